@@ -0,0 +1,67 @@
+"""
+Compare the per-tick cost of the macro and tag speaker dispatch modes.
+
+There's no server to time the functions against, so this counts what the server
+would execute instead: commands run and macro expansions, averaged over every tick
+that plays notes, for a given number of speakers. Ticks are costed by
+`src.runtime_cost`, the same estimate the build reports.
+
+Usage (from the project root):
+
+    python -m benchmarks.speaker_dispatch [--speakers 1 8 32] [--loudspeakers 0]
+"""
+
+import argparse
+from pathlib import Path
+
+from src.runtime_cost import Listeners, get_song_costs
+from src.song import SongOptions, compile_song
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Compare the per-tick cost of the speaker dispatch modes."
+    )
+    parser.add_argument("--songs", type=Path, default=Path("songs"))
+    parser.add_argument("--speakers", type=int, nargs="+", default=[1, 8, 32])
+    parser.add_argument("--loudspeakers", type=int, default=0)
+    args = parser.parse_args()
+
+    print(
+        f"{'song':<20} {'speakers':>8} {'dispatch':>8} "
+        f"{'commands/tick':>14} {'overhead/tick':>14} {'macros/tick':>12}"
+    )
+
+    for path in sorted(args.songs.glob("*.nbs")):
+        for dispatch in ["macro", "tag"]:
+            compiled = compile_song(path, SongOptions(dispatch=dispatch))
+            ticks = {
+                tick: functions
+                for tick, functions in compiled.ticks
+                if "speaker" in functions
+            }
+
+            for speakers in args.speakers:
+                listeners = Listeners(speakers, args.loudspeakers, headphones=0)
+                songs = get_song_costs(compiled.name, compiled.texts, listeners)
+                costs = [
+                    cost for cost in songs[compiled.name].ticks if cost.tick in ticks
+                ]
+                playback = sum(
+                    getattr(listeners, mode) * len(ticks[cost.tick].get(mode, []))
+                    for cost in costs
+                    for mode in ["speaker", "loudspeaker"]
+                )
+
+                commands = sum(cost.commands for cost in costs) / len(costs)
+                macros = sum(cost.macros for cost in costs) / len(costs)
+                overhead = commands - playback / len(costs)
+
+                print(
+                    f"{compiled.name:<20} {speakers:>8} {dispatch:>8} "
+                    f"{commands:>14.1f} {overhead:>14.1f} {macros:>12.1f}"
+                )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,297 @@
+"""
+Time the stages of the build against a synthetic corpus, and catch regressions.
+
+The corpus is generated by `benchmarks.synthetic`, so results only depend on the
+parameters below and the machine. Each benchmark runs `--repeat` times, and the
+median is kept. Everything runs offline, with beet's caches disabled so every run
+does the full work:
+
+-   `get_notes` and `get_note_table`: reading the notes of every song
+-   `play_speakers`, `play_loudspeakers`, `play_headphones`: rendering every note
+-   `model.*`: each stage of `src/model.py`, on the resource pack in `assets`
+-   `sound_config`: the sound events for the sounds played by the corpus
+-   `pipeline`: the whole beet build of the corpus, as configured in beet.yml
+
+Usage (from the project root):
+
+    python -m benchmarks.suite [--save baseline.json] [--compare baseline.json]
+        [--threshold 0.1] [--only PATTERN ...] [--repeat 3] [--songs 2]
+        [--length 2000] [--density 0.3] [--layers 8] [--custom-instruments 2]
+
+With `--compare`, every benchmark whose median is more than `threshold` slower than
+in the baseline is flagged, and the exit code is 1.
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import platform
+import statistics
+import sys
+import tempfile
+import time
+from dataclasses import asdict
+from fnmatch import fnmatch
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+
+import pynbs
+from beet import Context, load_config, run_beet
+
+from benchmarks.synthetic import SongParams, write_corpus
+from src import model, sound_config
+from src.nbs_reader import NbsReader
+from src.note import get_notes
+from src.sound_index import SoundIndex
+
+try:
+    from src.note_batch import get_note_table
+except ImportError:  # numpy only comes in through beet
+    get_note_table = None
+
+PROJECT = Path(__file__).resolve().parent.parent
+
+# Options that would let a run reuse the work of the previous one
+NO_CACHE = {"song_cache": False, "texture_cache": False, "stream": False}
+
+MODEL_STAGES = [
+    "create_note_models",
+    "create_monitor_models",
+    "create_balloon_models",
+    "generate_scrolling_animation",
+    "apply_emissive_textures",
+    "create_atlases",
+]
+
+PLAY_MODES = ["speakers", "loudspeakers", "headphones"]
+
+
+def get_nbs_meta() -> Dict[str, Any]:
+    """Return the song options of beet.yml, with the caches turned off."""
+    config = load_config(PROJECT / "beet.yml")
+    return {**config.meta.get("nbs", {}), **NO_CACHE}
+
+
+def measure(function: Callable[[], Any], repeat: int) -> List[float]:
+    """Return the wall time of each run of the function, in seconds."""
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        times.append(time.perf_counter() - start)
+    return times
+
+
+def bench_notes(corpus: List[Path], repeat: int) -> Dict[str, List[float]]:
+    def read_notes():
+        for path in corpus:
+            with NbsReader(path) as song:
+                for _ in get_notes(song):
+                    pass
+
+    results = {"get_notes": measure(read_notes, repeat)}
+
+    if get_note_table is None:
+        print("Skipping get_note_table: numpy isn't installed")
+    else:
+        read_note_table = get_note_table
+
+        def read_table():
+            for path in corpus:
+                read_note_table(pynbs.read(path))
+
+        results["get_note_table"] = measure(read_table, repeat)
+
+    notes = []
+    for path in corpus:
+        with NbsReader(path) as song:
+            notes.extend(
+                note
+                for _, chord in get_notes(song)
+                for note in chord
+                if note.instrument != "BEAT"
+            )
+
+    for mode in PLAY_MODES:
+
+        def play(mode=mode):
+            for note in notes:
+                getattr(note, f"play_{mode}")()
+
+        results[f"play_{mode}"] = measure(play, repeat)
+
+    return results
+
+
+def bench_model(repeat: int) -> Dict[str, List[float]]:
+    """Time each stage of the model plugin, in order, on a fresh resource pack."""
+
+    results = {f"model.{stage}": [] for stage in MODEL_STAGES}
+
+    def run_stages(ctx: Context):
+        for stage in MODEL_STAGES:
+            start = time.perf_counter()
+            getattr(model, stage)(ctx)
+            results[f"model.{stage}"].append(time.perf_counter() - start)
+
+    config = {
+        "resource_pack": {"load": ["assets"]},
+        "meta": {"nbs": get_nbs_meta()},
+    }
+
+    for _ in range(repeat):
+        with contextlib.redirect_stdout(io.StringIO()):
+            with run_beet(config, directory=PROJECT) as ctx:
+                ctx.require(run_stages)
+
+    return results
+
+
+def bench_sound_config(corpus: List[Path], repeat: int) -> Dict[str, List[float]]:
+    """Time the sound events for the sounds played by the corpus."""
+
+    usage = {}
+    for path in corpus:
+        counts = usage.setdefault(path.stem, {})
+        with NbsReader(path) as song:
+            for _, chord in get_notes(song):
+                for note in chord:
+                    if note.instrument != "BEAT":
+                        counts[note.instrument] = counts.get(note.instrument, 0) + 1
+
+    times = []
+
+    def run_sound_config(ctx: Context):
+        sound_index = ctx.inject(SoundIndex)
+        for song_name, counts in usage.items():
+            sound_index.add(song_name, counts)
+        times.extend(measure(lambda: sound_config.beet_default(ctx), 1))
+
+    for _ in range(repeat):
+        with contextlib.redirect_stdout(io.StringIO()):
+            with run_beet({}, directory=PROJECT) as ctx:
+                ctx.require(run_sound_config)
+
+    return {"sound_config": times}
+
+
+def bench_pipeline(corpus_directory: Path, repeat: int) -> Dict[str, List[float]]:
+    """Time the full build of the corpus, written to a temporary directory."""
+
+    def build():
+        with tempfile.TemporaryDirectory() as output:
+            config = load_config(PROJECT / "beet.yml")
+            config.output = output
+            config.meta["nbs"] = {**get_nbs_meta(), "songs": str(corpus_directory)}
+            with contextlib.redirect_stdout(io.StringIO()):
+                with run_beet(config, directory=PROJECT):
+                    pass
+
+    return {"pipeline": measure(build, repeat)}
+
+
+def summarize(times: List[float]) -> Dict[str, float]:
+    return {
+        "median": statistics.median(times),
+        "min": min(times),
+        "max": max(times),
+        "runs": len(times),
+    }
+
+
+def compare(
+    results: Dict[str, Dict[str, float]],
+    baseline: Dict[str, Dict[str, float]],
+    threshold: float,
+) -> List[str]:
+    """Print the change of each benchmark, and return the ones that regressed."""
+
+    regressions = []
+    for name, result in results.items():
+        if name not in baseline:
+            print(f"{name:<36} {result['median'] * 1000:>10.1f} ms (new)")
+            continue
+
+        ratio = result["median"] / baseline[name]["median"]
+        flag = ""
+        if ratio > 1 + threshold:
+            flag = "  REGRESSION"
+            regressions.append(name)
+
+        print(
+            f"{name:<36} {result['median'] * 1000:>10.1f} ms "
+            f"{baseline[name]['median'] * 1000:>10.1f} ms {ratio - 1:>+8.1%}{flag}"
+        )
+
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Time the build against a synthetic corpus, and catch regressions."
+    )
+    parser.add_argument("--save", type=Path)
+    parser.add_argument("--compare", type=Path)
+    parser.add_argument("--threshold", type=float, default=0.1)
+    parser.add_argument("--only", nargs="+", default=["*"])
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--songs", type=int, default=2)
+    parser.add_argument("--seed", type=int, default=0)
+    for name, default in asdict(SongParams()).items():
+        parser.add_argument(
+            f"--{name.replace('_', '-')}", type=type(default), default=default
+        )
+    args = parser.parse_args()
+
+    params = SongParams(**{name: getattr(args, name) for name in asdict(SongParams())})
+
+    def selected(*names: str) -> bool:
+        return any(fnmatch(name, pattern) for name in names for pattern in args.only)
+
+    times: Dict[str, List[float]] = {}
+
+    with tempfile.TemporaryDirectory() as corpus_directory:
+        corpus = write_corpus(Path(corpus_directory), args.songs, params, args.seed)
+
+        note_benchmarks = ["get_notes", "get_note_table"]
+        note_benchmarks += [f"play_{mode}" for mode in PLAY_MODES]
+        if selected(*note_benchmarks):
+            times.update(bench_notes(corpus, args.repeat))
+        if selected(*(f"model.{stage}" for stage in MODEL_STAGES)):
+            times.update(bench_model(args.repeat))
+        if selected("sound_config"):
+            times.update(bench_sound_config(corpus, args.repeat))
+        if selected("pipeline"):
+            times.update(bench_pipeline(Path(corpus_directory), args.repeat))
+
+    results = {name: summarize(runs) for name, runs in times.items() if selected(name)}
+
+    if args.compare:
+        baseline = json.loads(args.compare.read_text("utf-8"))
+        if baseline["params"] != asdict(params) or baseline["songs"] != args.songs:
+            print("Warning: the baseline was recorded with a different corpus")
+        regressions = compare(results, baseline["results"], args.threshold)
+    else:
+        regressions = []
+        for name, result in results.items():
+            print(f"{name:<36} {result['median'] * 1000:>10.1f} ms")
+
+    if args.save:
+        report = {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "songs": args.songs,
+            "seed": args.seed,
+            "params": asdict(params),
+            "results": results,
+        }
+        args.save.write_text(json.dumps(report, indent=2), "utf-8")
+
+    if regressions:
+        print(f"{len(regressions)} regression(s) over {args.threshold:.0%}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
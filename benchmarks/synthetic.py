@@ -0,0 +1,149 @@
+"""
+Generate a deterministic corpus of synthetic .nbs songs.
+
+Songs are random, but only depend on their parameters and seed, so the same corpus
+can be regenerated on any machine to time the build against. Each (tick, layer) cell
+holds a note with probability `density`. Notes cover the whole 6-octave range of the
+vanilla instruments, and the 2-octave range of the custom ones, with a few notes out
+of range that the build has to filter out.
+
+Usage (from the project root):
+
+    python -m benchmarks.synthetic OUTPUT [--songs 4] [--length 2000] [--density 0.3]
+        [--layers 8] [--custom-instruments 2] [--tempo 10] [--seed 0]
+"""
+
+import argparse
+import random
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import List
+
+import pynbs
+
+# Vanilla sounds used by the custom instruments, in the format introduced in NBS 3.11
+CUSTOM_SOUNDS = [
+    "minecraft/mob/wolf/bark2.ogg",
+    "minecraft/random/wood_click.ogg",
+    "minecraft/dig/gravel1.ogg",
+    "minecraft/fireworks/blast_far1.ogg",
+    "minecraft/mob/silverfish/hit2.ogg",
+    "minecraft/random/fizz.ogg",
+]
+
+# Share of notes placed outside of the range of their instrument
+OUT_OF_RANGE = 0.02
+
+
+@dataclass(frozen=True)
+class SongParams:
+    """Shape of a synthetic song."""
+
+    length: int = 2000
+    density: float = 0.3
+    layers: int = 8
+    custom_instruments: int = 2
+    tempo: float = 10.0
+
+
+def generate_song(params: SongParams, seed: int = 0, name: str = "") -> pynbs.File:
+    """Return a random song with the given shape, always the same for a given seed."""
+
+    rng = random.Random(f"{seed} {params}")
+
+    song = pynbs.new_file(
+        song_name=name or f"Synthetic {seed}",
+        song_author="benchmarks",
+        tempo=params.tempo,
+    )
+
+    song.layers = [
+        pynbs.Layer(
+            id=i,
+            name=f"Layer {i}",
+            volume=rng.randint(50, 100),
+            panning=rng.choice([0, 0, rng.randint(-100, 100)]),
+        )
+        for i in range(params.layers)
+    ]
+
+    song.instruments = [
+        pynbs.Instrument(
+            id=i,
+            name=f"Custom {i}",
+            file=CUSTOM_SOUNDS[i % len(CUSTOM_SOUNDS)],
+        )
+        for i in range(params.custom_instruments)
+    ]
+
+    instrument_count = song.header.default_instruments + params.custom_instruments
+
+    for tick in range(params.length):
+        for layer in range(params.layers):
+            if rng.random() >= params.density:
+                continue
+
+            instrument = rng.randrange(instrument_count)
+            if rng.random() < OUT_OF_RANGE:
+                key = rng.choice([rng.randint(0, 8), rng.randint(82, 87)])
+            elif instrument >= song.header.default_instruments:
+                key = rng.randint(33, 57)
+            else:
+                key = rng.randint(9, 81)
+
+            song.notes.append(
+                pynbs.Note(
+                    tick=tick,
+                    layer=layer,
+                    instrument=instrument,
+                    key=key,
+                    velocity=rng.randint(30, 100),
+                    panning=rng.choice([0, rng.randint(-100, 100)]),
+                    pitch=rng.choice([0, 0, 0, rng.randint(-50, 50)]),
+                )
+            )
+
+    return song
+
+
+def write_corpus(
+    directory: Path, count: int, params: SongParams = SongParams(), seed: int = 0
+) -> List[Path]:
+    """Write `count` synthetic songs to the directory, and return their paths."""
+
+    directory.mkdir(parents=True, exist_ok=True)
+
+    paths = []
+    for i in range(count):
+        path = directory / f"Synthetic {i} - benchmarks.nbs"
+        generate_song(params, seed + i, f"Synthetic {i}").save(path)
+        paths.append(path)
+
+    return paths
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Generate a deterministic corpus of synthetic .nbs songs."
+    )
+    parser.add_argument("output", type=Path)
+    parser.add_argument("--songs", type=int, default=4)
+    parser.add_argument("--seed", type=int, default=0)
+    for name, default in asdict(SongParams()).items():
+        parser.add_argument(f"--{name.replace('_', '-')}", type=type(default))
+    args = parser.parse_args()
+
+    params = SongParams(
+        **{
+            name: getattr(args, name)
+            for name in asdict(SongParams())
+            if getattr(args, name) is not None
+        }
+    )
+
+    for path in write_corpus(args.output, args.songs, params, args.seed):
+        print(path)
+
+
+if __name__ == "__main__":
+    main()
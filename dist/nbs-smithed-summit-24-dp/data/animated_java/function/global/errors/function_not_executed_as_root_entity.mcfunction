@@ -0,0 +1 @@
+$tellraw @a ["",[{"text":"[","color":"gray"},{"text":"AJ","color":"aqua"},{"text":"] "}],{"text":"Error: ","color":"red"},{"text":"The function ","color":"red"},{"text":"$(function_path)","color":"yellow"},{"text":" must be executed as the root entity.","color":"red"},{"text":"\n You can use ","color":"red"},{"text":"execute as @e[tag=aj.$(export_namespace).root] run ...","color":"aqua"},{"text":" to run the function as the root.","color":"red"}]
@@ -0,0 +1,16 @@
+$data modify storage aj:uuid temp.0 set from storage aj:uuid main.hex_chars[$(0)]
+$data modify storage aj:uuid temp.1 set from storage aj:uuid main.hex_chars[$(1)]
+$data modify storage aj:uuid temp.2 set from storage aj:uuid main.hex_chars[$(2)]
+$data modify storage aj:uuid temp.3 set from storage aj:uuid main.hex_chars[$(3)]
+$data modify storage aj:uuid temp.4 set from storage aj:uuid main.hex_chars[$(4)]
+$data modify storage aj:uuid temp.5 set from storage aj:uuid main.hex_chars[$(5)]
+$data modify storage aj:uuid temp.6 set from storage aj:uuid main.hex_chars[$(6)]
+$data modify storage aj:uuid temp.7 set from storage aj:uuid main.hex_chars[$(7)]
+$data modify storage aj:uuid temp.8 set from storage aj:uuid main.hex_chars[$(8)]
+$data modify storage aj:uuid temp.9 set from storage aj:uuid main.hex_chars[$(9)]
+$data modify storage aj:uuid temp.a set from storage aj:uuid main.hex_chars[$(a)]
+$data modify storage aj:uuid temp.b set from storage aj:uuid main.hex_chars[$(b)]
+$data modify storage aj:uuid temp.c set from storage aj:uuid main.hex_chars[$(c)]
+$data modify storage aj:uuid temp.d set from storage aj:uuid main.hex_chars[$(d)]
+$data modify storage aj:uuid temp.e set from storage aj:uuid main.hex_chars[$(e)]
+$data modify storage aj:uuid temp.f set from storage aj:uuid main.hex_chars[$(f)]
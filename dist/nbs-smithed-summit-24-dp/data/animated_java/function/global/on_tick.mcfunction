@@ -0,0 +1 @@
+execute as @e[type=item_display, tag=aj.rig_root] at @s run function #animated_java:global/root/on_tick
@@ -0,0 +1 @@
+kill @e[tag=aj.rig_entity]
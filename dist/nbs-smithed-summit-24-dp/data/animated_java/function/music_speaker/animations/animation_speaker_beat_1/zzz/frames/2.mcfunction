@@ -0,0 +1,6 @@
+$data merge entity $(bone_antenna) { transformation: [-0.9914448613738104f,0.1305261922200516f,1.2246467991473532e-16f,-0.6080478682266601f,0.1305261922200516f,0.9914448613738104f,0f,0.8287212658969052f,-1.2141697760125285e-16f,1.5984848350717836e-17f,-1f,-0.18750000000000008f,0f,0f,0f,1f], start_interpolation: 0, interpolation_duration: 1 }
+$data merge entity $(bone_speaker_1) { transformation: [-1.1189340081716808f,0.048853713849176326f,1.8369701987210297e-16f,-0.47239317143199616f,0.048853713849176326f,1.1189340081716808f,0f,0.3536018827545757f,-1.3702989515645673e-16f,5.982854429185451e-18f,-1.5f,0.24999999999999994f,0f,0f,0f,1f], start_interpolation: 0, interpolation_duration: 1 }
+$data merge entity $(bone_speaker_2) { transformation: [-1.1189340081716808f,0.048853713849176326f,1.8369701987210297e-16f,0.4642145363009956f,0.048853713849176326f,1.1189340081716808f,0f,0.3127087070995732f,-1.3702989515645673e-16f,5.982854429185451e-18f,-1.5f,0.25000000000000006f,0f,0f,0f,1f], start_interpolation: 0, interpolation_duration: 1 }
+$data merge entity $(text_display_text_display) { transformation: [0.19980964431637158f,0.0087238774730672f,-4.896256011802862e-17f,0.002343515502663887f,-0.0087238774730672f,0.19980964431637158f,1.0683668623545447e-18f,0.6237763054953352f,4.896256011802862e-17f,1.0683668623545447e-18f,0.2f,0.2515625f,0f,0f,0f,1f], start_interpolation: 0, interpolation_duration: 1 }
+$data merge entity $(bone_details) { transformation: [-0.9990482215818578f,0.043619387365336f,1.2246467991473532e-16f,0.047511938314232935f,0.043619387365336f,0.9990482215818578f,0f,0.44038153537984004f,-1.223481206754078e-16f,5.341834311772723e-18f,-1f,0.1953125f,0f,0f,0f,1f], start_interpolation: 0, interpolation_duration: 1 }
+$data merge entity $(bone_stereo) { transformation: [-0.9990482215818578f,0.043619387365336f,1.2246467991473532e-16f,0f,0.043619387365336f,0.9990482215818578f,0f,0.4268160657003736f,-1.223481206754078e-16f,5.341834311772723e-18f,-1f,0f,0f,0f,0f,1f], start_interpolation: 0, interpolation_duration: 1 }
@@ -0,0 +1,6 @@
+$data merge entity $(bone_antenna) { transformation: [-0.9993400189207761f,0.036325288483685894f,1.2246467991473532e-16f,-0.625f,0.036325288483685894f,0.9993400189207761f,0f,0.8082375902357247f,-1.2238385554311838e-16f,4.448564826965014e-18f,-1f,-0.18750000000000008f,0f,0f,0f,1f], start_interpolation: 0, interpolation_duration: 1 }
+$data merge entity $(bone_speaker_1) { transformation: [-1f,0f,1.2246467991473532e-16f,-0.46875000000000006f,0f,1f,0f,0.3394875902357247f,-1.2246467991473532e-16f,0f,-1f,0.24999999999999994f,0f,0f,0f,1f], start_interpolation: 0, interpolation_duration: 1 }
+$data merge entity $(bone_speaker_2) { transformation: [-1f,0f,1.2246467991473532e-16f,0.46874999999999994f,0f,1f,0f,0.3394875902357247f,-1.2246467991473532e-16f,0f,-1f,0.25000000000000006f,0f,0f,0f,1f], start_interpolation: 0, interpolation_duration: 1 }
+$data merge entity $(text_display_text_display) { transformation: [0.2f,0f,-4.898587196589413e-17f,-0.006250000000000026f,0f,0.2f,0f,0.6301125902357247f,4.898587196589413e-17f,0f,0.2f,0.2515625f,0f,0f,0f,1f], start_interpolation: 0, interpolation_duration: 1 }
+$data merge entity $(bone_details) { transformation: [-1f,0f,1.2246467991473532e-16f,0.04687499999999998f,0f,1f,0f,0.4488625902357247f,-1.2246467991473532e-16f,0f,-1f,0.1953125f,0f,0f,0f,1f], start_interpolation: 0, interpolation_duration: 1 }
+$data merge entity $(bone_stereo) { transformation: [-1f,0f,1.2246467991473532e-16f,0f,0f,1f,0f,0.4332375902357247f,-1.2246467991473532e-16f,0f,-1f,0f,0f,0f,0f,1f], start_interpolation: 0, interpolation_duration: 1 }
@@ -0,0 +1,6 @@
+$data merge entity $(bone_antenna) { transformation: [-0.999591735267541f,-0.028572063013129922f,1.2246467991473532e-16f,-0.6354593581721368f,-0.028572063013129922f,0.999591735267541f,0f,0.7442723629996135f,-1.2241468190495425e-16f,-3.499068551406604e-18f,-1f,-0.18750000000000008f,0f,0f,0f,1f], start_interpolation: 0, interpolation_duration: 1 }
+$data merge entity $(bone_speaker_1) { transformation: [-0.999591735267541f,-0.028572063013129922f,1.2246467991473532e-16f,-0.4658799949991789f,-0.028572063013129922f,0.999591735267541f,0f,0.28017812193875524f,-1.2241468190495425e-16f,-3.499068551406604e-18f,-1f,0.24999999999999994f,0f,0f,0f,1f], start_interpolation: 0, interpolation_duration: 1 }
+$data merge entity $(bone_speaker_2) { transformation: [-0.999591735267541f,-0.028572063013129922f,1.2246467991473532e-16f,0.4712372568141407f,-0.028572063013129922f,0.999591735267541f,0f,0.3069644310135645f,-1.2241468190495425e-16f,-3.499068551406604e-18f,-1f,0.25000000000000006f,0f,0f,0f,1f], start_interpolation: 0, interpolation_duration: 1 }
+$data merge entity $(text_display_text_display) { transformation: [0.1999183470535082f,-0.005714412602625985f,-4.897587236393791e-17f,-0.011872573251132106f,0.005714412602625985f,0.1999183470535082f,-6.998137102813209e-19f,0.5838990491444569f,4.897587236393792e-17f,-6.998137102813208e-19f,0.2f,0.2515625f,0f,0f,0f,1f], start_interpolation: 0, interpolation_duration: 1 }
+$data merge entity $(bone_details) { transformation: [-0.999591735267541f,-0.028572063013129922f,1.2246467991473532e-16f,0.04640942410608581f,-0.028572063013129922f,0.999591735267541f,0f,0.40424093797478766f,-1.2241468190495425e-16f,-3.499068551406604e-18f,-1f,0.1953125f,0f,0f,0f,1f], start_interpolation: 0, interpolation_duration: 1 }
+$data merge entity $(bone_stereo) { transformation: [-0.999591735267541f,-0.028572063013129922f,1.2246467991473532e-16f,0f,-0.028572063013129922f,0.999591735267541f,0f,0.38728300165749185f,-1.2241468190495425e-16f,-3.499068551406604e-18f,-1f,0f,0f,0f,0f,1f], start_interpolation: 0, interpolation_duration: 1 }
@@ -0,0 +1 @@
+particle minecraft:note ~ ~1 ~ 0 0 0 1 1
@@ -0,0 +1,7 @@
+scoreboard players remove @s aj.tween_duration 1
+execute if score @s aj.tween_duration matches 1.. run return 1
+execute if score @s aj.tween_duration matches 0 on passengers run data modify entity @s interpolation_duration set value 1
+execute store result storage aj:temp frame int 1 run scoreboard players get @s aj.animation_speaker_beat_1.frame
+function animated_java:music_speaker/animations/animation_speaker_beat_1/zzz/apply_frame with storage aj:temp
+execute if score @s aj.animation_speaker_beat_1.frame matches 8 run return run function animated_java:music_speaker/animations/animation_speaker_beat_1/stop
+scoreboard players add @s aj.animation_speaker_beat_1.frame 1
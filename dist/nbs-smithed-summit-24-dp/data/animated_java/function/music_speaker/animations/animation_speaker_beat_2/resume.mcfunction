@@ -0,0 +1,2 @@
+execute unless entity @s[type=item_display, tag=aj.music_speaker.root] run return run function animated_java:global/errors/function_not_executed_as_root_entity {export_namespace: "music_speaker", function_path: "animated_java:music_speaker/animations/animation_speaker_beat_2/resume"}
+tag @s add aj.music_speaker.animation.animation_speaker_beat_2.playing
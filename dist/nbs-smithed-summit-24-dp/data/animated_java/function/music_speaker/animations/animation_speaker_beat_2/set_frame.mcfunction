@@ -0,0 +1,3 @@
+execute unless entity @s[type=item_display, tag=aj.music_speaker.root] run return run function animated_java:global/errors/function_not_executed_as_root_entity {export_namespace: "music_speaker", function_path: "animated_java:music_speaker/animations/animation_speaker_beat_2/set_frame"}
+$execute store result storage aj:temp frame int 1 run scoreboard players set @s aj.animation_speaker_beat_2.frame $(frame)
+execute at @s run function animated_java:music_speaker/animations/animation_speaker_beat_2/zzz/set_frame with storage aj:temp
@@ -0,0 +1,7 @@
+$data merge entity $(bone_antenna) { transformation: [-1f,0f,1.2246467991473532e-16f,-0.625f,0f,1f,0f,0.75f,-1.2246467991473532e-16f,0f,-1f,-0.18750000000000008f,0f,0f,0f,1f], start_interpolation: 0, interpolation_duration: 1 }
+$data merge entity $(bone_speaker_1) { transformation: [-1f,0f,1.2246467991473532e-16f,-0.46875000000000006f,0f,1f,0f,0.28125f,-1.2246467991473532e-16f,0f,-1f,0.24999999999999994f,0f,0f,0f,1f], start_interpolation: 0, interpolation_duration: 1 }
+$data merge entity $(bone_speaker_2) { transformation: [-1f,0f,1.2246467991473532e-16f,0.46874999999999994f,0f,1f,0f,0.28125f,-1.2246467991473532e-16f,0f,-1f,0.25000000000000006f,0f,0f,0f,1f], start_interpolation: 0, interpolation_duration: 1 }
+$data merge entity $(text_display_text_display) { transformation: [0.2f,0f,-4.898587196589413e-17f,-0.006250000000000026f,0f,0.2f,0f,0.571875f,4.898587196589413e-17f,0f,0.2f,0.2515625f,0f,0f,0f,1f], start_interpolation: 0, interpolation_duration: 1 }
+$data merge entity $(bone_details) { transformation: [-1f,0f,1.2246467991473532e-16f,0.04687499999999998f,0f,1f,0f,0.390625f,-1.2246467991473532e-16f,0f,-1f,0.1953125f,0f,0f,0f,1f], start_interpolation: 0, interpolation_duration: 1 }
+$data merge entity $(bone_stereo) { transformation: [-1f,0f,1.2246467991473532e-16f,0f,0f,1f,0f,0.375f,-1.2246467991473532e-16f,0f,-1f,0f,0f,0f,0f,1f], start_interpolation: 0, interpolation_duration: 1 }
+execute on vehicle unless entity @s[tag=aj.transforms_only] at @s run function animated_java:music_speaker/animations/animation_speaker_beat_2/zzz/frames/zzz/0
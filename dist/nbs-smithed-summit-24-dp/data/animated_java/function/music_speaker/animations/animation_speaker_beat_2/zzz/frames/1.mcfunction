@@ -0,0 +1,6 @@
+$data merge entity $(bone_antenna) { transformation: [-0.9997229013480003f,0.023539764661870584f,1.2246467991473532e-16f,-0.6347914494518019f,0.023539764661870584f,0.9997229013480003f,0f,0.7566611035162658f,-1.2243074511701338e-16f,2.882789744584178e-18f,-1f,-0.18750000000000008f,0f,0f,0f,1f], start_interpolation: 0, interpolation_duration: 1 }
+$data merge entity $(bone_speaker_1) { transformation: [-1.0596219612790767f,-0.028307228318632405f,1.5308084989341916e-16f,-0.46607923744782587f,-0.028307228318632405f,1.0596219612790767f,0f,0.29225092434194433f,-1.2976626431866618e-16f,-3.4666356553146487e-18f,-1.25f,0.24999999999999994f,0f,0f,0f,1f], start_interpolation: 0, interpolation_duration: 1 }
+$data merge entity $(bone_speaker_2) { transformation: [-1.0596219612790767f,-0.028307228318632405f,1.5308084989341916e-16f,0.4710864122683386f,-0.028307228318632405f,1.0596219612790767f,0f,0.31728679844450836f,-1.2976626431866618e-16f,-3.4666356553146487e-18f,-1.25f,0.25000000000000006f,0f,0f,0f,1f], start_interpolation: 0, interpolation_duration: 1 }
+$data merge entity $(text_display_text_display) { transformation: [0.1999286719394484f,-0.005340986475213662f,-4.897713679778974e-17f,-0.01150530455964624f,0.005340986475213662f,0.1999286719394484f,-6.540821991159715e-19f,0.595123306977887f,4.897713679778974e-17f,-6.540821991159714e-19f,0.2f,0.2515625f,0f,0f,0f,1f], start_interpolation: 0, interpolation_duration: 1 }
+$data merge entity $(bone_details) { transformation: [-0.999643359697242f,-0.026704932376068306f,1.2246467991473532e-16f,0.04644101791743213f,-0.026704932376068306f,0.999643359697242f,0f,0.41535664756524043f,-1.2242100407421337e-16f,-3.270410995579857e-18f,-1f,0.1953125f,0f,0f,0f,1f], start_interpolation: 0, interpolation_duration: 1 }
+$data merge entity $(bone_stereo) { transformation: [-0.999643359697242f,-0.026704932376068306f,1.2246467991473532e-16f,0f,-0.026704932376068306f,0.999643359697242f,0f,0.3984854263648428f,-1.2242100407421337e-16f,-3.270410995579857e-18f,-1f,0f,0f,0f,0f,1f], start_interpolation: 0, interpolation_duration: 1 }
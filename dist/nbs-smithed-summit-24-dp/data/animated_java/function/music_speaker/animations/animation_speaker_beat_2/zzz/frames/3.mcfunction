@@ -0,0 +1,6 @@
+$data merge entity $(bone_antenna) { transformation: [-0.9988858266823866f,0.0471922160217661f,1.2246467991473532e-16f,-0.6354593581721368f,0.0471922160217661f,0.9988858266823866f,0f,0.7944893613421217f,-1.2232823303602426e-16f,5.77937962957263e-18f,-1f,-0.18750000000000008f,0f,0f,0f,1f], start_interpolation: 0, interpolation_duration: 1 }
+$data merge entity $(bone_speaker_1) { transformation: [-1.0595672393835935f,-0.030286386793917718f,1.5308084989341916e-16f,-0.4658799949991789f,-0.030286386793917718f,1.0595672393835935f,0f,0.3303951202812634f,-1.297595628192515e-16f,-3.7090126644910004e-18f,-1.25f,0.24999999999999994f,0f,0f,0f,1f], start_interpolation: 0, interpolation_duration: 1 }
+$data merge entity $(bone_speaker_2) { transformation: [-1.0595672393835935f,-0.030286386793917718f,1.5308084989341916e-16f,0.4712372568141407f,-0.030286386793917718f,1.0595672393835935f,0f,0.35718142935607267f,-1.297595628192515e-16f,-3.7090126644910004e-18f,-1.25f,0.25000000000000006f,0f,0f,0f,1f], start_interpolation: 0, interpolation_duration: 1 }
+$data merge entity $(text_display_text_display) { transformation: [0.1999183470535082f,-0.005714412602625985f,-4.897587236393791e-17f,-0.011872573251132106f,0.005714412602625985f,0.1999183470535082f,-6.998137102813209e-19f,0.6341160474869652f,4.897587236393792e-17f,-6.998137102813208e-19f,0.2f,0.2515625f,0f,0f,0f,1f], start_interpolation: 0, interpolation_duration: 1 }
+$data merge entity $(bone_details) { transformation: [-0.999591735267541f,-0.028572063013129922f,1.2246467991473532e-16f,0.04640942410608581f,-0.028572063013129922f,0.999591735267541f,0f,0.4544579363172958f,-1.2241468190495425e-16f,-3.499068551406604e-18f,-1f,0.1953125f,0f,0f,0f,1f], start_interpolation: 0, interpolation_duration: 1 }
+$data merge entity $(bone_stereo) { transformation: [-0.999591735267541f,-0.028572063013129922f,1.2246467991473532e-16f,0f,-0.028572063013129922f,0.999591735267541f,0f,0.4375f,-1.2241468190495425e-16f,-3.499068551406604e-18f,-1f,0f,0f,0f,0f,1f], start_interpolation: 0, interpolation_duration: 1 }
@@ -0,0 +1,6 @@
+$data merge entity $(bone_antenna) { transformation: [-0.9998983613867463f,0.014257169989162155f,1.2246467991473532e-16f,-0.6189596529418955f,0.014257169989162155f,0.9998983613867463f,0f,0.7664085998031864f,-1.2245223277449622e-16f,1.7459997592127135e-18f,-1f,-0.18750000000000008f,0f,0f,0f,1f], start_interpolation: 0, interpolation_duration: 1 }
+$data merge entity $(bone_speaker_1) { transformation: [-0.999873634969437f,0.015896983770673705f,1.2246467991473532e-16f,-0.47018110862042434f,0.015896983770673705f,0.999873634969437f,0f,0.29523392969709505f,-1.2244920466171501e-16f,1.9468190290852976e-18f,-1f,0.24999999999999994f,0f,0f,0f,1f], start_interpolation: 0, interpolation_duration: 1 }
+$data merge entity $(bone_speaker_2) { transformation: [-0.999873634969437f,0.015896983770673705f,1.2246467991473532e-16f,0.46720042416342294f,0.015896983770673705f,0.999873634969437f,0f,0.2803305074120885f,-1.2244920466171501e-16f,1.9468190290852976e-18f,-1f,0.25000000000000006f,0f,0f,0f,1f], start_interpolation: 0, interpolation_duration: 1 }
+$data merge entity $(text_display_text_display) { transformation: [0.1999747269938874f,0.0031793967541347413f,-4.898277691529007e-17f,-0.003119491538707629f,-0.0031793967541347413f,0.1999747269938874f,3.893638058170595e-19f,0.5784698498661511f,4.898277691529007e-17f,3.8936380581705956e-19f,0.2f,0.2515625f,0f,0f,0f,1f], start_interpolation: 0, interpolation_duration: 1 }
+$data merge entity $(bone_details) { transformation: [-0.999873634969437f,0.015896983770673705f,1.2246467991473532e-16f,0.047117467010609114f,0.015896983770673705f,0.999873634969437f,0f,0.3963982262651236f,-1.2244920466171501e-16f,1.9468190290852976e-18f,-1f,0.1953125f,0f,0f,0f,1f], start_interpolation: 0, interpolation_duration: 1 }
+$data merge entity $(bone_stereo) { transformation: [-0.999873634969437f,0.015896983770673705f,1.2246467991473532e-16f,0f,0.015896983770673705f,0.999873634969437f,0f,0.3815203718329765f,-1.2244920466171501e-16f,1.9468190290852976e-18f,-1f,0f,0f,0f,0f,1f], start_interpolation: 0, interpolation_duration: 1 }
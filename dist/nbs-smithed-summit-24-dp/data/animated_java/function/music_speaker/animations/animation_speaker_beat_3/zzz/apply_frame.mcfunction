@@ -0,0 +1 @@
+$execute on passengers if entity @s[type=marker] run function animated_java:music_speaker/animations/animation_speaker_beat_3/zzz/frames/$(frame) with entity @s data.bones
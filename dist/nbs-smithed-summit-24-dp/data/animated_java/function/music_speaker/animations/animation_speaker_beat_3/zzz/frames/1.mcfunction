@@ -0,0 +1,6 @@
+$data merge entity $(bone_antenna) { transformation: [-0.9990533038930491f,0.04349650407327521f,0.0007416965595212817f,-0.6329036449323523f,0.04344634177202445f,0.9984796204578305f,-0.033924370547073306f,0.7696998456074942f,-0.0022161604209297594f,-0.03386003047532953f,-0.9994241276701291f,-0.2001167030090126f,0f,0f,0f,1f], start_interpolation: 0, interpolation_duration: 1 }
+$data merge entity $(bone_speaker_1) { transformation: [-1.0597467501824198f,-0.023156151881296053f,0.0009271206994016021f,-0.4667754240541612f,-0.023169494552105707f,1.059136471352319f,-0.042405463183841634f,0.31958893939860006f,-1.29781546551771e-16f,-0.035968426173640274f,-1.2492801595876615f,0.25303720168524807f,0f,0f,0f,1f], start_interpolation: 0, interpolation_duration: 1 }
+$data merge entity $(bone_speaker_2) { transformation: [-1.0597467501824198f,-0.023156151881296053f,0.0009271206994016021f,0.47050059320623366f,-0.023169494552105707f,1.059136471352319f,-0.042405463183841634f,0.34008082726897654f,-1.29781546551771e-16f,-0.035968426173640274f,-1.2492801595876615f,0.2530372016852482f,0f,0f,0f,1f], start_interpolation: 0, interpolation_duration: 1 }
+$data merge entity $(text_display_text_display) { transformation: [0.1999522170155509f,-0.0043690852606218964f,-0.00014833931190428082f,-0.010735908125915218f,0.004371602745680323f,0.1998370700664753f,0.00678487410941466f,0.6201395200173125f,4.896591543388832e-17f,-0.006786495504460428f,0.19988482553402584f,0.24473717560481362f,0f,0f,0f,1f], start_interpolation: 0, interpolation_duration: 1 }
+$data merge entity $(bone_details) { transformation: [-0.9997610850777545f,-0.021845426303109483f,0.0007416965595212817f,0.04637760346775215f,-0.02185801372840161f,0.9991853503323764f,-0.033924370547073306f,0.43829013640561776f,-1.2243542127525566e-16f,-0.03393247752230214f,-0.9994241276701291f,0.1946698299742861f,0f,0f,0f,1f], start_interpolation: 0, interpolation_duration: 1 }
+$data merge entity $(bone_stereo) { transformation: [-0.9997610850777545f,-0.021845426303109483f,0.0007416965595212817f,0f,-0.02185801372840161f,0.9991853503323764f,-0.033924370547073306f,0.41502741729068027f,-1.2243542127525566e-16f,-0.03393247752230214f,-0.9994241276701291f,0f,0f,0f,0f,1f], start_interpolation: 0, interpolation_duration: 1 }
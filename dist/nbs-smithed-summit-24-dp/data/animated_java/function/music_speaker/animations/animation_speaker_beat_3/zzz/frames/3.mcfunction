@@ -0,0 +1,6 @@
+$data merge entity $(bone_antenna) { transformation: [-0.9960498964311707f,0.08879149272625353f,0.00082136404697607f,-0.633416355022632f,0.08870766529008703f,0.9954352300559721f,-0.035208704636718796f,0.8534874914064754f,-0.003943848150713353f,-0.034996765319918965f,-0.9993796438185574f,-0.2005905396797167f,0f,0f,0f,1f], start_interpolation: 0, interpolation_duration: 1 }
+$data merge entity $(bone_speaker_1) { transformation: [-1.0597116832096964f,-0.024706081126043104f,0.0010267050587200875f,-0.46664275270889366f,-0.024721417210023373f,1.0590542845164703f,-0.044010880795898495f,0.4042035879604839f,-1.2983471480132262e-16f,-0.03733138093749692f,-1.2492245547731966f,0.25314662507057356f,0f,0f,0f,1f], start_interpolation: 0, interpolation_duration: 1 }
+$data merge entity $(bone_speaker_2) { transformation: [-1.0597116832096964f,-0.024706081126043104f,0.0010267050587200875f,0.4706022501298708f,-0.024721417210023373f,1.0590542845164703f,-0.044010880795898495f,0.42606804893633005f,-1.2983471480132262e-16f,-0.03733138093749692f,-1.2492245547731966f,0.25314662507057367f,0f,0f,0f,1f], start_interpolation: 0, interpolation_duration: 1 }
+$data merge entity $(text_display_text_display) { transformation: [0.1999456006056031f,-0.00466152474076285f,-0.0001642728093952385f,-0.011043612828680952f,0.004664418341513845f,0.19982156311631516f,0.0070417409273437585f,0.705410777879625f,4.8974857638957914e-17f,-0.007043656780659796f,0.1998759287637115f,0.24447284200464386f,0f,0f,0f,1f], start_interpolation: 0, interpolation_duration: 1 }
+$data merge entity $(bone_details) { transformation: [-0.9997280030280155f,-0.02330762370381425f,0.00082136404697607f,0.04633764585614111f,-0.023322091707569218f,0.9991078155815758f,-0.035208704636718796f,0.5235809827916136f,-1.2248558000124773e-16f,-0.03521828390329898f,-0.9993796438185574f,0.19464105099732296f,0f,0f,0f,1f], start_interpolation: 0, interpolation_duration: 1 }
+$data merge entity $(bone_stereo) { transformation: [-0.9997280030280155f,-0.02330762370381425f,0.00082136404697607f,0f,-0.023322091707569218f,0.9991078155815758f,-0.035208704636718796f,0.5f,-1.2248558000124773e-16f,-0.03521828390329898f,-0.9993796438185574f,0f,0f,0f,0f,1f], start_interpolation: 0, interpolation_duration: 1 }
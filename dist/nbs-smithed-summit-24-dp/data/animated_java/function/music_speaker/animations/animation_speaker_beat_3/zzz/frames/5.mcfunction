@@ -0,0 +1,6 @@
+$data merge entity $(bone_antenna) { transformation: [-0.9997280030280155f,0.023309308695177337f,0.0007720685003281932f,-0.6159442482880068f,0.023322091707569215f,0.9991800446539789f,0.03309559492827606f,0.7985457160375002f,-1.2243136989262346e-16f,0.03310459927903872f,-0.9994518925423946f,-0.17498300512205955f,0f,0f,0f,1f], start_interpolation: 0, interpolation_duration: 1 }
+$data merge entity $(bone_speaker_1) { transformation: [-0.9997280030280155f,0.023309308695177337f,0.0007720685003281932f,-0.47100076623463716f,0.023322091707569215f,0.9991800446539789f,0.03309559492827606f,0.3120566704955191f,-1.2243136989262346e-16f,0.03310459927903872f,-0.9994518925423946f,0.24675941695318873f,0f,0f,0f,1f], start_interpolation: 0, interpolation_duration: 1 }
+$data merge entity $(bone_speaker_2) { transformation: [-0.9997280030280155f,0.023309308695177337f,0.0007720685003281932f,0.4662442366041273f,0.023322091707569215f,0.9991800446539789f,0.03309559492827606f,0.290192209519673f,-1.2243136989262346e-16f,0.03310459927903872f,-0.9994518925423946f,0.24675941695318884f,0f,0f,0f,1f], start_interpolation: 0, interpolation_duration: 1 }
+$data merge entity $(text_display_text_display) { transformation: [0.1999456006056031f,0.004661861739035467f,-0.00015441370006566313f,-0.0018535033516758753f,-0.004664418341513844f,0.19983600893079578f,-0.006619118985655211f,0.5916051916912556f,4.8965785200600855e-17f,0.006620919855807744f,0.19989037850847893f,0.2579420847007569f,0f,0f,0f,1f], start_interpolation: 0, interpolation_duration: 1 }
+$data merge entity $(bone_details) { transformation: [-0.9997280030280155f,0.023309308695177337f,0.0007720685003281932f,0.04707566346133002f,0.023322091707569215f,0.9991800446539789f,0.03309559492827606f,0.4111264496904728f,-1.2243136989262346e-16f,0.03310459927903872f,-0.9994518925423946f,0.19572270712592144f,0f,0f,0f,1f], start_interpolation: 0, interpolation_duration: 1 }
+$data merge entity $(bone_stereo) { transformation: [-0.9997280030280155f,0.023309308695177337f,0.0007720685003281932f,0f,0.023322091707569215f,0.9991800446539789f,0.03309559492827606f,0.4030714679259756f,-1.2243136989262346e-16f,0.03310459927903872f,-0.9994518925423946f,0f,0f,0f,0f,1f], start_interpolation: 0, interpolation_duration: 1 }
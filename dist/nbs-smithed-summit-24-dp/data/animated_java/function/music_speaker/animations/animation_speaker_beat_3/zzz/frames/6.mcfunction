@@ -0,0 +1,6 @@
+$data merge entity $(bone_antenna) { transformation: [-0.9996041100349247f,0.028094587027354276f,0.0015222946655217787f,-0.6112589815941236f,0.02813424724249152f,0.9986531582882116f,0.04359281561310944f,0.7794006990160147f,-0.0002955222235587099f,0.04361838626935455f,-0.9990482215818578f,-0.1709642712845974f,0f,0f,0f,1f], start_interpolation: 0, interpolation_duration: 1 }
+$data merge entity $(bone_speaker_1) { transformation: [-0.9993908270190958f,0.034866280114735505f,0.0015222946655217787f,-0.47211373759233805f,0.034899496702500976f,0.9984396283986496f,0.04359281561310944f,0.28685722001364655f,-1.2228165752336762e-16f,0.04361938736533601f,-0.9990482215818578f,0.24567273782996413f,0f,0f,0f,1f], start_interpolation: 0, interpolation_duration: 1 }
+$data merge entity $(bone_speaker_2) { transformation: [-0.9993908270190958f,0.034866280114735505f,0.0015222946655217787f,0.4648151627380643f,0.034899496702500976f,0.9984396283986496f,0.04359281561310944f,0.2541389418550519f,-1.2228165752336762e-16f,0.04361938736533601f,-0.9990482215818578f,0.24567273782996427f,0f,0f,0f,1f], start_interpolation: 0, interpolation_duration: 1 }
+$data merge entity $(text_display_text_display) { transformation: [0.19987816540381917f,0.006973256022947101f,-0.0003044589331043803f,0.00023515397692387696f,-0.006979899340500196f,0.19968792567972993f,-0.008718563122621889f,0.560819606017702f,4.8925955639755084e-17f,0.008723877473067201f,0.19980964431637158f,0.2599106351292366f,0f,0f,0f,1f], start_interpolation: 0, interpolation_duration: 1 }
+$data merge entity $(bone_details) { transformation: [-0.9993908270190958f,0.034866280114735505f,0.0015222946655217787f,0.04709390746645313f,0.034899496702500976f,0.9984396283986496f,0.04359281561310944f,0.38045048348636373f,-1.2228165752336762e-16f,0.04361938736533601f,-0.9990482215818578f,0.19580815870528998f,0f,0f,0f,1f], start_interpolation: 0, interpolation_duration: 1 }
+$data merge entity $(bone_stereo) { transformation: [-0.9993908270190958f,0.034866280114735505f,0.0015222946655217787f,0f,0.034899496702500976f,0.9984396283986496f,0.04359281561310944f,0.375f,-1.2228165752336762e-16f,0.04361938736533601f,-0.9990482215818578f,0f,0f,0f,0f,1f], start_interpolation: 0, interpolation_duration: 1 }
@@ -0,0 +1,6 @@
+$data merge entity $(bone_antenna) { transformation: [-0.9999385450930429f,0.011085872605218833f,0.00009729228906715098f,-0.6201589862061841f,0.011086292437462677f,0.9999093240463777f,0.007644462381826524f,0.7658662130129154f,-0.000012537930895743147f,0.007645071202870621f,-0.9999707759375287f,-0.18462761493179472f,0f,0f,0f,1f], start_interpolation: 0, interpolation_duration: 1 }
+$data merge entity $(bone_speaker_1) { transformation: [-0.9999190195482685f,0.012725756552756045f,0.00009729228906715098f,-0.4699294031623385f,0.012726128461929234f,0.999889797852375f,0.007644462381826524f,0.29183496040538903f,-1.2245476266963466e-16f,0.007645081483978623f,-0.9999707759375287f,0.24927596759525913f,0f,0f,0f,1f], start_interpolation: 0, interpolation_duration: 1 }
+$data merge entity $(bone_speaker_2) { transformation: [-0.9999190195482685f,0.012725756552756045f,0.00009729228906715098f,0.46749467766416314f,0.012726128461929234f,0.999889797852375f,0.007644462381826524f,0.27990421497233037f,-1.2245476266963466e-16f,0.007645081483978623f,-0.9999707759375287f,0.24927596759525925f,0f,0f,0f,1f], start_interpolation: 0, interpolation_duration: 1 }
+$data merge entity $(text_display_text_display) { transformation: [0.1999838039096537f,0.002545151310551209f,-0.000019458457813454687f,-0.0037685856423212843f,-0.002545225692385847f,0.199977959570475f,-0.0015288924763653046f,0.5765301540201216f,4.8983172733782724e-17f,0.0015290162967957247f,0.19999415518750574f,0.25306027373894285f,0f,0f,0f,1f], start_interpolation: 0, interpolation_duration: 1 }
+$data merge entity $(bone_details) { transformation: [-0.9999190195482685f,0.012725756552756045f,0.00009729228906715098f,0.04705104158725347f,0.012726128461929234f,0.999889797852375f,0.007644462381826524f,0.3950540535938164f,-1.2245476266963466e-16f,0.007645081483978623f,-0.9999707759375287f,0.19542624657348573f,0f,0f,0f,1f], start_interpolation: 0, interpolation_duration: 1 }
+$data merge entity $(bone_stereo) { transformation: [-0.9999190195482685f,0.012725756552756045f,0.00009729228906715098f,0f,0.012726128461929234f,0.999889797852375f,0.007644462381826524f,0.3815203718329765f,-1.2245476266963466e-16f,0.007645081483978623f,-0.9999707759375287f,0f,0f,0f,0f,1f], start_interpolation: 0, interpolation_duration: 1 }
@@ -0,0 +1,6 @@
+$data merge entity $(bone_antenna) { transformation: [-0.9961998152776383f,0.08709407515447273f,0.0007416965595212817f,-0.6165195752050202f,0.08706903395460441f,0.9956244876504378f,0.033924370547073306f,0.8097440017231488f,0.0022161604209295148f,0.033860030475329546f,-0.9994241276701291f,-0.174667344867286f,0f,0f,0f,1f], start_interpolation: 0, interpolation_duration: 1 }
+$data merge entity $(bone_speaker_1) { transformation: [-1.0597467501824198f,0.023156151881296053f,0.0009271206994016021f,-0.4708714414859943f,0.023169494552105707f,1.059136471352319f,0.042405463183841634f,0.3231186419954399f,-1.29781546551771e-16f,0.035968426173640274f,-1.2492801595876615f,0.2466748621498164f,0f,0f,0f,1f], start_interpolation: 0, interpolation_duration: 1 }
+$data merge entity $(bone_speaker_2) { transformation: [-1.0597467501824198f,0.023156151881296053f,0.0009271206994016021f,0.4664045757744006f,0.023169494552105707f,1.059136471352319f,0.042405463183841634f,0.3026267541250634f,-1.29781546551771e-16f,0.035968426173640274f,-1.2492801595876615f,0.24667486214981652f,0f,0f,0f,1f], start_interpolation: 0, interpolation_duration: 1 }
+$data merge entity $(text_display_text_display) { transformation: [0.1999522170155509f,0.0043690852606218964f,-0.00014833931190428082f,-0.00213427151906586f,-0.004371602745680323f,0.1998370700664753f,-0.00678487410941466f,0.6033445462574213f,4.896591543388832e-17f,0.006786495504460428f,0.19988482553402584f,0.2580980886292201f,0f,0f,0f,1f], start_interpolation: 0, interpolation_duration: 1 }
+$data merge entity $(bone_details) { transformation: [-0.9997610850777545f,0.021845426303109483f,0.0007416965595212817f,0.04706027303972433f,0.02185801372840161f,0.9991853503323764f,0.033924370547073306f,0.42298924037362956f,-1.2243542127525566e-16f,0.03393247752230214f,-0.9994241276701291f,0.19573021989685807f,0f,0f,0f,1f], start_interpolation: 0, interpolation_duration: 1 }
+$data merge entity $(bone_stereo) { transformation: [-0.9997610850777545f,0.021845426303109483f,0.0007416965595212817f,0f,0.02185801372840161f,0.9991853503323764f,0.033924370547073306f,0.41502741729068027f,-1.2243542127525566e-16f,0.03393247752230214f,-0.9994241276701291f,0f,0f,0f,0f,1f], start_interpolation: 0, interpolation_duration: 1 }
@@ -0,0 +1,6 @@
+$data merge entity $(bone_antenna) { transformation: [-0.9908297824191307f,0.13511353608118032f,0.00082136404697607f,-0.6159356372447714f,0.13505846264867005f,0.9902118757037719f,0.035208704636718796f,0.8958433702797064f,0.00394384815071311f,0.03499676531991899f,-0.9993796438185574f,-0.17417682675224247f,0f,0f,0f,1f], start_interpolation: 0, interpolation_duration: 1 }
+$data merge entity $(bone_speaker_1) { transformation: [-1.0597116832096964f,0.024706081126043104f,0.0010267050587200875f,-0.4710129321533588f,0.024721417210023373f,1.0590542845164703f,0.044010880795898495f,0.40846369661797066f,-1.2983471480132262e-16f,0.03733138093749692f,-1.2492245547731966f,0.24654319683870501f,0f,0f,0f,1f], start_interpolation: 0, interpolation_duration: 1 }
+$data merge entity $(bone_speaker_2) { transformation: [-1.0597116832096964f,0.024706081126043104f,0.0010267050587200875f,0.4662320706854056f,0.024721417210023373f,1.0590542845164703f,0.044010880795898495f,0.3865992356421245f,-1.2983471480132262e-16f,0.03733138093749692f,-1.2492245547731966f,0.24654319683870513f,0f,0f,0f,1f], start_interpolation: 0, interpolation_duration: 1 }
+$data merge entity $(text_display_text_display) { transformation: [0.1999456006056031f,0.00466152474076285f,-0.0001642728093952385f,-0.001866235995304083f,-0.004664418341513845f,0.19982156311631516f,-0.0070417409273437585f,0.6879879245056205f,4.8974857638957914e-17f,0.007043656780659796f,0.1998759287637115f,0.25834004129156785f,0f,0f,0f,1f], start_interpolation: 0, interpolation_duration: 1 }
+$data merge entity $(bone_details) { transformation: [-0.9997280030280155f,0.02330762370381425f,0.00082136404697607f,0.04706600909688531f,0.023322091707569218f,0.9991078155815758f,0.035208704636718796f,0.5076411364453107f,-1.2248558000124773e-16f,0.03521828390329898f,-0.9993796438185574f,0.19574162236930104f,0f,0f,0f,1f], start_interpolation: 0, interpolation_duration: 1 }
+$data merge entity $(bone_stereo) { transformation: [-0.9997280030280155f,0.02330762370381425f,0.00082136404697607f,0f,0.023322091707569218f,0.9991078155815758f,0.035208704636718796f,0.5f,-1.2248558000124773e-16f,0.03521828390329898f,-0.9993796438185574f,0f,0f,0f,0f,1f], start_interpolation: 0, interpolation_duration: 1 }
@@ -0,0 +1,6 @@
+$data merge entity $(bone_antenna) { transformation: [-0.9997280030280155f,-0.023309308695177337f,0.0007720685003281932f,-0.6334262298093897f,-0.023322091707569215f,0.9991800446539789f,-0.03309559492827606f,0.7569822533049351f,-1.2243136989262346e-16f,-0.03310459927903872f,-0.9994518925423946f,-0.1998114545813386f,0f,0f,0f,1f], start_interpolation: 0, interpolation_duration: 1 }
+$data merge entity $(bone_speaker_1) { transformation: [-0.9997280030280155f,-0.023309308695177337f,0.0007720685003281932f,-0.46663027085429143f,-0.023322091707569215f,0.9991800446539789f,-0.03309559492827606f,0.30674000698381104f,-1.2243136989262346e-16f,-0.03310459927903872f,-0.9994518925423946f,0.2529665293180085f,0f,0f,0f,1f], start_interpolation: 0, interpolation_duration: 1 }
+$data merge entity $(bone_speaker_2) { transformation: [-0.9997280030280155f,-0.023309308695177337f,0.0007720685003281932f,0.470614731984473f,-0.023322091707569215f,0.9991800446539789f,-0.03309559492827606f,0.32860446795965714f,-1.2243136989262346e-16f,-0.03310459927903872f,-0.9994518925423946f,0.2529665293180086f,0f,0f,0f,1f], start_interpolation: 0, interpolation_duration: 1 }
+$data merge entity $(text_display_text_display) { transformation: [0.1999456006056031f,-0.004661861739035467f,-0.00015441370006566313f,-0.011031543650401945f,0.004664418341513844f,0.19983600893079578f,0.006619118985655211f,0.6079648867431999f,4.8965785200600855e-17f,-0.006620919855807744f,0.19989037850847893f,0.24490714873463543f,0f,0f,0f,1f], start_interpolation: 0, interpolation_duration: 1 }
+$data merge entity $(bone_details) { transformation: [-0.9997280030280155f,-0.023309308695177337f,0.0007720685003281932f,0.04634724756460573f,-0.023322091707569215f,0.9991800446539789f,-0.03309559492827606f,0.42624086255691523f,-1.2243136989262346e-16f,-0.03310459927903872f,-0.9994518925423946f,0.19468818839845148f,0f,0f,0f,1f], start_interpolation: 0, interpolation_duration: 1 }
+$data merge entity $(bone_stereo) { transformation: [-0.9997280030280155f,-0.023309308695177337f,0.0007720685003281932f,0f,-0.023322091707569215f,0.9991800446539789f,-0.03309559492827606f,0.4030714679259756f,-1.2243136989262346e-16f,-0.03310459927903872f,-0.9994518925423946f,0f,0f,0f,0f,1f], start_interpolation: 0, interpolation_duration: 1 }
@@ -0,0 +1,6 @@
+$data merge entity $(bone_antenna) { transformation: [-0.999131670541888f,-0.0416363727902348f,0.0015222946655217787f,-0.6374086916801753f,-0.04166314422593983f,0.9981802687090794f,-0.04359281561310944f,0.7194290222829725f,0.0002955222235584653f,-0.04361838626935455f,-0.9990482215818578f,-0.20367881180859942f,0f,0f,0f,1f], start_interpolation: 0, interpolation_duration: 1 }
+$data merge entity $(bone_speaker_1) { transformation: [-0.9993908270190958f,-0.034866280114735505f,0.0015222946655217787f,-0.4655763100708252f,-0.034899496702500976f,0.9984396283986496f,-0.04359281561310944f,0.2759353496616066f,-1.2228165752336762e-16f,-0.04361938736533601f,-0.9990482215818578f,0.25385137296096466f,0f,0f,0f,1f], start_interpolation: 0, interpolation_duration: 1 }
+$data merge entity $(bone_speaker_2) { transformation: [-0.9993908270190958f,-0.034866280114735505f,0.0015222946655217787f,0.47135259025957715f,-0.034899496702500976f,0.9984396283986496f,-0.04359281561310944f,0.30865362782020134f,-1.2228165752336762e-16f,-0.04361938736533601f,-0.9990482215818578f,0.25385137296096477f,0f,0f,0f,1f], start_interpolation: 0, interpolation_duration: 1 }
+$data merge entity $(text_display_text_display) { transformation: [0.19987816540381917f,-0.006973256022947101f,-0.0003044589331043803f,-0.013493443818253223f,0.006979899340500196f,0.19968792567972993f,0.008718563122621889f,0.5823159976642664f,4.8925955639755084e-17f,-0.008723877473067201f,0.19980964431637158f,0.2427355013541356f,0f,0f,0f,1f], start_interpolation: 0, interpolation_duration: 1 }
+$data merge entity $(bone_details) { transformation: [-0.9993908270190958f,-0.034866280114735505f,0.0015222946655217787f,0.04600433621286765f,-0.034899496702500976f,0.9984396283986496f,-0.04359281561310944f,0.4007507549010941f,-1.2228165752336762e-16f,-0.04361938736533601f,-0.9990482215818578f,0.19444505285012323f,0f,0f,0f,1f], start_interpolation: 0, interpolation_duration: 1 }
+$data merge entity $(bone_stereo) { transformation: [-0.9993908270190958f,-0.034866280114735505f,0.0015222946655217787f,0f,-0.034899496702500976f,0.9984396283986496f,-0.04359281561310944f,0.375f,-1.2228165752336762e-16f,-0.04361938736533601f,-0.9990482215818578f,0f,0f,0f,0f,1f], start_interpolation: 0, interpolation_duration: 1 }
@@ -0,0 +1,6 @@
+$data merge entity $(bone_antenna) { transformation: [-0.9998968046206653f,-0.01436560627309037f,0.00009729228906715098f,-0.6297033036207512f,-0.014365930258192614f,0.9998675823541383f,-0.007644462381826524f,0.7470918790423189f,0.000012537930895498239f,-0.007645071202870621f,-0.9999707759375287f,-0.19036142604477868f,0f,0f,0f,1f], start_interpolation: 0, interpolation_duration: 1 }
+$data merge entity $(bone_speaker_1) { transformation: [-0.9999190195482685f,-0.012725756552756045f,0.00009729228906715098f,-0.46754332380869673f,-0.012726128461929234f,0.999889797852375f,-0.007644462381826524f,0.2837264461632436f,-1.2245476266963466e-16f,-0.007645081483978623f,-0.9999707759375287f,0.25070942037350513f,0f,0f,0f,1f], start_interpolation: 0, interpolation_duration: 1 }
+$data merge entity $(bone_speaker_2) { transformation: [-0.9999190195482685f,-0.012725756552756045f,0.00009729228906715098f,0.4698807570178049f,-0.012726128461929234f,0.999889797852375f,-0.007644462381826524f,0.2956571915963023f,-1.2245476266963466e-16f,-0.007645081483978623f,-0.9999707759375287f,0.25070942037350524f,0f,0f,0f,1f], start_interpolation: 0, interpolation_duration: 1 }
+$data merge entity $(text_display_text_display) { transformation: [0.1999838039096537f,-0.002545151310551209f,-0.000019458457813454687f,-0.008779352284968983f,0.002545225692385847f,0.199977959570475f,0.0015288924763653046f,0.580217197550204f,4.8983172733782724e-17f,-0.0015290162967957247f,0.19999415518750574f,0.25005002290462625f,0f,0f,0f,1f], start_interpolation: 0, interpolation_duration: 1 }
+$data merge entity $(bone_details) { transformation: [-0.9999190195482685f,-0.012725756552756045f,0.00009729228906715098f,0.04665336169497984f,-0.012726128461929234f,0.999889797852375f,-0.007644462381826524f,0.39923324625502327f,-1.2245476266963466e-16f,-0.007645081483978623f,-0.9999707759375287f,0.1951873377771114f,0f,0f,0f,1f], start_interpolation: 0, interpolation_duration: 1 }
+$data merge entity $(bone_stereo) { transformation: [-0.9999190195482685f,-0.012725756552756045f,0.00009729228906715098f,0f,-0.012726128461929234f,0.999889797852375f,-0.007644462381826524f,0.3815203718329765f,-1.2245476266963466e-16f,-0.007645081483978623f,-0.9999707759375287f,0f,0f,0f,0f,1f], start_interpolation: 0, interpolation_duration: 1 }
@@ -0,0 +1,11 @@
+execute unless entity @s[type=item_display, tag=aj.music_speaker.root] run return run function animated_java:global/errors/function_not_executed_as_root_entity {export_namespace: "music_speaker", function_path: "animated_java:music_speaker/animations/animation_speaker_playing_120/tween"}
+function animated_java:music_speaker/animations/pause_all
+tag @s add aj.music_speaker.animation.animation_speaker_playing_120.playing
+$scoreboard players set @s aj.tween_duration $(duration)
+$scoreboard players set @s aj.animation_speaker_playing_120.frame $(to_frame)
+scoreboard players operation #this aj.i = @s aj.tween_duration
+tag @s add aj.transforms_only
+execute at @s run function animated_java:music_speaker/animations/animation_speaker_playing_120/zzz/apply_frame {frame: 0}
+$execute at @s run function animated_java:music_speaker/animations/animation_speaker_playing_120/zzz/apply_frame {frame: $(to_frame)}
+tag @s remove aj.transforms_only
+execute on passengers store result entity @s interpolation_duration int 1 run scoreboard players get #this aj.i
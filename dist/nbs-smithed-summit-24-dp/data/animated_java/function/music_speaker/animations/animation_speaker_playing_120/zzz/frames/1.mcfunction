@@ -0,0 +1,6 @@
+$data merge entity $(bone_antenna) { transformation: [-0.9999952938095762f,-0.003067956762965976f,1.2246467991473532e-16f,-0.625f,-0.003067956762965976f,0.9999952938095762f,0f,0.74853515625f,-1.2246410357263145e-16f,-3.7571634296887576e-19f,-1f,-0.18750000000000008f,0f,0f,0f,1f], start_interpolation: 0, interpolation_duration: 1 }
+$data merge entity $(bone_speaker_1) { transformation: [-0.9962962962962962f,0f,1.2019681547186986e-16f,-0.46875000000000006f,0f,0.9962962962962962f,0f,0.27978515625f,-1.2201110702616222e-16f,0f,-0.9814814814814815f,0.24999999999999994f,0f,0f,0f,1f], start_interpolation: 0, interpolation_duration: 1 }
+$data merge entity $(bone_speaker_2) { transformation: [-0.9962962962962962f,0f,1.2019681547186986e-16f,0.46874999999999994f,0f,0.9962962962962962f,0f,0.27978515625f,-1.2201110702616222e-16f,0f,-0.9814814814814815f,0.25000000000000006f,0f,0f,0f,1f], start_interpolation: 0, interpolation_duration: 1 }
+$data merge entity $(text_display_text_display) { transformation: [0.2f,0f,-4.898587196589413e-17f,-0.006250000000000026f,0f,0.2f,0f,0.57041015625f,4.898587196589413e-17f,0f,0.2f,0.2515625f,0f,0f,0f,1f], start_interpolation: 0, interpolation_duration: 1 }
+$data merge entity $(bone_details) { transformation: [-1f,0f,1.2246467991473532e-16f,0.04687499999999998f,0f,1f,0f,0.38916015625f,-1.2246467991473532e-16f,0f,-1f,0.1953125f,0f,0f,0f,1f], start_interpolation: 0, interpolation_duration: 1 }
+$data merge entity $(bone_stereo) { transformation: [-1f,0f,1.2246467991473532e-16f,0f,0f,1f,0f,0.37353515625f,-1.2246467991473532e-16f,0f,-1f,0f,0f,0f,0f,1f], start_interpolation: 0, interpolation_duration: 1 }
@@ -0,0 +1,6 @@
+$data merge entity $(bone_antenna) { transformation: [-0.9999882478077495f,-0.004848117819001852f,1.2246467991473532e-16f,-0.625f,-0.004848117819001852f,0.9999882478077495f,0f,0.7476851851851851f,-1.2246324068627308e-16f,-5.9372319689298655e-19f,-1f,-0.18750000000000008f,0f,0f,0f,1f], start_interpolation: 0, interpolation_duration: 1 }
+$data merge entity $(bone_speaker_1) { transformation: [-0.9925925925925926f,0f,1.1792895102900438e-16f,-0.46875000000000006f,0f,0.9925925925925926f,0f,0.2789351851851852f,-1.2155753413758913e-16f,0f,-0.962962962962963f,0.24999999999999994f,0f,0f,0f,1f], start_interpolation: 0, interpolation_duration: 1 }
+$data merge entity $(bone_speaker_2) { transformation: [-0.9925925925925926f,0f,1.1792895102900438e-16f,0.46874999999999994f,0f,0.9925925925925926f,0f,0.2789351851851852f,-1.2155753413758913e-16f,0f,-0.962962962962963f,0.25000000000000006f,0f,0f,0f,1f], start_interpolation: 0, interpolation_duration: 1 }
+$data merge entity $(text_display_text_display) { transformation: [0.2f,0f,-4.898587196589413e-17f,-0.006250000000000026f,0f,0.2f,0f,0.5695601851851853f,4.898587196589413e-17f,0f,0.2f,0.2515625f,0f,0f,0f,1f], start_interpolation: 0, interpolation_duration: 1 }
+$data merge entity $(bone_details) { transformation: [-1f,0f,1.2246467991473532e-16f,0.04687499999999998f,0f,1f,0f,0.3883101851851852f,-1.2246467991473532e-16f,0f,-1f,0.1953125f,0f,0f,0f,1f], start_interpolation: 0, interpolation_duration: 1 }
+$data merge entity $(bone_stereo) { transformation: [-1f,0f,1.2246467991473532e-16f,0f,0f,1f,0f,0.3726851851851852f,-1.2246467991473532e-16f,0f,-1f,0f,0f,0f,0f,1f], start_interpolation: 0, interpolation_duration: 1 }
@@ -0,0 +1,6 @@
+$data merge entity $(bone_antenna) { transformation: [-0.9999665339174011f,-0.008181139603937137f,1.2246467991473532e-16f,-0.625f,-0.008181139603937137f,0.9999665339174011f,0f,0.74609375f,-1.2246058150164184e-16f,-1.001900642933926e-18f,-1f,-0.18750000000000008f,0f,0f,0f,1f], start_interpolation: 0, interpolation_duration: 1 }
+$data merge entity $(bone_speaker_1) { transformation: [-0.9962962962962963f,0f,1.2019681547186984e-16f,-0.46875000000000006f,0f,0.9962962962962963f,0f,0.27734375f,-1.2201110702616222e-16f,0f,-0.9814814814814814f,0.24999999999999994f,0f,0f,0f,1f], start_interpolation: 0, interpolation_duration: 1 }
+$data merge entity $(bone_speaker_2) { transformation: [-0.9962962962962963f,0f,1.2019681547186984e-16f,0.46874999999999994f,0f,0.9962962962962963f,0f,0.27734375f,-1.2201110702616222e-16f,0f,-0.9814814814814814f,0.25000000000000006f,0f,0f,0f,1f], start_interpolation: 0, interpolation_duration: 1 }
+$data merge entity $(text_display_text_display) { transformation: [0.2f,0f,-4.898587196589413e-17f,-0.006250000000000026f,0f,0.2f,0f,0.56796875f,4.898587196589413e-17f,0f,0.2f,0.2515625f,0f,0f,0f,1f], start_interpolation: 0, interpolation_duration: 1 }
+$data merge entity $(bone_details) { transformation: [-1f,0f,1.2246467991473532e-16f,0.04687499999999998f,0f,1f,0f,0.38671875f,-1.2246467991473532e-16f,0f,-1f,0.1953125f,0f,0f,0f,1f], start_interpolation: 0, interpolation_duration: 1 }
+$data merge entity $(bone_stereo) { transformation: [-1f,0f,1.2246467991473532e-16f,0f,0f,1f,0f,0.37109375f,-1.2246467991473532e-16f,0f,-1f,0f,0f,0f,0f,1f], start_interpolation: 0, interpolation_duration: 1 }
@@ -0,0 +1,6 @@
+$data merge entity $(bone_antenna) { transformation: [-0.9972904566786902f,0.07356456359966743f,1.2246467991473532e-16f,-0.625f,0.07356456359966743f,0.9972904566786902f,0f,0.78515625f,-1.2213285655917601e-16f,9.009060734300461e-18f,-1f,-0.18750000000000008f,0f,0f,0f,1f], start_interpolation: 0, interpolation_duration: 1 }
+$data merge entity $(bone_speaker_1) { transformation: [-1.1f,0f,1.8369701987210297e-16f,-0.46875000000000006f,0f,1.1f,0f,0.31640625f,-1.3471114790620887e-16f,0f,-1.5f,0.24999999999999994f,0f,0f,0f,1f], start_interpolation: 0, interpolation_duration: 1 }
+$data merge entity $(bone_speaker_2) { transformation: [-1.1f,0f,1.8369701987210297e-16f,0.46874999999999994f,0f,1.1f,0f,0.31640625f,-1.3471114790620887e-16f,0f,-1.5f,0.25000000000000006f,0f,0f,0f,1f], start_interpolation: 0, interpolation_duration: 1 }
+$data merge entity $(text_display_text_display) { transformation: [0.2f,0f,-4.898587196589413e-17f,-0.006250000000000026f,0f,0.2f,0f,0.60703125f,4.898587196589413e-17f,0f,0.2f,0.2515625f,0f,0f,0f,1f], start_interpolation: 0, interpolation_duration: 1 }
+$data merge entity $(bone_details) { transformation: [-1f,0f,1.2246467991473532e-16f,0.04687499999999998f,0f,1f,0f,0.42578125f,-1.2246467991473532e-16f,0f,-1f,0.1953125f,0f,0f,0f,1f], start_interpolation: 0, interpolation_duration: 1 }
+$data merge entity $(bone_stereo) { transformation: [-1f,0f,1.2246467991473532e-16f,0f,0f,1f,0f,0.41015625f,-1.2246467991473532e-16f,0f,-1f,0f,0f,0f,0f,1f], start_interpolation: 0, interpolation_duration: 1 }
@@ -0,0 +1,6 @@
+$data merge entity $(bone_antenna) { transformation: [-0.9914448613738104f,0.13052619222005157f,1.2246467991473532e-16f,-0.625f,0.13052619222005157f,0.9914448613738104f,0f,0.8125f,-1.2141697760125282e-16f,1.5984848350717833e-17f,-1f,-0.18750000000000008f,0f,0f,0f,1f], start_interpolation: 0, interpolation_duration: 1 }
+$data merge entity $(bone_speaker_1) { transformation: [-1.0562500000000001f,0f,1.5690787114075463e-16f,-0.46875000000000006f,0f,1.0562500000000001f,0f,0.34375f,-1.293533181599392e-16f,0f,-1.28125f,0.24999999999999994f,0f,0f,0f,1f], start_interpolation: 0, interpolation_duration: 1 }
+$data merge entity $(bone_speaker_2) { transformation: [-1.0562500000000001f,0f,1.5690787114075463e-16f,0.46874999999999994f,0f,1.0562500000000001f,0f,0.34375f,-1.293533181599392e-16f,0f,-1.28125f,0.25000000000000006f,0f,0f,0f,1f], start_interpolation: 0, interpolation_duration: 1 }
+$data merge entity $(text_display_text_display) { transformation: [0.2f,0f,-4.898587196589413e-17f,-0.006250000000000026f,0f,0.2f,0f,0.634375f,4.898587196589413e-17f,0f,0.2f,0.2515625f,0f,0f,0f,1f], start_interpolation: 0, interpolation_duration: 1 }
+$data merge entity $(bone_details) { transformation: [-1f,0f,1.2246467991473532e-16f,0.04687499999999998f,0f,1f,0f,0.453125f,-1.2246467991473532e-16f,0f,-1f,0.1953125f,0f,0f,0f,1f], start_interpolation: 0, interpolation_duration: 1 }
+$data merge entity $(bone_stereo) { transformation: [-1f,0f,1.2246467991473532e-16f,0f,0f,1f,0f,0.4375f,-1.2246467991473532e-16f,0f,-1f,0f,0f,0f,0f,1f], start_interpolation: 0, interpolation_duration: 1 }
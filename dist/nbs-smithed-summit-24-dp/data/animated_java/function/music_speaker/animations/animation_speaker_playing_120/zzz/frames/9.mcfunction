@@ -0,0 +1,6 @@
+$data merge entity $(bone_antenna) { transformation: [-0.9999529915072262f,-0.009696121685978396f,1.2246467991473532e-16f,-0.625f,-0.009696121685978396f,0.9999529915072262f,0f,0.7453703703703703f,-1.224589230347145e-16f,-1.187432438687668e-18f,-1f,-0.18750000000000008f,0f,0f,0f,1f], start_interpolation: 0, interpolation_duration: 1 }
+$data merge entity $(bone_speaker_1) { transformation: [-0.9962962962962963f,0f,1.2019681547186986e-16f,-0.46875000000000006f,0f,0.9962962962962963f,0f,0.27662037037037035f,-1.2201110702616222e-16f,0f,-0.9814814814814815f,0.24999999999999994f,0f,0f,0f,1f], start_interpolation: 0, interpolation_duration: 1 }
+$data merge entity $(bone_speaker_2) { transformation: [-0.9962962962962963f,0f,1.2019681547186986e-16f,0.46874999999999994f,0f,0.9962962962962963f,0f,0.27662037037037035f,-1.2201110702616222e-16f,0f,-0.9814814814814815f,0.25000000000000006f,0f,0f,0f,1f], start_interpolation: 0, interpolation_duration: 1 }
+$data merge entity $(text_display_text_display) { transformation: [0.2f,0f,-4.898587196589413e-17f,-0.006250000000000026f,0f,0.2f,0f,0.5672453703703704f,4.898587196589413e-17f,0f,0.2f,0.2515625f,0f,0f,0f,1f], start_interpolation: 0, interpolation_duration: 1 }
+$data merge entity $(bone_details) { transformation: [-1f,0f,1.2246467991473532e-16f,0.04687499999999998f,0f,1f,0f,0.38599537037037035f,-1.2246467991473532e-16f,0f,-1f,0.1953125f,0f,0f,0f,1f], start_interpolation: 0, interpolation_duration: 1 }
+$data merge entity $(bone_stereo) { transformation: [-1f,0f,1.2246467991473532e-16f,0f,0f,1f,0f,0.37037037037037035f,-1.2246467991473532e-16f,0f,-1f,0f,0f,0f,0f,1f], start_interpolation: 0, interpolation_duration: 1 }
@@ -0,0 +1,8 @@
+scoreboard players remove @s aj.tween_duration 1
+execute if score @s aj.tween_duration matches 1.. run return 1
+execute if score @s aj.tween_duration matches 0 on passengers run data modify entity @s interpolation_duration set value 1
+execute if score @s aj.animation_speaker_playing_120.frame matches -1 run function animated_java:music_speaker/animations/animation_speaker_playing_120/zzz/zzz/0
+execute store result storage aj:temp frame int 1 run scoreboard players get @s aj.animation_speaker_playing_120.frame
+function animated_java:music_speaker/animations/animation_speaker_playing_120/zzz/apply_frame with storage aj:temp
+execute if score @s aj.animation_speaker_playing_120.frame matches 19.. run return run function animated_java:music_speaker/animations/animation_speaker_playing_120/zzz/zzz/1
+scoreboard players add @s aj.animation_speaker_playing_120.frame 1
@@ -0,0 +1 @@
+scoreboard players set @s aj.animation_speaker_playing_120.frame -1
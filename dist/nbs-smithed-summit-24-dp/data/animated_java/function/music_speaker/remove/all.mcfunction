@@ -0,0 +1 @@
+execute as @e[type=item_display, tag=aj.music_speaker.root] run function animated_java:music_speaker/remove/this
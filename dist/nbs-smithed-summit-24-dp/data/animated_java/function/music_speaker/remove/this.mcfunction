@@ -0,0 +1,5 @@
+execute unless entity @s[type=item_display, tag=aj.music_speaker.root] run return run function animated_java:global/errors/function_not_executed_as_root_entity {export_namespace: "music_speaker", function_path: "animated_java:music_speaker/remove/this"}
+function #animated_java:music_speaker/as_root/on_remove
+execute on passengers if entity @s[tag=aj.data] run function animated_java:music_speaker/remove/zzz/0
+execute on passengers run kill @s
+kill @s
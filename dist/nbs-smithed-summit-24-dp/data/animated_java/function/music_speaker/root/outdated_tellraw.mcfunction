@@ -0,0 +1 @@
+$tellraw @a ["",[{"text":"[","color":"gray"},{"text":"AJ","color":"aqua"},{"text":"] "}],{"text":"Error: ","color":"red"},{"text":"The ","color":"red"},{"text":"music_speaker","color":"yellow"},{"text":" rig instance at","color":"red"},[{"text":" [","color":"yellow"},{"score":{"name":"#this.x","objective":"aj.i"}},", ",{"score":{"name":"#this.y","objective":"aj.i"}},", ",{"score":{"name":"#this.z","objective":"aj.i"}},"]"],{"text":" is outdated! It will not function correctly and should be removed or re-summoned.","color":"red"},"\n ",{"text":"[Click Here to Teleport to the Rig Instance]","clickEvent":{"action":"suggest_command","value":"/tp @s $(x) $(y) $(z)"},"color":"aqua","underlined":true}]
@@ -0,0 +1,9 @@
+execute store result storage aj:temp x int 1 store result score #this.x aj.i run data get entity @s Pos[0] 1
+execute store result storage aj:temp y int 1 store result score #this.y aj.i run data get entity @s Pos[1] 1
+execute store result storage aj:temp z int 1 store result score #this.z aj.i run data get entity @s Pos[2] 1
+function animated_java:music_speaker/root/outdated_tellraw with storage aj:temp
+data modify entity @s data.rigHash set value "161acab26de4cba90bedfd171f5231a5a315b02ec9aef87b4b4f73d03abc5813"
+execute on passengers run data merge entity @s {Glowing: 1b, glow_color_override: 16711680}
+summon minecraft:text_display ~ ~ ~ {Tags: ["aj.rig_entity", "aj.outdated_rig_text_display", "aj.new"], text: '["",{"text":"This rig instance is outdated!\\nIt will not function correctly and should be removed or re-summoned.","color":"red"}]', billboard: "vertical", transformation: {translation: [0.0f, 3.0f, 0.0f], left_rotation: [0.0f, 0.0f, 0.0f, 1.0f], right_rotation: [0.0f, 0.0f, 0.0f, 1.0f], scale: [1.0f, 1.0f, 1.0f]}}
+ride @e[type=minecraft:text_display, tag=aj.new, limit=1, distance=..0.01] mount @s
+tag @e[type=minecraft:text_display, tag=aj.new, limit=1, distance=..0.01] remove aj.new
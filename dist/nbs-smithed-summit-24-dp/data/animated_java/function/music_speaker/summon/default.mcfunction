@@ -0,0 +1 @@
+function animated_java:music_speaker/summon {args: {variant: "default"}}
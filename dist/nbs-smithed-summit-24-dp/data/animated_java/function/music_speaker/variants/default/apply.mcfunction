@@ -0,0 +1,6 @@
+execute unless entity @s[type=item_display, tag=aj.music_speaker.root] run return run function animated_java:global/errors/function_not_executed_as_root_entity {export_namespace: "music_speaker", function_path: "animated_java:music_speaker/variants/default/apply"}
+execute on passengers if entity @s[tag=aj.music_speaker.bone.antenna] run function animated_java:music_speaker/variants/default/zzz/0
+execute on passengers if entity @s[tag=aj.music_speaker.bone.speaker_1] run function animated_java:music_speaker/variants/default/zzz/1
+execute on passengers if entity @s[tag=aj.music_speaker.bone.speaker_2] run function animated_java:music_speaker/variants/default/zzz/2
+execute on passengers if entity @s[tag=aj.music_speaker.bone.details] run function animated_java:music_speaker/variants/default/zzz/3
+execute on passengers if entity @s[tag=aj.music_speaker.bone.stereo] run function animated_java:music_speaker/variants/default/zzz/4
@@ -0,0 +1 @@
+data modify entity @s item.components."minecraft:custom_model_data" set value 18484
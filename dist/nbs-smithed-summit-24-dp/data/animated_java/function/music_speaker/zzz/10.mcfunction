@@ -0,0 +1,2 @@
+$tellraw @a ["",[{"text":"[","color":"gray"},{"text":"AJ","color":"aqua"},{"text":"] "}],{"text":"Error: ","color":"red"},{"text":"The animation ","color":"red"},{"text":"$(animation)","color":"yellow"},{"text":" does not exist.","color":"red"},"\n ",{"text":" ≡ ","color":"white"},{"text":"Available Animations:","color":"green"},["\n "," "," ",{"text":" ● ","color":"gray"},{"text":"animation_speaker_playing_120","color":"yellow"}],["\n "," "," ",{"text":" ● ","color":"gray"},{"text":"animation_speaker_beat_1","color":"yellow"}],["\n "," "," ",{"text":" ● ","color":"gray"},{"text":"animation_speaker_beat_2","color":"yellow"}],["\n "," "," ",{"text":" ● ","color":"gray"},{"text":"animation_speaker_beat_3","color":"yellow"}],["\n "," "," ",{"text":" ● ","color":"gray"},{"text":"animation_speaker_beat_4","color":"yellow"}]]
+function animated_java:music_speaker/remove/this
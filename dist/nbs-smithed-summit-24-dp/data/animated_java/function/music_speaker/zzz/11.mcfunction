@@ -0,0 +1 @@
+$function animated_java:music_speaker/animations/$(animation)/resume
@@ -0,0 +1,3 @@
+execute if data storage aj:temp {args: {variant: ""}} run return run function animated_java:music_speaker/zzz/3
+execute store success score #success aj.i run function animated_java:music_speaker/zzz/4 with storage aj:temp args
+execute unless score #success aj.i matches 1 run return run function animated_java:music_speaker/zzz/5 with storage aj:temp args
@@ -0,0 +1,2 @@
+tellraw @a ["", [{"text": "[", "color": "gray"}, {"text": "AJ", "color": "aqua"}, {"text": "] "}], {"text": "Error: ", "color": "red"}, {"text": "variant", "color": "yellow"}, {"text": " cannot be an empty string.", "color": "red"}]
+function animated_java:music_speaker/remove/this
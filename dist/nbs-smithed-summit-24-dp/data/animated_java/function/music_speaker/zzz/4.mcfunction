@@ -0,0 +1,3 @@
+$execute store success score #success aj.i run function animated_java:music_speaker/variants/$(variant)/apply
+execute if score #success aj.i matches 1 run return 1
+return fail
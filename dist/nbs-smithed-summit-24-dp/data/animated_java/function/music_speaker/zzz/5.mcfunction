@@ -0,0 +1,2 @@
+$tellraw @a ["",[{"text":"[","color":"gray"},{"text":"AJ","color":"aqua"},{"text":"] "}],{"text":"Error: ","color":"red"},{"text":"The variant ","color":"red"},{"text":"$(variant)","color":"yellow"},{"text":" does not exist.","color":"red"},"\n ",{"text":" ≡ ","color":"white"},{"text":"Available Variants:","color":"green"},["\n "," "," ",{"text":" ● ","color":"gray"},{"text":"default","color":"yellow"}]]
+function animated_java:music_speaker/remove/this
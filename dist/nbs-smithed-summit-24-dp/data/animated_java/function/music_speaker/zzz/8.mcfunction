@@ -0,0 +1,2 @@
+tellraw @a ["", [{"text": "[", "color": "gray"}, {"text": "AJ", "color": "aqua"}, {"text": "] "}], {"text": "Error: ", "color": "red"}, {"text": "frame", "color": "yellow"}, {"text": " must be a non-negative integer.", "color": "red"}]
+function animated_java:music_speaker/remove/this
@@ -0,0 +1,2 @@
+execute if score shuffle nbs matches 0 run function nbs:global/next
+execute if score shuffle nbs matches 1 run function nbs:global/shuffle
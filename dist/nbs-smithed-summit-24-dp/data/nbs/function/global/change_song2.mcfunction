@@ -0,0 +1,2 @@
+$data modify storage nbs:main playing set from storage nbs:main songs[$(index)]
+function nbs:global/title with storage nbs:main playing
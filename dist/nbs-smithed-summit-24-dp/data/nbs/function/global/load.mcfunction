@@ -0,0 +1,12 @@
+data modify storage nbs:main songs set value []
+data modify storage nbs:main songs append value {name: "box_has_key", index: 0, formatted_string: "Box Has Key (Baba Is You) - Bentroen", title: "", author: "", original_author: ""}
+data modify storage nbs:main songs append value {name: "remix_10", index: 1, formatted_string: "Remix 10 (Super Mario Run) - Bentroen", title: "Remix 10 (Super Mario Run)", author: "Bentroen", original_author: "Kenta Nagata"}
+data modify storage nbs:main songs append value {name: "thriller", index: 2, formatted_string: "Thriller - Bentroen", title: "", author: "", original_author: ""}
+data modify storage nbs:main songs append value {name: "everybody_falls", index: 3, formatted_string: "Everybody Falls (Fall Guys Theme) - Bentroen", title: "Everybody Falls (Fall Guys Theme)", author: "Bentroen", original_author: "Jukio Kallio; Daniel Hagstrom"}
+scoreboard objectives add nbs dummy
+scoreboard objectives add nbs_stats dummy
+scoreboard players set playing nbs 1
+scoreboard players set shuffle nbs 1
+function nbs:interaction/fix_entities
+schedule function nbs:global/tick 1 replace
+function nbs:global/load/save_speaker_positions
@@ -0,0 +1,4 @@
+data modify storage nbs:main locations set value {speaker: [], loudspeaker: []}
+data modify storage nbs:temp input set value {}
+execute as @e[type=item_display, tag=nbs_speaker] run function nbs:global/load/save_speaker_positions/nested_execute_0
+execute as @e[type=item_display, tag=nbs_loudspeaker] run function nbs:global/load/save_speaker_positions/nested_execute_1
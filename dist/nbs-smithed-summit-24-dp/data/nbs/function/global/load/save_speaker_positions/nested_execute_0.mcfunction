@@ -0,0 +1,3 @@
+data modify storage nbs:temp input.UUID set from entity @s UUID
+function animated_java:global/internal/gu/convert_uuid_array_to_string with storage nbs:temp input
+data modify storage nbs:main locations.speaker append from storage aj:uuid main.out
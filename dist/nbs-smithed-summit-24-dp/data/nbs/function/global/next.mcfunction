@@ -0,0 +1,3 @@
+scoreboard players add songindex nbs 1
+execute if score songindex nbs matches 4.. run scoreboard players set songindex nbs 0
+function nbs:global/change_song
@@ -0,0 +1,3 @@
+function animated_java:music_speaker/summon/default
+tag @e[type=item_display, limit=1, distance=..1, tag=nbs_speaker_new] add nbs_speaker
+tag @e[type=item_display, limit=1, distance=..1, tag=nbs_speaker_new] remove nbs_speaker_new
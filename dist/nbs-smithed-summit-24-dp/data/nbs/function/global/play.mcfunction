@@ -0,0 +1 @@
+scoreboard players set playing nbs 1
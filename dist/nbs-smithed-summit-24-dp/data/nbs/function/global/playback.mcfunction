@@ -0,0 +1 @@
+$function nbs:song/$(name)/$(tick)/root
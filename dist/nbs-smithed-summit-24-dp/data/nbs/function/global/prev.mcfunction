@@ -0,0 +1,3 @@
+scoreboard players remove songindex nbs 1
+execute if score songindex nbs matches ..-1 run scoreboard players set songindex nbs 3
+function nbs:global/change_song
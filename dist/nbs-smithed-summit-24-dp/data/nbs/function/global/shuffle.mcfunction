@@ -0,0 +1,4 @@
+scoreboard players operation prevsong nbs = songindex nbs
+execute store result score songindex nbs run random value 0..3
+execute if score songindex nbs = prevsong nbs run function nbs:global/next
+function nbs:global/change_song
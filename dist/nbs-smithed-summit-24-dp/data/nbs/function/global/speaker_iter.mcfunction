@@ -0,0 +1,4 @@
+$data modify storage nbs:temp input.uuid set from storage nbs:main locations.$(speaker_type)[$(i)]
+function nbs:global/speaker_iter/uuid with storage nbs:temp input
+execute store result storage nbs:temp input.i int 1 run scoreboard players add #iter nbs 1
+execute if score #iter nbs < #len nbs run function nbs:global/speaker_iter with storage nbs:temp input
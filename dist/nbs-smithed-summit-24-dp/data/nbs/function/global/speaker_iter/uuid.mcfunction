@@ -0,0 +1 @@
+$execute as $(uuid) at @s run function nbs:song/$(song)/$(tick)/$(speaker_type)
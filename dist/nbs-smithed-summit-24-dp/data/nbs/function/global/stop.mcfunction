@@ -0,0 +1,2 @@
+scoreboard players set playing nbs 0
+scoreboard players set songtime nbs -1
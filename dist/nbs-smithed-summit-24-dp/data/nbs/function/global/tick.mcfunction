@@ -0,0 +1,4 @@
+schedule function nbs:global/tick 1 replace
+execute if score playing nbs matches 1 run scoreboard players add songtime nbs 1
+execute store result storage nbs:main playing.tick int 1 run scoreboard players get songtime nbs
+function nbs:global/playback with storage nbs:main playing
@@ -0,0 +1,6 @@
+give @s minecraft:carved_pumpkin[minecraft:custom_model_data=48185, minecraft:item_name="Headphones", minecraft:rarity="rare", minecraft:max_stack_size=1, minecraft:lore=['{text:"Equip in your head slot to",italic:false,color:gray}', '{text:"hear music everywhere!",italic:false,color:gray}', '{text:""}', '["",{text:"by ",italic:false,color:gray},{text:"Note Block Studio",italic:false,color:green}]']] 1
+execute unless entity @s[tag=nbs_headphones_collected] run scoreboard players add headphones_players nbs_stats 1
+scoreboard players add headphones_collected nbs_stats 1
+tag @s add nbs_headphones_collected
+advancement revoke @s only nbs:headphones_left
+advancement revoke @s only nbs:headphones_right
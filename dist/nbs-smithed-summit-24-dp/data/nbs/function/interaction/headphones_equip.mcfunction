@@ -0,0 +1,4 @@
+tag @s add nbs_headphones
+scoreboard players add headphones_equipped nbs_stats 1
+function nbs:interaction/title with storage nbs:main playing
+function nbs:interaction/headphones_equip2 with storage nbs:main playing
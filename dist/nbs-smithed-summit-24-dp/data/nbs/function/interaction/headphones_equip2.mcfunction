@@ -0,0 +1 @@
+$title @s actionbar {"text":"","extra":[{"text":"🎧 Listening to: ","color":"green"},{"text":"$(formatted_string)","color":"white"}]}
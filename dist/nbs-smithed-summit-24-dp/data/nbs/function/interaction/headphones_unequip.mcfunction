@@ -0,0 +1,3 @@
+tag @s remove nbs_headphones
+advancement revoke @s only nbs:headphones_equip
+advancement revoke @s only nbs:headphones_unequip
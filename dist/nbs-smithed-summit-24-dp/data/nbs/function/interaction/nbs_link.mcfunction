@@ -0,0 +1,4 @@
+scoreboard players add nbs_link nbs_stats 1
+tellraw @p ["", "\n", {"text": "\u2554\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2557", "color": "yellow"}, "\n", "\n", {"text": "   Click to open in your browser!", "color": "yellow"}, "\n", "\n", {"text": "      >> ", "color": "gray"}, {"text": "noteblock.studio", "bold": true, "underlined": true, "color": "green", "clickEvent": {"action": "open_url", "value": "https://noteblock.studio/"}, "hoverEvent": {"action": "show_text", "contents": [{"text": "https://noteblock.studio/", "color": "yellow"}]}}, {"text": " <<", "color": "gray"}, "\n", "\n", {"text": "   You can also find us on:", "color": "yellow"}, "\n", "\n", "        ", {"text": "Discord", "bold": true, "underlined": true, "color": "#5865F2", "clickEvent": {"action": "open_url", "value": "https://discord.gg/open-note-block-studio-608692895179997252"}, "hoverEvent": {"action": "show_text", "contents": [{"text": "https://discord.gg/open-note-block-studio-608692895179997252", "color": "yellow"}]}}, " \ud83c\udfae \u2022 \ud83d\udcbb ", {"text": "GitHub", "bold": true, "underlined": true, "color": "dark_purple", "clickEvent": {"action": "open_url", "value": "https://github.com/OpenNBS"}, "hoverEvent": {"action": "show_text", "contents": [{"text": "https://github.com/OpenNBS", "color": "yellow"}]}}, "\n", "\n", "       ", {"text": "YouTube", "bold": true, "underlined": true, "color": "#FF0000", "clickEvent": {"action": "open_url", "value": "https://youtube.com/@OpenNBS"}, "hoverEvent": {"action": "show_text", "contents": [{"text": "https://youtube.com/OpenNBS", "color": "yellow"}]}}, " \ud83c\udf9e \u2022 \u2764 ", {"text": "Donate", "bold": true, "underlined": true, "color": "#7EADF1", "clickEvent": {"action": "open_url", "value": "https://opencollective.com/OpenNBS"}, "hoverEvent": {"action": "show_text", "contents": [{"text": "https://opencollective.com/OpenNBS", "color": "yellow"}]}}, "\n", "\n", {"text": "\u255a\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u255d", "color": "yellow"}]
+advancement revoke @s only nbs:nbs_link_left
+advancement revoke @s only nbs:nbs_link_right
@@ -0,0 +1,4 @@
+scoreboard players add nbw_link nbs_stats 1
+tellraw @p ["", "\n", {"text": "\u2554\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2557", "color": "green"}, "\n", "\n", {"text": "   Click to open in your browser!", "color": "green"}, "\n", "\n", {"text": "      >> ", "color": "gray"}, {"text": "noteblock.world", "bold": true, "underlined": true, "color": "aqua", "clickEvent": {"action": "open_url", "value": "https://noteblock.world/"}, "hoverEvent": {"action": "show_text", "contents": [{"text": "https://noteblock.world/", "color": "green"}]}}, {"text": " <<", "color": "gray"}, "\n", "\n", {"text": "   You can also find us on:", "color": "green"}, "\n", "\n", "        ", {"text": "Discord", "bold": true, "underlined": true, "color": "#5865F2", "clickEvent": {"action": "open_url", "value": "https://discord.gg/open-note-block-studio-608692895179997252"}, "hoverEvent": {"action": "show_text", "contents": [{"text": "https://discord.gg/", "color": "green"}]}}, " \ud83c\udfae \u2022 \ud83d\udcbb ", {"text": "GitHub", "bold": true, "underlined": true, "color": "dark_purple", "clickEvent": {"action": "open_url", "value": "https://github.com/OpenNBS"}, "hoverEvent": {"action": "show_text", "contents": [{"text": "https://github.com/OpenNBS", "color": "green"}]}}, "\n", "\n", "       ", {"text": "YouTube", "bold": true, "underlined": true, "color": "#FF0000", "clickEvent": {"action": "open_url", "value": "https://youtube.com/@OpenNBS"}, "hoverEvent": {"action": "show_text", "contents": [{"text": "https://youtube.com/OpenNBS", "color": "green"}]}}, " \ud83c\udf9e \u2022 \u2764 ", {"text": "Donate", "bold": true, "underlined": true, "color": "#7EADF1", "clickEvent": {"action": "open_url", "value": "https://opencollective.com/OpenNBS"}, "hoverEvent": {"action": "show_text", "contents": [{"text": "https://opencollective.com/OpenNBS", "color": "green"}]}}, "\n", "\n", {"text": "\u255a\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u255d", "color": "green"}]
+advancement revoke @s only nbs:nbw_link_left
+advancement revoke @s only nbs:nbw_link_right
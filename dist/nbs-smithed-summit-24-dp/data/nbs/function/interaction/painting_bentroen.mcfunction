@@ -0,0 +1,4 @@
+tellraw @s ["","\n",{"text":"========================================","bold":true,"strikethrough":true,"color":"dark_purple"},"\n","\n",{"text":"  Bentroen >>","bold":true,"color":"light_purple"},"\n","\n",{"text":"   Songs:","color":"yellow"},"\n",{"text":"     -  ","color":"gray"},{"text":"Jukio Kallio - Everybody Falls (Fall Guys Theme)","color":"white"},"\n",{"text":"     -  ","color":"gray"},{"text":"Super Mario Run - Remix 10","color":"white"},"\n",{"text":"     -  ","color":"gray"},{"text":"Michael Jackson - Thriller","color":"white"},"\n","\n",{"text":"   ⛏ ","color":"white"},{"text":"Bentroen","color":"dark_green","hoverEvent":{"action":"show_text","contents":["Minecraft username"]}},"\n",{"text":"   🎮 ","color":"white"},{"text":"@bentroen","color":"#5865F2","hoverEvent":{"action":"show_text","contents":[{"text":"Discord username","color":"white"}]}},"\n",{"text":"   📺 ","color":"white"},{"text":"@Bentroen_","underlined":true,"color":"#FF0000","clickEvent":{"action":"open_url","value":"https://youtube.com/@Bentroen_"},"hoverEvent":{"action":"show_text","contents":[{"text":"https://youtube.com/@Bentroen_","color":"yellow"}]}},"\n","\n",{"text":"========================================","bold":true,"strikethrough":true,"color":"dark_purple"}]
+scoreboard players add paintings_clicked nbs_stats 1
+advancement revoke @s only nbs:painting_bentroen_left
+advancement revoke @s only nbs:painting_bentroen_right
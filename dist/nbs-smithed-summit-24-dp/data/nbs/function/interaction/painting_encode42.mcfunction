@@ -0,0 +1,4 @@
+tellraw @s ["","\n",{"text":"========================================","bold":true,"strikethrough":true,"color":"dark_purple"},"\n","\n",{"text":"  encode42 >>","bold":true,"color":"light_purple"},"\n","\n",{"text":"   Songs:","color":"yellow"},"\n",{"text":"     -  ","color":"gray"},{"text":"Lena Raine - Resurrections (Celeste)","color":"white"},"\n",{"text":"     -  ","color":"gray"},{"text":"Toby Fox - My Castle Town (DELTARUNE)","color":"white"},"\n",{"text":"     -  ","color":"gray"},{"text":"Radiohead - Jigsaw Falling Into Place","color":"white"},"\n","\n",{"text":"   ⛏ ","color":"white"},{"text":"encode42","color":"dark_green","hoverEvent":{"action":"show_text","contents":["Minecraft username"]}},"\n",{"text":"   🎮 ","color":"white"},{"text":"@encode42","color":"#5865F2","hoverEvent":{"action":"show_text","contents":[{"text":"Discord username","color":"white"}]}},"\n",{"text":"   📺 ","color":"white"},{"text":"@encode42","underlined":true,"color":"#FF0000","clickEvent":{"action":"open_url","value":"https://youtube.com/@encode42"},"hoverEvent":{"action":"show_text","contents":[{"text":"https://youtube.com/@encode42","color":"yellow"}]}},"\n","\n",{"text":"========================================","bold":true,"strikethrough":true,"color":"dark_purple"}]
+scoreboard players add paintings_clicked nbs_stats 1
+advancement revoke @s only nbs:painting_encode42_left
+advancement revoke @s only nbs:painting_encode42_right
@@ -0,0 +1,4 @@
+tellraw @s ["","\n",{"text":"========================================","bold":true,"strikethrough":true,"color":"dark_purple"},"\n","\n",{"text":"  KaliumI >>","bold":true,"color":"light_purple"},"\n","\n",{"text":"   Songs:","color":"yellow"},"\n",{"text":"     -  ","color":"gray"},{"text":"KaliumI - Micro-Rave","color":"white"},"\n",{"text":"     -  ","color":"gray"},{"text":"Toby Fox - Ruins","color":"white"},"\n",{"text":"     -  ","color":"gray"},{"text":"Item Asylum - SMILER","color":"white"},"\n","\n",{"text":"   ⛏ ","color":"white"},{"text":"KaliumI","color":"dark_green","hoverEvent":{"action":"show_text","contents":["Minecraft username"]}},"\n",{"text":"   🎮 ","color":"white"},{"text":"@kaliumi","color":"#5865F2","hoverEvent":{"action":"show_text","contents":[{"text":"Discord username","color":"white"}]}},"\n",{"text":"   📺 ","color":"white"},{"text":"@kaliumi","underlined":true,"color":"#FF0000","clickEvent":{"action":"open_url","value":"https://youtube.com/@kaliumi"},"hoverEvent":{"action":"show_text","contents":[{"text":"https://youtube.com/@kaliumi","color":"yellow"}]}},"\n","\n",{"text":"========================================","bold":true,"strikethrough":true,"color":"dark_purple"}]
+scoreboard players add paintings_clicked nbs_stats 1
+advancement revoke @s only nbs:painting_kaliumi_left
+advancement revoke @s only nbs:painting_kaliumi_right
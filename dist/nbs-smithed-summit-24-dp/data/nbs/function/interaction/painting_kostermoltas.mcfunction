@@ -0,0 +1,4 @@
+tellraw @s ["","\n",{"text":"========================================","bold":true,"strikethrough":true,"color":"dark_purple"},"\n","\n",{"text":"  KosterMoltas >>","bold":true,"color":"light_purple"},"\n","\n",{"text":"   Songs:","color":"yellow"},"\n",{"text":"     -  ","color":"gray"},{"text":"Koji Kondo - Overworld Theme (New Super Mario Bros.)","color":"white"},"\n",{"text":"     -  ","color":"gray"},{"text":"Laura Shigihara - Crazy Dave (Plants vs. Zombies)","color":"white"},"\n",{"text":"     -  ","color":"gray"},{"text":"Shadrow - Spider Girl","color":"white"},"\n","\n",{"text":"   ⛏ ","color":"white"},{"text":"KosterMoltas","color":"dark_green","hoverEvent":{"action":"show_text","contents":["Minecraft username"]}},"\n",{"text":"   🎮 ","color":"white"},{"text":"@kostermoltas","color":"#5865F2","hoverEvent":{"action":"show_text","contents":[{"text":"Discord username","color":"white"}]}},"\n",{"text":"   📺 ","color":"white"},{"text":"@kostermoltas","underlined":true,"color":"#FF0000","clickEvent":{"action":"open_url","value":"https://youtube.com/@kostermoltas"},"hoverEvent":{"action":"show_text","contents":[{"text":"https://youtube.com/@kostermoltas","color":"yellow"}]}},"\n","\n",{"text":"========================================","bold":true,"strikethrough":true,"color":"dark_purple"}]
+scoreboard players add paintings_clicked nbs_stats 1
+advancement revoke @s only nbs:painting_kostermoltas_left
+advancement revoke @s only nbs:painting_kostermoltas_right
@@ -0,0 +1,4 @@
+tellraw @s ["","\n",{"text":"========================================","bold":true,"strikethrough":true,"color":"dark_purple"},"\n","\n",{"text":"  noteblocc >>","bold":true,"color":"light_purple"},"\n","\n",{"text":"   Songs:","color":"yellow"},"\n",{"text":"     -  ","color":"gray"},{"text":"Tatsuya Kitani - Ao no Sumika (Jujutsu Kaisen)","color":"white"},"\n","\n",{"text":"   ⛏ ","color":"white"},{"text":"Noteblocc","color":"dark_green","hoverEvent":{"action":"show_text","contents":["Minecraft username"]}},"\n",{"text":"   🎮 ","color":"white"},{"text":"@seninsophile","color":"#5865F2","hoverEvent":{"action":"show_text","contents":[{"text":"Discord username","color":"white"}]}},"\n",{"text":"   📺 ","color":"white"},{"text":"@noteblockk","underlined":true,"color":"#FF0000","clickEvent":{"action":"open_url","value":"https://youtube.com/@noteblockk"},"hoverEvent":{"action":"show_text","contents":[{"text":"https://youtube.com/@noteblockk","color":"yellow"}]}},"\n","\n",{"text":"========================================","bold":true,"strikethrough":true,"color":"dark_purple"}]
+scoreboard players add paintings_clicked nbs_stats 1
+advancement revoke @s only nbs:painting_noteblocc_left
+advancement revoke @s only nbs:painting_noteblocc_right
@@ -0,0 +1,4 @@
+tellraw @s ["","\n",{"text":"========================================","bold":true,"strikethrough":true,"color":"dark_purple"},"\n","\n",{"text":"  NoteBlockMatt >>","bold":true,"color":"light_purple"},"\n","\n",{"text":"   Songs:","color":"yellow"},"\n",{"text":"     -  ","color":"gray"},{"text":"Toby Fox - Ruins (Undertale)","color":"white"},"\n",{"text":"     -  ","color":"gray"},{"text":"Animal Crossing - Bubblegum K.K.","color":"white"},"\n",{"text":"     -  ","color":"gray"},{"text":"Inside Out - Bundle of Joy","color":"white"},"\n","\n",{"text":"   ⛏ ","color":"white"},{"text":"NoteBlockMatt","color":"dark_green","hoverEvent":{"action":"show_text","contents":["Minecraft username"]}},"\n",{"text":"   🎮 ","color":"white"},{"text":"@noteblockmatt","color":"#5865F2","hoverEvent":{"action":"show_text","contents":[{"text":"Discord username","color":"white"}]}},"\n",{"text":"   📺 ","color":"white"},{"text":"@NoteBlockMatt","underlined":true,"color":"#FF0000","clickEvent":{"action":"open_url","value":"https://youtube.com/@NoteBlockMatt"},"hoverEvent":{"action":"show_text","contents":[{"text":"https://youtube.com/@NoteBlockMatt","color":"yellow"}]}},"\n","\n",{"text":"========================================","bold":true,"strikethrough":true,"color":"dark_purple"}]
+scoreboard players add paintings_clicked nbs_stats 1
+advancement revoke @s only nbs:painting_noteblockmatt_left
+advancement revoke @s only nbs:painting_noteblockmatt_right
@@ -0,0 +1,4 @@
+tellraw @s ["","\n",{"text":"========================================","bold":true,"strikethrough":true,"color":"dark_purple"},"\n","\n",{"text":"  PScoutGaming >>","bold":true,"color":"light_purple"},"\n","\n",{"text":"   Songs:","color":"yellow"},"\n",{"text":"     -  ","color":"gray"},{"text":"Billy Joel - We Didn't Start The Fire","color":"white"},"\n",{"text":"     -  ","color":"gray"},{"text":"Weezer - Say It Ain't So","color":"white"},"\n","\n",{"text":"   ⛏ ","color":"white"},{"text":"PScoutGaming","color":"dark_green","hoverEvent":{"action":"show_text","contents":["Minecraft username"]}},"\n",{"text":"   🎮 ","color":"white"},{"text":"@pscoutgaming","color":"#5865F2","hoverEvent":{"action":"show_text","contents":[{"text":"Discord username","color":"white"}]}},"\n",{"text":"   📺 ","color":"white"},{"text":"@pscoutgaming","underlined":true,"color":"#FF0000","clickEvent":{"action":"open_url","value":"https://youtube.com/@pscoutgaming"},"hoverEvent":{"action":"show_text","contents":[{"text":"https://youtube.com/@pscoutgaming","color":"yellow"}]}},"\n","\n",{"text":"========================================","bold":true,"strikethrough":true,"color":"dark_purple"}]
+scoreboard players add paintings_clicked nbs_stats 1
+advancement revoke @s only nbs:painting_pscoutgaming_left
+advancement revoke @s only nbs:painting_pscoutgaming_right
@@ -0,0 +1,4 @@
+tellraw @s ["","\n",{"text":"========================================","bold":true,"strikethrough":true,"color":"dark_purple"},"\n","\n",{"text":"  ShinkoNet >>","bold":true,"color":"light_purple"},"\n","\n",{"text":"   Songs:","color":"yellow"},"\n",{"text":"     -  ","color":"gray"},{"text":"Dropkick on My Devil! X - Ryusenkei Mayday","color":"white"},"\n","\n",{"text":"   ⛏ ","color":"white"},{"text":"ShinkoNet","color":"dark_green","hoverEvent":{"action":"show_text","contents":["Minecraft username"]}},"\n",{"text":"   🎮 ","color":"white"},{"text":"@shinkonet","color":"#5865F2","hoverEvent":{"action":"show_text","contents":[{"text":"Discord username","color":"white"}]}},"\n",{"text":"   📺 ","color":"white"},{"text":"@shinkonet","underlined":true,"color":"#FF0000","clickEvent":{"action":"open_url","value":"https://youtube.com/@shinkonet"},"hoverEvent":{"action":"show_text","contents":[{"text":"https://youtube.com/@shinkonet","color":"yellow"}]}},"\n","\n",{"text":"========================================","bold":true,"strikethrough":true,"color":"dark_purple"}]
+scoreboard players add paintings_clicked nbs_stats 1
+advancement revoke @s only nbs:painting_shinkonet_left
+advancement revoke @s only nbs:painting_shinkonet_right
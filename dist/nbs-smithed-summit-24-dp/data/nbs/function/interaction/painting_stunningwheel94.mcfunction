@@ -0,0 +1,4 @@
+tellraw @s ["","\n",{"text":"========================================","bold":true,"strikethrough":true,"color":"dark_purple"},"\n","\n",{"text":"  StunningWheel94 >>","bold":true,"color":"light_purple"},"\n","\n",{"text":"   Songs:","color":"yellow"},"\n",{"text":"     -  ","color":"gray"},{"text":"StunningWheel94 - Boss Battle 3o","color":"white"},"\n",{"text":"     -  ","color":"gray"},{"text":"Robin Beanland - Grogg Mayles (Sea of Thieves)","color":"white"},"\n",{"text":"     -  ","color":"gray"},{"text":"StunningWheel94 - The Notes of No Return","color":"white"},"\n","\n",{"text":"   ⛏ ","color":"white"},{"text":"Sajsteve","color":"dark_green","hoverEvent":{"action":"show_text","contents":["Minecraft username"]}},"\n",{"text":"   🎮 ","color":"white"},{"text":"@stunningwheel94","color":"#5865F2","hoverEvent":{"action":"show_text","contents":[{"text":"Discord username","color":"white"}]}},"\n",{"text":"   📺 ","color":"white"},{"text":"@StunningWheel94","underlined":true,"color":"#FF0000","clickEvent":{"action":"open_url","value":"https://youtube.com/@StunningWheel94"},"hoverEvent":{"action":"show_text","contents":[{"text":"https://youtube.com/@StunningWheel94","color":"yellow"}]}},"\n","\n",{"text":"========================================","bold":true,"strikethrough":true,"color":"dark_purple"}]
+scoreboard players add paintings_clicked nbs_stats 1
+advancement revoke @s only nbs:painting_stunningwheel94_left
+advancement revoke @s only nbs:painting_stunningwheel94_right
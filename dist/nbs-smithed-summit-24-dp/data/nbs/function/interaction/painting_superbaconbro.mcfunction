@@ -0,0 +1,4 @@
+tellraw @s ["","\n",{"text":"========================================","bold":true,"strikethrough":true,"color":"dark_purple"},"\n","\n",{"text":"  superbaconbro >>","bold":true,"color":"light_purple"},"\n","\n",{"text":"   Songs:","color":"yellow"},"\n",{"text":"     -  ","color":"gray"},{"text":"Game & Watch Gallery 4 - Mario's Cement Factory Modern","color":"white"},"\n",{"text":"     -  ","color":"gray"},{"text":"Defenders II - Defenders Theme (Overgrown Temple)","color":"white"},"\n",{"text":"     -  ","color":"gray"},{"text":"DiamondFire Battle Box - Beepy Blocks","color":"white"},"\n","\n",{"text":"   ⛏ ","color":"white"},{"text":"superbaconbro","color":"dark_green","hoverEvent":{"action":"show_text","contents":["Minecraft username"]}},"\n",{"text":"   🎮 ","color":"white"},{"text":"@superbaconbro","color":"#5865F2","hoverEvent":{"action":"show_text","contents":[{"text":"Discord username","color":"white"}]}},"\n",{"text":"   📺 ","color":"white"},{"text":"@superbaconbro","underlined":true,"color":"#FF0000","clickEvent":{"action":"open_url","value":"https://youtube.com/@superbaconbro"},"hoverEvent":{"action":"show_text","contents":[{"text":"https://youtube.com/@superbaconbro","color":"yellow"}]}},"\n","\n",{"text":"========================================","bold":true,"strikethrough":true,"color":"dark_purple"}]
+scoreboard players add paintings_clicked nbs_stats 1
+advancement revoke @s only nbs:painting_superbaconbro_left
+advancement revoke @s only nbs:painting_superbaconbro_right
@@ -0,0 +1,4 @@
+tellraw @s ["","\n",{"text":"========================================","bold":true,"strikethrough":true,"color":"dark_purple"},"\n","\n",{"text":"  Vizeon >>","bold":true,"color":"light_purple"},"\n","\n",{"text":"   Songs:","color":"yellow"},"\n",{"text":"     -  ","color":"gray"},{"text":"Vizeon - Metropolis of Illusion","color":"white"},"\n","\n",{"text":"   ⛏ ","color":"white"},{"text":"Vizeon","color":"dark_green","hoverEvent":{"action":"show_text","contents":["Minecraft username"]}},"\n",{"text":"   🎮 ","color":"white"},{"text":"@overlordvizeon","color":"#5865F2","hoverEvent":{"action":"show_text","contents":[{"text":"Discord username","color":"white"}]}},"\n",{"text":"   📺 ","color":"white"},{"text":"@OverlordVizeon","underlined":true,"color":"#FF0000","clickEvent":{"action":"open_url","value":"https://youtube.com/@OverlordVizeon"},"hoverEvent":{"action":"show_text","contents":[{"text":"https://youtube.com/@OverlordVizeon","color":"yellow"}]}},"\n","\n",{"text":"========================================","bold":true,"strikethrough":true,"color":"dark_purple"}]
+scoreboard players add paintings_clicked nbs_stats 1
+advancement revoke @s only nbs:painting_vizeon_left
+advancement revoke @s only nbs:painting_vizeon_right
@@ -0,0 +1,14 @@
+data modify storage nbs:temp input set value {}
+data modify storage nbs:temp input.song set value "box_has_key"
+data modify storage nbs:temp input.tick set value 1001
+execute store result score #len nbs if data storage nbs:main locations.speaker[]
+execute store result storage nbs:temp input.i int 1 run scoreboard players set #iter nbs 0
+data modify storage nbs:temp input.speaker_type set value "speaker"
+function nbs:global/speaker_iter with storage nbs:temp input
+execute store result score #len nbs if data storage nbs:main locations.loudspeaker[]
+execute store result storage nbs:temp input.i int 1 run scoreboard players set #iter nbs 0
+data modify storage nbs:temp input.speaker_type set value "loudspeaker"
+function nbs:global/speaker_iter with storage nbs:temp input
+execute as @a[tag=nbs_headphones] at @s run function nbs:song/box_has_key/1001/headphones
+scoreboard players add notes_played nbs_stats 8
+scoreboard players add ticks_played nbs_stats 1
@@ -0,0 +1,4 @@
+playsound block.note_block.harp_-1 record @a[distance=..48.00] ^2.0 ^ ^ 1.678 1.12246 0.000
+playsound block.note_block.harp record @a[distance=..48.00] ^0.0 ^ ^ 1.581 0.56123 0.000
+playsound block.note_block.bass_-1 record @a[distance=..48.00] ^0.0 ^ ^ 1.115 1.78180 0.000
+playsound block.note_block.bass_-1 record @a[distance=..48.00] ^0.0 ^ ^ 0.603 1.78180 0.000
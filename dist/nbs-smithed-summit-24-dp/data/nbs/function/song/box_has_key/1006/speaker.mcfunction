@@ -0,0 +1,7 @@
+playsound block.note_block.basedrum record @a[distance=..9.94] ^0.0 ^ ^ 1.000 1.58740 0.000
+playsound block.note_block.harp_-1 record @a[distance=..11.84] ^-1.0 ^ ^ 0.500 1.12246 0.000
+playsound block.note_block.harp record @a[distance=..11.01] ^0.0 ^ ^ 0.500 0.56123 0.000
+playsound block.note_block.bass_-1 record @a[distance=..11.99] ^0.0 ^ ^ 0.430 1.78180 0.000
+playsound block.note_block.bass_-1 record @a[distance=..11.99] ^0.0 ^ ^ 0.230 1.78180 0.000
+playsound block.note_block.pling record @a[distance=..10.54] ^-1.0 ^ ^ 0.300 0.66742 0.000
+playsound block.note_block.pling record @a[distance=..10.15] ^-1.0 ^ ^ 0.300 0.74915 0.000
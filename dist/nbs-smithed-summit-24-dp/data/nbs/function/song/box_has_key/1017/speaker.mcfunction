@@ -0,0 +1,7 @@
+playsound block.note_block.hat record @a[distance=..10.35] ^0.0 ^ ^ 1.000 0.70711 0.000
+playsound block.note_block.harp_-1 record @a[distance=..11.95] ^-1.0 ^ ^ 0.500 0.74915 0.000
+playsound block.note_block.harp_-1 record @a[distance=..11.64] ^0.0 ^ ^ 0.500 1.49831 0.000
+playsound block.note_block.bass_-1 record @a[distance=..11.99] ^0.0 ^ ^ 0.680 1.78180 0.000
+playsound block.note_block.bass_-1 record @a[distance=..11.99] ^0.0 ^ ^ 0.355 1.78180 0.000
+playsound block.note_block.pling record @a[distance=..10.54] ^-1.0 ^ ^ 0.050 0.66742 0.000
+playsound block.note_block.pling record @a[distance=..10.15] ^-1.0 ^ ^ 0.050 0.74915 0.000
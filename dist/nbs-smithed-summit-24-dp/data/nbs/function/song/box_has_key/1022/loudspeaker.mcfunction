@@ -0,0 +1,13 @@
+playsound block.note_block.basedrum record @a[distance=..48.00] ^0.0 ^ ^ 2.554 1.58740 0.000
+playsound block.note_block.snare record @a[distance=..48.00] ^0.0 ^ ^ 2.203 1.78180 0.000
+playsound block.note_block.harp_-1 record @a[distance=..48.00] ^0.0 ^ ^ 2.730 1.49831 0.000
+playsound block.note_block.harp record @a[distance=..48.00] ^0.0 ^ ^ 2.568 0.74915 0.000
+playsound block.note_block.bass_-1 record @a[distance=..48.00] ^0.0 ^ ^ 2.441 1.78180 0.000
+playsound block.note_block.bass_-1 record @a[distance=..48.00] ^0.0 ^ ^ 1.266 1.78180 0.000
+playsound block.note_block.pling record @a[distance=..48.00] ^0.0 ^ ^ 2.595 0.66742 0.000
+playsound block.note_block.pling record @a[distance=..48.00] ^0.0 ^ ^ 2.568 0.74915 0.000
+execute store result score #random nbs run random value 1..4
+execute if score #random nbs matches 1 if entity @a[distance=0..48] run function animated_java:music_speaker/animations/animation_speaker_beat_1/play
+execute if score #random nbs matches 2 if entity @a[distance=0..48] run function animated_java:music_speaker/animations/animation_speaker_beat_2/play
+execute if score #random nbs matches 3 if entity @a[distance=0..48] run function animated_java:music_speaker/animations/animation_speaker_beat_3/play
+execute if score #random nbs matches 4 if entity @a[distance=0..48] run function animated_java:music_speaker/animations/animation_speaker_beat_4/play
@@ -0,0 +1,4 @@
+playsound block.note_block.harp_-1 record @a[distance=..48.00] ^2.0 ^ ^ 1.638 1.49831 0.000
+playsound block.note_block.harp record @a[distance=..48.00] ^0.0 ^ ^ 1.541 0.74915 0.000
+playsound block.note_block.bass_-1 record @a[distance=..48.00] ^0.0 ^ ^ 2.622 1.78180 0.000
+playsound block.note_block.bass_-1 record @a[distance=..48.00] ^0.0 ^ ^ 1.356 1.78180 0.000
@@ -0,0 +1,8 @@
+playsound block.note_block.snare record @a[distance=..48.00] ^0.0 ^ ^ 2.297 1.18921 0.000
+playsound block.note_block.snare record @a[distance=..48.00] ^0.0 ^ ^ 2.365 0.89090 0.000
+playsound block.note_block.harp_-1 record @a[distance=..48.00] ^-2.0 ^ ^ 1.365 1.49831 0.000
+playsound block.note_block.harp record @a[distance=..48.00] ^0.0 ^ ^ 1.284 0.74915 0.000
+playsound block.note_block.bass_-1 record @a[distance=..48.00] ^0.0 ^ ^ 2.803 1.78180 0.000
+playsound block.note_block.bass_-1 record @a[distance=..48.00] ^0.0 ^ ^ 1.446 1.78180 0.000
+playsound block.note_block.pling record @a[distance=..48.00] ^-2.0 ^ ^ 1.297 0.66742 0.000
+playsound block.note_block.pling record @a[distance=..48.00] ^-2.0 ^ ^ 1.284 0.74915 0.000
@@ -0,0 +1,8 @@
+playsound block.note_block.snare record @a[distance=..6.48] ^0.0 ^ ^ 1.000 1.18921 0.000
+playsound block.note_block.snare record @a[distance=..6.99] ^0.0 ^ ^ 1.000 0.89090 0.000
+playsound block.note_block.harp_-1 record @a[distance=..11.64] ^-1.0 ^ ^ 0.500 1.49831 0.000
+playsound block.note_block.harp record @a[distance=..10.15] ^0.0 ^ ^ 0.500 0.74915 0.000
+playsound block.note_block.bass_-1 record @a[distance=..11.99] ^0.0 ^ ^ 0.930 1.78180 0.000
+playsound block.note_block.bass_-1 record @a[distance=..11.99] ^0.0 ^ ^ 0.480 1.78180 0.000
+playsound block.note_block.pling record @a[distance=..10.54] ^-1.0 ^ ^ 0.500 0.66742 0.000
+playsound block.note_block.pling record @a[distance=..10.15] ^-1.0 ^ ^ 0.500 0.74915 0.000
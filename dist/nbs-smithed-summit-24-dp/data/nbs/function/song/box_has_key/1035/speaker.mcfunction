@@ -0,0 +1,4 @@
+playsound block.note_block.harp_-1 record @a[distance=..11.84] ^1.0 ^ ^ 0.600 1.12246 0.000
+playsound block.note_block.harp record @a[distance=..11.01] ^0.0 ^ ^ 0.600 0.56123 0.000
+playsound block.note_block.bass_-1 record @a[distance=..11.99] ^0.0 ^ ^ 0.930 1.78180 0.000
+playsound block.note_block.bass_-1 record @a[distance=..11.99] ^0.0 ^ ^ 0.450 1.78180 0.000
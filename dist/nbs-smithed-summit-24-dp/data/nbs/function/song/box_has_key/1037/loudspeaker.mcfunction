@@ -0,0 +1,7 @@
+playsound block.note_block.hat record @a[distance=..48.00] ^0.0 ^ ^ 2.581 0.70711 0.000
+playsound block.note_block.harp_-1 record @a[distance=..48.00] ^-2.0 ^ ^ 1.399 1.12246 0.000
+playsound block.note_block.harp record @a[distance=..48.00] ^0.0 ^ ^ 1.318 0.56123 0.000
+playsound block.note_block.bass_-1 record @a[distance=..48.00] ^0.0 ^ ^ 2.622 1.78180 0.000
+playsound block.note_block.bass_-1 record @a[distance=..48.00] ^0.0 ^ ^ 1.266 1.78180 0.000
+playsound block.note_block.pling record @a[distance=..48.00] ^-2.0 ^ ^ 1.297 0.66742 0.000
+playsound block.note_block.pling record @a[distance=..48.00] ^-2.0 ^ ^ 1.250 1.00000 0.000
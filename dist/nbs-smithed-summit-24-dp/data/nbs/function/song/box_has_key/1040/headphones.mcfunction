@@ -0,0 +1,2 @@
+playsound block.note_block.bass_-1 record @s[] ^-0.05 ^ ^ 0.810 1.78180 0.000
+playsound block.note_block.bass_-1 record @s[] ^-0.0 ^ ^ 0.390 1.78180 0.000
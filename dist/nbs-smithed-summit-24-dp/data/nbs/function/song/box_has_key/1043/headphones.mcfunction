@@ -0,0 +1,8 @@
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 1.000 1.78180 0.000
+playsound block.note_block.harp_-1 record @s[] ^-0.0 ^ ^ 1.000 0.74915 0.000
+playsound block.note_block.harp_-1 record @s[] ^-0.0 ^ ^ 1.000 1.49831 0.000
+playsound block.note_block.bass_-1 record @s[] ^-0.05 ^ ^ 0.750 1.78180 0.000
+playsound block.note_block.bass_-1 record @s[] ^-0.0 ^ ^ 0.355 1.78180 0.000
+playsound block.note_block.pling record @s[] ^-0.5 ^ ^ 0.400 0.66742 0.000
+playsound block.note_block.pling record @s[] ^-0.5 ^ ^ 0.400 1.00000 0.000
+particle note ~ ~2.25 ~ 0 0 0 1 1
@@ -0,0 +1,4 @@
+playsound block.note_block.harp_-1 record @s[] ^-0.5 ^ ^ 0.600 0.74915 0.000
+playsound block.note_block.harp_-1 record @s[] ^-0.0 ^ ^ 0.600 1.49831 0.000
+playsound block.note_block.bass_-1 record @s[] ^-0.05 ^ ^ 0.680 1.78180 0.000
+playsound block.note_block.bass_-1 record @s[] ^-0.0 ^ ^ 0.325 1.78180 0.000
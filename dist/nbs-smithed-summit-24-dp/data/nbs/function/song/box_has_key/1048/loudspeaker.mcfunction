@@ -0,0 +1,7 @@
+playsound block.note_block.basedrum record @a[distance=..48.00] ^0.0 ^ ^ 2.554 1.58740 0.000
+playsound block.note_block.harp_-1 record @a[distance=..48.00] ^-2.0 ^ ^ 1.446 0.74915 0.000
+playsound block.note_block.harp_-1 record @a[distance=..48.00] ^0.0 ^ ^ 1.365 1.49831 0.000
+playsound block.note_block.bass_-1 record @a[distance=..48.00] ^0.0 ^ ^ 1.868 1.78180 0.000
+playsound block.note_block.bass_-1 record @a[distance=..48.00] ^0.0 ^ ^ 0.889 1.78180 0.000
+playsound block.note_block.pling record @a[distance=..48.00] ^-2.0 ^ ^ 0.778 0.66742 0.000
+playsound block.note_block.pling record @a[distance=..48.00] ^-2.0 ^ ^ 0.750 1.00000 0.000
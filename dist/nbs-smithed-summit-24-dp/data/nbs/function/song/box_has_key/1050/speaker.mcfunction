@@ -0,0 +1,2 @@
+playsound block.note_block.bass_-1 record @a[distance=..11.99] ^0.0 ^ ^ 0.560 1.78180 0.000
+playsound block.note_block.bass_-1 record @a[distance=..11.99] ^0.0 ^ ^ 0.265 1.78180 0.000
@@ -0,0 +1,8 @@
+playsound block.note_block.basedrum record @s[] ^-0.05 ^ ^ 1.000 1.33484 0.000
+playsound block.note_block.hat record @s[] ^-0.0 ^ ^ 1.000 0.70711 0.000
+playsound block.note_block.harp_-1 record @s[] ^0.5 ^ ^ 0.500 1.49831 0.000
+playsound block.note_block.harp record @s[] ^-0.0 ^ ^ 0.500 0.74915 0.000
+playsound block.note_block.bass_-1 record @s[] ^-0.05 ^ ^ 0.370 1.78180 0.000
+playsound block.note_block.bass_-1 record @s[] ^-0.0 ^ ^ 0.170 1.78180 0.000
+playsound block.note_block.pling record @s[] ^0.5 ^ ^ 0.500 0.74915 0.000
+playsound block.note_block.pling record @s[] ^0.5 ^ ^ 0.500 0.89090 0.000
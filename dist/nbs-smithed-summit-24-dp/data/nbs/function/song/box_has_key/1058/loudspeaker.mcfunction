@@ -0,0 +1,8 @@
+playsound block.note_block.basedrum record @a[distance=..48.00] ^0.0 ^ ^ 2.595 1.33484 0.000
+playsound block.note_block.hat record @a[distance=..48.00] ^0.0 ^ ^ 2.581 0.70711 0.000
+playsound block.note_block.harp_-1 record @a[distance=..48.00] ^-2.0 ^ ^ 1.365 1.49831 0.000
+playsound block.note_block.harp record @a[distance=..48.00] ^0.0 ^ ^ 1.284 0.74915 0.000
+playsound block.note_block.bass_-1 record @a[distance=..48.00] ^0.0 ^ ^ 1.115 1.78180 0.000
+playsound block.note_block.bass_-1 record @a[distance=..48.00] ^0.0 ^ ^ 0.512 1.78180 0.000
+playsound block.note_block.pling record @a[distance=..48.00] ^-2.0 ^ ^ 1.284 0.74915 0.000
+playsound block.note_block.pling record @a[distance=..48.00] ^-2.0 ^ ^ 1.264 0.89090 0.000
@@ -0,0 +1,9 @@
+playsound block.note_block.basedrum record @a[distance=..9.94] ^0.0 ^ ^ 1.000 1.58740 0.000
+playsound block.note_block.snare record @a[distance=..6.48] ^0.0 ^ ^ 1.000 1.18921 0.000
+playsound block.note_block.snare record @a[distance=..6.99] ^0.0 ^ ^ 1.000 0.89090 0.000
+playsound block.note_block.harp_-1 record @a[distance=..11.81] ^-1.0 ^ ^ 0.500 1.18921 0.000
+playsound block.note_block.harp record @a[distance=..10.87] ^0.0 ^ ^ 0.500 0.59460 0.000
+playsound block.note_block.bass_-1 record @a[distance=..11.99] ^0.0 ^ ^ 0.120 1.78180 0.000
+playsound block.note_block.bass_-1 record @a[distance=..11.99] ^0.0 ^ ^ 0.045 1.78180 0.000
+playsound block.note_block.pling record @a[distance=..10.15] ^-1.0 ^ ^ 0.300 0.74915 0.000
+playsound block.note_block.pling record @a[distance=..9.48] ^-1.0 ^ ^ 0.300 0.89090 0.000
@@ -0,0 +1,4 @@
+playsound block.note_block.harp_-1 record @s[] ^-0.5 ^ ^ 0.600 1.00000 0.000
+playsound block.note_block.harp record @s[] ^-0.0 ^ ^ 0.600 0.50000 0.000
+playsound block.note_block.bass_-1 record @s[] ^-0.05 ^ ^ 0.370 1.78180 0.000
+playsound block.note_block.bass_-1 record @s[] ^-0.0 ^ ^ 0.200 1.78180 0.000
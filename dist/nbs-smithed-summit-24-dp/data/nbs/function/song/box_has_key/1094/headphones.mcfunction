@@ -0,0 +1,8 @@
+playsound block.note_block.hat record @s[] ^-0.0 ^ ^ 1.000 0.70711 0.000
+playsound block.note_block.harp_-1 record @s[] ^-0.0 ^ ^ 1.000 0.66742 0.000
+playsound block.note_block.harp_-1 record @s[] ^-0.0 ^ ^ 1.000 1.33484 0.000
+playsound block.note_block.bass_-1 record @s[] ^-0.05 ^ ^ 0.560 1.78180 0.000
+playsound block.note_block.bass_-1 record @s[] ^-0.0 ^ ^ 0.295 1.78180 0.000
+playsound block.note_block.pling record @s[] ^-0.5 ^ ^ 0.200 1.00000 0.000
+playsound block.note_block.pling record @s[] ^-0.5 ^ ^ 0.200 1.33484 0.000
+particle note ~ ~2.25 ~ 0 0 0 1 1
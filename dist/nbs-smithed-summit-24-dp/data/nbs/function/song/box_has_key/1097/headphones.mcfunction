@@ -0,0 +1,5 @@
+playsound block.note_block.basedrum record @s[] ^-0.05 ^ ^ 1.000 1.58740 0.000
+playsound block.note_block.harp_-1 record @s[] ^-0.5 ^ ^ 0.600 0.66742 0.000
+playsound block.note_block.harp_-1 record @s[] ^-0.0 ^ ^ 0.600 1.33484 0.000
+playsound block.note_block.bass_-1 record @s[] ^-0.05 ^ ^ 0.620 1.78180 0.000
+playsound block.note_block.bass_-1 record @s[] ^-0.0 ^ ^ 0.325 1.78180 0.000
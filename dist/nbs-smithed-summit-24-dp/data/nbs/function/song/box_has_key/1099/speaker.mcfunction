@@ -0,0 +1,7 @@
+playsound block.note_block.hat record @a[distance=..10.35] ^0.0 ^ ^ 1.000 0.70711 0.000
+playsound block.note_block.harp_-1 record @a[distance=..11.96] ^-1.0 ^ ^ 0.500 0.66742 0.000
+playsound block.note_block.harp_-1 record @a[distance=..11.74] ^0.0 ^ ^ 0.500 1.33484 0.000
+playsound block.note_block.bass_-1 record @a[distance=..11.99] ^0.0 ^ ^ 0.680 1.78180 0.000
+playsound block.note_block.bass_-1 record @a[distance=..11.99] ^0.0 ^ ^ 0.355 1.78180 0.000
+playsound block.note_block.pling record @a[distance=..9.00] ^-1.0 ^ ^ 0.050 1.00000 0.000
+playsound block.note_block.pling record @a[distance=..7.85] ^-1.0 ^ ^ 0.050 1.33484 0.000
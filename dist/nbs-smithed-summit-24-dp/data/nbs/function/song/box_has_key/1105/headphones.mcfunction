@@ -0,0 +1,7 @@
+playsound block.note_block.basedrum record @s[] ^-0.05 ^ ^ 1.000 1.58740 0.000
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 1.000 1.78180 0.000
+playsound block.note_block.harp_-1 record @s[] ^-0.0 ^ ^ 1.000 1.33484 0.000
+playsound block.note_block.harp record @s[] ^-0.0 ^ ^ 1.000 0.66742 0.000
+playsound block.note_block.bass_-1 record @s[] ^-0.05 ^ ^ 0.810 1.78180 0.000
+playsound block.note_block.bass_-1 record @s[] ^-0.0 ^ ^ 0.420 1.78180 0.000
+particle note ~ ~2.25 ~ 0 0 0 1 1
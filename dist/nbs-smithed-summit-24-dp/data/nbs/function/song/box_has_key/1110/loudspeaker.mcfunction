@@ -0,0 +1,4 @@
+playsound block.note_block.harp_-1 record @a[distance=..48.00] ^-2.0 ^ ^ 1.378 1.33484 0.000
+playsound block.note_block.harp record @a[distance=..48.00] ^0.0 ^ ^ 1.297 0.66742 0.000
+playsound block.note_block.bass_-1 record @a[distance=..48.00] ^0.0 ^ ^ 2.803 1.78180 0.000
+playsound block.note_block.bass_-1 record @a[distance=..48.00] ^0.0 ^ ^ 1.446 1.78180 0.000
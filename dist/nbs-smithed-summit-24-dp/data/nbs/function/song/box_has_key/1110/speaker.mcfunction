@@ -0,0 +1,4 @@
+playsound block.note_block.harp_-1 record @a[distance=..11.74] ^-1.0 ^ ^ 0.500 1.33484 0.000
+playsound block.note_block.harp record @a[distance=..10.54] ^0.0 ^ ^ 0.500 0.66742 0.000
+playsound block.note_block.bass_-1 record @a[distance=..11.99] ^0.0 ^ ^ 0.930 1.78180 0.000
+playsound block.note_block.bass_-1 record @a[distance=..11.99] ^0.0 ^ ^ 0.480 1.78180 0.000
@@ -0,0 +1,5 @@
+playsound block.note_block.harp_-1 record @s[] ^-0.0 ^ ^ 1.000 1.00000 0.000
+playsound block.note_block.harp record @s[] ^-0.0 ^ ^ 1.000 0.50000 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 1.000 1.33484 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 1.000 2.00000 0.000
+particle note ~ ~2.25 ~ 0 0 0 1 1
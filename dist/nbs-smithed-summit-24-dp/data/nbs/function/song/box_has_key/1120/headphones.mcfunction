@@ -0,0 +1,4 @@
+playsound block.note_block.harp_-1 record @s[] ^0.5 ^ ^ 0.500 1.00000 0.000
+playsound block.note_block.harp record @s[] ^-0.0 ^ ^ 0.500 0.50000 0.000
+playsound block.note_block.pling record @s[] ^0.5 ^ ^ 0.500 1.33484 0.000
+playsound block.note_block.pling record @s[] ^0.5 ^ ^ 0.500 2.00000 0.000
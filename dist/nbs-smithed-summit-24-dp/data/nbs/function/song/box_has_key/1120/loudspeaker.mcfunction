@@ -0,0 +1,4 @@
+playsound block.note_block.harp_-1 record @a[distance=..48.00] ^-2.0 ^ ^ 1.412 1.00000 0.000
+playsound block.note_block.harp record @a[distance=..48.00] ^0.0 ^ ^ 1.331 0.50000 0.000
+playsound block.note_block.pling record @a[distance=..48.00] ^-2.0 ^ ^ 1.216 1.33484 0.000
+playsound block.note_block.pling record @a[distance=..48.00] ^-2.0 ^ ^ 1.169 2.00000 0.000
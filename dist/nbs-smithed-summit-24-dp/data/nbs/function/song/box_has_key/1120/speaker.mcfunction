@@ -0,0 +1,4 @@
+playsound block.note_block.harp_-1 record @a[distance=..11.88] ^-1.0 ^ ^ 0.500 1.00000 0.000
+playsound block.note_block.harp record @a[distance=..11.25] ^0.0 ^ ^ 0.500 0.50000 0.000
+playsound block.note_block.pling record @a[distance=..7.85] ^-1.0 ^ ^ 0.500 1.33484 0.000
+playsound block.note_block.pling record @a[distance=..6.75] ^-1.0 ^ ^ 0.500 2.00000 0.000
@@ -0,0 +1,4 @@
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 1.000 1.78180 0.000
+playsound block.note_block.pling record @s[] ^-0.5 ^ ^ 0.400 1.33484 0.000
+playsound block.note_block.pling record @s[] ^-0.5 ^ ^ 0.400 2.00000 0.000
+particle note ~ ~2.25 ~ 0 0 0 1 1
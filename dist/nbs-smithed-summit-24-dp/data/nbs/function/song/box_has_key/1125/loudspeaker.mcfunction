@@ -0,0 +1,8 @@
+playsound block.note_block.snare record @a[distance=..48.00] ^0.0 ^ ^ 2.203 1.78180 0.000
+playsound block.note_block.pling record @a[distance=..48.00] ^2.0 ^ ^ 0.973 1.33484 0.000
+playsound block.note_block.pling record @a[distance=..48.00] ^2.0 ^ ^ 0.935 2.00000 0.000
+execute store result score #random nbs run random value 1..4
+execute if score #random nbs matches 1 if entity @a[distance=0..48] run function animated_java:music_speaker/animations/animation_speaker_beat_1/play
+execute if score #random nbs matches 2 if entity @a[distance=0..48] run function animated_java:music_speaker/animations/animation_speaker_beat_2/play
+execute if score #random nbs matches 3 if entity @a[distance=0..48] run function animated_java:music_speaker/animations/animation_speaker_beat_3/play
+execute if score #random nbs matches 4 if entity @a[distance=0..48] run function animated_java:music_speaker/animations/animation_speaker_beat_4/play
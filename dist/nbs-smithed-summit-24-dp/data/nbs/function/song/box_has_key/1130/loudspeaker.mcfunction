@@ -0,0 +1,3 @@
+playsound block.note_block.basedrum record @a[distance=..48.00] ^0.0 ^ ^ 2.554 1.58740 0.000
+playsound block.note_block.pling record @a[distance=..48.00] ^-2.0 ^ ^ 0.730 1.33484 0.000
+playsound block.note_block.pling record @a[distance=..48.00] ^-2.0 ^ ^ 0.701 2.00000 0.000
@@ -0,0 +1,3 @@
+playsound block.note_block.basedrum record @a[distance=..9.94] ^0.0 ^ ^ 1.000 1.58740 0.000
+playsound block.note_block.pling record @a[distance=..7.85] ^-1.0 ^ ^ 0.300 1.33484 0.000
+playsound block.note_block.pling record @a[distance=..6.75] ^-1.0 ^ ^ 0.300 2.00000 0.000
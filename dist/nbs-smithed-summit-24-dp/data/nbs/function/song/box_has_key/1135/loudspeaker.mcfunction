@@ -0,0 +1,10 @@
+playsound block.note_block.basedrum record @a[distance=..48.00] ^0.0 ^ ^ 2.500 2.00000 0.000
+playsound block.note_block.harp_-1 record @a[distance=..48.00] ^0.0 ^ ^ 2.784 1.18921 0.000
+playsound block.note_block.harp record @a[distance=..48.00] ^0.0 ^ ^ 2.622 0.59460 0.000
+playsound block.note_block.pling record @a[distance=..48.00] ^0.0 ^ ^ 2.459 1.18921 0.000
+playsound block.note_block.pling record @a[distance=..48.00] ^0.0 ^ ^ 2.365 1.78180 0.000
+execute store result score #random nbs run random value 1..4
+execute if score #random nbs matches 1 if entity @a[distance=0..48] run function animated_java:music_speaker/animations/animation_speaker_beat_1/play
+execute if score #random nbs matches 2 if entity @a[distance=0..48] run function animated_java:music_speaker/animations/animation_speaker_beat_2/play
+execute if score #random nbs matches 3 if entity @a[distance=0..48] run function animated_java:music_speaker/animations/animation_speaker_beat_3/play
+execute if score #random nbs matches 4 if entity @a[distance=0..48] run function animated_java:music_speaker/animations/animation_speaker_beat_4/play
@@ -0,0 +1,2 @@
+playsound block.note_block.pling record @a[distance=..8.28] ^-1.0 ^ ^ 0.500 1.18921 0.000
+playsound block.note_block.pling record @a[distance=..6.99] ^-1.0 ^ ^ 0.500 1.78180 0.000
@@ -0,0 +1,3 @@
+playsound block.note_block.pling record @s[] ^-0.5 ^ ^ 0.400 1.18921 0.000
+playsound block.note_block.pling record @s[] ^-0.5 ^ ^ 0.400 1.78180 0.000
+particle note ~ ~2.25 ~ 0 0 0 1 1
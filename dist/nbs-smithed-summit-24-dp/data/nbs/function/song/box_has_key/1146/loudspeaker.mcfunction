@@ -0,0 +1,7 @@
+playsound block.note_block.pling record @a[distance=..48.00] ^2.0 ^ ^ 0.984 1.18921 0.000
+playsound block.note_block.pling record @a[distance=..48.00] ^2.0 ^ ^ 0.946 1.78180 0.000
+execute store result score #random nbs run random value 1..4
+execute if score #random nbs matches 1 if entity @a[distance=0..48] run function animated_java:music_speaker/animations/animation_speaker_beat_1/play
+execute if score #random nbs matches 2 if entity @a[distance=0..48] run function animated_java:music_speaker/animations/animation_speaker_beat_2/play
+execute if score #random nbs matches 3 if entity @a[distance=0..48] run function animated_java:music_speaker/animations/animation_speaker_beat_3/play
+execute if score #random nbs matches 4 if entity @a[distance=0..48] run function animated_java:music_speaker/animations/animation_speaker_beat_4/play
@@ -0,0 +1,2 @@
+playsound block.note_block.pling record @s[] ^0.5 ^ ^ 0.300 1.18921 0.000
+playsound block.note_block.pling record @s[] ^0.5 ^ ^ 0.300 1.78180 0.000
@@ -0,0 +1,2 @@
+playsound block.note_block.pling record @a[distance=..48.00] ^-2.0 ^ ^ 0.738 1.18921 0.000
+playsound block.note_block.pling record @a[distance=..48.00] ^-2.0 ^ ^ 0.709 1.78180 0.000
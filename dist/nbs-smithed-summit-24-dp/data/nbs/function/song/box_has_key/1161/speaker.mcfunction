@@ -0,0 +1,10 @@
+playsound block.note_block.harp_-1 record @a[distance=..11.44] ^1.0 ^ ^ 1.000 1.78180 0.000
+playsound block.note_block.harp_-1 record @a[distance=..11.44] ^1.0 ^ ^ 0.600 1.78180 0.000
+playsound block.note_block.harp_-1 record @a[distance=..11.44] ^-2.0 ^ ^ 0.500 1.78180 0.000
+playsound block.note_block.harp_-1 record @a[distance=..11.44] ^-2.0 ^ ^ 1.000 1.78180 0.000
+playsound block.note_block.bass_-1 record @a[distance=..11.99] ^0.0 ^ ^ 1.000 1.78180 0.000
+playsound block.note_block.bass_-1 record @a[distance=..11.99] ^0.0 ^ ^ 0.500 1.78180 0.000
+playsound block.note_block.pling record @a[distance=..9.48] ^-1.0 ^ ^ 0.150 0.89090 0.000
+playsound block.note_block.pling record @a[distance=..7.85] ^-1.0 ^ ^ 0.150 1.33484 0.000
+playsound block.note_block.bass record @a[distance=..11.91] ^0.0 ^ ^ 1.000 0.89090 0.000
+playsound block.note_block.bass record @a[distance=..11.91] ^-1.0 ^ ^ 0.600 0.89090 0.000
@@ -0,0 +1,6 @@
+playsound block.note_block.harp_-1 record @s[] ^-0.8 ^ ^ 1.000 1.78180 0.000
+playsound block.note_block.harp_-1 record @s[] ^-0.9 ^ ^ 0.600 1.78180 0.000
+playsound block.note_block.harp_-1 record @s[] ^0.9 ^ ^ 0.500 1.78180 0.000
+playsound block.note_block.harp_-1 record @s[] ^0.8 ^ ^ 1.000 1.78180 0.000
+playsound block.note_block.bass_-1 record @s[] ^-0.05 ^ ^ 1.000 1.78180 0.000
+playsound block.note_block.bass_-1 record @s[] ^-0.0 ^ ^ 0.500 1.78180 0.000
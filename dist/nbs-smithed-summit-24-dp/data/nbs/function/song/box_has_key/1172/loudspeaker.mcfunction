@@ -0,0 +1,9 @@
+playsound block.note_block.snare record @a[distance=..48.00] ^0.0 ^ ^ 2.203 1.78180 0.000
+playsound block.note_block.harp_-1 record @a[distance=..48.00] ^3.0 ^ ^ 2.689 1.78180 0.000
+playsound block.note_block.harp_-1 record @a[distance=..48.00] ^3.0 ^ ^ 1.614 1.78180 0.000
+playsound block.note_block.harp_-1 record @a[distance=..48.00] ^-4.0 ^ ^ 1.345 1.78180 0.000
+playsound block.note_block.harp_-1 record @a[distance=..48.00] ^-4.0 ^ ^ 2.689 1.78180 0.000
+playsound block.note_block.bass_-1 record @a[distance=..48.00] ^0.0 ^ ^ 3.014 1.78180 0.000
+playsound block.note_block.bass_-1 record @a[distance=..48.00] ^0.0 ^ ^ 1.507 1.78180 0.000
+playsound block.note_block.bass record @a[distance=..48.00] ^2.0 ^ ^ 1.426 0.89090 0.000
+playsound block.note_block.bass record @a[distance=..48.00] ^-2.0 ^ ^ 1.141 0.89090 0.000
@@ -0,0 +1,6 @@
+playsound block.note_block.harp_-1 record @a[distance=..11.44] ^1.0 ^ ^ 0.660 1.78180 0.000
+playsound block.note_block.harp_-1 record @a[distance=..11.44] ^1.0 ^ ^ 0.396 1.78180 0.000
+playsound block.note_block.harp_-1 record @a[distance=..11.44] ^-2.0 ^ ^ 0.385 1.78180 0.000
+playsound block.note_block.harp_-1 record @a[distance=..11.44] ^-2.0 ^ ^ 0.550 1.78180 0.000
+playsound block.note_block.bass_-1 record @a[distance=..11.99] ^0.0 ^ ^ 1.000 1.78180 0.000
+playsound block.note_block.bass_-1 record @a[distance=..11.99] ^0.0 ^ ^ 0.500 1.78180 0.000
@@ -0,0 +1,7 @@
+playsound block.note_block.basedrum record @s[] ^-0.05 ^ ^ 1.000 1.00000 0.000
+playsound block.note_block.harp_-1 record @s[] ^-0.8 ^ ^ 0.220 1.78180 0.000
+playsound block.note_block.harp_-1 record @s[] ^-0.9 ^ ^ 0.132 1.78180 0.000
+playsound block.note_block.harp_-1 record @s[] ^0.9 ^ ^ 0.165 1.78180 0.000
+playsound block.note_block.harp_-1 record @s[] ^0.8 ^ ^ 0.110 1.78180 0.000
+playsound block.note_block.bass_-1 record @s[] ^-0.05 ^ ^ 1.000 1.78180 0.000
+playsound block.note_block.bass_-1 record @s[] ^-0.0 ^ ^ 0.500 1.78180 0.000
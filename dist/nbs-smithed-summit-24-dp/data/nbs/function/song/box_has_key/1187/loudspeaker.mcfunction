@@ -0,0 +1,12 @@
+playsound block.note_block.harp_-1 record @a[distance=..48.00] ^-4.0 ^ ^ 0.148 1.78180 0.000
+playsound block.note_block.bass_-1 record @a[distance=..48.00] ^0.0 ^ ^ 3.014 1.78180 0.000
+playsound block.note_block.bass_-1 record @a[distance=..48.00] ^0.0 ^ ^ 1.507 1.78180 0.000
+playsound block.note_block.pling record @a[distance=..48.00] ^2.0 ^ ^ 0.303 0.89090 0.000
+playsound block.note_block.pling record @a[distance=..48.00] ^2.0 ^ ^ 0.292 1.33484 0.000
+playsound block.note_block.bass record @a[distance=..48.00] ^-2.0 ^ ^ 1.711 0.89090 0.000
+playsound block.note_block.bass record @a[distance=..48.00] ^2.0 ^ ^ 1.426 0.89090 0.000
+execute store result score #random nbs run random value 1..4
+execute if score #random nbs matches 1 if entity @a[distance=0..48] run function animated_java:music_speaker/animations/animation_speaker_beat_1/play
+execute if score #random nbs matches 2 if entity @a[distance=0..48] run function animated_java:music_speaker/animations/animation_speaker_beat_2/play
+execute if score #random nbs matches 3 if entity @a[distance=0..48] run function animated_java:music_speaker/animations/animation_speaker_beat_3/play
+execute if score #random nbs matches 4 if entity @a[distance=0..48] run function animated_java:music_speaker/animations/animation_speaker_beat_4/play
@@ -0,0 +1,2 @@
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 1.000 1.18921 0.000
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 1.000 0.89090 0.000
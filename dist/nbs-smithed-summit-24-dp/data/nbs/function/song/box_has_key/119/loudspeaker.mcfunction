@@ -0,0 +1,2 @@
+playsound block.note_block.snare record @a[distance=..48.00] ^0.0 ^ ^ 2.297 1.18921 0.000
+playsound block.note_block.snare record @a[distance=..48.00] ^0.0 ^ ^ 2.365 0.89090 0.000
@@ -0,0 +1,6 @@
+playsound block.note_block.basedrum record @s[] ^-0.05 ^ ^ 1.000 1.00000 0.000
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 1.000 1.78180 0.000
+playsound block.note_block.bass_-1 record @s[] ^-0.05 ^ ^ 1.000 1.78180 0.000
+playsound block.note_block.bass_-1 record @s[] ^-0.0 ^ ^ 0.500 1.78180 0.000
+playsound block.note_block.bass record @s[] ^-0.5 ^ ^ 0.500 0.89090 0.000
+playsound block.note_block.bass record @s[] ^0.5 ^ ^ 0.400 0.89090 0.000
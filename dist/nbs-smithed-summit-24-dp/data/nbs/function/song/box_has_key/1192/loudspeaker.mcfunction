@@ -0,0 +1,6 @@
+playsound block.note_block.basedrum record @a[distance=..48.00] ^0.0 ^ ^ 2.662 1.00000 0.000
+playsound block.note_block.snare record @a[distance=..48.00] ^0.0 ^ ^ 2.203 1.78180 0.000
+playsound block.note_block.bass_-1 record @a[distance=..48.00] ^0.0 ^ ^ 3.014 1.78180 0.000
+playsound block.note_block.bass_-1 record @a[distance=..48.00] ^0.0 ^ ^ 1.507 1.78180 0.000
+playsound block.note_block.bass record @a[distance=..48.00] ^2.0 ^ ^ 1.426 0.89090 0.000
+playsound block.note_block.bass record @a[distance=..48.00] ^-2.0 ^ ^ 1.141 0.89090 0.000
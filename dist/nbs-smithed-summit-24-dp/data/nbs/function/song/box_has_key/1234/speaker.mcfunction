@@ -0,0 +1,6 @@
+playsound block.note_block.basedrum record @a[distance=..11.25] ^0.0 ^ ^ 1.000 1.00000 0.000
+playsound block.note_block.snare record @a[distance=..6.16] ^0.0 ^ ^ 1.000 1.78180 0.000
+playsound block.note_block.bass_-1 record @a[distance=..11.99] ^0.0 ^ ^ 1.000 1.78180 0.000
+playsound block.note_block.bass_-1 record @a[distance=..11.99] ^0.0 ^ ^ 0.500 1.78180 0.000
+playsound block.note_block.bass record @a[distance=..11.91] ^1.0 ^ ^ 0.500 0.89090 0.000
+playsound block.note_block.bass record @a[distance=..11.91] ^-1.0 ^ ^ 0.400 0.89090 0.000
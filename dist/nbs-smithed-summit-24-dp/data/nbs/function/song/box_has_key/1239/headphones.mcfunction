@@ -0,0 +1,11 @@
+playsound block.note_block.basedrum record @s[] ^-0.05 ^ ^ 1.000 1.00000 0.000
+playsound block.note_block.harp record @s[] ^-0.8 ^ ^ 1.000 0.66742 0.000
+playsound block.note_block.harp record @s[] ^-0.9 ^ ^ 0.600 0.66742 0.000
+playsound block.note_block.harp record @s[] ^0.8 ^ ^ 1.000 0.66742 0.000
+playsound block.note_block.bass record @s[] ^-0.05 ^ ^ 1.000 0.66742 0.000
+playsound block.note_block.bass record @s[] ^-0.0 ^ ^ 0.500 0.66742 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.300 0.89090 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.300 1.00000 0.000
+playsound block.note_block.bass record @s[] ^-0.0 ^ ^ 1.000 1.33484 0.000
+playsound block.note_block.bass record @s[] ^-0.0 ^ ^ 1.000 1.33484 0.000
+particle note ~ ~2.25 ~ 0 0 0 1 1
@@ -0,0 +1,15 @@
+playsound block.note_block.harp record @a[distance=..48.00] ^3.0 ^ ^ 2.595 0.66742 0.000
+playsound block.note_block.harp record @a[distance=..48.00] ^3.0 ^ ^ 1.557 0.66742 0.000
+playsound block.note_block.harp record @a[distance=..48.00] ^-4.0 ^ ^ 1.297 0.66742 0.000
+playsound block.note_block.harp record @a[distance=..48.00] ^-4.0 ^ ^ 2.595 0.66742 0.000
+playsound block.note_block.bass record @a[distance=..48.00] ^0.0 ^ ^ 2.919 0.66742 0.000
+playsound block.note_block.bass record @a[distance=..48.00] ^0.0 ^ ^ 1.459 0.66742 0.000
+playsound block.note_block.pling record @a[distance=..48.00] ^2.0 ^ ^ 0.303 0.89090 0.000
+playsound block.note_block.pling record @a[distance=..48.00] ^2.0 ^ ^ 0.300 1.00000 0.000
+playsound block.note_block.bass record @a[distance=..48.00] ^-2.0 ^ ^ 1.654 1.33484 0.000
+playsound block.note_block.bass record @a[distance=..48.00] ^2.0 ^ ^ 1.378 1.33484 0.000
+execute store result score #random nbs run random value 1..4
+execute if score #random nbs matches 1 if entity @a[distance=0..48] run function animated_java:music_speaker/animations/animation_speaker_beat_1/play
+execute if score #random nbs matches 2 if entity @a[distance=0..48] run function animated_java:music_speaker/animations/animation_speaker_beat_2/play
+execute if score #random nbs matches 3 if entity @a[distance=0..48] run function animated_java:music_speaker/animations/animation_speaker_beat_3/play
+execute if score #random nbs matches 4 if entity @a[distance=0..48] run function animated_java:music_speaker/animations/animation_speaker_beat_4/play
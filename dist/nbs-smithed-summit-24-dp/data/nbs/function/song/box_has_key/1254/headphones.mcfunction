@@ -0,0 +1,10 @@
+playsound block.note_block.basedrum record @s[] ^-0.05 ^ ^ 1.000 1.00000 0.000
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 1.000 1.78180 0.000
+playsound block.note_block.harp record @s[] ^-0.8 ^ ^ 1.000 0.66742 0.000
+playsound block.note_block.harp record @s[] ^-0.9 ^ ^ 0.600 0.66742 0.000
+playsound block.note_block.harp record @s[] ^0.9 ^ ^ 0.500 0.66742 0.000
+playsound block.note_block.harp record @s[] ^0.8 ^ ^ 1.000 0.66742 0.000
+playsound block.note_block.bass record @s[] ^-0.05 ^ ^ 1.000 0.66742 0.000
+playsound block.note_block.bass record @s[] ^-0.0 ^ ^ 0.500 0.66742 0.000
+playsound block.note_block.bass record @s[] ^-0.5 ^ ^ 0.500 1.33484 0.000
+playsound block.note_block.bass record @s[] ^0.5 ^ ^ 0.400 1.33484 0.000
@@ -0,0 +1,10 @@
+playsound block.note_block.basedrum record @a[distance=..48.00] ^0.0 ^ ^ 2.662 1.00000 0.000
+playsound block.note_block.snare record @a[distance=..48.00] ^0.0 ^ ^ 2.203 1.78180 0.000
+playsound block.note_block.harp record @a[distance=..48.00] ^3.0 ^ ^ 2.595 0.66742 0.000
+playsound block.note_block.harp record @a[distance=..48.00] ^3.0 ^ ^ 1.557 0.66742 0.000
+playsound block.note_block.harp record @a[distance=..48.00] ^-4.0 ^ ^ 1.297 0.66742 0.000
+playsound block.note_block.harp record @a[distance=..48.00] ^-4.0 ^ ^ 2.595 0.66742 0.000
+playsound block.note_block.bass record @a[distance=..48.00] ^0.0 ^ ^ 2.919 0.66742 0.000
+playsound block.note_block.bass record @a[distance=..48.00] ^0.0 ^ ^ 1.459 0.66742 0.000
+playsound block.note_block.bass record @a[distance=..48.00] ^2.0 ^ ^ 1.378 1.33484 0.000
+playsound block.note_block.bass record @a[distance=..48.00] ^-2.0 ^ ^ 1.103 1.33484 0.000
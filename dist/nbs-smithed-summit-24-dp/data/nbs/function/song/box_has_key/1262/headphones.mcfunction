@@ -0,0 +1,6 @@
+playsound block.note_block.harp record @s[] ^-0.8 ^ ^ 0.660 0.66742 0.000
+playsound block.note_block.harp record @s[] ^-0.9 ^ ^ 0.396 0.66742 0.000
+playsound block.note_block.harp record @s[] ^0.9 ^ ^ 0.385 0.66742 0.000
+playsound block.note_block.harp record @s[] ^0.8 ^ ^ 0.550 0.66742 0.000
+playsound block.note_block.bass record @s[] ^-0.05 ^ ^ 1.000 0.66742 0.000
+playsound block.note_block.bass record @s[] ^-0.0 ^ ^ 0.500 0.66742 0.000
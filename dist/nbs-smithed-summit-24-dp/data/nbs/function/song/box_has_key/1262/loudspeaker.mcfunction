@@ -0,0 +1,6 @@
+playsound block.note_block.harp record @a[distance=..48.00] ^3.0 ^ ^ 1.712 0.66742 0.000
+playsound block.note_block.harp record @a[distance=..48.00] ^3.0 ^ ^ 1.027 0.66742 0.000
+playsound block.note_block.harp record @a[distance=..48.00] ^-4.0 ^ ^ 0.999 0.66742 0.000
+playsound block.note_block.harp record @a[distance=..48.00] ^-4.0 ^ ^ 1.427 0.66742 0.000
+playsound block.note_block.bass record @a[distance=..48.00] ^0.0 ^ ^ 2.919 0.66742 0.000
+playsound block.note_block.bass record @a[distance=..48.00] ^0.0 ^ ^ 1.459 0.66742 0.000
@@ -0,0 +1,11 @@
+playsound block.note_block.hat record @a[distance=..48.00] ^0.0 ^ ^ 2.581 0.70711 0.000
+playsound block.note_block.harp record @a[distance=..48.00] ^3.0 ^ ^ 1.142 0.66742 0.000
+playsound block.note_block.harp record @a[distance=..48.00] ^3.0 ^ ^ 0.685 0.66742 0.000
+playsound block.note_block.harp record @a[distance=..48.00] ^-4.0 ^ ^ 0.714 0.66742 0.000
+playsound block.note_block.harp record @a[distance=..48.00] ^-4.0 ^ ^ 0.856 0.66742 0.000
+playsound block.note_block.bass record @a[distance=..48.00] ^0.0 ^ ^ 2.919 0.66742 0.000
+playsound block.note_block.bass record @a[distance=..48.00] ^0.0 ^ ^ 1.459 0.66742 0.000
+playsound block.note_block.pling record @a[distance=..48.00] ^-2.0 ^ ^ 0.379 0.89090 0.000
+playsound block.note_block.pling record @a[distance=..48.00] ^-2.0 ^ ^ 0.375 1.00000 0.000
+playsound block.note_block.bass record @a[distance=..48.00] ^0.0 ^ ^ 2.757 1.33484 0.000
+playsound block.note_block.bass record @a[distance=..48.00] ^-2.0 ^ ^ 1.654 1.33484 0.000
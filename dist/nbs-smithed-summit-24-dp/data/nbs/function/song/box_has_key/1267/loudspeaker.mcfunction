@@ -0,0 +1,7 @@
+playsound block.note_block.basedrum record @a[distance=..48.00] ^0.0 ^ ^ 2.662 1.00000 0.000
+playsound block.note_block.harp record @a[distance=..48.00] ^3.0 ^ ^ 0.571 0.66742 0.000
+playsound block.note_block.harp record @a[distance=..48.00] ^3.0 ^ ^ 0.342 0.66742 0.000
+playsound block.note_block.harp record @a[distance=..48.00] ^-4.0 ^ ^ 0.428 0.66742 0.000
+playsound block.note_block.harp record @a[distance=..48.00] ^-4.0 ^ ^ 0.285 0.66742 0.000
+playsound block.note_block.bass record @a[distance=..48.00] ^0.0 ^ ^ 2.919 0.66742 0.000
+playsound block.note_block.bass record @a[distance=..48.00] ^0.0 ^ ^ 1.459 0.66742 0.000
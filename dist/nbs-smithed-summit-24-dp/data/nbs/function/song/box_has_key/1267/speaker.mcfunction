@@ -0,0 +1,7 @@
+playsound block.note_block.basedrum record @a[distance=..11.25] ^0.0 ^ ^ 1.000 1.00000 0.000
+playsound block.note_block.harp record @a[distance=..10.54] ^1.0 ^ ^ 0.220 0.66742 0.000
+playsound block.note_block.harp record @a[distance=..10.54] ^1.0 ^ ^ 0.132 0.66742 0.000
+playsound block.note_block.harp record @a[distance=..10.54] ^-2.0 ^ ^ 0.165 0.66742 0.000
+playsound block.note_block.harp record @a[distance=..10.54] ^-2.0 ^ ^ 0.110 0.66742 0.000
+playsound block.note_block.bass record @a[distance=..11.96] ^0.0 ^ ^ 1.000 0.66742 0.000
+playsound block.note_block.bass record @a[distance=..11.96] ^0.0 ^ ^ 0.500 0.66742 0.000
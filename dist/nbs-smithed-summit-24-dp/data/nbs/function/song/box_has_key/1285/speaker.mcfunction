@@ -0,0 +1,11 @@
+playsound block.note_block.hat record @a[distance=..10.35] ^0.0 ^ ^ 1.000 0.70711 0.000
+playsound block.note_block.harp record @a[distance=..10.54] ^1.0 ^ ^ 1.000 0.66742 0.000
+playsound block.note_block.harp record @a[distance=..10.54] ^1.0 ^ ^ 0.600 0.66742 0.000
+playsound block.note_block.harp record @a[distance=..10.54] ^-2.0 ^ ^ 0.500 0.66742 0.000
+playsound block.note_block.harp record @a[distance=..10.54] ^-2.0 ^ ^ 1.000 0.66742 0.000
+playsound block.note_block.bass record @a[distance=..11.96] ^0.0 ^ ^ 1.000 0.66742 0.000
+playsound block.note_block.bass record @a[distance=..11.96] ^0.0 ^ ^ 0.500 0.66742 0.000
+playsound block.note_block.pling record @a[distance=..9.48] ^-1.0 ^ ^ 0.150 0.89090 0.000
+playsound block.note_block.pling record @a[distance=..9.00] ^-1.0 ^ ^ 0.150 1.00000 0.000
+playsound block.note_block.bass record @a[distance=..11.74] ^0.0 ^ ^ 1.000 1.33484 0.000
+playsound block.note_block.bass record @a[distance=..11.74] ^-1.0 ^ ^ 0.600 1.33484 0.000
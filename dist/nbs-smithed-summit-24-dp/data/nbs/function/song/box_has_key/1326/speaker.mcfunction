@@ -0,0 +1,11 @@
+playsound block.note_block.hat record @a[distance=..10.35] ^0.0 ^ ^ 1.000 0.70711 0.000
+playsound block.note_block.harp_-1 record @a[distance=..11.58] ^1.0 ^ ^ 1.000 1.58740 0.000
+playsound block.note_block.harp_-1 record @a[distance=..11.58] ^1.0 ^ ^ 0.600 1.58740 0.000
+playsound block.note_block.harp_-1 record @a[distance=..11.58] ^-2.0 ^ ^ 0.500 1.58740 0.000
+playsound block.note_block.harp_-1 record @a[distance=..11.58] ^-2.0 ^ ^ 1.000 1.59660 0.000
+playsound block.note_block.bass_-1 record @a[distance=..11.99] ^0.0 ^ ^ 1.000 1.78180 0.000
+playsound block.note_block.bass_-1 record @a[distance=..11.99] ^0.0 ^ ^ 0.500 1.78180 0.000
+playsound block.note_block.pling record @a[distance=..9.48] ^-1.0 ^ ^ 0.150 0.89090 0.000
+playsound block.note_block.pling record @a[distance=..8.52] ^-1.0 ^ ^ 0.150 1.12246 0.000
+playsound block.note_block.bass record @a[distance=..11.91] ^0.0 ^ ^ 1.000 0.89090 0.000
+playsound block.note_block.bass record @a[distance=..11.91] ^-1.0 ^ ^ 0.600 0.89090 0.000
@@ -0,0 +1,6 @@
+playsound block.note_block.harp_-1 record @a[distance=..11.54] ^1.0 ^ ^ 1.000 1.64338 0.000
+playsound block.note_block.harp_-1 record @a[distance=..11.54] ^1.0 ^ ^ 0.600 1.64338 0.000
+playsound block.note_block.harp_-1 record @a[distance=..11.55] ^-2.0 ^ ^ 0.500 1.63392 0.000
+playsound block.note_block.harp_-1 record @a[distance=..11.54] ^-2.0 ^ ^ 1.000 1.65290 0.000
+playsound block.note_block.bass_-1 record @a[distance=..11.99] ^0.0 ^ ^ 1.000 1.78180 0.000
+playsound block.note_block.bass_-1 record @a[distance=..11.99] ^0.0 ^ ^ 0.500 1.78180 0.000
@@ -0,0 +1,10 @@
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 1.000 1.18921 0.000
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 1.000 0.89090 0.000
+playsound block.note_block.harp_-1 record @s[] ^-0.8 ^ ^ 1.000 1.63392 0.000
+playsound block.note_block.harp_-1 record @s[] ^-0.9 ^ ^ 0.600 1.63392 0.000
+playsound block.note_block.harp_-1 record @s[] ^0.9 ^ ^ 0.500 1.65290 0.000
+playsound block.note_block.harp_-1 record @s[] ^0.8 ^ ^ 1.000 1.61515 0.000
+playsound block.note_block.bass_-1 record @s[] ^-0.05 ^ ^ 1.000 1.78180 0.000
+playsound block.note_block.bass_-1 record @s[] ^-0.0 ^ ^ 0.500 1.78180 0.000
+playsound block.note_block.bass record @s[] ^-0.5 ^ ^ 0.500 0.89090 0.000
+playsound block.note_block.bass record @s[] ^0.5 ^ ^ 0.400 0.89090 0.000
@@ -0,0 +1,10 @@
+playsound block.note_block.snare record @a[distance=..6.48] ^0.0 ^ ^ 1.000 1.18921 0.000
+playsound block.note_block.snare record @a[distance=..6.99] ^0.0 ^ ^ 1.000 0.89090 0.000
+playsound block.note_block.harp_-1 record @a[distance=..11.55] ^1.0 ^ ^ 1.000 1.63392 0.000
+playsound block.note_block.harp_-1 record @a[distance=..11.55] ^1.0 ^ ^ 0.600 1.63392 0.000
+playsound block.note_block.harp_-1 record @a[distance=..11.54] ^-2.0 ^ ^ 0.500 1.65290 0.000
+playsound block.note_block.harp_-1 record @a[distance=..11.56] ^-2.0 ^ ^ 1.000 1.61515 0.000
+playsound block.note_block.bass_-1 record @a[distance=..11.99] ^0.0 ^ ^ 1.000 1.78180 0.000
+playsound block.note_block.bass_-1 record @a[distance=..11.99] ^0.0 ^ ^ 0.500 1.78180 0.000
+playsound block.note_block.bass record @a[distance=..11.91] ^1.0 ^ ^ 0.500 0.89090 0.000
+playsound block.note_block.bass record @a[distance=..11.91] ^-1.0 ^ ^ 0.400 0.89090 0.000
@@ -0,0 +1,6 @@
+playsound block.note_block.harp_-1 record @a[distance=..11.58] ^1.0 ^ ^ 1.000 1.59660 0.000
+playsound block.note_block.harp_-1 record @a[distance=..11.58] ^1.0 ^ ^ 0.600 1.59660 0.000
+playsound block.note_block.harp_-1 record @a[distance=..11.56] ^-2.0 ^ ^ 0.500 1.61515 0.000
+playsound block.note_block.harp_-1 record @a[distance=..11.58] ^-2.0 ^ ^ 1.000 1.58740 0.000
+playsound block.note_block.bass_-1 record @a[distance=..11.99] ^0.0 ^ ^ 1.000 1.78180 0.000
+playsound block.note_block.bass_-1 record @a[distance=..11.99] ^0.0 ^ ^ 0.500 1.78180 0.000
@@ -0,0 +1,4 @@
+playsound block.note_block.harp record @s[] ^-0.8 ^ ^ 1.000 0.50000 0.000
+playsound block.note_block.harp record @s[] ^-0.9 ^ ^ 0.600 0.50000 0.000
+playsound block.note_block.harp record @s[] ^0.9 ^ ^ 0.500 0.50000 0.000
+playsound block.note_block.harp record @s[] ^0.8 ^ ^ 1.000 0.50000 0.000
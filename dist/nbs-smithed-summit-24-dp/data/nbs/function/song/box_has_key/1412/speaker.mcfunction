@@ -0,0 +1,4 @@
+playsound block.note_block.harp record @a[distance=..11.25] ^1.0 ^ ^ 1.000 0.50000 0.000
+playsound block.note_block.harp record @a[distance=..11.25] ^1.0 ^ ^ 0.600 0.50000 0.000
+playsound block.note_block.harp record @a[distance=..11.25] ^-2.0 ^ ^ 0.500 0.50000 0.000
+playsound block.note_block.harp record @a[distance=..11.25] ^-2.0 ^ ^ 1.000 0.50000 0.000
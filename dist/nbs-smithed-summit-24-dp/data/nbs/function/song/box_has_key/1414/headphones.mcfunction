@@ -0,0 +1,10 @@
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 1.000 1.78180 0.000
+playsound block.note_block.harp record @s[] ^-0.8 ^ ^ 1.000 0.50000 0.000
+playsound block.note_block.harp record @s[] ^-0.9 ^ ^ 0.600 0.50000 0.000
+playsound block.note_block.harp record @s[] ^0.9 ^ ^ 0.500 0.50000 0.000
+playsound block.note_block.harp record @s[] ^0.8 ^ ^ 1.000 0.50000 0.000
+playsound block.note_block.pling record @s[] ^-0.5 ^ ^ 0.120 0.89090 0.000
+playsound block.note_block.pling record @s[] ^-0.5 ^ ^ 0.120 1.00000 0.000
+playsound block.note_block.bass record @s[] ^0.5 ^ ^ 0.600 1.33484 0.000
+playsound block.note_block.bass record @s[] ^-0.5 ^ ^ 0.500 1.33484 0.000
+particle note ~ ~2.25 ~ 0 0 0 1 1
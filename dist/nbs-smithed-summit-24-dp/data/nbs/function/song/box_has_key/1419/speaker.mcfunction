@@ -0,0 +1,8 @@
+playsound block.note_block.snare record @a[distance=..6.48] ^0.0 ^ ^ 1.000 1.18921 0.000
+playsound block.note_block.snare record @a[distance=..6.99] ^0.0 ^ ^ 1.000 0.89090 0.000
+playsound block.note_block.harp record @a[distance=..11.25] ^1.0 ^ ^ 1.000 0.50000 0.000
+playsound block.note_block.harp record @a[distance=..11.25] ^1.0 ^ ^ 0.600 0.50000 0.000
+playsound block.note_block.harp record @a[distance=..11.25] ^-2.0 ^ ^ 0.500 0.50000 0.000
+playsound block.note_block.harp record @a[distance=..11.25] ^-2.0 ^ ^ 1.000 0.50000 0.000
+playsound block.note_block.bass record @a[distance=..11.74] ^1.0 ^ ^ 0.500 1.33484 0.000
+playsound block.note_block.bass record @a[distance=..11.74] ^-1.0 ^ ^ 0.400 1.33484 0.000
@@ -0,0 +1,4 @@
+playsound block.note_block.harp record @a[distance=..48.00] ^3.0 ^ ^ 2.662 0.50000 0.000
+playsound block.note_block.harp record @a[distance=..48.00] ^3.0 ^ ^ 1.597 0.50000 0.000
+playsound block.note_block.harp record @a[distance=..48.00] ^-4.0 ^ ^ 1.331 0.50000 0.000
+playsound block.note_block.harp record @a[distance=..48.00] ^-4.0 ^ ^ 2.662 0.50000 0.000
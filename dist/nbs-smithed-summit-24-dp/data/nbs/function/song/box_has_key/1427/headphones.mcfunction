@@ -0,0 +1,4 @@
+playsound block.note_block.harp record @s[] ^-0.8 ^ ^ 0.660 0.50000 0.000
+playsound block.note_block.harp record @s[] ^-0.9 ^ ^ 0.396 0.50000 0.000
+playsound block.note_block.harp record @s[] ^0.9 ^ ^ 0.385 0.50000 0.000
+playsound block.note_block.harp record @s[] ^0.8 ^ ^ 0.550 0.50000 0.000
@@ -0,0 +1,4 @@
+playsound block.note_block.harp record @a[distance=..48.00] ^3.0 ^ ^ 1.757 0.50000 0.000
+playsound block.note_block.harp record @a[distance=..48.00] ^3.0 ^ ^ 1.054 0.50000 0.000
+playsound block.note_block.harp record @a[distance=..48.00] ^-4.0 ^ ^ 1.025 0.50000 0.000
+playsound block.note_block.harp record @a[distance=..48.00] ^-4.0 ^ ^ 1.464 0.50000 0.000
@@ -0,0 +1,4 @@
+playsound block.note_block.harp record @a[distance=..11.25] ^1.0 ^ ^ 0.660 0.50000 0.000
+playsound block.note_block.harp record @a[distance=..11.25] ^1.0 ^ ^ 0.396 0.50000 0.000
+playsound block.note_block.harp record @a[distance=..11.25] ^-2.0 ^ ^ 0.385 0.50000 0.000
+playsound block.note_block.harp record @a[distance=..11.25] ^-2.0 ^ ^ 0.550 0.50000 0.000
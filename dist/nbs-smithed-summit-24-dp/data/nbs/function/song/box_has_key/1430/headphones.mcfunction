@@ -0,0 +1,7 @@
+playsound block.note_block.hat record @s[] ^-0.0 ^ ^ 1.000 0.70711 0.000
+playsound block.note_block.harp record @s[] ^-0.8 ^ ^ 0.440 0.50000 0.000
+playsound block.note_block.harp record @s[] ^-0.9 ^ ^ 0.264 0.50000 0.000
+playsound block.note_block.harp record @s[] ^0.9 ^ ^ 0.275 0.50000 0.000
+playsound block.note_block.harp record @s[] ^0.8 ^ ^ 0.330 0.50000 0.000
+playsound block.note_block.bass record @s[] ^-0.0 ^ ^ 1.000 1.33484 0.000
+playsound block.note_block.bass record @s[] ^0.5 ^ ^ 0.600 1.33484 0.000
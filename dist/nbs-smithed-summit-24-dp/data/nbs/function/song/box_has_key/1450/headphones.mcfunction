@@ -0,0 +1,9 @@
+playsound block.note_block.hat record @s[] ^-0.0 ^ ^ 1.000 0.70711 0.000
+playsound block.note_block.harp record @s[] ^-0.8 ^ ^ 1.000 0.66742 0.000
+playsound block.note_block.harp record @s[] ^-0.9 ^ ^ 0.600 0.66742 0.000
+playsound block.note_block.harp record @s[] ^0.9 ^ ^ 0.500 0.66742 0.000
+playsound block.note_block.harp record @s[] ^0.8 ^ ^ 1.000 0.66742 0.000
+playsound block.note_block.bass record @s[] ^-0.05 ^ ^ 0.180 0.66742 0.000
+playsound block.note_block.bass record @s[] ^-0.0 ^ ^ 0.105 0.66742 0.000
+playsound block.note_block.bass record @s[] ^-0.5 ^ ^ 0.200 1.33484 0.000
+playsound block.note_block.bass record @s[] ^0.5 ^ ^ 0.100 1.33484 0.000
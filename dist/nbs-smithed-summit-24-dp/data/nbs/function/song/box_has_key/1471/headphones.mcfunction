@@ -0,0 +1,7 @@
+playsound block.note_block.harp record @s[] ^-0.8 ^ ^ 0.440 0.66742 0.000
+playsound block.note_block.harp record @s[] ^-0.9 ^ ^ 0.264 0.66742 0.000
+playsound block.note_block.harp record @s[] ^0.9 ^ ^ 0.275 0.66742 0.000
+playsound block.note_block.harp record @s[] ^0.8 ^ ^ 0.330 0.66742 0.000
+playsound block.note_block.bass record @s[] ^-0.05 ^ ^ 0.680 0.66742 0.000
+playsound block.note_block.bass record @s[] ^-0.0 ^ ^ 0.355 0.66742 0.000
+playsound block.note_block.pling record @s[] ^0.5 ^ ^ 0.500 1.33484 0.000
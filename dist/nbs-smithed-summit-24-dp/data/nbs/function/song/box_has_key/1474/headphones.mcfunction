@@ -0,0 +1,7 @@
+playsound block.note_block.basedrum record @s[] ^-0.05 ^ ^ 1.000 1.00000 0.000
+playsound block.note_block.harp record @s[] ^-0.8 ^ ^ 0.220 0.66742 0.000
+playsound block.note_block.harp record @s[] ^-0.9 ^ ^ 0.132 0.66742 0.000
+playsound block.note_block.harp record @s[] ^0.9 ^ ^ 0.165 0.66742 0.000
+playsound block.note_block.harp record @s[] ^0.8 ^ ^ 0.110 0.66742 0.000
+playsound block.note_block.bass record @s[] ^-0.05 ^ ^ 0.750 0.66742 0.000
+playsound block.note_block.bass record @s[] ^-0.0 ^ ^ 0.390 0.66742 0.000
@@ -0,0 +1,6 @@
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 1.000 1.78180 0.000
+playsound block.note_block.harp record @s[] ^0.9 ^ ^ 0.055 0.66742 0.000
+playsound block.note_block.bass record @s[] ^-0.05 ^ ^ 0.810 0.66742 0.000
+playsound block.note_block.bass record @s[] ^-0.0 ^ ^ 0.420 0.66742 0.000
+playsound block.note_block.pling record @s[] ^-0.5 ^ ^ 0.400 1.33484 0.000
+particle note ~ ~2.25 ~ 0 0 0 1 1
@@ -0,0 +1,4 @@
+playsound block.note_block.basedrum record @s[] ^-0.05 ^ ^ 1.000 1.00000 0.000
+playsound block.note_block.hat record @s[] ^-0.0 ^ ^ 1.000 0.70711 0.000
+playsound block.note_block.bass record @s[] ^-0.05 ^ ^ 0.870 0.66742 0.000
+playsound block.note_block.bass record @s[] ^-0.0 ^ ^ 0.450 0.66742 0.000
@@ -0,0 +1,6 @@
+playsound block.note_block.basedrum record @s[] ^-0.05 ^ ^ 1.000 1.00000 0.000
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 1.000 1.18921 0.000
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 1.000 0.89090 0.000
+playsound block.note_block.bass record @s[] ^-0.05 ^ ^ 0.930 0.66742 0.000
+playsound block.note_block.bass record @s[] ^-0.0 ^ ^ 0.480 0.66742 0.000
+playsound block.note_block.pling record @s[] ^0.5 ^ ^ 0.300 1.33484 0.000
@@ -0,0 +1,3 @@
+playsound block.note_block.bass record @a[distance=..11.91] ^0.0 ^ ^ 0.600 0.89090 0.000
+playsound block.note_block.bass record @a[distance=..11.91] ^-2.0 ^ ^ 0.300 0.89090 0.000
+playsound block.note_block.bit record @a[distance=..6.99] ^1.0 ^ ^ 0.200 1.78180 0.000
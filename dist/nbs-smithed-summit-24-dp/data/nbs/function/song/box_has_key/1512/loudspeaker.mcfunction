@@ -0,0 +1,8 @@
+playsound block.note_block.hat record @a[distance=..48.00] ^0.0 ^ ^ 2.581 0.70711 0.000
+playsound block.note_block.harp_-1 record @a[distance=..48.00] ^-2.0 ^ ^ 1.345 1.78180 0.000
+playsound block.note_block.harp record @a[distance=..48.00] ^0.0 ^ ^ 1.264 0.89090 0.000
+playsound block.note_block.bass record @a[distance=..48.00] ^1.0 ^ ^ 1.711 0.89090 0.000
+playsound block.note_block.bass record @a[distance=..48.00] ^-4.0 ^ ^ 0.855 0.89090 0.000
+playsound block.note_block.pling record @a[distance=..48.00] ^-2.0 ^ ^ 0.038 0.89090 0.000
+playsound block.note_block.pling record @a[distance=..48.00] ^-2.0 ^ ^ 0.036 1.33484 0.000
+playsound block.note_block.bit_1 record @a[distance=..48.00] ^0.0 ^ ^ 2.324 0.52973 0.000
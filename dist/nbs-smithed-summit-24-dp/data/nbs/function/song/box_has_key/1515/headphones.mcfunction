@@ -0,0 +1,4 @@
+playsound block.note_block.bass record @s[] ^-0.45 ^ ^ 0.600 0.89090 0.000
+playsound block.note_block.bass record @s[] ^0.8 ^ ^ 0.300 0.89090 0.000
+playsound block.note_block.bit_1 record @s[] ^0.5 ^ ^ 0.600 0.52973 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.5 ^ ^ 0.500 0.52973 0.000
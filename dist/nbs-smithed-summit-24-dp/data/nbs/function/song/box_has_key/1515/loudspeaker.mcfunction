@@ -0,0 +1,4 @@
+playsound block.note_block.bass record @a[distance=..48.00] ^1.0 ^ ^ 1.711 0.89090 0.000
+playsound block.note_block.bass record @a[distance=..48.00] ^-4.0 ^ ^ 0.855 0.89090 0.000
+playsound block.note_block.bit_1 record @a[distance=..48.00] ^-2.0 ^ ^ 1.395 0.52973 0.000
+playsound block.note_block.bit_1 record @a[distance=..48.00] ^2.0 ^ ^ 1.162 0.52973 0.000
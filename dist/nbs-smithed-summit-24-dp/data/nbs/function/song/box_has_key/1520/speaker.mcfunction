@@ -0,0 +1,6 @@
+playsound block.note_block.harp_-1 record @a[distance=..11.91] ^1.0 ^ ^ 0.600 0.89090 0.000
+playsound block.note_block.harp_-1 record @a[distance=..11.44] ^0.0 ^ ^ 0.600 1.78180 0.000
+playsound block.note_block.bass record @a[distance=..11.91] ^0.0 ^ ^ 0.600 0.89090 0.000
+playsound block.note_block.bass record @a[distance=..11.91] ^-2.0 ^ ^ 0.300 0.89090 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.48] ^-1.0 ^ ^ 0.600 0.59460 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.48] ^1.0 ^ ^ 0.500 0.59460 0.000
@@ -0,0 +1,3 @@
+playsound block.note_block.bass record @a[distance=..48.00] ^1.0 ^ ^ 1.711 0.89090 0.000
+playsound block.note_block.bass record @a[distance=..48.00] ^-4.0 ^ ^ 0.855 0.89090 0.000
+playsound block.note_block.bit_1 record @a[distance=..48.00] ^2.0 ^ ^ 0.459 0.59460 0.000
@@ -0,0 +1,6 @@
+playsound block.note_block.harp_-1 record @a[distance=..48.00] ^2.0 ^ ^ 1.614 1.78180 0.000
+playsound block.note_block.harp record @a[distance=..48.00] ^0.0 ^ ^ 1.516 0.89090 0.000
+playsound block.note_block.bass record @a[distance=..48.00] ^1.0 ^ ^ 1.711 0.89090 0.000
+playsound block.note_block.bass record @a[distance=..48.00] ^-4.0 ^ ^ 0.855 0.89090 0.000
+playsound block.note_block.bit record @a[distance=..48.00] ^-2.0 ^ ^ 1.459 1.33484 0.000
+playsound block.note_block.bit record @a[distance=..48.00] ^2.0 ^ ^ 1.216 1.33484 0.000
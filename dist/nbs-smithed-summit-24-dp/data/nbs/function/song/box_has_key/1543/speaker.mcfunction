@@ -0,0 +1,8 @@
+playsound block.note_block.basedrum record @a[distance=..11.25] ^0.0 ^ ^ 1.000 1.00000 0.000
+playsound block.note_block.harp_-1 record @a[distance=..11.44] ^-1.0 ^ ^ 0.500 1.78180 0.000
+playsound block.note_block.harp record @a[distance=..9.48] ^0.0 ^ ^ 0.500 0.89090 0.000
+playsound block.note_block.bass record @a[distance=..11.91] ^0.0 ^ ^ 0.600 0.89090 0.000
+playsound block.note_block.bass record @a[distance=..11.91] ^-2.0 ^ ^ 0.300 0.89090 0.000
+playsound block.note_block.pling record @a[distance=..9.94] ^-1.0 ^ ^ 0.090 0.79370 0.000
+playsound block.note_block.pling record @a[distance=..8.52] ^-1.0 ^ ^ 0.090 1.12246 0.000
+playsound block.note_block.bit record @a[distance=..7.85] ^-1.0 ^ ^ 0.400 1.33484 0.000
@@ -0,0 +1,13 @@
+playsound block.note_block.basedrum record @a[distance=..48.00] ^0.0 ^ ^ 2.662 1.00000 0.000
+playsound block.note_block.harp_-1 record @a[distance=..48.00] ^0.0 ^ ^ 2.878 0.79370 0.000
+playsound block.note_block.harp_-1 record @a[distance=..48.00] ^0.0 ^ ^ 2.716 1.58740 0.000
+playsound block.note_block.bass record @a[distance=..48.00] ^1.0 ^ ^ 1.727 0.79370 0.000
+playsound block.note_block.bass record @a[distance=..48.00] ^-4.0 ^ ^ 0.864 0.79370 0.000
+playsound block.note_block.pling record @a[distance=..48.00] ^0.0 ^ ^ 0.766 0.79370 0.000
+playsound block.note_block.pling record @a[distance=..48.00] ^0.0 ^ ^ 0.738 1.18921 0.000
+playsound block.note_block.bit record @a[distance=..48.00] ^-2.0 ^ ^ 0.236 1.78180 0.000
+execute store result score #random nbs run random value 1..4
+execute if score #random nbs matches 1 if entity @a[distance=0..48] run function animated_java:music_speaker/animations/animation_speaker_beat_1/play
+execute if score #random nbs matches 2 if entity @a[distance=0..48] run function animated_java:music_speaker/animations/animation_speaker_beat_2/play
+execute if score #random nbs matches 3 if entity @a[distance=0..48] run function animated_java:music_speaker/animations/animation_speaker_beat_3/play
+execute if score #random nbs matches 4 if entity @a[distance=0..48] run function animated_java:music_speaker/animations/animation_speaker_beat_4/play
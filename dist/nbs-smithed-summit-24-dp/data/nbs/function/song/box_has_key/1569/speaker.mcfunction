@@ -0,0 +1,13 @@
+playsound block.note_block.basedrum record @a[distance=..11.25] ^0.0 ^ ^ 1.000 1.00000 0.000
+playsound block.note_block.harp_-1 record @a[distance=..11.94] ^0.0 ^ ^ 1.000 0.79370 0.000
+playsound block.note_block.harp_-1 record @a[distance=..11.58] ^0.0 ^ ^ 1.000 1.58740 0.000
+playsound block.note_block.bass record @a[distance=..11.94] ^0.0 ^ ^ 0.600 0.79370 0.000
+playsound block.note_block.bass record @a[distance=..11.94] ^-2.0 ^ ^ 0.300 0.79370 0.000
+playsound block.note_block.pling record @a[distance=..9.94] ^0.0 ^ ^ 0.300 0.79370 0.000
+playsound block.note_block.pling record @a[distance=..8.28] ^0.0 ^ ^ 0.300 1.18921 0.000
+playsound block.note_block.bit record @a[distance=..6.99] ^-1.0 ^ ^ 0.100 1.78180 0.000
+execute store result score #random nbs run random value 1..4
+execute if score #random nbs matches 1 if entity @a[distance=0..12] run function animated_java:music_speaker/animations/animation_speaker_beat_1/play
+execute if score #random nbs matches 2 if entity @a[distance=0..12] run function animated_java:music_speaker/animations/animation_speaker_beat_2/play
+execute if score #random nbs matches 3 if entity @a[distance=0..12] run function animated_java:music_speaker/animations/animation_speaker_beat_3/play
+execute if score #random nbs matches 4 if entity @a[distance=0..12] run function animated_java:music_speaker/animations/animation_speaker_beat_4/play
@@ -0,0 +1,3 @@
+playsound block.note_block.bass record @a[distance=..48.00] ^1.0 ^ ^ 1.727 0.79370 0.000
+playsound block.note_block.bass record @a[distance=..48.00] ^-4.0 ^ ^ 0.864 0.79370 0.000
+playsound block.note_block.bit record @a[distance=..48.00] ^2.0 ^ ^ 0.478 1.58740 0.000
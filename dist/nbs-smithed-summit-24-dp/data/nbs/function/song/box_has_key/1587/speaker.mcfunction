@@ -0,0 +1,3 @@
+playsound block.note_block.bass record @a[distance=..11.94] ^0.0 ^ ^ 0.600 0.79370 0.000
+playsound block.note_block.bass record @a[distance=..11.94] ^-2.0 ^ ^ 0.300 0.79370 0.000
+playsound block.note_block.bit record @a[distance=..7.29] ^1.0 ^ ^ 0.200 1.58740 0.000
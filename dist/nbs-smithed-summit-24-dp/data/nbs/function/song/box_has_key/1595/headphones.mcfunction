@@ -0,0 +1,8 @@
+playsound block.note_block.hat record @s[] ^-0.0 ^ ^ 1.000 0.70711 0.000
+playsound block.note_block.harp_-1 record @s[] ^0.5 ^ ^ 0.500 1.78180 0.000
+playsound block.note_block.harp record @s[] ^-0.0 ^ ^ 0.500 0.89090 0.000
+playsound block.note_block.bass record @s[] ^-0.45 ^ ^ 0.600 0.79370 0.000
+playsound block.note_block.bass record @s[] ^0.8 ^ ^ 0.300 0.79370 0.000
+playsound block.note_block.pling record @s[] ^0.5 ^ ^ 0.015 0.79370 0.000
+playsound block.note_block.pling record @s[] ^0.5 ^ ^ 0.015 1.18921 0.000
+playsound block.note_block.bit record @s[] ^-0.0 ^ ^ 1.000 1.33484 0.000
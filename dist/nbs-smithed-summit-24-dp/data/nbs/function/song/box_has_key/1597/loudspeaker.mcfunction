@@ -0,0 +1,4 @@
+playsound block.note_block.bass record @a[distance=..48.00] ^1.0 ^ ^ 1.727 0.79370 0.000
+playsound block.note_block.bass record @a[distance=..48.00] ^-4.0 ^ ^ 0.864 0.79370 0.000
+playsound block.note_block.bit record @a[distance=..48.00] ^-2.0 ^ ^ 1.459 1.33484 0.000
+playsound block.note_block.bit record @a[distance=..48.00] ^2.0 ^ ^ 1.216 1.33484 0.000
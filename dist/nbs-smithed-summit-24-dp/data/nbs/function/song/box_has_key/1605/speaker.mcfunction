@@ -0,0 +1,9 @@
+playsound block.note_block.snare record @a[distance=..6.48] ^0.0 ^ ^ 1.000 1.18921 0.000
+playsound block.note_block.snare record @a[distance=..6.99] ^0.0 ^ ^ 1.000 0.89090 0.000
+playsound block.note_block.harp_-1 record @a[distance=..11.94] ^-1.0 ^ ^ 0.500 0.79370 0.000
+playsound block.note_block.harp_-1 record @a[distance=..11.58] ^0.0 ^ ^ 0.500 1.58740 0.000
+playsound block.note_block.bass record @a[distance=..11.94] ^0.0 ^ ^ 0.600 0.79370 0.000
+playsound block.note_block.bass record @a[distance=..11.94] ^-2.0 ^ ^ 0.300 0.79370 0.000
+playsound block.note_block.pling record @a[distance=..9.94] ^-1.0 ^ ^ 0.150 0.79370 0.000
+playsound block.note_block.pling record @a[distance=..8.28] ^-1.0 ^ ^ 0.150 1.18921 0.000
+playsound block.note_block.bit record @a[distance=..7.46] ^-1.0 ^ ^ 0.400 1.49831 0.000
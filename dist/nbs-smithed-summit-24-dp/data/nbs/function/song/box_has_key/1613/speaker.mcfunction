@@ -0,0 +1,6 @@
+playsound block.note_block.harp_-1 record @a[distance=..11.74] ^1.0 ^ ^ 0.600 1.33484 0.000
+playsound block.note_block.harp record @a[distance=..10.54] ^0.0 ^ ^ 0.600 0.66742 0.000
+playsound block.note_block.bass record @a[distance=..11.94] ^0.0 ^ ^ 0.600 0.79370 0.000
+playsound block.note_block.bass record @a[distance=..11.94] ^-2.0 ^ ^ 0.300 0.79370 0.000
+playsound block.note_block.bit record @a[distance=..7.85] ^-1.0 ^ ^ 0.600 1.33484 0.000
+playsound block.note_block.bit record @a[distance=..7.85] ^1.0 ^ ^ 0.500 1.33484 0.000
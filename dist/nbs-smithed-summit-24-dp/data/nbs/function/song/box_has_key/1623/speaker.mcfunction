@@ -0,0 +1,4 @@
+playsound block.note_block.harp_-1 record @a[distance=..11.58] ^1.0 ^ ^ 0.600 1.58740 0.000
+playsound block.note_block.harp record @a[distance=..9.94] ^0.0 ^ ^ 0.600 0.79370 0.000
+playsound block.note_block.bass record @a[distance=..11.94] ^0.0 ^ ^ 0.600 0.79370 0.000
+playsound block.note_block.bass record @a[distance=..11.94] ^-2.0 ^ ^ 0.300 0.79370 0.000
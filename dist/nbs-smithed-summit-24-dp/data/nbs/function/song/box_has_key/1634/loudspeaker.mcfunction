@@ -0,0 +1,8 @@
+playsound block.note_block.harp_-1 record @a[distance=..48.00] ^2.0 ^ ^ 1.638 1.49831 0.000
+playsound block.note_block.harp record @a[distance=..48.00] ^0.0 ^ ^ 1.541 0.74915 0.000
+playsound block.note_block.bass record @a[distance=..48.00] ^1.0 ^ ^ 1.727 0.79370 0.000
+playsound block.note_block.bass record @a[distance=..48.00] ^-4.0 ^ ^ 0.864 0.79370 0.000
+playsound block.note_block.bit record @a[distance=..48.00] ^-2.0 ^ ^ 1.500 1.00000 0.000
+playsound block.note_block.bit record @a[distance=..48.00] ^-2.0 ^ ^ 1.516 0.89090 0.000
+playsound block.note_block.bit record @a[distance=..48.00] ^2.0 ^ ^ 1.250 1.00000 0.000
+playsound block.note_block.bit record @a[distance=..48.00] ^2.0 ^ ^ 1.264 0.89090 0.000
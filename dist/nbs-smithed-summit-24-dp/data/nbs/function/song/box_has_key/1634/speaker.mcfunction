@@ -0,0 +1,8 @@
+playsound block.note_block.harp_-1 record @a[distance=..11.64] ^1.0 ^ ^ 0.600 1.49831 0.000
+playsound block.note_block.harp record @a[distance=..10.15] ^0.0 ^ ^ 0.600 0.74915 0.000
+playsound block.note_block.bass record @a[distance=..11.94] ^0.0 ^ ^ 0.600 0.79370 0.000
+playsound block.note_block.bass record @a[distance=..11.94] ^-2.0 ^ ^ 0.300 0.79370 0.000
+playsound block.note_block.bit record @a[distance=..9.00] ^-1.0 ^ ^ 0.600 1.00000 0.000
+playsound block.note_block.bit record @a[distance=..9.48] ^-1.0 ^ ^ 0.600 0.89090 0.000
+playsound block.note_block.bit record @a[distance=..9.00] ^1.0 ^ ^ 0.500 1.00000 0.000
+playsound block.note_block.bit record @a[distance=..9.48] ^1.0 ^ ^ 0.500 0.89090 0.000
@@ -0,0 +1,9 @@
+playsound block.note_block.basedrum record @s[] ^-0.05 ^ ^ 1.000 1.00000 0.000
+playsound block.note_block.harp_-1 record @s[] ^0.5 ^ ^ 0.500 1.49831 0.000
+playsound block.note_block.harp record @s[] ^-0.0 ^ ^ 0.500 0.74915 0.000
+playsound block.note_block.bass record @s[] ^-0.45 ^ ^ 0.600 0.79370 0.000
+playsound block.note_block.bass record @s[] ^0.8 ^ ^ 0.300 0.79370 0.000
+playsound block.note_block.pling record @s[] ^0.5 ^ ^ 0.150 0.66742 0.000
+playsound block.note_block.pling record @s[] ^0.5 ^ ^ 0.150 0.89090 0.000
+playsound block.note_block.bit record @s[] ^0.5 ^ ^ 0.400 1.00000 0.000
+playsound block.note_block.bit record @s[] ^0.5 ^ ^ 0.400 0.89090 0.000
@@ -0,0 +1,9 @@
+playsound block.note_block.basedrum record @a[distance=..11.25] ^0.0 ^ ^ 1.000 1.00000 0.000
+playsound block.note_block.harp_-1 record @a[distance=..11.64] ^-1.0 ^ ^ 0.500 1.49831 0.000
+playsound block.note_block.harp record @a[distance=..10.15] ^0.0 ^ ^ 0.500 0.74915 0.000
+playsound block.note_block.bass record @a[distance=..11.94] ^0.0 ^ ^ 0.600 0.79370 0.000
+playsound block.note_block.bass record @a[distance=..11.94] ^-2.0 ^ ^ 0.300 0.79370 0.000
+playsound block.note_block.pling record @a[distance=..10.54] ^-1.0 ^ ^ 0.150 0.66742 0.000
+playsound block.note_block.pling record @a[distance=..9.48] ^-1.0 ^ ^ 0.150 0.89090 0.000
+playsound block.note_block.bit record @a[distance=..9.00] ^-1.0 ^ ^ 0.400 1.00000 0.000
+playsound block.note_block.bit record @a[distance=..9.48] ^-1.0 ^ ^ 0.400 0.89090 0.000
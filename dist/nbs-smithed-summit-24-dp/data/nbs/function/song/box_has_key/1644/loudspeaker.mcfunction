@@ -0,0 +1,5 @@
+playsound block.note_block.hat record @a[distance=..48.00] ^0.0 ^ ^ 2.581 0.70711 0.000
+playsound block.note_block.harp_-1 record @a[distance=..48.00] ^2.0 ^ ^ 1.670 1.18921 0.000
+playsound block.note_block.harp record @a[distance=..48.00] ^0.0 ^ ^ 1.573 0.59460 0.000
+playsound block.note_block.bass record @a[distance=..48.00] ^1.0 ^ ^ 1.727 0.79370 0.000
+playsound block.note_block.bass record @a[distance=..48.00] ^-4.0 ^ ^ 0.864 0.79370 0.000
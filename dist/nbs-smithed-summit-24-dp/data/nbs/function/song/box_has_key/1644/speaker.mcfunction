@@ -0,0 +1,5 @@
+playsound block.note_block.hat record @a[distance=..10.35] ^0.0 ^ ^ 1.000 0.70711 0.000
+playsound block.note_block.harp_-1 record @a[distance=..11.81] ^1.0 ^ ^ 0.600 1.18921 0.000
+playsound block.note_block.harp record @a[distance=..10.87] ^0.0 ^ ^ 0.600 0.59460 0.000
+playsound block.note_block.bass record @a[distance=..11.94] ^0.0 ^ ^ 0.600 0.79370 0.000
+playsound block.note_block.bass record @a[distance=..11.94] ^-2.0 ^ ^ 0.300 0.79370 0.000
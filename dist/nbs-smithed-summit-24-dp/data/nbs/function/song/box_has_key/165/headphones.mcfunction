@@ -0,0 +1,4 @@
+playsound block.note_block.basedrum record @s[] ^-0.05 ^ ^ 1.000 2.00000 0.000
+playsound block.note_block.harp_-1 record @s[] ^-0.0 ^ ^ 1.000 0.89090 0.000
+playsound block.note_block.harp_-1 record @s[] ^-0.0 ^ ^ 1.000 1.78180 0.000
+particle note ~ ~2.25 ~ 0 0 0 1 1
@@ -0,0 +1,12 @@
+playsound block.note_block.basedrum record @a[distance=..11.25] ^0.0 ^ ^ 1.000 1.00000 0.000
+playsound block.note_block.harp_-1 record @a[distance=..11.95] ^0.0 ^ ^ 1.000 0.74915 0.000
+playsound block.note_block.harp_-1 record @a[distance=..11.64] ^0.0 ^ ^ 1.000 1.49831 0.000
+playsound block.note_block.bass record @a[distance=..11.95] ^0.0 ^ ^ 0.600 0.74915 0.000
+playsound block.note_block.bass record @a[distance=..11.95] ^-2.0 ^ ^ 0.300 0.74915 0.000
+playsound block.note_block.pling record @a[distance=..10.54] ^0.0 ^ ^ 0.300 0.66742 0.000
+playsound block.note_block.pling record @a[distance=..10.15] ^0.0 ^ ^ 0.300 0.74915 0.000
+execute store result score #random nbs run random value 1..4
+execute if score #random nbs matches 1 if entity @a[distance=0..12] run function animated_java:music_speaker/animations/animation_speaker_beat_1/play
+execute if score #random nbs matches 2 if entity @a[distance=0..12] run function animated_java:music_speaker/animations/animation_speaker_beat_2/play
+execute if score #random nbs matches 3 if entity @a[distance=0..12] run function animated_java:music_speaker/animations/animation_speaker_beat_3/play
+execute if score #random nbs matches 4 if entity @a[distance=0..12] run function animated_java:music_speaker/animations/animation_speaker_beat_4/play
@@ -0,0 +1,2 @@
+playsound block.note_block.bass record @a[distance=..48.00] ^1.0 ^ ^ 1.735 0.74915 0.000
+playsound block.note_block.bass record @a[distance=..48.00] ^-4.0 ^ ^ 0.868 0.74915 0.000
@@ -0,0 +1,6 @@
+playsound block.note_block.harp_-1 record @a[distance=..48.00] ^2.0 ^ ^ 1.678 1.12246 0.000
+playsound block.note_block.harp record @a[distance=..48.00] ^0.0 ^ ^ 1.581 0.56123 0.000
+playsound block.note_block.bass record @a[distance=..48.00] ^1.0 ^ ^ 1.735 0.74915 0.000
+playsound block.note_block.bass record @a[distance=..48.00] ^-4.0 ^ ^ 0.868 0.74915 0.000
+playsound block.note_block.bit_1 record @a[distance=..48.00] ^-2.0 ^ ^ 1.386 0.56123 0.000
+playsound block.note_block.bit_1 record @a[distance=..48.00] ^2.0 ^ ^ 1.155 0.56123 0.000
@@ -0,0 +1,7 @@
+playsound block.note_block.basedrum record @a[distance=..48.00] ^0.0 ^ ^ 2.662 1.00000 0.000
+playsound block.note_block.harp_-1 record @a[distance=..48.00] ^2.0 ^ ^ 1.695 1.00000 0.000
+playsound block.note_block.harp record @a[distance=..48.00] ^0.0 ^ ^ 1.597 0.50000 0.000
+playsound block.note_block.bass record @a[distance=..48.00] ^1.0 ^ ^ 1.735 0.74915 0.000
+playsound block.note_block.bass record @a[distance=..48.00] ^-4.0 ^ ^ 0.868 0.74915 0.000
+playsound block.note_block.bit_1 record @a[distance=..48.00] ^-2.0 ^ ^ 1.386 0.56123 0.000
+playsound block.note_block.bit_1 record @a[distance=..48.00] ^2.0 ^ ^ 1.155 0.56123 0.000
@@ -0,0 +1,8 @@
+playsound block.note_block.hat record @a[distance=..10.35] ^0.0 ^ ^ 1.000 0.70711 0.000
+playsound block.note_block.harp_-1 record @a[distance=..11.88] ^-1.0 ^ ^ 0.500 1.00000 0.000
+playsound block.note_block.harp record @a[distance=..11.25] ^0.0 ^ ^ 0.500 0.50000 0.000
+playsound block.note_block.bass record @a[distance=..11.95] ^0.0 ^ ^ 0.600 0.74915 0.000
+playsound block.note_block.bass record @a[distance=..11.95] ^-2.0 ^ ^ 0.300 0.74915 0.000
+playsound block.note_block.pling record @a[distance=..10.54] ^-1.0 ^ ^ 0.015 0.66742 0.000
+playsound block.note_block.pling record @a[distance=..10.15] ^-1.0 ^ ^ 0.015 0.74915 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.56] ^-1.0 ^ ^ 0.400 0.56123 0.000
@@ -0,0 +1,2 @@
+playsound block.note_block.harp_-1 record @a[distance=..11.91] ^1.0 ^ ^ 0.600 0.89090 0.000
+playsound block.note_block.harp_-1 record @a[distance=..11.44] ^0.0 ^ ^ 0.600 1.78180 0.000
@@ -0,0 +1,6 @@
+playsound block.note_block.harp_-1 record @a[distance=..11.74] ^1.0 ^ ^ 0.600 1.33484 0.000
+playsound block.note_block.harp record @a[distance=..10.54] ^0.0 ^ ^ 0.600 0.66742 0.000
+playsound block.note_block.bass record @a[distance=..11.95] ^0.0 ^ ^ 0.600 0.74915 0.000
+playsound block.note_block.bass record @a[distance=..11.95] ^-2.0 ^ ^ 0.300 0.74915 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.42] ^-1.0 ^ ^ 0.600 0.62996 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.42] ^1.0 ^ ^ 0.500 0.62996 0.000
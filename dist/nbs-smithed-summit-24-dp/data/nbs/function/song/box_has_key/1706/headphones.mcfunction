@@ -0,0 +1,6 @@
+playsound block.note_block.harp_-1 record @s[] ^-0.5 ^ ^ 0.600 1.00000 0.000
+playsound block.note_block.harp record @s[] ^-0.0 ^ ^ 0.600 0.50000 0.000
+playsound block.note_block.bass record @s[] ^-0.45 ^ ^ 0.600 0.74915 0.000
+playsound block.note_block.bass record @s[] ^0.8 ^ ^ 0.300 0.74915 0.000
+playsound block.note_block.bit record @s[] ^0.5 ^ ^ 0.600 2.00000 0.000
+playsound block.note_block.bit record @s[] ^-0.5 ^ ^ 0.500 2.00000 0.000
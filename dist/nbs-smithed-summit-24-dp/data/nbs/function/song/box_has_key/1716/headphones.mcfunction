@@ -0,0 +1,6 @@
+playsound block.note_block.harp_-1 record @s[] ^-0.5 ^ ^ 0.600 1.12246 0.000
+playsound block.note_block.harp record @s[] ^-0.0 ^ ^ 0.600 0.56123 0.000
+playsound block.note_block.bass record @s[] ^-0.45 ^ ^ 0.600 1.18921 0.000
+playsound block.note_block.bass record @s[] ^0.8 ^ ^ 0.300 1.18921 0.000
+playsound block.note_block.bit_1 record @s[] ^0.5 ^ ^ 0.600 0.56123 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.5 ^ ^ 0.500 0.56123 0.000
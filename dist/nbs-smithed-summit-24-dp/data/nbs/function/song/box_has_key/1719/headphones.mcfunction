@@ -0,0 +1,8 @@
+playsound block.note_block.basedrum record @s[] ^-0.05 ^ ^ 1.000 1.00000 0.000
+playsound block.note_block.harp_-1 record @s[] ^0.5 ^ ^ 0.500 1.12246 0.000
+playsound block.note_block.harp record @s[] ^-0.0 ^ ^ 0.500 0.56123 0.000
+playsound block.note_block.bass record @s[] ^-0.45 ^ ^ 0.600 1.18921 0.000
+playsound block.note_block.bass record @s[] ^0.8 ^ ^ 0.300 1.18921 0.000
+playsound block.note_block.pling record @s[] ^0.5 ^ ^ 0.150 0.74915 0.000
+playsound block.note_block.pling record @s[] ^0.5 ^ ^ 0.150 0.89090 0.000
+playsound block.note_block.bit_1 record @s[] ^0.5 ^ ^ 0.400 0.56123 0.000
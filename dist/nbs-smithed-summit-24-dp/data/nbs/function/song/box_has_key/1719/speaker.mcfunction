@@ -0,0 +1,8 @@
+playsound block.note_block.basedrum record @a[distance=..11.25] ^0.0 ^ ^ 1.000 1.00000 0.000
+playsound block.note_block.harp_-1 record @a[distance=..11.84] ^-1.0 ^ ^ 0.500 1.12246 0.000
+playsound block.note_block.harp record @a[distance=..11.01] ^0.0 ^ ^ 0.500 0.56123 0.000
+playsound block.note_block.bass record @a[distance=..11.81] ^0.0 ^ ^ 0.600 1.18921 0.000
+playsound block.note_block.bass record @a[distance=..11.81] ^-2.0 ^ ^ 0.300 1.18921 0.000
+playsound block.note_block.pling record @a[distance=..10.15] ^-1.0 ^ ^ 0.150 0.74915 0.000
+playsound block.note_block.pling record @a[distance=..9.48] ^-1.0 ^ ^ 0.150 0.89090 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.56] ^-1.0 ^ ^ 0.400 0.56123 0.000
@@ -0,0 +1,3 @@
+playsound block.note_block.bass record @a[distance=..11.81] ^0.0 ^ ^ 0.600 1.18921 0.000
+playsound block.note_block.bass record @a[distance=..11.81] ^-2.0 ^ ^ 0.300 1.18921 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.56] ^1.0 ^ ^ 0.200 0.56123 0.000
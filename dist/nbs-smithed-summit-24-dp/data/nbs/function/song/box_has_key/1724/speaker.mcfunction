@@ -0,0 +1,13 @@
+playsound block.note_block.snare record @a[distance=..6.16] ^0.0 ^ ^ 1.000 1.78180 0.000
+playsound block.note_block.harp_-1 record @a[distance=..11.81] ^0.0 ^ ^ 1.000 1.18921 0.000
+playsound block.note_block.harp record @a[distance=..10.87] ^0.0 ^ ^ 1.000 0.59460 0.000
+playsound block.note_block.bass record @a[distance=..11.81] ^0.0 ^ ^ 0.600 1.18921 0.000
+playsound block.note_block.bass record @a[distance=..11.81] ^-2.0 ^ ^ 0.300 1.18921 0.000
+playsound block.note_block.pling record @a[distance=..10.15] ^1.0 ^ ^ 0.120 0.74915 0.000
+playsound block.note_block.pling record @a[distance=..9.48] ^1.0 ^ ^ 0.120 0.89090 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.48] ^0.0 ^ ^ 1.000 0.59460 0.000
+execute store result score #random nbs run random value 1..4
+execute if score #random nbs matches 1 if entity @a[distance=0..12] run function animated_java:music_speaker/animations/animation_speaker_beat_1/play
+execute if score #random nbs matches 2 if entity @a[distance=0..12] run function animated_java:music_speaker/animations/animation_speaker_beat_2/play
+execute if score #random nbs matches 3 if entity @a[distance=0..12] run function animated_java:music_speaker/animations/animation_speaker_beat_3/play
+execute if score #random nbs matches 4 if entity @a[distance=0..12] run function animated_java:music_speaker/animations/animation_speaker_beat_4/play
@@ -0,0 +1,6 @@
+playsound block.note_block.harp_-1 record @a[distance=..11.96] ^1.0 ^ ^ 0.600 0.66742 0.000
+playsound block.note_block.harp_-1 record @a[distance=..11.74] ^0.0 ^ ^ 0.600 1.33484 0.000
+playsound block.note_block.bass record @a[distance=..11.96] ^0.0 ^ ^ 0.600 0.66742 0.000
+playsound block.note_block.bass record @a[distance=..11.96] ^-2.0 ^ ^ 0.300 0.66742 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.36] ^-1.0 ^ ^ 0.600 0.66742 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.36] ^1.0 ^ ^ 0.500 0.66742 0.000
@@ -0,0 +1,4 @@
+playsound block.note_block.bass record @a[distance=..11.96] ^0.0 ^ ^ 0.600 0.66742 0.000
+playsound block.note_block.bass record @a[distance=..11.96] ^-2.0 ^ ^ 0.300 0.66742 0.000
+playsound block.note_block.bit record @a[distance=..6.75] ^0.0 ^ ^ 1.000 2.00000 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.36] ^1.0 ^ ^ 0.200 0.66742 0.000
@@ -0,0 +1,15 @@
+playsound block.note_block.snare record @a[distance=..6.16] ^0.0 ^ ^ 1.000 1.78180 0.000
+playsound block.note_block.harp_-1 record @a[distance=..11.88] ^0.0 ^ ^ 1.000 1.00000 0.000
+playsound block.note_block.harp record @a[distance=..11.25] ^0.0 ^ ^ 1.000 0.50000 0.000
+playsound block.note_block.bass record @a[distance=..11.96] ^0.0 ^ ^ 0.600 0.66742 0.000
+playsound block.note_block.bass record @a[distance=..11.96] ^-2.0 ^ ^ 0.300 0.66742 0.000
+playsound block.note_block.pling record @a[distance=..9.00] ^1.0 ^ ^ 0.120 1.00000 0.000
+playsound block.note_block.pling record @a[distance=..7.85] ^1.0 ^ ^ 0.120 1.33484 0.000
+playsound block.note_block.bit record @a[distance=..6.75] ^-1.0 ^ ^ 0.600 2.00000 0.000
+playsound block.note_block.bit record @a[distance=..6.75] ^1.0 ^ ^ 0.500 2.00000 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.36] ^-1.0 ^ ^ 0.100 0.66742 0.000
+execute store result score #random nbs run random value 1..4
+execute if score #random nbs matches 1 if entity @a[distance=0..12] run function animated_java:music_speaker/animations/animation_speaker_beat_1/play
+execute if score #random nbs matches 2 if entity @a[distance=0..12] run function animated_java:music_speaker/animations/animation_speaker_beat_2/play
+execute if score #random nbs matches 3 if entity @a[distance=0..12] run function animated_java:music_speaker/animations/animation_speaker_beat_3/play
+execute if score #random nbs matches 4 if entity @a[distance=0..12] run function animated_java:music_speaker/animations/animation_speaker_beat_4/play
@@ -0,0 +1,9 @@
+playsound block.note_block.basedrum record @a[distance=..11.25] ^0.0 ^ ^ 1.000 1.00000 0.000
+playsound block.note_block.harp_-1 record @a[distance=..11.88] ^-1.0 ^ ^ 0.500 1.00000 0.000
+playsound block.note_block.harp record @a[distance=..11.25] ^0.0 ^ ^ 0.500 0.50000 0.000
+playsound block.note_block.bass record @a[distance=..11.96] ^0.0 ^ ^ 0.600 0.66742 0.000
+playsound block.note_block.bass record @a[distance=..11.96] ^-2.0 ^ ^ 0.300 0.66742 0.000
+playsound block.note_block.pling record @a[distance=..9.00] ^-1.0 ^ ^ 0.090 1.00000 0.000
+playsound block.note_block.pling record @a[distance=..7.85] ^-1.0 ^ ^ 0.090 1.33484 0.000
+playsound block.note_block.bit record @a[distance=..6.99] ^0.0 ^ ^ 1.000 1.78180 0.000
+playsound block.note_block.bit record @a[distance=..6.75] ^1.0 ^ ^ 0.200 2.00000 0.000
@@ -0,0 +1,5 @@
+playsound block.note_block.bass record @s[] ^-0.45 ^ ^ 0.600 0.66742 0.000
+playsound block.note_block.bass record @s[] ^0.8 ^ ^ 0.300 0.66742 0.000
+playsound block.note_block.bit record @s[] ^0.5 ^ ^ 0.600 1.78180 0.000
+playsound block.note_block.bit record @s[] ^-0.5 ^ ^ 0.500 1.78180 0.000
+playsound block.note_block.bit record @s[] ^0.5 ^ ^ 0.100 2.00000 0.000
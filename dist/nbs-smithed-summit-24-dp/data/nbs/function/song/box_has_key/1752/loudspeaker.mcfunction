@@ -0,0 +1,5 @@
+playsound block.note_block.bass record @a[distance=..48.00] ^1.0 ^ ^ 1.751 0.66742 0.000
+playsound block.note_block.bass record @a[distance=..48.00] ^-4.0 ^ ^ 0.876 0.66742 0.000
+playsound block.note_block.bit record @a[distance=..48.00] ^-2.0 ^ ^ 1.419 1.78180 0.000
+playsound block.note_block.bit record @a[distance=..48.00] ^2.0 ^ ^ 1.182 1.78180 0.000
+playsound block.note_block.bit record @a[distance=..48.00] ^-2.0 ^ ^ 0.234 2.00000 0.000
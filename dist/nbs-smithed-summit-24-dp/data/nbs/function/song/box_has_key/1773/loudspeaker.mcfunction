@@ -0,0 +1,4 @@
+playsound block.note_block.bass record @a[distance=..48.00] ^1.0 ^ ^ 1.751 0.66742 0.000
+playsound block.note_block.bass record @a[distance=..48.00] ^-4.0 ^ ^ 0.876 0.66742 0.000
+playsound block.note_block.bit record @a[distance=..48.00] ^0.0 ^ ^ 2.392 1.58740 0.000
+playsound block.note_block.bit record @a[distance=..48.00] ^2.0 ^ ^ 0.473 1.78180 0.000
@@ -0,0 +1,4 @@
+playsound block.note_block.bass record @a[distance=..11.96] ^0.0 ^ ^ 0.600 0.66742 0.000
+playsound block.note_block.bass record @a[distance=..11.96] ^-2.0 ^ ^ 0.300 0.66742 0.000
+playsound block.note_block.bit record @a[distance=..7.29] ^0.0 ^ ^ 1.000 1.58740 0.000
+playsound block.note_block.bit record @a[distance=..6.99] ^1.0 ^ ^ 0.200 1.78180 0.000
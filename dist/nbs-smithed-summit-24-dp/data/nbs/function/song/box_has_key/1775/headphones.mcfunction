@@ -0,0 +1,13 @@
+playsound block.note_block.basedrum record @s[] ^-0.05 ^ ^ 1.000 1.00000 0.000
+playsound block.note_block.harp_-1 record @s[] ^-0.0 ^ ^ 1.000 0.50000 0.000
+playsound block.note_block.harp_-1 record @s[] ^-0.0 ^ ^ 1.000 1.00000 0.000
+playsound block.note_block.bass record @s[] ^-0.45 ^ ^ 0.600 0.50000 0.000
+playsound block.note_block.bass record @s[] ^0.8 ^ ^ 0.300 0.50000 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.300 1.33484 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.300 2.00000 0.000
+playsound block.note_block.bit record @s[] ^-0.0 ^ ^ 1.000 1.49831 0.000
+playsound block.note_block.bit record @s[] ^-0.0 ^ ^ 1.000 1.58740 0.000
+playsound block.note_block.bit record @s[] ^0.5 ^ ^ 0.600 1.58740 0.000
+playsound block.note_block.bit record @s[] ^-0.5 ^ ^ 0.500 1.58740 0.000
+playsound block.note_block.bit record @s[] ^0.5 ^ ^ 0.100 1.78180 0.000
+particle note ~ ~2.25 ~ 0 0 0 1 1
@@ -0,0 +1,8 @@
+playsound block.note_block.harp_-1 record @a[distance=..11.98] ^1.0 ^ ^ 0.600 0.50000 0.000
+playsound block.note_block.harp_-1 record @a[distance=..11.88] ^0.0 ^ ^ 0.600 1.00000 0.000
+playsound block.note_block.bass record @a[distance=..11.98] ^0.0 ^ ^ 0.600 0.50000 0.000
+playsound block.note_block.bass record @a[distance=..11.98] ^-2.0 ^ ^ 0.300 0.50000 0.000
+playsound block.note_block.bit record @a[distance=..7.46] ^-1.0 ^ ^ 0.600 1.49831 0.000
+playsound block.note_block.bit record @a[distance=..7.29] ^-1.0 ^ ^ 0.600 1.58740 0.000
+playsound block.note_block.bit record @a[distance=..7.46] ^1.0 ^ ^ 0.500 1.49831 0.000
+playsound block.note_block.bit record @a[distance=..7.29] ^-1.0 ^ ^ 0.400 1.58740 0.000
@@ -0,0 +1,10 @@
+playsound block.note_block.hat record @s[] ^-0.0 ^ ^ 1.000 0.70711 0.000
+playsound block.note_block.harp_-1 record @s[] ^0.5 ^ ^ 0.500 0.50000 0.000
+playsound block.note_block.harp_-1 record @s[] ^-0.0 ^ ^ 0.500 1.00000 0.000
+playsound block.note_block.bass record @s[] ^-0.45 ^ ^ 0.600 0.50000 0.000
+playsound block.note_block.bass record @s[] ^0.8 ^ ^ 0.300 0.50000 0.000
+playsound block.note_block.pling record @s[] ^0.5 ^ ^ 0.150 1.33484 0.000
+playsound block.note_block.pling record @s[] ^0.5 ^ ^ 0.150 2.00000 0.000
+playsound block.note_block.bit record @s[] ^-0.5 ^ ^ 0.500 1.58740 0.000
+playsound block.note_block.bit record @s[] ^0.5 ^ ^ 0.400 1.49831 0.000
+playsound block.note_block.bit record @s[] ^-0.5 ^ ^ 0.200 1.58740 0.000
@@ -0,0 +1,10 @@
+playsound block.note_block.hat record @a[distance=..10.35] ^0.0 ^ ^ 1.000 0.70711 0.000
+playsound block.note_block.harp_-1 record @a[distance=..11.98] ^-1.0 ^ ^ 0.500 0.50000 0.000
+playsound block.note_block.harp_-1 record @a[distance=..11.88] ^0.0 ^ ^ 0.500 1.00000 0.000
+playsound block.note_block.bass record @a[distance=..11.98] ^0.0 ^ ^ 0.600 0.50000 0.000
+playsound block.note_block.bass record @a[distance=..11.98] ^-2.0 ^ ^ 0.300 0.50000 0.000
+playsound block.note_block.pling record @a[distance=..7.85] ^-1.0 ^ ^ 0.150 1.33484 0.000
+playsound block.note_block.pling record @a[distance=..6.75] ^-1.0 ^ ^ 0.150 2.00000 0.000
+playsound block.note_block.bit record @a[distance=..7.29] ^1.0 ^ ^ 0.500 1.58740 0.000
+playsound block.note_block.bit record @a[distance=..7.46] ^-1.0 ^ ^ 0.400 1.49831 0.000
+playsound block.note_block.bit record @a[distance=..7.29] ^1.0 ^ ^ 0.200 1.58740 0.000
@@ -0,0 +1,6 @@
+playsound block.note_block.bass record @s[] ^-0.45 ^ ^ 0.600 0.50000 0.000
+playsound block.note_block.bass record @s[] ^0.8 ^ ^ 0.300 0.50000 0.000
+playsound block.note_block.bit record @s[] ^-0.0 ^ ^ 1.000 1.58740 0.000
+playsound block.note_block.bit record @s[] ^0.5 ^ ^ 0.400 1.58740 0.000
+playsound block.note_block.bit record @s[] ^-0.5 ^ ^ 0.200 1.49831 0.000
+playsound block.note_block.bit record @s[] ^0.5 ^ ^ 0.100 1.58740 0.000
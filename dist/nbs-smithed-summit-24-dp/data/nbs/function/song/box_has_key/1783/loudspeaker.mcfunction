@@ -0,0 +1,6 @@
+playsound block.note_block.bass record @a[distance=..48.00] ^1.0 ^ ^ 1.792 0.50000 0.000
+playsound block.note_block.bass record @a[distance=..48.00] ^-4.0 ^ ^ 0.896 0.50000 0.000
+playsound block.note_block.bit record @a[distance=..48.00] ^0.0 ^ ^ 2.392 1.58740 0.000
+playsound block.note_block.bit record @a[distance=..48.00] ^-2.0 ^ ^ 0.957 1.58740 0.000
+playsound block.note_block.bit record @a[distance=..48.00] ^2.0 ^ ^ 0.481 1.49831 0.000
+playsound block.note_block.bit record @a[distance=..48.00] ^-2.0 ^ ^ 0.239 1.58740 0.000
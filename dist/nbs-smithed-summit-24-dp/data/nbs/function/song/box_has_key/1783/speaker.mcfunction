@@ -0,0 +1,6 @@
+playsound block.note_block.bass record @a[distance=..11.98] ^0.0 ^ ^ 0.600 0.50000 0.000
+playsound block.note_block.bass record @a[distance=..11.98] ^-2.0 ^ ^ 0.300 0.50000 0.000
+playsound block.note_block.bit record @a[distance=..7.29] ^0.0 ^ ^ 1.000 1.58740 0.000
+playsound block.note_block.bit record @a[distance=..7.29] ^-1.0 ^ ^ 0.400 1.58740 0.000
+playsound block.note_block.bit record @a[distance=..7.46] ^1.0 ^ ^ 0.200 1.49831 0.000
+playsound block.note_block.bit record @a[distance=..7.29] ^-1.0 ^ ^ 0.100 1.58740 0.000
@@ -0,0 +1,7 @@
+playsound block.note_block.harp_-1 record @a[distance=..48.00] ^2.0 ^ ^ 1.670 1.18921 0.000
+playsound block.note_block.harp record @a[distance=..48.00] ^0.0 ^ ^ 1.573 0.59460 0.000
+playsound block.note_block.bass record @a[distance=..48.00] ^1.0 ^ ^ 1.768 0.59460 0.000
+playsound block.note_block.bass record @a[distance=..48.00] ^-4.0 ^ ^ 0.884 0.59460 0.000
+playsound block.note_block.bit record @a[distance=..48.00] ^-2.0 ^ ^ 1.459 1.33484 0.000
+playsound block.note_block.bit record @a[distance=..48.00] ^2.0 ^ ^ 1.216 1.33484 0.000
+playsound block.note_block.bit record @a[distance=..48.00] ^2.0 ^ ^ 0.481 1.49831 0.000
@@ -0,0 +1,7 @@
+playsound block.note_block.harp_-1 record @a[distance=..11.81] ^1.0 ^ ^ 0.600 1.18921 0.000
+playsound block.note_block.harp record @a[distance=..10.87] ^0.0 ^ ^ 0.600 0.59460 0.000
+playsound block.note_block.bass record @a[distance=..11.97] ^0.0 ^ ^ 0.600 0.59460 0.000
+playsound block.note_block.bass record @a[distance=..11.97] ^-2.0 ^ ^ 0.300 0.59460 0.000
+playsound block.note_block.bit record @a[distance=..7.85] ^-1.0 ^ ^ 0.600 1.33484 0.000
+playsound block.note_block.bit record @a[distance=..7.85] ^1.0 ^ ^ 0.500 1.33484 0.000
+playsound block.note_block.bit record @a[distance=..7.46] ^1.0 ^ ^ 0.200 1.49831 0.000
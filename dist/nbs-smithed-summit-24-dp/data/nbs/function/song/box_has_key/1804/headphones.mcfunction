@@ -0,0 +1,4 @@
+playsound block.note_block.bass record @s[] ^-0.45 ^ ^ 0.600 0.59460 0.000
+playsound block.note_block.bass record @s[] ^0.8 ^ ^ 0.300 0.59460 0.000
+playsound block.note_block.bit record @s[] ^-0.0 ^ ^ 1.000 1.18921 0.000
+playsound block.note_block.bit record @s[] ^-0.5 ^ ^ 0.200 1.33484 0.000
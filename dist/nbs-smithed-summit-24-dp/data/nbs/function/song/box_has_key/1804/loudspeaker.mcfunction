@@ -0,0 +1,4 @@
+playsound block.note_block.bass record @a[distance=..48.00] ^1.0 ^ ^ 1.768 0.59460 0.000
+playsound block.note_block.bass record @a[distance=..48.00] ^-4.0 ^ ^ 0.884 0.59460 0.000
+playsound block.note_block.bit record @a[distance=..48.00] ^0.0 ^ ^ 2.459 1.18921 0.000
+playsound block.note_block.bit record @a[distance=..48.00] ^2.0 ^ ^ 0.486 1.33484 0.000
@@ -0,0 +1,6 @@
+playsound block.note_block.hat record @s[] ^-0.0 ^ ^ 1.000 0.70711 0.000
+playsound block.note_block.bass record @s[] ^-0.45 ^ ^ 0.600 0.59460 0.000
+playsound block.note_block.bass record @s[] ^0.8 ^ ^ 0.300 0.59460 0.000
+playsound block.note_block.bit record @s[] ^0.5 ^ ^ 0.600 1.49831 0.000
+playsound block.note_block.bit record @s[] ^-0.5 ^ ^ 0.500 1.49831 0.000
+playsound block.note_block.bit record @s[] ^0.5 ^ ^ 0.100 1.18921 0.000
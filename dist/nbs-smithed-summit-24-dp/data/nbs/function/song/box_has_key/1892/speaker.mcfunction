@@ -0,0 +1,9 @@
+playsound block.note_block.hat record @a[distance=..10.35] ^0.0 ^ ^ 1.000 0.70711 0.000
+playsound block.note_block.harp_-1 record @a[distance=..11.74] ^1.0 ^ ^ 0.600 1.33484 0.000
+playsound block.note_block.harp record @a[distance=..10.54] ^0.0 ^ ^ 0.600 0.66742 0.000
+playsound block.note_block.bass record @a[distance=..11.91] ^0.0 ^ ^ 0.600 0.89090 0.000
+playsound block.note_block.bass record @a[distance=..11.91] ^-2.0 ^ ^ 0.300 0.89090 0.000
+playsound block.note_block.bit record @a[distance=..6.99] ^-1.0 ^ ^ 0.600 1.78180 0.000
+playsound block.note_block.bit record @a[distance=..10.54] ^-1.0 ^ ^ 0.600 0.66742 0.000
+playsound block.note_block.bit record @a[distance=..6.99] ^1.0 ^ ^ 0.500 1.78180 0.000
+playsound block.note_block.bit record @a[distance=..10.54] ^1.0 ^ ^ 0.500 0.66742 0.000
@@ -0,0 +1,4 @@
+playsound block.note_block.bass record @a[distance=..11.95] ^0.0 ^ ^ 0.600 0.74915 0.000
+playsound block.note_block.bass record @a[distance=..11.95] ^-2.0 ^ ^ 0.300 0.74915 0.000
+playsound block.note_block.bit record @a[distance=..6.75] ^-1.0 ^ ^ 0.600 2.00000 0.000
+playsound block.note_block.bit record @a[distance=..6.75] ^1.0 ^ ^ 0.500 2.00000 0.000
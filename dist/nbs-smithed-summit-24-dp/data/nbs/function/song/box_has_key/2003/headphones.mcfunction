@@ -0,0 +1,11 @@
+playsound block.note_block.hat record @s[] ^-0.0 ^ ^ 1.000 0.70711 0.000
+playsound block.note_block.harp_-1 record @s[] ^-0.0 ^ ^ 1.000 1.00000 0.000
+playsound block.note_block.harp record @s[] ^-0.0 ^ ^ 1.000 0.50000 0.000
+playsound block.note_block.bass record @s[] ^-0.45 ^ ^ 0.600 0.74915 0.000
+playsound block.note_block.bass record @s[] ^0.8 ^ ^ 0.300 0.74915 0.000
+playsound block.note_block.pling record @s[] ^-0.5 ^ ^ 0.060 0.66742 0.000
+playsound block.note_block.pling record @s[] ^-0.5 ^ ^ 0.060 0.74915 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.0 ^ ^ 1.000 0.56123 0.000
+playsound block.note_block.bit record @s[] ^-0.0 ^ ^ 1.000 1.12246 0.000
+playsound block.note_block.bit record @s[] ^0.5 ^ ^ 0.400 2.00000 0.000
+particle note ~ ~2.25 ~ 0 0 0 1 1
@@ -0,0 +1,6 @@
+playsound block.note_block.harp_-1 record @a[distance=..11.88] ^1.0 ^ ^ 0.600 1.00000 0.000
+playsound block.note_block.harp record @a[distance=..11.25] ^0.0 ^ ^ 0.600 0.50000 0.000
+playsound block.note_block.bass record @a[distance=..11.95] ^0.0 ^ ^ 0.600 0.74915 0.000
+playsound block.note_block.bass record @a[distance=..11.95] ^-2.0 ^ ^ 0.300 0.74915 0.000
+playsound block.note_block.bit record @a[distance=..6.75] ^-1.0 ^ ^ 0.600 2.00000 0.000
+playsound block.note_block.bit record @a[distance=..6.75] ^1.0 ^ ^ 0.500 2.00000 0.000
@@ -0,0 +1,5 @@
+playsound block.note_block.bass record @a[distance=..11.97] ^0.0 ^ ^ 0.600 0.59460 0.000
+playsound block.note_block.bass record @a[distance=..11.97] ^-2.0 ^ ^ 0.300 0.59460 0.000
+playsound block.note_block.bit record @a[distance=..8.28] ^0.0 ^ ^ 1.000 1.18921 0.000
+playsound block.note_block.bit record @a[distance=..7.85] ^1.0 ^ ^ 0.200 1.33484 0.000
+playsound block.note_block.bit record @a[distance=..9.00] ^1.0 ^ ^ 0.200 1.00000 0.000
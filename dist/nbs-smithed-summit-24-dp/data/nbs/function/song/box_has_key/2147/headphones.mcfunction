@@ -0,0 +1,6 @@
+playsound block.note_block.basedrum record @s[] ^-0.05 ^ ^ 1.000 1.58740 0.000
+playsound block.note_block.bass_-1 record @s[] ^-0.45 ^ ^ 0.600 1.78180 0.000
+playsound block.note_block.bass_-1 record @s[] ^0.8 ^ ^ 0.300 1.78180 0.000
+playsound block.note_block.bit record @s[] ^-0.0 ^ ^ 1.000 1.33484 0.000
+playsound block.note_block.bit record @s[] ^0.5 ^ ^ 0.400 1.49831 0.000
+particle note ~ ~2.25 ~ 0 0 0 1 1
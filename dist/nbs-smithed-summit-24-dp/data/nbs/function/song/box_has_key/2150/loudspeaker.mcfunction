@@ -0,0 +1,4 @@
+playsound block.note_block.bass_-1 record @a[distance=..48.00] ^1.0 ^ ^ 1.808 1.78180 0.000
+playsound block.note_block.bass_-1 record @a[distance=..48.00] ^-4.0 ^ ^ 0.904 1.78180 0.000
+playsound block.note_block.bit record @a[distance=..48.00] ^-2.0 ^ ^ 1.459 1.33484 0.000
+playsound block.note_block.bit record @a[distance=..48.00] ^2.0 ^ ^ 1.216 1.33484 0.000
@@ -0,0 +1,3 @@
+playsound block.note_block.bass_-1 record @s[] ^-0.45 ^ ^ 0.600 1.78180 0.000
+playsound block.note_block.bass_-1 record @s[] ^0.8 ^ ^ 0.300 1.78180 0.000
+playsound block.note_block.bit record @s[] ^-0.5 ^ ^ 0.200 1.33484 0.000
@@ -0,0 +1,3 @@
+playsound block.note_block.bass_-1 record @a[distance=..48.00] ^1.0 ^ ^ 1.808 1.78180 0.000
+playsound block.note_block.bass_-1 record @a[distance=..48.00] ^-4.0 ^ ^ 0.904 1.78180 0.000
+playsound block.note_block.bit record @a[distance=..48.00] ^2.0 ^ ^ 0.486 1.33484 0.000
@@ -0,0 +1,3 @@
+playsound block.note_block.bass_-1 record @a[distance=..11.99] ^0.0 ^ ^ 0.600 1.78180 0.000
+playsound block.note_block.bass_-1 record @a[distance=..11.99] ^-2.0 ^ ^ 0.300 1.78180 0.000
+playsound block.note_block.bit record @a[distance=..7.85] ^1.0 ^ ^ 0.200 1.33484 0.000
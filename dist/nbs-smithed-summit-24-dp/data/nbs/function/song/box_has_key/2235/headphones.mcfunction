@@ -0,0 +1,5 @@
+playsound block.note_block.hat record @s[] ^-0.0 ^ ^ 1.000 0.70711 0.000
+playsound block.note_block.bass_-1 record @s[] ^-0.45 ^ ^ 0.600 1.58740 0.000
+playsound block.note_block.bass_-1 record @s[] ^0.8 ^ ^ 0.300 1.58740 0.000
+playsound block.note_block.pling record @s[] ^0.5 ^ ^ 0.050 0.56123 0.000
+playsound block.note_block.pling record @s[] ^0.5 ^ ^ 0.050 0.66742 0.000
@@ -0,0 +1,2 @@
+playsound block.note_block.bass_-1 record @a[distance=..48.00] ^1.0 ^ ^ 1.824 1.58740 0.000
+playsound block.note_block.bass_-1 record @a[distance=..48.00] ^-4.0 ^ ^ 0.912 1.58740 0.000
@@ -0,0 +1,2 @@
+playsound block.note_block.bass_-1 record @s[] ^-0.45 ^ ^ 0.600 1.58740 0.000
+playsound block.note_block.bass_-1 record @s[] ^0.8 ^ ^ 0.300 1.58740 0.000
@@ -0,0 +1,4 @@
+playsound block.note_block.bass_-1 record @a[distance=..11.99] ^0.0 ^ ^ 0.600 1.58740 0.000
+playsound block.note_block.bass_-1 record @a[distance=..11.99] ^-2.0 ^ ^ 0.300 1.58740 0.000
+playsound block.note_block.pling_-1 record @a[distance=..11.44] ^-1.0 ^ ^ 0.500 1.78180 0.000
+playsound block.note_block.pling record @a[distance=..10.15] ^-1.0 ^ ^ 0.500 0.74915 0.000
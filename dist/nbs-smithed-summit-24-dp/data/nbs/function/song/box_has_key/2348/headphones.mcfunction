@@ -0,0 +1,4 @@
+playsound block.note_block.bass_-1 record @s[] ^-0.45 ^ ^ 0.600 1.49831 0.000
+playsound block.note_block.bass_-1 record @s[] ^0.8 ^ ^ 0.300 1.49831 0.000
+playsound block.note_block.pling record @s[] ^0.5 ^ ^ 0.500 0.59460 0.000
+playsound block.note_block.pling record @s[] ^0.5 ^ ^ 0.500 0.74915 0.000
@@ -0,0 +1,2 @@
+playsound block.note_block.bass_-1 record @s[] ^-0.45 ^ ^ 0.520 1.78180 0.000
+playsound block.note_block.bass_-1 record @s[] ^0.8 ^ ^ 0.250 1.78180 0.000
@@ -0,0 +1,5 @@
+playsound block.note_block.hat record @a[distance=..10.35] ^0.0 ^ ^ 1.000 0.70711 0.000
+playsound block.note_block.bass_-1 record @a[distance=..11.99] ^0.0 ^ ^ 0.270 1.78180 0.000
+playsound block.note_block.bass_-1 record @a[distance=..11.99] ^-2.0 ^ ^ 0.125 1.78180 0.000
+playsound block.note_block.pling record @a[distance=..10.57] ^-1.0 ^ ^ 0.300 0.66166 0.000
+playsound block.note_block.pling record @a[distance=..9.52] ^-1.0 ^ ^ 0.300 0.88321 0.000
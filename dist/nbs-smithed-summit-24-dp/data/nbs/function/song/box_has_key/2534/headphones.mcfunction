@@ -0,0 +1,3 @@
+playsound block.note_block.basedrum record @s[] ^-0.05 ^ ^ 1.000 1.00000 0.000
+playsound block.note_block.pling record @s[] ^0.5 ^ ^ 0.050 0.65595 0.000
+playsound block.note_block.pling record @s[] ^0.5 ^ ^ 0.050 0.87559 0.000
@@ -0,0 +1,3 @@
+playsound block.note_block.basedrum record @a[distance=..11.25] ^0.0 ^ ^ 1.000 1.00000 0.000
+playsound block.note_block.pling record @a[distance=..10.59] ^-1.0 ^ ^ 0.050 0.65595 0.000
+playsound block.note_block.pling record @a[distance=..9.55] ^-1.0 ^ ^ 0.050 0.87559 0.000
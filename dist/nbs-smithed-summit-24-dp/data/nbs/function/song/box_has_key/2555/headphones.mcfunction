@@ -0,0 +1,3 @@
+playsound block.note_block.basedrum record @s[] ^-0.05 ^ ^ 1.000 1.00000 0.000
+playsound block.note_block.pling record @s[] ^0.5 ^ ^ 0.300 0.55639 0.000
+playsound block.note_block.pling record @s[] ^0.5 ^ ^ 0.300 0.66166 0.000
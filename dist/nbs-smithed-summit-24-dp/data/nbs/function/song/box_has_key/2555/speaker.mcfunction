@@ -0,0 +1,3 @@
+playsound block.note_block.basedrum record @a[distance=..11.25] ^0.0 ^ ^ 1.000 1.00000 0.000
+playsound block.note_block.pling record @a[distance=..11.03] ^-1.0 ^ ^ 0.300 0.55639 0.000
+playsound block.note_block.pling record @a[distance=..10.57] ^-1.0 ^ ^ 0.300 0.66166 0.000
@@ -0,0 +1,4 @@
+playsound block.note_block.basedrum record @s[] ^-0.05 ^ ^ 1.000 1.58740 0.000
+playsound block.note_block.pling record @s[] ^-0.5 ^ ^ 0.200 0.55478 0.000
+playsound block.note_block.pling record @s[] ^-0.5 ^ ^ 0.200 0.65975 0.000
+particle note ~ ~2.25 ~ 0 0 0 1 1
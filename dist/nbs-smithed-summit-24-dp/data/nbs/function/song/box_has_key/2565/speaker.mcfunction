@@ -0,0 +1,3 @@
+playsound block.note_block.hat record @a[distance=..10.35] ^0.0 ^ ^ 1.000 0.70711 0.000
+playsound block.note_block.pling record @a[distance=..11.04] ^-1.0 ^ ^ 0.050 0.55478 0.000
+playsound block.note_block.pling record @a[distance=..10.58] ^-1.0 ^ ^ 0.050 0.65975 0.000
@@ -0,0 +1,3 @@
+playsound block.note_block.hat record @s[] ^-0.0 ^ ^ 1.000 0.70711 0.000
+playsound block.note_block.pling_-1 record @s[] ^0.5 ^ ^ 0.500 1.58740 0.000
+playsound block.note_block.pling record @s[] ^0.5 ^ ^ 0.500 1.00000 0.000
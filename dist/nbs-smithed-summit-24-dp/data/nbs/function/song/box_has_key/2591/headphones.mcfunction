@@ -0,0 +1,5 @@
+playsound block.note_block.basedrum record @s[] ^-0.05 ^ ^ 1.000 1.00000 0.000
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 1.000 1.78180 0.000
+playsound block.note_block.pling_-1 record @s[] ^-0.5 ^ ^ 0.400 1.58740 0.000
+playsound block.note_block.pling record @s[] ^-0.5 ^ ^ 0.400 1.00000 0.000
+particle note ~ ~2.25 ~ 0 0 0 1 1
@@ -0,0 +1,4 @@
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 1.000 1.18921 0.000
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 1.000 0.89090 0.000
+playsound block.note_block.pling_-1 record @s[] ^0.5 ^ ^ 0.300 1.58740 0.000
+playsound block.note_block.pling record @s[] ^0.5 ^ ^ 0.300 1.00000 0.000
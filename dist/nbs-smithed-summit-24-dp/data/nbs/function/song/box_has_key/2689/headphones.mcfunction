@@ -0,0 +1 @@
+playsound block.note_block.hat record @s[] ^-0.0 ^ ^ 0.690 0.70711 0.000
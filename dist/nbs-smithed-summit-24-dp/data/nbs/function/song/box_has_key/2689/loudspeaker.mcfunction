@@ -0,0 +1 @@
+playsound block.note_block.hat record @a[distance=..48.00] ^0.0 ^ ^ 1.781 0.70711 0.000
@@ -0,0 +1 @@
+playsound block.note_block.basedrum record @s[] ^-0.05 ^ ^ 0.630 1.58740 0.000
@@ -0,0 +1 @@
+playsound block.note_block.basedrum record @a[distance=..48.00] ^0.0 ^ ^ 1.609 1.58740 0.000
@@ -0,0 +1,2 @@
+playsound block.note_block.basedrum record @s[] ^-0.05 ^ ^ 0.560 1.33484 0.000
+playsound block.note_block.hat record @s[] ^-0.0 ^ ^ 0.560 0.70711 0.000
@@ -0,0 +1,2 @@
+playsound block.note_block.basedrum record @a[distance=..48.00] ^0.0 ^ ^ 1.453 1.33484 0.000
+playsound block.note_block.hat record @a[distance=..48.00] ^0.0 ^ ^ 1.445 0.70711 0.000
@@ -0,0 +1,2 @@
+playsound block.note_block.basedrum record @a[distance=..10.54] ^0.0 ^ ^ 0.560 1.33484 0.000
+playsound block.note_block.hat record @a[distance=..10.35] ^0.0 ^ ^ 0.560 0.70711 0.000
@@ -0,0 +1 @@
+playsound block.note_block.hat record @a[distance=..10.35] ^0.0 ^ ^ 0.430 0.70711 0.000
@@ -0,0 +1 @@
+playsound block.note_block.basedrum record @a[distance=..9.94] ^0.0 ^ ^ 0.360 1.58740 0.000
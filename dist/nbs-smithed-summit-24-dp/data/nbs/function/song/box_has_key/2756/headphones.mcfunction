@@ -0,0 +1,3 @@
+playsound block.note_block.basedrum record @s[] ^-0.05 ^ ^ 0.290 1.58740 0.000
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 0.290 1.78180 0.000
+particle note ~ ~2.25 ~ 0 0 0 1 1
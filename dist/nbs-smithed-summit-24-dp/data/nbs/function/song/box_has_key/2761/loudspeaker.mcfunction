@@ -0,0 +1,2 @@
+playsound block.note_block.snare record @a[distance=..48.00] ^0.0 ^ ^ 0.597 1.18921 0.000
+playsound block.note_block.snare record @a[distance=..48.00] ^0.0 ^ ^ 0.615 0.89090 0.000
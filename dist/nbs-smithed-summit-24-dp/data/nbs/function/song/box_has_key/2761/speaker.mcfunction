@@ -0,0 +1,2 @@
+playsound block.note_block.snare record @a[distance=..6.48] ^0.0 ^ ^ 0.260 1.18921 0.000
+playsound block.note_block.snare record @a[distance=..6.99] ^0.0 ^ ^ 0.260 0.89090 0.000
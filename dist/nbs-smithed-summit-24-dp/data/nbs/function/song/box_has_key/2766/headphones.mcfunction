@@ -0,0 +1,2 @@
+playsound block.note_block.basedrum record @s[] ^-0.05 ^ ^ 0.230 2.00000 0.000
+particle note ~ ~2.25 ~ 0 0 0 1 1
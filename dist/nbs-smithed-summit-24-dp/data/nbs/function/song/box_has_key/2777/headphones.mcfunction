@@ -0,0 +1,2 @@
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 0.160 1.78180 0.000
+particle note ~ ~2.25 ~ 0 0 0 1 1
@@ -0,0 +1,4 @@
+playsound block.note_block.hat record @s[] ^-0.0 ^ ^ 0.090 0.70711 0.000
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 0.090 1.18921 0.000
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 0.090 0.89090 0.000
+particle note ~ ~2.25 ~ 0 0 0 1 1
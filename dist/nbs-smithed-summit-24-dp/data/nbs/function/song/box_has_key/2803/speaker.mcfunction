@@ -0,0 +1,3 @@
+playsound block.note_block.basedrum record @a[distance=..9.94] ^0.0 ^ ^ 0.010 1.58740 0.000
+playsound block.note_block.snare record @a[distance=..6.48] ^0.0 ^ ^ 0.010 1.18921 0.000
+playsound block.note_block.snare record @a[distance=..6.99] ^0.0 ^ ^ 0.010 0.89090 0.000
@@ -0,0 +1,2 @@
+playsound block.note_block.harp_-1 record @a[distance=..11.94] ^1.0 ^ ^ 0.600 0.79370 0.000
+playsound block.note_block.harp_-1 record @a[distance=..11.58] ^0.0 ^ ^ 0.600 1.58740 0.000
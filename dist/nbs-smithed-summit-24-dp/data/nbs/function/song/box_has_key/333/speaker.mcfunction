@@ -0,0 +1,2 @@
+playsound block.note_block.harp_-1 record @a[distance=..11.64] ^1.0 ^ ^ 0.600 1.49831 0.000
+playsound block.note_block.harp record @a[distance=..10.15] ^0.0 ^ ^ 0.600 0.74915 0.000
@@ -0,0 +1,4 @@
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 1.000 1.78180 0.000
+playsound block.note_block.harp_-1 record @s[] ^-0.0 ^ ^ 1.000 1.12246 0.000
+playsound block.note_block.harp record @s[] ^-0.0 ^ ^ 1.000 0.56123 0.000
+particle note ~ ~2.25 ~ 0 0 0 1 1
@@ -0,0 +1,3 @@
+playsound block.note_block.basedrum record @s[] ^-0.05 ^ ^ 1.000 1.58740 0.000
+playsound block.note_block.harp_-1 record @s[] ^0.5 ^ ^ 0.500 1.12246 0.000
+playsound block.note_block.harp record @s[] ^-0.0 ^ ^ 0.500 0.56123 0.000
@@ -0,0 +1,4 @@
+playsound block.note_block.basedrum record @a[distance=..10.54] ^0.0 ^ ^ 1.000 1.33484 0.000
+playsound block.note_block.hat record @a[distance=..10.35] ^0.0 ^ ^ 1.000 0.70711 0.000
+playsound block.note_block.harp_-1 record @a[distance=..11.64] ^-1.0 ^ ^ 0.500 1.49831 0.000
+playsound block.note_block.harp record @a[distance=..10.15] ^0.0 ^ ^ 0.500 0.74915 0.000
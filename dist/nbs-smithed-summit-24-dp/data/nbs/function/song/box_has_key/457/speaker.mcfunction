@@ -0,0 +1,2 @@
+playsound block.note_block.harp_-1 record @a[distance=..11.88] ^1.0 ^ ^ 0.600 1.00000 0.000
+playsound block.note_block.harp record @a[distance=..11.25] ^0.0 ^ ^ 0.600 0.50000 0.000
@@ -0,0 +1,4 @@
+playsound block.note_block.harp_-1 record @a[distance=..11.95] ^1.0 ^ ^ 0.600 0.74915 0.000
+playsound block.note_block.harp_-1 record @a[distance=..11.64] ^0.0 ^ ^ 0.600 1.49831 0.000
+playsound block.note_block.bass_-1 record @a[distance=..11.99] ^0.0 ^ ^ 0.250 1.78180 0.000
+playsound block.note_block.bass_-1 record @a[distance=..11.99] ^0.0 ^ ^ 0.155 1.78180 0.000
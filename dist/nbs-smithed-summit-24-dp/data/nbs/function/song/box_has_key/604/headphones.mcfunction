@@ -0,0 +1,7 @@
+playsound block.note_block.hat record @s[] ^-0.0 ^ ^ 1.000 0.70711 0.000
+playsound block.note_block.harp_-1 record @s[] ^0.5 ^ ^ 0.500 1.78180 0.000
+playsound block.note_block.harp record @s[] ^-0.0 ^ ^ 0.500 0.89090 0.000
+playsound block.note_block.bass_-1 record @s[] ^-0.05 ^ ^ 0.680 1.78180 0.000
+playsound block.note_block.bass_-1 record @s[] ^-0.0 ^ ^ 0.355 1.78180 0.000
+playsound block.note_block.pling record @s[] ^0.5 ^ ^ 0.050 0.79370 0.000
+playsound block.note_block.pling record @s[] ^0.5 ^ ^ 0.050 1.18921 0.000
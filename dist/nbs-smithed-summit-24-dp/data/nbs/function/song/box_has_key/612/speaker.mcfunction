@@ -0,0 +1,4 @@
+playsound block.note_block.harp_-1 record @a[distance=..11.94] ^1.0 ^ ^ 0.600 0.79370 0.000
+playsound block.note_block.harp_-1 record @a[distance=..11.58] ^0.0 ^ ^ 0.600 1.58740 0.000
+playsound block.note_block.bass_-1 record @a[distance=..11.99] ^0.0 ^ ^ 0.870 1.78180 0.000
+playsound block.note_block.bass_-1 record @a[distance=..11.99] ^0.0 ^ ^ 0.450 1.78180 0.000
@@ -0,0 +1,2 @@
+playsound block.note_block.hat record @s[] ^-0.0 ^ ^ 1.000 0.70711 0.000
+particle note ~ ~2.25 ~ 0 0 0 1 1
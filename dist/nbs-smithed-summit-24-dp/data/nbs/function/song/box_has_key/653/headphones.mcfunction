@@ -0,0 +1,5 @@
+playsound block.note_block.hat record @s[] ^-0.0 ^ ^ 1.000 0.70711 0.000
+playsound block.note_block.harp_-1 record @s[] ^-0.5 ^ ^ 0.600 1.58740 0.000
+playsound block.note_block.harp record @s[] ^-0.0 ^ ^ 0.600 0.79370 0.000
+playsound block.note_block.bass_-1 record @s[] ^-0.05 ^ ^ 0.180 1.78180 0.000
+playsound block.note_block.bass_-1 record @s[] ^-0.0 ^ ^ 0.075 1.78180 0.000
@@ -0,0 +1,2 @@
+playsound block.note_block.bass_-1 record @s[] ^-0.05 ^ ^ 0.250 1.78180 0.000
+playsound block.note_block.bass_-1 record @s[] ^-0.0 ^ ^ 0.140 1.78180 0.000
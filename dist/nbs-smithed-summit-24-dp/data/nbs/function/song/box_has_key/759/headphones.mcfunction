@@ -0,0 +1,7 @@
+playsound block.note_block.basedrum record @s[] ^-0.05 ^ ^ 1.000 1.58740 0.000
+playsound block.note_block.harp_-1 record @s[] ^0.5 ^ ^ 0.500 1.00000 0.000
+playsound block.note_block.harp record @s[] ^-0.0 ^ ^ 0.500 0.50000 0.000
+playsound block.note_block.bass_-1 record @s[] ^-0.05 ^ ^ 0.430 1.78180 0.000
+playsound block.note_block.bass_-1 record @s[] ^-0.0 ^ ^ 0.230 1.78180 0.000
+playsound block.note_block.pling record @s[] ^0.5 ^ ^ 0.300 1.00000 0.000
+playsound block.note_block.pling record @s[] ^0.5 ^ ^ 0.300 1.33484 0.000
@@ -0,0 +1,7 @@
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.396 0.50000 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.594 0.62996 0.000
+playsound block.note_block.bit_1 record @s[] ^0.9 ^ ^ 0.665 1.00000 0.000
+playsound block.note_block.bit_1 record @s[] ^0.85 ^ ^ 0.372 1.24186 0.000
+playsound block.note_block.bit_1 record @s[] ^0.95 ^ ^ 0.480 0.74915 0.000
+playsound block.note_block.bit_1 record @s[] ^0.9 ^ ^ 0.380 0.98566 0.000
+playsound block.note_block.chime_1 record @s[] ^-0.0 ^ ^ 0.010 0.56123 0.000
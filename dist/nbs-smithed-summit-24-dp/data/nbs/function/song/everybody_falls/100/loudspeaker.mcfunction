@@ -0,0 +1,7 @@
+playsound block.note_block.pling record @a[distance=..48.00] ^0.0 ^ ^ 1.054 0.50000 0.000
+playsound block.note_block.pling record @a[distance=..48.00] ^0.0 ^ ^ 1.549 0.62996 0.000
+playsound block.note_block.bit_1 record @a[distance=..48.00] ^-4.0 ^ ^ 1.447 1.00000 0.000
+playsound block.note_block.bit_1 record @a[distance=..48.00] ^-4.0 ^ ^ 0.791 1.24186 0.000
+playsound block.note_block.bit_1 record @a[distance=..48.00] ^-4.0 ^ ^ 1.077 0.74915 0.000
+playsound block.note_block.bit_1 record @a[distance=..48.00] ^-4.0 ^ ^ 0.828 0.98566 0.000
+playsound block.note_block.chime_1 record @a[distance=..48.00] ^0.0 ^ ^ 0.020 0.56123 0.000
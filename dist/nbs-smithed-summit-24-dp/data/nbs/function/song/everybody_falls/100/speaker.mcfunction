@@ -0,0 +1,7 @@
+playsound block.note_block.pling record @a[distance=..11.25] ^0.0 ^ ^ 0.396 0.50000 0.000
+playsound block.note_block.pling record @a[distance=..10.71] ^0.0 ^ ^ 0.594 0.62996 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.12] ^-2.0 ^ ^ 0.665 1.00000 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.07] ^-2.0 ^ ^ 0.372 1.24186 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.26] ^-2.0 ^ ^ 0.480 0.74915 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.12] ^-2.0 ^ ^ 0.380 0.98566 0.000
+playsound block.note_block.chime_1 record @a[distance=..6.01] ^0.0 ^ ^ 0.010 0.56123 0.000
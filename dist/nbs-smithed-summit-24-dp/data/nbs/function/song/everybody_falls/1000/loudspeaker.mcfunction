@@ -0,0 +1,18 @@
+playsound block.note_block.pling_-1 record @a[distance=..48.00] ^0.0 ^ ^ 2.420 1.78180 0.000
+playsound block.note_block.pling_-1 record @a[distance=..48.00] ^0.0 ^ ^ 2.195 1.41421 0.000
+playsound block.note_block.pling record @a[distance=..48.00] ^0.0 ^ ^ 0.316 0.89090 0.000
+playsound block.note_block.pling record @a[distance=..48.00] ^0.0 ^ ^ 0.323 0.70711 0.000
+playsound block.note_block.basedrum record @a[distance=..48.00] ^0.0 ^ ^ 2.824 0.50000 0.000
+playsound block.note_block.basedrum record @a[distance=..48.00] ^0.0 ^ ^ 1.810 1.00000 0.000
+playsound block.note_block.basedrum_1 record @a[distance=..48.00] ^0.0 ^ ^ 1.599 0.94387 0.000
+playsound block.note_block.basedrum_1 record @a[distance=..48.00] ^0.0 ^ ^ 1.599 0.94387 0.000
+playsound block.note_block.snare record @a[distance=..48.00] ^0.0 ^ ^ 0.919 1.18921 0.000
+playsound block.note_block.bit_1 record @a[distance=..48.00] ^2.0 ^ ^ 0.930 1.33484 0.000
+playsound block.note_block.bit_1 record @a[distance=..48.00] ^2.0 ^ ^ 0.551 1.10637 0.000
+playsound block.note_block.bit_1 record @a[distance=..48.00] ^3.0 ^ ^ 0.633 1.78180 0.000
+playsound block.note_block.bit_1 record @a[distance=..48.00] ^2.0 ^ ^ 0.532 1.31570 0.000
+execute store result score #random nbs run random value 1..4
+execute if score #random nbs matches 1 if entity @a[distance=0..48] run function animated_java:music_speaker/animations/animation_speaker_beat_1/play
+execute if score #random nbs matches 2 if entity @a[distance=0..48] run function animated_java:music_speaker/animations/animation_speaker_beat_2/play
+execute if score #random nbs matches 3 if entity @a[distance=0..48] run function animated_java:music_speaker/animations/animation_speaker_beat_3/play
+execute if score #random nbs matches 4 if entity @a[distance=0..48] run function animated_java:music_speaker/animations/animation_speaker_beat_4/play
@@ -0,0 +1,11 @@
+playsound block.note_block.pling_-1 record @a[distance=..48.00] ^0.0 ^ ^ 2.420 1.78180 0.000
+playsound block.note_block.pling_-1 record @a[distance=..48.00] ^0.0 ^ ^ 2.195 1.41421 0.000
+playsound block.note_block.pling record @a[distance=..48.00] ^0.0 ^ ^ 0.316 0.89090 0.000
+playsound block.note_block.pling record @a[distance=..48.00] ^0.0 ^ ^ 0.323 0.70711 0.000
+playsound random_click_stereo record @a[distance=..48.00] ^0.0 ^ ^ 1.145 1.78180 0.000
+playsound block.note_block.snare record @a[distance=..48.00] ^0.0 ^ ^ 1.662 1.68179 0.000
+playsound block.note_block.snare record @a[distance=..48.00] ^0.0 ^ ^ 0.870 2.00000 0.000
+playsound block.note_block.bit_1 record @a[distance=..48.00] ^3.0 ^ ^ 0.900 1.33484 0.000
+playsound block.note_block.bit_1 record @a[distance=..48.00] ^3.0 ^ ^ 0.507 1.75625 0.000
+playsound block.note_block.bit_1 record @a[distance=..48.00] ^3.0 ^ ^ 0.645 1.12246 0.000
+playsound block.note_block.bit_1 record @a[distance=..48.00] ^3.0 ^ ^ 0.515 1.31570 0.000
@@ -0,0 +1,5 @@
+playsound block.note_block.snare record @a[distance=..48.00] ^0.0 ^ ^ 0.886 1.68179 0.000
+playsound block.note_block.bit_1 record @a[distance=..48.00] ^3.0 ^ ^ 0.910 0.89090 0.000
+playsound block.note_block.bit_1 record @a[distance=..48.00] ^3.0 ^ ^ 0.516 1.10637 0.000
+playsound block.note_block.bit_1 record @a[distance=..48.00] ^3.0 ^ ^ 0.658 0.66742 0.000
+playsound block.note_block.bit_1 record @a[distance=..48.00] ^3.0 ^ ^ 0.521 0.87813 0.000
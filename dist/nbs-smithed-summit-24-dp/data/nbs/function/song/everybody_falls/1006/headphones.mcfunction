@@ -0,0 +1,12 @@
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.900 0.66742 0.000
+playsound block.note_block.pling_-1 record @s[] ^-0.0 ^ ^ 0.800 1.58740 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.125 1.33484 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.125 0.79370 0.000
+playsound block.note_block.basedrum record @s[] ^-0.0 ^ ^ 1.000 0.50000 0.000
+playsound block.note_block.basedrum record @s[] ^-0.0 ^ ^ 0.680 1.00000 0.000
+playsound dig_gravel1 record @s[] ^-0.25 ^ ^ 0.700 1.58740 0.000
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 0.400 1.41421 0.000
+playsound block.note_block.bit_1 record @s[] ^-1.0 ^ ^ 0.399 0.56123 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.95 ^ ^ 0.232 0.65785 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.95 ^ ^ 0.280 0.66742 0.000
+playsound block.note_block.bit_1 record @s[] ^-1.0 ^ ^ 0.228 0.55318 0.000
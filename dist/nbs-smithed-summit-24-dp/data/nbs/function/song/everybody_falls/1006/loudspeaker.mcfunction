@@ -0,0 +1,12 @@
+playsound block.note_block.pling record @a[distance=..48.00] ^0.0 ^ ^ 2.335 0.66742 0.000
+playsound block.note_block.pling_-1 record @a[distance=..48.00] ^0.0 ^ ^ 2.173 1.58740 0.000
+playsound block.note_block.pling record @a[distance=..48.00] ^0.0 ^ ^ 0.304 1.33484 0.000
+playsound block.note_block.pling record @a[distance=..48.00] ^0.0 ^ ^ 0.319 0.79370 0.000
+playsound block.note_block.basedrum record @a[distance=..48.00] ^0.0 ^ ^ 2.824 0.50000 0.000
+playsound block.note_block.basedrum record @a[distance=..48.00] ^0.0 ^ ^ 1.810 1.00000 0.000
+playsound dig_gravel1 record @a[distance=..48.00] ^1.0 ^ ^ 1.561 1.58740 0.000
+playsound block.note_block.snare record @a[distance=..48.00] ^0.0 ^ ^ 0.903 1.41421 0.000
+playsound block.note_block.bit_1 record @a[distance=..48.00] ^4.0 ^ ^ 0.922 0.56123 0.000
+playsound block.note_block.bit_1 record @a[distance=..48.00] ^3.0 ^ ^ 0.527 0.65785 0.000
+playsound block.note_block.bit_1 record @a[distance=..48.00] ^3.0 ^ ^ 0.636 0.66742 0.000
+playsound block.note_block.bit_1 record @a[distance=..48.00] ^4.0 ^ ^ 0.528 0.55318 0.000
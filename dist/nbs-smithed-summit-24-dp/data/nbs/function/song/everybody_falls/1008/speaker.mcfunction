@@ -0,0 +1,14 @@
+playsound block.note_block.pling record @a[distance=..10.54] ^0.0 ^ ^ 0.900 0.66742 0.000
+playsound block.note_block.pling_-1 record @a[distance=..11.58] ^0.0 ^ ^ 0.800 1.58740 0.000
+playsound block.note_block.pling record @a[distance=..7.85] ^0.0 ^ ^ 0.125 1.33484 0.000
+playsound block.note_block.pling record @a[distance=..9.94] ^0.0 ^ ^ 0.125 0.79370 0.000
+playsound block.note_block.snare record @a[distance=..6.48] ^0.0 ^ ^ 0.400 1.18921 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.16] ^1.0 ^ ^ 0.385 0.89090 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.37] ^1.0 ^ ^ 0.224 0.65785 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.09] ^1.0 ^ ^ 0.270 1.12246 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.17] ^1.0 ^ ^ 0.220 0.87813 0.000
+execute store result score #random nbs run random value 1..4
+execute if score #random nbs matches 1 if entity @a[distance=0..12] run function animated_java:music_speaker/animations/animation_speaker_beat_1/play
+execute if score #random nbs matches 2 if entity @a[distance=0..12] run function animated_java:music_speaker/animations/animation_speaker_beat_2/play
+execute if score #random nbs matches 3 if entity @a[distance=0..12] run function animated_java:music_speaker/animations/animation_speaker_beat_3/play
+execute if score #random nbs matches 4 if entity @a[distance=0..12] run function animated_java:music_speaker/animations/animation_speaker_beat_4/play
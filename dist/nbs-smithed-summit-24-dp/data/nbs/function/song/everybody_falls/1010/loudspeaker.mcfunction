@@ -0,0 +1,8 @@
+playsound entity_witch_hurt1 record @a[distance=..48.00] ^0.0 ^ ^ 0.979 2.00000 0.000
+playsound block.note_block.snare record @a[distance=..48.00] ^0.0 ^ ^ 2.000 0.50000 0.000
+playsound block.note_block.snare record @a[distance=..48.00] ^0.0 ^ ^ 1.870 1.00000 0.000
+playsound block.note_block.snare record @a[distance=..48.00] ^0.0 ^ ^ 0.870 2.00000 0.000
+playsound block.note_block.bit_1 record @a[distance=..48.00] ^3.0 ^ ^ 0.782 1.33484 0.000
+playsound block.note_block.bit_1 record @a[distance=..48.00] ^3.0 ^ ^ 0.465 1.10637 0.000
+playsound block.note_block.bit_1 record @a[distance=..48.00] ^3.0 ^ ^ 0.531 1.78180 0.000
+playsound block.note_block.bit_1 record @a[distance=..48.00] ^3.0 ^ ^ 0.448 1.31570 0.000
@@ -0,0 +1,8 @@
+playsound entity_witch_hurt1 record @a[distance=..6.12] ^0.0 ^ ^ 0.450 2.00000 0.000
+playsound block.note_block.snare record @a[distance=..9.00] ^0.0 ^ ^ 0.800 0.50000 0.000
+playsound block.note_block.snare record @a[distance=..6.75] ^0.0 ^ ^ 0.800 1.00000 0.000
+playsound block.note_block.snare record @a[distance=..6.12] ^0.0 ^ ^ 0.400 2.00000 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.05] ^1.0 ^ ^ 0.371 1.33484 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.09] ^1.0 ^ ^ 0.216 1.10637 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.02] ^1.0 ^ ^ 0.260 1.78180 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.06] ^1.0 ^ ^ 0.212 1.31570 0.000
@@ -0,0 +1,10 @@
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.900 0.66742 0.000
+playsound block.note_block.pling_-1 record @s[] ^-0.0 ^ ^ 0.800 1.58740 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.125 1.33484 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.125 0.79370 0.000
+playsound block.note_block.basedrum record @s[] ^-0.0 ^ ^ 0.750 1.41421 0.000
+playsound block.note_block.basedrum record @s[] ^-0.0 ^ ^ 0.750 1.18921 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.7 ^ ^ 0.357 1.33484 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.75 ^ ^ 0.208 1.75625 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.65 ^ ^ 0.250 1.12246 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.7 ^ ^ 0.204 1.31570 0.000
@@ -0,0 +1,10 @@
+playsound block.note_block.pling record @a[distance=..48.00] ^0.0 ^ ^ 2.335 0.66742 0.000
+playsound block.note_block.pling_-1 record @a[distance=..48.00] ^0.0 ^ ^ 2.173 1.58740 0.000
+playsound block.note_block.pling record @a[distance=..48.00] ^0.0 ^ ^ 0.304 1.33484 0.000
+playsound block.note_block.pling record @a[distance=..48.00] ^0.0 ^ ^ 0.319 0.79370 0.000
+playsound block.note_block.basedrum record @a[distance=..48.00] ^0.0 ^ ^ 1.936 1.41421 0.000
+playsound block.note_block.basedrum record @a[distance=..48.00] ^0.0 ^ ^ 1.966 1.18921 0.000
+playsound block.note_block.bit_1 record @a[distance=..48.00] ^2.0 ^ ^ 0.753 1.33484 0.000
+playsound block.note_block.bit_1 record @a[distance=..48.00] ^3.0 ^ ^ 0.425 1.75625 0.000
+playsound block.note_block.bit_1 record @a[distance=..48.00] ^2.0 ^ ^ 0.537 1.12246 0.000
+playsound block.note_block.bit_1 record @a[distance=..48.00] ^2.0 ^ ^ 0.431 1.31570 0.000
@@ -0,0 +1,10 @@
+playsound block.note_block.pling record @a[distance=..10.54] ^0.0 ^ ^ 0.900 0.66742 0.000
+playsound block.note_block.pling_-1 record @a[distance=..11.58] ^0.0 ^ ^ 0.800 1.58740 0.000
+playsound block.note_block.pling record @a[distance=..7.85] ^0.0 ^ ^ 0.125 1.33484 0.000
+playsound block.note_block.pling record @a[distance=..9.94] ^0.0 ^ ^ 0.125 0.79370 0.000
+playsound block.note_block.basedrum record @a[distance=..10.35] ^0.0 ^ ^ 0.750 1.41421 0.000
+playsound block.note_block.basedrum record @a[distance=..10.87] ^0.0 ^ ^ 0.750 1.18921 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.05] ^1.0 ^ ^ 0.357 1.33484 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.03] ^1.0 ^ ^ 0.208 1.75625 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.09] ^1.0 ^ ^ 0.250 1.12246 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.06] ^1.0 ^ ^ 0.204 1.31570 0.000
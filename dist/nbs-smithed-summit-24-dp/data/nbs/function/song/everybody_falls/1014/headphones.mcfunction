@@ -0,0 +1,12 @@
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.900 0.66742 0.000
+playsound block.note_block.pling_-1 record @s[] ^-0.0 ^ ^ 0.800 1.58740 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.125 1.33484 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.125 0.79370 0.000
+playsound block.note_block.basedrum record @s[] ^0.8 ^ ^ 0.150 1.41421 0.000
+playsound block.note_block.basedrum record @s[] ^0.8 ^ ^ 0.150 1.18921 0.000
+playsound dig_gravel1 record @s[] ^-0.25 ^ ^ 0.700 1.58740 0.000
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 0.400 1.68179 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.6 ^ ^ 0.350 0.89090 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.65 ^ ^ 0.200 1.10637 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.55 ^ ^ 0.245 0.66742 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.6 ^ ^ 0.200 0.87813 0.000
@@ -0,0 +1,5 @@
+playsound block.note_block.bit_1 record @s[] ^-0.5 ^ ^ 0.336 0.56123 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.55 ^ ^ 0.196 0.65785 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.45 ^ ^ 0.235 0.66742 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.5 ^ ^ 0.192 0.55318 0.000
+particle note ~ ~2.25 ~ 0 0 0 1 1
@@ -0,0 +1,9 @@
+playsound block.note_block.bit_1 record @a[distance=..6.56] ^1.0 ^ ^ 0.336 0.56123 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.37] ^1.0 ^ ^ 0.196 0.65785 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.36] ^0.0 ^ ^ 0.235 0.66742 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.58] ^1.0 ^ ^ 0.192 0.55318 0.000
+execute store result score #random nbs run random value 1..4
+execute if score #random nbs matches 1 if entity @a[distance=0..12] run function animated_java:music_speaker/animations/animation_speaker_beat_1/play
+execute if score #random nbs matches 2 if entity @a[distance=0..12] run function animated_java:music_speaker/animations/animation_speaker_beat_2/play
+execute if score #random nbs matches 3 if entity @a[distance=0..12] run function animated_java:music_speaker/animations/animation_speaker_beat_3/play
+execute if score #random nbs matches 4 if entity @a[distance=0..12] run function animated_java:music_speaker/animations/animation_speaker_beat_4/play
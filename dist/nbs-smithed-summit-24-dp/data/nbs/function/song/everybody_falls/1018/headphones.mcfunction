@@ -0,0 +1,11 @@
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.900 0.52973 0.000
+playsound block.note_block.pling_-1 record @s[] ^-0.0 ^ ^ 0.800 1.58740 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.125 1.05946 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.125 0.79370 0.000
+playsound block.note_block.basedrum record @s[] ^-0.0 ^ ^ 1.000 0.50000 0.000
+playsound block.note_block.basedrum record @s[] ^-0.0 ^ ^ 0.680 1.00000 0.000
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 0.400 1.41421 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.4 ^ ^ 0.322 0.89090 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.45 ^ ^ 0.188 0.65785 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.35 ^ ^ 0.225 1.12246 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.4 ^ ^ 0.184 0.87813 0.000
@@ -0,0 +1,11 @@
+playsound block.note_block.pling record @a[distance=..48.00] ^0.0 ^ ^ 2.384 0.52973 0.000
+playsound block.note_block.pling_-1 record @a[distance=..48.00] ^0.0 ^ ^ 2.173 1.58740 0.000
+playsound block.note_block.pling record @a[distance=..48.00] ^0.0 ^ ^ 0.311 1.05946 0.000
+playsound block.note_block.pling record @a[distance=..48.00] ^0.0 ^ ^ 0.319 0.79370 0.000
+playsound block.note_block.basedrum record @a[distance=..48.00] ^0.0 ^ ^ 2.824 0.50000 0.000
+playsound block.note_block.basedrum record @a[distance=..48.00] ^0.0 ^ ^ 1.810 1.00000 0.000
+playsound block.note_block.snare record @a[distance=..48.00] ^0.0 ^ ^ 0.903 1.41421 0.000
+playsound block.note_block.bit_1 record @a[distance=..48.00] ^1.0 ^ ^ 0.709 0.89090 0.000
+playsound block.note_block.bit_1 record @a[distance=..48.00] ^1.0 ^ ^ 0.427 0.65785 0.000
+playsound block.note_block.bit_1 record @a[distance=..48.00] ^1.0 ^ ^ 0.483 1.12246 0.000
+playsound block.note_block.bit_1 record @a[distance=..48.00] ^1.0 ^ ^ 0.406 0.87813 0.000
@@ -0,0 +1,11 @@
+playsound block.note_block.pling record @a[distance=..11.14] ^0.0 ^ ^ 0.900 0.52973 0.000
+playsound block.note_block.pling_-1 record @a[distance=..11.58] ^0.0 ^ ^ 0.800 1.58740 0.000
+playsound block.note_block.pling record @a[distance=..8.76] ^0.0 ^ ^ 0.125 1.05946 0.000
+playsound block.note_block.pling record @a[distance=..9.94] ^0.0 ^ ^ 0.125 0.79370 0.000
+playsound block.note_block.basedrum record @a[distance=..11.88] ^0.0 ^ ^ 1.000 0.50000 0.000
+playsound block.note_block.basedrum record @a[distance=..11.25] ^0.0 ^ ^ 0.680 1.00000 0.000
+playsound block.note_block.snare record @a[distance=..6.31] ^0.0 ^ ^ 0.400 1.41421 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.16] ^0.0 ^ ^ 0.322 0.89090 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.37] ^0.0 ^ ^ 0.188 0.65785 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.09] ^0.0 ^ ^ 0.225 1.12246 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.17] ^0.0 ^ ^ 0.184 0.87813 0.000
@@ -0,0 +1,5 @@
+playsound block.note_block.bit_1 record @s[] ^1.0 ^ ^ 0.686 0.62996 0.000
+playsound block.note_block.bit_1 record @s[] ^0.95 ^ ^ 0.384 0.73841 0.000
+playsound block.note_block.bit_1 record @s[] ^0.95 ^ ^ 0.500 0.74915 0.000
+playsound block.note_block.bit_1 record @s[] ^1.0 ^ ^ 0.392 0.62093 0.000
+playsound block.note_block.chime record @s[] ^-0.0 ^ ^ 0.010 1.33484 0.000
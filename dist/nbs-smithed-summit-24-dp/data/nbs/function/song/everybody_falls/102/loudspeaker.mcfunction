@@ -0,0 +1,5 @@
+playsound block.note_block.bit_1 record @a[distance=..48.00] ^-4.0 ^ ^ 1.567 0.62996 0.000
+playsound block.note_block.bit_1 record @a[distance=..48.00] ^-4.0 ^ ^ 0.863 0.73841 0.000
+playsound block.note_block.bit_1 record @a[distance=..48.00] ^-4.0 ^ ^ 1.122 0.74915 0.000
+playsound block.note_block.bit_1 record @a[distance=..48.00] ^-4.0 ^ ^ 0.897 0.62093 0.000
+playsound block.note_block.chime record @a[distance=..48.00] ^0.0 ^ ^ 0.021 1.33484 0.000
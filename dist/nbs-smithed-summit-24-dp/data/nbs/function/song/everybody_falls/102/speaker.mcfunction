@@ -0,0 +1,5 @@
+playsound block.note_block.bit_1 record @a[distance=..6.42] ^-2.0 ^ ^ 0.686 0.62996 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.27] ^-2.0 ^ ^ 0.384 0.73841 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.26] ^-2.0 ^ ^ 0.500 0.74915 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.43] ^-2.0 ^ ^ 0.392 0.62093 0.000
+playsound block.note_block.chime record @a[distance=..6.05] ^0.0 ^ ^ 0.010 1.33484 0.000
@@ -0,0 +1,8 @@
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.900 0.52973 0.000
+playsound block.note_block.pling_-1 record @s[] ^-0.0 ^ ^ 0.800 1.58740 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.125 1.05946 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.125 0.79370 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.3 ^ ^ 0.308 1.33484 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.35 ^ ^ 0.180 1.10637 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.25 ^ ^ 0.215 1.78180 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.3 ^ ^ 0.176 1.31570 0.000
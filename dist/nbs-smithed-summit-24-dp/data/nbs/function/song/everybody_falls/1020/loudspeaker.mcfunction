@@ -0,0 +1,8 @@
+playsound block.note_block.pling record @a[distance=..48.00] ^0.0 ^ ^ 2.384 0.52973 0.000
+playsound block.note_block.pling_-1 record @a[distance=..48.00] ^0.0 ^ ^ 2.173 1.58740 0.000
+playsound block.note_block.pling record @a[distance=..48.00] ^0.0 ^ ^ 0.311 1.05946 0.000
+playsound block.note_block.pling record @a[distance=..48.00] ^0.0 ^ ^ 0.319 0.79370 0.000
+playsound block.note_block.bit_1 record @a[distance=..48.00] ^1.0 ^ ^ 0.649 1.33484 0.000
+playsound block.note_block.bit_1 record @a[distance=..48.00] ^1.0 ^ ^ 0.387 1.10637 0.000
+playsound block.note_block.bit_1 record @a[distance=..48.00] ^1.0 ^ ^ 0.439 1.78180 0.000
+playsound block.note_block.bit_1 record @a[distance=..48.00] ^1.0 ^ ^ 0.372 1.31570 0.000
@@ -0,0 +1,11 @@
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.900 0.52973 0.000
+playsound block.note_block.pling_-1 record @s[] ^-0.0 ^ ^ 0.800 1.58740 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.125 1.05946 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.125 0.79370 0.000
+playsound block.note_block.basedrum record @s[] ^0.8 ^ ^ 0.150 1.41421 0.000
+playsound block.note_block.basedrum record @s[] ^0.8 ^ ^ 0.150 1.18921 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.1 ^ ^ 0.280 0.89090 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.15 ^ ^ 0.164 1.10637 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.05 ^ ^ 0.195 0.66742 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.1 ^ ^ 0.160 0.87813 0.000
+particle note ~ ~2.25 ~ 0 0 0 1 1
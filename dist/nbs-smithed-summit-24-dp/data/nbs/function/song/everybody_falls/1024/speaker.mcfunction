@@ -0,0 +1,15 @@
+playsound block.note_block.pling record @a[distance=..11.14] ^0.0 ^ ^ 0.900 0.52973 0.000
+playsound block.note_block.pling_-1 record @a[distance=..11.58] ^0.0 ^ ^ 0.800 1.58740 0.000
+playsound block.note_block.pling record @a[distance=..8.76] ^0.0 ^ ^ 0.125 1.05946 0.000
+playsound block.note_block.pling record @a[distance=..9.94] ^0.0 ^ ^ 0.125 0.79370 0.000
+playsound block.note_block.basedrum record @a[distance=..10.35] ^-2.0 ^ ^ 0.150 1.41421 0.000
+playsound block.note_block.basedrum record @a[distance=..10.87] ^-2.0 ^ ^ 0.150 1.18921 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.16] ^0.0 ^ ^ 0.280 0.89090 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.09] ^0.0 ^ ^ 0.164 1.10637 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.36] ^0.0 ^ ^ 0.195 0.66742 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.17] ^0.0 ^ ^ 0.160 0.87813 0.000
+execute store result score #random nbs run random value 1..4
+execute if score #random nbs matches 1 if entity @a[distance=0..12] run function animated_java:music_speaker/animations/animation_speaker_beat_1/play
+execute if score #random nbs matches 2 if entity @a[distance=0..12] run function animated_java:music_speaker/animations/animation_speaker_beat_2/play
+execute if score #random nbs matches 3 if entity @a[distance=0..12] run function animated_java:music_speaker/animations/animation_speaker_beat_3/play
+execute if score #random nbs matches 4 if entity @a[distance=0..12] run function animated_java:music_speaker/animations/animation_speaker_beat_4/play
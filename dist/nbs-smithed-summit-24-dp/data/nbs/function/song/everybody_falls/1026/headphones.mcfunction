@@ -0,0 +1,12 @@
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.900 0.52973 0.000
+playsound block.note_block.pling_-1 record @s[] ^-0.0 ^ ^ 0.800 1.58740 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.125 1.05946 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.125 0.79370 0.000
+playsound entity_witch_hurt1 record @s[] ^-0.0 ^ ^ 0.450 2.00000 0.000
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 0.800 0.50000 0.000
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 0.800 1.00000 0.000
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 0.400 2.00000 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.0 ^ ^ 0.266 0.56123 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.05 ^ ^ 0.156 0.65785 0.000
+playsound block.note_block.bit_1 record @s[] ^0.05 ^ ^ 0.185 0.66742 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.0 ^ ^ 0.152 0.55318 0.000
@@ -0,0 +1,12 @@
+playsound block.note_block.pling record @a[distance=..48.00] ^0.0 ^ ^ 2.384 0.52973 0.000
+playsound block.note_block.pling_-1 record @a[distance=..48.00] ^0.0 ^ ^ 2.173 1.58740 0.000
+playsound block.note_block.pling record @a[distance=..48.00] ^0.0 ^ ^ 0.311 1.05946 0.000
+playsound block.note_block.pling record @a[distance=..48.00] ^0.0 ^ ^ 0.319 0.79370 0.000
+playsound entity_witch_hurt1 record @a[distance=..48.00] ^0.0 ^ ^ 0.979 2.00000 0.000
+playsound block.note_block.snare record @a[distance=..48.00] ^0.0 ^ ^ 2.000 0.50000 0.000
+playsound block.note_block.snare record @a[distance=..48.00] ^0.0 ^ ^ 1.870 1.00000 0.000
+playsound block.note_block.snare record @a[distance=..48.00] ^0.0 ^ ^ 0.870 2.00000 0.000
+playsound block.note_block.bit_1 record @a[distance=..48.00] ^0.0 ^ ^ 0.615 0.56123 0.000
+playsound block.note_block.bit_1 record @a[distance=..48.00] ^0.0 ^ ^ 0.355 0.65785 0.000
+playsound block.note_block.bit_1 record @a[distance=..48.00] ^-1.0 ^ ^ 0.420 0.66742 0.000
+playsound block.note_block.bit_1 record @a[distance=..48.00] ^0.0 ^ ^ 0.352 0.55318 0.000
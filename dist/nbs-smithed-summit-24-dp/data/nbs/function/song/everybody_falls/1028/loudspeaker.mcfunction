@@ -0,0 +1,6 @@
+playsound block.note_block.basedrum record @a[distance=..48.00] ^0.0 ^ ^ 1.936 1.41421 0.000
+playsound block.note_block.basedrum record @a[distance=..48.00] ^0.0 ^ ^ 1.966 1.18921 0.000
+playsound block.note_block.bit_1 record @a[distance=..48.00] ^-1.0 ^ ^ 0.555 0.89090 0.000
+playsound block.note_block.bit_1 record @a[distance=..48.00] ^-1.0 ^ ^ 0.336 0.65785 0.000
+playsound block.note_block.bit_1 record @a[distance=..48.00] ^-1.0 ^ ^ 0.376 1.12246 0.000
+playsound block.note_block.bit_1 record @a[distance=..48.00] ^-1.0 ^ ^ 0.318 0.87813 0.000
@@ -0,0 +1,6 @@
+playsound block.note_block.basedrum record @a[distance=..10.35] ^0.0 ^ ^ 0.750 1.41421 0.000
+playsound block.note_block.basedrum record @a[distance=..10.87] ^0.0 ^ ^ 0.750 1.18921 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.16] ^-1.0 ^ ^ 0.252 0.89090 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.37] ^-1.0 ^ ^ 0.148 0.65785 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.09] ^-1.0 ^ ^ 0.175 1.12246 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.17] ^-1.0 ^ ^ 0.144 0.87813 0.000
@@ -0,0 +1,14 @@
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.900 0.52973 0.000
+playsound block.note_block.pling_-1 record @s[] ^-0.0 ^ ^ 0.800 1.58740 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.125 1.05946 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.125 0.79370 0.000
+playsound block.note_block.basedrum record @s[] ^0.8 ^ ^ 0.150 1.41421 0.000
+playsound block.note_block.basedrum record @s[] ^0.8 ^ ^ 0.150 1.18921 0.000
+playsound block.note_block.basedrum_1 record @s[] ^-0.0 ^ ^ 0.680 0.70711 0.000
+playsound block.note_block.basedrum_1 record @s[] ^-0.0 ^ ^ 0.680 0.70711 0.000
+playsound dig_gravel1 record @s[] ^-0.25 ^ ^ 0.700 1.58740 0.000
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 0.400 1.68179 0.000
+playsound block.note_block.bit_1 record @s[] ^0.2 ^ ^ 0.238 1.33484 0.000
+playsound block.note_block.bit_1 record @s[] ^0.15 ^ ^ 0.140 1.10637 0.000
+playsound block.note_block.bit_1 record @s[] ^0.25 ^ ^ 0.165 1.78180 0.000
+playsound block.note_block.bit_1 record @s[] ^0.2 ^ ^ 0.136 1.31570 0.000
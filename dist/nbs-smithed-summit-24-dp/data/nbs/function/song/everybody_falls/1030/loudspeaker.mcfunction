@@ -0,0 +1,14 @@
+playsound block.note_block.pling record @a[distance=..48.00] ^0.0 ^ ^ 2.384 0.52973 0.000
+playsound block.note_block.pling_-1 record @a[distance=..48.00] ^0.0 ^ ^ 2.173 1.58740 0.000
+playsound block.note_block.pling record @a[distance=..48.00] ^0.0 ^ ^ 0.311 1.05946 0.000
+playsound block.note_block.pling record @a[distance=..48.00] ^0.0 ^ ^ 0.319 0.79370 0.000
+playsound block.note_block.basedrum record @a[distance=..48.00] ^-4.0 ^ ^ 0.387 1.41421 0.000
+playsound block.note_block.basedrum record @a[distance=..48.00] ^-4.0 ^ ^ 0.393 1.18921 0.000
+playsound block.note_block.basedrum_1 record @a[distance=..48.00] ^0.0 ^ ^ 1.645 0.70711 0.000
+playsound block.note_block.basedrum_1 record @a[distance=..48.00] ^0.0 ^ ^ 1.645 0.70711 0.000
+playsound dig_gravel1 record @a[distance=..48.00] ^1.0 ^ ^ 1.561 1.58740 0.000
+playsound block.note_block.snare record @a[distance=..48.00] ^0.0 ^ ^ 0.886 1.68179 0.000
+playsound block.note_block.bit_1 record @a[distance=..48.00] ^-1.0 ^ ^ 0.502 1.33484 0.000
+playsound block.note_block.bit_1 record @a[distance=..48.00] ^-1.0 ^ ^ 0.301 1.10637 0.000
+playsound block.note_block.bit_1 record @a[distance=..48.00] ^-1.0 ^ ^ 0.337 1.78180 0.000
+playsound block.note_block.bit_1 record @a[distance=..48.00] ^-1.0 ^ ^ 0.287 1.31570 0.000
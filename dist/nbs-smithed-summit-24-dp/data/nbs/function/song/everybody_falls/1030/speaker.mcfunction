@@ -0,0 +1,14 @@
+playsound block.note_block.pling record @a[distance=..11.14] ^0.0 ^ ^ 0.900 0.52973 0.000
+playsound block.note_block.pling_-1 record @a[distance=..11.58] ^0.0 ^ ^ 0.800 1.58740 0.000
+playsound block.note_block.pling record @a[distance=..8.76] ^0.0 ^ ^ 0.125 1.05946 0.000
+playsound block.note_block.pling record @a[distance=..9.94] ^0.0 ^ ^ 0.125 0.79370 0.000
+playsound block.note_block.basedrum record @a[distance=..10.35] ^-2.0 ^ ^ 0.150 1.41421 0.000
+playsound block.note_block.basedrum record @a[distance=..10.87] ^-2.0 ^ ^ 0.150 1.18921 0.000
+playsound block.note_block.basedrum_1 record @a[distance=..7.65] ^0.0 ^ ^ 0.680 0.70711 0.000
+playsound block.note_block.basedrum_1 record @a[distance=..7.65] ^0.0 ^ ^ 0.680 0.70711 0.000
+playsound dig_gravel1 record @a[distance=..6.23] ^0.0 ^ ^ 0.700 1.58740 0.000
+playsound block.note_block.snare record @a[distance=..6.19] ^0.0 ^ ^ 0.400 1.68179 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.05] ^-1.0 ^ ^ 0.238 1.33484 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.09] ^-1.0 ^ ^ 0.140 1.10637 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.02] ^-1.0 ^ ^ 0.165 1.78180 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.06] ^-1.0 ^ ^ 0.136 1.31570 0.000
@@ -0,0 +1,14 @@
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.900 0.52973 0.000
+playsound block.note_block.pling_-1 record @s[] ^-0.0 ^ ^ 0.800 1.58740 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.125 1.05946 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.125 0.79370 0.000
+playsound block.note_block.basedrum record @s[] ^-0.0 ^ ^ 1.000 0.50000 0.000
+playsound block.note_block.basedrum record @s[] ^-0.0 ^ ^ 0.680 1.00000 0.000
+playsound block.note_block.basedrum_1 record @s[] ^-0.0 ^ ^ 0.680 0.94387 0.000
+playsound block.note_block.basedrum_1 record @s[] ^-0.0 ^ ^ 0.680 0.94387 0.000
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 0.400 1.18921 0.000
+playsound block.note_block.bit_1 record @s[] ^0.3 ^ ^ 0.224 1.33484 0.000
+playsound block.note_block.bit_1 record @s[] ^0.25 ^ ^ 0.132 1.75625 0.000
+playsound block.note_block.bit_1 record @s[] ^0.35 ^ ^ 0.155 1.12246 0.000
+playsound block.note_block.bit_1 record @s[] ^0.3 ^ ^ 0.128 1.31570 0.000
+particle note ~ ~2.25 ~ 0 0 0 1 1
@@ -0,0 +1,11 @@
+playsound block.note_block.pling record @a[distance=..48.00] ^0.0 ^ ^ 2.384 0.52973 0.000
+playsound block.note_block.pling_-1 record @a[distance=..48.00] ^0.0 ^ ^ 2.173 1.58740 0.000
+playsound block.note_block.pling record @a[distance=..48.00] ^0.0 ^ ^ 0.311 1.05946 0.000
+playsound block.note_block.pling record @a[distance=..48.00] ^0.0 ^ ^ 0.319 0.79370 0.000
+playsound random_click_stereo record @a[distance=..48.00] ^0.0 ^ ^ 1.145 1.78180 0.000
+playsound block.note_block.snare record @a[distance=..48.00] ^0.0 ^ ^ 1.662 1.68179 0.000
+playsound block.note_block.snare record @a[distance=..48.00] ^0.0 ^ ^ 0.870 2.00000 0.000
+playsound block.note_block.bit_1 record @a[distance=..48.00] ^-2.0 ^ ^ 0.463 0.89090 0.000
+playsound block.note_block.bit_1 record @a[distance=..48.00] ^-2.0 ^ ^ 0.267 1.10637 0.000
+playsound block.note_block.bit_1 record @a[distance=..48.00] ^-2.0 ^ ^ 0.329 0.66742 0.000
+playsound block.note_block.bit_1 record @a[distance=..48.00] ^-2.0 ^ ^ 0.265 0.87813 0.000
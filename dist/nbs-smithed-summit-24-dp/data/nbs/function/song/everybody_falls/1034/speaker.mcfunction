@@ -0,0 +1,11 @@
+playsound block.note_block.pling record @a[distance=..11.14] ^0.0 ^ ^ 0.900 0.52973 0.000
+playsound block.note_block.pling_-1 record @a[distance=..11.58] ^0.0 ^ ^ 0.800 1.58740 0.000
+playsound block.note_block.pling record @a[distance=..8.76] ^0.0 ^ ^ 0.125 1.05946 0.000
+playsound block.note_block.pling record @a[distance=..9.94] ^0.0 ^ ^ 0.125 0.79370 0.000
+playsound random_click_stereo record @a[distance=..6.16] ^0.0 ^ ^ 0.520 1.78180 0.000
+playsound block.note_block.snare record @a[distance=..6.19] ^0.0 ^ ^ 0.750 1.68179 0.000
+playsound block.note_block.snare record @a[distance=..6.12] ^0.0 ^ ^ 0.400 2.00000 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.16] ^-1.0 ^ ^ 0.210 0.89090 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.09] ^-1.0 ^ ^ 0.124 1.10637 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.36] ^-1.0 ^ ^ 0.145 0.66742 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.17] ^-1.0 ^ ^ 0.120 0.87813 0.000
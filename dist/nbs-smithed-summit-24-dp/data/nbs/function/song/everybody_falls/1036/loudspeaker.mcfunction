@@ -0,0 +1,5 @@
+playsound block.note_block.snare record @a[distance=..48.00] ^0.0 ^ ^ 0.886 1.68179 0.000
+playsound block.note_block.bit_1 record @a[distance=..48.00] ^-2.0 ^ ^ 0.453 0.56123 0.000
+playsound block.note_block.bit_1 record @a[distance=..48.00] ^-2.0 ^ ^ 0.264 0.65785 0.000
+playsound block.note_block.bit_1 record @a[distance=..48.00] ^-3.0 ^ ^ 0.306 0.66742 0.000
+playsound block.note_block.bit_1 record @a[distance=..48.00] ^-2.0 ^ ^ 0.259 0.55318 0.000
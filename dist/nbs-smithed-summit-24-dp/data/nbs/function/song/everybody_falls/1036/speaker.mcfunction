@@ -0,0 +1,5 @@
+playsound block.note_block.snare record @a[distance=..6.19] ^0.0 ^ ^ 0.400 1.68179 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.56] ^-1.0 ^ ^ 0.196 0.56123 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.37] ^-1.0 ^ ^ 0.116 0.65785 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.36] ^-2.0 ^ ^ 0.135 0.66742 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.58] ^-1.0 ^ ^ 0.112 0.55318 0.000
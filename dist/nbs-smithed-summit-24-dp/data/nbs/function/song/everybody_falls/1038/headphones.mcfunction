@@ -0,0 +1,12 @@
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.900 0.50000 0.000
+playsound block.note_block.pling_-1 record @s[] ^-0.0 ^ ^ 0.800 1.58740 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.125 1.00000 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.125 0.79370 0.000
+playsound block.note_block.basedrum record @s[] ^-0.0 ^ ^ 1.000 0.50000 0.000
+playsound block.note_block.basedrum record @s[] ^-0.0 ^ ^ 0.680 1.00000 0.000
+playsound dig_gravel1 record @s[] ^-0.25 ^ ^ 0.700 1.58740 0.000
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 0.400 1.41421 0.000
+playsound block.note_block.bit_1 record @s[] ^0.6 ^ ^ 0.182 0.89090 0.000
+playsound block.note_block.bit_1 record @s[] ^0.55 ^ ^ 0.108 0.65785 0.000
+playsound block.note_block.bit_1 record @s[] ^0.65 ^ ^ 0.125 1.12246 0.000
+playsound block.note_block.bit_1 record @s[] ^0.6 ^ ^ 0.104 0.87813 0.000
@@ -0,0 +1,12 @@
+playsound block.note_block.pling record @a[distance=..48.00] ^0.0 ^ ^ 2.396 0.50000 0.000
+playsound block.note_block.pling_-1 record @a[distance=..48.00] ^0.0 ^ ^ 2.173 1.58740 0.000
+playsound block.note_block.pling record @a[distance=..48.00] ^0.0 ^ ^ 0.312 1.00000 0.000
+playsound block.note_block.pling record @a[distance=..48.00] ^0.0 ^ ^ 0.319 0.79370 0.000
+playsound block.note_block.basedrum record @a[distance=..48.00] ^0.0 ^ ^ 2.824 0.50000 0.000
+playsound block.note_block.basedrum record @a[distance=..48.00] ^0.0 ^ ^ 1.810 1.00000 0.000
+playsound dig_gravel1 record @a[distance=..48.00] ^1.0 ^ ^ 1.561 1.58740 0.000
+playsound block.note_block.snare record @a[distance=..48.00] ^0.0 ^ ^ 0.903 1.41421 0.000
+playsound block.note_block.bit_1 record @a[distance=..48.00] ^-3.0 ^ ^ 0.401 0.89090 0.000
+playsound block.note_block.bit_1 record @a[distance=..48.00] ^-3.0 ^ ^ 0.246 0.65785 0.000
+playsound block.note_block.bit_1 record @a[distance=..48.00] ^-3.0 ^ ^ 0.269 1.12246 0.000
+playsound block.note_block.bit_1 record @a[distance=..48.00] ^-3.0 ^ ^ 0.229 0.87813 0.000
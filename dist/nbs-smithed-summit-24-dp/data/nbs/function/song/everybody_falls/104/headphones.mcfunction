@@ -0,0 +1,10 @@
+playsound block.note_block.pling_-1 record @s[] ^-0.0 ^ ^ 0.408 1.78180 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.612 0.56123 0.000
+playsound block.note_block.bit_1 record @s[] ^0.9 ^ ^ 0.700 1.00000 0.000
+playsound block.note_block.bit_1 record @s[] ^0.95 ^ ^ 0.400 0.73841 0.000
+playsound block.note_block.bit_1 record @s[] ^0.85 ^ ^ 0.500 1.25992 0.000
+playsound block.note_block.bit_1 record @s[] ^0.9 ^ ^ 0.400 0.98566 0.000
+playsound block.note_block.chime record @s[] ^-0.0 ^ ^ 0.004 1.58740 0.000
+playsound block.note_block.chime record @s[] ^-0.0 ^ ^ 0.004 1.41421 0.000
+playsound block.note_block.chime_1 record @s[] ^-0.0 ^ ^ 0.010 0.62996 0.000
+particle note ~ ~2.25 ~ 0 0 0 1 1
@@ -0,0 +1,14 @@
+playsound block.note_block.pling_-1 record @a[distance=..48.00] ^0.0 ^ ^ 1.097 1.78180 0.000
+playsound block.note_block.pling record @a[distance=..48.00] ^0.0 ^ ^ 1.613 0.56123 0.000
+playsound block.note_block.bit_1 record @a[distance=..48.00] ^-4.0 ^ ^ 1.523 1.00000 0.000
+playsound block.note_block.bit_1 record @a[distance=..48.00] ^-4.0 ^ ^ 0.899 0.73841 0.000
+playsound block.note_block.bit_1 record @a[distance=..48.00] ^-4.0 ^ ^ 1.061 1.25992 0.000
+playsound block.note_block.bit_1 record @a[distance=..48.00] ^-4.0 ^ ^ 0.872 0.98566 0.000
+playsound block.note_block.chime record @a[distance=..48.00] ^0.0 ^ ^ 0.008 1.58740 0.000
+playsound block.note_block.chime record @a[distance=..48.00] ^0.0 ^ ^ 0.008 1.41421 0.000
+playsound block.note_block.chime_1 record @a[distance=..48.00] ^0.0 ^ ^ 0.020 0.62996 0.000
+execute store result score #random nbs run random value 1..4
+execute if score #random nbs matches 1 if entity @a[distance=0..48] run function animated_java:music_speaker/animations/animation_speaker_beat_1/play
+execute if score #random nbs matches 2 if entity @a[distance=0..48] run function animated_java:music_speaker/animations/animation_speaker_beat_2/play
+execute if score #random nbs matches 3 if entity @a[distance=0..48] run function animated_java:music_speaker/animations/animation_speaker_beat_3/play
+execute if score #random nbs matches 4 if entity @a[distance=0..48] run function animated_java:music_speaker/animations/animation_speaker_beat_4/play
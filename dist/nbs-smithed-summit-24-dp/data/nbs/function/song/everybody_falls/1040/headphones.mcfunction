@@ -0,0 +1,10 @@
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.900 0.50000 0.000
+playsound block.note_block.pling_-1 record @s[] ^-0.0 ^ ^ 0.800 1.58740 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.125 1.00000 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.125 0.79370 0.000
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 0.400 1.18921 0.000
+playsound block.note_block.bit_1 record @s[] ^0.7 ^ ^ 0.168 1.33484 0.000
+playsound block.note_block.bit_1 record @s[] ^0.65 ^ ^ 0.100 1.10637 0.000
+playsound block.note_block.bit_1 record @s[] ^0.75 ^ ^ 0.115 1.78180 0.000
+playsound block.note_block.bit_1 record @s[] ^0.7 ^ ^ 0.096 1.31570 0.000
+particle note ~ ~2.25 ~ 0 0 0 1 1
@@ -0,0 +1,14 @@
+playsound block.note_block.pling record @a[distance=..48.00] ^0.0 ^ ^ 2.396 0.50000 0.000
+playsound block.note_block.pling_-1 record @a[distance=..48.00] ^0.0 ^ ^ 2.173 1.58740 0.000
+playsound block.note_block.pling record @a[distance=..48.00] ^0.0 ^ ^ 0.312 1.00000 0.000
+playsound block.note_block.pling record @a[distance=..48.00] ^0.0 ^ ^ 0.319 0.79370 0.000
+playsound block.note_block.snare record @a[distance=..48.00] ^0.0 ^ ^ 0.919 1.18921 0.000
+playsound block.note_block.bit_1 record @a[distance=..48.00] ^-3.0 ^ ^ 0.354 1.33484 0.000
+playsound block.note_block.bit_1 record @a[distance=..48.00] ^-3.0 ^ ^ 0.215 1.10637 0.000
+playsound block.note_block.bit_1 record @a[distance=..48.00] ^-3.0 ^ ^ 0.235 1.78180 0.000
+playsound block.note_block.bit_1 record @a[distance=..48.00] ^-3.0 ^ ^ 0.203 1.31570 0.000
+execute store result score #random nbs run random value 1..4
+execute if score #random nbs matches 1 if entity @a[distance=0..48] run function animated_java:music_speaker/animations/animation_speaker_beat_1/play
+execute if score #random nbs matches 2 if entity @a[distance=0..48] run function animated_java:music_speaker/animations/animation_speaker_beat_2/play
+execute if score #random nbs matches 3 if entity @a[distance=0..48] run function animated_java:music_speaker/animations/animation_speaker_beat_3/play
+execute if score #random nbs matches 4 if entity @a[distance=0..48] run function animated_java:music_speaker/animations/animation_speaker_beat_4/play
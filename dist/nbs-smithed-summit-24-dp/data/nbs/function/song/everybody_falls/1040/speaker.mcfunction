@@ -0,0 +1,14 @@
+playsound block.note_block.pling record @a[distance=..11.25] ^0.0 ^ ^ 0.900 0.50000 0.000
+playsound block.note_block.pling_-1 record @a[distance=..11.58] ^0.0 ^ ^ 0.800 1.58740 0.000
+playsound block.note_block.pling record @a[distance=..9.00] ^0.0 ^ ^ 0.125 1.00000 0.000
+playsound block.note_block.pling record @a[distance=..9.94] ^0.0 ^ ^ 0.125 0.79370 0.000
+playsound block.note_block.snare record @a[distance=..6.48] ^0.0 ^ ^ 0.400 1.18921 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.05] ^-2.0 ^ ^ 0.168 1.33484 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.09] ^-2.0 ^ ^ 0.100 1.10637 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.02] ^-2.0 ^ ^ 0.115 1.78180 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.06] ^-2.0 ^ ^ 0.096 1.31570 0.000
+execute store result score #random nbs run random value 1..4
+execute if score #random nbs matches 1 if entity @a[distance=0..12] run function animated_java:music_speaker/animations/animation_speaker_beat_1/play
+execute if score #random nbs matches 2 if entity @a[distance=0..12] run function animated_java:music_speaker/animations/animation_speaker_beat_2/play
+execute if score #random nbs matches 3 if entity @a[distance=0..12] run function animated_java:music_speaker/animations/animation_speaker_beat_3/play
+execute if score #random nbs matches 4 if entity @a[distance=0..12] run function animated_java:music_speaker/animations/animation_speaker_beat_4/play
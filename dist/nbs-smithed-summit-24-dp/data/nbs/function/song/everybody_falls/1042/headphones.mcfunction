@@ -0,0 +1,9 @@
+playsound entity_witch_hurt1 record @s[] ^-0.0 ^ ^ 0.450 1.12246 0.000
+playsound entity_witch_hurt1 record @s[] ^-0.0 ^ ^ 0.450 1.12246 0.000
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 0.800 0.50000 0.000
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 0.800 1.00000 0.000
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 0.400 2.00000 0.000
+playsound block.note_block.bit_1 record @s[] ^0.8 ^ ^ 0.154 1.33484 0.000
+playsound block.note_block.bit_1 record @s[] ^0.75 ^ ^ 0.092 1.75625 0.000
+playsound block.note_block.bit_1 record @s[] ^0.85 ^ ^ 0.105 1.12246 0.000
+playsound block.note_block.bit_1 record @s[] ^0.8 ^ ^ 0.088 1.31570 0.000
@@ -0,0 +1,9 @@
+playsound entity_witch_hurt1 record @a[distance=..48.00] ^0.0 ^ ^ 1.040 1.12246 0.000
+playsound entity_witch_hurt1 record @a[distance=..48.00] ^0.0 ^ ^ 1.040 1.12246 0.000
+playsound block.note_block.snare record @a[distance=..48.00] ^0.0 ^ ^ 2.000 0.50000 0.000
+playsound block.note_block.snare record @a[distance=..48.00] ^0.0 ^ ^ 1.870 1.00000 0.000
+playsound block.note_block.snare record @a[distance=..48.00] ^0.0 ^ ^ 0.870 2.00000 0.000
+playsound block.note_block.bit_1 record @a[distance=..48.00] ^-4.0 ^ ^ 0.325 1.33484 0.000
+playsound block.note_block.bit_1 record @a[distance=..48.00] ^-3.0 ^ ^ 0.188 1.75625 0.000
+playsound block.note_block.bit_1 record @a[distance=..48.00] ^-4.0 ^ ^ 0.226 1.12246 0.000
+playsound block.note_block.bit_1 record @a[distance=..48.00] ^-4.0 ^ ^ 0.186 1.31570 0.000
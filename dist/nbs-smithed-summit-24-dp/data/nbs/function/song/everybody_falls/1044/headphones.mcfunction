@@ -0,0 +1,8 @@
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.900 0.50000 0.000
+playsound block.note_block.pling_-1 record @s[] ^-0.0 ^ ^ 0.800 1.58740 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.125 1.00000 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.125 0.79370 0.000
+playsound block.note_block.bit_1 record @s[] ^0.9 ^ ^ 0.140 0.89090 0.000
+playsound block.note_block.bit_1 record @s[] ^0.85 ^ ^ 0.084 1.10637 0.000
+playsound block.note_block.bit_1 record @s[] ^0.95 ^ ^ 0.095 0.66742 0.000
+playsound block.note_block.bit_1 record @s[] ^0.9 ^ ^ 0.080 0.87813 0.000
@@ -0,0 +1,8 @@
+playsound block.note_block.pling record @a[distance=..48.00] ^0.0 ^ ^ 2.396 0.50000 0.000
+playsound block.note_block.pling_-1 record @a[distance=..48.00] ^0.0 ^ ^ 2.173 1.58740 0.000
+playsound block.note_block.pling record @a[distance=..48.00] ^0.0 ^ ^ 0.312 1.00000 0.000
+playsound block.note_block.pling record @a[distance=..48.00] ^0.0 ^ ^ 0.319 0.79370 0.000
+playsound block.note_block.bit_1 record @a[distance=..48.00] ^-4.0 ^ ^ 0.308 0.89090 0.000
+playsound block.note_block.bit_1 record @a[distance=..48.00] ^-4.0 ^ ^ 0.181 1.10637 0.000
+playsound block.note_block.bit_1 record @a[distance=..48.00] ^-4.0 ^ ^ 0.216 0.66742 0.000
+playsound block.note_block.bit_1 record @a[distance=..48.00] ^-4.0 ^ ^ 0.176 0.87813 0.000
@@ -0,0 +1,11 @@
+playsound block.note_block.pling record @a[distance=..48.00] ^0.0 ^ ^ 2.396 0.50000 0.000
+playsound block.note_block.pling_-1 record @a[distance=..48.00] ^0.0 ^ ^ 2.173 1.58740 0.000
+playsound block.note_block.pling record @a[distance=..48.00] ^0.0 ^ ^ 0.312 1.00000 0.000
+playsound block.note_block.pling record @a[distance=..48.00] ^0.0 ^ ^ 0.319 0.79370 0.000
+playsound random_click_stereo record @a[distance=..48.00] ^0.0 ^ ^ 1.145 1.78180 0.000
+playsound block.note_block.snare record @a[distance=..48.00] ^0.0 ^ ^ 1.662 1.68179 0.000
+playsound block.note_block.snare record @a[distance=..48.00] ^0.0 ^ ^ 0.886 1.68179 0.000
+playsound block.note_block.bit_1 record @a[distance=..48.00] ^-4.0 ^ ^ 0.291 0.56123 0.000
+playsound block.note_block.bit_1 record @a[distance=..48.00] ^-4.0 ^ ^ 0.173 0.65785 0.000
+playsound block.note_block.bit_1 record @a[distance=..48.00] ^-4.0 ^ ^ 0.193 0.66742 0.000
+playsound block.note_block.bit_1 record @a[distance=..48.00] ^-4.0 ^ ^ 0.167 0.55318 0.000
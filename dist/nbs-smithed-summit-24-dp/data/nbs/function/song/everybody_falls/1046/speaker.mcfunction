@@ -0,0 +1,11 @@
+playsound block.note_block.pling record @a[distance=..11.25] ^0.0 ^ ^ 0.900 0.50000 0.000
+playsound block.note_block.pling_-1 record @a[distance=..11.58] ^0.0 ^ ^ 0.800 1.58740 0.000
+playsound block.note_block.pling record @a[distance=..9.00] ^0.0 ^ ^ 0.125 1.00000 0.000
+playsound block.note_block.pling record @a[distance=..9.94] ^0.0 ^ ^ 0.125 0.79370 0.000
+playsound random_click_stereo record @a[distance=..6.16] ^0.0 ^ ^ 0.520 1.78180 0.000
+playsound block.note_block.snare record @a[distance=..6.19] ^0.0 ^ ^ 0.750 1.68179 0.000
+playsound block.note_block.snare record @a[distance=..6.19] ^0.0 ^ ^ 0.400 1.68179 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.56] ^-2.0 ^ ^ 0.126 0.56123 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.37] ^-2.0 ^ ^ 0.076 0.65785 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.36] ^-2.0 ^ ^ 0.085 0.66742 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.58] ^-2.0 ^ ^ 0.072 0.55318 0.000
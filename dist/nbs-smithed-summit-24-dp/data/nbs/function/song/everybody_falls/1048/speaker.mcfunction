@@ -0,0 +1,9 @@
+playsound block.note_block.bit_1 record @a[distance=..6.16] ^-2.0 ^ ^ 0.112 0.89090 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.37] ^-2.0 ^ ^ 0.068 0.65785 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.09] ^-2.0 ^ ^ 0.075 1.12246 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.17] ^-2.0 ^ ^ 0.064 0.87813 0.000
+execute store result score #random nbs run random value 1..4
+execute if score #random nbs matches 1 if entity @a[distance=0..12] run function animated_java:music_speaker/animations/animation_speaker_beat_1/play
+execute if score #random nbs matches 2 if entity @a[distance=0..12] run function animated_java:music_speaker/animations/animation_speaker_beat_2/play
+execute if score #random nbs matches 3 if entity @a[distance=0..12] run function animated_java:music_speaker/animations/animation_speaker_beat_3/play
+execute if score #random nbs matches 4 if entity @a[distance=0..12] run function animated_java:music_speaker/animations/animation_speaker_beat_4/play
@@ -0,0 +1,18 @@
+playsound block.note_block.pling_-1 record @s[] ^-0.0 ^ ^ 0.900 1.78180 0.000
+playsound block.note_block.pling_-1 record @s[] ^-0.0 ^ ^ 0.800 1.41421 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.125 0.89090 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.125 0.70711 0.000
+playsound block.note_block.basedrum record @s[] ^-0.0 ^ ^ 1.000 0.50000 0.000
+playsound block.note_block.basedrum record @s[] ^-0.0 ^ ^ 0.680 1.00000 0.000
+playsound random_wood_click record @s[] ^-0.0 ^ ^ 0.680 1.00000 0.000
+playsound random_wood_click record @s[] ^-0.0 ^ ^ 0.680 1.00000 0.000
+playsound fireworks_blast_far1 record @s[] ^-0.0 ^ ^ 0.750 1.18921 0.000
+playsound fireworks_blast_far1 record @s[] ^-0.0 ^ ^ 0.750 1.00000 0.000
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 0.750 0.70711 0.000
+playsound random_click_stereo record @s[] ^-0.0 ^ ^ 0.520 1.78180 0.000
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 0.750 1.68179 0.000
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 0.400 1.41421 0.000
+playsound block.note_block.bit_1 record @s[] ^0.8 ^ ^ 0.098 1.33484 0.000
+playsound block.note_block.bit_1 record @s[] ^0.85 ^ ^ 0.060 1.10637 0.000
+playsound block.note_block.bit_1 record @s[] ^0.75 ^ ^ 0.065 1.78180 0.000
+playsound block.note_block.bit_1 record @s[] ^0.8 ^ ^ 0.056 1.31570 0.000
@@ -0,0 +1,18 @@
+playsound block.note_block.pling_-1 record @a[distance=..48.00] ^0.0 ^ ^ 2.420 1.78180 0.000
+playsound block.note_block.pling_-1 record @a[distance=..48.00] ^0.0 ^ ^ 2.195 1.41421 0.000
+playsound block.note_block.pling record @a[distance=..48.00] ^0.0 ^ ^ 0.316 0.89090 0.000
+playsound block.note_block.pling record @a[distance=..48.00] ^0.0 ^ ^ 0.323 0.70711 0.000
+playsound block.note_block.basedrum record @a[distance=..48.00] ^0.0 ^ ^ 2.824 0.50000 0.000
+playsound block.note_block.basedrum record @a[distance=..48.00] ^0.0 ^ ^ 1.810 1.00000 0.000
+playsound random_wood_click record @a[distance=..48.00] ^0.0 ^ ^ 1.590 1.00000 0.000
+playsound random_wood_click record @a[distance=..48.00] ^0.0 ^ ^ 1.590 1.00000 0.000
+playsound fireworks_blast_far1 record @a[distance=..48.00] ^0.0 ^ ^ 1.723 1.18921 0.000
+playsound fireworks_blast_far1 record @a[distance=..48.00] ^0.0 ^ ^ 1.753 1.00000 0.000
+playsound block.note_block.snare record @a[distance=..48.00] ^0.0 ^ ^ 1.814 0.70711 0.000
+playsound random_click_stereo record @a[distance=..48.00] ^0.0 ^ ^ 1.145 1.78180 0.000
+playsound block.note_block.snare record @a[distance=..48.00] ^0.0 ^ ^ 1.662 1.68179 0.000
+playsound block.note_block.snare record @a[distance=..48.00] ^0.0 ^ ^ 0.903 1.41421 0.000
+playsound block.note_block.bit_1 record @a[distance=..48.00] ^-4.0 ^ ^ 0.207 1.33484 0.000
+playsound block.note_block.bit_1 record @a[distance=..48.00] ^-4.0 ^ ^ 0.129 1.10637 0.000
+playsound block.note_block.bit_1 record @a[distance=..48.00] ^-3.0 ^ ^ 0.133 1.78180 0.000
+playsound block.note_block.bit_1 record @a[distance=..48.00] ^-4.0 ^ ^ 0.118 1.31570 0.000
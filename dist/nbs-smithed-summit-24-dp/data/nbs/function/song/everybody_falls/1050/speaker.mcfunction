@@ -0,0 +1,18 @@
+playsound block.note_block.pling_-1 record @a[distance=..11.44] ^0.0 ^ ^ 0.900 1.78180 0.000
+playsound block.note_block.pling_-1 record @a[distance=..11.69] ^0.0 ^ ^ 0.800 1.41421 0.000
+playsound block.note_block.pling record @a[distance=..9.48] ^0.0 ^ ^ 0.125 0.89090 0.000
+playsound block.note_block.pling record @a[distance=..10.35] ^0.0 ^ ^ 0.125 0.70711 0.000
+playsound block.note_block.basedrum record @a[distance=..11.88] ^0.0 ^ ^ 1.000 0.50000 0.000
+playsound block.note_block.basedrum record @a[distance=..11.25] ^0.0 ^ ^ 0.680 1.00000 0.000
+playsound random_wood_click record @a[distance=..6.75] ^0.0 ^ ^ 0.680 1.00000 0.000
+playsound random_wood_click record @a[distance=..6.75] ^0.0 ^ ^ 0.680 1.00000 0.000
+playsound fireworks_blast_far1 record @a[distance=..6.48] ^0.0 ^ ^ 0.750 1.18921 0.000
+playsound fireworks_blast_far1 record @a[distance=..6.75] ^0.0 ^ ^ 0.750 1.00000 0.000
+playsound block.note_block.snare record @a[distance=..7.65] ^0.0 ^ ^ 0.750 0.70711 0.000
+playsound random_click_stereo record @a[distance=..6.16] ^0.0 ^ ^ 0.520 1.78180 0.000
+playsound block.note_block.snare record @a[distance=..6.19] ^0.0 ^ ^ 0.750 1.68179 0.000
+playsound block.note_block.snare record @a[distance=..6.31] ^0.0 ^ ^ 0.400 1.41421 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.05] ^-2.0 ^ ^ 0.098 1.33484 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.09] ^-2.0 ^ ^ 0.060 1.10637 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.02] ^-2.0 ^ ^ 0.065 1.78180 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.06] ^-2.0 ^ ^ 0.056 1.31570 0.000
@@ -0,0 +1,10 @@
+playsound block.note_block.pling_-1 record @a[distance=..11.44] ^0.0 ^ ^ 0.900 1.78180 0.000
+playsound block.note_block.pling_-1 record @a[distance=..11.69] ^0.0 ^ ^ 0.800 1.41421 0.000
+playsound block.note_block.pling record @a[distance=..9.48] ^0.0 ^ ^ 0.125 0.89090 0.000
+playsound block.note_block.pling record @a[distance=..10.35] ^0.0 ^ ^ 0.125 0.70711 0.000
+playsound block.note_block.basedrum record @a[distance=..10.35] ^0.0 ^ ^ 0.750 1.41421 0.000
+playsound block.note_block.basedrum record @a[distance=..10.87] ^0.0 ^ ^ 0.750 1.18921 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.05] ^-2.0 ^ ^ 0.084 1.33484 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.03] ^-2.0 ^ ^ 0.052 1.75625 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.09] ^-2.0 ^ ^ 0.055 1.12246 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.06] ^-2.0 ^ ^ 0.048 1.31570 0.000
@@ -0,0 +1,19 @@
+playsound block.note_block.pling_-1 record @s[] ^-0.0 ^ ^ 0.900 1.78180 0.000
+playsound block.note_block.pling_-1 record @s[] ^-0.0 ^ ^ 0.800 1.41421 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.125 0.89090 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.125 0.70711 0.000
+playsound block.note_block.basedrum record @s[] ^0.8 ^ ^ 0.150 1.41421 0.000
+playsound block.note_block.basedrum record @s[] ^0.8 ^ ^ 0.150 1.18921 0.000
+playsound random_wood_click record @s[] ^-0.0 ^ ^ 0.680 1.00000 0.000
+playsound random_wood_click record @s[] ^-0.0 ^ ^ 0.680 1.00000 0.000
+playsound fireworks_blast_far1 record @s[] ^-0.0 ^ ^ 0.750 1.18921 0.000
+playsound fireworks_blast_far1 record @s[] ^-0.0 ^ ^ 0.750 1.00000 0.000
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 0.750 0.70711 0.000
+playsound random_click_stereo record @s[] ^-0.0 ^ ^ 0.520 1.78180 0.000
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 0.750 1.68179 0.000
+playsound dig_gravel1 record @s[] ^-0.25 ^ ^ 0.700 1.58740 0.000
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 0.400 1.18921 0.000
+playsound block.note_block.bit_1 record @s[] ^0.6 ^ ^ 0.070 0.89090 0.000
+playsound block.note_block.bit_1 record @s[] ^0.65 ^ ^ 0.044 1.10637 0.000
+playsound block.note_block.bit_1 record @s[] ^0.55 ^ ^ 0.045 0.66742 0.000
+playsound block.note_block.bit_1 record @s[] ^0.6 ^ ^ 0.040 0.87813 0.000
@@ -0,0 +1,19 @@
+playsound block.note_block.pling_-1 record @a[distance=..11.44] ^0.0 ^ ^ 0.900 1.78180 0.000
+playsound block.note_block.pling_-1 record @a[distance=..11.69] ^0.0 ^ ^ 0.800 1.41421 0.000
+playsound block.note_block.pling record @a[distance=..9.48] ^0.0 ^ ^ 0.125 0.89090 0.000
+playsound block.note_block.pling record @a[distance=..10.35] ^0.0 ^ ^ 0.125 0.70711 0.000
+playsound block.note_block.basedrum record @a[distance=..10.35] ^-2.0 ^ ^ 0.150 1.41421 0.000
+playsound block.note_block.basedrum record @a[distance=..10.87] ^-2.0 ^ ^ 0.150 1.18921 0.000
+playsound random_wood_click record @a[distance=..6.75] ^0.0 ^ ^ 0.680 1.00000 0.000
+playsound random_wood_click record @a[distance=..6.75] ^0.0 ^ ^ 0.680 1.00000 0.000
+playsound fireworks_blast_far1 record @a[distance=..6.48] ^0.0 ^ ^ 0.750 1.18921 0.000
+playsound fireworks_blast_far1 record @a[distance=..6.75] ^0.0 ^ ^ 0.750 1.00000 0.000
+playsound block.note_block.snare record @a[distance=..7.65] ^0.0 ^ ^ 0.750 0.70711 0.000
+playsound random_click_stereo record @a[distance=..6.16] ^0.0 ^ ^ 0.520 1.78180 0.000
+playsound block.note_block.snare record @a[distance=..6.19] ^0.0 ^ ^ 0.750 1.68179 0.000
+playsound dig_gravel1 record @a[distance=..6.23] ^0.0 ^ ^ 0.700 1.58740 0.000
+playsound block.note_block.snare record @a[distance=..6.48] ^0.0 ^ ^ 0.400 1.18921 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.16] ^-2.0 ^ ^ 0.070 0.89090 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.09] ^-2.0 ^ ^ 0.044 1.10637 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.36] ^-2.0 ^ ^ 0.045 0.66742 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.17] ^-2.0 ^ ^ 0.040 0.87813 0.000
@@ -0,0 +1,11 @@
+playsound block.note_block.pling_-1 record @s[] ^-0.0 ^ ^ 0.900 1.78180 0.000
+playsound block.note_block.pling_-1 record @s[] ^-0.0 ^ ^ 0.800 1.41421 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.125 0.89090 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.125 0.70711 0.000
+playsound block.note_block.basedrum record @s[] ^-0.0 ^ ^ 0.750 1.41421 0.000
+playsound block.note_block.basedrum record @s[] ^-0.0 ^ ^ 0.750 1.18921 0.000
+playsound block.note_block.bit_1 record @s[] ^0.5 ^ ^ 0.056 0.56123 0.000
+playsound block.note_block.bit_1 record @s[] ^0.55 ^ ^ 0.036 0.65785 0.000
+playsound block.note_block.bit_1 record @s[] ^0.45 ^ ^ 0.035 0.66742 0.000
+playsound block.note_block.bit_1 record @s[] ^0.5 ^ ^ 0.032 0.55318 0.000
+particle note ~ ~2.25 ~ 0 0 0 1 1
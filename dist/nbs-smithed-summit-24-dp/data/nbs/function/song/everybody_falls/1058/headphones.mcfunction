@@ -0,0 +1,19 @@
+playsound block.note_block.pling_-1 record @s[] ^-0.0 ^ ^ 0.900 1.78180 0.000
+playsound block.note_block.pling_-1 record @s[] ^-0.0 ^ ^ 0.800 1.41421 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.125 0.89090 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.125 0.70711 0.000
+playsound block.note_block.basedrum record @s[] ^0.8 ^ ^ 0.150 1.41421 0.000
+playsound block.note_block.basedrum record @s[] ^0.8 ^ ^ 0.150 1.18921 0.000
+playsound random_wood_click record @s[] ^-0.0 ^ ^ 0.680 1.00000 0.000
+playsound random_wood_click record @s[] ^-0.0 ^ ^ 0.680 1.00000 0.000
+playsound fireworks_blast_far1 record @s[] ^-0.0 ^ ^ 0.750 1.18921 0.000
+playsound fireworks_blast_far1 record @s[] ^-0.0 ^ ^ 0.750 1.00000 0.000
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 0.750 0.70711 0.000
+playsound entity_witch_hurt1 record @s[] ^-0.0 ^ ^ 0.450 2.00000 0.000
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 0.800 0.50000 0.000
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 0.800 1.00000 0.000
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 0.400 2.00000 0.000
+playsound block.note_block.bit_1 record @s[] ^0.4 ^ ^ 0.042 0.89090 0.000
+playsound block.note_block.bit_1 record @s[] ^0.45 ^ ^ 0.028 0.65785 0.000
+playsound block.note_block.bit_1 record @s[] ^0.35 ^ ^ 0.025 1.12246 0.000
+playsound block.note_block.bit_1 record @s[] ^0.4 ^ ^ 0.024 0.87813 0.000
@@ -0,0 +1,19 @@
+playsound block.note_block.pling_-1 record @a[distance=..48.00] ^0.0 ^ ^ 2.420 1.78180 0.000
+playsound block.note_block.pling_-1 record @a[distance=..48.00] ^0.0 ^ ^ 2.195 1.41421 0.000
+playsound block.note_block.pling record @a[distance=..48.00] ^0.0 ^ ^ 0.316 0.89090 0.000
+playsound block.note_block.pling record @a[distance=..48.00] ^0.0 ^ ^ 0.323 0.70711 0.000
+playsound block.note_block.basedrum record @a[distance=..48.00] ^-4.0 ^ ^ 0.387 1.41421 0.000
+playsound block.note_block.basedrum record @a[distance=..48.00] ^-4.0 ^ ^ 0.393 1.18921 0.000
+playsound random_wood_click record @a[distance=..48.00] ^0.0 ^ ^ 1.590 1.00000 0.000
+playsound random_wood_click record @a[distance=..48.00] ^0.0 ^ ^ 1.590 1.00000 0.000
+playsound fireworks_blast_far1 record @a[distance=..48.00] ^0.0 ^ ^ 1.723 1.18921 0.000
+playsound fireworks_blast_far1 record @a[distance=..48.00] ^0.0 ^ ^ 1.753 1.00000 0.000
+playsound block.note_block.snare record @a[distance=..48.00] ^0.0 ^ ^ 1.814 0.70711 0.000
+playsound entity_witch_hurt1 record @a[distance=..48.00] ^0.0 ^ ^ 0.979 2.00000 0.000
+playsound block.note_block.snare record @a[distance=..48.00] ^0.0 ^ ^ 2.000 0.50000 0.000
+playsound block.note_block.snare record @a[distance=..48.00] ^0.0 ^ ^ 1.870 1.00000 0.000
+playsound block.note_block.snare record @a[distance=..48.00] ^0.0 ^ ^ 0.870 2.00000 0.000
+playsound block.note_block.bit_1 record @a[distance=..48.00] ^-2.0 ^ ^ 0.093 0.89090 0.000
+playsound block.note_block.bit_1 record @a[distance=..48.00] ^-2.0 ^ ^ 0.064 0.65785 0.000
+playsound block.note_block.bit_1 record @a[distance=..48.00] ^-2.0 ^ ^ 0.054 1.12246 0.000
+playsound block.note_block.bit_1 record @a[distance=..48.00] ^-2.0 ^ ^ 0.053 0.87813 0.000
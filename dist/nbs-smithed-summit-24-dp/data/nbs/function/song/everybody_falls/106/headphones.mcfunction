@@ -0,0 +1,8 @@
+playsound block.note_block.pling_-1 record @s[] ^-0.0 ^ ^ 0.420 1.78180 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.630 0.56123 0.000
+playsound block.note_block.bit_1 record @s[] ^0.8 ^ ^ 0.700 1.49831 0.000
+playsound block.note_block.bit_1 record @s[] ^0.85 ^ ^ 0.400 1.24186 0.000
+playsound block.note_block.bit_1 record @s[] ^0.75 ^ ^ 0.500 2.00000 0.000
+playsound block.note_block.bit_1 record @s[] ^0.8 ^ ^ 0.400 1.47683 0.000
+playsound block.note_block.chime_1 record @s[] ^-0.0 ^ ^ 0.010 0.59460 0.000
+playsound block.note_block.chime record @s[] ^-0.0 ^ ^ 0.010 2.00000 0.000
@@ -0,0 +1,8 @@
+playsound block.note_block.pling_-1 record @a[distance=..48.00] ^0.0 ^ ^ 1.129 1.78180 0.000
+playsound block.note_block.pling record @a[distance=..48.00] ^0.0 ^ ^ 1.660 0.56123 0.000
+playsound block.note_block.bit_1 record @a[distance=..48.00] ^-4.0 ^ ^ 1.457 1.49831 0.000
+playsound block.note_block.bit_1 record @a[distance=..48.00] ^-4.0 ^ ^ 0.850 1.24186 0.000
+playsound block.note_block.bit_1 record @a[distance=..48.00] ^-3.0 ^ ^ 1.007 2.00000 0.000
+playsound block.note_block.bit_1 record @a[distance=..48.00] ^-4.0 ^ ^ 0.834 1.47683 0.000
+playsound block.note_block.chime_1 record @a[distance=..48.00] ^0.0 ^ ^ 0.020 0.59460 0.000
+playsound block.note_block.chime record @a[distance=..48.00] ^0.0 ^ ^ 0.020 2.00000 0.000
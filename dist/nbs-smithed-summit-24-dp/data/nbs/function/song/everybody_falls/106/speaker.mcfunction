@@ -0,0 +1,8 @@
+playsound block.note_block.pling_-1 record @a[distance=..11.44] ^0.0 ^ ^ 0.420 1.78180 0.000
+playsound block.note_block.pling record @a[distance=..11.01] ^0.0 ^ ^ 0.630 0.56123 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.04] ^-2.0 ^ ^ 0.700 1.49831 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.07] ^-2.0 ^ ^ 0.400 1.24186 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.02] ^-2.0 ^ ^ 0.500 2.00000 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.04] ^-2.0 ^ ^ 0.400 1.47683 0.000
+playsound block.note_block.chime_1 record @a[distance=..6.01] ^0.0 ^ ^ 0.010 0.59460 0.000
+playsound block.note_block.chime record @a[distance=..6.02] ^0.0 ^ ^ 0.010 2.00000 0.000
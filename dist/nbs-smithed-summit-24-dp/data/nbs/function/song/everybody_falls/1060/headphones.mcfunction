@@ -0,0 +1,4 @@
+playsound block.note_block.bit_1 record @s[] ^0.3 ^ ^ 0.028 1.33484 0.000
+playsound block.note_block.bit_1 record @s[] ^0.35 ^ ^ 0.020 1.10637 0.000
+playsound block.note_block.bit_1 record @s[] ^0.25 ^ ^ 0.015 1.78180 0.000
+playsound block.note_block.bit_1 record @s[] ^0.3 ^ ^ 0.016 1.31570 0.000
@@ -0,0 +1,4 @@
+playsound block.note_block.bit_1 record @a[distance=..48.00] ^-2.0 ^ ^ 0.059 1.33484 0.000
+playsound block.note_block.bit_1 record @a[distance=..48.00] ^-2.0 ^ ^ 0.043 1.10637 0.000
+playsound block.note_block.bit_1 record @a[distance=..48.00] ^-1.0 ^ ^ 0.031 1.78180 0.000
+playsound block.note_block.bit_1 record @a[distance=..48.00] ^-2.0 ^ ^ 0.034 1.31570 0.000
@@ -0,0 +1,4 @@
+playsound block.note_block.bit_1 record @a[distance=..6.05] ^-1.0 ^ ^ 0.028 1.33484 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.09] ^-1.0 ^ ^ 0.020 1.10637 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.02] ^-1.0 ^ ^ 0.015 1.78180 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.06] ^-1.0 ^ ^ 0.016 1.31570 0.000
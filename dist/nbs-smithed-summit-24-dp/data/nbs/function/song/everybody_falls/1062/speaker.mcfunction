@@ -0,0 +1,12 @@
+playsound block.note_block.pling_-1 record @a[distance=..11.44] ^0.0 ^ ^ 0.900 1.78180 0.000
+playsound block.note_block.pling_-1 record @a[distance=..11.69] ^0.0 ^ ^ 0.800 1.41421 0.000
+playsound block.note_block.pling record @a[distance=..9.48] ^0.0 ^ ^ 0.125 0.89090 0.000
+playsound block.note_block.pling record @a[distance=..10.35] ^0.0 ^ ^ 0.125 0.70711 0.000
+playsound block.note_block.basedrum_1 record @a[distance=..7.65] ^0.0 ^ ^ 0.680 0.70711 0.000
+playsound block.note_block.basedrum_1 record @a[distance=..7.65] ^0.0 ^ ^ 0.680 0.70711 0.000
+playsound dig_gravel1 record @a[distance=..6.23] ^0.0 ^ ^ 0.700 1.58740 0.000
+playsound block.note_block.snare record @a[distance=..6.19] ^0.0 ^ ^ 0.400 1.68179 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.05] ^-1.0 ^ ^ 0.014 1.33484 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.03] ^-1.0 ^ ^ 0.012 1.75625 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.09] ^-1.0 ^ ^ 0.005 1.12246 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.06] ^-1.0 ^ ^ 0.008 1.31570 0.000
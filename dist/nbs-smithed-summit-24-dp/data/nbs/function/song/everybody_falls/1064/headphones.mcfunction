@@ -0,0 +1,14 @@
+playsound block.note_block.pling_-1 record @s[] ^-0.0 ^ ^ 0.900 1.78180 0.000
+playsound block.note_block.pling_-1 record @s[] ^-0.0 ^ ^ 0.800 1.41421 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.125 0.89090 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.125 0.70711 0.000
+playsound block.note_block.basedrum record @s[] ^-0.0 ^ ^ 1.000 0.50000 0.000
+playsound block.note_block.basedrum record @s[] ^-0.0 ^ ^ 0.680 1.00000 0.000
+playsound block.note_block.basedrum_1 record @s[] ^-0.0 ^ ^ 0.680 0.94387 0.000
+playsound block.note_block.basedrum_1 record @s[] ^-0.0 ^ ^ 0.680 0.94387 0.000
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 0.400 1.18921 0.000
+playsound block.note_block.bit_1 record @s[] ^0.1 ^ ^ 0.000 0.89090 0.000
+playsound block.note_block.bit_1 record @s[] ^0.15 ^ ^ 0.004 1.10637 0.000
+playsound block.note_block.bit_1 record @s[] ^0.05 ^ ^ 0.000 0.66742 0.000
+playsound block.note_block.bit_1 record @s[] ^0.1 ^ ^ 0.000 0.87813 0.000
+particle note ~ ~2.25 ~ 0 0 0 1 1
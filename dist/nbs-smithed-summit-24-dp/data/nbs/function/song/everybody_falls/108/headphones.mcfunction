@@ -0,0 +1,5 @@
+playsound block.note_block.bit_1 record @s[] ^0.7 ^ ^ 0.700 1.49831 0.000
+playsound block.note_block.bit_1 record @s[] ^0.75 ^ ^ 0.400 1.97133 0.000
+playsound block.note_block.bit_1 record @s[] ^0.65 ^ ^ 0.500 1.25992 0.000
+playsound block.note_block.bit_1 record @s[] ^0.7 ^ ^ 0.400 1.47683 0.000
+playsound block.note_block.chime_1 record @s[] ^-0.0 ^ ^ 0.010 0.74915 0.000
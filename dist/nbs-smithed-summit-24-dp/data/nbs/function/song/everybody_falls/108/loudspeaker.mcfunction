@@ -0,0 +1,5 @@
+playsound block.note_block.bit_1 record @a[distance=..48.00] ^-3.0 ^ ^ 1.457 1.49831 0.000
+playsound block.note_block.bit_1 record @a[distance=..48.00] ^-3.0 ^ ^ 0.807 1.97133 0.000
+playsound block.note_block.bit_1 record @a[distance=..48.00] ^-3.0 ^ ^ 1.061 1.25992 0.000
+playsound block.note_block.bit_1 record @a[distance=..48.00] ^-3.0 ^ ^ 0.834 1.47683 0.000
+playsound block.note_block.chime_1 record @a[distance=..48.00] ^0.0 ^ ^ 0.019 0.74915 0.000
@@ -0,0 +1,10 @@
+playsound block.note_block.pling_-1 record @a[distance=..11.58] ^0.0 ^ ^ 0.900 1.58740 0.000
+playsound block.note_block.pling_-1 record @a[distance=..11.74] ^0.0 ^ ^ 0.800 1.33484 0.000
+playsound block.note_block.pling record @a[distance=..9.94] ^0.0 ^ ^ 0.125 0.79370 0.000
+playsound block.note_block.pling record @a[distance=..10.54] ^0.0 ^ ^ 0.125 0.66742 0.000
+playsound block.note_block.basedrum record @a[distance=..11.88] ^0.0 ^ ^ 1.000 0.50000 0.000
+playsound block.note_block.basedrum record @a[distance=..11.25] ^0.0 ^ ^ 0.680 1.00000 0.000
+playsound block.note_block.snare record @a[distance=..6.31] ^0.0 ^ ^ 0.400 1.41421 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.56] ^0.0 ^ ^ 0.007 0.56123 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.36] ^0.0 ^ ^ 0.015 0.66742 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.58] ^0.0 ^ ^ 0.004 0.55318 0.000
@@ -0,0 +1,8 @@
+playsound block.note_block.pling_-1 record @s[] ^-0.0 ^ ^ 0.900 1.58740 0.000
+playsound block.note_block.pling_-1 record @s[] ^-0.0 ^ ^ 0.800 1.33484 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.125 0.79370 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.125 0.66742 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.1 ^ ^ 0.028 0.89090 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.05 ^ ^ 0.012 0.65785 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.15 ^ ^ 0.030 1.12246 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.1 ^ ^ 0.016 0.87813 0.000
@@ -0,0 +1,8 @@
+playsound block.note_block.pling_-1 record @a[distance=..11.58] ^0.0 ^ ^ 0.900 1.58740 0.000
+playsound block.note_block.pling_-1 record @a[distance=..11.74] ^0.0 ^ ^ 0.800 1.33484 0.000
+playsound block.note_block.pling record @a[distance=..9.94] ^0.0 ^ ^ 0.125 0.79370 0.000
+playsound block.note_block.pling record @a[distance=..10.54] ^0.0 ^ ^ 0.125 0.66742 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.16] ^0.0 ^ ^ 0.028 0.89090 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.37] ^0.0 ^ ^ 0.012 0.65785 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.09] ^0.0 ^ ^ 0.030 1.12246 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.17] ^0.0 ^ ^ 0.016 0.87813 0.000
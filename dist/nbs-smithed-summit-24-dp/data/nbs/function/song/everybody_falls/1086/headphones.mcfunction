@@ -0,0 +1,12 @@
+playsound block.note_block.pling_-1 record @s[] ^-0.0 ^ ^ 0.900 1.58740 0.000
+playsound block.note_block.pling_-1 record @s[] ^-0.0 ^ ^ 0.800 1.33484 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.125 0.79370 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.125 0.66742 0.000
+playsound block.note_block.basedrum record @s[] ^-0.0 ^ ^ 0.750 1.41421 0.000
+playsound block.note_block.basedrum record @s[] ^-0.0 ^ ^ 0.750 1.18921 0.000
+playsound dig_gravel1 record @s[] ^-0.25 ^ ^ 0.700 1.58740 0.000
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 0.400 1.18921 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.2 ^ ^ 0.056 1.33484 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.15 ^ ^ 0.024 1.10637 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.25 ^ ^ 0.045 1.78180 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.2 ^ ^ 0.032 1.31570 0.000
@@ -0,0 +1,12 @@
+playsound block.note_block.pling_-1 record @a[distance=..11.58] ^0.0 ^ ^ 0.900 1.58740 0.000
+playsound block.note_block.pling_-1 record @a[distance=..11.74] ^0.0 ^ ^ 0.800 1.33484 0.000
+playsound block.note_block.pling record @a[distance=..9.94] ^0.0 ^ ^ 0.125 0.79370 0.000
+playsound block.note_block.pling record @a[distance=..10.54] ^0.0 ^ ^ 0.125 0.66742 0.000
+playsound block.note_block.basedrum record @a[distance=..10.35] ^0.0 ^ ^ 0.750 1.41421 0.000
+playsound block.note_block.basedrum record @a[distance=..10.87] ^0.0 ^ ^ 0.750 1.18921 0.000
+playsound dig_gravel1 record @a[distance=..6.23] ^0.0 ^ ^ 0.700 1.58740 0.000
+playsound block.note_block.snare record @a[distance=..6.48] ^0.0 ^ ^ 0.400 1.18921 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.05] ^0.0 ^ ^ 0.056 1.33484 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.09] ^0.0 ^ ^ 0.024 1.10637 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.02] ^0.0 ^ ^ 0.045 1.78180 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.06] ^0.0 ^ ^ 0.032 1.31570 0.000
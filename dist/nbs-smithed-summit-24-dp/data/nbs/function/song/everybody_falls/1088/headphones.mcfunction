@@ -0,0 +1,11 @@
+playsound block.note_block.pling_-1 record @s[] ^-0.0 ^ ^ 0.900 1.58740 0.000
+playsound block.note_block.pling_-1 record @s[] ^-0.0 ^ ^ 0.800 1.33484 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.125 0.79370 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.125 0.66742 0.000
+playsound block.note_block.basedrum record @s[] ^0.8 ^ ^ 0.150 1.41421 0.000
+playsound block.note_block.basedrum record @s[] ^0.8 ^ ^ 0.150 1.18921 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.3 ^ ^ 0.077 1.33484 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.25 ^ ^ 0.036 1.75625 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.35 ^ ^ 0.060 1.12246 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.3 ^ ^ 0.044 1.31570 0.000
+particle note ~ ~2.25 ~ 0 0 0 1 1
@@ -0,0 +1,12 @@
+playsound block.note_block.pling_-1 record @a[distance=..11.58] ^0.0 ^ ^ 0.900 1.58740 0.000
+playsound block.note_block.pling_-1 record @a[distance=..11.74] ^0.0 ^ ^ 0.800 1.33484 0.000
+playsound block.note_block.pling record @a[distance=..9.94] ^0.0 ^ ^ 0.125 0.79370 0.000
+playsound block.note_block.pling record @a[distance=..10.54] ^0.0 ^ ^ 0.125 0.66742 0.000
+playsound entity_witch_hurt1 record @a[distance=..6.12] ^0.0 ^ ^ 0.450 2.00000 0.000
+playsound block.note_block.snare record @a[distance=..9.00] ^0.0 ^ ^ 0.800 0.50000 0.000
+playsound block.note_block.snare record @a[distance=..6.75] ^0.0 ^ ^ 0.800 1.00000 0.000
+playsound block.note_block.snare record @a[distance=..6.12] ^0.0 ^ ^ 0.400 2.00000 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.16] ^0.0 ^ ^ 0.098 0.89090 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.09] ^0.0 ^ ^ 0.048 1.10637 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.36] ^0.0 ^ ^ 0.080 0.66742 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.17] ^0.0 ^ ^ 0.056 0.87813 0.000
@@ -0,0 +1,4 @@
+playsound block.note_block.bit_1 record @a[distance=..48.00] ^2.0 ^ ^ 0.275 0.56123 0.000
+playsound block.note_block.bit_1 record @a[distance=..48.00] ^1.0 ^ ^ 0.146 0.65785 0.000
+playsound block.note_block.bit_1 record @a[distance=..48.00] ^2.0 ^ ^ 0.216 0.66742 0.000
+playsound block.note_block.bit_1 record @a[distance=..48.00] ^2.0 ^ ^ 0.157 0.55318 0.000
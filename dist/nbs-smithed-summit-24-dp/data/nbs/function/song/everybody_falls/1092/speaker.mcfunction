@@ -0,0 +1,4 @@
+playsound block.note_block.bit_1 record @a[distance=..6.56] ^1.0 ^ ^ 0.119 0.56123 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.37] ^0.0 ^ ^ 0.064 0.65785 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.36] ^1.0 ^ ^ 0.095 0.66742 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.58] ^1.0 ^ ^ 0.068 0.55318 0.000
@@ -0,0 +1,12 @@
+playsound block.note_block.pling_-1 record @a[distance=..11.58] ^0.0 ^ ^ 0.900 1.58740 0.000
+playsound block.note_block.pling_-1 record @a[distance=..11.74] ^0.0 ^ ^ 0.800 1.33484 0.000
+playsound block.note_block.pling record @a[distance=..9.94] ^0.0 ^ ^ 0.125 0.79370 0.000
+playsound block.note_block.pling record @a[distance=..10.54] ^0.0 ^ ^ 0.125 0.66742 0.000
+playsound block.note_block.basedrum_1 record @a[distance=..7.65] ^0.0 ^ ^ 0.680 0.70711 0.000
+playsound block.note_block.basedrum_1 record @a[distance=..7.65] ^0.0 ^ ^ 0.680 0.70711 0.000
+playsound dig_gravel1 record @a[distance=..6.23] ^0.0 ^ ^ 0.700 1.58740 0.000
+playsound block.note_block.snare record @a[distance=..6.19] ^0.0 ^ ^ 0.400 1.68179 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.16] ^1.0 ^ ^ 0.140 0.89090 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.37] ^1.0 ^ ^ 0.076 0.65785 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.09] ^1.0 ^ ^ 0.110 1.12246 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.17] ^1.0 ^ ^ 0.080 0.87813 0.000
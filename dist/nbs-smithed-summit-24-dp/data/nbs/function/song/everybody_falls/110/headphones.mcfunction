@@ -0,0 +1,7 @@
+playsound block.note_block.pling_-1 record @s[] ^-0.0 ^ ^ 0.432 1.78180 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.648 0.56123 0.000
+playsound block.note_block.bit_1 record @s[] ^0.6 ^ ^ 0.700 1.00000 0.000
+playsound block.note_block.bit_1 record @s[] ^0.65 ^ ^ 0.400 1.24186 0.000
+playsound block.note_block.bit_1 record @s[] ^0.55 ^ ^ 0.500 0.74915 0.000
+playsound block.note_block.bit_1 record @s[] ^0.6 ^ ^ 0.400 0.98566 0.000
+playsound block.note_block.chime_1 record @s[] ^-0.0 ^ ^ 0.010 0.66742 0.000
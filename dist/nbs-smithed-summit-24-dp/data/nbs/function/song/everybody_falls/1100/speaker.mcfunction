@@ -0,0 +1,5 @@
+playsound block.note_block.snare record @a[distance=..6.19] ^0.0 ^ ^ 0.400 1.68179 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.16] ^1.0 ^ ^ 0.210 0.89090 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.09] ^1.0 ^ ^ 0.116 1.10637 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.36] ^1.0 ^ ^ 0.160 0.66742 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.17] ^1.0 ^ ^ 0.120 0.87813 0.000
@@ -0,0 +1,9 @@
+playsound entity_witch_hurt1 record @s[] ^-0.0 ^ ^ 0.450 1.12246 0.000
+playsound entity_witch_hurt1 record @s[] ^-0.0 ^ ^ 0.450 1.12246 0.000
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 0.800 0.50000 0.000
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 0.800 1.00000 0.000
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 0.400 2.00000 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.8 ^ ^ 0.280 1.33484 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.85 ^ ^ 0.152 1.10637 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.75 ^ ^ 0.205 1.78180 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.8 ^ ^ 0.160 1.31570 0.000
@@ -0,0 +1,10 @@
+playsound block.note_block.pling_-1 record @s[] ^-0.0 ^ ^ 0.900 1.78180 0.000
+playsound block.note_block.pling_-1 record @s[] ^-0.0 ^ ^ 0.800 1.41421 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.125 0.89090 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.125 0.70711 0.000
+playsound block.note_block.basedrum record @s[] ^-0.0 ^ ^ 0.750 1.41421 0.000
+playsound block.note_block.basedrum record @s[] ^-0.0 ^ ^ 0.750 1.18921 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.7 ^ ^ 0.301 1.33484 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.75 ^ ^ 0.164 1.75625 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.65 ^ ^ 0.225 1.12246 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.7 ^ ^ 0.172 1.31570 0.000
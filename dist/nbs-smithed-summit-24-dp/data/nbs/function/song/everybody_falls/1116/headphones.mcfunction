@@ -0,0 +1,8 @@
+playsound block.note_block.pling_-1 record @s[] ^-0.0 ^ ^ 0.900 1.78180 0.000
+playsound block.note_block.pling_-1 record @s[] ^-0.0 ^ ^ 0.800 1.41421 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.125 0.89090 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.125 0.70711 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.3 ^ ^ 0.392 1.33484 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.35 ^ ^ 0.216 1.10637 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.25 ^ ^ 0.290 1.78180 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.3 ^ ^ 0.224 1.31570 0.000
@@ -0,0 +1,8 @@
+playsound block.note_block.pling_-1 record @a[distance=..11.44] ^0.0 ^ ^ 0.900 1.78180 0.000
+playsound block.note_block.pling_-1 record @a[distance=..11.69] ^0.0 ^ ^ 0.800 1.41421 0.000
+playsound block.note_block.pling record @a[distance=..9.48] ^0.0 ^ ^ 0.125 0.89090 0.000
+playsound block.note_block.pling record @a[distance=..10.35] ^0.0 ^ ^ 0.125 0.70711 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.05] ^0.0 ^ ^ 0.392 1.33484 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.09] ^0.0 ^ ^ 0.216 1.10637 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.02] ^0.0 ^ ^ 0.290 1.78180 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.06] ^0.0 ^ ^ 0.224 1.31570 0.000
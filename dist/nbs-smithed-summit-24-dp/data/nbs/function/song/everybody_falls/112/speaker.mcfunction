@@ -0,0 +1,12 @@
+playsound block.note_block.pling_-1 record @a[distance=..11.44] ^0.0 ^ ^ 0.450 1.78180 0.000
+playsound block.note_block.pling record @a[distance=..11.01] ^0.0 ^ ^ 0.675 0.56123 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.42] ^-1.0 ^ ^ 0.700 0.62996 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.27] ^-2.0 ^ ^ 0.400 0.73841 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.26] ^-1.0 ^ ^ 0.500 0.74915 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.43] ^-1.0 ^ ^ 0.400 0.62093 0.000
+playsound block.note_block.chime record @a[distance=..6.02] ^0.0 ^ ^ 0.004 1.78180 0.000
+execute store result score #random nbs run random value 1..4
+execute if score #random nbs matches 1 if entity @a[distance=0..12] run function animated_java:music_speaker/animations/animation_speaker_beat_1/play
+execute if score #random nbs matches 2 if entity @a[distance=0..12] run function animated_java:music_speaker/animations/animation_speaker_beat_2/play
+execute if score #random nbs matches 3 if entity @a[distance=0..12] run function animated_java:music_speaker/animations/animation_speaker_beat_3/play
+execute if score #random nbs matches 4 if entity @a[distance=0..12] run function animated_java:music_speaker/animations/animation_speaker_beat_4/play
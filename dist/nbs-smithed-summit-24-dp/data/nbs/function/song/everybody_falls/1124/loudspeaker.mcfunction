@@ -0,0 +1,4 @@
+playsound block.note_block.bit_1 record @a[distance=..48.00] ^-1.0 ^ ^ 1.064 0.89090 0.000
+playsound block.note_block.bit_1 record @a[distance=..48.00] ^-1.0 ^ ^ 0.609 0.65785 0.000
+playsound block.note_block.bit_1 record @a[distance=..48.00] ^-1.0 ^ ^ 0.752 1.12246 0.000
+playsound block.note_block.bit_1 record @a[distance=..48.00] ^-1.0 ^ ^ 0.609 0.87813 0.000
@@ -0,0 +1,4 @@
+playsound block.note_block.bit_1 record @a[distance=..6.16] ^-1.0 ^ ^ 0.483 0.89090 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.37] ^-1.0 ^ ^ 0.268 0.65785 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.09] ^-1.0 ^ ^ 0.350 1.12246 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.17] ^-1.0 ^ ^ 0.276 0.87813 0.000
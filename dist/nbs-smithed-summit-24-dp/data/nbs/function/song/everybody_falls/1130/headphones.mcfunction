@@ -0,0 +1,11 @@
+playsound block.note_block.pling_-1 record @s[] ^-0.0 ^ ^ 0.900 1.78180 0.000
+playsound block.note_block.pling_-1 record @s[] ^-0.0 ^ ^ 0.800 1.41421 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.125 0.89090 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.125 0.70711 0.000
+playsound random_click_stereo record @s[] ^-0.0 ^ ^ 0.520 1.78180 0.000
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 0.750 1.68179 0.000
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 0.400 2.00000 0.000
+playsound block.note_block.bit_1 record @s[] ^0.4 ^ ^ 0.553 0.89090 0.000
+playsound block.note_block.bit_1 record @s[] ^0.35 ^ ^ 0.308 1.10637 0.000
+playsound block.note_block.bit_1 record @s[] ^0.45 ^ ^ 0.400 0.66742 0.000
+playsound block.note_block.bit_1 record @s[] ^0.4 ^ ^ 0.316 0.87813 0.000
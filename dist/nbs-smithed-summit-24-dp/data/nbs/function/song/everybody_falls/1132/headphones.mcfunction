@@ -0,0 +1,5 @@
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 0.400 1.68179 0.000
+playsound block.note_block.bit_1 record @s[] ^0.5 ^ ^ 0.574 0.56123 0.000
+playsound block.note_block.bit_1 record @s[] ^0.45 ^ ^ 0.320 0.65785 0.000
+playsound block.note_block.bit_1 record @s[] ^0.55 ^ ^ 0.415 0.66742 0.000
+playsound block.note_block.bit_1 record @s[] ^0.5 ^ ^ 0.328 0.55318 0.000
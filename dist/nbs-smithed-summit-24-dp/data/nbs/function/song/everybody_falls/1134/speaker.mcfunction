@@ -0,0 +1,12 @@
+playsound block.note_block.pling record @a[distance=..10.54] ^0.0 ^ ^ 0.900 0.66742 0.000
+playsound block.note_block.pling_-1 record @a[distance=..11.58] ^0.0 ^ ^ 0.800 1.58740 0.000
+playsound block.note_block.pling record @a[distance=..7.85] ^0.0 ^ ^ 0.125 1.33484 0.000
+playsound block.note_block.pling record @a[distance=..9.94] ^0.0 ^ ^ 0.125 0.79370 0.000
+playsound block.note_block.basedrum record @a[distance=..11.88] ^0.0 ^ ^ 1.000 0.50000 0.000
+playsound block.note_block.basedrum record @a[distance=..11.25] ^0.0 ^ ^ 0.680 1.00000 0.000
+playsound dig_gravel1 record @a[distance=..6.23] ^0.0 ^ ^ 0.700 1.58740 0.000
+playsound block.note_block.snare record @a[distance=..6.31] ^0.0 ^ ^ 0.400 1.41421 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.16] ^-2.0 ^ ^ 0.595 0.89090 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.37] ^-2.0 ^ ^ 0.332 0.65785 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.09] ^-2.0 ^ ^ 0.435 1.12246 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.17] ^-2.0 ^ ^ 0.340 0.87813 0.000
@@ -0,0 +1,4 @@
+playsound block.note_block.bit_1 record @a[distance=..48.00] ^-2.0 ^ ^ 1.523 1.00000 0.000
+playsound block.note_block.bit_1 record @a[distance=..48.00] ^-2.0 ^ ^ 0.899 0.73841 0.000
+playsound block.note_block.bit_1 record @a[distance=..48.00] ^-2.0 ^ ^ 1.061 1.25992 0.000
+playsound block.note_block.bit_1 record @a[distance=..48.00] ^-2.0 ^ ^ 0.872 0.98566 0.000
@@ -0,0 +1,10 @@
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.900 0.66742 0.000
+playsound block.note_block.pling_-1 record @s[] ^-0.0 ^ ^ 0.800 1.58740 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.125 1.33484 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.125 0.79370 0.000
+playsound block.note_block.basedrum record @s[] ^-0.0 ^ ^ 0.750 1.41421 0.000
+playsound block.note_block.basedrum record @s[] ^-0.0 ^ ^ 0.750 1.18921 0.000
+playsound block.note_block.bit_1 record @s[] ^0.9 ^ ^ 0.665 0.89090 0.000
+playsound block.note_block.bit_1 record @s[] ^0.85 ^ ^ 0.372 1.10637 0.000
+playsound block.note_block.bit_1 record @s[] ^0.95 ^ ^ 0.480 0.66742 0.000
+playsound block.note_block.bit_1 record @s[] ^0.9 ^ ^ 0.380 0.87813 0.000
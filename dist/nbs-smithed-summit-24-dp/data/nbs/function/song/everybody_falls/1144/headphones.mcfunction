@@ -0,0 +1,5 @@
+playsound block.note_block.bit_1 record @s[] ^0.9 ^ ^ 0.672 0.89090 0.000
+playsound block.note_block.bit_1 record @s[] ^0.95 ^ ^ 0.400 0.65785 0.000
+playsound block.note_block.bit_1 record @s[] ^0.85 ^ ^ 0.465 1.12246 0.000
+playsound block.note_block.bit_1 record @s[] ^0.9 ^ ^ 0.384 0.87813 0.000
+particle note ~ ~2.25 ~ 0 0 0 1 1
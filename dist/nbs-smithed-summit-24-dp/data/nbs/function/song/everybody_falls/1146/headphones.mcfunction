@@ -0,0 +1,11 @@
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.900 0.52973 0.000
+playsound block.note_block.pling_-1 record @s[] ^-0.0 ^ ^ 0.800 1.58740 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.125 1.05946 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.125 0.79370 0.000
+playsound block.note_block.basedrum record @s[] ^-0.0 ^ ^ 1.000 0.50000 0.000
+playsound block.note_block.basedrum record @s[] ^-0.0 ^ ^ 0.680 1.00000 0.000
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 0.400 1.41421 0.000
+playsound block.note_block.bit_1 record @s[] ^0.8 ^ ^ 0.630 1.33484 0.000
+playsound block.note_block.bit_1 record @s[] ^0.85 ^ ^ 0.372 1.10637 0.000
+playsound block.note_block.bit_1 record @s[] ^0.75 ^ ^ 0.435 1.78180 0.000
+playsound block.note_block.bit_1 record @s[] ^0.8 ^ ^ 0.360 1.31570 0.000
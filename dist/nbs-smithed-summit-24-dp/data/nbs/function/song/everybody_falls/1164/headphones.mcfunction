@@ -0,0 +1,7 @@
+playsound block.note_block.basedrum record @s[] ^-0.0 ^ ^ 0.750 1.49831 0.000
+playsound block.note_block.basedrum record @s[] ^-0.0 ^ ^ 0.750 1.49831 0.000
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 0.400 1.68179 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.1 ^ ^ 0.252 0.89090 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.05 ^ ^ 0.156 0.65785 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.15 ^ ^ 0.165 1.12246 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.1 ^ ^ 0.144 0.87813 0.000
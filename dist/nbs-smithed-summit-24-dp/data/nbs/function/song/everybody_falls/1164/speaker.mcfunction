@@ -0,0 +1,7 @@
+playsound block.note_block.basedrum record @a[distance=..10.15] ^0.0 ^ ^ 0.750 1.49831 0.000
+playsound block.note_block.basedrum record @a[distance=..10.15] ^0.0 ^ ^ 0.750 1.49831 0.000
+playsound block.note_block.snare record @a[distance=..6.19] ^0.0 ^ ^ 0.400 1.68179 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.16] ^0.0 ^ ^ 0.252 0.89090 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.37] ^0.0 ^ ^ 0.156 0.65785 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.09] ^0.0 ^ ^ 0.165 1.12246 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.17] ^0.0 ^ ^ 0.144 0.87813 0.000
@@ -0,0 +1,11 @@
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.900 0.50000 0.000
+playsound block.note_block.pling_-1 record @s[] ^-0.0 ^ ^ 0.800 1.58740 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.125 1.00000 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.125 0.79370 0.000
+playsound block.note_block.basedrum record @s[] ^-0.0 ^ ^ 0.750 1.68179 0.000
+playsound block.note_block.basedrum record @s[] ^-0.0 ^ ^ 0.750 1.68179 0.000
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 0.400 1.41421 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.2 ^ ^ 0.210 1.33484 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.15 ^ ^ 0.132 1.10637 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.25 ^ ^ 0.135 1.78180 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.2 ^ ^ 0.120 1.31570 0.000
@@ -0,0 +1,7 @@
+playsound entity_witch_hurt1 record @s[] ^-0.0 ^ ^ 0.450 1.12246 0.000
+playsound entity_witch_hurt1 record @s[] ^-0.0 ^ ^ 0.450 1.12246 0.000
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 0.400 2.00000 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.4 ^ ^ 0.126 0.89090 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.35 ^ ^ 0.084 1.10637 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.45 ^ ^ 0.075 0.66742 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.4 ^ ^ 0.072 0.87813 0.000
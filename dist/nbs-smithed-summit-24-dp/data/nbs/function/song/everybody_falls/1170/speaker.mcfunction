@@ -0,0 +1,7 @@
+playsound entity_witch_hurt1 record @a[distance=..6.56] ^0.0 ^ ^ 0.450 1.12246 0.000
+playsound entity_witch_hurt1 record @a[distance=..6.56] ^0.0 ^ ^ 0.450 1.12246 0.000
+playsound block.note_block.snare record @a[distance=..6.12] ^0.0 ^ ^ 0.400 2.00000 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.16] ^0.0 ^ ^ 0.126 0.89090 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.09] ^0.0 ^ ^ 0.084 1.10637 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.36] ^0.0 ^ ^ 0.075 0.66742 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.17] ^0.0 ^ ^ 0.072 0.87813 0.000
@@ -0,0 +1,10 @@
+playsound block.note_block.pling record @a[distance=..11.25] ^0.0 ^ ^ 0.900 0.50000 0.000
+playsound block.note_block.pling_-1 record @a[distance=..11.58] ^0.0 ^ ^ 0.800 1.58740 0.000
+playsound block.note_block.pling record @a[distance=..9.00] ^0.0 ^ ^ 0.125 1.00000 0.000
+playsound block.note_block.pling record @a[distance=..9.94] ^0.0 ^ ^ 0.125 0.79370 0.000
+playsound block.note_block.basedrum_1 record @a[distance=..8.52] ^0.0 ^ ^ 0.750 0.56123 0.000
+playsound block.note_block.basedrum_1 record @a[distance=..8.52] ^0.0 ^ ^ 0.750 0.56123 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.56] ^1.0 ^ ^ 0.084 0.56123 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.37] ^0.0 ^ ^ 0.060 0.65785 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.36] ^1.0 ^ ^ 0.045 0.66742 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.58] ^1.0 ^ ^ 0.048 0.55318 0.000
@@ -0,0 +1,9 @@
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.900 0.50000 0.000
+playsound block.note_block.pling_-1 record @s[] ^-0.0 ^ ^ 0.800 1.58740 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.125 1.00000 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.125 0.79370 0.000
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 0.400 1.68179 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.6 ^ ^ 0.042 0.89090 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.55 ^ ^ 0.036 0.65785 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.65 ^ ^ 0.015 1.12246 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.6 ^ ^ 0.024 0.87813 0.000
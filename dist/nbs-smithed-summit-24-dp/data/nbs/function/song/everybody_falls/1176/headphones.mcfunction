@@ -0,0 +1,6 @@
+playsound block.note_block.basedrum_1 record @s[] ^-0.0 ^ ^ 0.750 0.70711 0.000
+playsound block.note_block.basedrum_1 record @s[] ^-0.0 ^ ^ 0.750 0.74915 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.7 ^ ^ 0.000 1.33484 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.65 ^ ^ 0.012 1.10637 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.7 ^ ^ 0.000 1.31570 0.000
+particle note ~ ~2.25 ~ 0 0 0 1 1
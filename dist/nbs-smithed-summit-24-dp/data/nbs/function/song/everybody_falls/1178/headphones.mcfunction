@@ -0,0 +1,13 @@
+playsound block.note_block.guitar record @s[] ^-0.0 ^ ^ 0.750 0.50000 0.000
+playsound block.note_block.guitar record @s[] ^-0.0 ^ ^ 0.680 0.50000 0.000
+playsound block.note_block.didgeridoo record @s[] ^-0.0 ^ ^ 0.600 0.50000 0.000
+playsound block.note_block.bass record @s[] ^-0.0 ^ ^ 1.000 0.50000 0.000
+playsound block.note_block.bass record @s[] ^-0.0 ^ ^ 0.600 0.50000 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.900 0.62996 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.800 0.50000 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.125 1.25992 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.125 1.00000 0.000
+playsound block.note_block.basedrum record @s[] ^-0.0 ^ ^ 1.000 0.50000 0.000
+playsound block.note_block.basedrum record @s[] ^-0.0 ^ ^ 0.680 1.00000 0.000
+playsound random_fizz record @s[] ^-0.0 ^ ^ 0.680 0.89090 0.000
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 0.400 1.41421 0.000
@@ -0,0 +1,13 @@
+playsound block.note_block.guitar record @a[distance=..48.00] ^0.0 ^ ^ 2.118 0.50000 0.000
+playsound block.note_block.guitar record @a[distance=..48.00] ^0.0 ^ ^ 1.921 0.50000 0.000
+playsound block.note_block.didgeridoo record @a[distance=..48.00] ^0.0 ^ ^ 1.792 0.50000 0.000
+playsound block.note_block.bass record @a[distance=..48.00] ^0.0 ^ ^ 2.986 0.50000 0.000
+playsound block.note_block.bass record @a[distance=..48.00] ^0.0 ^ ^ 1.792 0.50000 0.000
+playsound block.note_block.pling record @a[distance=..48.00] ^0.0 ^ ^ 2.347 0.62996 0.000
+playsound block.note_block.pling record @a[distance=..48.00] ^0.0 ^ ^ 2.130 0.50000 0.000
+playsound block.note_block.pling record @a[distance=..48.00] ^0.0 ^ ^ 0.306 1.25992 0.000
+playsound block.note_block.pling record @a[distance=..48.00] ^0.0 ^ ^ 0.312 1.00000 0.000
+playsound block.note_block.basedrum record @a[distance=..48.00] ^0.0 ^ ^ 2.824 0.50000 0.000
+playsound block.note_block.basedrum record @a[distance=..48.00] ^0.0 ^ ^ 1.810 1.00000 0.000
+playsound random_fizz record @a[distance=..48.00] ^0.0 ^ ^ 1.608 0.89090 0.000
+playsound block.note_block.snare record @a[distance=..48.00] ^0.0 ^ ^ 0.903 1.41421 0.000
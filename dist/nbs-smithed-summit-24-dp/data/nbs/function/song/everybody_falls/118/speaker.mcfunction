@@ -0,0 +1,6 @@
+playsound block.note_block.pling_-1 record @a[distance=..11.58] ^0.0 ^ ^ 0.474 1.58740 0.000
+playsound block.note_block.pling record @a[distance=..11.25] ^0.0 ^ ^ 0.711 0.50000 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.04] ^-1.0 ^ ^ 0.700 1.49831 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.02] ^-1.0 ^ ^ 0.400 1.97133 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.06] ^-1.0 ^ ^ 0.500 1.25992 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.04] ^-1.0 ^ ^ 0.400 1.47683 0.000
@@ -0,0 +1,4 @@
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.900 0.62996 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.800 0.50000 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.125 1.25992 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.125 1.00000 0.000
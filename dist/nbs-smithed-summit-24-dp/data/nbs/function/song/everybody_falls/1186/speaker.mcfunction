@@ -0,0 +1,8 @@
+playsound block.note_block.pling record @a[distance=..10.71] ^0.0 ^ ^ 0.900 0.62996 0.000
+playsound block.note_block.pling record @a[distance=..11.25] ^0.0 ^ ^ 0.800 0.50000 0.000
+playsound block.note_block.pling record @a[distance=..8.06] ^0.0 ^ ^ 0.125 1.25992 0.000
+playsound block.note_block.pling record @a[distance=..9.00] ^0.0 ^ ^ 0.125 1.00000 0.000
+playsound block.note_block.snare record @a[distance=..9.00] ^0.0 ^ ^ 0.800 0.50000 0.000
+playsound block.note_block.snare record @a[distance=..6.75] ^1.0 ^ ^ 0.800 1.00000 0.000
+playsound random_wood_click record @a[distance=..6.75] ^-2.0 ^ ^ 0.800 1.00000 0.000
+playsound block.note_block.snare record @a[distance=..6.12] ^0.0 ^ ^ 0.400 2.00000 0.000
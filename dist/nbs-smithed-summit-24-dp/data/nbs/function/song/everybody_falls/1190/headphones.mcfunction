@@ -0,0 +1,11 @@
+playsound block.note_block.guitar record @s[] ^-0.0 ^ ^ 0.750 0.50000 0.000
+playsound block.note_block.guitar record @s[] ^-0.0 ^ ^ 0.680 0.50000 0.000
+playsound block.note_block.didgeridoo record @s[] ^-0.0 ^ ^ 0.600 0.50000 0.000
+playsound block.note_block.bass record @s[] ^-0.0 ^ ^ 1.000 0.50000 0.000
+playsound block.note_block.bass record @s[] ^-0.0 ^ ^ 0.600 0.50000 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.900 0.62996 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.800 0.50000 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.125 1.25992 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.125 1.00000 0.000
+playsound dig_gravel1 record @s[] ^-0.25 ^ ^ 0.700 1.58740 0.000
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 0.400 1.68179 0.000
@@ -0,0 +1,11 @@
+playsound block.note_block.pling_-1 record @a[distance=..11.58] ^0.0 ^ ^ 0.486 1.58740 0.000
+playsound block.note_block.pling record @a[distance=..11.25] ^0.0 ^ ^ 0.729 0.50000 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.12] ^-1.0 ^ ^ 0.700 1.00000 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.07] ^-1.0 ^ ^ 0.400 1.24186 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.26] ^-1.0 ^ ^ 0.500 0.74915 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.12] ^-1.0 ^ ^ 0.400 0.98566 0.000
+execute store result score #random nbs run random value 1..4
+execute if score #random nbs matches 1 if entity @a[distance=0..12] run function animated_java:music_speaker/animations/animation_speaker_beat_1/play
+execute if score #random nbs matches 2 if entity @a[distance=0..12] run function animated_java:music_speaker/animations/animation_speaker_beat_2/play
+execute if score #random nbs matches 3 if entity @a[distance=0..12] run function animated_java:music_speaker/animations/animation_speaker_beat_3/play
+execute if score #random nbs matches 4 if entity @a[distance=0..12] run function animated_java:music_speaker/animations/animation_speaker_beat_4/play
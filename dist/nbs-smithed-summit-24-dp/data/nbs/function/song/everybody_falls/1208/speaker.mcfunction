@@ -0,0 +1,8 @@
+playsound block.note_block.snare record @a[distance=..9.00] ^0.0 ^ ^ 0.480 0.50000 0.000
+playsound block.note_block.snare record @a[distance=..6.75] ^1.0 ^ ^ 0.480 1.00000 0.000
+playsound random_wood_click record @a[distance=..6.75] ^-2.0 ^ ^ 0.480 1.00000 0.000
+execute store result score #random nbs run random value 1..4
+execute if score #random nbs matches 1 if entity @a[distance=0..12] run function animated_java:music_speaker/animations/animation_speaker_beat_1/play
+execute if score #random nbs matches 2 if entity @a[distance=0..12] run function animated_java:music_speaker/animations/animation_speaker_beat_2/play
+execute if score #random nbs matches 3 if entity @a[distance=0..12] run function animated_java:music_speaker/animations/animation_speaker_beat_3/play
+execute if score #random nbs matches 4 if entity @a[distance=0..12] run function animated_java:music_speaker/animations/animation_speaker_beat_4/play
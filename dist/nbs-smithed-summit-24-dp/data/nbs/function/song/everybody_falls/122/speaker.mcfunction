@@ -0,0 +1,6 @@
+playsound block.note_block.pling_-1 record @a[distance=..11.58] ^0.0 ^ ^ 0.498 1.58740 0.000
+playsound block.note_block.pling record @a[distance=..11.25] ^0.0 ^ ^ 0.747 0.50000 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.42] ^0.0 ^ ^ 0.700 0.62996 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.27] ^-1.0 ^ ^ 0.400 0.73841 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.26] ^0.0 ^ ^ 0.500 0.74915 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.43] ^0.0 ^ ^ 0.400 0.62093 0.000
@@ -0,0 +1,5 @@
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.900 0.56123 0.000
+playsound block.note_block.pling_-1 record @s[] ^-0.0 ^ ^ 0.800 1.78180 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.125 1.12246 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.125 0.89090 0.000
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 0.400 1.68179 0.000
@@ -0,0 +1,5 @@
+playsound block.note_block.pling record @a[distance=..11.01] ^0.0 ^ ^ 0.900 0.56123 0.000
+playsound block.note_block.pling_-1 record @a[distance=..11.44] ^0.0 ^ ^ 0.800 1.78180 0.000
+playsound block.note_block.pling record @a[distance=..8.52] ^0.0 ^ ^ 0.125 1.12246 0.000
+playsound block.note_block.pling record @a[distance=..9.48] ^0.0 ^ ^ 0.125 0.89090 0.000
+playsound block.note_block.snare record @a[distance=..6.19] ^0.0 ^ ^ 0.400 1.68179 0.000
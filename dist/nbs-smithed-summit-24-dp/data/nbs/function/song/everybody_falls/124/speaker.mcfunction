@@ -0,0 +1,6 @@
+playsound block.note_block.pling_-1 record @a[distance=..11.58] ^0.0 ^ ^ 0.510 1.58740 0.000
+playsound block.note_block.pling record @a[distance=..11.25] ^0.0 ^ ^ 0.765 0.50000 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.12] ^0.0 ^ ^ 0.700 1.00000 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.27] ^0.0 ^ ^ 0.400 0.73841 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.06] ^0.0 ^ ^ 0.500 1.25992 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.12] ^0.0 ^ ^ 0.400 0.98566 0.000
@@ -0,0 +1,12 @@
+playsound block.note_block.guitar record @a[distance=..11.88] ^0.0 ^ ^ 0.750 0.50000 0.000
+playsound block.note_block.guitar record @a[distance=..11.88] ^0.0 ^ ^ 0.680 0.50000 0.000
+playsound block.note_block.didgeridoo record @a[distance=..11.98] ^0.0 ^ ^ 0.600 0.50000 0.000
+playsound block.note_block.bass record @a[distance=..11.98] ^0.0 ^ ^ 1.000 0.50000 0.000
+playsound block.note_block.bass record @a[distance=..11.98] ^0.0 ^ ^ 0.600 0.50000 0.000
+playsound block.note_block.pling record @a[distance=..10.71] ^0.0 ^ ^ 0.900 0.62996 0.000
+playsound block.note_block.pling record @a[distance=..11.25] ^0.0 ^ ^ 0.800 0.50000 0.000
+playsound block.note_block.pling record @a[distance=..8.06] ^0.0 ^ ^ 0.125 1.25992 0.000
+playsound block.note_block.pling record @a[distance=..9.00] ^0.0 ^ ^ 0.125 1.00000 0.000
+playsound block.note_block.basedrum record @a[distance=..11.88] ^0.0 ^ ^ 1.000 0.50000 0.000
+playsound block.note_block.basedrum record @a[distance=..11.25] ^0.0 ^ ^ 0.680 1.00000 0.000
+playsound block.note_block.snare record @a[distance=..6.31] ^0.0 ^ ^ 0.400 1.41421 0.000
@@ -0,0 +1,4 @@
+playsound block.note_block.pling record @a[distance=..48.00] ^0.0 ^ ^ 2.347 0.62996 0.000
+playsound block.note_block.pling record @a[distance=..48.00] ^0.0 ^ ^ 2.130 0.50000 0.000
+playsound block.note_block.pling record @a[distance=..48.00] ^0.0 ^ ^ 0.306 1.25992 0.000
+playsound block.note_block.pling record @a[distance=..48.00] ^0.0 ^ ^ 0.312 1.00000 0.000
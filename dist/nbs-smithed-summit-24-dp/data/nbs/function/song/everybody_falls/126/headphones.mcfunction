@@ -0,0 +1,4 @@
+playsound block.note_block.bit_1 record @s[] ^-0.2 ^ ^ 0.700 1.49831 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.15 ^ ^ 0.400 1.24186 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.25 ^ ^ 0.500 2.00000 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.2 ^ ^ 0.400 1.47683 0.000
@@ -0,0 +1,4 @@
+playsound block.note_block.bit_1 record @a[distance=..48.00] ^0.0 ^ ^ 1.457 1.49831 0.000
+playsound block.note_block.bit_1 record @a[distance=..48.00] ^0.0 ^ ^ 0.850 1.24186 0.000
+playsound block.note_block.bit_1 record @a[distance=..48.00] ^1.0 ^ ^ 1.007 2.00000 0.000
+playsound block.note_block.bit_1 record @a[distance=..48.00] ^0.0 ^ ^ 0.834 1.47683 0.000
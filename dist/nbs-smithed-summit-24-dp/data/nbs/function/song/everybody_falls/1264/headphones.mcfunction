@@ -0,0 +1,6 @@
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.900 0.74915 0.000
+playsound block.note_block.pling_-1 record @s[] ^-0.0 ^ ^ 0.800 1.78180 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.125 1.49831 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.125 0.89090 0.000
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 0.400 1.18921 0.000
+particle note ~ ~2.25 ~ 0 0 0 1 1
@@ -0,0 +1,9 @@
+playsound block.note_block.guitar record @a[distance=..48.00] ^0.0 ^ ^ 2.088 0.59460 0.000
+playsound block.note_block.guitar record @a[distance=..48.00] ^0.0 ^ ^ 1.893 0.59460 0.000
+playsound block.note_block.didgeridoo record @a[distance=..48.00] ^0.0 ^ ^ 1.768 0.59460 0.000
+playsound block.note_block.bass record @a[distance=..48.00] ^0.0 ^ ^ 2.946 0.59460 0.000
+playsound block.note_block.bass record @a[distance=..48.00] ^0.0 ^ ^ 1.768 0.59460 0.000
+playsound block.note_block.snare record @a[distance=..48.00] ^0.0 ^ ^ 1.200 0.50000 0.000
+playsound block.note_block.snare record @a[distance=..48.00] ^2.0 ^ ^ 1.122 1.00000 0.000
+playsound random_wood_click record @a[distance=..48.00] ^-3.0 ^ ^ 1.122 1.00000 0.000
+playsound block.note_block.snare record @a[distance=..48.00] ^0.0 ^ ^ 0.870 2.00000 0.000
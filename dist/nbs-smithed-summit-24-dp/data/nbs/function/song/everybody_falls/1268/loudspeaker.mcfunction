@@ -0,0 +1,4 @@
+playsound block.note_block.pling record @a[distance=..48.00] ^0.0 ^ ^ 2.311 0.74915 0.000
+playsound block.note_block.pling_-1 record @a[distance=..48.00] ^0.0 ^ ^ 2.151 1.78180 0.000
+playsound block.note_block.pling record @a[distance=..48.00] ^0.0 ^ ^ 0.301 1.49831 0.000
+playsound block.note_block.pling record @a[distance=..48.00] ^0.0 ^ ^ 0.316 0.89090 0.000
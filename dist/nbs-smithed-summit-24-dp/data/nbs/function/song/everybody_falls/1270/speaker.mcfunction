@@ -0,0 +1,11 @@
+playsound block.note_block.guitar_-1 record @a[distance=..11.94] ^0.0 ^ ^ 0.750 1.58740 0.000
+playsound block.note_block.guitar_-1 record @a[distance=..11.94] ^0.0 ^ ^ 0.680 1.58740 0.000
+playsound block.note_block.didgeridoo_-1 record @a[distance=..11.99] ^0.0 ^ ^ 0.600 1.58740 0.000
+playsound block.note_block.bass_-1 record @a[distance=..11.99] ^0.0 ^ ^ 1.000 1.58740 0.000
+playsound block.note_block.bass_-1 record @a[distance=..11.99] ^0.0 ^ ^ 0.600 1.58740 0.000
+playsound block.note_block.pling record @a[distance=..10.15] ^0.0 ^ ^ 0.900 0.74915 0.000
+playsound block.note_block.pling_-1 record @a[distance=..11.44] ^0.0 ^ ^ 0.800 1.78180 0.000
+playsound block.note_block.pling record @a[distance=..7.46] ^0.0 ^ ^ 0.125 1.49831 0.000
+playsound block.note_block.pling record @a[distance=..9.48] ^0.0 ^ ^ 0.125 0.89090 0.000
+playsound dig_gravel1 record @a[distance=..6.23] ^0.0 ^ ^ 0.700 1.58740 0.000
+playsound block.note_block.snare record @a[distance=..6.19] ^0.0 ^ ^ 0.400 1.68179 0.000
@@ -0,0 +1,4 @@
+playsound block.note_block.pling record @a[distance=..10.87] ^0.0 ^ ^ 0.900 0.59460 0.000
+playsound block.note_block.pling_-1 record @a[distance=..11.58] ^0.0 ^ ^ 0.800 1.58740 0.000
+playsound block.note_block.pling record @a[distance=..8.28] ^0.0 ^ ^ 0.125 1.18921 0.000
+playsound block.note_block.pling record @a[distance=..9.94] ^0.0 ^ ^ 0.125 0.79370 0.000
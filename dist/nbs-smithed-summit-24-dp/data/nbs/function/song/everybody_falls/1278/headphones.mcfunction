@@ -0,0 +1,11 @@
+playsound block.note_block.guitar_-1 record @s[] ^-0.0 ^ ^ 0.750 1.58740 0.000
+playsound block.note_block.guitar_-1 record @s[] ^-0.0 ^ ^ 0.680 1.58740 0.000
+playsound block.note_block.didgeridoo_-1 record @s[] ^-0.0 ^ ^ 0.600 1.58740 0.000
+playsound block.note_block.bass_-1 record @s[] ^-0.0 ^ ^ 1.000 1.58740 0.000
+playsound block.note_block.bass_-1 record @s[] ^-0.0 ^ ^ 0.600 1.58740 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.900 0.59460 0.000
+playsound block.note_block.pling_-1 record @s[] ^-0.0 ^ ^ 0.800 1.58740 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.125 1.18921 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.125 0.79370 0.000
+playsound dig_gravel1 record @s[] ^-0.25 ^ ^ 0.700 1.58740 0.000
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 0.400 1.18921 0.000
@@ -0,0 +1,11 @@
+playsound block.note_block.guitar_-1 record @a[distance=..11.94] ^0.0 ^ ^ 0.750 1.58740 0.000
+playsound block.note_block.guitar_-1 record @a[distance=..11.94] ^0.0 ^ ^ 0.680 1.58740 0.000
+playsound block.note_block.didgeridoo_-1 record @a[distance=..11.99] ^0.0 ^ ^ 0.600 1.58740 0.000
+playsound block.note_block.bass_-1 record @a[distance=..11.99] ^0.0 ^ ^ 1.000 1.58740 0.000
+playsound block.note_block.bass_-1 record @a[distance=..11.99] ^0.0 ^ ^ 0.600 1.58740 0.000
+playsound block.note_block.pling record @a[distance=..10.87] ^0.0 ^ ^ 0.900 0.59460 0.000
+playsound block.note_block.pling_-1 record @a[distance=..11.58] ^0.0 ^ ^ 0.800 1.58740 0.000
+playsound block.note_block.pling record @a[distance=..8.28] ^0.0 ^ ^ 0.125 1.18921 0.000
+playsound block.note_block.pling record @a[distance=..9.94] ^0.0 ^ ^ 0.125 0.79370 0.000
+playsound dig_gravel1 record @a[distance=..6.23] ^0.0 ^ ^ 0.700 1.58740 0.000
+playsound block.note_block.snare record @a[distance=..6.48] ^0.0 ^ ^ 0.400 1.18921 0.000
@@ -0,0 +1,7 @@
+playsound block.note_block.pling_-1 record @s[] ^-0.0 ^ ^ 0.522 1.58740 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.783 0.50000 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.3 ^ ^ 0.700 1.49831 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.25 ^ ^ 0.400 1.97133 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.35 ^ ^ 0.500 1.25992 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.3 ^ ^ 0.400 1.47683 0.000
+particle note ~ ~2.25 ~ 0 0 0 1 1
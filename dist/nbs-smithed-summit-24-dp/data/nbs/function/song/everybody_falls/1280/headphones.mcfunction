@@ -0,0 +1,5 @@
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.900 0.59460 0.000
+playsound block.note_block.pling_-1 record @s[] ^-0.0 ^ ^ 0.800 1.58740 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.125 1.18921 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.125 0.79370 0.000
+particle note ~ ~2.25 ~ 0 0 0 1 1
@@ -0,0 +1,8 @@
+playsound block.note_block.pling record @a[distance=..10.87] ^0.0 ^ ^ 0.900 0.59460 0.000
+playsound block.note_block.pling_-1 record @a[distance=..11.58] ^0.0 ^ ^ 0.800 1.58740 0.000
+playsound block.note_block.pling record @a[distance=..8.28] ^0.0 ^ ^ 0.125 1.18921 0.000
+playsound block.note_block.pling record @a[distance=..9.94] ^0.0 ^ ^ 0.125 0.79370 0.000
+playsound block.note_block.snare record @a[distance=..9.00] ^0.0 ^ ^ 0.800 0.50000 0.000
+playsound block.note_block.snare record @a[distance=..6.75] ^1.0 ^ ^ 0.800 1.00000 0.000
+playsound random_wood_click record @a[distance=..6.75] ^-2.0 ^ ^ 0.800 1.00000 0.000
+playsound block.note_block.snare record @a[distance=..6.12] ^0.0 ^ ^ 0.400 2.00000 0.000
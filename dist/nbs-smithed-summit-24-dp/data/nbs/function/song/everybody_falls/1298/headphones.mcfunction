@@ -0,0 +1,9 @@
+playsound block.note_block.guitar record @s[] ^-0.0 ^ ^ 0.750 0.74915 0.000
+playsound block.note_block.guitar record @s[] ^-0.0 ^ ^ 0.680 0.74915 0.000
+playsound block.note_block.didgeridoo record @s[] ^-0.0 ^ ^ 0.600 0.74915 0.000
+playsound block.note_block.bass record @s[] ^-0.0 ^ ^ 1.000 0.74915 0.000
+playsound block.note_block.bass record @s[] ^-0.0 ^ ^ 0.600 0.74915 0.000
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 0.480 0.50000 0.000
+playsound block.note_block.snare record @s[] ^-0.6 ^ ^ 0.480 1.00000 0.000
+playsound random_wood_click record @s[] ^0.6 ^ ^ 0.480 1.00000 0.000
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 0.400 2.00000 0.000
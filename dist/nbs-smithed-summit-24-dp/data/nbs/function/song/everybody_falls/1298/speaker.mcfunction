@@ -0,0 +1,9 @@
+playsound block.note_block.guitar record @a[distance=..11.64] ^0.0 ^ ^ 0.750 0.74915 0.000
+playsound block.note_block.guitar record @a[distance=..11.64] ^0.0 ^ ^ 0.680 0.74915 0.000
+playsound block.note_block.didgeridoo record @a[distance=..11.95] ^0.0 ^ ^ 0.600 0.74915 0.000
+playsound block.note_block.bass record @a[distance=..11.95] ^0.0 ^ ^ 1.000 0.74915 0.000
+playsound block.note_block.bass record @a[distance=..11.95] ^0.0 ^ ^ 0.600 0.74915 0.000
+playsound block.note_block.snare record @a[distance=..9.00] ^0.0 ^ ^ 0.480 0.50000 0.000
+playsound block.note_block.snare record @a[distance=..6.75] ^1.0 ^ ^ 0.480 1.00000 0.000
+playsound random_wood_click record @a[distance=..6.75] ^-2.0 ^ ^ 0.480 1.00000 0.000
+playsound block.note_block.snare record @a[distance=..6.12] ^0.0 ^ ^ 0.400 2.00000 0.000
@@ -0,0 +1,9 @@
+playsound block.note_block.guitar record @a[distance=..48.00] ^0.0 ^ ^ 0.512 0.74915 0.000
+playsound block.note_block.guitar record @a[distance=..48.00] ^0.0 ^ ^ 0.464 0.74915 0.000
+playsound block.note_block.didgeridoo record @a[distance=..48.00] ^0.0 ^ ^ 0.434 0.74915 0.000
+playsound block.note_block.bass record @a[distance=..48.00] ^0.0 ^ ^ 0.723 0.74915 0.000
+playsound block.note_block.bass record @a[distance=..48.00] ^0.0 ^ ^ 0.434 0.74915 0.000
+playsound block.note_block.pling record @a[distance=..48.00] ^0.0 ^ ^ 2.372 0.56123 0.000
+playsound block.note_block.pling_-1 record @a[distance=..48.00] ^0.0 ^ ^ 2.151 1.78180 0.000
+playsound block.note_block.pling record @a[distance=..48.00] ^0.0 ^ ^ 0.309 1.12246 0.000
+playsound block.note_block.pling record @a[distance=..48.00] ^0.0 ^ ^ 0.316 0.89090 0.000
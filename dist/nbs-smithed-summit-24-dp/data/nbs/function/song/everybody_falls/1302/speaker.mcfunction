@@ -0,0 +1,13 @@
+playsound block.note_block.guitar record @a[distance=..11.64] ^0.0 ^ ^ 0.188 0.74915 0.000
+playsound block.note_block.guitar record @a[distance=..11.64] ^0.0 ^ ^ 0.170 0.74915 0.000
+playsound block.note_block.didgeridoo record @a[distance=..11.95] ^0.0 ^ ^ 0.150 0.74915 0.000
+playsound block.note_block.bass record @a[distance=..11.95] ^0.0 ^ ^ 0.250 0.74915 0.000
+playsound block.note_block.bass record @a[distance=..11.95] ^0.0 ^ ^ 0.150 0.74915 0.000
+playsound block.note_block.pling record @a[distance=..11.01] ^0.0 ^ ^ 0.900 0.56123 0.000
+playsound block.note_block.pling_-1 record @a[distance=..11.44] ^0.0 ^ ^ 0.800 1.78180 0.000
+playsound block.note_block.pling record @a[distance=..8.52] ^0.0 ^ ^ 0.125 1.12246 0.000
+playsound block.note_block.pling record @a[distance=..9.48] ^0.0 ^ ^ 0.125 0.89090 0.000
+playsound random_click_stereo record @a[distance=..6.16] ^0.0 ^ ^ 0.520 1.78180 0.000
+playsound block.note_block.snare record @a[distance=..6.19] ^0.0 ^ ^ 0.750 1.68179 0.000
+playsound dig_gravel1 record @a[distance=..6.23] ^0.0 ^ ^ 0.700 1.58740 0.000
+playsound block.note_block.snare record @a[distance=..6.19] ^0.0 ^ ^ 0.400 1.68179 0.000
@@ -0,0 +1,4 @@
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 0.480 0.50000 0.000
+playsound block.note_block.snare record @s[] ^-0.6 ^ ^ 0.480 1.00000 0.000
+playsound random_wood_click record @s[] ^0.6 ^ ^ 0.480 1.00000 0.000
+particle note ~ ~2.25 ~ 0 0 0 1 1
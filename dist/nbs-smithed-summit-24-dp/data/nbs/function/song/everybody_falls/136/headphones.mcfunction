@@ -0,0 +1,7 @@
+playsound block.note_block.pling_-1 record @s[] ^-0.0 ^ ^ 0.558 1.78180 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.837 0.56123 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.7 ^ ^ 0.700 1.49831 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.65 ^ ^ 0.400 1.24186 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.75 ^ ^ 0.500 2.00000 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.7 ^ ^ 0.400 1.47683 0.000
+particle note ~ ~2.25 ~ 0 0 0 1 1
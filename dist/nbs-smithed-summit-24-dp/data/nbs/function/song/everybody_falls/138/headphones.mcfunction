@@ -0,0 +1,6 @@
+playsound block.note_block.pling_-1 record @s[] ^-0.0 ^ ^ 0.570 1.78180 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.855 0.56123 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.8 ^ ^ 0.700 1.49831 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.75 ^ ^ 0.400 1.97133 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.85 ^ ^ 0.500 1.25992 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.8 ^ ^ 0.400 1.47683 0.000
@@ -0,0 +1,13 @@
+playsound block.note_block.guitar record @s[] ^-0.0 ^ ^ 0.750 0.74915 0.000
+playsound block.note_block.guitar record @s[] ^-0.0 ^ ^ 0.680 0.74915 0.000
+playsound block.note_block.didgeridoo record @s[] ^-0.0 ^ ^ 0.600 0.74915 0.000
+playsound block.note_block.bass record @s[] ^-0.0 ^ ^ 1.000 0.74915 0.000
+playsound block.note_block.bass record @s[] ^-0.0 ^ ^ 0.600 0.74915 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.900 0.74915 0.000
+playsound block.note_block.pling_-1 record @s[] ^-0.0 ^ ^ 0.800 1.78180 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.125 1.49831 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.125 0.89090 0.000
+playsound block.note_block.basedrum record @s[] ^-0.0 ^ ^ 1.000 0.50000 0.000
+playsound block.note_block.basedrum record @s[] ^-0.0 ^ ^ 0.680 1.00000 0.000
+playsound dig_gravel1 record @s[] ^-0.25 ^ ^ 0.700 1.58740 0.000
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 0.400 1.41421 0.000
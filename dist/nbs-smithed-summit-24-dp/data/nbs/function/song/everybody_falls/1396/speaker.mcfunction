@@ -0,0 +1,4 @@
+playsound block.note_block.pling record @a[distance=..10.15] ^0.0 ^ ^ 0.900 0.74915 0.000
+playsound block.note_block.pling_-1 record @a[distance=..11.44] ^0.0 ^ ^ 0.800 1.78180 0.000
+playsound block.note_block.pling record @a[distance=..7.46] ^0.0 ^ ^ 0.125 1.49831 0.000
+playsound block.note_block.pling record @a[distance=..9.48] ^0.0 ^ ^ 0.125 0.89090 0.000
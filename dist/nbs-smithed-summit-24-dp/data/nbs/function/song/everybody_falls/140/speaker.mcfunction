@@ -0,0 +1,4 @@
+playsound block.note_block.bit_1 record @a[distance=..6.12] ^1.0 ^ ^ 0.700 1.00000 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.07] ^1.0 ^ ^ 0.400 1.24186 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.26] ^1.0 ^ ^ 0.500 0.74915 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.12] ^1.0 ^ ^ 0.400 0.98566 0.000
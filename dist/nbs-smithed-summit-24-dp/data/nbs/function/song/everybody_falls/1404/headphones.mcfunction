@@ -0,0 +1,8 @@
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.900 0.59460 0.000
+playsound block.note_block.pling_-1 record @s[] ^-0.0 ^ ^ 0.800 1.58740 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.125 1.18921 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.125 0.79370 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.1 ^ ^ 0.028 1.00000 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.05 ^ ^ 0.012 0.73841 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.15 ^ ^ 0.030 1.25992 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.1 ^ ^ 0.016 0.98566 0.000
@@ -0,0 +1,8 @@
+playsound block.note_block.pling record @a[distance=..10.87] ^0.0 ^ ^ 0.900 0.59460 0.000
+playsound block.note_block.pling_-1 record @a[distance=..11.58] ^0.0 ^ ^ 0.800 1.58740 0.000
+playsound block.note_block.pling record @a[distance=..8.28] ^0.0 ^ ^ 0.125 1.18921 0.000
+playsound block.note_block.pling record @a[distance=..9.94] ^0.0 ^ ^ 0.125 0.79370 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.12] ^0.0 ^ ^ 0.028 1.00000 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.27] ^0.0 ^ ^ 0.012 0.73841 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.06] ^0.0 ^ ^ 0.030 1.25992 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.12] ^0.0 ^ ^ 0.016 0.98566 0.000
@@ -0,0 +1,9 @@
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.900 0.59460 0.000
+playsound block.note_block.pling_-1 record @s[] ^-0.0 ^ ^ 0.800 1.58740 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.125 1.18921 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.125 0.79370 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.3 ^ ^ 0.077 1.49831 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.25 ^ ^ 0.036 1.97133 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.35 ^ ^ 0.060 1.25992 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.3 ^ ^ 0.044 1.47683 0.000
+particle note ~ ~2.25 ~ 0 0 0 1 1
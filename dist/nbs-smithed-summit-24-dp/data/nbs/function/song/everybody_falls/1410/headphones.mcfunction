@@ -0,0 +1,12 @@
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.900 0.59460 0.000
+playsound block.note_block.pling_-1 record @s[] ^-0.0 ^ ^ 0.800 1.58740 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.125 1.18921 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.125 0.79370 0.000
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 0.800 0.50000 0.000
+playsound block.note_block.snare record @s[] ^-0.6 ^ ^ 0.800 1.00000 0.000
+playsound random_wood_click record @s[] ^0.6 ^ ^ 0.800 1.00000 0.000
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 0.400 2.00000 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.4 ^ ^ 0.098 1.00000 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.35 ^ ^ 0.048 1.24186 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.45 ^ ^ 0.080 0.74915 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.4 ^ ^ 0.056 0.98566 0.000
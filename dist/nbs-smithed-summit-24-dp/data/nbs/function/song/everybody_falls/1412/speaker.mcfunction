@@ -0,0 +1,4 @@
+playsound block.note_block.bit_1 record @a[distance=..6.42] ^1.0 ^ ^ 0.119 0.62996 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.27] ^0.0 ^ ^ 0.064 0.73841 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.26] ^1.0 ^ ^ 0.095 0.74915 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.43] ^1.0 ^ ^ 0.068 0.62093 0.000
@@ -0,0 +1,15 @@
+playsound block.note_block.guitar_-1 record @s[] ^-0.0 ^ ^ 0.750 1.58740 0.000
+playsound block.note_block.guitar_-1 record @s[] ^-0.0 ^ ^ 0.680 1.58740 0.000
+playsound block.note_block.didgeridoo_-1 record @s[] ^-0.0 ^ ^ 0.600 1.58740 0.000
+playsound block.note_block.bass_-1 record @s[] ^-0.0 ^ ^ 1.000 1.58740 0.000
+playsound block.note_block.bass_-1 record @s[] ^-0.0 ^ ^ 0.600 1.58740 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.900 0.59460 0.000
+playsound block.note_block.pling_-1 record @s[] ^-0.0 ^ ^ 0.800 1.58740 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.125 1.18921 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.125 0.79370 0.000
+playsound dig_gravel1 record @s[] ^-0.25 ^ ^ 0.700 1.58740 0.000
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 0.400 1.68179 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.6 ^ ^ 0.140 1.00000 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.55 ^ ^ 0.076 0.73841 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.65 ^ ^ 0.110 1.25992 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.6 ^ ^ 0.080 0.98566 0.000
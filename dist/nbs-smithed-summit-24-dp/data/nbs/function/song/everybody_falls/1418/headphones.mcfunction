@@ -0,0 +1,16 @@
+playsound block.note_block.guitar record @s[] ^-0.0 ^ ^ 0.750 0.59460 0.000
+playsound block.note_block.guitar record @s[] ^-0.0 ^ ^ 0.680 0.59460 0.000
+playsound block.note_block.didgeridoo record @s[] ^-0.0 ^ ^ 0.600 0.59460 0.000
+playsound block.note_block.bass record @s[] ^-0.0 ^ ^ 1.000 0.59460 0.000
+playsound block.note_block.bass record @s[] ^-0.0 ^ ^ 0.600 0.59460 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.900 0.59460 0.000
+playsound block.note_block.pling_-1 record @s[] ^-0.0 ^ ^ 0.800 1.58740 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.125 1.18921 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.125 0.79370 0.000
+playsound random_click_stereo record @s[] ^-0.0 ^ ^ 0.520 1.78180 0.000
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 0.750 1.68179 0.000
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 0.400 2.00000 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.8 ^ ^ 0.189 1.49831 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.75 ^ ^ 0.100 1.97133 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.85 ^ ^ 0.145 1.25992 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.8 ^ ^ 0.108 1.47683 0.000
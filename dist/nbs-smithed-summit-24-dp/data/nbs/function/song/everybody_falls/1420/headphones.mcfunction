@@ -0,0 +1,5 @@
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 0.400 1.68179 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.9 ^ ^ 0.210 1.00000 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.85 ^ ^ 0.116 1.24186 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.95 ^ ^ 0.160 0.74915 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.9 ^ ^ 0.120 0.98566 0.000
@@ -0,0 +1,18 @@
+playsound block.note_block.guitar record @s[] ^-0.0 ^ ^ 0.750 0.74915 0.000
+playsound block.note_block.guitar record @s[] ^-0.0 ^ ^ 0.680 0.74915 0.000
+playsound block.note_block.didgeridoo record @s[] ^-0.0 ^ ^ 0.600 0.74915 0.000
+playsound block.note_block.bass record @s[] ^-0.0 ^ ^ 1.000 0.74915 0.000
+playsound block.note_block.bass record @s[] ^-0.0 ^ ^ 0.600 0.74915 0.000
+playsound random_wood_click record @s[] ^-0.0 ^ ^ 0.680 1.00000 0.000
+playsound random_wood_click record @s[] ^-0.0 ^ ^ 0.680 1.00000 0.000
+playsound random_wood_click record @s[] ^-0.0 ^ ^ 0.750 1.00000 0.000
+playsound random_wood_click record @s[] ^-0.0 ^ ^ 0.750 1.00000 0.000
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 0.750 0.70711 0.000
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 0.800 0.50000 0.000
+playsound block.note_block.snare record @s[] ^-0.6 ^ ^ 0.800 1.00000 0.000
+playsound random_wood_click record @s[] ^0.6 ^ ^ 0.800 1.00000 0.000
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 0.400 2.00000 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.8 ^ ^ 0.280 1.49831 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.85 ^ ^ 0.152 1.24186 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.75 ^ ^ 0.205 2.00000 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.8 ^ ^ 0.160 1.47683 0.000
@@ -0,0 +1,18 @@
+playsound block.note_block.guitar record @a[distance=..48.00] ^0.0 ^ ^ 2.047 0.74915 0.000
+playsound block.note_block.guitar record @a[distance=..48.00] ^0.0 ^ ^ 1.856 0.74915 0.000
+playsound block.note_block.didgeridoo record @a[distance=..48.00] ^0.0 ^ ^ 1.735 0.74915 0.000
+playsound block.note_block.bass record @a[distance=..48.00] ^0.0 ^ ^ 2.892 0.74915 0.000
+playsound block.note_block.bass record @a[distance=..48.00] ^0.0 ^ ^ 1.735 0.74915 0.000
+playsound random_wood_click record @a[distance=..48.00] ^0.0 ^ ^ 1.590 1.00000 0.000
+playsound random_wood_click record @a[distance=..48.00] ^0.0 ^ ^ 1.590 1.00000 0.000
+playsound random_wood_click record @a[distance=..48.00] ^0.0 ^ ^ 1.753 1.00000 0.000
+playsound random_wood_click record @a[distance=..48.00] ^0.0 ^ ^ 1.753 1.00000 0.000
+playsound block.note_block.snare record @a[distance=..48.00] ^0.0 ^ ^ 1.814 0.70711 0.000
+playsound block.note_block.snare record @a[distance=..48.00] ^0.0 ^ ^ 2.000 0.50000 0.000
+playsound block.note_block.snare record @a[distance=..48.00] ^2.0 ^ ^ 1.870 1.00000 0.000
+playsound random_wood_click record @a[distance=..48.00] ^-3.0 ^ ^ 1.870 1.00000 0.000
+playsound block.note_block.snare record @a[distance=..48.00] ^0.0 ^ ^ 0.870 2.00000 0.000
+playsound block.note_block.bit_1 record @a[distance=..48.00] ^3.0 ^ ^ 0.583 1.49831 0.000
+playsound block.note_block.bit_1 record @a[distance=..48.00] ^3.0 ^ ^ 0.323 1.24186 0.000
+playsound block.note_block.bit_1 record @a[distance=..48.00] ^3.0 ^ ^ 0.413 2.00000 0.000
+playsound block.note_block.bit_1 record @a[distance=..48.00] ^3.0 ^ ^ 0.334 1.47683 0.000
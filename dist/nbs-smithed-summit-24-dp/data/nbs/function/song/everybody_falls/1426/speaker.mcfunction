@@ -0,0 +1,18 @@
+playsound block.note_block.guitar record @a[distance=..11.64] ^0.0 ^ ^ 0.750 0.74915 0.000
+playsound block.note_block.guitar record @a[distance=..11.64] ^0.0 ^ ^ 0.680 0.74915 0.000
+playsound block.note_block.didgeridoo record @a[distance=..11.95] ^0.0 ^ ^ 0.600 0.74915 0.000
+playsound block.note_block.bass record @a[distance=..11.95] ^0.0 ^ ^ 1.000 0.74915 0.000
+playsound block.note_block.bass record @a[distance=..11.95] ^0.0 ^ ^ 0.600 0.74915 0.000
+playsound random_wood_click record @a[distance=..6.75] ^0.0 ^ ^ 0.680 1.00000 0.000
+playsound random_wood_click record @a[distance=..6.75] ^0.0 ^ ^ 0.680 1.00000 0.000
+playsound random_wood_click record @a[distance=..6.75] ^0.0 ^ ^ 0.750 1.00000 0.000
+playsound random_wood_click record @a[distance=..6.75] ^0.0 ^ ^ 0.750 1.00000 0.000
+playsound block.note_block.snare record @a[distance=..7.65] ^0.0 ^ ^ 0.750 0.70711 0.000
+playsound block.note_block.snare record @a[distance=..9.00] ^0.0 ^ ^ 0.800 0.50000 0.000
+playsound block.note_block.snare record @a[distance=..6.75] ^1.0 ^ ^ 0.800 1.00000 0.000
+playsound random_wood_click record @a[distance=..6.75] ^-2.0 ^ ^ 0.800 1.00000 0.000
+playsound block.note_block.snare record @a[distance=..6.12] ^0.0 ^ ^ 0.400 2.00000 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.04] ^1.0 ^ ^ 0.280 1.49831 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.07] ^1.0 ^ ^ 0.152 1.24186 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.02] ^1.0 ^ ^ 0.205 2.00000 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.04] ^1.0 ^ ^ 0.160 1.47683 0.000
@@ -0,0 +1,13 @@
+playsound block.note_block.guitar record @s[] ^-0.0 ^ ^ 0.188 0.74915 0.000
+playsound block.note_block.guitar record @s[] ^-0.0 ^ ^ 0.170 0.74915 0.000
+playsound block.note_block.didgeridoo record @s[] ^-0.0 ^ ^ 0.150 0.74915 0.000
+playsound block.note_block.bass record @s[] ^-0.0 ^ ^ 0.250 0.74915 0.000
+playsound block.note_block.bass record @s[] ^-0.0 ^ ^ 0.150 0.74915 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.900 0.56123 0.000
+playsound block.note_block.pling_-1 record @s[] ^-0.0 ^ ^ 0.800 1.78180 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.125 1.12246 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.125 0.89090 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.7 ^ ^ 0.301 1.49831 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.75 ^ ^ 0.164 1.97133 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.65 ^ ^ 0.225 1.25992 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.7 ^ ^ 0.172 1.47683 0.000
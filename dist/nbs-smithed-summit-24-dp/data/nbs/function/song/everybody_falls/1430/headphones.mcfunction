@@ -0,0 +1,23 @@
+playsound block.note_block.guitar record @s[] ^-0.0 ^ ^ 0.188 0.74915 0.000
+playsound block.note_block.guitar record @s[] ^-0.0 ^ ^ 0.170 0.74915 0.000
+playsound block.note_block.didgeridoo record @s[] ^-0.0 ^ ^ 0.150 0.74915 0.000
+playsound block.note_block.bass record @s[] ^-0.0 ^ ^ 0.250 0.74915 0.000
+playsound block.note_block.bass record @s[] ^-0.0 ^ ^ 0.150 0.74915 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.900 0.56123 0.000
+playsound block.note_block.pling_-1 record @s[] ^-0.0 ^ ^ 0.800 1.78180 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.125 1.12246 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.125 0.89090 0.000
+playsound random_wood_click record @s[] ^-0.0 ^ ^ 0.680 1.00000 0.000
+playsound random_wood_click record @s[] ^-0.0 ^ ^ 0.680 1.00000 0.000
+playsound random_wood_click record @s[] ^-0.0 ^ ^ 0.750 1.00000 0.000
+playsound random_wood_click record @s[] ^-0.0 ^ ^ 0.750 1.00000 0.000
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 0.750 0.70711 0.000
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 0.800 0.50000 0.000
+playsound block.note_block.snare record @s[] ^-0.6 ^ ^ 0.800 1.00000 0.000
+playsound random_wood_click record @s[] ^0.6 ^ ^ 0.800 1.00000 0.000
+playsound dig_gravel1 record @s[] ^-0.25 ^ ^ 0.700 1.58740 0.000
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 0.400 1.68179 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.6 ^ ^ 0.322 1.00000 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.65 ^ ^ 0.180 1.24186 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.55 ^ ^ 0.240 0.74915 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.6 ^ ^ 0.184 0.98566 0.000
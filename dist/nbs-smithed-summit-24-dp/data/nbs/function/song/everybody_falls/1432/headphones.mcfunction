@@ -0,0 +1,5 @@
+playsound block.note_block.bit_1 record @s[] ^-0.5 ^ ^ 0.350 0.62996 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.55 ^ ^ 0.192 0.73841 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.45 ^ ^ 0.255 0.74915 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.5 ^ ^ 0.200 0.62093 0.000
+particle note ~ ~2.25 ~ 0 0 0 1 1
@@ -0,0 +1,9 @@
+playsound block.note_block.bit_1 record @a[distance=..6.42] ^1.0 ^ ^ 0.350 0.62996 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.27] ^1.0 ^ ^ 0.192 0.73841 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.26] ^0.0 ^ ^ 0.255 0.74915 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.43] ^1.0 ^ ^ 0.200 0.62093 0.000
+execute store result score #random nbs run random value 1..4
+execute if score #random nbs matches 1 if entity @a[distance=0..12] run function animated_java:music_speaker/animations/animation_speaker_beat_1/play
+execute if score #random nbs matches 2 if entity @a[distance=0..12] run function animated_java:music_speaker/animations/animation_speaker_beat_2/play
+execute if score #random nbs matches 3 if entity @a[distance=0..12] run function animated_java:music_speaker/animations/animation_speaker_beat_3/play
+execute if score #random nbs matches 4 if entity @a[distance=0..12] run function animated_java:music_speaker/animations/animation_speaker_beat_4/play
@@ -0,0 +1,20 @@
+playsound block.note_block.guitar_-1 record @s[] ^-0.0 ^ ^ 0.750 1.58740 0.000
+playsound block.note_block.guitar_-1 record @s[] ^-0.0 ^ ^ 0.680 1.58740 0.000
+playsound block.note_block.didgeridoo_-1 record @s[] ^-0.0 ^ ^ 0.600 1.58740 0.000
+playsound block.note_block.bass_-1 record @s[] ^-0.0 ^ ^ 1.000 1.58740 0.000
+playsound block.note_block.bass_-1 record @s[] ^-0.0 ^ ^ 0.600 1.58740 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.900 0.50000 0.000
+playsound block.note_block.pling_-1 record @s[] ^-0.0 ^ ^ 0.800 1.58740 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.125 1.00000 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.125 0.79370 0.000
+playsound block.note_block.basedrum record @s[] ^-0.0 ^ ^ 1.000 0.50000 0.000
+playsound block.note_block.basedrum record @s[] ^-0.0 ^ ^ 0.680 1.00000 0.000
+playsound fireworks_blast_far1 record @s[] ^-0.0 ^ ^ 0.680 1.12246 0.000
+playsound fireworks_blast_far1 record @s[] ^-0.0 ^ ^ 0.680 1.00000 0.000
+playsound fireworks_blast_far1 record @s[] ^-0.0 ^ ^ 0.750 0.84090 0.000
+playsound fireworks_blast_far1 record @s[] ^-0.0 ^ ^ 0.750 1.49831 0.000
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 0.400 1.41421 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.4 ^ ^ 0.371 1.00000 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.45 ^ ^ 0.204 0.73841 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.35 ^ ^ 0.270 1.25992 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.4 ^ ^ 0.212 0.98566 0.000
@@ -0,0 +1,20 @@
+playsound block.note_block.guitar_-1 record @a[distance=..11.94] ^0.0 ^ ^ 0.750 1.58740 0.000
+playsound block.note_block.guitar_-1 record @a[distance=..11.94] ^0.0 ^ ^ 0.680 1.58740 0.000
+playsound block.note_block.didgeridoo_-1 record @a[distance=..11.99] ^0.0 ^ ^ 0.600 1.58740 0.000
+playsound block.note_block.bass_-1 record @a[distance=..11.99] ^0.0 ^ ^ 1.000 1.58740 0.000
+playsound block.note_block.bass_-1 record @a[distance=..11.99] ^0.0 ^ ^ 0.600 1.58740 0.000
+playsound block.note_block.pling record @a[distance=..11.25] ^0.0 ^ ^ 0.900 0.50000 0.000
+playsound block.note_block.pling_-1 record @a[distance=..11.58] ^0.0 ^ ^ 0.800 1.58740 0.000
+playsound block.note_block.pling record @a[distance=..9.00] ^0.0 ^ ^ 0.125 1.00000 0.000
+playsound block.note_block.pling record @a[distance=..9.94] ^0.0 ^ ^ 0.125 0.79370 0.000
+playsound block.note_block.basedrum record @a[distance=..11.88] ^0.0 ^ ^ 1.000 0.50000 0.000
+playsound block.note_block.basedrum record @a[distance=..11.25] ^0.0 ^ ^ 0.680 1.00000 0.000
+playsound fireworks_blast_far1 record @a[distance=..6.56] ^0.0 ^ ^ 0.680 1.12246 0.000
+playsound fireworks_blast_far1 record @a[distance=..6.75] ^0.0 ^ ^ 0.680 1.00000 0.000
+playsound fireworks_blast_far1 record @a[distance=..7.13] ^0.0 ^ ^ 0.750 0.84090 0.000
+playsound fireworks_blast_far1 record @a[distance=..6.26] ^0.0 ^ ^ 0.750 1.49831 0.000
+playsound block.note_block.snare record @a[distance=..6.31] ^0.0 ^ ^ 0.400 1.41421 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.12] ^0.0 ^ ^ 0.371 1.00000 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.27] ^0.0 ^ ^ 0.204 0.73841 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.06] ^0.0 ^ ^ 0.270 1.25992 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.12] ^0.0 ^ ^ 0.212 0.98566 0.000
@@ -0,0 +1,8 @@
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.900 0.50000 0.000
+playsound block.note_block.pling_-1 record @s[] ^-0.0 ^ ^ 0.800 1.58740 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.125 1.00000 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.125 0.79370 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.3 ^ ^ 0.392 1.49831 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.35 ^ ^ 0.216 1.24186 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.25 ^ ^ 0.290 2.00000 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.3 ^ ^ 0.224 1.47683 0.000
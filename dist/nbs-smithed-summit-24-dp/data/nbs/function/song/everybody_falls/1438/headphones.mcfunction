@@ -0,0 +1,14 @@
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.900 0.50000 0.000
+playsound block.note_block.pling_-1 record @s[] ^-0.0 ^ ^ 0.800 1.58740 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.125 1.00000 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.125 0.79370 0.000
+playsound fireworks_blast_far1 record @s[] ^-0.0 ^ ^ 0.680 1.12246 0.000
+playsound fireworks_blast_far1 record @s[] ^-0.0 ^ ^ 0.680 1.00000 0.000
+playsound fireworks_blast_far1 record @s[] ^-0.0 ^ ^ 0.750 0.84090 0.000
+playsound fireworks_blast_far1 record @s[] ^-0.0 ^ ^ 0.750 1.49831 0.000
+playsound dig_gravel1 record @s[] ^-0.25 ^ ^ 0.700 1.58740 0.000
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 0.400 1.18921 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.2 ^ ^ 0.413 1.49831 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.25 ^ ^ 0.232 1.97133 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.15 ^ ^ 0.305 1.25992 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.2 ^ ^ 0.236 1.47683 0.000
@@ -0,0 +1,14 @@
+playsound block.note_block.pling record @a[distance=..48.00] ^0.0 ^ ^ 2.396 0.50000 0.000
+playsound block.note_block.pling_-1 record @a[distance=..48.00] ^0.0 ^ ^ 2.173 1.58740 0.000
+playsound block.note_block.pling record @a[distance=..48.00] ^0.0 ^ ^ 0.312 1.00000 0.000
+playsound block.note_block.pling record @a[distance=..48.00] ^0.0 ^ ^ 0.319 0.79370 0.000
+playsound fireworks_blast_far1 record @a[distance=..48.00] ^0.0 ^ ^ 1.571 1.12246 0.000
+playsound fireworks_blast_far1 record @a[distance=..48.00] ^0.0 ^ ^ 1.590 1.00000 0.000
+playsound fireworks_blast_far1 record @a[distance=..48.00] ^0.0 ^ ^ 1.784 0.84090 0.000
+playsound fireworks_blast_far1 record @a[distance=..48.00] ^0.0 ^ ^ 1.682 1.49831 0.000
+playsound dig_gravel1 record @a[distance=..48.00] ^1.0 ^ ^ 1.561 1.58740 0.000
+playsound block.note_block.snare record @a[distance=..48.00] ^0.0 ^ ^ 0.919 1.18921 0.000
+playsound block.note_block.bit_1 record @a[distance=..48.00] ^0.0 ^ ^ 0.859 1.49831 0.000
+playsound block.note_block.bit_1 record @a[distance=..48.00] ^1.0 ^ ^ 0.468 1.97133 0.000
+playsound block.note_block.bit_1 record @a[distance=..48.00] ^0.0 ^ ^ 0.647 1.25992 0.000
+playsound block.note_block.bit_1 record @a[distance=..48.00] ^0.0 ^ ^ 0.492 1.47683 0.000
@@ -0,0 +1,14 @@
+playsound block.note_block.pling record @a[distance=..11.25] ^0.0 ^ ^ 0.900 0.50000 0.000
+playsound block.note_block.pling_-1 record @a[distance=..11.58] ^0.0 ^ ^ 0.800 1.58740 0.000
+playsound block.note_block.pling record @a[distance=..9.00] ^0.0 ^ ^ 0.125 1.00000 0.000
+playsound block.note_block.pling record @a[distance=..9.94] ^0.0 ^ ^ 0.125 0.79370 0.000
+playsound fireworks_blast_far1 record @a[distance=..6.56] ^0.0 ^ ^ 0.680 1.12246 0.000
+playsound fireworks_blast_far1 record @a[distance=..6.75] ^0.0 ^ ^ 0.680 1.00000 0.000
+playsound fireworks_blast_far1 record @a[distance=..7.13] ^0.0 ^ ^ 0.750 0.84090 0.000
+playsound fireworks_blast_far1 record @a[distance=..6.26] ^0.0 ^ ^ 0.750 1.49831 0.000
+playsound dig_gravel1 record @a[distance=..6.23] ^0.0 ^ ^ 0.700 1.58740 0.000
+playsound block.note_block.snare record @a[distance=..6.48] ^0.0 ^ ^ 0.400 1.18921 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.04] ^0.0 ^ ^ 0.413 1.49831 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.02] ^0.0 ^ ^ 0.232 1.97133 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.06] ^0.0 ^ ^ 0.305 1.25992 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.04] ^0.0 ^ ^ 0.236 1.47683 0.000
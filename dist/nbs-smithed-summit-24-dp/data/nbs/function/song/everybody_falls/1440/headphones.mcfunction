@@ -0,0 +1,9 @@
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.900 0.50000 0.000
+playsound block.note_block.pling_-1 record @s[] ^-0.0 ^ ^ 0.800 1.58740 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.125 1.00000 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.125 0.79370 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.1 ^ ^ 0.434 1.00000 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.15 ^ ^ 0.244 1.24186 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.05 ^ ^ 0.320 0.74915 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.1 ^ ^ 0.248 0.98566 0.000
+particle note ~ ~2.25 ~ 0 0 0 1 1
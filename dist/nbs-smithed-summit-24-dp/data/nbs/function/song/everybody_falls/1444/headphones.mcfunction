@@ -0,0 +1,4 @@
+playsound block.note_block.bit_1 record @s[] ^0.1 ^ ^ 0.483 1.00000 0.000
+playsound block.note_block.bit_1 record @s[] ^0.05 ^ ^ 0.268 0.73841 0.000
+playsound block.note_block.bit_1 record @s[] ^0.15 ^ ^ 0.350 1.25992 0.000
+playsound block.note_block.bit_1 record @s[] ^0.1 ^ ^ 0.276 0.98566 0.000
@@ -0,0 +1,4 @@
+playsound block.note_block.bit_1 record @a[distance=..6.12] ^-1.0 ^ ^ 0.483 1.00000 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.27] ^-1.0 ^ ^ 0.268 0.73841 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.06] ^-1.0 ^ ^ 0.350 1.25992 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.12] ^-1.0 ^ ^ 0.276 0.98566 0.000
@@ -0,0 +1,5 @@
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 0.400 1.68179 0.000
+playsound block.note_block.bit_1 record @s[] ^0.5 ^ ^ 0.574 0.62996 0.000
+playsound block.note_block.bit_1 record @s[] ^0.45 ^ ^ 0.320 0.73841 0.000
+playsound block.note_block.bit_1 record @s[] ^0.55 ^ ^ 0.415 0.74915 0.000
+playsound block.note_block.bit_1 record @s[] ^0.5 ^ ^ 0.328 0.62093 0.000
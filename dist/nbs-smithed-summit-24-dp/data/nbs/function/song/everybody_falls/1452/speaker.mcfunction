@@ -0,0 +1,5 @@
+playsound block.note_block.snare record @a[distance=..6.19] ^0.0 ^ ^ 0.400 1.68179 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.42] ^-1.0 ^ ^ 0.574 0.62996 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.27] ^-1.0 ^ ^ 0.320 0.73841 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.26] ^-2.0 ^ ^ 0.415 0.74915 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.43] ^-1.0 ^ ^ 0.328 0.62093 0.000
@@ -0,0 +1,10 @@
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.900 0.56123 0.000
+playsound block.note_block.pling_-1 record @s[] ^-0.0 ^ ^ 0.800 1.78180 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.125 1.12246 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.125 0.89090 0.000
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 0.400 1.18921 0.000
+playsound block.note_block.bit_1 record @s[] ^0.7 ^ ^ 0.616 1.49831 0.000
+playsound block.note_block.bit_1 record @s[] ^0.65 ^ ^ 0.348 1.24186 0.000
+playsound block.note_block.bit_1 record @s[] ^0.75 ^ ^ 0.450 2.00000 0.000
+playsound block.note_block.bit_1 record @s[] ^0.7 ^ ^ 0.352 1.47683 0.000
+particle note ~ ~2.25 ~ 0 0 0 1 1
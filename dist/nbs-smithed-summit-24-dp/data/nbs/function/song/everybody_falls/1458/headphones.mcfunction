@@ -0,0 +1,13 @@
+playsound block.note_block.guitar record @s[] ^-0.0 ^ ^ 0.750 0.59460 0.000
+playsound block.note_block.guitar record @s[] ^-0.0 ^ ^ 0.680 0.59460 0.000
+playsound block.note_block.didgeridoo record @s[] ^-0.0 ^ ^ 0.600 0.59460 0.000
+playsound block.note_block.bass record @s[] ^-0.0 ^ ^ 1.000 0.59460 0.000
+playsound block.note_block.bass record @s[] ^-0.0 ^ ^ 0.600 0.59460 0.000
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 0.480 0.50000 0.000
+playsound block.note_block.snare record @s[] ^-0.6 ^ ^ 0.480 1.00000 0.000
+playsound random_wood_click record @s[] ^0.6 ^ ^ 0.480 1.00000 0.000
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 0.400 2.00000 0.000
+playsound block.note_block.bit_1 record @s[] ^0.8 ^ ^ 0.637 1.49831 0.000
+playsound block.note_block.bit_1 record @s[] ^0.75 ^ ^ 0.360 1.97133 0.000
+playsound block.note_block.bit_1 record @s[] ^0.85 ^ ^ 0.465 1.25992 0.000
+playsound block.note_block.bit_1 record @s[] ^0.8 ^ ^ 0.364 1.47683 0.000
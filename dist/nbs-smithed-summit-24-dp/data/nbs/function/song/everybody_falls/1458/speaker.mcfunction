@@ -0,0 +1,13 @@
+playsound block.note_block.guitar record @a[distance=..11.81] ^0.0 ^ ^ 0.750 0.59460 0.000
+playsound block.note_block.guitar record @a[distance=..11.81] ^0.0 ^ ^ 0.680 0.59460 0.000
+playsound block.note_block.didgeridoo record @a[distance=..11.97] ^0.0 ^ ^ 0.600 0.59460 0.000
+playsound block.note_block.bass record @a[distance=..11.97] ^0.0 ^ ^ 1.000 0.59460 0.000
+playsound block.note_block.bass record @a[distance=..11.97] ^0.0 ^ ^ 0.600 0.59460 0.000
+playsound block.note_block.snare record @a[distance=..9.00] ^0.0 ^ ^ 0.480 0.50000 0.000
+playsound block.note_block.snare record @a[distance=..6.75] ^1.0 ^ ^ 0.480 1.00000 0.000
+playsound random_wood_click record @a[distance=..6.75] ^-2.0 ^ ^ 0.480 1.00000 0.000
+playsound block.note_block.snare record @a[distance=..6.12] ^0.0 ^ ^ 0.400 2.00000 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.04] ^-2.0 ^ ^ 0.637 1.49831 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.02] ^-2.0 ^ ^ 0.360 1.97133 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.06] ^-2.0 ^ ^ 0.465 1.25992 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.04] ^-2.0 ^ ^ 0.364 1.47683 0.000
@@ -0,0 +1,8 @@
+playsound block.note_block.pling record @a[distance=..11.01] ^0.0 ^ ^ 0.900 0.56123 0.000
+playsound block.note_block.pling_-1 record @a[distance=..11.44] ^0.0 ^ ^ 0.800 1.78180 0.000
+playsound block.note_block.pling record @a[distance=..8.52] ^0.0 ^ ^ 0.125 1.12246 0.000
+playsound block.note_block.pling record @a[distance=..9.48] ^0.0 ^ ^ 0.125 0.89090 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.12] ^-2.0 ^ ^ 0.665 1.00000 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.07] ^-2.0 ^ ^ 0.372 1.24186 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.26] ^-2.0 ^ ^ 0.480 0.74915 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.12] ^-2.0 ^ ^ 0.380 0.98566 0.000
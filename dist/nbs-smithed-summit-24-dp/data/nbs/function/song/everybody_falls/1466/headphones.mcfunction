@@ -0,0 +1,11 @@
+playsound block.note_block.pling_-1 record @s[] ^-0.0 ^ ^ 0.900 1.78180 0.000
+playsound block.note_block.pling_-1 record @s[] ^-0.0 ^ ^ 0.800 1.49831 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.125 0.89090 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.125 0.74915 0.000
+playsound block.note_block.basedrum record @s[] ^-0.0 ^ ^ 1.000 0.50000 0.000
+playsound block.note_block.basedrum record @s[] ^-0.0 ^ ^ 0.680 1.00000 0.000
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 0.400 1.41421 0.000
+playsound block.note_block.bit_1 record @s[] ^0.8 ^ ^ 0.700 1.49831 0.000
+playsound block.note_block.bit_1 record @s[] ^0.85 ^ ^ 0.400 1.24186 0.000
+playsound block.note_block.bit_1 record @s[] ^0.75 ^ ^ 0.500 2.00000 0.000
+playsound block.note_block.bit_1 record @s[] ^0.8 ^ ^ 0.400 1.47683 0.000
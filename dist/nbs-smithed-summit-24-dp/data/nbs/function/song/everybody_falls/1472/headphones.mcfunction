@@ -0,0 +1,9 @@
+playsound block.note_block.pling_-1 record @s[] ^-0.0 ^ ^ 0.900 1.78180 0.000
+playsound block.note_block.pling_-1 record @s[] ^-0.0 ^ ^ 0.800 1.49831 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.125 0.89090 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.125 0.74915 0.000
+playsound block.note_block.bit_1 record @s[] ^0.5 ^ ^ 0.700 0.62996 0.000
+playsound block.note_block.bit_1 record @s[] ^0.55 ^ ^ 0.400 0.73841 0.000
+playsound block.note_block.bit_1 record @s[] ^0.45 ^ ^ 0.500 0.74915 0.000
+playsound block.note_block.bit_1 record @s[] ^0.5 ^ ^ 0.400 0.62093 0.000
+particle note ~ ~2.25 ~ 0 0 0 1 1
@@ -0,0 +1,12 @@
+playsound block.note_block.pling record @a[distance=..11.25] ^0.0 ^ ^ 0.600 0.50000 0.000
+playsound block.note_block.pling record @a[distance=..10.71] ^0.0 ^ ^ 0.900 0.62996 0.000
+playsound block.note_block.pling_-1 record @a[distance=..11.26] ^1.0 ^ ^ 0.020 1.98848 0.000
+playsound block.note_block.pling record @a[distance=..10.73] ^1.0 ^ ^ 0.020 0.62633 0.000
+playsound block.note_block.basedrum record @a[distance=..11.25] ^0.0 ^ ^ 0.750 1.00000 0.000
+playsound block.note_block.basedrum record @a[distance=..11.52] ^0.0 ^ ^ 0.750 0.84090 0.000
+playsound block.note_block.snare record @a[distance=..9.00] ^0.0 ^ ^ 0.000 0.50000 0.000
+playsound block.note_block.snare_-1 record @a[distance=..9.94] ^0.0 ^ ^ 0.600 1.58740 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.04] ^1.0 ^ ^ 0.700 1.49831 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.02] ^1.0 ^ ^ 0.400 1.97133 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.06] ^1.0 ^ ^ 0.500 1.25992 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.04] ^1.0 ^ ^ 0.400 1.47683 0.000
@@ -0,0 +1,9 @@
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.600 0.50000 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.900 0.62996 0.000
+playsound block.note_block.pling_-1 record @s[] ^0.8 ^ ^ 0.050 1.98848 0.000
+playsound block.note_block.pling record @s[] ^0.8 ^ ^ 0.050 0.62633 0.000
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 0.200 0.52973 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.6 ^ ^ 0.700 1.00000 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.65 ^ ^ 0.400 1.24186 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.55 ^ ^ 0.500 0.74915 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.6 ^ ^ 0.400 0.98566 0.000
@@ -0,0 +1,9 @@
+playsound block.note_block.pling record @a[distance=..48.00] ^0.0 ^ ^ 1.597 0.50000 0.000
+playsound block.note_block.pling record @a[distance=..48.00] ^0.0 ^ ^ 2.347 0.62996 0.000
+playsound block.note_block.pling_-1 record @a[distance=..48.00] ^-4.0 ^ ^ 0.133 1.98848 0.000
+playsound block.note_block.pling record @a[distance=..48.00] ^-4.0 ^ ^ 0.130 0.62633 0.000
+playsound block.note_block.snare record @a[distance=..48.00] ^0.0 ^ ^ 0.497 0.52973 0.000
+playsound block.note_block.bit_1 record @a[distance=..48.00] ^2.0 ^ ^ 1.523 1.00000 0.000
+playsound block.note_block.bit_1 record @a[distance=..48.00] ^2.0 ^ ^ 0.850 1.24186 0.000
+playsound block.note_block.bit_1 record @a[distance=..48.00] ^2.0 ^ ^ 1.122 0.74915 0.000
+playsound block.note_block.bit_1 record @a[distance=..48.00] ^2.0 ^ ^ 0.872 0.98566 0.000
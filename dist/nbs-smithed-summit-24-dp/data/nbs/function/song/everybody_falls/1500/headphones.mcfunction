@@ -0,0 +1,8 @@
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.900 0.50000 0.000
+playsound block.note_block.pling_-1 record @s[] ^-0.0 ^ ^ 0.800 1.58740 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.125 1.00000 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.125 0.79370 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.9 ^ ^ 0.686 1.00000 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.85 ^ ^ 0.400 1.24186 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.95 ^ ^ 0.480 0.74915 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.9 ^ ^ 0.392 0.98566 0.000
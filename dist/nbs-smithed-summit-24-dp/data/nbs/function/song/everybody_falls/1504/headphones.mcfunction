@@ -0,0 +1,9 @@
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.900 0.50000 0.000
+playsound block.note_block.pling_-1 record @s[] ^-0.0 ^ ^ 0.800 1.58740 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.125 1.00000 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.125 0.79370 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.9 ^ ^ 0.637 1.00000 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.95 ^ ^ 0.372 0.73841 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.85 ^ ^ 0.450 1.25992 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.9 ^ ^ 0.364 0.98566 0.000
+particle note ~ ~2.25 ~ 0 0 0 1 1
@@ -0,0 +1,4 @@
+playsound block.note_block.bit_1 record @s[] ^-0.7 ^ ^ 0.595 1.49831 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.75 ^ ^ 0.348 1.97133 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.65 ^ ^ 0.415 1.25992 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.7 ^ ^ 0.340 1.47683 0.000
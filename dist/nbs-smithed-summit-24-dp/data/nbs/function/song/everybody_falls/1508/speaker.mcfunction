@@ -0,0 +1,4 @@
+playsound block.note_block.bit_1 record @a[distance=..6.04] ^1.0 ^ ^ 0.595 1.49831 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.02] ^1.0 ^ ^ 0.348 1.97133 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.06] ^1.0 ^ ^ 0.415 1.25992 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.04] ^1.0 ^ ^ 0.340 1.47683 0.000
@@ -0,0 +1,16 @@
+playsound block.note_block.guitar record @s[] ^-0.0 ^ ^ 0.750 1.00000 0.000
+playsound block.note_block.guitar record @s[] ^-0.0 ^ ^ 0.680 1.00000 0.000
+playsound block.note_block.didgeridoo record @s[] ^-0.0 ^ ^ 0.600 1.00000 0.000
+playsound block.note_block.bass record @s[] ^-0.0 ^ ^ 1.000 1.00000 0.000
+playsound block.note_block.bass record @s[] ^-0.0 ^ ^ 0.600 1.00000 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.900 0.50000 0.000
+playsound block.note_block.pling_-1 record @s[] ^-0.0 ^ ^ 0.800 1.58740 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.125 1.00000 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.125 0.79370 0.000
+playsound random_click_stereo record @s[] ^-0.0 ^ ^ 0.520 1.78180 0.000
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 0.750 1.68179 0.000
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 0.400 2.00000 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.4 ^ ^ 0.525 1.00000 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.45 ^ ^ 0.308 0.73841 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.35 ^ ^ 0.370 1.25992 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.4 ^ ^ 0.300 0.98566 0.000
@@ -0,0 +1,5 @@
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 0.400 1.68179 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.3 ^ ^ 0.504 1.49831 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.35 ^ ^ 0.296 1.24186 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.25 ^ ^ 0.350 2.00000 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.3 ^ ^ 0.288 1.47683 0.000
@@ -0,0 +1,17 @@
+playsound block.note_block.guitar record @s[] ^-0.0 ^ ^ 0.750 0.74915 0.000
+playsound block.note_block.guitar record @s[] ^-0.0 ^ ^ 0.680 0.74915 0.000
+playsound block.note_block.didgeridoo record @s[] ^-0.0 ^ ^ 0.600 0.74915 0.000
+playsound block.note_block.bass record @s[] ^-0.0 ^ ^ 1.000 0.74915 0.000
+playsound block.note_block.bass record @s[] ^-0.0 ^ ^ 0.600 0.74915 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.900 0.74915 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.800 0.56123 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.125 1.49831 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.125 1.12246 0.000
+playsound block.note_block.basedrum record @s[] ^-0.0 ^ ^ 1.000 0.50000 0.000
+playsound block.note_block.basedrum record @s[] ^-0.0 ^ ^ 0.680 1.00000 0.000
+playsound dig_gravel1 record @s[] ^-0.25 ^ ^ 0.700 1.58740 0.000
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 0.400 1.41421 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.2 ^ ^ 0.483 1.49831 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.25 ^ ^ 0.280 1.97133 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.15 ^ ^ 0.335 1.25992 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.2 ^ ^ 0.276 1.47683 0.000
@@ -0,0 +1,12 @@
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.600 0.50000 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.900 0.62996 0.000
+playsound block.note_block.pling_-1 record @s[] ^-0.8 ^ ^ 0.080 1.98848 0.000
+playsound block.note_block.pling record @s[] ^-0.8 ^ ^ 0.080 0.62633 0.000
+playsound block.note_block.basedrum record @s[] ^-0.0 ^ ^ 0.750 1.00000 0.000
+playsound block.note_block.basedrum record @s[] ^-0.0 ^ ^ 0.750 0.84090 0.000
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 0.300 0.56123 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.5 ^ ^ 0.700 0.62996 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.55 ^ ^ 0.400 0.73841 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.45 ^ ^ 0.500 0.74915 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.5 ^ ^ 0.400 0.62093 0.000
+particle note ~ ~2.25 ~ 0 0 0 1 1
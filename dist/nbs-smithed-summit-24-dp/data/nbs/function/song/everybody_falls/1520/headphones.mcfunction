@@ -0,0 +1,10 @@
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.900 0.74915 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.800 0.56123 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.125 1.49831 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.125 1.12246 0.000
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 0.400 1.18921 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.1 ^ ^ 0.462 1.00000 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.15 ^ ^ 0.268 1.24186 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.05 ^ ^ 0.320 0.74915 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.1 ^ ^ 0.264 0.98566 0.000
+particle note ~ ~2.25 ~ 0 0 0 1 1
@@ -0,0 +1,8 @@
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.900 0.74915 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.800 0.56123 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.125 1.49831 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.125 1.12246 0.000
+playsound block.note_block.bit_1 record @s[] ^0.1 ^ ^ 0.413 1.00000 0.000
+playsound block.note_block.bit_1 record @s[] ^0.05 ^ ^ 0.244 0.73841 0.000
+playsound block.note_block.bit_1 record @s[] ^0.15 ^ ^ 0.290 1.25992 0.000
+playsound block.note_block.bit_1 record @s[] ^0.1 ^ ^ 0.236 0.98566 0.000
@@ -0,0 +1,9 @@
+playsound block.note_block.pling record @a[distance=..48.00] ^0.0 ^ ^ 1.597 0.50000 0.000
+playsound block.note_block.pling record @a[distance=..48.00] ^0.0 ^ ^ 2.347 0.62996 0.000
+playsound block.note_block.pling_-1 record @a[distance=..48.00] ^-4.0 ^ ^ 0.293 1.98848 0.000
+playsound block.note_block.pling record @a[distance=..48.00] ^-4.0 ^ ^ 0.287 0.62633 0.000
+playsound block.note_block.snare record @a[distance=..48.00] ^0.0 ^ ^ 0.492 0.59460 0.000
+playsound block.note_block.bit_1 record @a[distance=..48.00] ^1.0 ^ ^ 1.523 1.00000 0.000
+playsound block.note_block.bit_1 record @a[distance=..48.00] ^1.0 ^ ^ 0.899 0.73841 0.000
+playsound block.note_block.bit_1 record @a[distance=..48.00] ^1.0 ^ ^ 1.061 1.25992 0.000
+playsound block.note_block.bit_1 record @a[distance=..48.00] ^1.0 ^ ^ 0.872 0.98566 0.000
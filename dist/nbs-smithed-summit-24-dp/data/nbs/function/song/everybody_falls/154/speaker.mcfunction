@@ -0,0 +1,9 @@
+playsound block.note_block.pling record @a[distance=..11.25] ^0.0 ^ ^ 0.600 0.50000 0.000
+playsound block.note_block.pling record @a[distance=..10.71] ^0.0 ^ ^ 0.900 0.62996 0.000
+playsound block.note_block.pling_-1 record @a[distance=..11.26] ^-2.0 ^ ^ 0.110 1.98848 0.000
+playsound block.note_block.pling record @a[distance=..10.73] ^-2.0 ^ ^ 0.110 0.62633 0.000
+playsound block.note_block.snare record @a[distance=..8.28] ^0.0 ^ ^ 0.200 0.59460 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.12] ^0.0 ^ ^ 0.700 1.00000 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.27] ^0.0 ^ ^ 0.400 0.73841 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.06] ^0.0 ^ ^ 0.500 1.25992 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.12] ^0.0 ^ ^ 0.400 0.98566 0.000
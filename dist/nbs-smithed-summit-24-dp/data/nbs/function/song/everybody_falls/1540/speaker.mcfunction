@@ -0,0 +1,4 @@
+playsound block.note_block.bit_1 record @a[distance=..6.12] ^-2.0 ^ ^ 0.231 1.00000 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.07] ^-2.0 ^ ^ 0.140 1.24186 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.26] ^-2.0 ^ ^ 0.160 0.74915 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.12] ^-2.0 ^ ^ 0.132 0.98566 0.000
@@ -0,0 +1,5 @@
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 0.400 1.68179 0.000
+playsound block.note_block.bit_1 record @s[] ^0.7 ^ ^ 0.140 1.49831 0.000
+playsound block.note_block.bit_1 record @s[] ^0.75 ^ ^ 0.088 1.97133 0.000
+playsound block.note_block.bit_1 record @s[] ^0.65 ^ ^ 0.095 1.25992 0.000
+playsound block.note_block.bit_1 record @s[] ^0.7 ^ ^ 0.080 1.47683 0.000
@@ -0,0 +1,14 @@
+playsound block.note_block.pling record @a[distance=..48.00] ^0.0 ^ ^ 1.597 0.50000 0.000
+playsound block.note_block.pling record @a[distance=..48.00] ^0.0 ^ ^ 2.347 0.62996 0.000
+playsound block.note_block.pling_-1 record @a[distance=..48.00] ^3.0 ^ ^ 0.346 1.98848 0.000
+playsound block.note_block.pling record @a[distance=..48.00] ^3.0 ^ ^ 0.339 0.62633 0.000
+playsound random_wood_click record @a[distance=..48.00] ^0.0 ^ ^ 1.285 0.52973 0.000
+playsound random_wood_click record @a[distance=..48.00] ^0.0 ^ ^ 1.285 0.52973 0.000
+playsound block.note_block.snare record @a[distance=..48.00] ^0.0 ^ ^ 1.989 0.52973 0.000
+playsound block.note_block.snare record @a[distance=..48.00] ^0.0 ^ ^ 1.968 0.59460 0.000
+playsound block.note_block.snare record @a[distance=..48.00] ^0.0 ^ ^ 1.946 0.66742 0.000
+playsound block.note_block.snare record @a[distance=..48.00] ^0.0 ^ ^ 0.978 0.62996 0.000
+playsound block.note_block.bit_1 record @a[distance=..48.00] ^1.0 ^ ^ 1.457 1.49831 0.000
+playsound block.note_block.bit_1 record @a[distance=..48.00] ^1.0 ^ ^ 0.850 1.24186 0.000
+playsound block.note_block.bit_1 record @a[distance=..48.00] ^1.0 ^ ^ 1.007 2.00000 0.000
+playsound block.note_block.bit_1 record @a[distance=..48.00] ^1.0 ^ ^ 0.834 1.47683 0.000
@@ -0,0 +1,14 @@
+playsound block.note_block.pling record @a[distance=..11.25] ^0.0 ^ ^ 0.600 0.50000 0.000
+playsound block.note_block.pling record @a[distance=..10.71] ^0.0 ^ ^ 0.900 0.62996 0.000
+playsound block.note_block.pling_-1 record @a[distance=..11.26] ^1.0 ^ ^ 0.130 1.98848 0.000
+playsound block.note_block.pling record @a[distance=..10.73] ^1.0 ^ ^ 0.130 0.62633 0.000
+playsound random_wood_click record @a[distance=..8.76] ^0.0 ^ ^ 0.517 0.52973 0.000
+playsound random_wood_click record @a[distance=..8.76] ^0.0 ^ ^ 0.517 0.52973 0.000
+playsound block.note_block.snare record @a[distance=..8.76] ^0.0 ^ ^ 0.800 0.52973 0.000
+playsound block.note_block.snare record @a[distance=..8.28] ^0.0 ^ ^ 0.800 0.59460 0.000
+playsound block.note_block.snare record @a[distance=..7.85] ^0.0 ^ ^ 0.800 0.66742 0.000
+playsound block.note_block.snare record @a[distance=..8.06] ^0.0 ^ ^ 0.400 0.62996 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.04] ^0.0 ^ ^ 0.700 1.49831 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.07] ^0.0 ^ ^ 0.400 1.24186 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.02] ^0.0 ^ ^ 0.500 2.00000 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.04] ^0.0 ^ ^ 0.400 1.47683 0.000
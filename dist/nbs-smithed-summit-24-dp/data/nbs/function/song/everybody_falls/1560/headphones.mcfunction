@@ -0,0 +1,5 @@
+playsound block.note_block.bit_1 record @s[] ^0.1 ^ ^ 0.007 1.00000 0.000
+playsound block.note_block.bit_1 record @s[] ^0.15 ^ ^ 0.012 1.24186 0.000
+playsound block.note_block.bit_1 record @s[] ^0.05 ^ ^ 0.000 0.74915 0.000
+playsound block.note_block.bit_1 record @s[] ^0.1 ^ ^ 0.004 0.98566 0.000
+particle note ~ ~2.25 ~ 0 0 0 1 1
@@ -0,0 +1,8 @@
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 0.480 0.50000 0.000
+playsound block.note_block.snare record @s[] ^-0.6 ^ ^ 0.480 1.00000 0.000
+playsound random_wood_click record @s[] ^0.6 ^ ^ 0.480 1.00000 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.3 ^ ^ 0.084 1.49831 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.25 ^ ^ 0.048 1.97133 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.35 ^ ^ 0.060 1.25992 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.3 ^ ^ 0.048 1.47683 0.000
+particle note ~ ~2.25 ~ 0 0 0 1 1
@@ -0,0 +1,11 @@
+playsound block.note_block.pling_-1 record @s[] ^-0.0 ^ ^ 0.900 1.78180 0.000
+playsound block.note_block.pling_-1 record @s[] ^-0.0 ^ ^ 0.800 1.49831 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.125 0.89090 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.125 0.74915 0.000
+playsound block.note_block.basedrum record @s[] ^-0.0 ^ ^ 1.000 0.50000 0.000
+playsound block.note_block.basedrum record @s[] ^-0.0 ^ ^ 0.680 1.00000 0.000
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 0.400 1.41421 0.000
+playsound block.note_block.bit_1 record @s[] ^0.1 ^ ^ 0.175 1.00000 0.000
+playsound block.note_block.bit_1 record @s[] ^0.15 ^ ^ 0.100 1.24186 0.000
+playsound block.note_block.bit_1 record @s[] ^0.05 ^ ^ 0.125 0.74915 0.000
+playsound block.note_block.bit_1 record @s[] ^0.1 ^ ^ 0.100 0.98566 0.000
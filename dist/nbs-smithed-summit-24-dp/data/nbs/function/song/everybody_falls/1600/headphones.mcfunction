@@ -0,0 +1,9 @@
+playsound block.note_block.pling_-1 record @s[] ^-0.0 ^ ^ 0.900 1.78180 0.000
+playsound block.note_block.pling_-1 record @s[] ^-0.0 ^ ^ 0.800 1.49831 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.125 0.89090 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.125 0.74915 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.2 ^ ^ 0.434 1.49831 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.15 ^ ^ 0.248 1.24186 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.25 ^ ^ 0.310 2.00000 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.2 ^ ^ 0.248 1.47683 0.000
+particle note ~ ~2.25 ~ 0 0 0 1 1
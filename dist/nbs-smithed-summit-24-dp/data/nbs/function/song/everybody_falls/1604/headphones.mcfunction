@@ -0,0 +1,4 @@
+playsound block.note_block.bit_1 record @s[] ^-0.4 ^ ^ 0.609 1.00000 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.35 ^ ^ 0.348 1.24186 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.45 ^ ^ 0.435 0.74915 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.4 ^ ^ 0.348 0.98566 0.000
@@ -0,0 +1,10 @@
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.900 0.50000 0.000
+playsound block.note_block.pling_-1 record @s[] ^-0.0 ^ ^ 0.800 1.58740 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.125 1.00000 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.125 0.79370 0.000
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 0.400 1.18921 0.000
+playsound block.note_block.bit_1 record @s[] ^-1.0 ^ ^ 0.665 0.62996 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.95 ^ ^ 0.384 0.73841 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.95 ^ ^ 0.465 0.74915 0.000
+playsound block.note_block.bit_1 record @s[] ^-1.0 ^ ^ 0.380 0.62093 0.000
+particle note ~ ~2.25 ~ 0 0 0 1 1
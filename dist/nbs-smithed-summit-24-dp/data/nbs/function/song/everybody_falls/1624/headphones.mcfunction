@@ -0,0 +1,8 @@
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 0.480 0.50000 0.000
+playsound block.note_block.snare record @s[] ^-0.6 ^ ^ 0.480 1.00000 0.000
+playsound random_wood_click record @s[] ^0.6 ^ ^ 0.480 1.00000 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.6 ^ ^ 0.574 1.00000 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.65 ^ ^ 0.332 1.24186 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.55 ^ ^ 0.400 0.74915 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.6 ^ ^ 0.328 0.98566 0.000
+particle note ~ ~2.25 ~ 0 0 0 1 1
@@ -0,0 +1,8 @@
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.900 0.50000 0.000
+playsound block.note_block.pling_-1 record @s[] ^-0.0 ^ ^ 0.800 1.58740 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.125 1.00000 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.125 0.79370 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.4 ^ ^ 0.525 1.00000 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.45 ^ ^ 0.308 0.73841 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.35 ^ ^ 0.370 1.25992 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.4 ^ ^ 0.300 0.98566 0.000
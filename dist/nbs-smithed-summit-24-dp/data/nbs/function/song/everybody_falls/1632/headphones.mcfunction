@@ -0,0 +1,9 @@
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.900 0.50000 0.000
+playsound block.note_block.pling_-1 record @s[] ^-0.0 ^ ^ 0.800 1.58740 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.125 1.00000 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.125 0.79370 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.2 ^ ^ 0.483 1.49831 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.25 ^ ^ 0.280 1.97133 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.15 ^ ^ 0.335 1.25992 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.2 ^ ^ 0.276 1.47683 0.000
+particle note ~ ~2.25 ~ 0 0 0 1 1
@@ -0,0 +1,4 @@
+playsound block.note_block.bit_1 record @s[] ^-0.0 ^ ^ 0.434 0.62996 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.05 ^ ^ 0.256 0.73841 0.000
+playsound block.note_block.bit_1 record @s[] ^0.05 ^ ^ 0.305 0.74915 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.0 ^ ^ 0.248 0.62093 0.000
@@ -0,0 +1,10 @@
+playsound block.note_block.pling record @a[distance=..11.25] ^0.0 ^ ^ 0.600 0.50000 0.000
+playsound block.note_block.pling record @a[distance=..10.71] ^0.0 ^ ^ 0.900 0.62996 0.000
+playsound block.note_block.pling_-1 record @a[distance=..11.26] ^-2.0 ^ ^ 0.220 1.98848 0.000
+playsound block.note_block.pling record @a[distance=..10.73] ^-2.0 ^ ^ 0.220 0.62633 0.000
+playsound block.note_block.snare record @a[distance=..7.29] ^0.0 ^ ^ 0.400 0.79370 0.000
+playsound block.note_block.snare record @a[distance=..8.06] ^0.0 ^ ^ 0.600 0.62996 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.12] ^-1.0 ^ ^ 0.700 1.00000 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.27] ^-1.0 ^ ^ 0.400 0.73841 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.06] ^-1.0 ^ ^ 0.500 1.25992 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.12] ^-1.0 ^ ^ 0.400 0.98566 0.000
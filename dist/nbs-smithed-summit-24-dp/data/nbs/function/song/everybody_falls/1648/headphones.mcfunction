@@ -0,0 +1,10 @@
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.900 0.74915 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.800 0.56123 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.125 1.49831 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.125 1.12246 0.000
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 0.400 1.18921 0.000
+playsound block.note_block.bit_1 record @s[] ^0.6 ^ ^ 0.301 1.00000 0.000
+playsound block.note_block.bit_1 record @s[] ^0.55 ^ ^ 0.180 0.73841 0.000
+playsound block.note_block.bit_1 record @s[] ^0.65 ^ ^ 0.205 1.25992 0.000
+playsound block.note_block.bit_1 record @s[] ^0.6 ^ ^ 0.172 0.98566 0.000
+particle note ~ ~2.25 ~ 0 0 0 1 1
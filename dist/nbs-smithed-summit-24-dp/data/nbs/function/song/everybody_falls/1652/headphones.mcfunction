@@ -0,0 +1,8 @@
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.900 0.74915 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.800 0.56123 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.125 1.49831 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.125 1.12246 0.000
+playsound block.note_block.bit_1 record @s[] ^0.8 ^ ^ 0.259 1.49831 0.000
+playsound block.note_block.bit_1 record @s[] ^0.75 ^ ^ 0.152 1.97133 0.000
+playsound block.note_block.bit_1 record @s[] ^0.85 ^ ^ 0.175 1.25992 0.000
+playsound block.note_block.bit_1 record @s[] ^0.8 ^ ^ 0.148 1.47683 0.000
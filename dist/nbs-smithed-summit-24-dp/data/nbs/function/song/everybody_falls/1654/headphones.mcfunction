@@ -0,0 +1,15 @@
+playsound block.note_block.guitar_-1 record @s[] ^-0.0 ^ ^ 0.750 1.58740 0.000
+playsound block.note_block.guitar_-1 record @s[] ^-0.0 ^ ^ 0.680 1.58740 0.000
+playsound block.note_block.didgeridoo_-1 record @s[] ^-0.0 ^ ^ 0.600 1.58740 0.000
+playsound block.note_block.bass record @s[] ^-0.0 ^ ^ 1.000 0.79370 0.000
+playsound block.note_block.bass record @s[] ^-0.0 ^ ^ 0.600 0.79370 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.900 0.74915 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.800 0.56123 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.125 1.49831 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.125 1.12246 0.000
+playsound dig_gravel1 record @s[] ^-0.25 ^ ^ 0.700 1.58740 0.000
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 0.400 1.68179 0.000
+playsound block.note_block.bit_1 record @s[] ^0.9 ^ ^ 0.231 1.00000 0.000
+playsound block.note_block.bit_1 record @s[] ^0.85 ^ ^ 0.140 1.24186 0.000
+playsound block.note_block.bit_1 record @s[] ^0.95 ^ ^ 0.160 0.74915 0.000
+playsound block.note_block.bit_1 record @s[] ^0.9 ^ ^ 0.132 0.98566 0.000
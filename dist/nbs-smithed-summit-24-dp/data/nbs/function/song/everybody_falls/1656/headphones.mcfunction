@@ -0,0 +1,8 @@
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 0.480 0.50000 0.000
+playsound block.note_block.snare record @s[] ^-0.6 ^ ^ 0.480 1.00000 0.000
+playsound random_wood_click record @s[] ^0.6 ^ ^ 0.480 1.00000 0.000
+playsound block.note_block.bit_1 record @s[] ^1.0 ^ ^ 0.210 0.62996 0.000
+playsound block.note_block.bit_1 record @s[] ^0.95 ^ ^ 0.128 0.73841 0.000
+playsound block.note_block.bit_1 record @s[] ^0.95 ^ ^ 0.145 0.74915 0.000
+playsound block.note_block.bit_1 record @s[] ^1.0 ^ ^ 0.120 0.62093 0.000
+particle note ~ ~2.25 ~ 0 0 0 1 1
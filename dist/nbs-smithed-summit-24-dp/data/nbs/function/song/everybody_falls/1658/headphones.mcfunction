@@ -0,0 +1,11 @@
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.900 0.59460 0.000
+playsound block.note_block.pling_-1 record @s[] ^-0.0 ^ ^ 0.800 1.78180 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.125 1.18921 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.125 0.89090 0.000
+playsound block.note_block.basedrum record @s[] ^-0.0 ^ ^ 1.000 0.50000 0.000
+playsound block.note_block.basedrum record @s[] ^-0.0 ^ ^ 0.680 1.00000 0.000
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 0.400 1.41421 0.000
+playsound block.note_block.bit_1 record @s[] ^0.9 ^ ^ 0.189 1.00000 0.000
+playsound block.note_block.bit_1 record @s[] ^0.95 ^ ^ 0.116 0.73841 0.000
+playsound block.note_block.bit_1 record @s[] ^0.85 ^ ^ 0.125 1.25992 0.000
+playsound block.note_block.bit_1 record @s[] ^0.9 ^ ^ 0.108 0.98566 0.000
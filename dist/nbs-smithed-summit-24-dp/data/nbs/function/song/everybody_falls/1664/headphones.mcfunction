@@ -0,0 +1,9 @@
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.900 0.59460 0.000
+playsound block.note_block.pling_-1 record @s[] ^-0.0 ^ ^ 0.800 1.78180 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.125 1.18921 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.125 0.89090 0.000
+playsound block.note_block.bit_1 record @s[] ^0.6 ^ ^ 0.119 1.00000 0.000
+playsound block.note_block.bit_1 record @s[] ^0.65 ^ ^ 0.076 1.24186 0.000
+playsound block.note_block.bit_1 record @s[] ^0.55 ^ ^ 0.080 0.74915 0.000
+playsound block.note_block.bit_1 record @s[] ^0.6 ^ ^ 0.068 0.98566 0.000
+particle note ~ ~2.25 ~ 0 0 0 1 1
@@ -0,0 +1,4 @@
+playsound block.note_block.bit_1 record @s[] ^0.4 ^ ^ 0.077 1.00000 0.000
+playsound block.note_block.bit_1 record @s[] ^0.45 ^ ^ 0.048 0.73841 0.000
+playsound block.note_block.bit_1 record @s[] ^0.35 ^ ^ 0.045 1.25992 0.000
+playsound block.note_block.bit_1 record @s[] ^0.4 ^ ^ 0.044 0.98566 0.000
@@ -0,0 +1,17 @@
+playsound block.note_block.guitar_-1 record @s[] ^-0.0 ^ ^ 0.750 1.58740 0.000
+playsound block.note_block.guitar_-1 record @s[] ^-0.0 ^ ^ 0.680 1.58740 0.000
+playsound block.note_block.didgeridoo_-1 record @s[] ^-0.0 ^ ^ 0.600 1.58740 0.000
+playsound block.note_block.bass record @s[] ^-0.0 ^ ^ 1.000 0.79370 0.000
+playsound block.note_block.bass record @s[] ^-0.0 ^ ^ 0.600 0.79370 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.900 0.59460 0.000
+playsound block.note_block.pling_-1 record @s[] ^-0.0 ^ ^ 0.800 1.78180 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.125 1.18921 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.125 0.89090 0.000
+playsound ambient_cave_cave11 record @s[] ^-0.0 ^ ^ 0.450 1.00000 0.000
+playsound ambient_cave_cave11 record @s[] ^-0.0 ^ ^ 0.450 1.00000 0.000
+playsound dig_gravel1 record @s[] ^-0.25 ^ ^ 0.700 1.58740 0.000
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 0.400 1.68179 0.000
+playsound block.note_block.bit_1 record @s[] ^0.3 ^ ^ 0.056 1.49831 0.000
+playsound block.note_block.bit_1 record @s[] ^0.35 ^ ^ 0.036 1.24186 0.000
+playsound block.note_block.bit_1 record @s[] ^0.25 ^ ^ 0.030 2.00000 0.000
+playsound block.note_block.bit_1 record @s[] ^0.3 ^ ^ 0.032 1.47683 0.000
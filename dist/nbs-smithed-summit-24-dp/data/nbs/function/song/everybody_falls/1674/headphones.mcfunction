@@ -0,0 +1,12 @@
+playsound ambient_cave_cave11 record @s[] ^-0.0 ^ ^ 0.450 1.49831 0.000
+playsound ambient_cave_cave11 record @s[] ^-0.0 ^ ^ 0.450 1.49831 0.000
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 0.800 0.50000 0.000
+playsound block.note_block.snare record @s[] ^-0.6 ^ ^ 0.800 1.00000 0.000
+playsound random_wood_click record @s[] ^0.6 ^ ^ 0.800 1.00000 0.000
+playsound random_click_stereo record @s[] ^-0.0 ^ ^ 0.520 1.78180 0.000
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 0.750 1.68179 0.000
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 0.400 2.00000 0.000
+playsound block.note_block.bit_1 record @s[] ^0.1 ^ ^ 0.007 1.00000 0.000
+playsound block.note_block.bit_1 record @s[] ^0.15 ^ ^ 0.012 1.24186 0.000
+playsound block.note_block.bit_1 record @s[] ^0.05 ^ ^ 0.000 0.74915 0.000
+playsound block.note_block.bit_1 record @s[] ^0.1 ^ ^ 0.004 0.98566 0.000
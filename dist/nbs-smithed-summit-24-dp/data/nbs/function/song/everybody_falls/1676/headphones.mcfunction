@@ -0,0 +1 @@
+playsound block.note_block.bit_1 record @s[] ^0.05 ^ ^ 0.000 0.73841 0.000
@@ -0,0 +1,2 @@
+playsound ambient_cave_cave11 record @s[] ^-0.0 ^ ^ 0.450 2.00000 0.000
+playsound ambient_cave_cave11 record @s[] ^-0.0 ^ ^ 0.450 2.00000 0.000
@@ -0,0 +1,2 @@
+playsound ambient_cave_cave11 record @a[distance=..48.00] ^0.0 ^ ^ 0.979 2.00000 0.000
+playsound ambient_cave_cave11 record @a[distance=..48.00] ^0.0 ^ ^ 0.979 2.00000 0.000
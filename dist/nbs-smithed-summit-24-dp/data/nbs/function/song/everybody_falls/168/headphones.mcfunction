@@ -0,0 +1,12 @@
+playsound block.note_block.pling_-1 record @s[] ^-0.0 ^ ^ 0.600 1.78180 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.900 0.74915 0.000
+playsound block.note_block.pling_-1 record @s[] ^-0.8 ^ ^ 0.250 1.77154 0.000
+playsound block.note_block.pling record @s[] ^-0.8 ^ ^ 0.250 0.74484 0.000
+playsound block.note_block.basedrum record @s[] ^-0.0 ^ ^ 0.750 1.00000 0.000
+playsound block.note_block.basedrum record @s[] ^-0.0 ^ ^ 0.750 0.84090 0.000
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 0.300 0.89090 0.000
+playsound block.note_block.bit_1 record @s[] ^0.3 ^ ^ 0.700 1.49831 0.000
+playsound block.note_block.bit_1 record @s[] ^0.25 ^ ^ 0.400 1.97133 0.000
+playsound block.note_block.bit_1 record @s[] ^0.35 ^ ^ 0.500 1.25992 0.000
+playsound block.note_block.bit_1 record @s[] ^0.3 ^ ^ 0.400 1.47683 0.000
+particle note ~ ~2.25 ~ 0 0 0 1 1
@@ -0,0 +1,21 @@
+playsound block.note_block.bit record @s[] ^-0.0 ^ ^ 1.000 2.00000 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.0 ^ ^ 1.000 0.62996 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.0 ^ ^ 1.000 0.74915 0.000
+playsound block.note_block.bit record @s[] ^-0.0 ^ ^ 1.000 2.00000 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.0 ^ ^ 1.000 0.62996 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.0 ^ ^ 1.000 0.74915 0.000
+playsound block.note_block.bit record @s[] ^-1.0 ^ ^ 1.000 1.97133 0.000
+playsound block.note_block.bit_1 record @s[] ^-1.0 ^ ^ 1.000 0.62093 0.000
+playsound block.note_block.bit_1 record @s[] ^-1.0 ^ ^ 1.000 0.73841 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.0 ^ ^ 1.000 0.50290 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.0 ^ ^ 1.000 0.63361 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.0 ^ ^ 1.000 0.75349 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.0 ^ ^ 1.000 0.50290 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.0 ^ ^ 1.000 0.63361 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.0 ^ ^ 1.000 0.75349 0.000
+playsound block.note_block.bit record @s[] ^1.0 ^ ^ 1.000 1.98275 0.000
+playsound block.note_block.bit_1 record @s[] ^1.0 ^ ^ 1.000 0.62453 0.000
+playsound block.note_block.bit_1 record @s[] ^1.0 ^ ^ 1.000 0.74269 0.000
+playsound block.note_block.bit record @s[] ^-0.0 ^ ^ 0.100 1.00579 0.000
+playsound block.note_block.bit record @s[] ^-0.0 ^ ^ 0.100 1.26722 0.000
+playsound block.note_block.bit record @s[] ^-0.0 ^ ^ 0.100 1.50699 0.000
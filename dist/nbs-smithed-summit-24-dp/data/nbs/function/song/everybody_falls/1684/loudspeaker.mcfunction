@@ -0,0 +1,21 @@
+playsound block.note_block.bit record @a[distance=..48.00] ^0.0 ^ ^ 2.338 2.00000 0.000
+playsound block.note_block.bit_1 record @a[distance=..48.00] ^0.0 ^ ^ 2.284 0.62996 0.000
+playsound block.note_block.bit_1 record @a[distance=..48.00] ^0.0 ^ ^ 2.243 0.74915 0.000
+playsound block.note_block.bit record @a[distance=..48.00] ^0.0 ^ ^ 2.338 2.00000 0.000
+playsound block.note_block.bit_1 record @a[distance=..48.00] ^0.0 ^ ^ 2.284 0.62996 0.000
+playsound block.note_block.bit_1 record @a[distance=..48.00] ^0.0 ^ ^ 2.243 0.74915 0.000
+playsound block.note_block.bit record @a[distance=..48.00] ^4.0 ^ ^ 2.341 1.97133 0.000
+playsound block.note_block.bit_1 record @a[distance=..48.00] ^4.0 ^ ^ 2.287 0.62093 0.000
+playsound block.note_block.bit_1 record @a[distance=..48.00] ^4.0 ^ ^ 2.247 0.73841 0.000
+playsound block.note_block.bit_1 record @a[distance=..48.00] ^0.0 ^ ^ 2.336 0.50290 0.000
+playsound block.note_block.bit_1 record @a[distance=..48.00] ^0.0 ^ ^ 2.282 0.63361 0.000
+playsound block.note_block.bit_1 record @a[distance=..48.00] ^0.0 ^ ^ 2.242 0.75349 0.000
+playsound block.note_block.bit_1 record @a[distance=..48.00] ^0.0 ^ ^ 2.336 0.50290 0.000
+playsound block.note_block.bit_1 record @a[distance=..48.00] ^0.0 ^ ^ 2.282 0.63361 0.000
+playsound block.note_block.bit_1 record @a[distance=..48.00] ^0.0 ^ ^ 2.242 0.75349 0.000
+playsound block.note_block.bit record @a[distance=..48.00] ^-4.0 ^ ^ 2.340 1.98275 0.000
+playsound block.note_block.bit_1 record @a[distance=..48.00] ^-4.0 ^ ^ 2.286 0.62453 0.000
+playsound block.note_block.bit_1 record @a[distance=..48.00] ^-4.0 ^ ^ 2.245 0.74269 0.000
+playsound block.note_block.bit record @a[distance=..48.00] ^0.0 ^ ^ 0.250 1.00579 0.000
+playsound block.note_block.bit record @a[distance=..48.00] ^0.0 ^ ^ 0.244 1.26722 0.000
+playsound block.note_block.bit record @a[distance=..48.00] ^0.0 ^ ^ 0.240 1.50699 0.000
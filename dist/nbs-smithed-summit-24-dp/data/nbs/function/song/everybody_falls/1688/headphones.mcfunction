@@ -0,0 +1,10 @@
+playsound block.note_block.bit record @s[] ^-0.0 ^ ^ 1.000 2.00000 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.0 ^ ^ 1.000 0.62996 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.0 ^ ^ 1.000 0.74915 0.000
+playsound block.note_block.bit record @s[] ^-0.0 ^ ^ 1.000 2.00000 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.0 ^ ^ 1.000 0.62996 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.0 ^ ^ 1.000 0.74915 0.000
+playsound block.note_block.bit record @s[] ^-1.0 ^ ^ 1.000 1.97133 0.000
+playsound block.note_block.bit_1 record @s[] ^-1.0 ^ ^ 1.000 0.62093 0.000
+playsound block.note_block.bit_1 record @s[] ^-1.0 ^ ^ 1.000 0.73841 0.000
+particle note ~ ~2.25 ~ 0 0 0 1 1
@@ -0,0 +1 @@
+particle note ~ ~2.25 ~ 0 0 0 1 1
@@ -0,0 +1,7 @@
+playsound block.note_block.guitar record @s[] ^-0.0 ^ ^ 0.750 1.00000 0.000
+playsound block.note_block.guitar record @s[] ^-0.0 ^ ^ 0.680 1.00000 0.000
+playsound block.note_block.didgeridoo record @s[] ^-0.0 ^ ^ 0.600 1.00000 0.000
+playsound block.note_block.bass record @s[] ^-0.0 ^ ^ 1.000 1.00000 0.000
+playsound block.note_block.bass record @s[] ^-0.0 ^ ^ 0.600 1.00000 0.000
+playsound dig_gravel1 record @s[] ^-0.25 ^ ^ 0.700 1.58740 0.000
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 0.400 2.00000 0.000
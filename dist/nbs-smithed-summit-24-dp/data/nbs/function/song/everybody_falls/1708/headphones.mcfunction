@@ -0,0 +1,2 @@
+playsound dig_gravel1 record @s[] ^-0.25 ^ ^ 0.350 1.58740 0.000
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 0.400 1.68179 0.000
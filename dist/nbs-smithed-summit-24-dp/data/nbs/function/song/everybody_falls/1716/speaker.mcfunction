@@ -0,0 +1 @@
+playsound dig_gravel1 record @a[distance=..6.23] ^0.0 ^ ^ 0.350 1.58740 0.000
@@ -0,0 +1,10 @@
+playsound random_wood_click record @a[distance=..48.00] ^0.0 ^ ^ 1.271 0.59460 0.000
+playsound random_wood_click record @a[distance=..48.00] ^0.0 ^ ^ 1.271 0.59460 0.000
+playsound block.note_block.snare record @a[distance=..48.00] ^0.0 ^ ^ 1.968 0.59460 0.000
+playsound block.note_block.snare record @a[distance=..48.00] ^0.0 ^ ^ 1.946 0.66742 0.000
+playsound block.note_block.snare record @a[distance=..48.00] ^0.0 ^ ^ 1.924 0.74915 0.000
+playsound block.note_block.snare record @a[distance=..48.00] ^0.0 ^ ^ 0.935 1.00000 0.000
+playsound block.note_block.bit_1 record @a[distance=..48.00] ^-2.0 ^ ^ 1.599 0.62996 0.000
+playsound block.note_block.bit_1 record @a[distance=..48.00] ^-2.0 ^ ^ 0.899 0.73841 0.000
+playsound block.note_block.bit_1 record @a[distance=..48.00] ^-3.0 ^ ^ 1.122 0.74915 0.000
+playsound block.note_block.bit_1 record @a[distance=..48.00] ^-2.0 ^ ^ 0.915 0.62093 0.000
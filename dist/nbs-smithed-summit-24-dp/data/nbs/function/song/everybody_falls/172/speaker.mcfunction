@@ -0,0 +1,10 @@
+playsound random_wood_click record @a[distance=..8.28] ^0.0 ^ ^ 0.517 0.59460 0.000
+playsound random_wood_click record @a[distance=..8.28] ^0.0 ^ ^ 0.517 0.59460 0.000
+playsound block.note_block.snare record @a[distance=..8.28] ^0.0 ^ ^ 0.800 0.59460 0.000
+playsound block.note_block.snare record @a[distance=..7.85] ^0.0 ^ ^ 0.800 0.66742 0.000
+playsound block.note_block.snare record @a[distance=..7.46] ^0.0 ^ ^ 0.800 0.74915 0.000
+playsound block.note_block.snare record @a[distance=..6.75] ^0.0 ^ ^ 0.400 1.00000 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.42] ^-1.0 ^ ^ 0.700 0.62996 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.27] ^-1.0 ^ ^ 0.400 0.73841 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.26] ^-2.0 ^ ^ 0.500 0.74915 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.43] ^-1.0 ^ ^ 0.400 0.62093 0.000
@@ -0,0 +1,11 @@
+playsound block.note_block.guitar_-1 record @s[] ^-0.0 ^ ^ 0.225 1.88775 0.000
+playsound block.note_block.guitar_-1 record @s[] ^-0.0 ^ ^ 0.204 1.88775 0.000
+playsound block.note_block.didgeridoo_-1 record @s[] ^-0.0 ^ ^ 0.180 1.88775 0.000
+playsound block.note_block.bass_-1 record @s[] ^-0.0 ^ ^ 0.300 1.88775 0.000
+playsound block.note_block.bass_-1 record @s[] ^-0.0 ^ ^ 0.180 1.88775 0.000
+playsound entity_witch_hurt1 record @s[] ^-0.0 ^ ^ 0.450 2.00000 0.000
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 0.800 0.50000 0.000
+playsound block.note_block.snare record @s[] ^-0.6 ^ ^ 0.800 1.00000 0.000
+playsound random_wood_click record @s[] ^0.6 ^ ^ 0.584 1.00000 0.000
+playsound dig_gravel1 record @s[] ^-0.25 ^ ^ 0.700 1.58740 0.000
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 0.400 2.00000 0.000
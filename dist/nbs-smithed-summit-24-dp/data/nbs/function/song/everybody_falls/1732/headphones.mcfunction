@@ -0,0 +1,6 @@
+playsound block.note_block.guitar record @s[] ^-0.0 ^ ^ 0.750 0.94387 0.000
+playsound block.note_block.guitar record @s[] ^-0.0 ^ ^ 0.680 0.94387 0.000
+playsound block.note_block.didgeridoo record @s[] ^-0.0 ^ ^ 0.600 0.94387 0.000
+playsound block.note_block.bass record @s[] ^-0.0 ^ ^ 1.000 0.94387 0.000
+playsound block.note_block.bass record @s[] ^-0.0 ^ ^ 0.600 0.94387 0.000
+playsound dig_gravel1 record @s[] ^-0.25 ^ ^ 0.350 1.58740 0.000
@@ -0,0 +1,6 @@
+playsound block.note_block.guitar record @a[distance=..48.00] ^0.0 ^ ^ 2.007 0.94387 0.000
+playsound block.note_block.guitar record @a[distance=..48.00] ^0.0 ^ ^ 1.819 0.94387 0.000
+playsound block.note_block.didgeridoo record @a[distance=..48.00] ^0.0 ^ ^ 1.703 0.94387 0.000
+playsound block.note_block.bass record @a[distance=..48.00] ^0.0 ^ ^ 2.838 0.94387 0.000
+playsound block.note_block.bass record @a[distance=..48.00] ^0.0 ^ ^ 1.703 0.94387 0.000
+playsound dig_gravel1 record @a[distance=..48.00] ^1.0 ^ ^ 0.780 1.58740 0.000
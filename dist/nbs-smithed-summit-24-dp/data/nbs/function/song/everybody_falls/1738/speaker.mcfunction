@@ -0,0 +1,7 @@
+playsound block.note_block.guitar record @a[distance=..11.44] ^0.0 ^ ^ 0.750 0.89090 0.000
+playsound block.note_block.guitar record @a[distance=..11.44] ^0.0 ^ ^ 0.680 0.89090 0.000
+playsound block.note_block.didgeridoo record @a[distance=..11.91] ^0.0 ^ ^ 0.600 0.89090 0.000
+playsound block.note_block.bass record @a[distance=..11.91] ^0.0 ^ ^ 1.000 0.89090 0.000
+playsound block.note_block.bass record @a[distance=..11.91] ^0.0 ^ ^ 0.600 0.89090 0.000
+playsound dig_gravel1 record @a[distance=..6.23] ^0.0 ^ ^ 0.700 1.58740 0.000
+playsound block.note_block.snare record @a[distance=..6.12] ^0.0 ^ ^ 0.400 2.00000 0.000
@@ -0,0 +1,11 @@
+playsound block.note_block.pling_-1 record @s[] ^-0.0 ^ ^ 0.600 1.78180 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.900 0.74915 0.000
+playsound block.note_block.pling_-1 record @s[] ^-0.8 ^ ^ 0.300 1.77154 0.000
+playsound block.note_block.pling record @s[] ^-0.8 ^ ^ 0.300 0.74484 0.000
+playsound block.note_block.basedrum record @s[] ^-0.0 ^ ^ 0.750 1.00000 0.000
+playsound block.note_block.basedrum record @s[] ^-0.0 ^ ^ 0.750 0.84090 0.000
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 0.200 1.05946 0.000
+playsound block.note_block.bit_1 record @s[] ^0.6 ^ ^ 0.700 1.00000 0.000
+playsound block.note_block.bit_1 record @s[] ^0.55 ^ ^ 0.400 0.73841 0.000
+playsound block.note_block.bit_1 record @s[] ^0.65 ^ ^ 0.500 1.25992 0.000
+playsound block.note_block.bit_1 record @s[] ^0.6 ^ ^ 0.400 0.98566 0.000
@@ -0,0 +1,7 @@
+playsound block.note_block.guitar_-1 record @a[distance=..11.93] ^0.0 ^ ^ 0.225 1.68179 0.000
+playsound block.note_block.guitar_-1 record @a[distance=..11.93] ^0.0 ^ ^ 0.204 1.68179 0.000
+playsound block.note_block.didgeridoo_-1 record @a[distance=..11.99] ^0.0 ^ ^ 0.180 1.68179 0.000
+playsound block.note_block.bass_-1 record @a[distance=..11.99] ^0.0 ^ ^ 0.300 1.68179 0.000
+playsound block.note_block.bass_-1 record @a[distance=..11.99] ^0.0 ^ ^ 0.180 1.68179 0.000
+playsound dig_gravel1 record @a[distance=..6.23] ^0.0 ^ ^ 0.350 1.58740 0.000
+playsound block.note_block.snare record @a[distance=..6.31] ^0.0 ^ ^ 0.400 1.41421 0.000
@@ -0,0 +1,7 @@
+playsound block.note_block.guitar record @s[] ^-0.0 ^ ^ 0.750 0.84090 0.000
+playsound block.note_block.guitar record @s[] ^-0.0 ^ ^ 0.680 0.84090 0.000
+playsound block.note_block.didgeridoo record @s[] ^-0.0 ^ ^ 0.600 0.84090 0.000
+playsound block.note_block.bass record @s[] ^-0.0 ^ ^ 1.000 0.84090 0.000
+playsound block.note_block.bass record @s[] ^-0.0 ^ ^ 0.600 0.84090 0.000
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 0.400 1.18921 0.000
+particle note ~ ~2.25 ~ 0 0 0 1 1
@@ -0,0 +1,11 @@
+playsound block.note_block.guitar record @a[distance=..11.52] ^0.0 ^ ^ 0.750 0.84090 0.000
+playsound block.note_block.guitar record @a[distance=..11.52] ^0.0 ^ ^ 0.680 0.84090 0.000
+playsound block.note_block.didgeridoo record @a[distance=..11.93] ^0.0 ^ ^ 0.600 0.84090 0.000
+playsound block.note_block.bass record @a[distance=..11.93] ^0.0 ^ ^ 1.000 0.84090 0.000
+playsound block.note_block.bass record @a[distance=..11.93] ^0.0 ^ ^ 0.600 0.84090 0.000
+playsound block.note_block.snare record @a[distance=..6.48] ^0.0 ^ ^ 0.400 1.18921 0.000
+execute store result score #random nbs run random value 1..4
+execute if score #random nbs matches 1 if entity @a[distance=0..12] run function animated_java:music_speaker/animations/animation_speaker_beat_1/play
+execute if score #random nbs matches 2 if entity @a[distance=0..12] run function animated_java:music_speaker/animations/animation_speaker_beat_2/play
+execute if score #random nbs matches 3 if entity @a[distance=0..12] run function animated_java:music_speaker/animations/animation_speaker_beat_3/play
+execute if score #random nbs matches 4 if entity @a[distance=0..12] run function animated_java:music_speaker/animations/animation_speaker_beat_4/play
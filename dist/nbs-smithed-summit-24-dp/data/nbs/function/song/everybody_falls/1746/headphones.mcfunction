@@ -0,0 +1,12 @@
+playsound block.note_block.guitar record @s[] ^-0.0 ^ ^ 0.188 0.84090 0.000
+playsound block.note_block.guitar record @s[] ^-0.0 ^ ^ 0.170 0.84090 0.000
+playsound block.note_block.didgeridoo record @s[] ^-0.0 ^ ^ 0.150 0.84090 0.000
+playsound block.note_block.bass record @s[] ^-0.0 ^ ^ 0.250 0.84090 0.000
+playsound block.note_block.bass record @s[] ^-0.0 ^ ^ 0.150 0.84090 0.000
+playsound entity_witch_hurt1 record @s[] ^-0.0 ^ ^ 0.450 1.12246 0.000
+playsound entity_witch_hurt1 record @s[] ^-0.0 ^ ^ 0.450 1.12246 0.000
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 0.480 0.50000 0.000
+playsound block.note_block.snare record @s[] ^-0.6 ^ ^ 0.480 1.00000 0.000
+playsound random_wood_click record @s[] ^0.6 ^ ^ 0.376 1.00000 0.000
+playsound dig_gravel1 record @s[] ^-0.25 ^ ^ 0.700 1.58740 0.000
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 0.400 2.00000 0.000
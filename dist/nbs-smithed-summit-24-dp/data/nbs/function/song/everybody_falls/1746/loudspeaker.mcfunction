@@ -0,0 +1,12 @@
+playsound block.note_block.guitar record @a[distance=..48.00] ^0.0 ^ ^ 0.507 0.84090 0.000
+playsound block.note_block.guitar record @a[distance=..48.00] ^0.0 ^ ^ 0.459 0.84090 0.000
+playsound block.note_block.didgeridoo record @a[distance=..48.00] ^0.0 ^ ^ 0.430 0.84090 0.000
+playsound block.note_block.bass record @a[distance=..48.00] ^0.0 ^ ^ 0.716 0.84090 0.000
+playsound block.note_block.bass record @a[distance=..48.00] ^0.0 ^ ^ 0.430 0.84090 0.000
+playsound entity_witch_hurt1 record @a[distance=..48.00] ^0.0 ^ ^ 1.040 1.12246 0.000
+playsound entity_witch_hurt1 record @a[distance=..48.00] ^0.0 ^ ^ 1.040 1.12246 0.000
+playsound block.note_block.snare record @a[distance=..48.00] ^0.0 ^ ^ 1.200 0.50000 0.000
+playsound block.note_block.snare record @a[distance=..48.00] ^2.0 ^ ^ 1.122 1.00000 0.000
+playsound random_wood_click record @a[distance=..48.00] ^-3.0 ^ ^ 0.879 1.00000 0.000
+playsound dig_gravel1 record @a[distance=..48.00] ^1.0 ^ ^ 1.561 1.58740 0.000
+playsound block.note_block.snare record @a[distance=..48.00] ^0.0 ^ ^ 0.870 2.00000 0.000
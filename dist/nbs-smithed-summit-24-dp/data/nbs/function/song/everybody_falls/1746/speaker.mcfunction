@@ -0,0 +1,12 @@
+playsound block.note_block.guitar record @a[distance=..11.52] ^0.0 ^ ^ 0.188 0.84090 0.000
+playsound block.note_block.guitar record @a[distance=..11.52] ^0.0 ^ ^ 0.170 0.84090 0.000
+playsound block.note_block.didgeridoo record @a[distance=..11.93] ^0.0 ^ ^ 0.150 0.84090 0.000
+playsound block.note_block.bass record @a[distance=..11.93] ^0.0 ^ ^ 0.250 0.84090 0.000
+playsound block.note_block.bass record @a[distance=..11.93] ^0.0 ^ ^ 0.150 0.84090 0.000
+playsound entity_witch_hurt1 record @a[distance=..6.56] ^0.0 ^ ^ 0.450 1.12246 0.000
+playsound entity_witch_hurt1 record @a[distance=..6.56] ^0.0 ^ ^ 0.450 1.12246 0.000
+playsound block.note_block.snare record @a[distance=..9.00] ^0.0 ^ ^ 0.480 0.50000 0.000
+playsound block.note_block.snare record @a[distance=..6.75] ^1.0 ^ ^ 0.480 1.00000 0.000
+playsound random_wood_click record @a[distance=..6.75] ^-2.0 ^ ^ 0.376 1.00000 0.000
+playsound dig_gravel1 record @a[distance=..6.23] ^0.0 ^ ^ 0.700 1.58740 0.000
+playsound block.note_block.snare record @a[distance=..6.12] ^0.0 ^ ^ 0.400 2.00000 0.000
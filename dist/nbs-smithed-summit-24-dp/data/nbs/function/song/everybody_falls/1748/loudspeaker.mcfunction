@@ -0,0 +1,6 @@
+playsound block.note_block.guitar record @a[distance=..48.00] ^0.0 ^ ^ 0.507 0.84090 0.000
+playsound block.note_block.guitar record @a[distance=..48.00] ^0.0 ^ ^ 0.459 0.84090 0.000
+playsound block.note_block.didgeridoo record @a[distance=..48.00] ^0.0 ^ ^ 0.430 0.84090 0.000
+playsound block.note_block.bass record @a[distance=..48.00] ^0.0 ^ ^ 0.716 0.84090 0.000
+playsound block.note_block.bass record @a[distance=..48.00] ^0.0 ^ ^ 0.430 0.84090 0.000
+playsound dig_gravel1 record @a[distance=..48.00] ^1.0 ^ ^ 0.780 1.58740 0.000
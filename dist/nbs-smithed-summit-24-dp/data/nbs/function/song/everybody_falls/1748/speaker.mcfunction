@@ -0,0 +1,6 @@
+playsound block.note_block.guitar record @a[distance=..11.52] ^0.0 ^ ^ 0.188 0.84090 0.000
+playsound block.note_block.guitar record @a[distance=..11.52] ^0.0 ^ ^ 0.170 0.84090 0.000
+playsound block.note_block.didgeridoo record @a[distance=..11.93] ^0.0 ^ ^ 0.150 0.84090 0.000
+playsound block.note_block.bass record @a[distance=..11.93] ^0.0 ^ ^ 0.250 0.84090 0.000
+playsound block.note_block.bass record @a[distance=..11.93] ^0.0 ^ ^ 0.150 0.84090 0.000
+playsound dig_gravel1 record @a[distance=..6.23] ^0.0 ^ ^ 0.350 1.58740 0.000
@@ -0,0 +1,12 @@
+playsound block.note_block.pling_-1 record @s[] ^-0.0 ^ ^ 0.600 1.58740 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.900 0.50000 0.000
+playsound block.note_block.pling_-1 record @s[] ^-0.8 ^ ^ 0.360 1.57826 0.000
+playsound block.note_block.pling_-1 record @s[] ^-0.8 ^ ^ 0.360 1.98848 0.000
+playsound block.note_block.basedrum record @s[] ^-0.0 ^ ^ 0.750 1.00000 0.000
+playsound block.note_block.basedrum record @s[] ^-0.0 ^ ^ 0.750 0.84090 0.000
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 0.400 1.25992 0.000
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 0.600 1.00000 0.000
+playsound block.note_block.bit_1 record @s[] ^0.9 ^ ^ 0.693 1.00000 0.000
+playsound block.note_block.bit_1 record @s[] ^0.85 ^ ^ 0.400 1.24186 0.000
+playsound block.note_block.bit_1 record @s[] ^0.95 ^ ^ 0.490 0.74915 0.000
+playsound block.note_block.bit_1 record @s[] ^0.9 ^ ^ 0.396 0.98566 0.000
@@ -0,0 +1 @@
+playsound dig_gravel1 record @s[] ^-0.25 ^ ^ 0.350 1.58740 0.000
@@ -0,0 +1,9 @@
+playsound block.note_block.pling_-1 record @s[] ^-0.0 ^ ^ 0.600 1.58740 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.900 0.50000 0.000
+playsound block.note_block.pling_-1 record @s[] ^0.8 ^ ^ 0.380 1.57826 0.000
+playsound block.note_block.pling_-1 record @s[] ^0.8 ^ ^ 0.380 1.98848 0.000
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 0.200 1.33484 0.000
+playsound block.note_block.bit_1 record @s[] ^1.0 ^ ^ 0.679 0.62996 0.000
+playsound block.note_block.bit_1 record @s[] ^0.95 ^ ^ 0.392 0.73841 0.000
+playsound block.note_block.bit_1 record @s[] ^0.95 ^ ^ 0.480 0.74915 0.000
+playsound block.note_block.bit_1 record @s[] ^1.0 ^ ^ 0.388 0.62093 0.000
@@ -0,0 +1,9 @@
+playsound block.note_block.pling_-1 record @a[distance=..11.58] ^0.0 ^ ^ 0.600 1.58740 0.000
+playsound block.note_block.pling record @a[distance=..11.25] ^0.0 ^ ^ 0.900 0.50000 0.000
+playsound block.note_block.pling_-1 record @a[distance=..11.59] ^-2.0 ^ ^ 0.380 1.57826 0.000
+playsound block.note_block.pling_-1 record @a[distance=..11.26] ^-2.0 ^ ^ 0.380 1.98848 0.000
+playsound block.note_block.snare record @a[distance=..6.36] ^0.0 ^ ^ 0.200 1.33484 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.42] ^-2.0 ^ ^ 0.679 0.62996 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.27] ^-2.0 ^ ^ 0.392 0.73841 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.26] ^-2.0 ^ ^ 0.480 0.74915 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.43] ^-2.0 ^ ^ 0.388 0.62093 0.000
@@ -0,0 +1,3 @@
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.700 0.50000 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.700 0.62996 0.000
+particle note ~ ~2.25 ~ 0 0 0 1 1
@@ -0,0 +1,12 @@
+playsound block.note_block.pling_-1 record @s[] ^-0.0 ^ ^ 0.600 1.58740 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.900 0.50000 0.000
+playsound block.note_block.pling_-1 record @s[] ^-0.8 ^ ^ 0.410 1.57826 0.000
+playsound block.note_block.pling_-1 record @s[] ^-0.8 ^ ^ 0.410 1.98848 0.000
+playsound block.note_block.basedrum record @s[] ^-0.0 ^ ^ 0.750 1.00000 0.000
+playsound block.note_block.basedrum record @s[] ^-0.0 ^ ^ 0.750 0.84090 0.000
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 0.300 1.41421 0.000
+playsound block.note_block.bit_1 record @s[] ^0.9 ^ ^ 0.665 1.00000 0.000
+playsound block.note_block.bit_1 record @s[] ^0.95 ^ ^ 0.384 0.73841 0.000
+playsound block.note_block.bit_1 record @s[] ^0.85 ^ ^ 0.470 1.25992 0.000
+playsound block.note_block.bit_1 record @s[] ^0.9 ^ ^ 0.380 0.98566 0.000
+particle note ~ ~2.25 ~ 0 0 0 1 1
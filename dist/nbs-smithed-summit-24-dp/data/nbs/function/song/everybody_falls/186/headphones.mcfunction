@@ -0,0 +1,9 @@
+playsound block.note_block.pling_-1 record @s[] ^-0.0 ^ ^ 0.600 1.58740 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.900 0.50000 0.000
+playsound block.note_block.pling_-1 record @s[] ^0.8 ^ ^ 0.440 1.57826 0.000
+playsound block.note_block.pling_-1 record @s[] ^0.8 ^ ^ 0.440 1.98848 0.000
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 0.200 1.49831 0.000
+playsound block.note_block.bit_1 record @s[] ^0.8 ^ ^ 0.651 1.49831 0.000
+playsound block.note_block.bit_1 record @s[] ^0.85 ^ ^ 0.376 1.24186 0.000
+playsound block.note_block.bit_1 record @s[] ^0.75 ^ ^ 0.460 2.00000 0.000
+playsound block.note_block.bit_1 record @s[] ^0.8 ^ ^ 0.372 1.47683 0.000
@@ -0,0 +1,10 @@
+playsound block.note_block.guitar record @a[distance=..48.00] ^0.0 ^ ^ 2.098 0.56123 0.000
+playsound block.note_block.guitar record @a[distance=..48.00] ^0.0 ^ ^ 1.902 0.56123 0.000
+playsound block.note_block.didgeridoo record @a[distance=..48.00] ^0.0 ^ ^ 1.776 0.56123 0.000
+playsound block.note_block.bass record @a[distance=..48.00] ^0.0 ^ ^ 2.959 0.56123 0.000
+playsound block.note_block.bass record @a[distance=..48.00] ^0.0 ^ ^ 1.776 0.56123 0.000
+playsound block.note_block.pling record @a[distance=..48.00] ^0.0 ^ ^ 1.864 0.50000 0.000
+playsound block.note_block.pling record @a[distance=..48.00] ^0.0 ^ ^ 1.826 0.62996 0.000
+playsound block.note_block.pling record @a[distance=..48.00] ^0.0 ^ ^ 1.797 0.74915 0.000
+playsound dig_gravel1 record @a[distance=..48.00] ^1.0 ^ ^ 0.780 1.58740 0.000
+playsound block.note_block.snare record @a[distance=..48.00] ^0.0 ^ ^ 0.886 1.68179 0.000
@@ -0,0 +1,14 @@
+playsound block.note_block.pling_-1 record @s[] ^-0.0 ^ ^ 0.600 1.58740 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.900 0.50000 0.000
+playsound block.note_block.pling_-1 record @s[] ^-0.8 ^ ^ 0.470 1.57826 0.000
+playsound block.note_block.pling_-1 record @s[] ^-0.8 ^ ^ 0.470 1.98848 0.000
+playsound random_wood_click record @s[] ^-0.0 ^ ^ 0.517 0.66742 0.000
+playsound random_wood_click record @s[] ^-0.0 ^ ^ 0.517 0.66742 0.000
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 0.800 0.66742 0.000
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 0.800 0.74915 0.000
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 0.800 0.84090 0.000
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 0.400 1.58740 0.000
+playsound block.note_block.bit_1 record @s[] ^0.7 ^ ^ 0.637 1.49831 0.000
+playsound block.note_block.bit_1 record @s[] ^0.75 ^ ^ 0.368 1.97133 0.000
+playsound block.note_block.bit_1 record @s[] ^0.65 ^ ^ 0.450 1.25992 0.000
+playsound block.note_block.bit_1 record @s[] ^0.7 ^ ^ 0.364 1.47683 0.000
@@ -0,0 +1,14 @@
+playsound block.note_block.pling_-1 record @a[distance=..48.00] ^0.0 ^ ^ 1.630 1.58740 0.000
+playsound block.note_block.pling record @a[distance=..48.00] ^0.0 ^ ^ 2.396 0.50000 0.000
+playsound block.note_block.pling_-1 record @a[distance=..48.00] ^3.0 ^ ^ 1.277 1.57826 0.000
+playsound block.note_block.pling_-1 record @a[distance=..48.00] ^3.0 ^ ^ 1.252 1.98848 0.000
+playsound random_wood_click record @a[distance=..48.00] ^0.0 ^ ^ 1.257 0.66742 0.000
+playsound random_wood_click record @a[distance=..48.00] ^0.0 ^ ^ 1.257 0.66742 0.000
+playsound block.note_block.snare record @a[distance=..48.00] ^0.0 ^ ^ 1.946 0.66742 0.000
+playsound block.note_block.snare record @a[distance=..48.00] ^0.0 ^ ^ 1.924 0.74915 0.000
+playsound block.note_block.snare record @a[distance=..48.00] ^0.0 ^ ^ 1.903 0.84090 0.000
+playsound block.note_block.snare record @a[distance=..48.00] ^0.0 ^ ^ 0.892 1.58740 0.000
+playsound block.note_block.bit_1 record @a[distance=..48.00] ^-3.0 ^ ^ 1.326 1.49831 0.000
+playsound block.note_block.bit_1 record @a[distance=..48.00] ^-3.0 ^ ^ 0.742 1.97133 0.000
+playsound block.note_block.bit_1 record @a[distance=..48.00] ^-3.0 ^ ^ 0.955 1.25992 0.000
+playsound block.note_block.bit_1 record @a[distance=..48.00] ^-3.0 ^ ^ 0.759 1.47683 0.000
@@ -0,0 +1,14 @@
+playsound block.note_block.pling_-1 record @a[distance=..11.58] ^0.0 ^ ^ 0.600 1.58740 0.000
+playsound block.note_block.pling record @a[distance=..11.25] ^0.0 ^ ^ 0.900 0.50000 0.000
+playsound block.note_block.pling_-1 record @a[distance=..11.59] ^1.0 ^ ^ 0.470 1.57826 0.000
+playsound block.note_block.pling_-1 record @a[distance=..11.26] ^1.0 ^ ^ 0.470 1.98848 0.000
+playsound random_wood_click record @a[distance=..7.85] ^0.0 ^ ^ 0.517 0.66742 0.000
+playsound random_wood_click record @a[distance=..7.85] ^0.0 ^ ^ 0.517 0.66742 0.000
+playsound block.note_block.snare record @a[distance=..7.85] ^0.0 ^ ^ 0.800 0.66742 0.000
+playsound block.note_block.snare record @a[distance=..7.46] ^0.0 ^ ^ 0.800 0.74915 0.000
+playsound block.note_block.snare record @a[distance=..7.13] ^0.0 ^ ^ 0.800 0.84090 0.000
+playsound block.note_block.snare record @a[distance=..6.23] ^0.0 ^ ^ 0.400 1.58740 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.04] ^-2.0 ^ ^ 0.637 1.49831 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.02] ^-2.0 ^ ^ 0.368 1.97133 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.06] ^-2.0 ^ ^ 0.450 1.25992 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.04] ^-2.0 ^ ^ 0.364 1.47683 0.000
@@ -0,0 +1,5 @@
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 0.200 1.68179 0.000
+playsound block.note_block.bit_1 record @s[] ^0.6 ^ ^ 0.623 1.00000 0.000
+playsound block.note_block.bit_1 record @s[] ^0.65 ^ ^ 0.360 1.24186 0.000
+playsound block.note_block.bit_1 record @s[] ^0.55 ^ ^ 0.440 0.74915 0.000
+playsound block.note_block.bit_1 record @s[] ^0.6 ^ ^ 0.356 0.98566 0.000
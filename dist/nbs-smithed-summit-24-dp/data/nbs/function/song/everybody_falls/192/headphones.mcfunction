@@ -0,0 +1,10 @@
+playsound block.note_block.pling_-1 record @s[] ^-0.0 ^ ^ 0.600 1.58740 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.900 0.50000 0.000
+playsound block.note_block.pling_-1 record @s[] ^0.8 ^ ^ 0.500 1.57826 0.000
+playsound block.note_block.pling_-1 record @s[] ^0.8 ^ ^ 0.500 1.98848 0.000
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 0.300 1.78180 0.000
+playsound block.note_block.bit_1 record @s[] ^0.5 ^ ^ 0.609 0.62996 0.000
+playsound block.note_block.bit_1 record @s[] ^0.55 ^ ^ 0.352 0.73841 0.000
+playsound block.note_block.bit_1 record @s[] ^0.45 ^ ^ 0.430 0.74915 0.000
+playsound block.note_block.bit_1 record @s[] ^0.5 ^ ^ 0.348 0.62093 0.000
+particle note ~ ~2.25 ~ 0 0 0 1 1
@@ -0,0 +1,9 @@
+playsound block.note_block.pling_-1 record @s[] ^-0.0 ^ ^ 0.600 1.58740 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.900 0.50000 0.000
+playsound block.note_block.pling_-1 record @s[] ^-0.8 ^ ^ 0.520 1.57826 0.000
+playsound block.note_block.pling_-1 record @s[] ^-0.8 ^ ^ 0.520 1.98848 0.000
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 0.200 1.88775 0.000
+playsound block.note_block.bit_1 record @s[] ^0.4 ^ ^ 0.595 1.00000 0.000
+playsound block.note_block.bit_1 record @s[] ^0.45 ^ ^ 0.344 0.73841 0.000
+playsound block.note_block.bit_1 record @s[] ^0.35 ^ ^ 0.420 1.25992 0.000
+playsound block.note_block.bit_1 record @s[] ^0.4 ^ ^ 0.340 0.98566 0.000
@@ -0,0 +1,4 @@
+playsound block.note_block.pling record @a[distance=..48.00] ^0.0 ^ ^ 1.230 0.50000 0.000
+playsound block.note_block.pling record @a[distance=..48.00] ^0.0 ^ ^ 1.205 0.62996 0.000
+playsound block.note_block.pling record @a[distance=..48.00] ^0.0 ^ ^ 1.186 0.74915 0.000
+playsound block.note_block.pling record @a[distance=..48.00] ^0.0 ^ ^ 1.155 1.00000 0.000
@@ -0,0 +1,4 @@
+playsound block.note_block.pling record @a[distance=..11.25] ^0.0 ^ ^ 0.462 0.50000 0.000
+playsound block.note_block.pling record @a[distance=..10.71] ^0.0 ^ ^ 0.462 0.62996 0.000
+playsound block.note_block.pling record @a[distance=..10.15] ^0.0 ^ ^ 0.462 0.74915 0.000
+playsound block.note_block.pling record @a[distance=..9.00] ^0.0 ^ ^ 0.462 1.00000 0.000
@@ -0,0 +1,6 @@
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.231 0.50000 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.231 0.62996 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.231 0.74915 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.231 1.00000 0.000
+playsound dig_gravel1 record @s[] ^-0.25 ^ ^ 0.700 1.58740 0.000
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 0.400 1.18921 0.000
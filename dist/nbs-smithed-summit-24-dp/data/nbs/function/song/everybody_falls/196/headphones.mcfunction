@@ -0,0 +1,10 @@
+playsound block.note_block.pling_-1 record @s[] ^-0.0 ^ ^ 0.600 1.58740 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.900 0.50000 0.000
+playsound block.note_block.pling_-1 record @s[] ^0.8 ^ ^ 0.550 1.57826 0.000
+playsound block.note_block.pling_-1 record @s[] ^0.8 ^ ^ 0.550 1.98848 0.000
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 0.400 2.00000 0.000
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 0.600 1.58740 0.000
+playsound block.note_block.bit_1 record @s[] ^0.3 ^ ^ 0.581 1.49831 0.000
+playsound block.note_block.bit_1 record @s[] ^0.35 ^ ^ 0.336 1.24186 0.000
+playsound block.note_block.bit_1 record @s[] ^0.25 ^ ^ 0.410 2.00000 0.000
+playsound block.note_block.bit_1 record @s[] ^0.3 ^ ^ 0.332 1.47683 0.000
@@ -0,0 +1 @@
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 0.400 2.00000 0.000
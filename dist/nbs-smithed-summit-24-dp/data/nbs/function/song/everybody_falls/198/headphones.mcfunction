@@ -0,0 +1,5 @@
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 0.200 2.00000 0.000
+playsound block.note_block.bit_1 record @s[] ^0.2 ^ ^ 0.567 1.49831 0.000
+playsound block.note_block.bit_1 record @s[] ^0.25 ^ ^ 0.328 1.97133 0.000
+playsound block.note_block.bit_1 record @s[] ^0.15 ^ ^ 0.400 1.25992 0.000
+playsound block.note_block.bit_1 record @s[] ^0.2 ^ ^ 0.324 1.47683 0.000
@@ -0,0 +1,2 @@
+playsound block.note_block.basedrum record @a[distance=..48.00] ^3.0 ^ ^ 0.387 1.41421 0.000
+playsound block.note_block.basedrum record @a[distance=..48.00] ^3.0 ^ ^ 0.393 1.18921 0.000
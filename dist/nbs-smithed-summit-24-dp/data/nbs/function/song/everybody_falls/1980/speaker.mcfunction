@@ -0,0 +1,2 @@
+playsound block.note_block.basedrum record @a[distance=..10.35] ^1.0 ^ ^ 0.150 1.41421 0.000
+playsound block.note_block.basedrum record @a[distance=..10.87] ^1.0 ^ ^ 0.150 1.18921 0.000
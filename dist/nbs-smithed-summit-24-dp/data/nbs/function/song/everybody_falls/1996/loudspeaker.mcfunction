@@ -0,0 +1,2 @@
+playsound mob_zombie_unfect record @a[distance=..48.00] ^0.0 ^ ^ 1.590 1.00000 0.000
+playsound block.note_block.snare record @a[distance=..48.00] ^0.0 ^ ^ 0.886 1.68179 0.000
@@ -0,0 +1,2 @@
+playsound mob_zombie_unfect record @a[distance=..6.75] ^0.0 ^ ^ 0.680 1.00000 0.000
+playsound block.note_block.snare record @a[distance=..6.19] ^0.0 ^ ^ 0.400 1.68179 0.000
@@ -0,0 +1,4 @@
+playsound block.note_block.pling record @a[distance=..11.25] ^0.0 ^ ^ 0.120 0.50000 0.000
+playsound block.note_block.pling record @a[distance=..10.71] ^0.0 ^ ^ 0.180 0.62996 0.000
+playsound block.note_block.chime_1 record @a[distance=..6.00] ^0.0 ^ ^ 0.158 1.12246 0.000
+playsound block.note_block.chime_1 record @a[distance=..6.00] ^0.0 ^ ^ 0.517 1.05946 0.000
@@ -0,0 +1 @@
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 0.400 1.41421 0.000
@@ -0,0 +1,11 @@
+playsound block.note_block.pling_-1 record @s[] ^-0.0 ^ ^ 0.600 1.78180 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.900 0.56123 0.000
+playsound block.note_block.pling_-1 record @s[] ^0.8 ^ ^ 0.610 1.77154 0.000
+playsound block.note_block.pling record @s[] ^0.8 ^ ^ 0.610 0.55800 0.000
+playsound block.note_block.basedrum record @s[] ^0.8 ^ ^ 0.150 1.00000 0.000
+playsound block.note_block.basedrum record @s[] ^0.8 ^ ^ 0.150 0.84090 0.000
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 0.200 2.00000 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.0 ^ ^ 0.539 0.62996 0.000
+playsound block.note_block.bit_1 record @s[] ^0.05 ^ ^ 0.312 0.73841 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.05 ^ ^ 0.380 0.74915 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.0 ^ ^ 0.308 0.62093 0.000
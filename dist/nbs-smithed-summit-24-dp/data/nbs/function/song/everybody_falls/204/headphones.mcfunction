@@ -0,0 +1,10 @@
+playsound random_wood_click record @s[] ^-0.0 ^ ^ 0.517 0.74915 0.000
+playsound random_wood_click record @s[] ^-0.0 ^ ^ 0.517 0.74915 0.000
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 0.800 0.74915 0.000
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 0.800 0.84090 0.000
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 0.800 0.94387 0.000
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 0.400 2.00000 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.1 ^ ^ 0.525 1.00000 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.05 ^ ^ 0.304 0.73841 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.15 ^ ^ 0.370 1.25992 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.1 ^ ^ 0.300 0.98566 0.000
@@ -0,0 +1,7 @@
+playsound block.note_block.basedrum record @s[] ^0.8 ^ ^ 0.150 1.41421 0.000
+playsound block.note_block.basedrum record @s[] ^0.8 ^ ^ 0.150 1.18921 0.000
+playsound ambient_cave_cave11 record @s[] ^-0.0 ^ ^ 0.450 1.33484 0.000
+playsound ambient_cave_cave11 record @s[] ^-0.0 ^ ^ 0.680 1.33484 0.000
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 0.800 0.50000 0.000
+playsound block.note_block.snare record @s[] ^-0.6 ^ ^ 0.800 1.00000 0.000
+playsound random_wood_click record @s[] ^0.6 ^ ^ 0.800 1.00000 0.000
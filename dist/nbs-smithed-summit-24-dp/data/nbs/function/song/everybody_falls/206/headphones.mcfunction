@@ -0,0 +1,11 @@
+playsound block.note_block.pling_-1 record @s[] ^-0.0 ^ ^ 0.600 1.78180 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.900 0.56123 0.000
+playsound block.note_block.pling_-1 record @s[] ^-0.8 ^ ^ 0.630 1.77154 0.000
+playsound block.note_block.pling record @s[] ^-0.8 ^ ^ 0.630 0.55800 0.000
+playsound block.note_block.basedrum record @s[] ^-0.0 ^ ^ 0.750 1.00000 0.000
+playsound block.note_block.basedrum record @s[] ^-0.0 ^ ^ 0.750 0.84090 0.000
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 0.200 2.00000 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.2 ^ ^ 0.511 1.49831 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.15 ^ ^ 0.296 1.24186 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.25 ^ ^ 0.360 2.00000 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.2 ^ ^ 0.292 1.47683 0.000
@@ -0,0 +1,5 @@
+playsound block.note_block.basedrum record @a[distance=..48.00] ^0.0 ^ ^ 1.936 1.41421 0.000
+playsound block.note_block.basedrum record @a[distance=..48.00] ^0.0 ^ ^ 1.966 1.18921 0.000
+playsound ambient_cave_cave4 record @a[distance=..48.00] ^0.0 ^ ^ 1.052 1.00000 0.000
+playsound ambient_cave_cave4 record @a[distance=..48.00] ^0.0 ^ ^ 1.590 1.00000 0.000
+playsound dig_gravel1 record @a[distance=..48.00] ^1.0 ^ ^ 1.561 1.58740 0.000
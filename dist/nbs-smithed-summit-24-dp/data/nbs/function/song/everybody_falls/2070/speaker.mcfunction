@@ -0,0 +1,5 @@
+playsound block.note_block.basedrum record @a[distance=..10.35] ^0.0 ^ ^ 0.750 1.41421 0.000
+playsound block.note_block.basedrum record @a[distance=..10.87] ^0.0 ^ ^ 0.750 1.18921 0.000
+playsound ambient_cave_cave4 record @a[distance=..6.75] ^0.0 ^ ^ 0.450 1.00000 0.000
+playsound ambient_cave_cave4 record @a[distance=..6.75] ^0.0 ^ ^ 0.680 1.00000 0.000
+playsound dig_gravel1 record @a[distance=..6.23] ^0.0 ^ ^ 0.700 1.58740 0.000
@@ -0,0 +1,7 @@
+playsound block.note_block.flute record @a[distance=..48.00] ^0.0 ^ ^ 0.245 0.62996 0.000
+playsound block.note_block.flute_-1 record @a[distance=..48.00] ^0.0 ^ ^ 0.782 1.25992 0.000
+playsound block.note_block.flute_-1 record @a[distance=..48.00] ^0.0 ^ ^ 1.247 0.62996 0.000
+playsound block.note_block.flute_-1 record @a[distance=..48.00] ^0.0 ^ ^ 0.628 1.88775 0.000
+playsound block.note_block.flute record @a[distance=..48.00] ^0.0 ^ ^ 0.176 0.94387 0.000
+playsound block.note_block.basedrum record @a[distance=..48.00] ^-4.0 ^ ^ 0.387 1.41421 0.000
+playsound block.note_block.basedrum record @a[distance=..48.00] ^-4.0 ^ ^ 0.393 1.18921 0.000
@@ -0,0 +1,4 @@
+playsound block.note_block.flute record @a[distance=..8.06] ^0.0 ^ ^ 0.100 0.62996 0.000
+playsound block.note_block.flute_-1 record @a[distance=..10.71] ^0.0 ^ ^ 0.300 1.25992 0.000
+playsound block.note_block.flute_-1 record @a[distance=..9.24] ^0.0 ^ ^ 0.250 1.88775 0.000
+playsound block.note_block.flute record @a[distance=..6.86] ^0.0 ^ ^ 0.075 0.94387 0.000
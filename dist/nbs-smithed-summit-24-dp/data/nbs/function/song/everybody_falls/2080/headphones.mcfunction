@@ -0,0 +1,4 @@
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.100 0.62996 0.000
+playsound block.note_block.flute_-1 record @s[] ^-0.0 ^ ^ 0.250 1.88775 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.075 0.94387 0.000
+particle note ~ ~2.25 ~ 0 0 0 1 1
@@ -0,0 +1,7 @@
+playsound block.note_block.flute record @a[distance=..48.00] ^0.0 ^ ^ 0.245 0.62996 0.000
+playsound block.note_block.flute_-1 record @a[distance=..48.00] ^0.0 ^ ^ 0.628 1.88775 0.000
+playsound block.note_block.flute record @a[distance=..48.00] ^0.0 ^ ^ 0.176 0.94387 0.000
+playsound block.note_block.chime_1 record @a[distance=..48.00] ^0.0 ^ ^ 0.269 1.00000 0.000
+playsound block.note_block.chime record @a[distance=..48.00] ^0.0 ^ ^ 0.008 2.00000 0.000
+playsound block.note_block.chime_1 record @a[distance=..48.00] ^0.0 ^ ^ 0.008 0.56123 0.000
+playsound block.note_block.chime_1 record @a[distance=..48.00] ^0.0 ^ ^ 0.881 0.94387 0.000
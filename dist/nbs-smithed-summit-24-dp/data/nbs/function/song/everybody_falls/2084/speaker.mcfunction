@@ -0,0 +1,7 @@
+playsound block.note_block.flute record @a[distance=..8.06] ^0.0 ^ ^ 0.100 0.62996 0.000
+playsound block.note_block.flute_-1 record @a[distance=..9.24] ^0.0 ^ ^ 0.250 1.88775 0.000
+playsound block.note_block.flute record @a[distance=..6.86] ^0.0 ^ ^ 0.075 0.94387 0.000
+playsound block.note_block.chime_1 record @a[distance=..6.00] ^0.0 ^ ^ 0.145 1.00000 0.000
+playsound block.note_block.chime record @a[distance=..6.02] ^0.0 ^ ^ 0.004 2.00000 0.000
+playsound block.note_block.chime_1 record @a[distance=..6.01] ^0.0 ^ ^ 0.004 0.56123 0.000
+playsound block.note_block.chime_1 record @a[distance=..6.00] ^0.0 ^ ^ 0.473 0.94387 0.000
@@ -0,0 +1,11 @@
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.100 0.62996 0.000
+playsound block.note_block.flute_-1 record @s[] ^-0.0 ^ ^ 0.300 1.25992 0.000
+playsound block.note_block.flute_-1 record @s[] ^-0.0 ^ ^ 0.250 1.88775 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.075 0.94387 0.000
+playsound block.note_block.chime_1 record @s[] ^-0.0 ^ ^ 0.132 0.89090 0.000
+playsound block.note_block.chime_1 record @s[] ^-0.0 ^ ^ 0.008 0.59460 0.000
+playsound block.note_block.chime record @s[] ^-0.0 ^ ^ 0.008 1.49831 0.000
+playsound block.note_block.chime_1 record @s[] ^-0.0 ^ ^ 0.008 0.66742 0.000
+playsound block.note_block.chime_1 record @s[] ^-0.0 ^ ^ 0.427 0.79370 0.000
+playsound block.note_block.chime record @s[] ^-0.0 ^ ^ 0.030 1.33484 0.000
+playsound block.note_block.chime_1 record @s[] ^-0.0 ^ ^ 0.030 0.74915 0.000
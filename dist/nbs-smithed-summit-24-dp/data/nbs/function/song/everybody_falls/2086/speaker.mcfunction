@@ -0,0 +1,11 @@
+playsound block.note_block.flute record @a[distance=..8.06] ^0.0 ^ ^ 0.100 0.62996 0.000
+playsound block.note_block.flute_-1 record @a[distance=..10.71] ^0.0 ^ ^ 0.300 1.25992 0.000
+playsound block.note_block.flute_-1 record @a[distance=..9.24] ^0.0 ^ ^ 0.250 1.88775 0.000
+playsound block.note_block.flute record @a[distance=..6.86] ^0.0 ^ ^ 0.075 0.94387 0.000
+playsound block.note_block.chime_1 record @a[distance=..6.00] ^0.0 ^ ^ 0.132 0.89090 0.000
+playsound block.note_block.chime_1 record @a[distance=..6.01] ^0.0 ^ ^ 0.008 0.59460 0.000
+playsound block.note_block.chime record @a[distance=..6.04] ^0.0 ^ ^ 0.008 1.49831 0.000
+playsound block.note_block.chime_1 record @a[distance=..6.01] ^0.0 ^ ^ 0.008 0.66742 0.000
+playsound block.note_block.chime_1 record @a[distance=..6.00] ^0.0 ^ ^ 0.427 0.79370 0.000
+playsound block.note_block.chime record @a[distance=..6.05] ^0.0 ^ ^ 0.030 1.33484 0.000
+playsound block.note_block.chime_1 record @a[distance=..6.01] ^0.0 ^ ^ 0.030 0.74915 0.000
@@ -0,0 +1,9 @@
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.100 0.62996 0.000
+playsound block.note_block.flute_-1 record @s[] ^-0.0 ^ ^ 0.250 1.88775 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.075 0.94387 0.000
+playsound block.note_block.chime_1 record @s[] ^-0.0 ^ ^ 0.119 0.74915 0.000
+playsound block.note_block.chime record @s[] ^-0.0 ^ ^ 0.015 1.78180 0.000
+playsound block.note_block.chime_1 record @s[] ^-0.0 ^ ^ 0.015 0.59460 0.000
+playsound block.note_block.chime_1 record @s[] ^-0.0 ^ ^ 0.383 0.70711 0.000
+playsound block.note_block.chime_1 record @s[] ^-0.0 ^ ^ 0.050 0.62996 0.000
+particle note ~ ~2.25 ~ 0 0 0 1 1
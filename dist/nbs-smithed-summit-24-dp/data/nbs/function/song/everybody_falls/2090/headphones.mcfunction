@@ -0,0 +1,10 @@
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.100 0.62996 0.000
+playsound block.note_block.flute_-1 record @s[] ^-0.0 ^ ^ 0.300 1.25992 0.000
+playsound block.note_block.flute_-1 record @s[] ^-0.0 ^ ^ 0.450 0.62996 0.000
+playsound block.note_block.flute_-1 record @s[] ^-0.0 ^ ^ 0.250 1.88775 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.075 0.94387 0.000
+playsound block.note_block.chime_1 record @s[] ^-0.0 ^ ^ 0.106 0.66742 0.000
+playsound block.note_block.chime_1 record @s[] ^-0.0 ^ ^ 0.023 0.59460 0.000
+playsound block.note_block.chime_1 record @s[] ^-0.0 ^ ^ 0.338 0.62996 0.000
+playsound block.note_block.chime_1 record @s[] ^-0.0 ^ ^ 0.070 0.56123 0.000
+playsound block.note_block.chime record @s[] ^-0.0 ^ ^ 0.070 1.58740 0.000
@@ -0,0 +1,9 @@
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.100 0.62996 0.000
+playsound block.note_block.flute_-1 record @s[] ^-0.0 ^ ^ 0.300 1.25992 0.000
+playsound block.note_block.flute_-1 record @s[] ^-0.0 ^ ^ 0.250 1.88775 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.075 0.94387 0.000
+playsound block.note_block.chime record @s[] ^-0.0 ^ ^ 0.079 2.00000 0.000
+playsound block.note_block.chime_1 record @s[] ^-0.0 ^ ^ 0.038 0.74915 0.000
+playsound block.note_block.chime record @s[] ^-0.0 ^ ^ 0.247 1.88775 0.000
+playsound block.note_block.chime record @s[] ^-0.0 ^ ^ 0.110 1.49831 0.000
+playsound block.note_block.chime record @s[] ^-0.0 ^ ^ 0.110 1.68179 0.000
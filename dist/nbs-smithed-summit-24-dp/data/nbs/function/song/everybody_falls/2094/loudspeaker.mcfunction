@@ -0,0 +1,9 @@
+playsound block.note_block.flute record @a[distance=..48.00] ^0.0 ^ ^ 0.245 0.62996 0.000
+playsound block.note_block.flute_-1 record @a[distance=..48.00] ^0.0 ^ ^ 0.782 1.25992 0.000
+playsound block.note_block.flute_-1 record @a[distance=..48.00] ^0.0 ^ ^ 0.628 1.88775 0.000
+playsound block.note_block.flute record @a[distance=..48.00] ^0.0 ^ ^ 0.176 0.94387 0.000
+playsound block.note_block.chime record @a[distance=..48.00] ^0.0 ^ ^ 0.159 2.00000 0.000
+playsound block.note_block.chime_1 record @a[distance=..48.00] ^0.0 ^ ^ 0.073 0.74915 0.000
+playsound block.note_block.chime record @a[distance=..48.00] ^0.0 ^ ^ 0.502 1.88775 0.000
+playsound block.note_block.chime record @a[distance=..48.00] ^0.0 ^ ^ 0.229 1.49831 0.000
+playsound block.note_block.chime record @a[distance=..48.00] ^0.0 ^ ^ 0.226 1.68179 0.000
@@ -0,0 +1,10 @@
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.100 0.62996 0.000
+playsound block.note_block.flute_-1 record @s[] ^-0.0 ^ ^ 0.300 1.25992 0.000
+playsound block.note_block.flute_-1 record @s[] ^-0.0 ^ ^ 0.250 1.88775 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.075 0.94387 0.000
+playsound block.note_block.chime record @s[] ^-0.0 ^ ^ 0.066 1.78180 0.000
+playsound block.note_block.chime record @s[] ^-0.0 ^ ^ 0.046 2.00000 0.000
+playsound block.note_block.chime_1 record @s[] ^-0.0 ^ ^ 0.046 0.56123 0.000
+playsound block.note_block.chime record @s[] ^-0.0 ^ ^ 0.203 1.68179 0.000
+playsound block.note_block.chime_1 record @s[] ^-0.0 ^ ^ 0.130 0.59460 0.000
+particle note ~ ~2.25 ~ 0 0 0 1 1
@@ -0,0 +1,5 @@
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 0.200 2.00000 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.4 ^ ^ 0.483 1.00000 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.35 ^ ^ 0.280 1.24186 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.45 ^ ^ 0.340 0.74915 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.4 ^ ^ 0.276 0.98566 0.000
@@ -0,0 +1,8 @@
+playsound block.note_block.flute record @a[distance=..48.00] ^0.0 ^ ^ 0.245 0.62996 0.000
+playsound block.note_block.flute_-1 record @a[distance=..48.00] ^0.0 ^ ^ 0.782 1.25992 0.000
+playsound block.note_block.flute_-1 record @a[distance=..48.00] ^0.0 ^ ^ 0.628 1.88775 0.000
+playsound block.note_block.flute record @a[distance=..48.00] ^0.0 ^ ^ 0.176 0.94387 0.000
+playsound block.note_block.chime record @a[distance=..48.00] ^0.0 ^ ^ 0.083 1.33484 0.000
+playsound block.note_block.chime record @a[distance=..48.00] ^0.0 ^ ^ 0.239 1.25992 0.000
+playsound block.note_block.chime record @a[distance=..48.00] ^0.0 ^ ^ 0.345 1.88775 0.000
+playsound block.note_block.chime record @a[distance=..48.00] ^0.0 ^ ^ 0.342 2.00000 0.000
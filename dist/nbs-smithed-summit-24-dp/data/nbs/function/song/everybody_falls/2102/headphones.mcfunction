@@ -0,0 +1,8 @@
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.100 0.62996 0.000
+playsound block.note_block.flute_-1 record @s[] ^-0.0 ^ ^ 0.300 1.25992 0.000
+playsound block.note_block.flute_-1 record @s[] ^-0.0 ^ ^ 0.250 1.88775 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.075 0.94387 0.000
+playsound block.note_block.chime record @s[] ^-0.0 ^ ^ 0.026 1.18921 0.000
+playsound block.note_block.chime_1 record @s[] ^-0.0 ^ ^ 0.068 0.62996 0.000
+playsound block.note_block.chime record @s[] ^-0.0 ^ ^ 0.068 1.12246 0.000
+playsound block.note_block.chime_1 record @s[] ^-0.0 ^ ^ 0.170 0.56123 0.000
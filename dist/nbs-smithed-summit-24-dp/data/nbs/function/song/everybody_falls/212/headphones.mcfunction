@@ -0,0 +1,12 @@
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.600 0.50000 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.900 0.62996 0.000
+playsound block.note_block.pling_-1 record @s[] ^-0.8 ^ ^ 0.690 1.98848 0.000
+playsound block.note_block.pling record @s[] ^-0.8 ^ ^ 0.690 0.62633 0.000
+playsound block.note_block.basedrum record @s[] ^-0.0 ^ ^ 0.750 1.00000 0.000
+playsound block.note_block.basedrum record @s[] ^-0.0 ^ ^ 0.750 0.84090 0.000
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 0.400 2.00000 0.000
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 0.600 1.58740 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.5 ^ ^ 0.469 0.62996 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.45 ^ ^ 0.272 0.73841 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.55 ^ ^ 0.330 0.74915 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.5 ^ ^ 0.268 0.62093 0.000
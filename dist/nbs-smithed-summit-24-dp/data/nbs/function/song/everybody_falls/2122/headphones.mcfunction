@@ -0,0 +1,9 @@
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.100 0.52973 0.000
+playsound block.note_block.flute_-1 record @s[] ^-0.0 ^ ^ 0.300 1.05946 0.000
+playsound block.note_block.flute_-1 record @s[] ^-0.0 ^ ^ 0.450 0.52973 0.000
+playsound block.note_block.flute_-1 record @s[] ^-0.0 ^ ^ 0.250 1.78180 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.075 0.89090 0.000
+playsound block.note_block.chime_1 record @s[] ^-0.0 ^ ^ 0.046 0.59460 0.000
+playsound block.note_block.chime_1 record @s[] ^-0.0 ^ ^ 0.046 0.66742 0.000
+playsound block.note_block.chime record @s[] ^-0.0 ^ ^ 0.110 1.33484 0.000
+playsound block.note_block.chime record @s[] ^-0.0 ^ ^ 0.110 1.41421 0.000
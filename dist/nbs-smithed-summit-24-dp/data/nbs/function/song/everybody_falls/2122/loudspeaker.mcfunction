@@ -0,0 +1,9 @@
+playsound block.note_block.flute record @a[distance=..48.00] ^0.0 ^ ^ 0.249 0.52973 0.000
+playsound block.note_block.flute_-1 record @a[distance=..48.00] ^0.0 ^ ^ 0.795 1.05946 0.000
+playsound block.note_block.flute_-1 record @a[distance=..48.00] ^0.0 ^ ^ 1.265 0.52973 0.000
+playsound block.note_block.flute_-1 record @a[distance=..48.00] ^0.0 ^ ^ 0.632 1.78180 0.000
+playsound block.note_block.flute record @a[distance=..48.00] ^0.0 ^ ^ 0.177 0.89090 0.000
+playsound block.note_block.chime_1 record @a[distance=..48.00] ^0.0 ^ ^ 0.090 0.59460 0.000
+playsound block.note_block.chime_1 record @a[distance=..48.00] ^0.0 ^ ^ 0.089 0.66742 0.000
+playsound block.note_block.chime record @a[distance=..48.00] ^0.0 ^ ^ 0.232 1.33484 0.000
+playsound block.note_block.chime record @a[distance=..48.00] ^0.0 ^ ^ 0.230 1.41421 0.000
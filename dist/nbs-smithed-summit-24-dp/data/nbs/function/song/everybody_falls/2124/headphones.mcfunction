@@ -0,0 +1,7 @@
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.100 0.52973 0.000
+playsound block.note_block.flute_-1 record @s[] ^-0.0 ^ ^ 0.300 1.05946 0.000
+playsound block.note_block.flute_-1 record @s[] ^-0.0 ^ ^ 0.250 1.78180 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.075 0.89090 0.000
+playsound block.note_block.chime_1 record @s[] ^-0.0 ^ ^ 0.042 0.74915 0.000
+playsound block.note_block.chime record @s[] ^-0.0 ^ ^ 0.100 1.78180 0.000
+playsound block.note_block.chime_1 record @s[] ^-0.0 ^ ^ 0.100 0.66742 0.000
@@ -0,0 +1,7 @@
+playsound block.note_block.flute record @a[distance=..48.00] ^0.0 ^ ^ 0.249 0.52973 0.000
+playsound block.note_block.flute_-1 record @a[distance=..48.00] ^0.0 ^ ^ 0.795 1.05946 0.000
+playsound block.note_block.flute_-1 record @a[distance=..48.00] ^0.0 ^ ^ 0.632 1.78180 0.000
+playsound block.note_block.flute record @a[distance=..48.00] ^0.0 ^ ^ 0.177 0.89090 0.000
+playsound block.note_block.chime_1 record @a[distance=..48.00] ^0.0 ^ ^ 0.080 0.74915 0.000
+playsound block.note_block.chime record @a[distance=..48.00] ^0.0 ^ ^ 0.204 1.78180 0.000
+playsound block.note_block.chime_1 record @a[distance=..48.00] ^0.0 ^ ^ 0.195 0.66742 0.000
@@ -0,0 +1,7 @@
+playsound block.note_block.flute record @a[distance=..8.76] ^0.0 ^ ^ 0.100 0.52973 0.000
+playsound block.note_block.flute_-1 record @a[distance=..11.14] ^0.0 ^ ^ 0.300 1.05946 0.000
+playsound block.note_block.flute_-1 record @a[distance=..9.48] ^0.0 ^ ^ 0.250 1.78180 0.000
+playsound block.note_block.flute record @a[distance=..6.99] ^0.0 ^ ^ 0.075 0.89090 0.000
+playsound block.note_block.chime_1 record @a[distance=..6.01] ^0.0 ^ ^ 0.042 0.74915 0.000
+playsound block.note_block.chime record @a[distance=..6.02] ^0.0 ^ ^ 0.100 1.78180 0.000
+playsound block.note_block.chime_1 record @a[distance=..6.01] ^0.0 ^ ^ 0.100 0.66742 0.000
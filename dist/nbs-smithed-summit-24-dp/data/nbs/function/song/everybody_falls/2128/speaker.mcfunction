@@ -0,0 +1,12 @@
+playsound block.note_block.flute record @a[distance=..8.76] ^0.0 ^ ^ 0.100 0.52973 0.000
+playsound block.note_block.flute_-1 record @a[distance=..11.14] ^0.0 ^ ^ 0.300 1.05946 0.000
+playsound block.note_block.flute_-1 record @a[distance=..9.48] ^0.0 ^ ^ 0.250 1.78180 0.000
+playsound block.note_block.flute record @a[distance=..6.99] ^0.0 ^ ^ 0.075 0.89090 0.000
+playsound block.note_block.chime_1 record @a[distance=..6.01] ^0.0 ^ ^ 0.038 0.66742 0.000
+playsound block.note_block.chime_1 record @a[distance=..6.01] ^0.0 ^ ^ 0.090 0.59460 0.000
+playsound block.note_block.chime record @a[distance=..6.02] ^0.0 ^ ^ 0.090 1.78180 0.000
+execute store result score #random nbs run random value 1..4
+execute if score #random nbs matches 1 if entity @a[distance=0..12] run function animated_java:music_speaker/animations/animation_speaker_beat_1/play
+execute if score #random nbs matches 2 if entity @a[distance=0..12] run function animated_java:music_speaker/animations/animation_speaker_beat_2/play
+execute if score #random nbs matches 3 if entity @a[distance=0..12] run function animated_java:music_speaker/animations/animation_speaker_beat_3/play
+execute if score #random nbs matches 4 if entity @a[distance=0..12] run function animated_java:music_speaker/animations/animation_speaker_beat_4/play
@@ -0,0 +1,9 @@
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.100 0.52973 0.000
+playsound block.note_block.flute_-1 record @s[] ^-0.0 ^ ^ 0.300 1.05946 0.000
+playsound block.note_block.flute_-1 record @s[] ^-0.0 ^ ^ 0.450 0.52973 0.000
+playsound block.note_block.flute_-1 record @s[] ^-0.0 ^ ^ 0.250 1.78180 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.075 0.89090 0.000
+playsound block.note_block.chime record @s[] ^-0.0 ^ ^ 0.034 1.49831 0.000
+playsound block.note_block.chime_1 record @s[] ^-0.0 ^ ^ 0.034 0.59460 0.000
+playsound block.note_block.chime record @s[] ^-0.0 ^ ^ 0.034 1.68179 0.000
+playsound block.note_block.chime record @s[] ^-0.0 ^ ^ 0.080 2.00000 0.000
@@ -0,0 +1,9 @@
+playsound block.note_block.flute record @a[distance=..48.00] ^0.0 ^ ^ 0.249 0.52973 0.000
+playsound block.note_block.flute_-1 record @a[distance=..48.00] ^0.0 ^ ^ 0.795 1.05946 0.000
+playsound block.note_block.flute_-1 record @a[distance=..48.00] ^0.0 ^ ^ 1.265 0.52973 0.000
+playsound block.note_block.flute_-1 record @a[distance=..48.00] ^0.0 ^ ^ 0.632 1.78180 0.000
+playsound block.note_block.flute record @a[distance=..48.00] ^0.0 ^ ^ 0.177 0.89090 0.000
+playsound block.note_block.chime record @a[distance=..48.00] ^0.0 ^ ^ 0.071 1.49831 0.000
+playsound block.note_block.chime_1 record @a[distance=..48.00] ^0.0 ^ ^ 0.067 0.59460 0.000
+playsound block.note_block.chime record @a[distance=..48.00] ^0.0 ^ ^ 0.070 1.68179 0.000
+playsound block.note_block.chime record @a[distance=..48.00] ^0.0 ^ ^ 0.161 2.00000 0.000
@@ -0,0 +1,8 @@
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.100 0.52973 0.000
+playsound block.note_block.flute_-1 record @s[] ^-0.0 ^ ^ 0.300 1.05946 0.000
+playsound block.note_block.flute_-1 record @s[] ^-0.0 ^ ^ 0.250 1.78180 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.075 0.89090 0.000
+playsound block.note_block.chime record @s[] ^-0.0 ^ ^ 0.027 1.58740 0.000
+playsound block.note_block.chime record @s[] ^-0.0 ^ ^ 0.027 1.41421 0.000
+playsound block.note_block.chime_1 record @s[] ^-0.0 ^ ^ 0.070 0.62996 0.000
+particle note ~ ~2.25 ~ 0 0 0 1 1
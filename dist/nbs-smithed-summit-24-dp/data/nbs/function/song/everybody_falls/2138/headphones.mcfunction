@@ -0,0 +1,7 @@
+playsound block.note_block.flute_-1 record @s[] ^-0.0 ^ ^ 0.100 1.88775 0.000
+playsound block.note_block.flute_-1 record @s[] ^-0.0 ^ ^ 0.300 0.94387 0.000
+playsound block.note_block.flute_-1 record @s[] ^-0.0 ^ ^ 0.450 0.50000 0.000
+playsound block.note_block.flute_-1 record @s[] ^-0.0 ^ ^ 0.250 1.18921 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.075 0.59460 0.000
+playsound block.note_block.chime_1 record @s[] ^-0.0 ^ ^ 0.060 0.59460 0.000
+playsound block.note_block.chime record @s[] ^-0.0 ^ ^ 0.060 2.00000 0.000
@@ -0,0 +1,9 @@
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.600 0.50000 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.900 0.62996 0.000
+playsound block.note_block.pling_-1 record @s[] ^0.8 ^ ^ 0.720 1.98848 0.000
+playsound block.note_block.pling record @s[] ^0.8 ^ ^ 0.720 0.62633 0.000
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 0.200 2.00000 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.6 ^ ^ 0.455 1.00000 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.55 ^ ^ 0.264 0.73841 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.65 ^ ^ 0.320 1.25992 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.6 ^ ^ 0.260 0.98566 0.000
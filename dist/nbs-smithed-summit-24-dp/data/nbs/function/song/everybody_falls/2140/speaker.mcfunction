@@ -0,0 +1,5 @@
+playsound block.note_block.flute_-1 record @a[distance=..9.24] ^0.0 ^ ^ 0.100 1.88775 0.000
+playsound block.note_block.flute_-1 record @a[distance=..11.35] ^0.0 ^ ^ 0.300 0.94387 0.000
+playsound block.note_block.flute_-1 record @a[distance=..10.87] ^0.0 ^ ^ 0.250 1.18921 0.000
+playsound block.note_block.flute record @a[distance=..8.28] ^0.0 ^ ^ 0.075 0.59460 0.000
+playsound block.note_block.chime_1 record @a[distance=..6.01] ^0.0 ^ ^ 0.060 0.74915 0.000
@@ -0,0 +1,5 @@
+playsound block.note_block.flute_-1 record @a[distance=..48.00] ^0.0 ^ ^ 0.251 1.88775 0.000
+playsound block.note_block.flute_-1 record @a[distance=..48.00] ^0.0 ^ ^ 0.803 0.94387 0.000
+playsound block.note_block.flute_-1 record @a[distance=..48.00] ^0.0 ^ ^ 0.655 1.18921 0.000
+playsound block.note_block.flute record @a[distance=..48.00] ^0.0 ^ ^ 0.184 0.59460 0.000
+playsound block.note_block.chime_1 record @a[distance=..48.00] ^0.0 ^ ^ 0.117 0.66742 0.000
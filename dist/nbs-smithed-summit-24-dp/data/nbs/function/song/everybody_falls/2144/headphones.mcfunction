@@ -0,0 +1,6 @@
+playsound block.note_block.flute_-1 record @s[] ^-0.0 ^ ^ 0.100 1.88775 0.000
+playsound block.note_block.flute_-1 record @s[] ^-0.0 ^ ^ 0.300 0.94387 0.000
+playsound block.note_block.flute_-1 record @s[] ^-0.0 ^ ^ 0.250 1.18921 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.075 0.59460 0.000
+playsound block.note_block.chime record @s[] ^-0.0 ^ ^ 0.019 1.78180 0.000
+particle note ~ ~2.25 ~ 0 0 0 1 1
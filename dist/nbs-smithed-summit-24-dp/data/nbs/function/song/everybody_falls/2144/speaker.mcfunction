@@ -0,0 +1,10 @@
+playsound block.note_block.flute_-1 record @a[distance=..9.24] ^0.0 ^ ^ 0.100 1.88775 0.000
+playsound block.note_block.flute_-1 record @a[distance=..11.35] ^0.0 ^ ^ 0.300 0.94387 0.000
+playsound block.note_block.flute_-1 record @a[distance=..10.87] ^0.0 ^ ^ 0.250 1.18921 0.000
+playsound block.note_block.flute record @a[distance=..8.28] ^0.0 ^ ^ 0.075 0.59460 0.000
+playsound block.note_block.chime record @a[distance=..6.02] ^0.0 ^ ^ 0.019 1.78180 0.000
+execute store result score #random nbs run random value 1..4
+execute if score #random nbs matches 1 if entity @a[distance=0..12] run function animated_java:music_speaker/animations/animation_speaker_beat_1/play
+execute if score #random nbs matches 2 if entity @a[distance=0..12] run function animated_java:music_speaker/animations/animation_speaker_beat_2/play
+execute if score #random nbs matches 3 if entity @a[distance=0..12] run function animated_java:music_speaker/animations/animation_speaker_beat_3/play
+execute if score #random nbs matches 4 if entity @a[distance=0..12] run function animated_java:music_speaker/animations/animation_speaker_beat_4/play
@@ -0,0 +1,12 @@
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.600 0.50000 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.900 0.62996 0.000
+playsound block.note_block.pling_-1 record @s[] ^-0.8 ^ ^ 0.750 1.98848 0.000
+playsound block.note_block.pling record @s[] ^-0.8 ^ ^ 0.750 0.62633 0.000
+playsound block.note_block.basedrum record @s[] ^-0.0 ^ ^ 0.750 1.00000 0.000
+playsound block.note_block.basedrum record @s[] ^-0.0 ^ ^ 0.750 0.84090 0.000
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 0.300 2.00000 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.7 ^ ^ 0.441 1.49831 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.65 ^ ^ 0.256 1.24186 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.75 ^ ^ 0.310 2.00000 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.7 ^ ^ 0.252 1.47683 0.000
+particle note ~ ~2.25 ~ 0 0 0 1 1
@@ -0,0 +1,6 @@
+playsound block.note_block.flute record @a[distance=..48.00] ^0.0 ^ ^ 0.246 0.59460 0.000
+playsound block.note_block.flute_-1 record @a[distance=..48.00] ^0.0 ^ ^ 0.786 1.18921 0.000
+playsound block.note_block.flute_-1 record @a[distance=..48.00] ^0.0 ^ ^ 1.253 0.59460 0.000
+playsound block.note_block.flute_-1 record @a[distance=..48.00] ^0.0 ^ ^ 0.645 1.41421 0.000
+playsound block.note_block.flute record @a[distance=..48.00] ^0.0 ^ ^ 0.181 0.70711 0.000
+playsound block.note_block.chime_1 record @a[distance=..48.00] ^0.0 ^ ^ 0.019 0.74915 0.000
@@ -0,0 +1,9 @@
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.600 0.50000 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.900 0.62996 0.000
+playsound block.note_block.pling_-1 record @s[] ^0.8 ^ ^ 0.770 1.98848 0.000
+playsound block.note_block.pling record @s[] ^0.8 ^ ^ 0.770 0.62633 0.000
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 0.200 2.00000 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.8 ^ ^ 0.427 1.49831 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.75 ^ ^ 0.248 1.97133 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.85 ^ ^ 0.300 1.25992 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.8 ^ ^ 0.244 1.47683 0.000
@@ -0,0 +1,5 @@
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.100 0.59460 0.000
+playsound block.note_block.flute_-1 record @s[] ^-0.0 ^ ^ 0.300 1.18921 0.000
+playsound block.note_block.flute_-1 record @s[] ^-0.0 ^ ^ 0.250 1.41421 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.075 0.70711 0.000
+particle note ~ ~2.25 ~ 0 0 0 1 1
@@ -0,0 +1,4 @@
+playsound block.note_block.flute record @a[distance=..8.28] ^0.0 ^ ^ 0.100 0.59460 0.000
+playsound block.note_block.flute_-1 record @a[distance=..10.87] ^0.0 ^ ^ 0.300 1.18921 0.000
+playsound block.note_block.flute_-1 record @a[distance=..10.35] ^0.0 ^ ^ 0.250 1.41421 0.000
+playsound block.note_block.flute record @a[distance=..7.65] ^0.0 ^ ^ 0.075 0.70711 0.000
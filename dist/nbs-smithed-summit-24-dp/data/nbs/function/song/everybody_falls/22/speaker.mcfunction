@@ -0,0 +1,6 @@
+playsound block.note_block.pling record @a[distance=..11.25] ^0.0 ^ ^ 0.120 0.50000 0.000
+playsound block.note_block.pling record @a[distance=..10.71] ^0.0 ^ ^ 0.180 0.62996 0.000
+playsound block.note_block.chime_1 record @a[distance=..6.00] ^0.0 ^ ^ 0.145 1.00000 0.000
+playsound block.note_block.chime record @a[distance=..6.02] ^0.0 ^ ^ 0.004 2.00000 0.000
+playsound block.note_block.chime_1 record @a[distance=..6.01] ^0.0 ^ ^ 0.004 0.56123 0.000
+playsound block.note_block.chime_1 record @a[distance=..6.00] ^0.0 ^ ^ 0.473 0.94387 0.000
@@ -0,0 +1,14 @@
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.600 0.50000 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.900 0.62996 0.000
+playsound block.note_block.pling_-1 record @s[] ^-0.8 ^ ^ 0.800 1.98848 0.000
+playsound block.note_block.pling record @s[] ^-0.8 ^ ^ 0.800 0.62633 0.000
+playsound random_wood_click record @s[] ^-0.0 ^ ^ 0.517 0.74915 0.000
+playsound random_wood_click record @s[] ^-0.0 ^ ^ 0.517 0.74915 0.000
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 0.800 0.84090 0.000
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 0.800 0.94387 0.000
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 0.800 1.05946 0.000
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 0.400 2.00000 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.9 ^ ^ 0.413 1.00000 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.85 ^ ^ 0.240 1.24186 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.95 ^ ^ 0.290 0.74915 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.9 ^ ^ 0.236 0.98566 0.000
@@ -0,0 +1,14 @@
+playsound block.note_block.pling record @a[distance=..11.25] ^0.0 ^ ^ 0.600 0.50000 0.000
+playsound block.note_block.pling record @a[distance=..10.71] ^0.0 ^ ^ 0.900 0.62996 0.000
+playsound block.note_block.pling_-1 record @a[distance=..11.26] ^1.0 ^ ^ 0.800 1.98848 0.000
+playsound block.note_block.pling record @a[distance=..10.73] ^1.0 ^ ^ 0.800 0.62633 0.000
+playsound random_wood_click record @a[distance=..7.46] ^0.0 ^ ^ 0.517 0.74915 0.000
+playsound random_wood_click record @a[distance=..7.46] ^0.0 ^ ^ 0.517 0.74915 0.000
+playsound block.note_block.snare record @a[distance=..7.13] ^0.0 ^ ^ 0.800 0.84090 0.000
+playsound block.note_block.snare record @a[distance=..6.86] ^0.0 ^ ^ 0.800 0.94387 0.000
+playsound block.note_block.snare record @a[distance=..6.65] ^0.0 ^ ^ 0.800 1.05946 0.000
+playsound block.note_block.snare record @a[distance=..6.12] ^0.0 ^ ^ 0.400 2.00000 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.12] ^1.0 ^ ^ 0.413 1.00000 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.07] ^1.0 ^ ^ 0.240 1.24186 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.26] ^1.0 ^ ^ 0.290 0.74915 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.12] ^1.0 ^ ^ 0.236 0.98566 0.000
@@ -0,0 +1,5 @@
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 0.200 2.00000 0.000
+playsound block.note_block.bit_1 record @s[] ^-1.0 ^ ^ 0.399 0.62996 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.95 ^ ^ 0.232 0.73841 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.95 ^ ^ 0.280 0.74915 0.000
+playsound block.note_block.bit_1 record @s[] ^-1.0 ^ ^ 0.228 0.62093 0.000
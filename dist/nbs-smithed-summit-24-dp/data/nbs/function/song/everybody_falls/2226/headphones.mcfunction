@@ -0,0 +1,8 @@
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.100 0.62996 0.000
+playsound block.note_block.flute_-1 record @s[] ^-0.0 ^ ^ 0.300 1.25992 0.000
+playsound block.note_block.flute_-1 record @s[] ^-0.0 ^ ^ 0.450 0.62996 0.000
+playsound block.note_block.flute_-1 record @s[] ^-0.0 ^ ^ 0.250 1.88775 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.075 0.94387 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.5 ^ ^ 0.042 1.41421 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.5 ^ ^ 0.060 0.69898 0.000
+playsound block.note_block.bit_1 record @s[] ^0.5 ^ ^ 0.040 1.88775 0.000
@@ -0,0 +1,9 @@
+playsound block.note_block.flute record @a[distance=..8.06] ^0.0 ^ ^ 0.100 0.62996 0.000
+playsound block.note_block.flute_-1 record @a[distance=..10.71] ^0.0 ^ ^ 0.300 1.25992 0.000
+playsound block.note_block.flute_-1 record @a[distance=..9.24] ^0.0 ^ ^ 0.250 1.88775 0.000
+playsound block.note_block.flute record @a[distance=..6.86] ^0.0 ^ ^ 0.075 0.94387 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.31] ^1.0 ^ ^ 0.750 0.70711 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.15] ^-1.0 ^ ^ 0.060 0.93303 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.14] ^-1.0 ^ ^ 1.000 0.94387 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.32] ^1.0 ^ ^ 0.100 0.69898 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.02] ^-1.0 ^ ^ 0.080 1.88775 0.000
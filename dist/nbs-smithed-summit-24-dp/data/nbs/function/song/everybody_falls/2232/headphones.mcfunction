@@ -0,0 +1,11 @@
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.100 0.62996 0.000
+playsound block.note_block.flute_-1 record @s[] ^-0.0 ^ ^ 0.300 1.25992 0.000
+playsound block.note_block.flute_-1 record @s[] ^-0.0 ^ ^ 0.250 1.88775 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.075 0.94387 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.5 ^ ^ 0.750 0.70711 0.000
+playsound block.note_block.bit_1 record @s[] ^0.5 ^ ^ 0.090 0.93303 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.5 ^ ^ 0.070 1.41421 0.000
+playsound block.note_block.bit_1 record @s[] ^0.5 ^ ^ 1.000 0.94387 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.5 ^ ^ 0.140 0.69898 0.000
+playsound block.note_block.bit_1 record @s[] ^0.5 ^ ^ 0.120 1.88775 0.000
+particle note ~ ~2.25 ~ 0 0 0 1 1
@@ -0,0 +1,11 @@
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.100 0.62996 0.000
+playsound block.note_block.flute_-1 record @s[] ^-0.0 ^ ^ 0.300 1.25992 0.000
+playsound block.note_block.flute_-1 record @s[] ^-0.0 ^ ^ 0.450 0.62996 0.000
+playsound block.note_block.flute_-1 record @s[] ^-0.0 ^ ^ 0.250 1.88775 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.075 0.94387 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.5 ^ ^ 0.750 1.18921 0.000
+playsound block.note_block.bit_1 record @s[] ^0.5 ^ ^ 0.120 0.93303 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.5 ^ ^ 0.098 1.41421 0.000
+playsound block.note_block.bit_1 record @s[] ^0.5 ^ ^ 1.000 1.41421 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.5 ^ ^ 0.180 1.17555 0.000
+playsound block.note_block.bit_1 record @s[] ^0.5 ^ ^ 0.160 1.88775 0.000
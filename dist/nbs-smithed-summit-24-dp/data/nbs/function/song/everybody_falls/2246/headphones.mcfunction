@@ -0,0 +1,10 @@
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.100 0.62996 0.000
+playsound block.note_block.flute_-1 record @s[] ^-0.0 ^ ^ 0.300 1.25992 0.000
+playsound block.note_block.flute_-1 record @s[] ^-0.0 ^ ^ 0.250 1.88775 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.075 0.94387 0.000
+playsound block.note_block.bit record @s[] ^0.5 ^ ^ 0.750 1.88775 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.5 ^ ^ 0.255 0.69898 0.000
+playsound block.note_block.bit_1 record @s[] ^0.5 ^ ^ 0.224 1.88775 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.5 ^ ^ 1.000 0.70711 0.000
+playsound block.note_block.bit record @s[] ^0.5 ^ ^ 0.360 1.86607 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.5 ^ ^ 0.340 1.41421 0.000
@@ -0,0 +1,10 @@
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.100 0.59460 0.000
+playsound block.note_block.flute_-1 record @s[] ^-0.0 ^ ^ 0.300 1.18921 0.000
+playsound block.note_block.flute_-1 record @s[] ^-0.0 ^ ^ 0.450 0.59460 0.000
+playsound block.note_block.flute_-1 record @s[] ^-0.0 ^ ^ 0.250 1.78180 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.075 0.89090 0.000
+playsound block.note_block.bit_1 record @s[] ^0.5 ^ ^ 0.750 1.41421 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.5 ^ ^ 0.315 1.17555 0.000
+playsound block.note_block.bit_1 record @s[] ^0.5 ^ ^ 0.280 1.88775 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.5 ^ ^ 1.000 1.88775 0.000
+playsound block.note_block.bit_1 record @s[] ^0.5 ^ ^ 0.440 1.39797 0.000
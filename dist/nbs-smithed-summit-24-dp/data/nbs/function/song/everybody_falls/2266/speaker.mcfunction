@@ -0,0 +1,11 @@
+playsound block.note_block.flute record @a[distance=..6.86] ^0.0 ^ ^ 0.100 0.94387 0.000
+playsound block.note_block.flute_-1 record @a[distance=..9.24] ^0.0 ^ ^ 0.300 1.88775 0.000
+playsound block.note_block.flute_-1 record @a[distance=..11.35] ^0.0 ^ ^ 0.450 0.94387 0.000
+playsound block.note_block.flute record @a[distance=..8.28] ^0.0 ^ ^ 0.250 0.59460 0.000
+playsound block.note_block.flute record @a[distance=..6.48] ^0.0 ^ ^ 0.075 1.18921 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.14] ^-1.0 ^ ^ 0.750 0.94387 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.32] ^1.0 ^ ^ 0.555 0.69898 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.07] ^-1.0 ^ ^ 0.504 1.18921 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.07] ^1.0 ^ ^ 1.000 1.18921 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.15] ^-1.0 ^ ^ 0.760 0.93303 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.05] ^1.0 ^ ^ 0.740 1.41421 0.000
@@ -0,0 +1,9 @@
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.100 0.94387 0.000
+playsound block.note_block.flute_-1 record @s[] ^-0.0 ^ ^ 0.300 1.88775 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.250 0.59460 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.075 1.18921 0.000
+playsound block.note_block.bit_1 record @s[] ^0.5 ^ ^ 0.750 0.94387 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.5 ^ ^ 0.645 1.17555 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.5 ^ ^ 1.000 0.70711 0.000
+playsound block.note_block.bit_1 record @s[] ^0.5 ^ ^ 0.880 0.93303 0.000
+particle note ~ ~2.25 ~ 0 0 0 1 1
@@ -0,0 +1,11 @@
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.100 0.94387 0.000
+playsound block.note_block.flute_-1 record @s[] ^-0.0 ^ ^ 0.300 1.88775 0.000
+playsound block.note_block.flute_-1 record @s[] ^-0.0 ^ ^ 0.450 0.94387 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.250 0.59460 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.075 1.18921 0.000
+playsound block.note_block.bit_1 record @s[] ^0.5 ^ ^ 0.750 0.59460 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.5 ^ ^ 0.675 0.69898 0.000
+playsound block.note_block.bit_1 record @s[] ^0.5 ^ ^ 0.616 1.88775 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.5 ^ ^ 1.000 0.70711 0.000
+playsound block.note_block.bit_1 record @s[] ^0.5 ^ ^ 0.920 0.58777 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.5 ^ ^ 0.900 1.41421 0.000
@@ -0,0 +1,11 @@
+playsound block.note_block.flute record @a[distance=..6.86] ^0.0 ^ ^ 0.100 0.94387 0.000
+playsound block.note_block.flute_-1 record @a[distance=..9.24] ^0.0 ^ ^ 0.300 1.88775 0.000
+playsound block.note_block.flute_-1 record @a[distance=..11.35] ^0.0 ^ ^ 0.450 0.94387 0.000
+playsound block.note_block.flute record @a[distance=..8.28] ^0.0 ^ ^ 0.250 0.59460 0.000
+playsound block.note_block.flute record @a[distance=..6.48] ^0.0 ^ ^ 0.075 1.18921 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.48] ^-1.0 ^ ^ 0.750 0.59460 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.32] ^1.0 ^ ^ 0.675 0.69898 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.02] ^-1.0 ^ ^ 0.616 1.88775 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.31] ^1.0 ^ ^ 1.000 0.70711 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.50] ^-1.0 ^ ^ 0.920 0.58777 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.05] ^1.0 ^ ^ 0.900 1.41421 0.000
@@ -0,0 +1,10 @@
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.600 0.50000 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.900 0.62996 0.000
+playsound block.note_block.pling_-1 record @s[] ^0.8 ^ ^ 0.880 1.98848 0.000
+playsound block.note_block.pling record @s[] ^0.8 ^ ^ 0.880 0.62633 0.000
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 0.400 2.00000 0.000
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 0.600 1.58740 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.7 ^ ^ 0.357 1.49831 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.75 ^ ^ 0.208 1.97133 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.65 ^ ^ 0.250 1.25992 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.7 ^ ^ 0.204 1.47683 0.000
@@ -0,0 +1,5 @@
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 0.200 2.00000 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.6 ^ ^ 0.350 1.00000 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.65 ^ ^ 0.200 1.24186 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.55 ^ ^ 0.245 0.74915 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.6 ^ ^ 0.200 0.98566 0.000
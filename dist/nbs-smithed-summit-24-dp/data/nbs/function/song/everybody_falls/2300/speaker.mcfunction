@@ -0,0 +1,9 @@
+playsound block.note_block.flute record @a[distance=..6.99] ^0.0 ^ ^ 0.100 0.89090 0.000
+playsound block.note_block.flute_-1 record @a[distance=..9.48] ^0.0 ^ ^ 0.300 1.78180 0.000
+playsound block.note_block.flute record @a[distance=..8.76] ^0.0 ^ ^ 0.250 0.52973 0.000
+playsound block.note_block.flute record @a[distance=..6.65] ^0.0 ^ ^ 0.075 1.05946 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.05] ^-1.0 ^ ^ 0.750 1.41421 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.02] ^1.0 ^ ^ 0.750 1.86607 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.07] ^1.0 ^ ^ 1.000 1.18921 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.05] ^-1.0 ^ ^ 1.000 1.39797 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.02] ^1.0 ^ ^ 1.000 1.88775 0.000
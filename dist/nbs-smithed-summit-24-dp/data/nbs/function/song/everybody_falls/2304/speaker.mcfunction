@@ -0,0 +1,15 @@
+playsound block.note_block.flute record @a[distance=..6.99] ^0.0 ^ ^ 0.100 0.89090 0.000
+playsound block.note_block.flute_-1 record @a[distance=..9.48] ^0.0 ^ ^ 0.300 1.78180 0.000
+playsound block.note_block.flute record @a[distance=..8.76] ^0.0 ^ ^ 0.250 0.52973 0.000
+playsound block.note_block.flute record @a[distance=..6.65] ^0.0 ^ ^ 0.075 1.05946 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.48] ^-1.0 ^ ^ 0.750 0.59460 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.32] ^1.0 ^ ^ 0.750 0.69898 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.02] ^-1.0 ^ ^ 0.700 1.88775 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.31] ^1.0 ^ ^ 0.980 0.70711 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.50] ^-1.0 ^ ^ 1.000 0.58777 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.05] ^1.0 ^ ^ 1.000 1.41421 0.000
+execute store result score #random nbs run random value 1..4
+execute if score #random nbs matches 1 if entity @a[distance=0..12] run function animated_java:music_speaker/animations/animation_speaker_beat_1/play
+execute if score #random nbs matches 2 if entity @a[distance=0..12] run function animated_java:music_speaker/animations/animation_speaker_beat_2/play
+execute if score #random nbs matches 3 if entity @a[distance=0..12] run function animated_java:music_speaker/animations/animation_speaker_beat_3/play
+execute if score #random nbs matches 4 if entity @a[distance=0..12] run function animated_java:music_speaker/animations/animation_speaker_beat_4/play
@@ -0,0 +1,11 @@
+playsound block.note_block.flute record @a[distance=..6.99] ^0.0 ^ ^ 0.100 0.89090 0.000
+playsound block.note_block.flute_-1 record @a[distance=..9.48] ^0.0 ^ ^ 0.300 1.78180 0.000
+playsound block.note_block.flute_-1 record @a[distance=..11.44] ^0.0 ^ ^ 0.450 0.89090 0.000
+playsound block.note_block.flute record @a[distance=..8.76] ^0.0 ^ ^ 0.250 0.52973 0.000
+playsound block.note_block.flute record @a[distance=..6.65] ^0.0 ^ ^ 0.075 1.05946 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.14] ^-1.0 ^ ^ 0.728 0.94387 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.32] ^1.0 ^ ^ 0.735 0.69898 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.07] ^-1.0 ^ ^ 0.700 1.18921 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.07] ^1.0 ^ ^ 0.960 1.18921 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.15] ^-1.0 ^ ^ 0.970 0.93303 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.05] ^1.0 ^ ^ 0.980 1.41421 0.000
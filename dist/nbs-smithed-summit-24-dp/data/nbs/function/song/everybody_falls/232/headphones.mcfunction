@@ -0,0 +1,12 @@
+playsound block.note_block.pling_-1 record @s[] ^-0.0 ^ ^ 0.600 1.78180 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.900 0.56123 0.000
+playsound block.note_block.pling_-1 record @s[] ^-0.8 ^ ^ 0.910 1.77154 0.000
+playsound block.note_block.pling record @s[] ^-0.8 ^ ^ 0.910 0.55800 0.000
+playsound block.note_block.basedrum record @s[] ^-0.0 ^ ^ 0.750 1.00000 0.000
+playsound block.note_block.basedrum record @s[] ^-0.0 ^ ^ 0.750 0.84090 0.000
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 0.300 2.00000 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.5 ^ ^ 0.336 0.62996 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.55 ^ ^ 0.196 0.73841 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.45 ^ ^ 0.235 0.74915 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.5 ^ ^ 0.192 0.62093 0.000
+particle note ~ ~2.25 ~ 0 0 0 1 1
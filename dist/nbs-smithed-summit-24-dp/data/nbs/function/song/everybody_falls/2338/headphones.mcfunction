@@ -0,0 +1,16 @@
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.100 0.62996 0.000
+playsound block.note_block.flute_-1 record @s[] ^-0.0 ^ ^ 0.300 1.25992 0.000
+playsound block.note_block.flute_-1 record @s[] ^-0.0 ^ ^ 0.450 0.62996 0.000
+playsound block.note_block.flute_-1 record @s[] ^-0.0 ^ ^ 0.250 1.88775 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.075 0.94387 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.210 0.59460 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.210 1.18921 0.000
+playsound block.note_block.pling_-1 record @s[] ^-0.0 ^ ^ 0.500 1.88775 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.500 0.59460 0.000
+playsound fireworks_blast_far1 record @s[] ^-0.5 ^ ^ 0.680 1.00000 0.000
+playsound fireworks_blast_far1 record @s[] ^0.5 ^ ^ 0.750 1.25992 0.000
+playsound block.note_block.bit_1 record @s[] ^0.5 ^ ^ 0.420 1.41421 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.5 ^ ^ 0.435 1.17555 0.000
+playsound block.note_block.bit_1 record @s[] ^0.5 ^ ^ 0.420 1.88775 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.5 ^ ^ 0.550 1.88775 0.000
+playsound block.note_block.bit_1 record @s[] ^0.5 ^ ^ 0.570 1.39797 0.000
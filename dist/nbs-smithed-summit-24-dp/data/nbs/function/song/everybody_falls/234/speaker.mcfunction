@@ -0,0 +1,11 @@
+playsound block.note_block.pling_-1 record @a[distance=..11.44] ^0.0 ^ ^ 0.600 1.78180 0.000
+playsound block.note_block.pling record @a[distance=..11.01] ^0.0 ^ ^ 0.900 0.56123 0.000
+playsound block.note_block.pling_-1 record @a[distance=..11.45] ^-2.0 ^ ^ 0.940 1.77154 0.000
+playsound block.note_block.pling record @a[distance=..11.02] ^-2.0 ^ ^ 0.940 0.55800 0.000
+playsound block.note_block.basedrum record @a[distance=..11.25] ^-2.0 ^ ^ 0.150 1.00000 0.000
+playsound block.note_block.basedrum record @a[distance=..11.52] ^-2.0 ^ ^ 0.150 0.84090 0.000
+playsound block.note_block.snare record @a[distance=..6.12] ^0.0 ^ ^ 0.200 2.00000 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.12] ^0.0 ^ ^ 0.322 1.00000 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.27] ^0.0 ^ ^ 0.188 0.73841 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.06] ^0.0 ^ ^ 0.225 1.25992 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.12] ^0.0 ^ ^ 0.184 0.98566 0.000
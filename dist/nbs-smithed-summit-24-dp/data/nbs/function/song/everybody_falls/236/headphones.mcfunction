@@ -0,0 +1,10 @@
+playsound random_wood_click record @s[] ^-0.0 ^ ^ 0.517 0.74915 0.000
+playsound random_wood_click record @s[] ^-0.0 ^ ^ 0.517 0.74915 0.000
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 0.800 0.94387 0.000
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 0.800 1.05946 0.000
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 0.800 1.18921 0.000
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 0.400 2.00000 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.3 ^ ^ 0.308 1.49831 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.35 ^ ^ 0.180 1.24186 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.25 ^ ^ 0.215 2.00000 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.3 ^ ^ 0.176 1.47683 0.000
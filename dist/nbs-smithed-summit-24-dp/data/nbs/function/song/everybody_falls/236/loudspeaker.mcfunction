@@ -0,0 +1,10 @@
+playsound random_wood_click record @a[distance=..48.00] ^0.0 ^ ^ 1.243 0.74915 0.000
+playsound random_wood_click record @a[distance=..48.00] ^0.0 ^ ^ 1.243 0.74915 0.000
+playsound block.note_block.snare record @a[distance=..48.00] ^0.0 ^ ^ 1.881 0.94387 0.000
+playsound block.note_block.snare record @a[distance=..48.00] ^0.0 ^ ^ 1.859 1.05946 0.000
+playsound block.note_block.snare record @a[distance=..48.00] ^0.0 ^ ^ 1.838 1.18921 0.000
+playsound block.note_block.snare record @a[distance=..48.00] ^0.0 ^ ^ 0.870 2.00000 0.000
+playsound block.note_block.bit_1 record @a[distance=..48.00] ^1.0 ^ ^ 0.641 1.49831 0.000
+playsound block.note_block.bit_1 record @a[distance=..48.00] ^1.0 ^ ^ 0.383 1.24186 0.000
+playsound block.note_block.bit_1 record @a[distance=..48.00] ^1.0 ^ ^ 0.433 2.00000 0.000
+playsound block.note_block.bit_1 record @a[distance=..48.00] ^1.0 ^ ^ 0.367 1.47683 0.000
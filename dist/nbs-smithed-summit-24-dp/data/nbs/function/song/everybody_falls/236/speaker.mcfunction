@@ -0,0 +1,10 @@
+playsound random_wood_click record @a[distance=..7.46] ^0.0 ^ ^ 0.517 0.74915 0.000
+playsound random_wood_click record @a[distance=..7.46] ^0.0 ^ ^ 0.517 0.74915 0.000
+playsound block.note_block.snare record @a[distance=..6.86] ^0.0 ^ ^ 0.800 0.94387 0.000
+playsound block.note_block.snare record @a[distance=..6.65] ^0.0 ^ ^ 0.800 1.05946 0.000
+playsound block.note_block.snare record @a[distance=..6.48] ^0.0 ^ ^ 0.800 1.18921 0.000
+playsound block.note_block.snare record @a[distance=..6.12] ^0.0 ^ ^ 0.400 2.00000 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.04] ^0.0 ^ ^ 0.308 1.49831 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.07] ^0.0 ^ ^ 0.180 1.24186 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.02] ^0.0 ^ ^ 0.215 2.00000 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.04] ^0.0 ^ ^ 0.176 1.47683 0.000
@@ -0,0 +1,11 @@
+playsound block.note_block.pling_-1 record @s[] ^-0.0 ^ ^ 0.600 1.78180 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.900 0.56123 0.000
+playsound block.note_block.pling_-1 record @s[] ^-0.8 ^ ^ 0.970 1.77154 0.000
+playsound block.note_block.pling record @s[] ^-0.8 ^ ^ 0.970 0.55800 0.000
+playsound block.note_block.basedrum record @s[] ^-0.0 ^ ^ 0.750 1.00000 0.000
+playsound block.note_block.basedrum record @s[] ^-0.0 ^ ^ 0.750 0.84090 0.000
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 0.200 2.00000 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.2 ^ ^ 0.294 1.49831 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.25 ^ ^ 0.172 1.97133 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.15 ^ ^ 0.205 1.25992 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.2 ^ ^ 0.168 1.47683 0.000
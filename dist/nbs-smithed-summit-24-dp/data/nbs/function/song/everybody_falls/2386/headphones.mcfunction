@@ -0,0 +1,10 @@
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.100 0.52973 0.000
+playsound block.note_block.flute_-1 record @s[] ^-0.0 ^ ^ 0.300 1.05946 0.000
+playsound block.note_block.flute_-1 record @s[] ^-0.0 ^ ^ 0.450 0.52973 0.000
+playsound block.note_block.flute_-1 record @s[] ^-0.0 ^ ^ 0.250 1.78180 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.075 0.89090 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.210 0.52973 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.210 1.05946 0.000
+playsound fireworks_blast_far1 record @s[] ^-0.5 ^ ^ 0.680 1.00000 0.000
+playsound fireworks_blast_far1 record @s[] ^0.5 ^ ^ 0.750 1.25992 0.000
+playsound block.note_block.bit_1 record @s[] ^0.5 ^ ^ 0.000 1.18921 0.000
@@ -0,0 +1,10 @@
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.120 0.50000 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.180 0.62996 0.000
+playsound block.note_block.chime_1 record @s[] ^-0.0 ^ ^ 0.132 0.89090 0.000
+playsound block.note_block.chime_1 record @s[] ^-0.0 ^ ^ 0.008 0.59460 0.000
+playsound block.note_block.chime record @s[] ^-0.0 ^ ^ 0.008 1.49831 0.000
+playsound block.note_block.chime_1 record @s[] ^-0.0 ^ ^ 0.008 0.66742 0.000
+playsound block.note_block.chime_1 record @s[] ^-0.0 ^ ^ 0.427 0.79370 0.000
+playsound block.note_block.chime record @s[] ^-0.0 ^ ^ 0.030 1.33484 0.000
+playsound block.note_block.chime_1 record @s[] ^-0.0 ^ ^ 0.030 0.74915 0.000
+particle note ~ ~2.25 ~ 0 0 0 1 1
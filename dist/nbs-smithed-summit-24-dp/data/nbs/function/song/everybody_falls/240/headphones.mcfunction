@@ -0,0 +1,12 @@
+playsound block.note_block.pling_-1 record @s[] ^-0.0 ^ ^ 0.600 1.78180 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.900 0.56123 0.000
+playsound block.note_block.pling_-1 record @s[] ^0.8 ^ ^ 1.000 1.77154 0.000
+playsound block.note_block.pling record @s[] ^0.8 ^ ^ 1.000 0.55800 0.000
+playsound block.note_block.basedrum record @s[] ^0.8 ^ ^ 0.150 1.00000 0.000
+playsound block.note_block.basedrum record @s[] ^0.8 ^ ^ 0.150 0.84090 0.000
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 0.300 2.00000 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.1 ^ ^ 0.280 1.00000 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.15 ^ ^ 0.164 1.24186 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.05 ^ ^ 0.195 0.74915 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.1 ^ ^ 0.160 0.98566 0.000
+particle note ~ ~2.25 ~ 0 0 0 1 1
@@ -0,0 +1,11 @@
+playsound block.note_block.flute_-1 record @s[] ^-0.0 ^ ^ 0.100 1.88775 0.000
+playsound block.note_block.flute_-1 record @s[] ^-0.0 ^ ^ 0.300 0.94387 0.000
+playsound block.note_block.flute_-1 record @s[] ^-0.0 ^ ^ 0.250 1.18921 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.075 0.59460 0.000
+playsound block.note_block.flute_-1 record @s[] ^-0.0 ^ ^ 0.210 1.41421 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.210 0.70711 0.000
+playsound block.note_block.pling_-1 record @s[] ^-0.0 ^ ^ 0.500 1.88775 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.500 0.59460 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.500 0.94387 0.000
+playsound fireworks_blast_far1 record @s[] ^-0.5 ^ ^ 0.680 1.00000 0.000
+playsound fireworks_blast_far1 record @s[] ^0.5 ^ ^ 0.750 1.25992 0.000
@@ -0,0 +1,4 @@
+playsound block.note_block.bit_1 record @s[] ^0.1 ^ ^ 0.252 1.00000 0.000
+playsound block.note_block.bit_1 record @s[] ^0.05 ^ ^ 0.148 0.73841 0.000
+playsound block.note_block.bit_1 record @s[] ^0.15 ^ ^ 0.175 1.25992 0.000
+playsound block.note_block.bit_1 record @s[] ^0.1 ^ ^ 0.144 0.98566 0.000
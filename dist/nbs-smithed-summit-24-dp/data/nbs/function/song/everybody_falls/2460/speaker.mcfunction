@@ -0,0 +1,14 @@
+playsound block.note_block.flute record @a[distance=..8.06] ^0.0 ^ ^ 0.100 0.62996 0.000
+playsound block.note_block.flute_-1 record @a[distance=..10.71] ^0.0 ^ ^ 0.300 1.25992 0.000
+playsound block.note_block.flute_-1 record @a[distance=..9.24] ^0.0 ^ ^ 0.250 1.88775 0.000
+playsound block.note_block.flute record @a[distance=..6.86] ^0.0 ^ ^ 0.075 0.94387 0.000
+playsound block.note_block.flute record @a[distance=..8.28] ^0.0 ^ ^ 0.210 0.59460 0.000
+playsound block.note_block.flute record @a[distance=..6.48] ^0.0 ^ ^ 0.210 1.18921 0.000
+playsound block.note_block.pling_-1 record @a[distance=..11.35] ^0.0 ^ ^ 0.500 1.88775 0.000
+playsound block.note_block.pling record @a[distance=..10.87] ^0.0 ^ ^ 0.500 0.59460 0.000
+playsound block.note_block.pling record @a[distance=..9.24] ^0.0 ^ ^ 0.500 0.94387 0.000
+playsound block.note_block.pling record @a[distance=..8.28] ^0.0 ^ ^ 0.500 1.18921 0.000
+playsound block.note_block.pling_-1 record @a[distance=..11.89] ^-1.0 ^ ^ 0.600 0.96204 0.000
+playsound block.note_block.pling_-1 record @a[distance=..11.90] ^-1.0 ^ ^ 0.300 0.94551 0.000
+playsound block.note_block.pling_-1 record @a[distance=..11.89] ^1.0 ^ ^ 0.800 0.98112 0.000
+playsound block.note_block.pling_-1 record @a[distance=..11.89] ^1.0 ^ ^ 0.400 0.96426 0.000
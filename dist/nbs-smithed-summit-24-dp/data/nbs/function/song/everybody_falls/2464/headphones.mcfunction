@@ -0,0 +1,15 @@
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.100 0.62996 0.000
+playsound block.note_block.flute_-1 record @s[] ^-0.0 ^ ^ 0.300 1.25992 0.000
+playsound block.note_block.flute_-1 record @s[] ^-0.0 ^ ^ 0.250 1.88775 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.075 0.94387 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.210 0.59460 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.210 1.18921 0.000
+playsound block.note_block.pling_-1 record @s[] ^-0.0 ^ ^ 0.500 1.88775 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.500 0.59460 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.500 0.94387 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.500 1.18921 0.000
+playsound block.note_block.pling_-1 record @s[] ^0.5 ^ ^ 0.600 1.03946 0.000
+playsound block.note_block.pling_-1 record @s[] ^0.5 ^ ^ 0.300 1.02160 0.000
+playsound block.note_block.pling_-1 record @s[] ^-0.5 ^ ^ 0.800 1.05946 0.000
+playsound block.note_block.pling_-1 record @s[] ^-0.5 ^ ^ 0.400 1.04126 0.000
+particle note ~ ~2.25 ~ 0 0 0 1 1
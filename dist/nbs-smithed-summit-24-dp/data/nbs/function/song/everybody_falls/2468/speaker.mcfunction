@@ -0,0 +1,10 @@
+playsound block.note_block.flute record @a[distance=..8.06] ^0.0 ^ ^ 0.100 0.62996 0.000
+playsound block.note_block.flute_-1 record @a[distance=..10.71] ^0.0 ^ ^ 0.300 1.25992 0.000
+playsound block.note_block.flute_-1 record @a[distance=..9.24] ^0.0 ^ ^ 0.250 1.88775 0.000
+playsound block.note_block.flute record @a[distance=..6.86] ^0.0 ^ ^ 0.075 0.94387 0.000
+playsound block.note_block.flute record @a[distance=..8.28] ^0.0 ^ ^ 0.210 0.59460 0.000
+playsound block.note_block.flute record @a[distance=..6.48] ^0.0 ^ ^ 0.210 1.18921 0.000
+playsound block.note_block.pling_-1 record @a[distance=..11.84] ^-1.0 ^ ^ 0.600 1.12246 0.000
+playsound block.note_block.pling_-1 record @a[distance=..11.84] ^-1.0 ^ ^ 0.300 1.10318 0.000
+playsound block.note_block.pling_-1 record @a[distance=..11.83] ^1.0 ^ ^ 0.800 1.14406 0.000
+playsound block.note_block.pling_-1 record @a[distance=..11.83] ^1.0 ^ ^ 0.400 1.12441 0.000
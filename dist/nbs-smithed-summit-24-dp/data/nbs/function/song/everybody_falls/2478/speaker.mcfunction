@@ -0,0 +1,16 @@
+playsound block.note_block.flute record @a[distance=..8.06] ^0.0 ^ ^ 0.100 0.62996 0.000
+playsound block.note_block.flute_-1 record @a[distance=..10.71] ^0.0 ^ ^ 0.300 1.25992 0.000
+playsound block.note_block.flute_-1 record @a[distance=..9.24] ^0.0 ^ ^ 0.250 1.88775 0.000
+playsound block.note_block.flute record @a[distance=..6.86] ^0.0 ^ ^ 0.075 0.94387 0.000
+playsound block.note_block.flute record @a[distance=..8.28] ^0.0 ^ ^ 0.210 0.59460 0.000
+playsound block.note_block.flute record @a[distance=..6.48] ^0.0 ^ ^ 0.210 1.18921 0.000
+playsound block.note_block.pling record @a[distance=..10.35] ^0.0 ^ ^ 0.700 0.70711 0.000
+playsound block.note_block.pling record @a[distance=..7.65] ^0.0 ^ ^ 0.700 1.41421 0.000
+playsound block.note_block.pling_-1 record @a[distance=..11.44] ^0.0 ^ ^ 0.500 1.78180 0.000
+playsound block.note_block.pling record @a[distance=..11.14] ^0.0 ^ ^ 0.500 0.52973 0.000
+playsound block.note_block.pling record @a[distance=..9.48] ^0.0 ^ ^ 0.500 0.89090 0.000
+playsound block.note_block.pling record @a[distance=..8.76] ^0.0 ^ ^ 0.500 1.05946 0.000
+playsound block.note_block.pling_-1 record @a[distance=..11.72] ^-1.0 ^ ^ 0.600 1.36053 0.000
+playsound block.note_block.pling_-1 record @a[distance=..11.74] ^-1.0 ^ ^ 0.300 1.33715 0.000
+playsound block.note_block.pling_-1 record @a[distance=..11.71] ^1.0 ^ ^ 0.800 1.38751 0.000
+playsound block.note_block.pling_-1 record @a[distance=..11.72] ^1.0 ^ ^ 0.400 1.36368 0.000
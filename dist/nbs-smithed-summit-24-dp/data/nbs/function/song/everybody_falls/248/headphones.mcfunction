@@ -0,0 +1,5 @@
+playsound block.note_block.bit_1 record @s[] ^0.3 ^ ^ 0.224 1.49831 0.000
+playsound block.note_block.bit_1 record @s[] ^0.25 ^ ^ 0.132 1.97133 0.000
+playsound block.note_block.bit_1 record @s[] ^0.35 ^ ^ 0.155 1.25992 0.000
+playsound block.note_block.bit_1 record @s[] ^0.3 ^ ^ 0.128 1.47683 0.000
+particle note ~ ~2.25 ~ 0 0 0 1 1
@@ -0,0 +1,17 @@
+playsound block.note_block.flute record @a[distance=..8.06] ^0.0 ^ ^ 0.100 0.62996 0.000
+playsound block.note_block.flute_-1 record @a[distance=..10.71] ^0.0 ^ ^ 0.300 1.25992 0.000
+playsound block.note_block.flute_-1 record @a[distance=..11.77] ^0.0 ^ ^ 0.450 0.62996 0.000
+playsound block.note_block.flute_-1 record @a[distance=..9.24] ^0.0 ^ ^ 0.250 1.88775 0.000
+playsound block.note_block.flute record @a[distance=..6.86] ^0.0 ^ ^ 0.075 0.94387 0.000
+playsound block.note_block.flute record @a[distance=..8.28] ^0.0 ^ ^ 0.210 0.59460 0.000
+playsound block.note_block.flute record @a[distance=..6.48] ^0.0 ^ ^ 0.210 1.18921 0.000
+playsound block.note_block.pling record @a[distance=..10.87] ^0.0 ^ ^ 0.700 0.59460 0.000
+playsound block.note_block.pling record @a[distance=..8.28] ^0.0 ^ ^ 0.700 1.18921 0.000
+playsound block.note_block.pling_-1 record @a[distance=..11.58] ^0.0 ^ ^ 0.500 1.58740 0.000
+playsound block.note_block.pling_-1 record @a[distance=..11.35] ^0.0 ^ ^ 0.500 1.88775 0.000
+playsound block.note_block.pling record @a[distance=..9.94] ^0.0 ^ ^ 0.500 0.79370 0.000
+playsound block.note_block.pling record @a[distance=..9.24] ^0.0 ^ ^ 0.500 0.94387 0.000
+playsound block.note_block.pling_-1 record @a[distance=..11.49] ^-1.0 ^ ^ 0.600 1.71416 0.000
+playsound block.note_block.pling_-1 record @a[distance=..11.51] ^-1.0 ^ ^ 0.300 1.68471 0.000
+playsound block.note_block.pling_-1 record @a[distance=..11.46] ^1.0 ^ ^ 0.800 1.74816 0.000
+playsound block.note_block.pling_-1 record @a[distance=..11.49] ^1.0 ^ ^ 0.400 1.71812 0.000
@@ -0,0 +1,8 @@
+playsound fireworks_launch1 record @s[] ^-0.0 ^ ^ 0.750 1.00000 0.000
+playsound fireworks_launch1 record @s[] ^-0.6 ^ ^ 0.750 1.00000 0.000
+playsound fireworks_launch1 record @s[] ^-0.0 ^ ^ 0.700 0.79370 0.000
+playsound fireworks_launch1 record @s[] ^-0.0 ^ ^ 1.000 0.89090 0.000
+playsound block.note_block.bit_1 record @s[] ^0.4 ^ ^ 0.210 1.00000 0.000
+playsound block.note_block.bit_1 record @s[] ^0.35 ^ ^ 0.124 1.24186 0.000
+playsound block.note_block.bit_1 record @s[] ^0.45 ^ ^ 0.145 0.74915 0.000
+playsound block.note_block.bit_1 record @s[] ^0.4 ^ ^ 0.120 0.98566 0.000
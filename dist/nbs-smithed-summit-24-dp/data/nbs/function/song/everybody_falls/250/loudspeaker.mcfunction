@@ -0,0 +1,8 @@
+playsound fireworks_launch1 record @a[distance=..48.00] ^0.0 ^ ^ 1.753 1.00000 0.000
+playsound fireworks_launch1 record @a[distance=..48.00] ^2.0 ^ ^ 1.753 1.00000 0.000
+playsound fireworks_launch1 record @a[distance=..48.00] ^0.0 ^ ^ 1.674 0.79370 0.000
+playsound fireworks_launch1 record @a[distance=..48.00] ^0.0 ^ ^ 2.365 0.89090 0.000
+playsound block.note_block.bit_1 record @a[distance=..48.00] ^-2.0 ^ ^ 0.457 1.00000 0.000
+playsound block.note_block.bit_1 record @a[distance=..48.00] ^-2.0 ^ ^ 0.264 1.24186 0.000
+playsound block.note_block.bit_1 record @a[distance=..48.00] ^-2.0 ^ ^ 0.325 0.74915 0.000
+playsound block.note_block.bit_1 record @a[distance=..48.00] ^-2.0 ^ ^ 0.261 0.98566 0.000
@@ -0,0 +1,8 @@
+playsound fireworks_launch1 record @a[distance=..6.75] ^0.0 ^ ^ 0.750 1.00000 0.000
+playsound fireworks_launch1 record @a[distance=..6.75] ^1.0 ^ ^ 0.750 1.00000 0.000
+playsound fireworks_launch1 record @a[distance=..7.29] ^0.0 ^ ^ 0.700 0.79370 0.000
+playsound fireworks_launch1 record @a[distance=..6.99] ^0.0 ^ ^ 1.000 0.89090 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.12] ^-1.0 ^ ^ 0.210 1.00000 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.07] ^-1.0 ^ ^ 0.124 1.24186 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.26] ^-1.0 ^ ^ 0.145 0.74915 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.12] ^-1.0 ^ ^ 0.120 0.98566 0.000
@@ -0,0 +1,10 @@
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.100 0.59460 0.000
+playsound block.note_block.flute_-1 record @s[] ^-0.0 ^ ^ 0.300 1.18921 0.000
+playsound block.note_block.flute_-1 record @s[] ^-0.0 ^ ^ 0.250 1.78180 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.075 0.89090 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.210 0.52973 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.210 1.05946 0.000
+playsound block.note_block.pling record @s[] ^0.5 ^ ^ 0.600 0.60605 0.000
+playsound block.note_block.pling record @s[] ^0.5 ^ ^ 0.300 0.59563 0.000
+playsound block.note_block.pling record @s[] ^-0.5 ^ ^ 0.800 0.61807 0.000
+playsound block.note_block.pling record @s[] ^-0.5 ^ ^ 0.400 0.60745 0.000
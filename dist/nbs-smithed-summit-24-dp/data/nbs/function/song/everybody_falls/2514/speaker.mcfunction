@@ -0,0 +1,13 @@
+playsound block.note_block.flute record @a[distance=..7.65] ^0.0 ^ ^ 0.100 0.70711 0.000
+playsound block.note_block.flute_-1 record @a[distance=..10.35] ^0.0 ^ ^ 0.300 1.41421 0.000
+playsound block.note_block.flute_-1 record @a[distance=..11.69] ^0.0 ^ ^ 0.450 0.70711 0.000
+playsound block.note_block.flute_-1 record @a[distance=..9.24] ^0.0 ^ ^ 0.250 1.88775 0.000
+playsound block.note_block.flute record @a[distance=..6.86] ^0.0 ^ ^ 0.075 0.94387 0.000
+playsound block.note_block.flute record @a[distance=..8.76] ^0.0 ^ ^ 0.210 0.52973 0.000
+playsound block.note_block.flute record @a[distance=..6.65] ^0.0 ^ ^ 0.210 1.05946 0.000
+playsound fireworks_blast_far1 record @a[distance=..6.75] ^1.0 ^ ^ 0.680 1.00000 0.000
+playsound fireworks_blast_far1 record @a[distance=..6.42] ^-1.0 ^ ^ 0.750 1.25992 0.000
+playsound block.note_block.pling record @a[distance=..10.48] ^-1.0 ^ ^ 0.600 0.68026 0.000
+playsound block.note_block.pling record @a[distance=..10.54] ^-1.0 ^ ^ 0.300 0.66858 0.000
+playsound block.note_block.pling record @a[distance=..10.42] ^1.0 ^ ^ 0.800 0.69376 0.000
+playsound block.note_block.pling record @a[distance=..10.47] ^1.0 ^ ^ 0.400 0.68184 0.000
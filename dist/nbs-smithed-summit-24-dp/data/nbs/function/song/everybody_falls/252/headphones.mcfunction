@@ -0,0 +1,4 @@
+playsound block.note_block.bit_1 record @s[] ^0.5 ^ ^ 0.196 0.62996 0.000
+playsound block.note_block.bit_1 record @s[] ^0.45 ^ ^ 0.116 0.73841 0.000
+playsound block.note_block.bit_1 record @s[] ^0.55 ^ ^ 0.135 0.74915 0.000
+playsound block.note_block.bit_1 record @s[] ^0.5 ^ ^ 0.112 0.62093 0.000
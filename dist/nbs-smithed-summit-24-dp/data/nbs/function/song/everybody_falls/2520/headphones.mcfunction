@@ -0,0 +1,11 @@
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.100 0.70711 0.000
+playsound block.note_block.flute_-1 record @s[] ^-0.0 ^ ^ 0.300 1.41421 0.000
+playsound block.note_block.flute_-1 record @s[] ^-0.0 ^ ^ 0.250 1.88775 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.075 0.94387 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.210 0.52973 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.210 1.05946 0.000
+playsound block.note_block.pling record @s[] ^0.5 ^ ^ 0.600 0.76357 0.000
+playsound block.note_block.pling record @s[] ^0.5 ^ ^ 0.300 0.75045 0.000
+playsound block.note_block.pling record @s[] ^-0.5 ^ ^ 0.800 0.77871 0.000
+playsound block.note_block.pling record @s[] ^-0.5 ^ ^ 0.400 0.76534 0.000
+particle note ~ ~2.25 ~ 0 0 0 1 1
@@ -0,0 +1,10 @@
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.100 0.94387 0.000
+playsound block.note_block.flute_-1 record @s[] ^-0.0 ^ ^ 0.300 1.88775 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.250 0.59460 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.075 1.18921 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.210 0.59460 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.210 1.18921 0.000
+playsound block.note_block.pling record @s[] ^0.5 ^ ^ 0.600 1.12246 0.000
+playsound block.note_block.pling record @s[] ^0.5 ^ ^ 0.300 1.10318 0.000
+playsound block.note_block.pling record @s[] ^-0.5 ^ ^ 0.800 1.14406 0.000
+playsound block.note_block.pling record @s[] ^-0.5 ^ ^ 0.400 1.12441 0.000
@@ -0,0 +1,11 @@
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.100 0.94387 0.000
+playsound block.note_block.flute_-1 record @s[] ^-0.0 ^ ^ 0.300 1.88775 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.250 0.59460 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.075 1.18921 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.210 0.59460 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.210 1.18921 0.000
+playsound block.note_block.pling record @s[] ^0.5 ^ ^ 0.600 1.41421 0.000
+playsound block.note_block.pling record @s[] ^0.5 ^ ^ 0.300 1.38992 0.000
+playsound block.note_block.pling record @s[] ^-0.5 ^ ^ 0.800 1.44143 0.000
+playsound block.note_block.pling record @s[] ^-0.5 ^ ^ 0.400 1.41667 0.000
+particle note ~ ~2.25 ~ 0 0 0 1 1
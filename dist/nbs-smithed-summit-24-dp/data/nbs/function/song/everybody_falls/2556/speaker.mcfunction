@@ -0,0 +1,16 @@
+playsound block.note_block.flute record @a[distance=..7.29] ^0.0 ^ ^ 0.100 0.79370 0.000
+playsound block.note_block.flute_-1 record @a[distance=..9.94] ^0.0 ^ ^ 0.300 1.58740 0.000
+playsound block.note_block.flute record @a[distance=..8.28] ^0.0 ^ ^ 0.250 0.59460 0.000
+playsound block.note_block.flute record @a[distance=..6.48] ^0.0 ^ ^ 0.075 1.18921 0.000
+playsound block.note_block.flute record @a[distance=..7.65] ^0.0 ^ ^ 0.210 0.70711 0.000
+playsound block.note_block.flute record @a[distance=..6.31] ^0.0 ^ ^ 0.210 1.41421 0.000
+playsound block.note_block.pling record @a[distance=..10.87] ^0.0 ^ ^ 0.700 0.59460 0.000
+playsound block.note_block.pling record @a[distance=..8.28] ^0.0 ^ ^ 0.700 1.18921 0.000
+playsound block.note_block.pling_-1 record @a[distance=..11.58] ^0.0 ^ ^ 0.500 1.58740 0.000
+playsound block.note_block.pling_-1 record @a[distance=..11.35] ^0.0 ^ ^ 0.500 1.88775 0.000
+playsound block.note_block.pling record @a[distance=..9.94] ^0.0 ^ ^ 0.500 0.79370 0.000
+playsound block.note_block.pling record @a[distance=..9.24] ^0.0 ^ ^ 0.500 0.94387 0.000
+playsound block.note_block.pling record @a[distance=..7.40] ^-1.0 ^ ^ 0.600 1.52714 0.000
+playsound block.note_block.pling record @a[distance=..7.45] ^-1.0 ^ ^ 0.300 1.50091 0.000
+playsound block.note_block.pling record @a[distance=..7.34] ^1.0 ^ ^ 0.800 1.55743 0.000
+playsound block.note_block.pling record @a[distance=..7.39] ^1.0 ^ ^ 0.400 1.53067 0.000
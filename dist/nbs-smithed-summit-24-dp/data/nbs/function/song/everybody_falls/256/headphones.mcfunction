@@ -0,0 +1,5 @@
+playsound block.note_block.bit_1 record @s[] ^0.7 ^ ^ 0.168 1.49831 0.000
+playsound block.note_block.bit_1 record @s[] ^0.65 ^ ^ 0.100 1.24186 0.000
+playsound block.note_block.bit_1 record @s[] ^0.75 ^ ^ 0.115 2.00000 0.000
+playsound block.note_block.bit_1 record @s[] ^0.7 ^ ^ 0.096 1.47683 0.000
+particle note ~ ~2.25 ~ 0 0 0 1 1
@@ -0,0 +1,10 @@
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.100 0.79370 0.000
+playsound block.note_block.flute_-1 record @s[] ^-0.0 ^ ^ 0.300 1.58740 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.250 0.59460 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.075 1.18921 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.210 0.70711 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.210 1.41421 0.000
+playsound block.note_block.pling record @s[] ^0.5 ^ ^ 0.675 1.78180 0.000
+playsound block.note_block.pling record @s[] ^0.5 ^ ^ 0.300 1.75119 0.000
+playsound block.note_block.pling record @s[] ^-0.5 ^ ^ 0.900 1.81609 0.000
+playsound block.note_block.pling record @s[] ^-0.5 ^ ^ 0.400 1.78489 0.000
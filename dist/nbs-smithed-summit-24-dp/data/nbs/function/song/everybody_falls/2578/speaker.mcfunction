@@ -0,0 +1,2 @@
+playsound mob_skeleton_hurt4 record @a[distance=..6.75] ^-1.0 ^ ^ 0.450 1.00000 0.000
+playsound mob_skeleton_hurt4 record @a[distance=..6.31] ^-1.0 ^ ^ 0.450 1.41421 0.000
@@ -0,0 +1,2 @@
+playsound mob_skeleton_hurt4 record @a[distance=..48.00] ^2.0 ^ ^ 1.052 1.00000 0.000
+playsound mob_skeleton_hurt4 record @a[distance=..48.00] ^2.0 ^ ^ 1.016 1.41421 0.000
@@ -0,0 +1,28 @@
+playsound block.note_block.bass record @a[distance=..48.00] ^0.0 ^ ^ 2.199 0.62996 0.000
+playsound block.note_block.bass record @a[distance=..48.00] ^0.0 ^ ^ 2.932 0.62996 0.000
+playsound block.note_block.bell record @a[distance=..48.00] ^0.0 ^ ^ 1.314 0.94387 0.000
+playsound block.note_block.xylophone record @a[distance=..48.00] ^0.0 ^ ^ 1.970 0.94387 0.000
+playsound block.note_block.pling record @a[distance=..48.00] ^0.0 ^ ^ 2.011 0.94387 0.000
+playsound block.note_block.pling record @a[distance=..48.00] ^0.0 ^ ^ 1.257 0.94387 0.000
+playsound block.note_block.flute record @a[distance=..48.00] ^0.0 ^ ^ 1.764 0.94387 0.000
+playsound block.note_block.pling record @a[distance=..48.00] ^0.0 ^ ^ 1.826 0.62996 0.000
+playsound block.note_block.pling record @a[distance=..48.00] ^0.0 ^ ^ 1.788 0.79370 0.000
+playsound block.note_block.pling record @a[distance=..48.00] ^0.0 ^ ^ 1.759 0.94387 0.000
+playsound block.note_block.pling record @a[distance=..48.00] ^0.0 ^ ^ 1.712 1.25992 0.000
+playsound block.note_block.flute_-1 record @a[distance=..48.00] ^0.0 ^ ^ 1.257 1.88775 0.000
+playsound block.note_block.flute record @a[distance=..48.00] ^0.0 ^ ^ 1.223 0.62996 0.000
+playsound block.note_block.flute record @a[distance=..48.00] ^0.0 ^ ^ 1.196 0.79370 0.000
+playsound block.note_block.flute record @a[distance=..48.00] ^0.0 ^ ^ 1.176 0.94387 0.000
+playsound block.note_block.basedrum_-1 record @a[distance=..48.00] ^0.0 ^ ^ 2.838 1.88775 0.000
+playsound block.note_block.basedrum record @a[distance=..48.00] ^0.0 ^ ^ 1.819 0.94387 0.000
+playsound random_fizz record @a[distance=..48.00] ^0.0 ^ ^ 1.599 0.94387 0.000
+playsound fireworks_blast_far1 record @a[distance=..48.00] ^0.0 ^ ^ 1.654 0.66742 0.000
+playsound fireworks_blast_far1 record @a[distance=..48.00] ^0.0 ^ ^ 1.599 0.94387 0.000
+playsound mob_wither_death record @a[distance=..48.00] ^0.0 ^ ^ 0.517 1.18921 0.000
+playsound mob_wither_death record @a[distance=..48.00] ^0.0 ^ ^ 0.493 1.88775 0.000
+playsound mob_wither_death record @a[distance=..48.00] ^0.0 ^ ^ 0.799 0.94387 0.000
+playsound block.note_block.snare record @a[distance=..48.00] ^0.0 ^ ^ 0.903 1.41421 0.000
+playsound block.note_block.bit_1 record @a[distance=..48.00] ^2.0 ^ ^ 2.162 1.05946 0.000
+playsound block.note_block.bit_1 record @a[distance=..48.00] ^2.0 ^ ^ 2.165 1.04729 0.000
+playsound block.note_block.bit_1 record @a[distance=..48.00] ^-2.0 ^ ^ 2.169 1.02930 0.000
+playsound block.note_block.bit_1 record @a[distance=..48.00] ^-2.0 ^ ^ 2.172 1.01748 0.000
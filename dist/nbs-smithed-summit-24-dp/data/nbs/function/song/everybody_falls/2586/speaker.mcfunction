@@ -0,0 +1,28 @@
+playsound block.note_block.bass record @a[distance=..11.97] ^0.0 ^ ^ 0.750 0.62996 0.000
+playsound block.note_block.bass record @a[distance=..11.97] ^0.0 ^ ^ 1.000 0.62996 0.000
+playsound block.note_block.bell record @a[distance=..6.14] ^0.0 ^ ^ 0.600 0.94387 0.000
+playsound block.note_block.xylophone record @a[distance=..6.14] ^0.0 ^ ^ 0.900 0.94387 0.000
+playsound block.note_block.pling record @a[distance=..9.24] ^0.0 ^ ^ 0.800 0.94387 0.000
+playsound block.note_block.pling record @a[distance=..9.24] ^0.0 ^ ^ 0.500 0.94387 0.000
+playsound block.note_block.flute record @a[distance=..6.86] ^0.0 ^ ^ 0.750 0.94387 0.000
+playsound block.note_block.pling record @a[distance=..10.71] ^0.0 ^ ^ 0.700 0.62996 0.000
+playsound block.note_block.pling record @a[distance=..9.94] ^0.0 ^ ^ 0.700 0.79370 0.000
+playsound block.note_block.pling record @a[distance=..9.24] ^0.0 ^ ^ 0.700 0.94387 0.000
+playsound block.note_block.pling record @a[distance=..8.06] ^0.0 ^ ^ 0.700 1.25992 0.000
+playsound block.note_block.flute_-1 record @a[distance=..9.24] ^0.0 ^ ^ 0.500 1.88775 0.000
+playsound block.note_block.flute record @a[distance=..8.06] ^0.0 ^ ^ 0.500 0.62996 0.000
+playsound block.note_block.flute record @a[distance=..7.29] ^0.0 ^ ^ 0.500 0.79370 0.000
+playsound block.note_block.flute record @a[distance=..6.86] ^0.0 ^ ^ 0.500 0.94387 0.000
+playsound block.note_block.basedrum_-1 record @a[distance=..11.90] ^0.0 ^ ^ 1.000 1.88775 0.000
+playsound block.note_block.basedrum record @a[distance=..11.35] ^0.0 ^ ^ 0.680 0.94387 0.000
+playsound random_fizz record @a[distance=..6.86] ^0.0 ^ ^ 0.680 0.94387 0.000
+playsound fireworks_blast_far1 record @a[distance=..7.85] ^0.0 ^ ^ 0.680 0.66742 0.000
+playsound fireworks_blast_far1 record @a[distance=..6.86] ^0.0 ^ ^ 0.680 0.94387 0.000
+playsound mob_wither_death record @a[distance=..6.48] ^0.0 ^ ^ 0.225 1.18921 0.000
+playsound mob_wither_death record @a[distance=..6.14] ^0.0 ^ ^ 0.225 1.88775 0.000
+playsound mob_wither_death record @a[distance=..6.86] ^0.0 ^ ^ 0.340 0.94387 0.000
+playsound block.note_block.snare record @a[distance=..6.31] ^0.0 ^ ^ 0.400 1.41421 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.10] ^1.0 ^ ^ 1.000 1.05946 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.11] ^1.0 ^ ^ 1.000 1.04729 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.11] ^-1.0 ^ ^ 1.000 1.02930 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.11] ^-1.0 ^ ^ 1.000 1.01748 0.000
@@ -0,0 +1,15 @@
+playsound block.note_block.bass record @s[] ^-0.0 ^ ^ 0.680 0.62996 0.000
+playsound block.note_block.bass record @s[] ^-0.0 ^ ^ 0.600 0.62996 0.000
+playsound block.note_block.bell record @s[] ^-0.0 ^ ^ 0.600 0.94387 0.000
+playsound block.note_block.xylophone record @s[] ^-0.0 ^ ^ 0.900 0.94387 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.800 0.94387 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.500 0.94387 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.750 0.94387 0.000
+playsound block.note_block.flute_-1 record @s[] ^-0.0 ^ ^ 0.500 1.88775 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.500 0.62996 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.500 0.79370 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.500 0.94387 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.5 ^ ^ 1.000 1.00000 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.5 ^ ^ 1.000 0.98851 0.000
+playsound block.note_block.bit_1 record @s[] ^0.5 ^ ^ 1.000 0.97153 0.000
+playsound block.note_block.bit_1 record @s[] ^0.5 ^ ^ 1.000 0.96037 0.000
@@ -0,0 +1,15 @@
+playsound block.note_block.bass record @a[distance=..48.00] ^0.0 ^ ^ 1.994 0.62996 0.000
+playsound block.note_block.bass record @a[distance=..48.00] ^0.0 ^ ^ 1.759 0.62996 0.000
+playsound block.note_block.bell record @a[distance=..48.00] ^0.0 ^ ^ 1.314 0.94387 0.000
+playsound block.note_block.xylophone record @a[distance=..48.00] ^0.0 ^ ^ 1.970 0.94387 0.000
+playsound block.note_block.pling record @a[distance=..48.00] ^0.0 ^ ^ 2.011 0.94387 0.000
+playsound block.note_block.pling record @a[distance=..48.00] ^0.0 ^ ^ 1.257 0.94387 0.000
+playsound block.note_block.flute record @a[distance=..48.00] ^0.0 ^ ^ 1.764 0.94387 0.000
+playsound block.note_block.flute_-1 record @a[distance=..48.00] ^0.0 ^ ^ 1.257 1.88775 0.000
+playsound block.note_block.flute record @a[distance=..48.00] ^0.0 ^ ^ 1.223 0.62996 0.000
+playsound block.note_block.flute record @a[distance=..48.00] ^0.0 ^ ^ 1.196 0.79370 0.000
+playsound block.note_block.flute record @a[distance=..48.00] ^0.0 ^ ^ 1.176 0.94387 0.000
+playsound block.note_block.bit_1 record @a[distance=..48.00] ^2.0 ^ ^ 2.176 1.00000 0.000
+playsound block.note_block.bit_1 record @a[distance=..48.00] ^2.0 ^ ^ 2.178 0.98851 0.000
+playsound block.note_block.bit_1 record @a[distance=..48.00] ^-2.0 ^ ^ 2.182 0.97153 0.000
+playsound block.note_block.bit_1 record @a[distance=..48.00] ^-2.0 ^ ^ 2.185 0.96037 0.000
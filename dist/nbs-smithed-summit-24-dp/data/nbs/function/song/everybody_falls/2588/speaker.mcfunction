@@ -0,0 +1,15 @@
+playsound block.note_block.bass record @a[distance=..11.97] ^0.0 ^ ^ 0.680 0.62996 0.000
+playsound block.note_block.bass record @a[distance=..11.97] ^0.0 ^ ^ 0.600 0.62996 0.000
+playsound block.note_block.bell record @a[distance=..6.14] ^0.0 ^ ^ 0.600 0.94387 0.000
+playsound block.note_block.xylophone record @a[distance=..6.14] ^0.0 ^ ^ 0.900 0.94387 0.000
+playsound block.note_block.pling record @a[distance=..9.24] ^0.0 ^ ^ 0.800 0.94387 0.000
+playsound block.note_block.pling record @a[distance=..9.24] ^0.0 ^ ^ 0.500 0.94387 0.000
+playsound block.note_block.flute record @a[distance=..6.86] ^0.0 ^ ^ 0.750 0.94387 0.000
+playsound block.note_block.flute_-1 record @a[distance=..9.24] ^0.0 ^ ^ 0.500 1.88775 0.000
+playsound block.note_block.flute record @a[distance=..8.06] ^0.0 ^ ^ 0.500 0.62996 0.000
+playsound block.note_block.flute record @a[distance=..7.29] ^0.0 ^ ^ 0.500 0.79370 0.000
+playsound block.note_block.flute record @a[distance=..6.86] ^0.0 ^ ^ 0.500 0.94387 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.12] ^1.0 ^ ^ 1.000 1.00000 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.12] ^1.0 ^ ^ 1.000 0.98851 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.13] ^-1.0 ^ ^ 1.000 0.97153 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.13] ^-1.0 ^ ^ 1.000 0.96037 0.000
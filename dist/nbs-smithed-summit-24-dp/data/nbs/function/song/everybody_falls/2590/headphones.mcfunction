@@ -0,0 +1,13 @@
+playsound block.note_block.bass record @s[] ^-0.0 ^ ^ 0.680 0.62996 0.000
+playsound block.note_block.bass record @s[] ^-0.0 ^ ^ 0.600 0.62996 0.000
+playsound block.note_block.bell record @s[] ^-0.0 ^ ^ 0.600 0.94387 0.000
+playsound block.note_block.xylophone record @s[] ^-0.0 ^ ^ 0.900 0.94387 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.800 0.94387 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.500 0.94387 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.750 0.94387 0.000
+playsound dig_gravel1 record @s[] ^-0.25 ^ ^ 0.700 1.58740 0.000
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 0.400 1.18921 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.5 ^ ^ 1.000 0.94387 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.5 ^ ^ 1.000 0.93303 0.000
+playsound block.note_block.bit_1 record @s[] ^0.5 ^ ^ 1.000 0.91700 0.000
+playsound block.note_block.bit_1 record @s[] ^0.5 ^ ^ 1.000 0.90647 0.000
@@ -0,0 +1,13 @@
+playsound block.note_block.bass record @a[distance=..48.00] ^0.0 ^ ^ 1.994 0.62996 0.000
+playsound block.note_block.bass record @a[distance=..48.00] ^0.0 ^ ^ 1.759 0.62996 0.000
+playsound block.note_block.bell record @a[distance=..48.00] ^0.0 ^ ^ 1.314 0.94387 0.000
+playsound block.note_block.xylophone record @a[distance=..48.00] ^0.0 ^ ^ 1.970 0.94387 0.000
+playsound block.note_block.pling record @a[distance=..48.00] ^0.0 ^ ^ 2.011 0.94387 0.000
+playsound block.note_block.pling record @a[distance=..48.00] ^0.0 ^ ^ 1.257 0.94387 0.000
+playsound block.note_block.flute record @a[distance=..48.00] ^0.0 ^ ^ 1.764 0.94387 0.000
+playsound dig_gravel1 record @a[distance=..48.00] ^1.0 ^ ^ 1.561 1.58740 0.000
+playsound block.note_block.snare record @a[distance=..48.00] ^0.0 ^ ^ 0.919 1.18921 0.000
+playsound block.note_block.bit_1 record @a[distance=..48.00] ^2.0 ^ ^ 2.189 0.94387 0.000
+playsound block.note_block.bit_1 record @a[distance=..48.00] ^2.0 ^ ^ 2.192 0.93303 0.000
+playsound block.note_block.bit_1 record @a[distance=..48.00] ^-2.0 ^ ^ 2.196 0.91700 0.000
+playsound block.note_block.bit_1 record @a[distance=..48.00] ^-2.0 ^ ^ 2.199 0.90647 0.000
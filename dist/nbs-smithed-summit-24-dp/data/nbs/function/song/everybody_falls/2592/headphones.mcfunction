@@ -0,0 +1,10 @@
+playsound block.note_block.bell record @s[] ^-0.0 ^ ^ 0.600 0.94387 0.000
+playsound block.note_block.xylophone record @s[] ^-0.0 ^ ^ 0.900 0.94387 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.800 0.94387 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.500 0.94387 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.750 0.94387 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.5 ^ ^ 1.000 0.89090 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.5 ^ ^ 1.000 0.88067 0.000
+particle note ~ ~2.25 ~ 0 0 0 1 1
+playsound block.note_block.bit_1 record @s[] ^0.5 ^ ^ 1.000 0.86554 0.000
+playsound block.note_block.bit_1 record @s[] ^0.5 ^ ^ 1.000 0.85560 0.000
@@ -0,0 +1,14 @@
+playsound block.note_block.bell record @a[distance=..6.14] ^0.0 ^ ^ 0.600 0.94387 0.000
+playsound block.note_block.xylophone record @a[distance=..6.14] ^0.0 ^ ^ 0.900 0.94387 0.000
+playsound block.note_block.pling record @a[distance=..9.24] ^0.0 ^ ^ 0.800 0.94387 0.000
+playsound block.note_block.pling record @a[distance=..9.24] ^0.0 ^ ^ 0.500 0.94387 0.000
+playsound block.note_block.flute record @a[distance=..6.86] ^0.0 ^ ^ 0.750 0.94387 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.16] ^1.0 ^ ^ 1.000 0.89090 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.17] ^1.0 ^ ^ 1.000 0.88067 0.000
+execute store result score #random nbs run random value 1..4
+execute if score #random nbs matches 1 if entity @a[distance=0..12] run function animated_java:music_speaker/animations/animation_speaker_beat_1/play
+execute if score #random nbs matches 2 if entity @a[distance=0..12] run function animated_java:music_speaker/animations/animation_speaker_beat_2/play
+execute if score #random nbs matches 3 if entity @a[distance=0..12] run function animated_java:music_speaker/animations/animation_speaker_beat_3/play
+execute if score #random nbs matches 4 if entity @a[distance=0..12] run function animated_java:music_speaker/animations/animation_speaker_beat_4/play
+playsound block.note_block.bit_1 record @a[distance=..6.18] ^-1.0 ^ ^ 1.000 0.86554 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.18] ^-1.0 ^ ^ 1.000 0.85560 0.000
@@ -0,0 +1,19 @@
+playsound block.note_block.bell record @s[] ^-0.0 ^ ^ 0.600 0.94387 0.000
+playsound block.note_block.xylophone record @s[] ^-0.0 ^ ^ 0.900 0.94387 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.800 0.94387 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.500 0.94387 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.750 0.94387 0.000
+playsound block.note_block.basedrum_-1 record @s[] ^-0.0 ^ ^ 1.000 1.88775 0.000
+playsound block.note_block.basedrum record @s[] ^-0.0 ^ ^ 0.680 0.94387 0.000
+playsound fireworks_blast_far1 record @s[] ^-0.0 ^ ^ 0.680 0.66742 0.000
+playsound fireworks_blast_far1 record @s[] ^-0.0 ^ ^ 0.680 0.94387 0.000
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 0.800 0.50000 0.000
+playsound block.note_block.snare record @s[] ^-0.6 ^ ^ 0.800 1.00000 0.000
+playsound random_wood_click record @s[] ^0.6 ^ ^ 0.800 1.00000 0.000
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 0.400 2.00000 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.5 ^ ^ 1.000 0.84090 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.5 ^ ^ 1.000 0.83124 0.000
+playsound block.note_block.bit_1 record @s[] ^0.5 ^ ^ 1.000 1.05946 0.000
+playsound block.note_block.bit_1 record @s[] ^0.5 ^ ^ 1.000 0.81696 0.000
+playsound block.note_block.bit_1 record @s[] ^0.5 ^ ^ 1.000 0.80757 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.5 ^ ^ 1.000 1.02930 0.000
@@ -0,0 +1,7 @@
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.750 0.94387 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.5 ^ ^ 1.000 0.79370 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.5 ^ ^ 1.000 0.78458 0.000
+playsound block.note_block.bit_1 record @s[] ^0.5 ^ ^ 1.000 1.00000 0.000
+playsound block.note_block.bit_1 record @s[] ^0.5 ^ ^ 1.000 0.77111 0.000
+playsound block.note_block.bit_1 record @s[] ^0.5 ^ ^ 1.000 0.76225 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.5 ^ ^ 1.000 0.97153 0.000
@@ -0,0 +1,7 @@
+playsound block.note_block.flute record @a[distance=..6.86] ^0.0 ^ ^ 0.750 0.94387 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.23] ^1.0 ^ ^ 1.000 0.79370 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.23] ^1.0 ^ ^ 1.000 0.78458 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.12] ^-1.0 ^ ^ 1.000 1.00000 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.24] ^-1.0 ^ ^ 1.000 0.77111 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.25] ^-1.0 ^ ^ 1.000 0.76225 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.13] ^1.0 ^ ^ 1.000 0.97153 0.000
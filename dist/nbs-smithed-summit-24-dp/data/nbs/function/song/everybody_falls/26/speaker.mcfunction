@@ -0,0 +1,7 @@
+playsound block.note_block.pling record @a[distance=..11.25] ^0.0 ^ ^ 0.120 0.50000 0.000
+playsound block.note_block.pling record @a[distance=..10.71] ^0.0 ^ ^ 0.180 0.62996 0.000
+playsound block.note_block.chime_1 record @a[distance=..6.01] ^0.0 ^ ^ 0.119 0.74915 0.000
+playsound block.note_block.chime record @a[distance=..6.02] ^0.0 ^ ^ 0.015 1.78180 0.000
+playsound block.note_block.chime_1 record @a[distance=..6.01] ^0.0 ^ ^ 0.015 0.59460 0.000
+playsound block.note_block.chime_1 record @a[distance=..6.01] ^0.0 ^ ^ 0.383 0.70711 0.000
+playsound block.note_block.chime_1 record @a[distance=..6.01] ^0.0 ^ ^ 0.050 0.62996 0.000
@@ -0,0 +1,4 @@
+playsound block.note_block.bit_1 record @s[] ^0.9 ^ ^ 0.140 1.00000 0.000
+playsound block.note_block.bit_1 record @s[] ^0.85 ^ ^ 0.084 1.24186 0.000
+playsound block.note_block.bit_1 record @s[] ^0.95 ^ ^ 0.095 0.74915 0.000
+playsound block.note_block.bit_1 record @s[] ^0.9 ^ ^ 0.080 0.98566 0.000
@@ -0,0 +1,16 @@
+playsound block.note_block.bell record @a[distance=..6.14] ^0.0 ^ ^ 0.600 0.94387 0.000
+playsound block.note_block.xylophone record @a[distance=..6.14] ^0.0 ^ ^ 0.900 0.94387 0.000
+playsound block.note_block.pling record @a[distance=..9.24] ^0.0 ^ ^ 0.800 0.94387 0.000
+playsound block.note_block.pling record @a[distance=..9.24] ^0.0 ^ ^ 0.500 0.94387 0.000
+playsound block.note_block.flute record @a[distance=..6.86] ^0.0 ^ ^ 0.750 0.94387 0.000
+playsound block.note_block.basedrum_-1 record @a[distance=..11.90] ^0.0 ^ ^ 1.000 1.88775 0.000
+playsound block.note_block.basedrum record @a[distance=..11.35] ^0.0 ^ ^ 0.680 0.94387 0.000
+playsound fireworks_blast_far1 record @a[distance=..7.85] ^0.0 ^ ^ 0.680 0.66742 0.000
+playsound fireworks_blast_far1 record @a[distance=..6.86] ^0.0 ^ ^ 0.680 0.94387 0.000
+playsound block.note_block.snare record @a[distance=..6.12] ^0.0 ^ ^ 0.400 2.00000 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.36] ^1.0 ^ ^ 1.000 0.66742 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.37] ^1.0 ^ ^ 1.000 0.65975 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.19] ^-1.0 ^ ^ 1.000 0.84090 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.39] ^-1.0 ^ ^ 1.000 0.64842 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.40] ^-1.0 ^ ^ 1.000 0.64097 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.21] ^1.0 ^ ^ 1.000 0.81696 0.000
@@ -0,0 +1,8 @@
+playsound block.note_block.flute record @a[distance=..6.86] ^0.0 ^ ^ 0.750 0.94387 0.000
+playsound block.note_block.snare record @a[distance=..6.19] ^0.0 ^ ^ 0.400 1.68179 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.42] ^1.0 ^ ^ 1.000 0.62996 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.43] ^1.0 ^ ^ 1.000 0.62272 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.23] ^-1.0 ^ ^ 1.000 0.79370 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.45] ^-1.0 ^ ^ 1.000 0.61203 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.46] ^-1.0 ^ ^ 1.000 0.60500 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.24] ^1.0 ^ ^ 1.000 0.77111 0.000
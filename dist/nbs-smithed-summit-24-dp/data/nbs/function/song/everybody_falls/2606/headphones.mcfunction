@@ -0,0 +1,23 @@
+playsound block.note_block.bass record @s[] ^-0.0 ^ ^ 0.750 0.62996 0.000
+playsound block.note_block.bass record @s[] ^-0.0 ^ ^ 1.000 0.62996 0.000
+playsound block.note_block.bell record @s[] ^-0.0 ^ ^ 0.600 0.89090 0.000
+playsound block.note_block.xylophone record @s[] ^-0.0 ^ ^ 0.900 0.89090 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.800 0.89090 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.500 0.89090 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.750 0.89090 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.700 0.62996 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.700 0.79370 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.700 0.94387 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.700 1.25992 0.000
+playsound block.note_block.flute_-1 record @s[] ^-0.0 ^ ^ 0.500 1.88775 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.500 0.62996 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.500 0.79370 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.500 0.94387 0.000
+playsound dig_gravel1 record @s[] ^-0.25 ^ ^ 0.700 1.58740 0.000
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 0.400 1.41421 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.5 ^ ^ 1.000 0.59460 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.5 ^ ^ 1.000 0.58777 0.000
+playsound block.note_block.bit_1 record @s[] ^0.5 ^ ^ 1.000 0.74915 0.000
+playsound block.note_block.bit_1 record @s[] ^0.5 ^ ^ 1.000 0.57768 0.000
+playsound block.note_block.bit_1 record @s[] ^0.5 ^ ^ 1.000 0.57104 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.5 ^ ^ 1.000 0.72783 0.000
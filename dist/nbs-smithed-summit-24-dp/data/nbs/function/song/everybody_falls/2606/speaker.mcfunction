@@ -0,0 +1,23 @@
+playsound block.note_block.bass record @a[distance=..11.97] ^0.0 ^ ^ 0.750 0.62996 0.000
+playsound block.note_block.bass record @a[distance=..11.97] ^0.0 ^ ^ 1.000 0.62996 0.000
+playsound block.note_block.bell record @a[distance=..6.16] ^0.0 ^ ^ 0.600 0.89090 0.000
+playsound block.note_block.xylophone record @a[distance=..6.16] ^0.0 ^ ^ 0.900 0.89090 0.000
+playsound block.note_block.pling record @a[distance=..9.48] ^0.0 ^ ^ 0.800 0.89090 0.000
+playsound block.note_block.pling record @a[distance=..9.48] ^0.0 ^ ^ 0.500 0.89090 0.000
+playsound block.note_block.flute record @a[distance=..6.99] ^0.0 ^ ^ 0.750 0.89090 0.000
+playsound block.note_block.pling record @a[distance=..10.71] ^0.0 ^ ^ 0.700 0.62996 0.000
+playsound block.note_block.pling record @a[distance=..9.94] ^0.0 ^ ^ 0.700 0.79370 0.000
+playsound block.note_block.pling record @a[distance=..9.24] ^0.0 ^ ^ 0.700 0.94387 0.000
+playsound block.note_block.pling record @a[distance=..8.06] ^0.0 ^ ^ 0.700 1.25992 0.000
+playsound block.note_block.flute_-1 record @a[distance=..9.24] ^0.0 ^ ^ 0.500 1.88775 0.000
+playsound block.note_block.flute record @a[distance=..8.06] ^0.0 ^ ^ 0.500 0.62996 0.000
+playsound block.note_block.flute record @a[distance=..7.29] ^0.0 ^ ^ 0.500 0.79370 0.000
+playsound block.note_block.flute record @a[distance=..6.86] ^0.0 ^ ^ 0.500 0.94387 0.000
+playsound dig_gravel1 record @a[distance=..6.23] ^0.0 ^ ^ 0.700 1.58740 0.000
+playsound block.note_block.snare record @a[distance=..6.31] ^0.0 ^ ^ 0.400 1.41421 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.48] ^1.0 ^ ^ 1.000 0.59460 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.50] ^1.0 ^ ^ 1.000 0.58777 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.26] ^-1.0 ^ ^ 1.000 0.74915 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.52] ^-1.0 ^ ^ 1.000 0.57768 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.54] ^-1.0 ^ ^ 1.000 0.57104 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.28] ^1.0 ^ ^ 1.000 0.72783 0.000
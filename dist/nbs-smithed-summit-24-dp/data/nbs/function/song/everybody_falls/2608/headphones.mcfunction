@@ -0,0 +1,19 @@
+playsound block.note_block.bass record @s[] ^-0.0 ^ ^ 0.680 0.62996 0.000
+playsound block.note_block.bass record @s[] ^-0.0 ^ ^ 0.600 0.62996 0.000
+playsound block.note_block.bell record @s[] ^-0.0 ^ ^ 0.600 0.89090 0.000
+playsound block.note_block.xylophone record @s[] ^-0.0 ^ ^ 0.900 0.89090 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.800 0.89090 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.500 0.89090 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.750 0.89090 0.000
+playsound block.note_block.flute_-1 record @s[] ^-0.0 ^ ^ 0.500 1.88775 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.500 0.62996 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.500 0.79370 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.500 0.94387 0.000
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 0.400 1.18921 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.5 ^ ^ 1.000 0.56123 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.5 ^ ^ 1.000 0.55478 0.000
+playsound block.note_block.bit_1 record @s[] ^0.5 ^ ^ 1.000 0.70711 0.000
+particle note ~ ~2.25 ~ 0 0 0 1 1
+playsound block.note_block.bit_1 record @s[] ^0.5 ^ ^ 1.000 0.54525 0.000
+playsound block.note_block.bit_1 record @s[] ^0.5 ^ ^ 1.000 0.53899 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.5 ^ ^ 1.000 0.68698 0.000
@@ -0,0 +1,23 @@
+playsound block.note_block.bass record @a[distance=..11.97] ^0.0 ^ ^ 0.680 0.62996 0.000
+playsound block.note_block.bass record @a[distance=..11.97] ^0.0 ^ ^ 0.600 0.62996 0.000
+playsound block.note_block.bell record @a[distance=..6.16] ^0.0 ^ ^ 0.600 0.89090 0.000
+playsound block.note_block.xylophone record @a[distance=..6.16] ^0.0 ^ ^ 0.900 0.89090 0.000
+playsound block.note_block.pling record @a[distance=..9.48] ^0.0 ^ ^ 0.800 0.89090 0.000
+playsound block.note_block.pling record @a[distance=..9.48] ^0.0 ^ ^ 0.500 0.89090 0.000
+playsound block.note_block.flute record @a[distance=..6.99] ^0.0 ^ ^ 0.750 0.89090 0.000
+playsound block.note_block.flute_-1 record @a[distance=..9.24] ^0.0 ^ ^ 0.500 1.88775 0.000
+playsound block.note_block.flute record @a[distance=..8.06] ^0.0 ^ ^ 0.500 0.62996 0.000
+playsound block.note_block.flute record @a[distance=..7.29] ^0.0 ^ ^ 0.500 0.79370 0.000
+playsound block.note_block.flute record @a[distance=..6.86] ^0.0 ^ ^ 0.500 0.94387 0.000
+playsound block.note_block.snare record @a[distance=..6.48] ^0.0 ^ ^ 0.400 1.18921 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.56] ^1.0 ^ ^ 1.000 0.56123 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.58] ^1.0 ^ ^ 1.000 0.55478 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.31] ^-1.0 ^ ^ 1.000 0.70711 0.000
+execute store result score #random nbs run random value 1..4
+execute if score #random nbs matches 1 if entity @a[distance=0..12] run function animated_java:music_speaker/animations/animation_speaker_beat_1/play
+execute if score #random nbs matches 2 if entity @a[distance=0..12] run function animated_java:music_speaker/animations/animation_speaker_beat_2/play
+execute if score #random nbs matches 3 if entity @a[distance=0..12] run function animated_java:music_speaker/animations/animation_speaker_beat_3/play
+execute if score #random nbs matches 4 if entity @a[distance=0..12] run function animated_java:music_speaker/animations/animation_speaker_beat_4/play
+playsound block.note_block.bit_1 record @a[distance=..6.60] ^-1.0 ^ ^ 1.000 0.54525 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.62] ^-1.0 ^ ^ 1.000 0.53899 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.33] ^1.0 ^ ^ 1.000 0.68698 0.000
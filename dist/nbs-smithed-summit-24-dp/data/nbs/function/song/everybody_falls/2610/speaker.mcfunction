@@ -0,0 +1,17 @@
+playsound block.note_block.bass record @a[distance=..11.97] ^0.0 ^ ^ 0.680 0.62996 0.000
+playsound block.note_block.bass record @a[distance=..11.97] ^0.0 ^ ^ 0.600 0.62996 0.000
+playsound block.note_block.flute record @a[distance=..6.99] ^0.0 ^ ^ 0.750 0.89090 0.000
+playsound block.note_block.basedrum_-1 record @a[distance=..11.90] ^0.0 ^ ^ 1.000 1.88775 0.000
+playsound block.note_block.basedrum record @a[distance=..11.35] ^0.0 ^ ^ 0.680 0.94387 0.000
+playsound fireworks_blast_far1 record @a[distance=..7.85] ^0.0 ^ ^ 0.680 0.66742 0.000
+playsound fireworks_blast_far1 record @a[distance=..6.86] ^0.0 ^ ^ 0.680 0.94387 0.000
+playsound block.note_block.snare record @a[distance=..9.00] ^0.0 ^ ^ 0.800 0.50000 0.000
+playsound block.note_block.snare record @a[distance=..6.75] ^1.0 ^ ^ 0.800 1.00000 0.000
+playsound random_wood_click record @a[distance=..6.75] ^-2.0 ^ ^ 0.800 1.00000 0.000
+playsound block.note_block.snare record @a[distance=..6.12] ^0.0 ^ ^ 0.400 2.00000 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.65] ^1.0 ^ ^ 1.000 0.52973 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.67] ^1.0 ^ ^ 1.000 0.52365 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.36] ^-1.0 ^ ^ 1.000 0.66742 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.70] ^-1.0 ^ ^ 1.000 0.51465 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.72] ^-1.0 ^ ^ 1.000 0.50874 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.39] ^1.0 ^ ^ 1.000 0.64842 0.000
@@ -0,0 +1,11 @@
+playsound block.note_block.bell record @s[] ^-0.0 ^ ^ 0.600 0.89090 0.000
+playsound block.note_block.xylophone record @s[] ^-0.0 ^ ^ 0.900 0.89090 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.800 0.89090 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.500 0.89090 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.750 0.89090 0.000
+playsound block.note_block.bit record @s[] ^-0.5 ^ ^ 1.000 2.00000 0.000
+playsound block.note_block.bit record @s[] ^-0.5 ^ ^ 1.000 1.97703 0.000
+playsound block.note_block.bit_1 record @s[] ^0.5 ^ ^ 1.000 0.62996 0.000
+playsound block.note_block.bit record @s[] ^0.5 ^ ^ 1.000 1.94306 0.000
+playsound block.note_block.bit record @s[] ^0.5 ^ ^ 1.000 1.92075 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.5 ^ ^ 1.000 0.61203 0.000
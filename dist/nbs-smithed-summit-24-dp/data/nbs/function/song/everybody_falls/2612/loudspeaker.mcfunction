@@ -0,0 +1,11 @@
+playsound block.note_block.bell record @a[distance=..48.00] ^0.0 ^ ^ 1.322 0.89090 0.000
+playsound block.note_block.xylophone record @a[distance=..48.00] ^0.0 ^ ^ 1.982 0.89090 0.000
+playsound block.note_block.pling record @a[distance=..48.00] ^0.0 ^ ^ 2.022 0.89090 0.000
+playsound block.note_block.pling record @a[distance=..48.00] ^0.0 ^ ^ 1.264 0.89090 0.000
+playsound block.note_block.flute record @a[distance=..48.00] ^0.0 ^ ^ 1.774 0.89090 0.000
+playsound block.note_block.bit record @a[distance=..48.00] ^2.0 ^ ^ 2.338 2.00000 0.000
+playsound block.note_block.bit record @a[distance=..48.00] ^2.0 ^ ^ 2.341 1.97703 0.000
+playsound block.note_block.bit_1 record @a[distance=..48.00] ^-2.0 ^ ^ 2.284 0.62996 0.000
+playsound block.note_block.bit record @a[distance=..48.00] ^-2.0 ^ ^ 2.345 1.94306 0.000
+playsound block.note_block.bit record @a[distance=..48.00] ^-2.0 ^ ^ 2.347 1.92075 0.000
+playsound block.note_block.bit_1 record @a[distance=..48.00] ^2.0 ^ ^ 2.291 0.61203 0.000
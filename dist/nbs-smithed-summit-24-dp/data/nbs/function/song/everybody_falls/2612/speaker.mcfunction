@@ -0,0 +1,11 @@
+playsound block.note_block.bell record @a[distance=..6.16] ^0.0 ^ ^ 0.600 0.89090 0.000
+playsound block.note_block.xylophone record @a[distance=..6.16] ^0.0 ^ ^ 0.900 0.89090 0.000
+playsound block.note_block.pling record @a[distance=..9.48] ^0.0 ^ ^ 0.800 0.89090 0.000
+playsound block.note_block.pling record @a[distance=..9.48] ^0.0 ^ ^ 0.500 0.89090 0.000
+playsound block.note_block.flute record @a[distance=..6.99] ^0.0 ^ ^ 0.750 0.89090 0.000
+playsound block.note_block.bit record @a[distance=..6.75] ^1.0 ^ ^ 1.000 2.00000 0.000
+playsound block.note_block.bit record @a[distance=..6.77] ^1.0 ^ ^ 1.000 1.97703 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.42] ^-1.0 ^ ^ 1.000 0.62996 0.000
+playsound block.note_block.bit record @a[distance=..6.80] ^-1.0 ^ ^ 1.000 1.94306 0.000
+playsound block.note_block.bit record @a[distance=..6.83] ^-1.0 ^ ^ 1.000 1.92075 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.45] ^1.0 ^ ^ 1.000 0.61203 0.000
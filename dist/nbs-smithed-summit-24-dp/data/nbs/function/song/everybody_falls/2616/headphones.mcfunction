@@ -0,0 +1,14 @@
+playsound block.note_block.bass record @s[] ^-0.0 ^ ^ 0.680 0.79370 0.000
+playsound block.note_block.bass record @s[] ^-0.0 ^ ^ 0.600 0.79370 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.750 0.89090 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.500 0.59460 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.500 0.79370 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.500 0.94387 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.500 1.18921 0.000
+playsound block.note_block.bit record @s[] ^-0.5 ^ ^ 1.000 1.78180 0.000
+playsound block.note_block.bit record @s[] ^-0.5 ^ ^ 1.000 1.76133 0.000
+playsound block.note_block.bit_1 record @s[] ^0.5 ^ ^ 1.000 0.56123 0.000
+particle note ~ ~2.25 ~ 0 0 0 1 1
+playsound block.note_block.bit record @s[] ^0.5 ^ ^ 1.000 1.73107 0.000
+playsound block.note_block.bit record @s[] ^0.5 ^ ^ 1.000 1.71119 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.5 ^ ^ 1.000 0.54525 0.000
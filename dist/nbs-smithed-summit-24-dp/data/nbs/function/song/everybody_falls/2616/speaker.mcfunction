@@ -0,0 +1,18 @@
+playsound block.note_block.bass record @a[distance=..11.94] ^0.0 ^ ^ 0.680 0.79370 0.000
+playsound block.note_block.bass record @a[distance=..11.94] ^0.0 ^ ^ 0.600 0.79370 0.000
+playsound block.note_block.flute record @a[distance=..6.99] ^0.0 ^ ^ 0.750 0.89090 0.000
+playsound block.note_block.flute record @a[distance=..8.28] ^0.0 ^ ^ 0.500 0.59460 0.000
+playsound block.note_block.flute record @a[distance=..7.29] ^0.0 ^ ^ 0.500 0.79370 0.000
+playsound block.note_block.flute record @a[distance=..6.86] ^0.0 ^ ^ 0.500 0.94387 0.000
+playsound block.note_block.flute record @a[distance=..6.48] ^0.0 ^ ^ 0.500 1.18921 0.000
+playsound block.note_block.bit record @a[distance=..6.99] ^1.0 ^ ^ 1.000 1.78180 0.000
+playsound block.note_block.bit record @a[distance=..7.02] ^1.0 ^ ^ 1.000 1.76133 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.56] ^-1.0 ^ ^ 1.000 0.56123 0.000
+execute store result score #random nbs run random value 1..4
+execute if score #random nbs matches 1 if entity @a[distance=0..12] run function animated_java:music_speaker/animations/animation_speaker_beat_1/play
+execute if score #random nbs matches 2 if entity @a[distance=0..12] run function animated_java:music_speaker/animations/animation_speaker_beat_2/play
+execute if score #random nbs matches 3 if entity @a[distance=0..12] run function animated_java:music_speaker/animations/animation_speaker_beat_3/play
+execute if score #random nbs matches 4 if entity @a[distance=0..12] run function animated_java:music_speaker/animations/animation_speaker_beat_4/play
+playsound block.note_block.bit record @a[distance=..7.06] ^-1.0 ^ ^ 1.000 1.73107 0.000
+playsound block.note_block.bit record @a[distance=..7.09] ^-1.0 ^ ^ 1.000 1.71119 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.60] ^1.0 ^ ^ 1.000 0.54525 0.000
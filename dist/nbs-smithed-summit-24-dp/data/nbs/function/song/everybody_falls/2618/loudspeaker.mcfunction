@@ -0,0 +1,22 @@
+playsound block.note_block.bass record @a[distance=..48.00] ^0.0 ^ ^ 1.957 0.79370 0.000
+playsound block.note_block.bass record @a[distance=..48.00] ^0.0 ^ ^ 1.727 0.79370 0.000
+playsound block.note_block.bell record @a[distance=..48.00] ^0.0 ^ ^ 1.378 0.59460 0.000
+playsound block.note_block.xylophone record @a[distance=..48.00] ^0.0 ^ ^ 2.068 0.59460 0.000
+playsound block.note_block.pling record @a[distance=..48.00] ^0.0 ^ ^ 2.097 0.59460 0.000
+playsound block.note_block.pling record @a[distance=..48.00] ^0.0 ^ ^ 1.311 0.59460 0.000
+playsound block.note_block.flute record @a[distance=..48.00] ^0.0 ^ ^ 1.845 0.59460 0.000
+playsound block.note_block.flute record @a[distance=..48.00] ^0.0 ^ ^ 1.230 0.59460 0.000
+playsound block.note_block.flute record @a[distance=..48.00] ^0.0 ^ ^ 1.196 0.79370 0.000
+playsound block.note_block.flute record @a[distance=..48.00] ^0.0 ^ ^ 1.176 0.94387 0.000
+playsound block.note_block.flute record @a[distance=..48.00] ^0.0 ^ ^ 1.149 1.18921 0.000
+playsound block.note_block.basedrum_-1 record @a[distance=..48.00] ^0.0 ^ ^ 2.838 1.88775 0.000
+playsound block.note_block.basedrum record @a[distance=..48.00] ^0.0 ^ ^ 1.819 0.94387 0.000
+playsound fireworks_blast_far1 record @a[distance=..48.00] ^0.0 ^ ^ 1.654 0.66742 0.000
+playsound fireworks_blast_far1 record @a[distance=..48.00] ^0.0 ^ ^ 1.599 0.94387 0.000
+playsound block.note_block.snare record @a[distance=..48.00] ^0.0 ^ ^ 0.903 1.41421 0.000
+playsound block.note_block.bit record @a[distance=..48.00] ^2.0 ^ ^ 2.378 1.68179 0.000
+playsound block.note_block.bit record @a[distance=..48.00] ^2.0 ^ ^ 2.381 1.66248 0.000
+playsound block.note_block.bit_1 record @a[distance=..48.00] ^-2.0 ^ ^ 2.324 0.52973 0.000
+playsound block.note_block.bit record @a[distance=..48.00] ^-2.0 ^ ^ 2.385 1.63392 0.000
+playsound block.note_block.bit record @a[distance=..48.00] ^-2.0 ^ ^ 2.388 1.61515 0.000
+playsound block.note_block.bit_1 record @a[distance=..48.00] ^2.0 ^ ^ 2.331 0.51465 0.000
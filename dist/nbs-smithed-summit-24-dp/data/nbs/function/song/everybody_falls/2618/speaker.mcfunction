@@ -0,0 +1,22 @@
+playsound block.note_block.bass record @a[distance=..11.94] ^0.0 ^ ^ 0.680 0.79370 0.000
+playsound block.note_block.bass record @a[distance=..11.94] ^0.0 ^ ^ 0.600 0.79370 0.000
+playsound block.note_block.bell record @a[distance=..6.48] ^0.0 ^ ^ 0.600 0.59460 0.000
+playsound block.note_block.xylophone record @a[distance=..6.48] ^0.0 ^ ^ 0.900 0.59460 0.000
+playsound block.note_block.pling record @a[distance=..10.87] ^0.0 ^ ^ 0.800 0.59460 0.000
+playsound block.note_block.pling record @a[distance=..10.87] ^0.0 ^ ^ 0.500 0.59460 0.000
+playsound block.note_block.flute record @a[distance=..8.28] ^0.0 ^ ^ 0.750 0.59460 0.000
+playsound block.note_block.flute record @a[distance=..8.28] ^0.0 ^ ^ 0.500 0.59460 0.000
+playsound block.note_block.flute record @a[distance=..7.29] ^0.0 ^ ^ 0.500 0.79370 0.000
+playsound block.note_block.flute record @a[distance=..6.86] ^0.0 ^ ^ 0.500 0.94387 0.000
+playsound block.note_block.flute record @a[distance=..6.48] ^0.0 ^ ^ 0.500 1.18921 0.000
+playsound block.note_block.basedrum_-1 record @a[distance=..11.90] ^0.0 ^ ^ 1.000 1.88775 0.000
+playsound block.note_block.basedrum record @a[distance=..11.35] ^0.0 ^ ^ 0.680 0.94387 0.000
+playsound fireworks_blast_far1 record @a[distance=..7.85] ^0.0 ^ ^ 0.680 0.66742 0.000
+playsound fireworks_blast_far1 record @a[distance=..6.86] ^0.0 ^ ^ 0.680 0.94387 0.000
+playsound block.note_block.snare record @a[distance=..6.31] ^0.0 ^ ^ 0.400 1.41421 0.000
+playsound block.note_block.bit record @a[distance=..7.13] ^1.0 ^ ^ 1.000 1.68179 0.000
+playsound block.note_block.bit record @a[distance=..7.16] ^1.0 ^ ^ 1.000 1.66248 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.65] ^-1.0 ^ ^ 1.000 0.52973 0.000
+playsound block.note_block.bit record @a[distance=..7.21] ^-1.0 ^ ^ 1.000 1.63392 0.000
+playsound block.note_block.bit record @a[distance=..7.24] ^-1.0 ^ ^ 1.000 1.61515 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.70] ^1.0 ^ ^ 1.000 0.51465 0.000
@@ -0,0 +1,4 @@
+playsound block.note_block.bit_1 record @s[] ^1.0 ^ ^ 0.126 0.62996 0.000
+playsound block.note_block.bit_1 record @s[] ^0.95 ^ ^ 0.076 0.73841 0.000
+playsound block.note_block.bit_1 record @s[] ^0.95 ^ ^ 0.085 0.74915 0.000
+playsound block.note_block.bit_1 record @s[] ^1.0 ^ ^ 0.072 0.62093 0.000
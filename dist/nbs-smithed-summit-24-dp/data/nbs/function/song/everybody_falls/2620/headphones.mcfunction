@@ -0,0 +1,17 @@
+playsound block.note_block.bass record @s[] ^-0.0 ^ ^ 0.680 0.79370 0.000
+playsound block.note_block.bass record @s[] ^-0.0 ^ ^ 0.600 0.79370 0.000
+playsound block.note_block.bell record @s[] ^-0.0 ^ ^ 0.600 0.59460 0.000
+playsound block.note_block.xylophone record @s[] ^-0.0 ^ ^ 0.900 0.59460 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.800 0.59460 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.500 0.59460 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.750 0.59460 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.500 0.59460 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.500 0.79370 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.500 0.94387 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.500 1.18921 0.000
+playsound block.note_block.bit record @s[] ^-0.5 ^ ^ 1.000 1.58740 0.000
+playsound block.note_block.bit record @s[] ^-0.5 ^ ^ 1.000 1.56917 0.000
+playsound block.note_block.bit record @s[] ^0.5 ^ ^ 1.000 2.00000 0.000
+playsound block.note_block.bit record @s[] ^0.5 ^ ^ 1.000 1.54221 0.000
+playsound block.note_block.bit record @s[] ^0.5 ^ ^ 1.000 1.52450 0.000
+playsound block.note_block.bit record @s[] ^-0.5 ^ ^ 1.000 1.94306 0.000
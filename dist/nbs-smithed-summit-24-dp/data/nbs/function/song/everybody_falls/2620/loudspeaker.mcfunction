@@ -0,0 +1,17 @@
+playsound block.note_block.bass record @a[distance=..48.00] ^0.0 ^ ^ 1.957 0.79370 0.000
+playsound block.note_block.bass record @a[distance=..48.00] ^0.0 ^ ^ 1.727 0.79370 0.000
+playsound block.note_block.bell record @a[distance=..48.00] ^0.0 ^ ^ 1.378 0.59460 0.000
+playsound block.note_block.xylophone record @a[distance=..48.00] ^0.0 ^ ^ 2.068 0.59460 0.000
+playsound block.note_block.pling record @a[distance=..48.00] ^0.0 ^ ^ 2.097 0.59460 0.000
+playsound block.note_block.pling record @a[distance=..48.00] ^0.0 ^ ^ 1.311 0.59460 0.000
+playsound block.note_block.flute record @a[distance=..48.00] ^0.0 ^ ^ 1.845 0.59460 0.000
+playsound block.note_block.flute record @a[distance=..48.00] ^0.0 ^ ^ 1.230 0.59460 0.000
+playsound block.note_block.flute record @a[distance=..48.00] ^0.0 ^ ^ 1.196 0.79370 0.000
+playsound block.note_block.flute record @a[distance=..48.00] ^0.0 ^ ^ 1.176 0.94387 0.000
+playsound block.note_block.flute record @a[distance=..48.00] ^0.0 ^ ^ 1.149 1.18921 0.000
+playsound block.note_block.bit record @a[distance=..48.00] ^2.0 ^ ^ 2.392 1.58740 0.000
+playsound block.note_block.bit record @a[distance=..48.00] ^2.0 ^ ^ 2.395 1.56917 0.000
+playsound block.note_block.bit record @a[distance=..48.00] ^-2.0 ^ ^ 2.338 2.00000 0.000
+playsound block.note_block.bit record @a[distance=..48.00] ^-2.0 ^ ^ 2.399 1.54221 0.000
+playsound block.note_block.bit record @a[distance=..48.00] ^-2.0 ^ ^ 2.401 1.52450 0.000
+playsound block.note_block.bit record @a[distance=..48.00] ^2.0 ^ ^ 2.345 1.94306 0.000
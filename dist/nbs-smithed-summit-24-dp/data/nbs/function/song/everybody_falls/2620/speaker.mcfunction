@@ -0,0 +1,17 @@
+playsound block.note_block.bass record @a[distance=..11.94] ^0.0 ^ ^ 0.680 0.79370 0.000
+playsound block.note_block.bass record @a[distance=..11.94] ^0.0 ^ ^ 0.600 0.79370 0.000
+playsound block.note_block.bell record @a[distance=..6.48] ^0.0 ^ ^ 0.600 0.59460 0.000
+playsound block.note_block.xylophone record @a[distance=..6.48] ^0.0 ^ ^ 0.900 0.59460 0.000
+playsound block.note_block.pling record @a[distance=..10.87] ^0.0 ^ ^ 0.800 0.59460 0.000
+playsound block.note_block.pling record @a[distance=..10.87] ^0.0 ^ ^ 0.500 0.59460 0.000
+playsound block.note_block.flute record @a[distance=..8.28] ^0.0 ^ ^ 0.750 0.59460 0.000
+playsound block.note_block.flute record @a[distance=..8.28] ^0.0 ^ ^ 0.500 0.59460 0.000
+playsound block.note_block.flute record @a[distance=..7.29] ^0.0 ^ ^ 0.500 0.79370 0.000
+playsound block.note_block.flute record @a[distance=..6.86] ^0.0 ^ ^ 0.500 0.94387 0.000
+playsound block.note_block.flute record @a[distance=..6.48] ^0.0 ^ ^ 0.500 1.18921 0.000
+playsound block.note_block.bit record @a[distance=..7.29] ^1.0 ^ ^ 1.000 1.58740 0.000
+playsound block.note_block.bit record @a[distance=..7.32] ^1.0 ^ ^ 1.000 1.56917 0.000
+playsound block.note_block.bit record @a[distance=..6.75] ^-1.0 ^ ^ 1.000 2.00000 0.000
+playsound block.note_block.bit record @a[distance=..7.37] ^-1.0 ^ ^ 1.000 1.54221 0.000
+playsound block.note_block.bit record @a[distance=..7.41] ^-1.0 ^ ^ 1.000 1.52450 0.000
+playsound block.note_block.bit record @a[distance=..6.80] ^1.0 ^ ^ 1.000 1.94306 0.000
@@ -0,0 +1,18 @@
+playsound block.note_block.bass record @s[] ^-0.0 ^ ^ 0.680 0.79370 0.000
+playsound block.note_block.bass record @s[] ^-0.0 ^ ^ 0.600 0.79370 0.000
+playsound block.note_block.bell record @s[] ^-0.0 ^ ^ 0.600 0.59460 0.000
+playsound block.note_block.xylophone record @s[] ^-0.0 ^ ^ 0.900 0.59460 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.800 0.59460 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.500 0.59460 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.750 0.59460 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.500 0.59460 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.500 0.79370 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.500 0.94387 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.500 1.18921 0.000
+playsound block.note_block.bit record @s[] ^-0.5 ^ ^ 1.000 1.41421 0.000
+playsound block.note_block.bit record @s[] ^-0.5 ^ ^ 1.000 1.39797 0.000
+playsound block.note_block.bit record @s[] ^0.5 ^ ^ 1.000 1.78180 0.000
+particle note ~ ~2.25 ~ 0 0 0 1 1
+playsound block.note_block.bit record @s[] ^0.5 ^ ^ 1.000 1.37395 0.000
+playsound block.note_block.bit record @s[] ^0.5 ^ ^ 1.000 1.35817 0.000
+playsound block.note_block.bit record @s[] ^-0.5 ^ ^ 1.000 1.73107 0.000
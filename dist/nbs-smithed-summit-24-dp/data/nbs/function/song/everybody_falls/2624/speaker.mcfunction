@@ -0,0 +1,22 @@
+playsound block.note_block.bass record @a[distance=..11.94] ^0.0 ^ ^ 0.680 0.79370 0.000
+playsound block.note_block.bass record @a[distance=..11.94] ^0.0 ^ ^ 0.600 0.79370 0.000
+playsound block.note_block.bell record @a[distance=..6.48] ^0.0 ^ ^ 0.600 0.59460 0.000
+playsound block.note_block.xylophone record @a[distance=..6.48] ^0.0 ^ ^ 0.900 0.59460 0.000
+playsound block.note_block.pling record @a[distance=..10.87] ^0.0 ^ ^ 0.800 0.59460 0.000
+playsound block.note_block.pling record @a[distance=..10.87] ^0.0 ^ ^ 0.500 0.59460 0.000
+playsound block.note_block.flute record @a[distance=..8.28] ^0.0 ^ ^ 0.750 0.59460 0.000
+playsound block.note_block.flute record @a[distance=..8.28] ^0.0 ^ ^ 0.500 0.59460 0.000
+playsound block.note_block.flute record @a[distance=..7.29] ^0.0 ^ ^ 0.500 0.79370 0.000
+playsound block.note_block.flute record @a[distance=..6.86] ^0.0 ^ ^ 0.500 0.94387 0.000
+playsound block.note_block.flute record @a[distance=..6.48] ^0.0 ^ ^ 0.500 1.18921 0.000
+playsound block.note_block.bit record @a[distance=..7.65] ^1.0 ^ ^ 1.000 1.41421 0.000
+playsound block.note_block.bit record @a[distance=..7.68] ^1.0 ^ ^ 1.000 1.39797 0.000
+playsound block.note_block.bit record @a[distance=..6.99] ^-1.0 ^ ^ 1.000 1.78180 0.000
+execute store result score #random nbs run random value 1..4
+execute if score #random nbs matches 1 if entity @a[distance=0..12] run function animated_java:music_speaker/animations/animation_speaker_beat_1/play
+execute if score #random nbs matches 2 if entity @a[distance=0..12] run function animated_java:music_speaker/animations/animation_speaker_beat_2/play
+execute if score #random nbs matches 3 if entity @a[distance=0..12] run function animated_java:music_speaker/animations/animation_speaker_beat_3/play
+execute if score #random nbs matches 4 if entity @a[distance=0..12] run function animated_java:music_speaker/animations/animation_speaker_beat_4/play
+playsound block.note_block.bit record @a[distance=..7.74] ^-1.0 ^ ^ 1.000 1.37395 0.000
+playsound block.note_block.bit record @a[distance=..7.78] ^-1.0 ^ ^ 1.000 1.35817 0.000
+playsound block.note_block.bit record @a[distance=..7.06] ^1.0 ^ ^ 1.000 1.73107 0.000
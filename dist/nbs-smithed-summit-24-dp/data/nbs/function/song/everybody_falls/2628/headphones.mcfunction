@@ -0,0 +1,13 @@
+playsound block.note_block.bass record @s[] ^-0.0 ^ ^ 0.680 0.79370 0.000
+playsound block.note_block.bass record @s[] ^-0.0 ^ ^ 0.600 0.79370 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.750 0.59460 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.500 0.59460 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.500 0.79370 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.500 0.94387 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.500 1.18921 0.000
+playsound block.note_block.bit record @s[] ^-0.5 ^ ^ 1.000 1.25992 0.000
+playsound block.note_block.bit record @s[] ^-0.5 ^ ^ 1.000 1.24545 0.000
+playsound block.note_block.bit record @s[] ^0.5 ^ ^ 1.000 1.58740 0.000
+playsound block.note_block.bit record @s[] ^0.5 ^ ^ 1.000 1.22405 0.000
+playsound block.note_block.bit record @s[] ^0.5 ^ ^ 1.000 1.20999 0.000
+playsound block.note_block.bit record @s[] ^-0.5 ^ ^ 1.000 1.54221 0.000
@@ -0,0 +1,13 @@
+playsound block.note_block.bass record @a[distance=..11.94] ^0.0 ^ ^ 0.680 0.79370 0.000
+playsound block.note_block.bass record @a[distance=..11.94] ^0.0 ^ ^ 0.600 0.79370 0.000
+playsound block.note_block.flute record @a[distance=..8.28] ^0.0 ^ ^ 0.750 0.59460 0.000
+playsound block.note_block.flute record @a[distance=..8.28] ^0.0 ^ ^ 0.500 0.59460 0.000
+playsound block.note_block.flute record @a[distance=..7.29] ^0.0 ^ ^ 0.500 0.79370 0.000
+playsound block.note_block.flute record @a[distance=..6.86] ^0.0 ^ ^ 0.500 0.94387 0.000
+playsound block.note_block.flute record @a[distance=..6.48] ^0.0 ^ ^ 0.500 1.18921 0.000
+playsound block.note_block.bit record @a[distance=..8.06] ^1.0 ^ ^ 1.000 1.25992 0.000
+playsound block.note_block.bit record @a[distance=..8.10] ^1.0 ^ ^ 1.000 1.24545 0.000
+playsound block.note_block.bit record @a[distance=..7.29] ^-1.0 ^ ^ 1.000 1.58740 0.000
+playsound block.note_block.bit record @a[distance=..8.17] ^-1.0 ^ ^ 1.000 1.22405 0.000
+playsound block.note_block.bit record @a[distance=..8.22] ^-1.0 ^ ^ 1.000 1.20999 0.000
+playsound block.note_block.bit record @a[distance=..7.37] ^1.0 ^ ^ 1.000 1.54221 0.000
@@ -0,0 +1,19 @@
+playsound block.note_block.bass record @s[] ^-0.0 ^ ^ 0.680 0.79370 0.000
+playsound block.note_block.bass record @s[] ^-0.0 ^ ^ 0.600 0.79370 0.000
+playsound block.note_block.bell record @s[] ^-0.0 ^ ^ 0.600 0.59460 0.000
+playsound block.note_block.xylophone record @s[] ^-0.0 ^ ^ 0.900 0.59460 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.800 0.59460 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.500 0.59460 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.750 0.59460 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.500 0.59460 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.500 0.79370 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.500 0.94387 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.500 1.18921 0.000
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 0.400 1.18921 0.000
+playsound block.note_block.bit record @s[] ^-0.5 ^ ^ 1.000 1.12246 0.000
+playsound block.note_block.bit record @s[] ^-0.5 ^ ^ 1.000 1.10957 0.000
+playsound block.note_block.bit record @s[] ^0.5 ^ ^ 1.000 1.41421 0.000
+particle note ~ ~2.25 ~ 0 0 0 1 1
+playsound block.note_block.bit record @s[] ^0.5 ^ ^ 1.000 1.09051 0.000
+playsound block.note_block.bit record @s[] ^0.5 ^ ^ 1.000 1.07798 0.000
+playsound block.note_block.bit record @s[] ^-0.5 ^ ^ 1.000 1.37395 0.000
@@ -0,0 +1,26 @@
+playsound block.note_block.bass record @s[] ^-0.0 ^ ^ 0.750 1.05946 0.000
+playsound block.note_block.bass record @s[] ^-0.0 ^ ^ 1.000 1.05946 0.000
+playsound block.note_block.bell record @s[] ^-0.0 ^ ^ 0.600 0.59460 0.000
+playsound block.note_block.xylophone record @s[] ^-0.0 ^ ^ 0.900 0.59460 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.800 0.59460 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.500 0.59460 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.750 0.59460 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.700 0.70711 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.700 0.89090 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.700 1.05946 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.700 1.41421 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.500 0.52973 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.500 0.70711 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.500 0.89090 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.500 1.05946 0.000
+playsound block.note_block.basedrum_-1 record @s[] ^-0.0 ^ ^ 1.000 1.88775 0.000
+playsound block.note_block.basedrum record @s[] ^-0.0 ^ ^ 0.680 0.94387 0.000
+playsound fireworks_blast_far1 record @s[] ^-0.0 ^ ^ 0.680 0.66742 0.000
+playsound fireworks_blast_far1 record @s[] ^-0.0 ^ ^ 0.680 0.94387 0.000
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 0.400 2.00000 0.000
+playsound block.note_block.bit record @s[] ^-0.5 ^ ^ 0.930 1.05946 0.000
+playsound block.note_block.bit record @s[] ^-0.5 ^ ^ 0.930 1.04729 0.000
+playsound block.note_block.bit record @s[] ^0.5 ^ ^ 1.000 1.33484 0.000
+playsound block.note_block.bit record @s[] ^0.5 ^ ^ 0.870 1.02930 0.000
+playsound block.note_block.bit record @s[] ^0.5 ^ ^ 0.870 1.01748 0.000
+playsound block.note_block.bit record @s[] ^-0.5 ^ ^ 1.000 1.29684 0.000
@@ -0,0 +1,14 @@
+playsound block.note_block.bass record @a[distance=..48.00] ^0.0 ^ ^ 1.911 1.05946 0.000
+playsound block.note_block.bass record @a[distance=..48.00] ^0.0 ^ ^ 1.686 1.05946 0.000
+playsound block.note_block.flute record @a[distance=..48.00] ^0.0 ^ ^ 1.845 0.59460 0.000
+playsound block.note_block.flute record @a[distance=..48.00] ^0.0 ^ ^ 1.243 0.52973 0.000
+playsound block.note_block.flute record @a[distance=..48.00] ^0.0 ^ ^ 1.209 0.70711 0.000
+playsound block.note_block.flute record @a[distance=..48.00] ^0.0 ^ ^ 1.182 0.89090 0.000
+playsound block.note_block.flute record @a[distance=..48.00] ^0.0 ^ ^ 1.162 1.05946 0.000
+playsound block.note_block.snare record @a[distance=..48.00] ^0.0 ^ ^ 0.886 1.68179 0.000
+playsound block.note_block.bit record @a[distance=..48.00] ^2.0 ^ ^ 2.025 1.00000 0.000
+playsound block.note_block.bit record @a[distance=..48.00] ^2.0 ^ ^ 2.027 0.98851 0.000
+playsound block.note_block.bit record @a[distance=..48.00] ^-2.0 ^ ^ 2.446 1.25992 0.000
+playsound block.note_block.bit record @a[distance=..48.00] ^-2.0 ^ ^ 1.880 0.97153 0.000
+playsound block.note_block.bit record @a[distance=..48.00] ^-2.0 ^ ^ 1.882 0.96037 0.000
+playsound block.note_block.bit record @a[distance=..48.00] ^2.0 ^ ^ 2.453 1.22405 0.000
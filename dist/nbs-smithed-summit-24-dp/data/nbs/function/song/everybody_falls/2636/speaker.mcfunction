@@ -0,0 +1,14 @@
+playsound block.note_block.bass record @a[distance=..11.86] ^0.0 ^ ^ 0.680 1.05946 0.000
+playsound block.note_block.bass record @a[distance=..11.86] ^0.0 ^ ^ 0.600 1.05946 0.000
+playsound block.note_block.flute record @a[distance=..8.28] ^0.0 ^ ^ 0.750 0.59460 0.000
+playsound block.note_block.flute record @a[distance=..8.76] ^0.0 ^ ^ 0.500 0.52973 0.000
+playsound block.note_block.flute record @a[distance=..7.65] ^0.0 ^ ^ 0.500 0.70711 0.000
+playsound block.note_block.flute record @a[distance=..6.99] ^0.0 ^ ^ 0.500 0.89090 0.000
+playsound block.note_block.flute record @a[distance=..6.65] ^0.0 ^ ^ 0.500 1.05946 0.000
+playsound block.note_block.snare record @a[distance=..6.19] ^0.0 ^ ^ 0.400 1.68179 0.000
+playsound block.note_block.bit record @a[distance=..9.00] ^1.0 ^ ^ 0.810 1.00000 0.000
+playsound block.note_block.bit record @a[distance=..9.05] ^1.0 ^ ^ 0.810 0.98851 0.000
+playsound block.note_block.bit record @a[distance=..8.06] ^-1.0 ^ ^ 1.000 1.25992 0.000
+playsound block.note_block.bit record @a[distance=..9.12] ^-1.0 ^ ^ 0.750 0.97153 0.000
+playsound block.note_block.bit record @a[distance=..9.17] ^-1.0 ^ ^ 0.750 0.96037 0.000
+playsound block.note_block.bit record @a[distance=..8.17] ^1.0 ^ ^ 1.000 1.22405 0.000
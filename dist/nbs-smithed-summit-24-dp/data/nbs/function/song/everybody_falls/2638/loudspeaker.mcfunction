@@ -0,0 +1,19 @@
+playsound block.note_block.bass record @a[distance=..48.00] ^0.0 ^ ^ 1.911 1.05946 0.000
+playsound block.note_block.bass record @a[distance=..48.00] ^0.0 ^ ^ 1.686 1.05946 0.000
+playsound block.note_block.bell record @a[distance=..48.00] ^0.0 ^ ^ 1.354 0.70711 0.000
+playsound block.note_block.xylophone record @a[distance=..48.00] ^0.0 ^ ^ 2.031 0.70711 0.000
+playsound block.note_block.pling record @a[distance=..48.00] ^0.0 ^ ^ 2.065 0.70711 0.000
+playsound block.note_block.pling record @a[distance=..48.00] ^0.0 ^ ^ 1.291 0.70711 0.000
+playsound block.note_block.flute record @a[distance=..48.00] ^0.0 ^ ^ 1.814 0.70711 0.000
+playsound block.note_block.flute record @a[distance=..48.00] ^0.0 ^ ^ 1.243 0.52973 0.000
+playsound block.note_block.flute record @a[distance=..48.00] ^0.0 ^ ^ 1.209 0.70711 0.000
+playsound block.note_block.flute record @a[distance=..48.00] ^0.0 ^ ^ 1.182 0.89090 0.000
+playsound block.note_block.flute record @a[distance=..48.00] ^0.0 ^ ^ 1.162 1.05946 0.000
+playsound dig_gravel1 record @a[distance=..48.00] ^1.0 ^ ^ 1.561 1.58740 0.000
+playsound block.note_block.snare record @a[distance=..48.00] ^0.0 ^ ^ 0.903 1.41421 0.000
+playsound block.note_block.bit record @a[distance=..48.00] ^2.0 ^ ^ 1.709 0.94387 0.000
+playsound block.note_block.bit record @a[distance=..48.00] ^2.0 ^ ^ 1.711 0.93303 0.000
+playsound block.note_block.bit record @a[distance=..48.00] ^-2.0 ^ ^ 2.336 1.18921 0.000
+playsound block.note_block.bit record @a[distance=..48.00] ^-2.0 ^ ^ 1.563 0.91700 0.000
+playsound block.note_block.bit record @a[distance=..48.00] ^-2.0 ^ ^ 1.564 0.90647 0.000
+playsound block.note_block.bit record @a[distance=..48.00] ^2.0 ^ ^ 2.220 1.15535 0.000
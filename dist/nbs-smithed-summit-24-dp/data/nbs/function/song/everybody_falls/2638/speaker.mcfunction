@@ -0,0 +1,19 @@
+playsound block.note_block.bass record @a[distance=..11.86] ^0.0 ^ ^ 0.680 1.05946 0.000
+playsound block.note_block.bass record @a[distance=..11.86] ^0.0 ^ ^ 0.600 1.05946 0.000
+playsound block.note_block.bell record @a[distance=..6.31] ^0.0 ^ ^ 0.600 0.70711 0.000
+playsound block.note_block.xylophone record @a[distance=..6.31] ^0.0 ^ ^ 0.900 0.70711 0.000
+playsound block.note_block.pling record @a[distance=..10.35] ^0.0 ^ ^ 0.800 0.70711 0.000
+playsound block.note_block.pling record @a[distance=..10.35] ^0.0 ^ ^ 0.500 0.70711 0.000
+playsound block.note_block.flute record @a[distance=..7.65] ^0.0 ^ ^ 0.750 0.70711 0.000
+playsound block.note_block.flute record @a[distance=..8.76] ^0.0 ^ ^ 0.500 0.52973 0.000
+playsound block.note_block.flute record @a[distance=..7.65] ^0.0 ^ ^ 0.500 0.70711 0.000
+playsound block.note_block.flute record @a[distance=..6.99] ^0.0 ^ ^ 0.500 0.89090 0.000
+playsound block.note_block.flute record @a[distance=..6.65] ^0.0 ^ ^ 0.500 1.05946 0.000
+playsound dig_gravel1 record @a[distance=..6.23] ^0.0 ^ ^ 0.700 1.58740 0.000
+playsound block.note_block.snare record @a[distance=..6.31] ^0.0 ^ ^ 0.400 1.41421 0.000
+playsound block.note_block.bit record @a[distance=..9.24] ^1.0 ^ ^ 0.680 0.94387 0.000
+playsound block.note_block.bit record @a[distance=..9.29] ^1.0 ^ ^ 0.680 0.93303 0.000
+playsound block.note_block.bit record @a[distance=..8.28] ^-1.0 ^ ^ 0.950 1.18921 0.000
+playsound block.note_block.bit record @a[distance=..9.36] ^-1.0 ^ ^ 0.620 0.91700 0.000
+playsound block.note_block.bit record @a[distance=..9.41] ^-1.0 ^ ^ 0.620 0.90647 0.000
+playsound block.note_block.bit record @a[distance=..8.40] ^1.0 ^ ^ 0.900 1.15535 0.000
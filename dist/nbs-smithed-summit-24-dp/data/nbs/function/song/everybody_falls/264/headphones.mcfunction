@@ -0,0 +1,5 @@
+playsound block.note_block.bit_1 record @s[] ^0.9 ^ ^ 0.112 1.00000 0.000
+playsound block.note_block.bit_1 record @s[] ^0.95 ^ ^ 0.068 0.73841 0.000
+playsound block.note_block.bit_1 record @s[] ^0.85 ^ ^ 0.075 1.25992 0.000
+playsound block.note_block.bit_1 record @s[] ^0.9 ^ ^ 0.064 0.98566 0.000
+particle note ~ ~2.25 ~ 0 0 0 1 1
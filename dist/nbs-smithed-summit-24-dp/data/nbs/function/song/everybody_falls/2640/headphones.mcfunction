@@ -0,0 +1,19 @@
+playsound block.note_block.bass record @s[] ^-0.0 ^ ^ 0.680 1.05946 0.000
+playsound block.note_block.bass record @s[] ^-0.0 ^ ^ 0.600 1.05946 0.000
+playsound block.note_block.bell record @s[] ^-0.0 ^ ^ 0.600 0.70711 0.000
+playsound block.note_block.xylophone record @s[] ^-0.0 ^ ^ 0.900 0.70711 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.800 0.70711 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.500 0.70711 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.750 0.70711 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.500 0.52973 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.500 0.70711 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.500 0.89090 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.500 1.05946 0.000
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 0.400 1.18921 0.000
+playsound block.note_block.bit record @s[] ^-0.5 ^ ^ 0.560 0.89090 0.000
+playsound block.note_block.bit record @s[] ^-0.5 ^ ^ 0.560 0.88067 0.000
+playsound block.note_block.bit record @s[] ^0.5 ^ ^ 0.850 1.12246 0.000
+particle note ~ ~2.25 ~ 0 0 0 1 1
+playsound block.note_block.bit record @s[] ^0.5 ^ ^ 0.500 0.86554 0.000
+playsound block.note_block.bit record @s[] ^0.5 ^ ^ 0.500 0.85560 0.000
+playsound block.note_block.bit record @s[] ^-0.5 ^ ^ 0.800 1.09051 0.000
@@ -0,0 +1,21 @@
+playsound block.note_block.bass record @s[] ^-0.0 ^ ^ 0.680 1.05946 0.000
+playsound block.note_block.bass record @s[] ^-0.0 ^ ^ 0.600 1.05946 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.750 0.70711 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.500 0.52973 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.500 0.70711 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.500 0.89090 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.500 1.05946 0.000
+playsound block.note_block.basedrum_-1 record @s[] ^-0.0 ^ ^ 1.000 1.88775 0.000
+playsound block.note_block.basedrum record @s[] ^-0.0 ^ ^ 0.680 0.94387 0.000
+playsound fireworks_blast_far1 record @s[] ^-0.0 ^ ^ 0.680 0.66742 0.000
+playsound fireworks_blast_far1 record @s[] ^-0.0 ^ ^ 0.680 0.94387 0.000
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 0.800 0.50000 0.000
+playsound block.note_block.snare record @s[] ^-0.6 ^ ^ 0.800 1.00000 0.000
+playsound random_wood_click record @s[] ^0.6 ^ ^ 0.800 1.00000 0.000
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 0.400 2.00000 0.000
+playsound block.note_block.bit record @s[] ^-0.5 ^ ^ 0.430 0.84090 0.000
+playsound block.note_block.bit record @s[] ^-0.5 ^ ^ 0.430 0.83124 0.000
+playsound block.note_block.bit record @s[] ^0.5 ^ ^ 0.750 1.05946 0.000
+playsound block.note_block.bit record @s[] ^0.5 ^ ^ 0.370 0.81696 0.000
+playsound block.note_block.bit record @s[] ^0.5 ^ ^ 0.370 0.80757 0.000
+playsound block.note_block.bit record @s[] ^-0.5 ^ ^ 0.700 1.02930 0.000
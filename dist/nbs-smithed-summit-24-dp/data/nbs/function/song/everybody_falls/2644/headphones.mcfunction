@@ -0,0 +1,17 @@
+playsound block.note_block.bass record @s[] ^-0.0 ^ ^ 0.680 1.05946 0.000
+playsound block.note_block.bass record @s[] ^-0.0 ^ ^ 0.600 1.05946 0.000
+playsound block.note_block.bell record @s[] ^-0.0 ^ ^ 0.600 0.70711 0.000
+playsound block.note_block.xylophone record @s[] ^-0.0 ^ ^ 0.900 0.70711 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.800 0.70711 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.500 0.70711 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.750 0.70711 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.500 0.52973 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.500 0.70711 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.500 0.89090 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.500 1.05946 0.000
+playsound block.note_block.bit record @s[] ^-0.5 ^ ^ 0.310 0.79370 0.000
+playsound block.note_block.bit record @s[] ^-0.5 ^ ^ 0.310 0.78458 0.000
+playsound block.note_block.bit record @s[] ^0.5 ^ ^ 0.650 1.00000 0.000
+playsound block.note_block.bit record @s[] ^0.5 ^ ^ 0.250 0.77111 0.000
+playsound block.note_block.bit record @s[] ^0.5 ^ ^ 0.250 0.76225 0.000
+playsound block.note_block.bit record @s[] ^-0.5 ^ ^ 0.600 0.97153 0.000
@@ -0,0 +1,17 @@
+playsound block.note_block.bass record @a[distance=..11.86] ^0.0 ^ ^ 0.680 1.05946 0.000
+playsound block.note_block.bass record @a[distance=..11.86] ^0.0 ^ ^ 0.600 1.05946 0.000
+playsound block.note_block.bell record @a[distance=..6.31] ^0.0 ^ ^ 0.600 0.70711 0.000
+playsound block.note_block.xylophone record @a[distance=..6.31] ^0.0 ^ ^ 0.900 0.70711 0.000
+playsound block.note_block.pling record @a[distance=..10.35] ^0.0 ^ ^ 0.800 0.70711 0.000
+playsound block.note_block.pling record @a[distance=..10.35] ^0.0 ^ ^ 0.500 0.70711 0.000
+playsound block.note_block.flute record @a[distance=..7.65] ^0.0 ^ ^ 0.750 0.70711 0.000
+playsound block.note_block.flute record @a[distance=..8.76] ^0.0 ^ ^ 0.500 0.52973 0.000
+playsound block.note_block.flute record @a[distance=..7.65] ^0.0 ^ ^ 0.500 0.70711 0.000
+playsound block.note_block.flute record @a[distance=..6.99] ^0.0 ^ ^ 0.500 0.89090 0.000
+playsound block.note_block.flute record @a[distance=..6.65] ^0.0 ^ ^ 0.500 1.05946 0.000
+playsound block.note_block.bit record @a[distance=..9.94] ^1.0 ^ ^ 0.310 0.79370 0.000
+playsound block.note_block.bit record @a[distance=..9.98] ^1.0 ^ ^ 0.310 0.78458 0.000
+playsound block.note_block.bit record @a[distance=..9.00] ^-1.0 ^ ^ 0.650 1.00000 0.000
+playsound block.note_block.bit record @a[distance=..10.05] ^-1.0 ^ ^ 0.250 0.77111 0.000
+playsound block.note_block.bit record @a[distance=..10.09] ^-1.0 ^ ^ 0.250 0.76225 0.000
+playsound block.note_block.bit record @a[distance=..9.12] ^1.0 ^ ^ 0.600 0.97153 0.000
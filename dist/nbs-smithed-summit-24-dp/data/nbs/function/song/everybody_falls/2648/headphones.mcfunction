@@ -0,0 +1,14 @@
+playsound block.note_block.bass record @s[] ^-0.0 ^ ^ 0.680 1.05946 0.000
+playsound block.note_block.bass record @s[] ^-0.0 ^ ^ 0.600 1.05946 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.750 0.70711 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.500 0.52973 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.500 0.70711 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.500 0.89090 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.500 1.05946 0.000
+playsound block.note_block.bit record @s[] ^-0.5 ^ ^ 0.060 0.70711 0.000
+playsound block.note_block.bit record @s[] ^-0.5 ^ ^ 0.060 0.69898 0.000
+playsound block.note_block.bit record @s[] ^0.5 ^ ^ 0.450 0.89090 0.000
+particle note ~ ~2.25 ~ 0 0 0 1 1
+playsound block.note_block.bit record @s[] ^0.5 ^ ^ 0.000 0.68698 0.000
+playsound block.note_block.bit record @s[] ^0.5 ^ ^ 0.000 0.67909 0.000
+playsound block.note_block.bit record @s[] ^-0.5 ^ ^ 0.400 0.86554 0.000
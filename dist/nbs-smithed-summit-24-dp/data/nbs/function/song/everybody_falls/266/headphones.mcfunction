@@ -0,0 +1,4 @@
+playsound block.note_block.bit_1 record @s[] ^0.8 ^ ^ 0.098 1.49831 0.000
+playsound block.note_block.bit_1 record @s[] ^0.85 ^ ^ 0.060 1.24186 0.000
+playsound block.note_block.bit_1 record @s[] ^0.75 ^ ^ 0.065 2.00000 0.000
+playsound block.note_block.bit_1 record @s[] ^0.8 ^ ^ 0.056 1.47683 0.000
@@ -0,0 +1 @@
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.750 0.94387 0.000
@@ -0,0 +1,7 @@
+playsound block.note_block.bell record @s[] ^-0.0 ^ ^ 0.600 0.89090 0.000
+playsound block.note_block.xylophone record @s[] ^-0.0 ^ ^ 0.900 0.89090 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.800 0.89090 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.500 0.89090 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.750 0.89090 0.000
+playsound dig_gravel1 record @s[] ^-0.25 ^ ^ 0.700 1.58740 0.000
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 0.400 1.41421 0.000
@@ -0,0 +1,13 @@
+playsound block.note_block.bass record @a[distance=..11.98] ^0.0 ^ ^ 0.680 0.52973 0.000
+playsound block.note_block.bass record @a[distance=..11.98] ^0.0 ^ ^ 0.600 0.52973 0.000
+playsound block.note_block.bell record @a[distance=..6.05] ^0.0 ^ ^ 0.600 1.41421 0.000
+playsound block.note_block.xylophone record @a[distance=..6.05] ^0.0 ^ ^ 0.900 1.41421 0.000
+playsound block.note_block.pling record @a[distance=..7.65] ^0.0 ^ ^ 0.800 1.41421 0.000
+playsound block.note_block.pling record @a[distance=..7.65] ^0.0 ^ ^ 0.500 1.41421 0.000
+playsound block.note_block.flute record @a[distance=..6.31] ^0.0 ^ ^ 0.750 1.41421 0.000
+playsound block.note_block.flute record @a[distance=..8.28] ^0.0 ^ ^ 0.500 0.59460 0.000
+playsound block.note_block.flute record @a[distance=..7.29] ^0.0 ^ ^ 0.500 0.79370 0.000
+playsound block.note_block.flute record @a[distance=..6.86] ^0.0 ^ ^ 0.500 0.94387 0.000
+playsound block.note_block.flute record @a[distance=..6.48] ^0.0 ^ ^ 0.500 1.18921 0.000
+playsound dig_gravel1 record @a[distance=..6.23] ^0.0 ^ ^ 0.700 1.58740 0.000
+playsound block.note_block.snare record @a[distance=..6.19] ^0.0 ^ ^ 0.400 1.68179 0.000
@@ -0,0 +1,8 @@
+playsound block.note_block.bass record @s[] ^-0.0 ^ ^ 0.680 0.52973 0.000
+playsound block.note_block.bass record @s[] ^-0.0 ^ ^ 0.600 0.52973 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.750 1.41421 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.500 0.59460 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.500 0.79370 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.500 0.94387 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.500 1.18921 0.000
+particle note ~ ~2.25 ~ 0 0 0 1 1
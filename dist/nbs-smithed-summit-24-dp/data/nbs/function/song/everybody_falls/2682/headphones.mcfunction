@@ -0,0 +1,14 @@
+playsound block.note_block.bass record @s[] ^-0.0 ^ ^ 0.680 0.52973 0.000
+playsound block.note_block.bass record @s[] ^-0.0 ^ ^ 0.600 0.52973 0.000
+playsound block.note_block.bell record @s[] ^-0.0 ^ ^ 0.600 1.18921 0.000
+playsound block.note_block.xylophone record @s[] ^-0.0 ^ ^ 0.900 1.18921 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.800 1.18921 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.500 1.18921 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.750 1.18921 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.500 0.59460 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.500 0.79370 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.500 0.94387 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.500 1.18921 0.000
+playsound block.note_block.basedrum_-1 record @s[] ^-0.0 ^ ^ 1.000 1.88775 0.000
+playsound block.note_block.basedrum record @s[] ^-0.0 ^ ^ 0.680 0.94387 0.000
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 0.400 1.41421 0.000
@@ -0,0 +1,11 @@
+playsound block.note_block.bass record @a[distance=..11.97] ^0.0 ^ ^ 0.680 0.59460 0.000
+playsound block.note_block.bass record @a[distance=..11.97] ^0.0 ^ ^ 0.600 0.59460 0.000
+playsound block.note_block.bell record @a[distance=..6.10] ^0.0 ^ ^ 0.600 1.05946 0.000
+playsound block.note_block.xylophone record @a[distance=..6.10] ^0.0 ^ ^ 0.900 1.05946 0.000
+playsound block.note_block.pling record @a[distance=..8.76] ^0.0 ^ ^ 0.800 1.05946 0.000
+playsound block.note_block.pling record @a[distance=..8.76] ^0.0 ^ ^ 0.500 1.05946 0.000
+playsound block.note_block.flute record @a[distance=..6.65] ^0.0 ^ ^ 0.750 1.05946 0.000
+playsound block.note_block.flute record @a[distance=..8.76] ^0.0 ^ ^ 0.500 0.52973 0.000
+playsound block.note_block.flute record @a[distance=..7.65] ^0.0 ^ ^ 0.500 0.70711 0.000
+playsound block.note_block.flute record @a[distance=..6.99] ^0.0 ^ ^ 0.500 0.89090 0.000
+playsound block.note_block.flute record @a[distance=..6.65] ^0.0 ^ ^ 0.500 1.05946 0.000
@@ -0,0 +1,9 @@
+playsound fireworks_blast_far1 record @s[] ^-0.0 ^ ^ 1.000 0.84090 0.000
+playsound fireworks_blast_far1 record @s[] ^-0.0 ^ ^ 1.000 1.18921 0.000
+playsound fireworks_blast_far1 record @s[] ^-0.0 ^ ^ 1.000 0.94387 0.000
+playsound fireworks_blast_far1 record @s[] ^-0.25 ^ ^ 0.700 0.66742 0.000
+playsound block.note_block.bit_1 record @s[] ^0.5 ^ ^ 0.056 0.62996 0.000
+playsound block.note_block.bit_1 record @s[] ^0.55 ^ ^ 0.036 0.73841 0.000
+playsound block.note_block.bit_1 record @s[] ^0.45 ^ ^ 0.035 0.74915 0.000
+playsound block.note_block.bit_1 record @s[] ^0.5 ^ ^ 0.032 0.62093 0.000
+particle note ~ ~2.25 ~ 0 0 0 1 1
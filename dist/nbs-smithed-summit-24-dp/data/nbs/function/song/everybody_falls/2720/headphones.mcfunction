@@ -0,0 +1,12 @@
+playsound block.note_block.bass record @s[] ^-0.0 ^ ^ 0.750 0.62996 0.000
+playsound block.note_block.bass record @s[] ^-0.0 ^ ^ 1.000 0.62996 0.000
+playsound block.note_block.bell record @s[] ^-0.0 ^ ^ 0.600 1.18921 0.000
+playsound block.note_block.xylophone record @s[] ^-0.0 ^ ^ 0.900 1.18921 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.800 1.18921 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.500 1.18921 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.750 1.18921 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.700 0.79370 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.700 0.94387 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.700 1.25992 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.700 1.58740 0.000
+particle note ~ ~2.25 ~ 0 0 0 1 1
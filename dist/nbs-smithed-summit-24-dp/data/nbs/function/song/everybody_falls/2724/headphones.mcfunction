@@ -0,0 +1 @@
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.750 1.18921 0.000
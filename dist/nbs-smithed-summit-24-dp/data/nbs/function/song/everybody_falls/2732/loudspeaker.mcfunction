@@ -0,0 +1,4 @@
+playsound block.note_block.flute record @a[distance=..48.00] ^0.0 ^ ^ 1.723 1.18921 0.000
+playsound block.note_block.pling_1 record @a[distance=..48.00] ^0.0 ^ ^ 1.561 0.79370 0.000
+playsound block.note_block.pling_1 record @a[distance=..48.00] ^0.0 ^ ^ 1.561 0.79370 0.000
+playsound block.note_block.snare record @a[distance=..48.00] ^0.0 ^ ^ 0.886 1.68179 0.000
@@ -0,0 +1,4 @@
+playsound block.note_block.flute record @a[distance=..6.48] ^0.0 ^ ^ 0.750 1.18921 0.000
+playsound block.note_block.pling_1 record @a[distance=..6.23] ^0.0 ^ ^ 0.700 0.79370 0.000
+playsound block.note_block.pling_1 record @a[distance=..6.23] ^0.0 ^ ^ 0.700 0.79370 0.000
+playsound block.note_block.snare record @a[distance=..6.19] ^0.0 ^ ^ 0.400 1.68179 0.000
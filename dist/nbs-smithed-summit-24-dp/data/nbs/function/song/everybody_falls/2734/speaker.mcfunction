@@ -0,0 +1,7 @@
+playsound block.note_block.bell record @a[distance=..6.10] ^0.0 ^ ^ 0.600 1.05946 0.000
+playsound block.note_block.xylophone record @a[distance=..6.10] ^0.0 ^ ^ 0.900 1.05946 0.000
+playsound block.note_block.pling record @a[distance=..8.76] ^0.0 ^ ^ 0.800 1.05946 0.000
+playsound block.note_block.pling record @a[distance=..8.76] ^0.0 ^ ^ 0.500 1.05946 0.000
+playsound block.note_block.flute record @a[distance=..6.65] ^0.0 ^ ^ 0.750 1.05946 0.000
+playsound dig_gravel1 record @a[distance=..6.23] ^0.0 ^ ^ 0.700 1.58740 0.000
+playsound block.note_block.snare record @a[distance=..6.31] ^0.0 ^ ^ 0.400 1.41421 0.000
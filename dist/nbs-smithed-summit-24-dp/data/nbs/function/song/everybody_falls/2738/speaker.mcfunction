@@ -0,0 +1,17 @@
+playsound block.note_block.bass record @a[distance=..11.94] ^0.0 ^ ^ 0.750 0.79370 0.000
+playsound block.note_block.bass record @a[distance=..11.94] ^0.0 ^ ^ 1.000 0.79370 0.000
+playsound block.note_block.flute record @a[distance=..6.65] ^0.0 ^ ^ 0.750 1.05946 0.000
+playsound block.note_block.pling record @a[distance=..6.86] ^0.0 ^ ^ 0.700 1.88775 0.000
+playsound block.note_block.pling_1 record @a[distance=..6.48] ^0.0 ^ ^ 0.700 0.59460 0.000
+playsound block.note_block.pling_1 record @a[distance=..6.23] ^0.0 ^ ^ 0.700 0.79370 0.000
+playsound block.note_block.pling_1 record @a[distance=..6.14] ^0.0 ^ ^ 0.700 0.94387 0.000
+playsound block.note_block.flute record @a[distance=..7.29] ^0.0 ^ ^ 0.500 0.79370 0.000
+playsound block.note_block.flute record @a[distance=..6.86] ^0.0 ^ ^ 0.500 0.94387 0.000
+playsound block.note_block.flute record @a[distance=..6.48] ^0.0 ^ ^ 0.500 1.18921 0.000
+playsound block.note_block.flute record @a[distance=..6.23] ^0.0 ^ ^ 0.500 1.58740 0.000
+playsound block.note_block.basedrum_-1 record @a[distance=..11.90] ^0.0 ^ ^ 1.000 1.88775 0.000
+playsound block.note_block.basedrum record @a[distance=..11.35] ^0.0 ^ ^ 0.680 0.94387 0.000
+playsound block.note_block.snare record @a[distance=..9.00] ^0.0 ^ ^ 0.800 0.50000 0.000
+playsound block.note_block.snare record @a[distance=..6.75] ^1.0 ^ ^ 0.800 1.00000 0.000
+playsound random_wood_click record @a[distance=..6.75] ^-2.0 ^ ^ 0.800 1.00000 0.000
+playsound block.note_block.snare record @a[distance=..6.12] ^0.0 ^ ^ 0.400 2.00000 0.000
@@ -0,0 +1,12 @@
+playsound block.note_block.bass record @s[] ^-0.0 ^ ^ 0.680 0.79370 0.000
+playsound block.note_block.bass record @s[] ^-0.0 ^ ^ 0.600 0.79370 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.750 1.05946 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.420 1.88775 0.000
+playsound block.note_block.pling_1 record @s[] ^-0.0 ^ ^ 0.420 0.59460 0.000
+playsound block.note_block.pling_1 record @s[] ^-0.0 ^ ^ 0.420 0.79370 0.000
+playsound block.note_block.pling_1 record @s[] ^-0.0 ^ ^ 0.420 0.94387 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.500 0.79370 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.500 0.94387 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.500 1.18921 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.500 1.58740 0.000
+particle note ~ ~2.25 ~ 0 0 0 1 1
@@ -0,0 +1,18 @@
+playsound block.note_block.bass record @a[distance=..11.94] ^0.0 ^ ^ 0.680 0.79370 0.000
+playsound block.note_block.bass record @a[distance=..11.94] ^0.0 ^ ^ 0.600 0.79370 0.000
+playsound block.note_block.bell record @a[distance=..6.31] ^0.0 ^ ^ 0.600 0.70711 0.000
+playsound block.note_block.xylophone record @a[distance=..6.31] ^0.0 ^ ^ 0.900 0.70711 0.000
+playsound block.note_block.pling record @a[distance=..10.35] ^0.0 ^ ^ 0.800 0.70711 0.000
+playsound block.note_block.pling record @a[distance=..10.35] ^0.0 ^ ^ 0.500 0.70711 0.000
+playsound block.note_block.flute record @a[distance=..7.65] ^0.0 ^ ^ 0.750 0.70711 0.000
+playsound block.note_block.pling record @a[distance=..6.86] ^0.0 ^ ^ 0.420 1.88775 0.000
+playsound block.note_block.pling_1 record @a[distance=..6.48] ^0.0 ^ ^ 0.420 0.59460 0.000
+playsound block.note_block.pling_1 record @a[distance=..6.23] ^0.0 ^ ^ 0.420 0.79370 0.000
+playsound block.note_block.pling_1 record @a[distance=..6.14] ^0.0 ^ ^ 0.420 0.94387 0.000
+playsound block.note_block.flute record @a[distance=..7.29] ^0.0 ^ ^ 0.500 0.79370 0.000
+playsound block.note_block.flute record @a[distance=..6.86] ^0.0 ^ ^ 0.500 0.94387 0.000
+playsound block.note_block.flute record @a[distance=..6.48] ^0.0 ^ ^ 0.500 1.18921 0.000
+playsound block.note_block.flute record @a[distance=..6.23] ^0.0 ^ ^ 0.500 1.58740 0.000
+playsound block.note_block.basedrum_-1 record @a[distance=..11.90] ^0.0 ^ ^ 1.000 1.88775 0.000
+playsound block.note_block.basedrum record @a[distance=..11.35] ^0.0 ^ ^ 0.680 0.94387 0.000
+playsound block.note_block.snare record @a[distance=..6.31] ^0.0 ^ ^ 0.400 1.41421 0.000
@@ -0,0 +1,7 @@
+playsound block.note_block.pling record @a[distance=..11.01] ^0.0 ^ ^ 0.750 0.56123 0.000
+playsound block.note_block.pling record @a[distance=..10.71] ^0.0 ^ ^ 0.750 0.62996 0.000
+playsound block.note_block.pling record @a[distance=..10.15] ^0.0 ^ ^ 1.000 0.74915 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.04] ^-1.0 ^ ^ 0.028 1.49831 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.07] ^-1.0 ^ ^ 0.020 1.24186 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.02] ^-1.0 ^ ^ 0.015 2.00000 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.04] ^-1.0 ^ ^ 0.016 1.47683 0.000
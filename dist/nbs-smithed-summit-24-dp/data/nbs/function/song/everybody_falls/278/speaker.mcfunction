@@ -0,0 +1,7 @@
+playsound block.note_block.pling record @a[distance=..9.72] ^0.0 ^ ^ 0.750 0.84090 0.000
+playsound block.note_block.pling record @a[distance=..9.24] ^0.0 ^ ^ 0.750 0.94387 0.000
+playsound block.note_block.pling record @a[distance=..8.52] ^0.0 ^ ^ 1.000 1.12246 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.04] ^-1.0 ^ ^ 0.014 1.49831 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.02] ^-1.0 ^ ^ 0.012 1.97133 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.06] ^-1.0 ^ ^ 0.005 1.25992 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.04] ^-1.0 ^ ^ 0.008 1.47683 0.000
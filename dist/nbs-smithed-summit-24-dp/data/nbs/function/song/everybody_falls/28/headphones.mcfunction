@@ -0,0 +1,7 @@
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.120 0.50000 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.180 0.62996 0.000
+playsound block.note_block.chime_1 record @s[] ^-0.0 ^ ^ 0.106 0.66742 0.000
+playsound block.note_block.chime_1 record @s[] ^-0.0 ^ ^ 0.023 0.59460 0.000
+playsound block.note_block.chime_1 record @s[] ^-0.0 ^ ^ 0.338 0.62996 0.000
+playsound block.note_block.chime_1 record @s[] ^-0.0 ^ ^ 0.070 0.56123 0.000
+playsound block.note_block.chime record @s[] ^-0.0 ^ ^ 0.070 1.58740 0.000
@@ -0,0 +1,8 @@
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.750 1.25992 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.750 1.49831 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 1.000 1.68179 0.000
+playsound block.note_block.bit_1 record @s[] ^0.1 ^ ^ 0.000 1.00000 0.000
+playsound block.note_block.bit_1 record @s[] ^0.15 ^ ^ 0.004 1.24186 0.000
+playsound block.note_block.bit_1 record @s[] ^0.05 ^ ^ 0.000 0.74915 0.000
+playsound block.note_block.bit_1 record @s[] ^0.1 ^ ^ 0.000 0.98566 0.000
+particle note ~ ~2.25 ~ 0 0 0 1 1
@@ -0,0 +1,17 @@
+playsound block.note_block.bass_-1 record @s[] ^-0.0 ^ ^ 0.680 1.78180 0.000
+playsound block.note_block.bass_-1 record @s[] ^-0.0 ^ ^ 0.600 1.78180 0.000
+playsound block.note_block.bell record @s[] ^-0.0 ^ ^ 0.600 1.41421 0.000
+playsound block.note_block.xylophone record @s[] ^-0.0 ^ ^ 0.900 1.41421 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.800 1.41421 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.500 1.41421 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.750 1.41421 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.420 1.58740 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.420 1.78180 0.000
+playsound block.note_block.pling_1 record @s[] ^-0.0 ^ ^ 0.420 0.52973 0.000
+playsound block.note_block.pling_1 record @s[] ^-0.0 ^ ^ 0.420 0.79370 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.500 0.52973 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.500 0.70711 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.500 0.89090 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.500 1.05946 0.000
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 0.400 1.18921 0.000
+particle note ~ ~2.25 ~ 0 0 0 1 1
@@ -0,0 +1,21 @@
+playsound block.note_block.bass_-1 record @a[distance=..11.99] ^0.0 ^ ^ 0.680 1.78180 0.000
+playsound block.note_block.bass_-1 record @a[distance=..11.99] ^0.0 ^ ^ 0.600 1.78180 0.000
+playsound block.note_block.bell record @a[distance=..6.05] ^0.0 ^ ^ 0.600 1.41421 0.000
+playsound block.note_block.xylophone record @a[distance=..6.05] ^0.0 ^ ^ 0.900 1.41421 0.000
+playsound block.note_block.pling record @a[distance=..7.65] ^0.0 ^ ^ 0.800 1.41421 0.000
+playsound block.note_block.pling record @a[distance=..7.65] ^0.0 ^ ^ 0.500 1.41421 0.000
+playsound block.note_block.flute record @a[distance=..6.31] ^0.0 ^ ^ 0.750 1.41421 0.000
+playsound block.note_block.pling record @a[distance=..7.29] ^0.0 ^ ^ 0.420 1.58740 0.000
+playsound block.note_block.pling record @a[distance=..6.99] ^0.0 ^ ^ 0.420 1.78180 0.000
+playsound block.note_block.pling_1 record @a[distance=..6.65] ^0.0 ^ ^ 0.420 0.52973 0.000
+playsound block.note_block.pling_1 record @a[distance=..6.23] ^0.0 ^ ^ 0.420 0.79370 0.000
+playsound block.note_block.flute record @a[distance=..8.76] ^0.0 ^ ^ 0.500 0.52973 0.000
+playsound block.note_block.flute record @a[distance=..7.65] ^0.0 ^ ^ 0.500 0.70711 0.000
+playsound block.note_block.flute record @a[distance=..6.99] ^0.0 ^ ^ 0.500 0.89090 0.000
+playsound block.note_block.flute record @a[distance=..6.65] ^0.0 ^ ^ 0.500 1.05946 0.000
+playsound block.note_block.snare record @a[distance=..6.48] ^0.0 ^ ^ 0.400 1.18921 0.000
+execute store result score #random nbs run random value 1..4
+execute if score #random nbs matches 1 if entity @a[distance=0..12] run function animated_java:music_speaker/animations/animation_speaker_beat_1/play
+execute if score #random nbs matches 2 if entity @a[distance=0..12] run function animated_java:music_speaker/animations/animation_speaker_beat_2/play
+execute if score #random nbs matches 3 if entity @a[distance=0..12] run function animated_java:music_speaker/animations/animation_speaker_beat_3/play
+execute if score #random nbs matches 4 if entity @a[distance=0..12] run function animated_java:music_speaker/animations/animation_speaker_beat_4/play
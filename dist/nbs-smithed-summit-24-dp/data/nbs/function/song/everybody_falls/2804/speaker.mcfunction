@@ -0,0 +1,9 @@
+playsound block.note_block.bell record @a[distance=..6.05] ^0.0 ^ ^ 0.600 1.41421 0.000
+playsound block.note_block.xylophone record @a[distance=..6.05] ^0.0 ^ ^ 0.900 1.41421 0.000
+playsound block.note_block.pling record @a[distance=..7.65] ^0.0 ^ ^ 0.800 1.41421 0.000
+playsound block.note_block.pling record @a[distance=..7.65] ^0.0 ^ ^ 0.500 1.41421 0.000
+playsound block.note_block.flute record @a[distance=..6.31] ^0.0 ^ ^ 0.750 1.41421 0.000
+playsound block.note_block.flute record @a[distance=..8.76] ^0.0 ^ ^ 0.500 0.52973 0.000
+playsound block.note_block.flute record @a[distance=..7.65] ^0.0 ^ ^ 0.500 0.70711 0.000
+playsound block.note_block.flute record @a[distance=..6.99] ^0.0 ^ ^ 0.500 0.89090 0.000
+playsound block.note_block.flute record @a[distance=..6.65] ^0.0 ^ ^ 0.500 1.05946 0.000
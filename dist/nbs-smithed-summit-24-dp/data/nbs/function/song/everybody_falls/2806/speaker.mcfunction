@@ -0,0 +1,17 @@
+playsound block.note_block.bass_-1 record @a[distance=..11.99] ^0.0 ^ ^ 0.750 1.88775 0.000
+playsound block.note_block.bass_-1 record @a[distance=..11.99] ^0.0 ^ ^ 1.000 1.88775 0.000
+playsound block.note_block.bell record @a[distance=..6.05] ^0.0 ^ ^ 0.600 1.41421 0.000
+playsound block.note_block.xylophone record @a[distance=..6.05] ^0.0 ^ ^ 0.900 1.41421 0.000
+playsound block.note_block.pling record @a[distance=..7.65] ^0.0 ^ ^ 0.800 1.41421 0.000
+playsound block.note_block.pling record @a[distance=..7.65] ^0.0 ^ ^ 0.500 1.41421 0.000
+playsound block.note_block.flute record @a[distance=..6.31] ^0.0 ^ ^ 0.750 1.41421 0.000
+playsound block.note_block.pling record @a[distance=..7.65] ^0.0 ^ ^ 0.700 1.41421 0.000
+playsound block.note_block.pling record @a[distance=..7.13] ^0.0 ^ ^ 0.700 1.68179 0.000
+playsound block.note_block.pling_1 record @a[distance=..6.56] ^0.0 ^ ^ 0.700 0.56123 0.000
+playsound block.note_block.pling_1 record @a[distance=..6.31] ^0.0 ^ ^ 0.700 0.70711 0.000
+playsound block.note_block.flute record @a[distance=..8.52] ^0.0 ^ ^ 0.500 0.56123 0.000
+playsound block.note_block.flute record @a[distance=..7.46] ^0.0 ^ ^ 0.500 0.74915 0.000
+playsound block.note_block.flute record @a[distance=..6.86] ^0.0 ^ ^ 0.500 0.94387 0.000
+playsound block.note_block.flute record @a[distance=..6.56] ^0.0 ^ ^ 0.500 1.12246 0.000
+playsound dig_gravel1 record @a[distance=..6.23] ^0.0 ^ ^ 0.700 1.58740 0.000
+playsound block.note_block.snare record @a[distance=..6.19] ^0.0 ^ ^ 0.400 1.68179 0.000
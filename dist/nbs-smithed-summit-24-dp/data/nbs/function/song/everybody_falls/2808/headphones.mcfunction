@@ -0,0 +1,12 @@
+playsound block.note_block.bass_-1 record @s[] ^-0.0 ^ ^ 0.680 1.88775 0.000
+playsound block.note_block.bass_-1 record @s[] ^-0.0 ^ ^ 0.600 1.88775 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.750 1.41421 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.420 1.41421 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.420 1.68179 0.000
+playsound block.note_block.pling_1 record @s[] ^-0.0 ^ ^ 0.420 0.56123 0.000
+playsound block.note_block.pling_1 record @s[] ^-0.0 ^ ^ 0.420 0.70711 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.500 0.56123 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.500 0.74915 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.500 0.94387 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.500 1.12246 0.000
+particle note ~ ~2.25 ~ 0 0 0 1 1
@@ -0,0 +1,16 @@
+playsound block.note_block.bass_-1 record @a[distance=..11.99] ^0.0 ^ ^ 0.680 1.88775 0.000
+playsound block.note_block.bass_-1 record @a[distance=..11.99] ^0.0 ^ ^ 0.600 1.88775 0.000
+playsound block.note_block.flute record @a[distance=..6.31] ^0.0 ^ ^ 0.750 1.41421 0.000
+playsound block.note_block.pling record @a[distance=..7.65] ^0.0 ^ ^ 0.420 1.41421 0.000
+playsound block.note_block.pling record @a[distance=..7.13] ^0.0 ^ ^ 0.420 1.68179 0.000
+playsound block.note_block.pling_1 record @a[distance=..6.56] ^0.0 ^ ^ 0.420 0.56123 0.000
+playsound block.note_block.pling_1 record @a[distance=..6.31] ^0.0 ^ ^ 0.420 0.70711 0.000
+playsound block.note_block.flute record @a[distance=..8.52] ^0.0 ^ ^ 0.500 0.56123 0.000
+playsound block.note_block.flute record @a[distance=..7.46] ^0.0 ^ ^ 0.500 0.74915 0.000
+playsound block.note_block.flute record @a[distance=..6.86] ^0.0 ^ ^ 0.500 0.94387 0.000
+playsound block.note_block.flute record @a[distance=..6.56] ^0.0 ^ ^ 0.500 1.12246 0.000
+execute store result score #random nbs run random value 1..4
+execute if score #random nbs matches 1 if entity @a[distance=0..12] run function animated_java:music_speaker/animations/animation_speaker_beat_1/play
+execute if score #random nbs matches 2 if entity @a[distance=0..12] run function animated_java:music_speaker/animations/animation_speaker_beat_2/play
+execute if score #random nbs matches 3 if entity @a[distance=0..12] run function animated_java:music_speaker/animations/animation_speaker_beat_3/play
+execute if score #random nbs matches 4 if entity @a[distance=0..12] run function animated_java:music_speaker/animations/animation_speaker_beat_4/play
@@ -0,0 +1,7 @@
+playsound block.note_block.bass_-1 record @a[distance=..11.99] ^0.0 ^ ^ 0.680 1.88775 0.000
+playsound block.note_block.bass_-1 record @a[distance=..11.99] ^0.0 ^ ^ 0.600 1.88775 0.000
+playsound block.note_block.flute record @a[distance=..6.86] ^0.0 ^ ^ 0.750 0.94387 0.000
+playsound block.note_block.flute record @a[distance=..8.52] ^0.0 ^ ^ 0.500 0.56123 0.000
+playsound block.note_block.flute record @a[distance=..7.46] ^0.0 ^ ^ 0.500 0.74915 0.000
+playsound block.note_block.flute record @a[distance=..6.86] ^0.0 ^ ^ 0.500 0.94387 0.000
+playsound block.note_block.flute record @a[distance=..6.56] ^0.0 ^ ^ 0.500 1.12246 0.000
@@ -0,0 +1,21 @@
+playsound block.note_block.bass record @s[] ^-0.0 ^ ^ 1.000 0.66742 0.000
+playsound block.note_block.bell record @s[] ^-0.0 ^ ^ 0.600 1.00000 0.000
+playsound block.note_block.xylophone record @s[] ^-0.0 ^ ^ 0.900 1.00000 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.800 1.00000 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.750 1.00000 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.700 0.66742 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.700 0.84090 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.700 1.00000 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.500 0.50000 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.500 0.66742 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.500 0.84090 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.500 1.00000 0.000
+playsound block.note_block.basedrum record @s[] ^-0.0 ^ ^ 1.000 0.50000 0.000
+playsound block.note_block.basedrum record @s[] ^-0.0 ^ ^ 0.680 1.00000 0.000
+playsound random_fizz record @s[] ^-0.0 ^ ^ 0.680 1.00000 0.000
+playsound mob_wither_death record @s[] ^-0.0 ^ ^ 0.270 1.25992 0.000
+playsound mob_wither_death record @s[] ^-0.0 ^ ^ 0.270 2.00000 0.000
+playsound mob_wither_death record @s[] ^-0.0 ^ ^ 0.408 1.00000 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.750 1.88775 0.000
+playsound block.note_block.pling_1 record @s[] ^-0.0 ^ ^ 1.000 0.56123 0.000
+playsound block.note_block.bit_1 record @s[] ^0.05 ^ ^ 0.000 0.73841 0.000
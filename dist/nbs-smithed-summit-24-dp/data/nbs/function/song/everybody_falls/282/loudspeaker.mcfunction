@@ -0,0 +1,21 @@
+playsound block.note_block.bass record @a[distance=..48.00] ^0.0 ^ ^ 2.919 0.66742 0.000
+playsound block.note_block.bell record @a[distance=..48.00] ^0.0 ^ ^ 1.305 1.00000 0.000
+playsound block.note_block.xylophone record @a[distance=..48.00] ^0.0 ^ ^ 1.958 1.00000 0.000
+playsound block.note_block.pling record @a[distance=..48.00] ^0.0 ^ ^ 2.000 1.00000 0.000
+playsound block.note_block.flute record @a[distance=..48.00] ^0.0 ^ ^ 1.753 1.00000 0.000
+playsound block.note_block.pling record @a[distance=..48.00] ^0.0 ^ ^ 1.816 0.66742 0.000
+playsound block.note_block.pling record @a[distance=..48.00] ^0.0 ^ ^ 1.778 0.84090 0.000
+playsound block.note_block.pling record @a[distance=..48.00] ^0.0 ^ ^ 1.750 1.00000 0.000
+playsound block.note_block.flute record @a[distance=..48.00] ^0.0 ^ ^ 1.250 0.50000 0.000
+playsound block.note_block.flute record @a[distance=..48.00] ^0.0 ^ ^ 1.216 0.66742 0.000
+playsound block.note_block.flute record @a[distance=..48.00] ^0.0 ^ ^ 1.189 0.84090 0.000
+playsound block.note_block.flute record @a[distance=..48.00] ^0.0 ^ ^ 1.169 1.00000 0.000
+playsound block.note_block.basedrum record @a[distance=..48.00] ^0.0 ^ ^ 2.824 0.50000 0.000
+playsound block.note_block.basedrum record @a[distance=..48.00] ^0.0 ^ ^ 1.810 1.00000 0.000
+playsound random_fizz record @a[distance=..48.00] ^0.0 ^ ^ 1.590 1.00000 0.000
+playsound mob_wither_death record @a[distance=..48.00] ^0.0 ^ ^ 0.617 1.25992 0.000
+playsound mob_wither_death record @a[distance=..48.00] ^0.0 ^ ^ 0.587 2.00000 0.000
+playsound mob_wither_death record @a[distance=..48.00] ^0.0 ^ ^ 0.954 1.00000 0.000
+playsound block.note_block.pling record @a[distance=..48.00] ^0.0 ^ ^ 1.764 1.88775 0.000
+playsound block.note_block.pling_1 record @a[distance=..48.00] ^0.0 ^ ^ 2.311 0.56123 0.000
+playsound block.note_block.bit_1 record @a[distance=..48.00] ^-1.0 ^ ^ 0.000 0.73841 0.000
@@ -0,0 +1,21 @@
+playsound block.note_block.bass record @a[distance=..11.96] ^0.0 ^ ^ 1.000 0.66742 0.000
+playsound block.note_block.bell record @a[distance=..6.12] ^0.0 ^ ^ 0.600 1.00000 0.000
+playsound block.note_block.xylophone record @a[distance=..6.12] ^0.0 ^ ^ 0.900 1.00000 0.000
+playsound block.note_block.pling record @a[distance=..9.00] ^0.0 ^ ^ 0.800 1.00000 0.000
+playsound block.note_block.flute record @a[distance=..6.75] ^0.0 ^ ^ 0.750 1.00000 0.000
+playsound block.note_block.pling record @a[distance=..10.54] ^0.0 ^ ^ 0.700 0.66742 0.000
+playsound block.note_block.pling record @a[distance=..9.72] ^0.0 ^ ^ 0.700 0.84090 0.000
+playsound block.note_block.pling record @a[distance=..9.00] ^0.0 ^ ^ 0.700 1.00000 0.000
+playsound block.note_block.flute record @a[distance=..9.00] ^0.0 ^ ^ 0.500 0.50000 0.000
+playsound block.note_block.flute record @a[distance=..7.85] ^0.0 ^ ^ 0.500 0.66742 0.000
+playsound block.note_block.flute record @a[distance=..7.13] ^0.0 ^ ^ 0.500 0.84090 0.000
+playsound block.note_block.flute record @a[distance=..6.75] ^0.0 ^ ^ 0.500 1.00000 0.000
+playsound block.note_block.basedrum record @a[distance=..11.88] ^0.0 ^ ^ 1.000 0.50000 0.000
+playsound block.note_block.basedrum record @a[distance=..11.25] ^0.0 ^ ^ 0.680 1.00000 0.000
+playsound random_fizz record @a[distance=..6.75] ^0.0 ^ ^ 0.680 1.00000 0.000
+playsound mob_wither_death record @a[distance=..6.42] ^0.0 ^ ^ 0.270 1.25992 0.000
+playsound mob_wither_death record @a[distance=..6.12] ^0.0 ^ ^ 0.270 2.00000 0.000
+playsound mob_wither_death record @a[distance=..6.75] ^0.0 ^ ^ 0.408 1.00000 0.000
+playsound block.note_block.pling record @a[distance=..6.86] ^0.0 ^ ^ 0.750 1.88775 0.000
+playsound block.note_block.pling_1 record @a[distance=..6.56] ^0.0 ^ ^ 1.000 0.56123 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.27] ^-1.0 ^ ^ 0.000 0.73841 0.000
@@ -0,0 +1,13 @@
+playsound block.note_block.bell record @a[distance=..48.00] ^0.0 ^ ^ 1.289 1.12246 0.000
+playsound block.note_block.xylophone record @a[distance=..48.00] ^0.0 ^ ^ 1.934 1.12246 0.000
+playsound block.note_block.pling record @a[distance=..48.00] ^0.0 ^ ^ 1.978 1.12246 0.000
+playsound block.note_block.pling record @a[distance=..48.00] ^0.0 ^ ^ 1.236 1.12246 0.000
+playsound block.note_block.flute record @a[distance=..48.00] ^0.0 ^ ^ 1.733 1.12246 0.000
+playsound block.note_block.flute record @a[distance=..48.00] ^0.0 ^ ^ 1.189 0.84090 0.000
+playsound block.note_block.flute record @a[distance=..48.00] ^0.0 ^ ^ 1.162 1.05946 0.000
+playsound block.note_block.flute record @a[distance=..48.00] ^0.0 ^ ^ 1.142 1.25992 0.000
+playsound block.note_block.flute record @a[distance=..48.00] ^0.0 ^ ^ 1.108 1.68179 0.000
+playsound block.note_block.snare record @a[distance=..48.00] ^0.0 ^ ^ 0.870 2.00000 0.000
+playsound block.note_block.pling record @a[distance=..48.00] ^2.0 ^ ^ 1.403 2.00000 0.000
+playsound block.note_block.pling record @a[distance=..48.00] ^2.0 ^ ^ 1.403 2.00000 0.000
+playsound block.note_block.pling_1 record @a[distance=..48.00] ^-2.0 ^ ^ 1.370 0.62996 0.000
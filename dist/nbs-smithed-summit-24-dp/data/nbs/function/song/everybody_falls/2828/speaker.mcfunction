@@ -0,0 +1,12 @@
+playsound block.note_block.flute record @a[distance=..6.56] ^0.0 ^ ^ 0.750 1.12246 0.000
+playsound block.note_block.flute record @a[distance=..7.13] ^0.0 ^ ^ 0.500 0.84090 0.000
+playsound block.note_block.flute record @a[distance=..6.65] ^0.0 ^ ^ 0.500 1.05946 0.000
+playsound block.note_block.flute record @a[distance=..6.42] ^0.0 ^ ^ 0.500 1.25992 0.000
+playsound block.note_block.flute record @a[distance=..6.19] ^0.0 ^ ^ 0.500 1.68179 0.000
+playsound block.note_block.snare record @a[distance=..9.00] ^0.0 ^ ^ 0.170 0.50000 0.000
+playsound block.note_block.snare record @a[distance=..6.75] ^-2.0 ^ ^ 0.170 1.00000 0.000
+playsound random_wood_click record @a[distance=..6.75] ^1.0 ^ ^ 0.188 1.00000 0.000
+playsound block.note_block.snare record @a[distance=..6.19] ^0.0 ^ ^ 0.400 1.68179 0.000
+playsound block.note_block.pling_1 record @a[distance=..6.26] ^-1.0 ^ ^ 0.600 0.74915 0.000
+playsound block.note_block.pling_1 record @a[distance=..6.26] ^-1.0 ^ ^ 0.600 0.74915 0.000
+playsound block.note_block.pling_1 record @a[distance=..6.19] ^-1.0 ^ ^ 0.600 0.84090 0.000
@@ -0,0 +1,16 @@
+playsound block.note_block.bell record @s[] ^-0.0 ^ ^ 0.600 1.12246 0.000
+playsound block.note_block.xylophone record @s[] ^-0.0 ^ ^ 0.900 1.12246 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.800 1.12246 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.500 1.12246 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.750 1.12246 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.500 0.84090 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.500 1.05946 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.500 1.25992 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.500 1.68179 0.000
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 0.750 0.50000 0.000
+playsound block.note_block.snare record @s[] ^-0.6 ^ ^ 0.750 1.00000 0.000
+playsound random_wood_click record @s[] ^0.6 ^ ^ 0.750 1.00000 0.000
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 0.400 1.41421 0.000
+playsound block.note_block.pling_1 record @s[] ^-0.5 ^ ^ 0.600 1.00000 0.000
+playsound block.note_block.pling_1 record @s[] ^-0.5 ^ ^ 0.600 1.00000 0.000
+playsound block.note_block.pling_1 record @s[] ^0.5 ^ ^ 0.600 1.00000 0.000
@@ -0,0 +1,17 @@
+playsound block.note_block.flute record @a[distance=..48.00] ^0.0 ^ ^ 1.733 1.12246 0.000
+playsound block.note_block.flute record @a[distance=..48.00] ^0.0 ^ ^ 1.189 0.84090 0.000
+playsound block.note_block.flute record @a[distance=..48.00] ^0.0 ^ ^ 1.162 1.05946 0.000
+playsound block.note_block.flute record @a[distance=..48.00] ^0.0 ^ ^ 1.142 1.25992 0.000
+playsound block.note_block.flute record @a[distance=..48.00] ^0.0 ^ ^ 1.108 1.68179 0.000
+playsound block.note_block.snare record @a[distance=..48.00] ^0.0 ^ ^ 0.425 0.50000 0.000
+playsound block.note_block.snare record @a[distance=..48.00] ^-3.0 ^ ^ 0.397 1.00000 0.000
+playsound random_wood_click record @a[distance=..48.00] ^2.0 ^ ^ 0.438 1.00000 0.000
+playsound block.note_block.snare record @a[distance=..48.00] ^0.0 ^ ^ 0.919 1.18921 0.000
+playsound block.note_block.pling_1 record @a[distance=..48.00] ^-2.0 ^ ^ 1.305 1.00000 0.000
+playsound block.note_block.pling_1 record @a[distance=..48.00] ^-2.0 ^ ^ 1.305 1.00000 0.000
+execute store result score #random nbs run random value 1..4
+execute if score #random nbs matches 1 if entity @a[distance=0..48] run function animated_java:music_speaker/animations/animation_speaker_beat_1/play
+execute if score #random nbs matches 2 if entity @a[distance=0..48] run function animated_java:music_speaker/animations/animation_speaker_beat_2/play
+execute if score #random nbs matches 3 if entity @a[distance=0..48] run function animated_java:music_speaker/animations/animation_speaker_beat_3/play
+execute if score #random nbs matches 4 if entity @a[distance=0..48] run function animated_java:music_speaker/animations/animation_speaker_beat_4/play
+playsound block.note_block.pling_1 record @a[distance=..48.00] ^-2.0 ^ ^ 1.305 1.00000 0.000
@@ -0,0 +1,17 @@
+playsound block.note_block.flute record @a[distance=..6.56] ^0.0 ^ ^ 0.750 1.12246 0.000
+playsound block.note_block.flute record @a[distance=..7.13] ^0.0 ^ ^ 0.500 0.84090 0.000
+playsound block.note_block.flute record @a[distance=..6.65] ^0.0 ^ ^ 0.500 1.05946 0.000
+playsound block.note_block.flute record @a[distance=..6.42] ^0.0 ^ ^ 0.500 1.25992 0.000
+playsound block.note_block.flute record @a[distance=..6.19] ^0.0 ^ ^ 0.500 1.68179 0.000
+playsound block.note_block.snare record @a[distance=..9.00] ^0.0 ^ ^ 0.170 0.50000 0.000
+playsound block.note_block.snare record @a[distance=..6.75] ^-2.0 ^ ^ 0.170 1.00000 0.000
+playsound random_wood_click record @a[distance=..6.75] ^1.0 ^ ^ 0.188 1.00000 0.000
+playsound block.note_block.snare record @a[distance=..6.48] ^0.0 ^ ^ 0.400 1.18921 0.000
+playsound block.note_block.pling_1 record @a[distance=..6.12] ^-1.0 ^ ^ 0.600 1.00000 0.000
+playsound block.note_block.pling_1 record @a[distance=..6.12] ^-1.0 ^ ^ 0.600 1.00000 0.000
+execute store result score #random nbs run random value 1..4
+execute if score #random nbs matches 1 if entity @a[distance=0..12] run function animated_java:music_speaker/animations/animation_speaker_beat_1/play
+execute if score #random nbs matches 2 if entity @a[distance=0..12] run function animated_java:music_speaker/animations/animation_speaker_beat_2/play
+execute if score #random nbs matches 3 if entity @a[distance=0..12] run function animated_java:music_speaker/animations/animation_speaker_beat_3/play
+execute if score #random nbs matches 4 if entity @a[distance=0..12] run function animated_java:music_speaker/animations/animation_speaker_beat_4/play
+playsound block.note_block.pling_1 record @a[distance=..6.12] ^-1.0 ^ ^ 0.600 1.00000 0.000
@@ -0,0 +1,17 @@
+playsound block.note_block.bell record @a[distance=..48.00] ^0.0 ^ ^ 1.232 1.68179 0.000
+playsound block.note_block.xylophone record @a[distance=..48.00] ^0.0 ^ ^ 1.849 1.68179 0.000
+playsound block.note_block.pling record @a[distance=..48.00] ^0.0 ^ ^ 1.903 1.68179 0.000
+playsound block.note_block.pling record @a[distance=..48.00] ^0.0 ^ ^ 1.189 1.68179 0.000
+playsound block.note_block.flute record @a[distance=..48.00] ^0.0 ^ ^ 1.662 1.68179 0.000
+playsound block.note_block.flute record @a[distance=..48.00] ^0.0 ^ ^ 1.189 0.84090 0.000
+playsound block.note_block.flute record @a[distance=..48.00] ^0.0 ^ ^ 1.162 1.05946 0.000
+playsound block.note_block.flute record @a[distance=..48.00] ^0.0 ^ ^ 1.142 1.25992 0.000
+playsound block.note_block.flute record @a[distance=..48.00] ^0.0 ^ ^ 1.108 1.68179 0.000
+playsound block.note_block.basedrum record @a[distance=..48.00] ^0.0 ^ ^ 1.936 1.41421 0.000
+playsound block.note_block.basedrum record @a[distance=..48.00] ^0.0 ^ ^ 1.966 1.18921 0.000
+playsound block.note_block.snare record @a[distance=..48.00] ^0.0 ^ ^ 0.425 0.50000 0.000
+playsound block.note_block.snare record @a[distance=..48.00] ^-3.0 ^ ^ 0.397 1.00000 0.000
+playsound random_wood_click record @a[distance=..48.00] ^2.0 ^ ^ 0.438 1.00000 0.000
+playsound block.note_block.pling_1 record @a[distance=..48.00] ^-2.0 ^ ^ 1.305 1.00000 0.000
+playsound block.note_block.pling_1 record @a[distance=..48.00] ^-2.0 ^ ^ 1.305 1.00000 0.000
+playsound block.note_block.pling_1 record @a[distance=..48.00] ^-2.0 ^ ^ 1.305 1.00000 0.000
@@ -0,0 +1,6 @@
+playsound block.note_block.bell record @a[distance=..48.00] ^0.0 ^ ^ 1.305 1.00000 0.000
+playsound block.note_block.xylophone record @a[distance=..48.00] ^0.0 ^ ^ 1.958 1.00000 0.000
+playsound block.note_block.pling record @a[distance=..48.00] ^0.0 ^ ^ 2.000 1.00000 0.000
+playsound block.note_block.flute record @a[distance=..48.00] ^0.0 ^ ^ 1.753 1.00000 0.000
+playsound block.note_block.pling_1 record @a[distance=..48.00] ^0.0 ^ ^ 1.733 0.56123 0.000
+playsound block.note_block.pling_1 record @a[distance=..48.00] ^0.0 ^ ^ 2.311 0.56123 0.000
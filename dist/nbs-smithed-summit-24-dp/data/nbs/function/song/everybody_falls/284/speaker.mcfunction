@@ -0,0 +1,6 @@
+playsound block.note_block.bell record @a[distance=..6.12] ^0.0 ^ ^ 0.600 1.00000 0.000
+playsound block.note_block.xylophone record @a[distance=..6.12] ^0.0 ^ ^ 0.900 1.00000 0.000
+playsound block.note_block.pling record @a[distance=..9.00] ^0.0 ^ ^ 0.800 1.00000 0.000
+playsound block.note_block.flute record @a[distance=..6.75] ^0.0 ^ ^ 0.750 1.00000 0.000
+playsound block.note_block.pling_1 record @a[distance=..6.56] ^0.0 ^ ^ 0.750 0.56123 0.000
+playsound block.note_block.pling_1 record @a[distance=..6.56] ^0.0 ^ ^ 1.000 0.56123 0.000
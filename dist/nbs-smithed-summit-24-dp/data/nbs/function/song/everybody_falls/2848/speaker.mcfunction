@@ -0,0 +1,14 @@
+playsound block.note_block.bell record @a[distance=..6.12] ^0.0 ^ ^ 0.600 1.00000 0.000
+playsound block.note_block.xylophone record @a[distance=..6.12] ^0.0 ^ ^ 0.900 1.00000 0.000
+playsound block.note_block.pling record @a[distance=..9.00] ^0.0 ^ ^ 0.800 1.00000 0.000
+playsound block.note_block.pling record @a[distance=..9.00] ^0.0 ^ ^ 0.500 1.00000 0.000
+playsound block.note_block.flute record @a[distance=..6.75] ^0.0 ^ ^ 0.750 1.00000 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.14] ^1.0 ^ ^ 1.000 0.94387 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.15] ^1.0 ^ ^ 1.000 0.93303 0.000
+execute store result score #random nbs run random value 1..4
+execute if score #random nbs matches 1 if entity @a[distance=0..12] run function animated_java:music_speaker/animations/animation_speaker_beat_1/play
+execute if score #random nbs matches 2 if entity @a[distance=0..12] run function animated_java:music_speaker/animations/animation_speaker_beat_2/play
+execute if score #random nbs matches 3 if entity @a[distance=0..12] run function animated_java:music_speaker/animations/animation_speaker_beat_3/play
+execute if score #random nbs matches 4 if entity @a[distance=0..12] run function animated_java:music_speaker/animations/animation_speaker_beat_4/play
+playsound block.note_block.bit_1 record @a[distance=..6.15] ^-1.0 ^ ^ 1.000 0.91700 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.16] ^-1.0 ^ ^ 1.000 0.90647 0.000
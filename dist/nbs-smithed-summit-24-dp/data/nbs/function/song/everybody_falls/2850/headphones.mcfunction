@@ -0,0 +1,17 @@
+playsound block.note_block.bell record @s[] ^-0.0 ^ ^ 0.600 1.00000 0.000
+playsound block.note_block.xylophone record @s[] ^-0.0 ^ ^ 0.900 1.00000 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.800 1.00000 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.500 1.00000 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.750 1.00000 0.000
+playsound block.note_block.basedrum_-1 record @s[] ^-0.0 ^ ^ 1.000 1.88775 0.000
+playsound block.note_block.basedrum record @s[] ^-0.0 ^ ^ 0.680 0.94387 0.000
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 0.800 0.50000 0.000
+playsound block.note_block.snare record @s[] ^-0.6 ^ ^ 0.800 1.00000 0.000
+playsound random_wood_click record @s[] ^0.6 ^ ^ 0.800 1.00000 0.000
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 0.400 2.00000 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.5 ^ ^ 1.000 0.89090 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.5 ^ ^ 1.000 0.88067 0.000
+playsound block.note_block.bit_1 record @s[] ^0.5 ^ ^ 1.000 1.12246 0.000
+playsound block.note_block.bit_1 record @s[] ^0.5 ^ ^ 1.000 0.86554 0.000
+playsound block.note_block.bit_1 record @s[] ^0.5 ^ ^ 1.000 0.85560 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.5 ^ ^ 1.000 1.09051 0.000
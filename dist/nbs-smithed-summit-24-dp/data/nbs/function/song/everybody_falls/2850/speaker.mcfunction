@@ -0,0 +1,17 @@
+playsound block.note_block.bell record @a[distance=..6.12] ^0.0 ^ ^ 0.600 1.00000 0.000
+playsound block.note_block.xylophone record @a[distance=..6.12] ^0.0 ^ ^ 0.900 1.00000 0.000
+playsound block.note_block.pling record @a[distance=..9.00] ^0.0 ^ ^ 0.800 1.00000 0.000
+playsound block.note_block.pling record @a[distance=..9.00] ^0.0 ^ ^ 0.500 1.00000 0.000
+playsound block.note_block.flute record @a[distance=..6.75] ^0.0 ^ ^ 0.750 1.00000 0.000
+playsound block.note_block.basedrum_-1 record @a[distance=..11.90] ^0.0 ^ ^ 1.000 1.88775 0.000
+playsound block.note_block.basedrum record @a[distance=..11.35] ^0.0 ^ ^ 0.680 0.94387 0.000
+playsound block.note_block.snare record @a[distance=..9.00] ^0.0 ^ ^ 0.800 0.50000 0.000
+playsound block.note_block.snare record @a[distance=..6.75] ^1.0 ^ ^ 0.800 1.00000 0.000
+playsound random_wood_click record @a[distance=..6.75] ^-2.0 ^ ^ 0.800 1.00000 0.000
+playsound block.note_block.snare record @a[distance=..6.12] ^0.0 ^ ^ 0.400 2.00000 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.16] ^1.0 ^ ^ 1.000 0.89090 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.17] ^1.0 ^ ^ 1.000 0.88067 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.09] ^-1.0 ^ ^ 1.000 1.12246 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.18] ^-1.0 ^ ^ 1.000 0.86554 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.18] ^-1.0 ^ ^ 1.000 0.85560 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.09] ^1.0 ^ ^ 1.000 1.09051 0.000
@@ -0,0 +1,13 @@
+playsound block.note_block.bell record @s[] ^-0.0 ^ ^ 0.600 1.00000 0.000
+playsound block.note_block.xylophone record @s[] ^-0.0 ^ ^ 0.900 1.00000 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.800 1.00000 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.500 1.00000 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.750 1.00000 0.000
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 0.400 1.18921 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.5 ^ ^ 1.000 0.74915 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.5 ^ ^ 1.000 0.74055 0.000
+playsound block.note_block.bit_1 record @s[] ^0.5 ^ ^ 1.000 0.94387 0.000
+particle note ~ ~2.25 ~ 0 0 0 1 1
+playsound block.note_block.bit_1 record @s[] ^0.5 ^ ^ 1.000 0.72783 0.000
+playsound block.note_block.bit_1 record @s[] ^0.5 ^ ^ 1.000 0.71947 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.5 ^ ^ 1.000 0.91700 0.000
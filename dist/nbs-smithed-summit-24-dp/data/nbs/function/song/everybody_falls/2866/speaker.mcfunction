@@ -0,0 +1,15 @@
+playsound block.note_block.bass record @a[distance=..11.96] ^0.0 ^ ^ 0.680 0.66742 0.000
+playsound block.note_block.bass record @a[distance=..11.96] ^0.0 ^ ^ 0.600 0.66742 0.000
+playsound block.note_block.flute record @a[distance=..6.86] ^0.0 ^ ^ 0.750 0.94387 0.000
+playsound block.note_block.basedrum_-1 record @a[distance=..11.90] ^0.0 ^ ^ 1.000 1.88775 0.000
+playsound block.note_block.basedrum record @a[distance=..11.35] ^0.0 ^ ^ 0.680 0.94387 0.000
+playsound block.note_block.snare record @a[distance=..9.00] ^0.0 ^ ^ 0.800 0.50000 0.000
+playsound block.note_block.snare record @a[distance=..6.75] ^1.0 ^ ^ 0.800 1.00000 0.000
+playsound random_wood_click record @a[distance=..6.75] ^-2.0 ^ ^ 0.800 1.00000 0.000
+playsound block.note_block.snare record @a[distance=..6.12] ^0.0 ^ ^ 0.400 2.00000 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.56] ^1.0 ^ ^ 1.000 0.56123 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.58] ^1.0 ^ ^ 1.000 0.55478 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.31] ^-1.0 ^ ^ 1.000 0.70711 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.60] ^-1.0 ^ ^ 1.000 0.54525 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.62] ^-1.0 ^ ^ 1.000 0.53899 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.33] ^1.0 ^ ^ 1.000 0.68698 0.000
@@ -0,0 +1,11 @@
+playsound block.note_block.bell record @s[] ^-0.0 ^ ^ 0.600 0.94387 0.000
+playsound block.note_block.xylophone record @s[] ^-0.0 ^ ^ 0.900 0.94387 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.800 0.94387 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.500 0.94387 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.750 0.94387 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.5 ^ ^ 1.000 0.52973 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.5 ^ ^ 1.000 0.52365 0.000
+playsound block.note_block.bit_1 record @s[] ^0.5 ^ ^ 1.000 0.66742 0.000
+playsound block.note_block.bit_1 record @s[] ^0.5 ^ ^ 1.000 0.51465 0.000
+playsound block.note_block.bit_1 record @s[] ^0.5 ^ ^ 1.000 0.50874 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.5 ^ ^ 1.000 0.64842 0.000
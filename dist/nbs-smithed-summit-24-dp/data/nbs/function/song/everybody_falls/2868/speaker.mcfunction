@@ -0,0 +1,11 @@
+playsound block.note_block.bell record @a[distance=..6.14] ^0.0 ^ ^ 0.600 0.94387 0.000
+playsound block.note_block.xylophone record @a[distance=..6.14] ^0.0 ^ ^ 0.900 0.94387 0.000
+playsound block.note_block.pling record @a[distance=..9.24] ^0.0 ^ ^ 0.800 0.94387 0.000
+playsound block.note_block.pling record @a[distance=..9.24] ^0.0 ^ ^ 0.500 0.94387 0.000
+playsound block.note_block.flute record @a[distance=..6.86] ^0.0 ^ ^ 0.750 0.94387 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.65] ^1.0 ^ ^ 1.000 0.52973 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.67] ^1.0 ^ ^ 1.000 0.52365 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.36] ^-1.0 ^ ^ 1.000 0.66742 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.70] ^-1.0 ^ ^ 1.000 0.51465 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.72] ^-1.0 ^ ^ 1.000 0.50874 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.39] ^1.0 ^ ^ 1.000 0.64842 0.000
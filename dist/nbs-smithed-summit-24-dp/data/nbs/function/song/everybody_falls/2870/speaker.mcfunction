@@ -0,0 +1,24 @@
+playsound block.note_block.bass record @a[distance=..11.93] ^0.0 ^ ^ 0.750 0.84090 0.000
+playsound block.note_block.bass record @a[distance=..11.93] ^0.0 ^ ^ 1.000 0.84090 0.000
+playsound block.note_block.bell record @a[distance=..6.14] ^0.0 ^ ^ 0.600 0.94387 0.000
+playsound block.note_block.xylophone record @a[distance=..6.14] ^0.0 ^ ^ 0.900 0.94387 0.000
+playsound block.note_block.pling record @a[distance=..9.24] ^0.0 ^ ^ 0.800 0.94387 0.000
+playsound block.note_block.pling record @a[distance=..9.24] ^0.0 ^ ^ 0.500 0.94387 0.000
+playsound block.note_block.flute record @a[distance=..6.86] ^0.0 ^ ^ 0.750 0.94387 0.000
+playsound block.note_block.pling record @a[distance=..9.72] ^0.0 ^ ^ 0.700 0.84090 0.000
+playsound block.note_block.pling record @a[distance=..9.00] ^0.0 ^ ^ 0.700 1.00000 0.000
+playsound block.note_block.pling record @a[distance=..8.06] ^0.0 ^ ^ 0.700 1.25992 0.000
+playsound block.note_block.pling record @a[distance=..7.13] ^0.0 ^ ^ 0.700 1.68179 0.000
+playsound block.note_block.flute record @a[distance=..8.06] ^0.0 ^ ^ 0.500 0.62996 0.000
+playsound block.note_block.flute record @a[distance=..7.13] ^0.0 ^ ^ 0.500 0.84090 0.000
+playsound block.note_block.flute record @a[distance=..6.75] ^0.0 ^ ^ 0.500 1.00000 0.000
+playsound block.note_block.flute record @a[distance=..6.42] ^0.0 ^ ^ 0.500 1.25992 0.000
+playsound entity_witch_hurt1 record @a[distance=..6.12] ^-2.0 ^ ^ 0.450 2.00000 0.000
+playsound dig_gravel1 record @a[distance=..6.23] ^0.0 ^ ^ 0.700 1.58740 0.000
+playsound block.note_block.snare record @a[distance=..6.19] ^0.0 ^ ^ 0.400 1.68179 0.000
+playsound block.note_block.bit record @a[distance=..6.75] ^1.0 ^ ^ 1.000 2.00000 0.000
+playsound block.note_block.bit record @a[distance=..6.77] ^1.0 ^ ^ 1.000 1.97703 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.42] ^-1.0 ^ ^ 1.000 0.62996 0.000
+playsound block.note_block.bit record @a[distance=..6.80] ^-1.0 ^ ^ 1.000 1.94306 0.000
+playsound block.note_block.bit record @a[distance=..6.83] ^-1.0 ^ ^ 1.000 1.92075 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.45] ^1.0 ^ ^ 1.000 0.61203 0.000
@@ -0,0 +1,18 @@
+playsound block.note_block.bass record @a[distance=..11.93] ^0.0 ^ ^ 0.680 0.84090 0.000
+playsound block.note_block.bass record @a[distance=..11.93] ^0.0 ^ ^ 0.600 0.84090 0.000
+playsound block.note_block.flute record @a[distance=..6.86] ^0.0 ^ ^ 0.750 0.94387 0.000
+playsound block.note_block.flute record @a[distance=..8.06] ^0.0 ^ ^ 0.500 0.62996 0.000
+playsound block.note_block.flute record @a[distance=..7.13] ^0.0 ^ ^ 0.500 0.84090 0.000
+playsound block.note_block.flute record @a[distance=..6.75] ^0.0 ^ ^ 0.500 1.00000 0.000
+playsound block.note_block.flute record @a[distance=..6.42] ^0.0 ^ ^ 0.500 1.25992 0.000
+playsound block.note_block.bit record @a[distance=..6.86] ^1.0 ^ ^ 1.000 1.88775 0.000
+playsound block.note_block.bit record @a[distance=..6.89] ^1.0 ^ ^ 1.000 1.86607 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.48] ^-1.0 ^ ^ 1.000 0.59460 0.000
+execute store result score #random nbs run random value 1..4
+execute if score #random nbs matches 1 if entity @a[distance=0..12] run function animated_java:music_speaker/animations/animation_speaker_beat_1/play
+execute if score #random nbs matches 2 if entity @a[distance=0..12] run function animated_java:music_speaker/animations/animation_speaker_beat_2/play
+execute if score #random nbs matches 3 if entity @a[distance=0..12] run function animated_java:music_speaker/animations/animation_speaker_beat_3/play
+execute if score #random nbs matches 4 if entity @a[distance=0..12] run function animated_java:music_speaker/animations/animation_speaker_beat_4/play
+playsound block.note_block.bit record @a[distance=..6.92] ^-1.0 ^ ^ 1.000 1.83401 0.000
+playsound block.note_block.bit record @a[distance=..6.95] ^-1.0 ^ ^ 1.000 1.81294 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.52] ^1.0 ^ ^ 1.000 0.57768 0.000
@@ -0,0 +1,22 @@
+playsound block.note_block.bass record @s[] ^-0.0 ^ ^ 0.680 0.84090 0.000
+playsound block.note_block.bass record @s[] ^-0.0 ^ ^ 0.600 0.84090 0.000
+playsound block.note_block.bell record @s[] ^-0.0 ^ ^ 0.600 0.62996 0.000
+playsound block.note_block.xylophone record @s[] ^-0.0 ^ ^ 0.900 0.62996 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.800 0.62996 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.500 0.62996 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.750 0.62996 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.500 0.62996 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.500 0.84090 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.500 1.00000 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.500 1.25992 0.000
+playsound block.note_block.basedrum_-1 record @s[] ^-0.0 ^ ^ 1.000 1.88775 0.000
+playsound block.note_block.basedrum record @s[] ^-0.0 ^ ^ 0.680 0.94387 0.000
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 0.400 1.41421 0.000
+playsound block.note_block.pling record @s[] ^-0.5 ^ ^ 0.154 1.49831 0.000
+playsound block.note_block.pling record @s[] ^0.5 ^ ^ 0.110 1.48110 0.000
+playsound block.note_block.bit record @s[] ^-0.5 ^ ^ 1.000 1.78180 0.000
+playsound block.note_block.bit record @s[] ^-0.5 ^ ^ 1.000 1.76133 0.000
+playsound block.note_block.bit_1 record @s[] ^0.5 ^ ^ 1.000 0.56123 0.000
+playsound block.note_block.bit record @s[] ^0.5 ^ ^ 1.000 1.73107 0.000
+playsound block.note_block.bit record @s[] ^0.5 ^ ^ 1.000 1.71119 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.5 ^ ^ 1.000 0.54525 0.000
@@ -0,0 +1,19 @@
+playsound block.note_block.bass record @s[] ^-0.0 ^ ^ 0.680 0.84090 0.000
+playsound block.note_block.bass record @s[] ^-0.0 ^ ^ 0.600 0.84090 0.000
+playsound block.note_block.bell record @s[] ^-0.0 ^ ^ 0.600 0.62996 0.000
+playsound block.note_block.xylophone record @s[] ^-0.0 ^ ^ 0.900 0.62996 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.800 0.62996 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.500 0.62996 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.750 0.62996 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.500 0.62996 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.500 0.84090 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.500 1.00000 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.500 1.25992 0.000
+playsound block.note_block.pling record @s[] ^-0.5 ^ ^ 0.308 1.49831 0.000
+playsound block.note_block.pling record @s[] ^0.5 ^ ^ 0.220 1.48110 0.000
+playsound block.note_block.bit record @s[] ^-0.5 ^ ^ 1.000 1.68179 0.000
+playsound block.note_block.bit record @s[] ^-0.5 ^ ^ 1.000 1.66248 0.000
+playsound block.note_block.bit_1 record @s[] ^0.5 ^ ^ 1.000 0.52973 0.000
+playsound block.note_block.bit record @s[] ^0.5 ^ ^ 1.000 1.63392 0.000
+playsound block.note_block.bit record @s[] ^0.5 ^ ^ 1.000 1.61515 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.5 ^ ^ 1.000 0.51465 0.000
@@ -0,0 +1,7 @@
+playsound block.note_block.bell record @s[] ^-0.0 ^ ^ 0.600 1.00000 0.000
+playsound block.note_block.xylophone record @s[] ^-0.0 ^ ^ 0.900 1.00000 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.800 1.00000 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.750 1.00000 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.750 1.49831 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 1.000 1.25992 0.000
+particle note ~ ~2.25 ~ 0 0 0 1 1
@@ -0,0 +1,24 @@
+playsound block.note_block.bass record @a[distance=..11.93] ^0.0 ^ ^ 0.680 0.84090 0.000
+playsound block.note_block.bass record @a[distance=..11.93] ^0.0 ^ ^ 0.600 0.84090 0.000
+playsound block.note_block.bell record @a[distance=..6.42] ^0.0 ^ ^ 0.600 0.62996 0.000
+playsound block.note_block.xylophone record @a[distance=..6.42] ^0.0 ^ ^ 0.900 0.62996 0.000
+playsound block.note_block.pling record @a[distance=..10.71] ^0.0 ^ ^ 0.800 0.62996 0.000
+playsound block.note_block.pling record @a[distance=..10.71] ^0.0 ^ ^ 0.500 0.62996 0.000
+playsound block.note_block.flute record @a[distance=..8.06] ^0.0 ^ ^ 0.750 0.62996 0.000
+playsound block.note_block.flute record @a[distance=..8.06] ^0.0 ^ ^ 0.500 0.62996 0.000
+playsound block.note_block.flute record @a[distance=..7.13] ^0.0 ^ ^ 0.500 0.84090 0.000
+playsound block.note_block.flute record @a[distance=..6.75] ^0.0 ^ ^ 0.500 1.00000 0.000
+playsound block.note_block.flute record @a[distance=..6.42] ^0.0 ^ ^ 0.500 1.25992 0.000
+playsound block.note_block.pling record @a[distance=..7.46] ^1.0 ^ ^ 0.616 1.49831 0.000
+playsound block.note_block.pling record @a[distance=..7.50] ^-1.0 ^ ^ 0.440 1.48110 0.000
+playsound block.note_block.bit record @a[distance=..7.46] ^1.0 ^ ^ 1.000 1.49831 0.000
+playsound block.note_block.bit record @a[distance=..7.50] ^1.0 ^ ^ 1.000 1.48110 0.000
+playsound block.note_block.bit record @a[distance=..6.86] ^-1.0 ^ ^ 1.000 1.88775 0.000
+execute store result score #random nbs run random value 1..4
+execute if score #random nbs matches 1 if entity @a[distance=0..12] run function animated_java:music_speaker/animations/animation_speaker_beat_1/play
+execute if score #random nbs matches 2 if entity @a[distance=0..12] run function animated_java:music_speaker/animations/animation_speaker_beat_2/play
+execute if score #random nbs matches 3 if entity @a[distance=0..12] run function animated_java:music_speaker/animations/animation_speaker_beat_3/play
+execute if score #random nbs matches 4 if entity @a[distance=0..12] run function animated_java:music_speaker/animations/animation_speaker_beat_4/play
+playsound block.note_block.bit record @a[distance=..7.55] ^-1.0 ^ ^ 1.000 1.45565 0.000
+playsound block.note_block.bit record @a[distance=..7.59] ^-1.0 ^ ^ 1.000 1.43893 0.000
+playsound block.note_block.bit record @a[distance=..6.92] ^1.0 ^ ^ 1.000 1.83401 0.000
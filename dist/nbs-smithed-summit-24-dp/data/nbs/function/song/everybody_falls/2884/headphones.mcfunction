@@ -0,0 +1,15 @@
+playsound block.note_block.bass record @s[] ^-0.0 ^ ^ 0.680 0.84090 0.000
+playsound block.note_block.bass record @s[] ^-0.0 ^ ^ 0.600 0.84090 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.750 0.62996 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.500 0.62996 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.500 0.84090 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.500 1.00000 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.500 1.25992 0.000
+playsound block.note_block.pling record @s[] ^-0.5 ^ ^ 0.700 1.49831 0.000
+playsound block.note_block.pling record @s[] ^0.5 ^ ^ 0.500 1.48110 0.000
+playsound block.note_block.bit record @s[] ^-0.5 ^ ^ 1.000 1.33484 0.000
+playsound block.note_block.bit record @s[] ^-0.5 ^ ^ 1.000 1.31951 0.000
+playsound block.note_block.bit record @s[] ^0.5 ^ ^ 1.000 1.68179 0.000
+playsound block.note_block.bit record @s[] ^0.5 ^ ^ 1.000 1.29684 0.000
+playsound block.note_block.bit record @s[] ^0.5 ^ ^ 1.000 1.28194 0.000
+playsound block.note_block.bit record @s[] ^-0.5 ^ ^ 1.000 1.63392 0.000
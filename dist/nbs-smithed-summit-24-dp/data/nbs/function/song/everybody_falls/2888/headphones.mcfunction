@@ -0,0 +1,21 @@
+playsound block.note_block.bass record @s[] ^-0.0 ^ ^ 0.680 0.84090 0.000
+playsound block.note_block.bass record @s[] ^-0.0 ^ ^ 0.600 0.84090 0.000
+playsound block.note_block.bell record @s[] ^-0.0 ^ ^ 0.600 0.62996 0.000
+playsound block.note_block.xylophone record @s[] ^-0.0 ^ ^ 0.900 0.62996 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.800 0.62996 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.500 0.62996 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.750 0.62996 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.500 0.62996 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.500 0.84090 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.500 1.00000 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.500 1.25992 0.000
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 0.400 1.18921 0.000
+playsound block.note_block.pling record @s[] ^-0.5 ^ ^ 0.700 1.49831 0.000
+playsound block.note_block.pling record @s[] ^0.5 ^ ^ 0.500 1.48110 0.000
+playsound block.note_block.bit record @s[] ^-0.5 ^ ^ 1.000 1.18921 0.000
+playsound block.note_block.bit record @s[] ^-0.5 ^ ^ 1.000 1.17555 0.000
+playsound block.note_block.bit record @s[] ^0.5 ^ ^ 1.000 1.49831 0.000
+particle note ~ ~2.25 ~ 0 0 0 1 1
+playsound block.note_block.bit record @s[] ^0.5 ^ ^ 1.000 1.15535 0.000
+playsound block.note_block.bit record @s[] ^0.5 ^ ^ 1.000 1.14208 0.000
+playsound block.note_block.bit record @s[] ^-0.5 ^ ^ 1.000 1.45565 0.000
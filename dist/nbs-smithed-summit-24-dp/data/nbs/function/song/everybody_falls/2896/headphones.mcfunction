@@ -0,0 +1,21 @@
+playsound block.note_block.bass record @s[] ^-0.0 ^ ^ 0.680 0.56123 0.000
+playsound block.note_block.bass record @s[] ^-0.0 ^ ^ 0.600 0.56123 0.000
+playsound block.note_block.bell record @s[] ^-0.0 ^ ^ 0.600 0.74915 0.000
+playsound block.note_block.xylophone record @s[] ^-0.0 ^ ^ 0.900 0.74915 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.800 0.74915 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.500 0.74915 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.750 0.74915 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.500 0.56123 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.500 0.74915 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.500 0.94387 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.500 1.12246 0.000
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 0.400 1.18921 0.000
+playsound block.note_block.pling record @s[] ^-0.5 ^ ^ 0.700 1.49831 0.000
+playsound block.note_block.pling record @s[] ^0.5 ^ ^ 0.500 1.48110 0.000
+playsound block.note_block.bit record @s[] ^-0.5 ^ ^ 0.560 0.94387 0.000
+playsound block.note_block.bit record @s[] ^-0.5 ^ ^ 0.560 0.93303 0.000
+playsound block.note_block.bit record @s[] ^0.5 ^ ^ 0.850 1.18921 0.000
+particle note ~ ~2.25 ~ 0 0 0 1 1
+playsound block.note_block.bit record @s[] ^0.5 ^ ^ 0.500 0.91700 0.000
+playsound block.note_block.bit record @s[] ^0.5 ^ ^ 0.500 0.90647 0.000
+playsound block.note_block.bit record @s[] ^-0.5 ^ ^ 0.800 1.15535 0.000
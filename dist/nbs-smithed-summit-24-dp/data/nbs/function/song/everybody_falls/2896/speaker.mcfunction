@@ -0,0 +1,25 @@
+playsound block.note_block.bass record @a[distance=..11.98] ^0.0 ^ ^ 0.680 0.56123 0.000
+playsound block.note_block.bass record @a[distance=..11.98] ^0.0 ^ ^ 0.600 0.56123 0.000
+playsound block.note_block.bell record @a[distance=..6.26] ^0.0 ^ ^ 0.600 0.74915 0.000
+playsound block.note_block.xylophone record @a[distance=..6.26] ^0.0 ^ ^ 0.900 0.74915 0.000
+playsound block.note_block.pling record @a[distance=..10.15] ^0.0 ^ ^ 0.800 0.74915 0.000
+playsound block.note_block.pling record @a[distance=..10.15] ^0.0 ^ ^ 0.500 0.74915 0.000
+playsound block.note_block.flute record @a[distance=..7.46] ^0.0 ^ ^ 0.750 0.74915 0.000
+playsound block.note_block.flute record @a[distance=..8.52] ^0.0 ^ ^ 0.500 0.56123 0.000
+playsound block.note_block.flute record @a[distance=..7.46] ^0.0 ^ ^ 0.500 0.74915 0.000
+playsound block.note_block.flute record @a[distance=..6.86] ^0.0 ^ ^ 0.500 0.94387 0.000
+playsound block.note_block.flute record @a[distance=..6.56] ^0.0 ^ ^ 0.500 1.12246 0.000
+playsound block.note_block.snare record @a[distance=..6.48] ^0.0 ^ ^ 0.400 1.18921 0.000
+playsound block.note_block.pling record @a[distance=..7.46] ^1.0 ^ ^ 0.700 1.49831 0.000
+playsound block.note_block.pling record @a[distance=..7.50] ^-1.0 ^ ^ 0.500 1.48110 0.000
+playsound block.note_block.bit record @a[distance=..9.24] ^1.0 ^ ^ 0.560 0.94387 0.000
+playsound block.note_block.bit record @a[distance=..9.29] ^1.0 ^ ^ 0.560 0.93303 0.000
+playsound block.note_block.bit record @a[distance=..8.28] ^-1.0 ^ ^ 0.850 1.18921 0.000
+execute store result score #random nbs run random value 1..4
+execute if score #random nbs matches 1 if entity @a[distance=0..12] run function animated_java:music_speaker/animations/animation_speaker_beat_1/play
+execute if score #random nbs matches 2 if entity @a[distance=0..12] run function animated_java:music_speaker/animations/animation_speaker_beat_2/play
+execute if score #random nbs matches 3 if entity @a[distance=0..12] run function animated_java:music_speaker/animations/animation_speaker_beat_3/play
+execute if score #random nbs matches 4 if entity @a[distance=0..12] run function animated_java:music_speaker/animations/animation_speaker_beat_4/play
+playsound block.note_block.bit record @a[distance=..9.36] ^-1.0 ^ ^ 0.500 0.91700 0.000
+playsound block.note_block.bit record @a[distance=..9.41] ^-1.0 ^ ^ 0.500 0.90647 0.000
+playsound block.note_block.bit record @a[distance=..8.40] ^1.0 ^ ^ 0.800 1.15535 0.000
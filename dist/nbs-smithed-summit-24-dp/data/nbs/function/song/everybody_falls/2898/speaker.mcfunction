@@ -0,0 +1,21 @@
+playsound block.note_block.bass record @a[distance=..11.98] ^0.0 ^ ^ 0.680 0.56123 0.000
+playsound block.note_block.bass record @a[distance=..11.98] ^0.0 ^ ^ 0.600 0.56123 0.000
+playsound block.note_block.flute record @a[distance=..7.46] ^0.0 ^ ^ 0.750 0.74915 0.000
+playsound block.note_block.flute record @a[distance=..8.52] ^0.0 ^ ^ 0.500 0.56123 0.000
+playsound block.note_block.flute record @a[distance=..7.46] ^0.0 ^ ^ 0.500 0.74915 0.000
+playsound block.note_block.flute record @a[distance=..6.86] ^0.0 ^ ^ 0.500 0.94387 0.000
+playsound block.note_block.flute record @a[distance=..6.56] ^0.0 ^ ^ 0.500 1.12246 0.000
+playsound block.note_block.basedrum_-1 record @a[distance=..11.90] ^0.0 ^ ^ 1.000 1.88775 0.000
+playsound block.note_block.basedrum record @a[distance=..11.35] ^0.0 ^ ^ 0.680 0.94387 0.000
+playsound block.note_block.snare record @a[distance=..9.00] ^0.0 ^ ^ 0.800 0.50000 0.000
+playsound block.note_block.snare record @a[distance=..6.75] ^1.0 ^ ^ 0.800 1.00000 0.000
+playsound random_wood_click record @a[distance=..6.75] ^-2.0 ^ ^ 0.800 1.00000 0.000
+playsound block.note_block.snare record @a[distance=..6.12] ^0.0 ^ ^ 0.400 2.00000 0.000
+playsound block.note_block.pling record @a[distance=..7.46] ^1.0 ^ ^ 0.700 1.49831 0.000
+playsound block.note_block.pling record @a[distance=..7.50] ^-1.0 ^ ^ 0.500 1.48110 0.000
+playsound block.note_block.bit record @a[distance=..9.48] ^1.0 ^ ^ 0.430 0.89090 0.000
+playsound block.note_block.bit record @a[distance=..9.53] ^1.0 ^ ^ 0.430 0.88067 0.000
+playsound block.note_block.bit record @a[distance=..8.52] ^-1.0 ^ ^ 0.750 1.12246 0.000
+playsound block.note_block.bit record @a[distance=..9.60] ^-1.0 ^ ^ 0.370 0.86554 0.000
+playsound block.note_block.bit record @a[distance=..9.65] ^-1.0 ^ ^ 0.370 0.85560 0.000
+playsound block.note_block.bit record @a[distance=..8.64] ^1.0 ^ ^ 0.700 1.09051 0.000
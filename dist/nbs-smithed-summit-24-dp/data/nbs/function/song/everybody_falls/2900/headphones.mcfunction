@@ -0,0 +1,19 @@
+playsound block.note_block.bass record @s[] ^-0.0 ^ ^ 0.680 0.56123 0.000
+playsound block.note_block.bass record @s[] ^-0.0 ^ ^ 0.600 0.56123 0.000
+playsound block.note_block.bell record @s[] ^-0.0 ^ ^ 0.600 0.74915 0.000
+playsound block.note_block.xylophone record @s[] ^-0.0 ^ ^ 0.900 0.74915 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.800 0.74915 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.500 0.74915 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.750 0.74915 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.500 0.56123 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.500 0.74915 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.500 0.94387 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.500 1.12246 0.000
+playsound block.note_block.pling record @s[] ^-0.5 ^ ^ 0.700 1.49831 0.000
+playsound block.note_block.pling record @s[] ^0.5 ^ ^ 0.500 1.48110 0.000
+playsound block.note_block.bit record @s[] ^-0.5 ^ ^ 0.310 0.84090 0.000
+playsound block.note_block.bit record @s[] ^-0.5 ^ ^ 0.310 0.83124 0.000
+playsound block.note_block.bit record @s[] ^0.5 ^ ^ 0.650 1.05946 0.000
+playsound block.note_block.bit record @s[] ^0.5 ^ ^ 0.250 0.81696 0.000
+playsound block.note_block.bit record @s[] ^0.5 ^ ^ 0.250 0.80757 0.000
+playsound block.note_block.bit record @s[] ^-0.5 ^ ^ 0.600 1.02930 0.000
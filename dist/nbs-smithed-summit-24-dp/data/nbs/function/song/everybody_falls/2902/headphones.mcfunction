@@ -0,0 +1,22 @@
+playsound block.note_block.bass record @s[] ^-0.0 ^ ^ 0.680 0.56123 0.000
+playsound block.note_block.bass record @s[] ^-0.0 ^ ^ 0.600 0.56123 0.000
+playsound block.note_block.bell record @s[] ^-0.0 ^ ^ 0.600 0.74915 0.000
+playsound block.note_block.xylophone record @s[] ^-0.0 ^ ^ 0.900 0.74915 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.800 0.74915 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.500 0.74915 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.750 0.74915 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.500 0.56123 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.500 0.74915 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.500 0.94387 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.500 1.12246 0.000
+playsound entity_witch_hurt1 record @s[] ^0.6 ^ ^ 0.450 2.00000 0.000
+playsound dig_gravel1 record @s[] ^-0.25 ^ ^ 0.700 1.58740 0.000
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 0.400 1.68179 0.000
+playsound block.note_block.pling record @s[] ^-0.5 ^ ^ 0.700 1.49831 0.000
+playsound block.note_block.pling record @s[] ^0.5 ^ ^ 0.500 1.48110 0.000
+playsound block.note_block.bit record @s[] ^-0.5 ^ ^ 0.180 0.79370 0.000
+playsound block.note_block.bit record @s[] ^-0.5 ^ ^ 0.180 0.78458 0.000
+playsound block.note_block.bit record @s[] ^0.5 ^ ^ 0.550 1.00000 0.000
+playsound block.note_block.bit record @s[] ^0.5 ^ ^ 0.120 0.77111 0.000
+playsound block.note_block.bit record @s[] ^0.5 ^ ^ 0.120 0.76225 0.000
+playsound block.note_block.bit record @s[] ^-0.5 ^ ^ 0.500 0.97153 0.000
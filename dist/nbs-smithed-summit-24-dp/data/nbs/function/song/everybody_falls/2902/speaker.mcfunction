@@ -0,0 +1,22 @@
+playsound block.note_block.bass record @a[distance=..11.98] ^0.0 ^ ^ 0.680 0.56123 0.000
+playsound block.note_block.bass record @a[distance=..11.98] ^0.0 ^ ^ 0.600 0.56123 0.000
+playsound block.note_block.bell record @a[distance=..6.26] ^0.0 ^ ^ 0.600 0.74915 0.000
+playsound block.note_block.xylophone record @a[distance=..6.26] ^0.0 ^ ^ 0.900 0.74915 0.000
+playsound block.note_block.pling record @a[distance=..10.15] ^0.0 ^ ^ 0.800 0.74915 0.000
+playsound block.note_block.pling record @a[distance=..10.15] ^0.0 ^ ^ 0.500 0.74915 0.000
+playsound block.note_block.flute record @a[distance=..7.46] ^0.0 ^ ^ 0.750 0.74915 0.000
+playsound block.note_block.flute record @a[distance=..8.52] ^0.0 ^ ^ 0.500 0.56123 0.000
+playsound block.note_block.flute record @a[distance=..7.46] ^0.0 ^ ^ 0.500 0.74915 0.000
+playsound block.note_block.flute record @a[distance=..6.86] ^0.0 ^ ^ 0.500 0.94387 0.000
+playsound block.note_block.flute record @a[distance=..6.56] ^0.0 ^ ^ 0.500 1.12246 0.000
+playsound entity_witch_hurt1 record @a[distance=..6.12] ^-2.0 ^ ^ 0.450 2.00000 0.000
+playsound dig_gravel1 record @a[distance=..6.23] ^0.0 ^ ^ 0.700 1.58740 0.000
+playsound block.note_block.snare record @a[distance=..6.19] ^0.0 ^ ^ 0.400 1.68179 0.000
+playsound block.note_block.pling record @a[distance=..7.46] ^1.0 ^ ^ 0.700 1.49831 0.000
+playsound block.note_block.pling record @a[distance=..7.50] ^-1.0 ^ ^ 0.500 1.48110 0.000
+playsound block.note_block.bit record @a[distance=..9.94] ^1.0 ^ ^ 0.180 0.79370 0.000
+playsound block.note_block.bit record @a[distance=..9.98] ^1.0 ^ ^ 0.180 0.78458 0.000
+playsound block.note_block.bit record @a[distance=..9.00] ^-1.0 ^ ^ 0.550 1.00000 0.000
+playsound block.note_block.bit record @a[distance=..10.05] ^-1.0 ^ ^ 0.120 0.77111 0.000
+playsound block.note_block.bit record @a[distance=..10.09] ^-1.0 ^ ^ 0.120 0.76225 0.000
+playsound block.note_block.bit record @a[distance=..9.12] ^1.0 ^ ^ 0.500 0.97153 0.000
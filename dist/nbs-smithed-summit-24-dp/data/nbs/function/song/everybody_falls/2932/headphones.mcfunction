@@ -0,0 +1,9 @@
+playsound block.note_block.bass record @s[] ^-0.0 ^ ^ 0.680 0.56123 0.000
+playsound block.note_block.bass record @s[] ^-0.0 ^ ^ 0.600 0.56123 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.750 0.94387 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.500 0.62996 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.500 0.84090 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.500 1.00000 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.500 1.25992 0.000
+playsound block.note_block.pling record @s[] ^-0.5 ^ ^ 0.700 1.97703 0.000
+playsound block.note_block.pling record @s[] ^0.5 ^ ^ 0.500 1.95432 0.000
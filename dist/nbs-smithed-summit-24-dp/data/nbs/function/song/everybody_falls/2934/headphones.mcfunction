@@ -0,0 +1,16 @@
+playsound block.note_block.bass record @s[] ^-0.0 ^ ^ 0.680 0.56123 0.000
+playsound block.note_block.bass record @s[] ^-0.0 ^ ^ 0.600 0.56123 0.000
+playsound block.note_block.bell record @s[] ^-0.0 ^ ^ 0.600 1.49831 0.000
+playsound block.note_block.xylophone record @s[] ^-0.0 ^ ^ 0.900 1.49831 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.800 1.49831 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.500 1.49831 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.750 1.49831 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.500 0.62996 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.500 0.84090 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.500 1.00000 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.500 1.25992 0.000
+playsound entity_witch_hurt1 record @s[] ^0.6 ^ ^ 0.450 2.00000 0.000
+playsound dig_gravel1 record @s[] ^-0.25 ^ ^ 0.700 1.58740 0.000
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 0.400 1.68179 0.000
+playsound block.note_block.pling record @s[] ^-0.5 ^ ^ 0.700 1.95432 0.000
+playsound block.note_block.pling record @s[] ^0.5 ^ ^ 0.500 1.93187 0.000
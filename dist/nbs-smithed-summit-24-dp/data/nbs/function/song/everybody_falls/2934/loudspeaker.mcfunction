@@ -0,0 +1,16 @@
+playsound block.note_block.bass record @a[distance=..48.00] ^0.0 ^ ^ 2.012 0.56123 0.000
+playsound block.note_block.bass record @a[distance=..48.00] ^0.0 ^ ^ 1.776 0.56123 0.000
+playsound block.note_block.bell record @a[distance=..48.00] ^0.0 ^ ^ 1.249 1.49831 0.000
+playsound block.note_block.xylophone record @a[distance=..48.00] ^0.0 ^ ^ 1.873 1.49831 0.000
+playsound block.note_block.pling record @a[distance=..48.00] ^0.0 ^ ^ 1.924 1.49831 0.000
+playsound block.note_block.pling record @a[distance=..48.00] ^0.0 ^ ^ 1.203 1.49831 0.000
+playsound block.note_block.flute record @a[distance=..48.00] ^0.0 ^ ^ 1.682 1.49831 0.000
+playsound block.note_block.flute record @a[distance=..48.00] ^0.0 ^ ^ 1.223 0.62996 0.000
+playsound block.note_block.flute record @a[distance=..48.00] ^0.0 ^ ^ 1.189 0.84090 0.000
+playsound block.note_block.flute record @a[distance=..48.00] ^0.0 ^ ^ 1.169 1.00000 0.000
+playsound block.note_block.flute record @a[distance=..48.00] ^0.0 ^ ^ 1.142 1.25992 0.000
+playsound entity_witch_hurt1 record @a[distance=..48.00] ^-3.0 ^ ^ 0.979 2.00000 0.000
+playsound dig_gravel1 record @a[distance=..48.00] ^1.0 ^ ^ 1.561 1.58740 0.000
+playsound block.note_block.snare record @a[distance=..48.00] ^0.0 ^ ^ 0.886 1.68179 0.000
+playsound block.note_block.pling record @a[distance=..48.00] ^2.0 ^ ^ 1.640 1.95432 0.000
+playsound block.note_block.pling record @a[distance=..48.00] ^-2.0 ^ ^ 1.173 1.93187 0.000
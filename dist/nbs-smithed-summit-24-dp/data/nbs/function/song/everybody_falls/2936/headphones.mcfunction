@@ -0,0 +1,10 @@
+playsound block.note_block.bass record @s[] ^-0.0 ^ ^ 0.680 0.56123 0.000
+playsound block.note_block.bass record @s[] ^-0.0 ^ ^ 0.600 0.56123 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.750 1.49831 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.500 0.62996 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.500 0.84090 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.500 1.00000 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.500 1.25992 0.000
+playsound block.note_block.pling record @s[] ^-0.5 ^ ^ 0.700 1.93187 0.000
+playsound block.note_block.pling record @s[] ^0.5 ^ ^ 0.500 1.90968 0.000
+particle note ~ ~2.25 ~ 0 0 0 1 1
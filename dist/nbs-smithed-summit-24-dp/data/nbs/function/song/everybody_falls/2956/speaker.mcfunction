@@ -0,0 +1,10 @@
+playsound block.note_block.bass record @a[distance=..11.97] ^0.0 ^ ^ 0.680 0.62996 0.000
+playsound block.note_block.bass record @a[distance=..11.97] ^0.0 ^ ^ 0.600 0.62996 0.000
+playsound block.note_block.flute record @a[distance=..6.42] ^0.0 ^ ^ 0.750 1.25992 0.000
+playsound block.note_block.flute record @a[distance=..8.52] ^0.0 ^ ^ 0.500 0.56123 0.000
+playsound block.note_block.flute record @a[distance=..7.46] ^0.0 ^ ^ 0.500 0.74915 0.000
+playsound block.note_block.flute record @a[distance=..6.86] ^0.0 ^ ^ 0.500 0.94387 0.000
+playsound block.note_block.flute record @a[distance=..6.56] ^0.0 ^ ^ 0.500 1.12246 0.000
+playsound block.note_block.snare record @a[distance=..6.19] ^0.0 ^ ^ 0.400 1.68179 0.000
+playsound block.note_block.pling_1 record @a[distance=..6.42] ^1.0 ^ ^ 0.700 0.62996 0.000
+playsound block.note_block.pling_1 record @a[distance=..6.43] ^-1.0 ^ ^ 0.500 0.62272 0.000
@@ -0,0 +1,16 @@
+playsound block.note_block.bass record @a[distance=..11.97] ^0.0 ^ ^ 0.680 0.62996 0.000
+playsound block.note_block.bass record @a[distance=..11.97] ^0.0 ^ ^ 0.600 0.62996 0.000
+playsound block.note_block.bell record @a[distance=..6.09] ^0.0 ^ ^ 0.600 1.12246 0.000
+playsound block.note_block.xylophone record @a[distance=..6.09] ^0.0 ^ ^ 0.900 1.12246 0.000
+playsound block.note_block.pling record @a[distance=..8.52] ^0.0 ^ ^ 0.800 1.12246 0.000
+playsound block.note_block.pling record @a[distance=..8.52] ^0.0 ^ ^ 0.500 1.12246 0.000
+playsound block.note_block.flute record @a[distance=..6.56] ^0.0 ^ ^ 0.750 1.12246 0.000
+playsound block.note_block.flute record @a[distance=..8.52] ^0.0 ^ ^ 0.500 0.56123 0.000
+playsound block.note_block.flute record @a[distance=..7.46] ^0.0 ^ ^ 0.500 0.74915 0.000
+playsound block.note_block.flute record @a[distance=..6.86] ^0.0 ^ ^ 0.500 0.94387 0.000
+playsound block.note_block.flute record @a[distance=..6.56] ^0.0 ^ ^ 0.500 1.12246 0.000
+playsound entity_witch_hurt1 record @a[distance=..6.12] ^1.0 ^ ^ 0.450 2.00000 0.000
+playsound dig_gravel1 record @a[distance=..6.23] ^0.0 ^ ^ 0.700 1.58740 0.000
+playsound block.note_block.snare record @a[distance=..6.31] ^0.0 ^ ^ 0.400 1.41421 0.000
+playsound block.note_block.pling_1 record @a[distance=..6.31] ^1.0 ^ ^ 0.700 0.70711 0.000
+playsound block.note_block.pling_1 record @a[distance=..6.32] ^-1.0 ^ ^ 0.500 0.69898 0.000
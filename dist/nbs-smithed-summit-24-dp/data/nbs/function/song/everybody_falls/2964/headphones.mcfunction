@@ -0,0 +1,13 @@
+playsound block.note_block.bass record @s[] ^-0.0 ^ ^ 0.680 0.62996 0.000
+playsound block.note_block.bass record @s[] ^-0.0 ^ ^ 0.600 0.62996 0.000
+playsound block.note_block.bell record @s[] ^-0.0 ^ ^ 0.600 1.12246 0.000
+playsound block.note_block.xylophone record @s[] ^-0.0 ^ ^ 0.900 1.12246 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.800 1.12246 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.500 1.12246 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.750 1.12246 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.500 0.56123 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.500 0.74915 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.500 0.94387 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.500 1.12246 0.000
+playsound block.note_block.pling_1 record @s[] ^-0.5 ^ ^ 0.700 0.74915 0.000
+playsound block.note_block.pling_1 record @s[] ^0.5 ^ ^ 0.500 0.74055 0.000
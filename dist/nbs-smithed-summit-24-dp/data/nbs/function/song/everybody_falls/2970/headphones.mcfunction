@@ -0,0 +1,20 @@
+playsound block.note_block.bass record @s[] ^-0.0 ^ ^ 0.750 0.66742 0.000
+playsound block.note_block.bass record @s[] ^-0.0 ^ ^ 1.000 0.66742 0.000
+playsound block.note_block.bell record @s[] ^-0.0 ^ ^ 0.600 1.25992 0.000
+playsound block.note_block.xylophone record @s[] ^-0.0 ^ ^ 0.900 1.25992 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.800 1.25992 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.500 1.25992 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.750 1.25992 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.700 0.84090 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.700 1.00000 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.700 1.33484 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.700 1.68179 0.000
+playsound block.note_block.flute record @s[] ^0.1 ^ ^ 0.500 0.66742 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.500 0.84090 0.000
+playsound block.note_block.flute record @s[] ^0.1 ^ ^ 0.500 1.00000 0.000
+playsound block.note_block.flute record @s[] ^0.1 ^ ^ 0.500 1.33484 0.000
+playsound block.note_block.basedrum_-1 record @s[] ^-0.0 ^ ^ 1.000 1.88775 0.000
+playsound block.note_block.basedrum record @s[] ^-0.0 ^ ^ 0.680 0.94387 0.000
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 0.400 1.41421 0.000
+playsound block.note_block.pling_1 record @s[] ^-0.5 ^ ^ 0.700 0.70711 0.000
+playsound block.note_block.pling_1 record @s[] ^0.5 ^ ^ 0.500 0.69898 0.000
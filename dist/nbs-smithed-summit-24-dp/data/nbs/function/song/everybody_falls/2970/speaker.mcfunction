@@ -0,0 +1,20 @@
+playsound block.note_block.bass record @a[distance=..11.96] ^0.0 ^ ^ 0.750 0.66742 0.000
+playsound block.note_block.bass record @a[distance=..11.96] ^0.0 ^ ^ 1.000 0.66742 0.000
+playsound block.note_block.bell record @a[distance=..6.06] ^0.0 ^ ^ 0.600 1.25992 0.000
+playsound block.note_block.xylophone record @a[distance=..6.06] ^0.0 ^ ^ 0.900 1.25992 0.000
+playsound block.note_block.pling record @a[distance=..8.06] ^0.0 ^ ^ 0.800 1.25992 0.000
+playsound block.note_block.pling record @a[distance=..8.06] ^0.0 ^ ^ 0.500 1.25992 0.000
+playsound block.note_block.flute record @a[distance=..6.42] ^0.0 ^ ^ 0.750 1.25992 0.000
+playsound block.note_block.pling record @a[distance=..9.72] ^0.0 ^ ^ 0.700 0.84090 0.000
+playsound block.note_block.pling record @a[distance=..9.00] ^0.0 ^ ^ 0.700 1.00000 0.000
+playsound block.note_block.pling record @a[distance=..7.85] ^0.0 ^ ^ 0.700 1.33484 0.000
+playsound block.note_block.pling record @a[distance=..7.13] ^0.0 ^ ^ 0.700 1.68179 0.000
+playsound block.note_block.flute record @a[distance=..7.85] ^-1.0 ^ ^ 0.500 0.66742 0.000
+playsound block.note_block.flute record @a[distance=..7.13] ^0.0 ^ ^ 0.500 0.84090 0.000
+playsound block.note_block.flute record @a[distance=..6.75] ^-1.0 ^ ^ 0.500 1.00000 0.000
+playsound block.note_block.flute record @a[distance=..6.36] ^-1.0 ^ ^ 0.500 1.33484 0.000
+playsound block.note_block.basedrum_-1 record @a[distance=..11.90] ^0.0 ^ ^ 1.000 1.88775 0.000
+playsound block.note_block.basedrum record @a[distance=..11.35] ^0.0 ^ ^ 0.680 0.94387 0.000
+playsound block.note_block.snare record @a[distance=..6.31] ^0.0 ^ ^ 0.400 1.41421 0.000
+playsound block.note_block.pling_1 record @a[distance=..6.31] ^1.0 ^ ^ 0.700 0.70711 0.000
+playsound block.note_block.pling_1 record @a[distance=..6.32] ^-1.0 ^ ^ 0.500 0.69898 0.000
@@ -0,0 +1,7 @@
+playsound block.note_block.bell record @a[distance=..6.06] ^0.0 ^ ^ 0.600 1.25992 0.000
+playsound block.note_block.xylophone record @a[distance=..6.06] ^0.0 ^ ^ 0.900 1.25992 0.000
+playsound block.note_block.pling record @a[distance=..8.06] ^0.0 ^ ^ 0.800 1.25992 0.000
+playsound block.note_block.pling record @a[distance=..8.06] ^0.0 ^ ^ 0.500 1.25992 0.000
+playsound block.note_block.flute record @a[distance=..6.42] ^0.0 ^ ^ 0.750 1.25992 0.000
+playsound block.note_block.pling_1 record @a[distance=..6.42] ^1.0 ^ ^ 0.700 0.62996 0.000
+playsound block.note_block.pling_1 record @a[distance=..6.43] ^-1.0 ^ ^ 0.500 0.62272 0.000
@@ -0,0 +1,3 @@
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.750 1.25992 0.000
+playsound block.note_block.pling record @s[] ^-0.5 ^ ^ 0.700 1.58740 0.000
+playsound block.note_block.pling record @s[] ^0.5 ^ ^ 0.500 1.56917 0.000
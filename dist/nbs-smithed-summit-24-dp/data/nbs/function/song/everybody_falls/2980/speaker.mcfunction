@@ -0,0 +1,3 @@
+playsound block.note_block.flute record @a[distance=..6.42] ^0.0 ^ ^ 0.750 1.25992 0.000
+playsound block.note_block.pling record @a[distance=..7.29] ^1.0 ^ ^ 0.700 1.58740 0.000
+playsound block.note_block.pling record @a[distance=..7.32] ^-1.0 ^ ^ 0.500 1.56917 0.000
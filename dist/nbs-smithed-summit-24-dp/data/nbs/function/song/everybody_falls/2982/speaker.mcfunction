@@ -0,0 +1,21 @@
+playsound block.note_block.bass record @a[distance=..11.96] ^0.0 ^ ^ 0.750 0.66742 0.000
+playsound block.note_block.bass record @a[distance=..11.96] ^0.0 ^ ^ 1.000 0.66742 0.000
+playsound block.note_block.bell record @a[distance=..6.06] ^0.0 ^ ^ 0.600 1.25992 0.000
+playsound block.note_block.xylophone record @a[distance=..6.06] ^0.0 ^ ^ 0.900 1.25992 0.000
+playsound block.note_block.pling record @a[distance=..8.06] ^0.0 ^ ^ 0.800 1.25992 0.000
+playsound block.note_block.pling record @a[distance=..8.06] ^0.0 ^ ^ 0.500 1.25992 0.000
+playsound block.note_block.flute record @a[distance=..6.42] ^0.0 ^ ^ 0.750 1.25992 0.000
+playsound block.note_block.pling record @a[distance=..9.72] ^0.0 ^ ^ 0.700 0.84090 0.000
+playsound block.note_block.pling record @a[distance=..9.00] ^0.0 ^ ^ 0.700 1.00000 0.000
+playsound block.note_block.pling record @a[distance=..7.85] ^0.0 ^ ^ 0.700 1.33484 0.000
+playsound block.note_block.pling record @a[distance=..7.13] ^0.0 ^ ^ 0.700 1.68179 0.000
+playsound block.note_block.flute record @a[distance=..7.85] ^0.0 ^ ^ 0.500 0.66742 0.000
+playsound block.note_block.flute record @a[distance=..7.13] ^0.0 ^ ^ 0.500 0.84090 0.000
+playsound block.note_block.flute record @a[distance=..6.75] ^0.0 ^ ^ 0.500 1.00000 0.000
+playsound block.note_block.flute record @a[distance=..6.36] ^0.0 ^ ^ 0.500 1.33484 0.000
+playsound entity_witch_hurt1 record @a[distance=..6.12] ^-2.0 ^ ^ 0.450 2.00000 0.000
+playsound dig_gravel1 record @a[distance=..6.23] ^0.0 ^ ^ 0.700 1.58740 0.000
+playsound block.note_block.snare record @a[distance=..6.19] ^0.0 ^ ^ 0.400 1.68179 0.000
+playsound block.note_block.pling record @a[distance=..7.65] ^1.0 ^ ^ 0.700 1.41421 0.000
+playsound block.note_block.pling_1 record @a[distance=..6.31] ^-1.0 ^ ^ 0.400 0.70711 0.000
+playsound block.note_block.pling record @a[distance=..7.68] ^-1.0 ^ ^ 0.500 1.39797 0.000
@@ -0,0 +1,10 @@
+playsound block.note_block.bell record @s[] ^-0.0 ^ ^ 0.600 1.25992 0.000
+playsound block.note_block.xylophone record @s[] ^-0.0 ^ ^ 0.900 1.25992 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.800 1.25992 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.500 1.25992 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.750 1.25992 0.000
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 0.400 1.18921 0.000
+playsound block.note_block.pling record @s[] ^-0.5 ^ ^ 0.700 1.25992 0.000
+playsound block.note_block.pling_1 record @s[] ^0.5 ^ ^ 0.400 0.62996 0.000
+playsound block.note_block.pling record @s[] ^0.5 ^ ^ 0.500 1.24545 0.000
+particle note ~ ~2.25 ~ 0 0 0 1 1
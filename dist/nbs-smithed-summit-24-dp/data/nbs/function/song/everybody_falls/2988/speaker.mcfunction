@@ -0,0 +1,7 @@
+playsound block.note_block.flute record @a[distance=..6.42] ^0.0 ^ ^ 0.750 1.25992 0.000
+playsound block.note_block.pling_1 record @a[distance=..6.19] ^0.0 ^ ^ 0.700 0.84090 0.000
+playsound block.note_block.pling_1 record @a[distance=..6.19] ^0.0 ^ ^ 0.700 0.84090 0.000
+playsound block.note_block.snare record @a[distance=..6.19] ^0.0 ^ ^ 0.400 1.68179 0.000
+playsound block.note_block.pling_1 record @a[distance=..6.42] ^1.0 ^ ^ 0.700 0.62996 0.000
+playsound block.note_block.pling record @a[distance=..6.75] ^-1.0 ^ ^ 0.400 2.00000 0.000
+playsound block.note_block.pling_1 record @a[distance=..6.43] ^-1.0 ^ ^ 0.500 0.62272 0.000
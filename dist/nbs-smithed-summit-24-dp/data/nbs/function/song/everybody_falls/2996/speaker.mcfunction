@@ -0,0 +1,18 @@
+playsound block.note_block.bass record @a[distance=..11.93] ^0.0 ^ ^ 0.680 0.84090 0.000
+playsound block.note_block.bass record @a[distance=..11.93] ^0.0 ^ ^ 0.600 0.84090 0.000
+playsound block.note_block.bell record @a[distance=..6.09] ^0.0 ^ ^ 0.600 1.12246 0.000
+playsound block.note_block.xylophone record @a[distance=..6.09] ^0.0 ^ ^ 0.900 1.12246 0.000
+playsound block.note_block.pling record @a[distance=..8.52] ^0.0 ^ ^ 0.800 1.12246 0.000
+playsound block.note_block.pling record @a[distance=..8.52] ^0.0 ^ ^ 0.500 1.12246 0.000
+playsound block.note_block.flute record @a[distance=..6.56] ^0.0 ^ ^ 0.750 1.12246 0.000
+playsound block.note_block.pling record @a[distance=..6.75] ^0.0 ^ ^ 0.420 2.00000 0.000
+playsound block.note_block.pling_1 record @a[distance=..6.42] ^0.0 ^ ^ 0.420 0.62996 0.000
+playsound block.note_block.pling_1 record @a[distance=..6.19] ^0.0 ^ ^ 0.420 0.84090 0.000
+playsound block.note_block.pling_1 record @a[distance=..6.12] ^0.0 ^ ^ 0.420 1.00000 0.000
+playsound block.note_block.flute record @a[distance=..7.13] ^0.0 ^ ^ 0.500 0.84090 0.000
+playsound block.note_block.flute record @a[distance=..6.75] ^0.0 ^ ^ 0.500 1.00000 0.000
+playsound block.note_block.flute record @a[distance=..6.42] ^0.0 ^ ^ 0.500 1.25992 0.000
+playsound block.note_block.flute record @a[distance=..6.19] ^0.0 ^ ^ 0.500 1.68179 0.000
+playsound block.note_block.pling_1 record @a[distance=..6.42] ^1.0 ^ ^ 0.700 0.62996 0.000
+playsound block.note_block.pling record @a[distance=..8.06] ^-1.0 ^ ^ 0.400 1.25992 0.000
+playsound block.note_block.pling_1 record @a[distance=..6.43] ^-1.0 ^ ^ 0.500 0.62272 0.000
@@ -0,0 +1,4 @@
+playsound block.note_block.chime_1 record @a[distance=..48.00] ^0.0 ^ ^ 0.182 0.59460 0.000
+playsound block.note_block.chime_1 record @a[distance=..48.00] ^0.0 ^ ^ 0.061 0.52973 0.000
+playsound block.note_block.chime_1 record @a[distance=..48.00] ^0.0 ^ ^ 0.585 0.52973 0.000
+playsound block.note_block.chime_1 record @a[distance=..48.00] ^0.0 ^ ^ 0.179 0.56123 0.000
@@ -0,0 +1,20 @@
+playsound block.note_block.bass record @a[distance=..11.98] ^0.0 ^ ^ 0.750 0.50000 0.000
+playsound block.note_block.bass record @a[distance=..11.98] ^0.0 ^ ^ 1.000 0.50000 0.000
+playsound block.note_block.bell record @a[distance=..6.04] ^0.0 ^ ^ 0.600 1.49831 0.000
+playsound block.note_block.xylophone record @a[distance=..6.04] ^0.0 ^ ^ 0.900 1.49831 0.000
+playsound block.note_block.pling record @a[distance=..7.46] ^0.0 ^ ^ 0.800 1.49831 0.000
+playsound block.note_block.pling record @a[distance=..7.46] ^0.0 ^ ^ 0.500 1.49831 0.000
+playsound block.note_block.flute record @a[distance=..6.26] ^0.0 ^ ^ 0.750 1.49831 0.000
+playsound block.note_block.pling record @a[distance=..7.29] ^0.0 ^ ^ 0.700 1.58740 0.000
+playsound block.note_block.pling record @a[distance=..6.75] ^0.0 ^ ^ 0.700 2.00000 0.000
+playsound block.note_block.pling_1 record @a[distance=..6.48] ^0.0 ^ ^ 0.700 0.59460 0.000
+playsound block.note_block.pling_1 record @a[distance=..6.23] ^0.0 ^ ^ 0.700 0.79370 0.000
+playsound block.note_block.flute record @a[distance=..8.28] ^0.0 ^ ^ 0.500 0.59460 0.000
+playsound block.note_block.flute record @a[distance=..7.29] ^0.0 ^ ^ 0.500 0.79370 0.000
+playsound block.note_block.flute record @a[distance=..6.75] ^0.0 ^ ^ 0.500 1.00000 0.000
+playsound block.note_block.flute record @a[distance=..6.48] ^0.0 ^ ^ 0.500 1.18921 0.000
+playsound entity_witch_hurt1 record @a[distance=..6.12] ^-2.0 ^ ^ 0.450 2.00000 0.000
+playsound dig_gravel1 record @a[distance=..6.23] ^0.0 ^ ^ 0.700 1.58740 0.000
+playsound block.note_block.snare record @a[distance=..6.19] ^0.0 ^ ^ 0.400 1.68179 0.000
+playsound block.note_block.pling_1 record @a[distance=..6.42] ^1.0 ^ ^ 0.700 0.62633 0.000
+playsound block.note_block.pling_1 record @a[distance=..6.44] ^-1.0 ^ ^ 0.500 0.61914 0.000
@@ -0,0 +1,15 @@
+playsound block.note_block.bass record @a[distance=..11.96] ^0.0 ^ ^ 0.680 0.66742 0.000
+playsound block.note_block.bass record @a[distance=..11.96] ^0.0 ^ ^ 0.600 0.66742 0.000
+playsound block.note_block.bell record @a[distance=..6.12] ^0.0 ^ ^ 0.600 1.00000 0.000
+playsound block.note_block.xylophone record @a[distance=..6.12] ^0.0 ^ ^ 0.900 1.00000 0.000
+playsound block.note_block.pling record @a[distance=..9.00] ^0.0 ^ ^ 0.800 1.00000 0.000
+playsound block.note_block.pling record @a[distance=..9.00] ^0.0 ^ ^ 0.500 1.00000 0.000
+playsound block.note_block.flute record @a[distance=..6.75] ^0.0 ^ ^ 0.750 1.00000 0.000
+playsound block.note_block.flute record @a[distance=..9.00] ^0.0 ^ ^ 0.500 0.50000 0.000
+playsound block.note_block.flute record @a[distance=..7.85] ^0.0 ^ ^ 0.500 0.66742 0.000
+playsound block.note_block.flute record @a[distance=..7.13] ^0.0 ^ ^ 0.500 0.84090 0.000
+playsound block.note_block.flute record @a[distance=..6.75] ^0.0 ^ ^ 0.500 1.00000 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.10] ^1.0 ^ ^ 1.000 1.05946 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.11] ^1.0 ^ ^ 1.000 1.04729 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.11] ^-1.0 ^ ^ 1.000 1.02930 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.11] ^-1.0 ^ ^ 1.000 1.01748 0.000
@@ -0,0 +1,7 @@
+playsound block.note_block.flute record @a[distance=..6.75] ^0.0 ^ ^ 0.750 1.00000 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.19] ^1.0 ^ ^ 1.000 0.84090 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.20] ^1.0 ^ ^ 1.000 0.83124 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.10] ^-1.0 ^ ^ 1.000 1.05946 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.21] ^-1.0 ^ ^ 1.000 0.81696 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.22] ^-1.0 ^ ^ 1.000 0.80757 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.11] ^1.0 ^ ^ 1.000 1.02930 0.000
@@ -0,0 +1,14 @@
+playsound block.note_block.bell record @a[distance=..6.12] ^0.0 ^ ^ 0.600 1.00000 0.000
+playsound block.note_block.xylophone record @a[distance=..6.12] ^0.0 ^ ^ 0.900 1.00000 0.000
+playsound block.note_block.pling record @a[distance=..9.00] ^0.0 ^ ^ 0.800 1.00000 0.000
+playsound block.note_block.pling record @a[distance=..9.00] ^0.0 ^ ^ 0.500 1.00000 0.000
+playsound block.note_block.flute record @a[distance=..6.75] ^0.0 ^ ^ 0.750 1.00000 0.000
+playsound entity_witch_hurt1 record @a[distance=..6.12] ^-2.0 ^ ^ 0.450 2.00000 0.000
+playsound dig_gravel1 record @a[distance=..6.23] ^0.0 ^ ^ 0.700 1.58740 0.000
+playsound block.note_block.snare record @a[distance=..6.19] ^0.0 ^ ^ 0.400 1.68179 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.23] ^1.0 ^ ^ 1.000 0.79370 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.23] ^1.0 ^ ^ 1.000 0.78458 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.12] ^-1.0 ^ ^ 1.000 1.00000 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.24] ^-1.0 ^ ^ 1.000 0.77111 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.25] ^-1.0 ^ ^ 1.000 0.76225 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.13] ^1.0 ^ ^ 1.000 0.97153 0.000
@@ -0,0 +1,8 @@
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.750 1.00000 0.000
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 0.400 1.68179 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.5 ^ ^ 1.000 0.66742 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.5 ^ ^ 1.000 0.65975 0.000
+playsound block.note_block.bit_1 record @s[] ^0.5 ^ ^ 1.000 0.84090 0.000
+playsound block.note_block.bit_1 record @s[] ^0.5 ^ ^ 1.000 0.64842 0.000
+playsound block.note_block.bit_1 record @s[] ^0.5 ^ ^ 1.000 0.64097 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.5 ^ ^ 1.000 0.81696 0.000
@@ -0,0 +1,19 @@
+playsound block.note_block.bass record @a[distance=..11.93] ^0.0 ^ ^ 0.680 0.84090 0.000
+playsound block.note_block.bass record @a[distance=..11.93] ^0.0 ^ ^ 0.600 0.84090 0.000
+playsound block.note_block.bell record @a[distance=..6.42] ^0.0 ^ ^ 0.600 0.62996 0.000
+playsound block.note_block.xylophone record @a[distance=..6.42] ^0.0 ^ ^ 0.900 0.62996 0.000
+playsound block.note_block.pling record @a[distance=..10.71] ^0.0 ^ ^ 0.800 0.62996 0.000
+playsound block.note_block.pling record @a[distance=..10.71] ^0.0 ^ ^ 0.500 0.62996 0.000
+playsound block.note_block.flute record @a[distance=..8.06] ^0.0 ^ ^ 0.750 0.62996 0.000
+playsound block.note_block.flute record @a[distance=..8.06] ^0.0 ^ ^ 0.500 0.62996 0.000
+playsound block.note_block.flute record @a[distance=..7.13] ^0.0 ^ ^ 0.500 0.84090 0.000
+playsound block.note_block.flute record @a[distance=..6.75] ^0.0 ^ ^ 0.500 1.00000 0.000
+playsound block.note_block.flute record @a[distance=..6.42] ^0.0 ^ ^ 0.500 1.25992 0.000
+playsound block.note_block.pling record @a[distance=..7.46] ^1.0 ^ ^ 0.308 1.49831 0.000
+playsound block.note_block.pling record @a[distance=..7.50] ^-1.0 ^ ^ 0.220 1.48110 0.000
+playsound block.note_block.bit record @a[distance=..7.13] ^1.0 ^ ^ 1.000 1.68179 0.000
+playsound block.note_block.bit record @a[distance=..7.16] ^1.0 ^ ^ 1.000 1.66248 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.65] ^-1.0 ^ ^ 1.000 0.52973 0.000
+playsound block.note_block.bit record @a[distance=..7.21] ^-1.0 ^ ^ 1.000 1.63392 0.000
+playsound block.note_block.bit record @a[distance=..7.24] ^-1.0 ^ ^ 1.000 1.61515 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.70] ^1.0 ^ ^ 1.000 0.51465 0.000
@@ -0,0 +1,22 @@
+playsound block.note_block.bass record @a[distance=..11.93] ^0.0 ^ ^ 0.680 0.84090 0.000
+playsound block.note_block.bass record @a[distance=..11.93] ^0.0 ^ ^ 0.600 0.84090 0.000
+playsound block.note_block.bell record @a[distance=..6.42] ^0.0 ^ ^ 0.600 0.62996 0.000
+playsound block.note_block.xylophone record @a[distance=..6.42] ^0.0 ^ ^ 0.900 0.62996 0.000
+playsound block.note_block.pling record @a[distance=..10.71] ^0.0 ^ ^ 0.800 0.62996 0.000
+playsound block.note_block.pling record @a[distance=..10.71] ^0.0 ^ ^ 0.500 0.62996 0.000
+playsound block.note_block.flute record @a[distance=..8.06] ^0.0 ^ ^ 0.750 0.62996 0.000
+playsound block.note_block.flute record @a[distance=..8.06] ^0.0 ^ ^ 0.500 0.62996 0.000
+playsound block.note_block.flute record @a[distance=..7.13] ^0.0 ^ ^ 0.500 0.84090 0.000
+playsound block.note_block.flute record @a[distance=..6.75] ^0.0 ^ ^ 0.500 1.00000 0.000
+playsound block.note_block.flute record @a[distance=..6.42] ^0.0 ^ ^ 0.500 1.25992 0.000
+playsound entity_witch_hurt1 record @a[distance=..6.12] ^1.0 ^ ^ 0.450 2.00000 0.000
+playsound dig_gravel1 record @a[distance=..6.23] ^0.0 ^ ^ 0.700 1.58740 0.000
+playsound block.note_block.snare record @a[distance=..6.48] ^0.0 ^ ^ 0.400 1.18921 0.000
+playsound block.note_block.pling record @a[distance=..7.46] ^1.0 ^ ^ 0.462 1.49831 0.000
+playsound block.note_block.pling record @a[distance=..7.50] ^-1.0 ^ ^ 0.330 1.48110 0.000
+playsound block.note_block.bit record @a[distance=..7.29] ^1.0 ^ ^ 1.000 1.58740 0.000
+playsound block.note_block.bit record @a[distance=..7.32] ^1.0 ^ ^ 1.000 1.56917 0.000
+playsound block.note_block.bit record @a[distance=..6.75] ^-1.0 ^ ^ 1.000 2.00000 0.000
+playsound block.note_block.bit record @a[distance=..7.37] ^-1.0 ^ ^ 1.000 1.54221 0.000
+playsound block.note_block.bit record @a[distance=..7.41] ^-1.0 ^ ^ 1.000 1.52450 0.000
+playsound block.note_block.bit record @a[distance=..6.80] ^1.0 ^ ^ 1.000 1.94306 0.000
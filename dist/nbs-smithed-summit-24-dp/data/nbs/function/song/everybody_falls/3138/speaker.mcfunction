@@ -0,0 +1,25 @@
+playsound block.note_block.bass record @a[distance=..11.93] ^0.0 ^ ^ 0.680 0.84090 0.000
+playsound block.note_block.bass record @a[distance=..11.93] ^0.0 ^ ^ 0.600 0.84090 0.000
+playsound block.note_block.bell record @a[distance=..6.42] ^0.0 ^ ^ 0.600 0.62996 0.000
+playsound block.note_block.xylophone record @a[distance=..6.42] ^0.0 ^ ^ 0.900 0.62996 0.000
+playsound block.note_block.pling record @a[distance=..10.71] ^0.0 ^ ^ 0.800 0.62996 0.000
+playsound block.note_block.pling record @a[distance=..10.71] ^0.0 ^ ^ 0.500 0.62996 0.000
+playsound block.note_block.flute record @a[distance=..8.06] ^0.0 ^ ^ 0.750 0.62996 0.000
+playsound block.note_block.flute record @a[distance=..8.06] ^0.0 ^ ^ 0.500 0.62996 0.000
+playsound block.note_block.flute record @a[distance=..7.13] ^0.0 ^ ^ 0.500 0.84090 0.000
+playsound block.note_block.flute record @a[distance=..6.75] ^0.0 ^ ^ 0.500 1.00000 0.000
+playsound block.note_block.flute record @a[distance=..6.42] ^0.0 ^ ^ 0.500 1.25992 0.000
+playsound block.note_block.basedrum_-1 record @a[distance=..11.90] ^0.0 ^ ^ 1.000 1.88775 0.000
+playsound block.note_block.basedrum record @a[distance=..11.35] ^0.0 ^ ^ 0.680 0.94387 0.000
+playsound block.note_block.snare record @a[distance=..9.00] ^0.0 ^ ^ 0.800 0.50000 0.000
+playsound block.note_block.snare record @a[distance=..6.75] ^1.0 ^ ^ 0.800 1.00000 0.000
+playsound random_wood_click record @a[distance=..6.75] ^-2.0 ^ ^ 0.800 1.00000 0.000
+playsound block.note_block.snare record @a[distance=..6.12] ^0.0 ^ ^ 0.400 2.00000 0.000
+playsound block.note_block.pling record @a[distance=..7.46] ^1.0 ^ ^ 0.700 1.49831 0.000
+playsound block.note_block.pling record @a[distance=..7.50] ^-1.0 ^ ^ 0.500 1.48110 0.000
+playsound block.note_block.bit record @a[distance=..7.65] ^1.0 ^ ^ 1.000 1.41421 0.000
+playsound block.note_block.bit record @a[distance=..7.68] ^1.0 ^ ^ 1.000 1.39797 0.000
+playsound block.note_block.bit record @a[distance=..6.99] ^-1.0 ^ ^ 1.000 1.78180 0.000
+playsound block.note_block.bit record @a[distance=..7.74] ^-1.0 ^ ^ 1.000 1.37395 0.000
+playsound block.note_block.bit record @a[distance=..7.78] ^-1.0 ^ ^ 1.000 1.35817 0.000
+playsound block.note_block.bit record @a[distance=..7.06] ^1.0 ^ ^ 1.000 1.73107 0.000
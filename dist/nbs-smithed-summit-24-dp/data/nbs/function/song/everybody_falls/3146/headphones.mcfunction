@@ -0,0 +1,26 @@
+playsound block.note_block.bass record @s[] ^-0.0 ^ ^ 0.750 0.56123 0.000
+playsound block.note_block.bass record @s[] ^-0.0 ^ ^ 1.000 0.56123 0.000
+playsound block.note_block.bell record @s[] ^-0.0 ^ ^ 0.600 0.62996 0.000
+playsound block.note_block.xylophone record @s[] ^-0.0 ^ ^ 0.900 0.62996 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.800 0.62996 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.500 0.62996 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.750 0.62996 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.700 0.74915 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.700 0.94387 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.700 1.12246 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.700 1.49831 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.500 0.56123 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.500 0.74915 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.500 0.94387 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.500 1.12246 0.000
+playsound block.note_block.basedrum_-1 record @s[] ^-0.0 ^ ^ 1.000 1.88775 0.000
+playsound block.note_block.basedrum record @s[] ^-0.0 ^ ^ 0.680 0.94387 0.000
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 0.400 2.00000 0.000
+playsound block.note_block.pling record @s[] ^-0.5 ^ ^ 0.700 1.49831 0.000
+playsound block.note_block.pling record @s[] ^0.5 ^ ^ 0.500 1.48110 0.000
+playsound block.note_block.bit record @s[] ^-0.5 ^ ^ 0.930 1.12246 0.000
+playsound block.note_block.bit record @s[] ^-0.5 ^ ^ 0.930 1.10957 0.000
+playsound block.note_block.bit record @s[] ^0.5 ^ ^ 1.000 1.41421 0.000
+playsound block.note_block.bit record @s[] ^0.5 ^ ^ 0.870 1.09051 0.000
+playsound block.note_block.bit record @s[] ^0.5 ^ ^ 0.870 1.07798 0.000
+playsound block.note_block.bit record @s[] ^-0.5 ^ ^ 1.000 1.37395 0.000
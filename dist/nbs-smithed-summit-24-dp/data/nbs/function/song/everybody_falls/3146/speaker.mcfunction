@@ -0,0 +1,26 @@
+playsound block.note_block.bass record @a[distance=..11.98] ^0.0 ^ ^ 0.750 0.56123 0.000
+playsound block.note_block.bass record @a[distance=..11.98] ^0.0 ^ ^ 1.000 0.56123 0.000
+playsound block.note_block.bell record @a[distance=..6.42] ^0.0 ^ ^ 0.600 0.62996 0.000
+playsound block.note_block.xylophone record @a[distance=..6.42] ^0.0 ^ ^ 0.900 0.62996 0.000
+playsound block.note_block.pling record @a[distance=..10.71] ^0.0 ^ ^ 0.800 0.62996 0.000
+playsound block.note_block.pling record @a[distance=..10.71] ^0.0 ^ ^ 0.500 0.62996 0.000
+playsound block.note_block.flute record @a[distance=..8.06] ^0.0 ^ ^ 0.750 0.62996 0.000
+playsound block.note_block.pling record @a[distance=..10.15] ^0.0 ^ ^ 0.700 0.74915 0.000
+playsound block.note_block.pling record @a[distance=..9.24] ^0.0 ^ ^ 0.700 0.94387 0.000
+playsound block.note_block.pling record @a[distance=..8.52] ^0.0 ^ ^ 0.700 1.12246 0.000
+playsound block.note_block.pling record @a[distance=..7.46] ^0.0 ^ ^ 0.700 1.49831 0.000
+playsound block.note_block.flute record @a[distance=..8.52] ^0.0 ^ ^ 0.500 0.56123 0.000
+playsound block.note_block.flute record @a[distance=..7.46] ^0.0 ^ ^ 0.500 0.74915 0.000
+playsound block.note_block.flute record @a[distance=..6.86] ^0.0 ^ ^ 0.500 0.94387 0.000
+playsound block.note_block.flute record @a[distance=..6.56] ^0.0 ^ ^ 0.500 1.12246 0.000
+playsound block.note_block.basedrum_-1 record @a[distance=..11.90] ^0.0 ^ ^ 1.000 1.88775 0.000
+playsound block.note_block.basedrum record @a[distance=..11.35] ^0.0 ^ ^ 0.680 0.94387 0.000
+playsound block.note_block.snare record @a[distance=..6.12] ^0.0 ^ ^ 0.400 2.00000 0.000
+playsound block.note_block.pling record @a[distance=..7.46] ^1.0 ^ ^ 0.700 1.49831 0.000
+playsound block.note_block.pling record @a[distance=..7.50] ^-1.0 ^ ^ 0.500 1.48110 0.000
+playsound block.note_block.bit record @a[distance=..8.52] ^1.0 ^ ^ 0.930 1.12246 0.000
+playsound block.note_block.bit record @a[distance=..8.57] ^1.0 ^ ^ 0.930 1.10957 0.000
+playsound block.note_block.bit record @a[distance=..7.65] ^-1.0 ^ ^ 1.000 1.41421 0.000
+playsound block.note_block.bit record @a[distance=..8.64] ^-1.0 ^ ^ 0.870 1.09051 0.000
+playsound block.note_block.bit record @a[distance=..8.68] ^-1.0 ^ ^ 0.870 1.07798 0.000
+playsound block.note_block.bit record @a[distance=..7.74] ^1.0 ^ ^ 1.000 1.37395 0.000
@@ -0,0 +1,16 @@
+playsound block.note_block.bass record @a[distance=..11.98] ^0.0 ^ ^ 0.680 0.56123 0.000
+playsound block.note_block.bass record @a[distance=..11.98] ^0.0 ^ ^ 0.600 0.56123 0.000
+playsound block.note_block.flute record @a[distance=..8.06] ^0.0 ^ ^ 0.750 0.62996 0.000
+playsound block.note_block.flute record @a[distance=..8.52] ^0.0 ^ ^ 0.500 0.56123 0.000
+playsound block.note_block.flute record @a[distance=..7.46] ^0.0 ^ ^ 0.500 0.74915 0.000
+playsound block.note_block.flute record @a[distance=..6.86] ^0.0 ^ ^ 0.500 0.94387 0.000
+playsound block.note_block.flute record @a[distance=..6.56] ^0.0 ^ ^ 0.500 1.12246 0.000
+playsound block.note_block.snare record @a[distance=..6.19] ^0.0 ^ ^ 0.400 1.68179 0.000
+playsound block.note_block.pling record @a[distance=..7.46] ^1.0 ^ ^ 0.700 1.49831 0.000
+playsound block.note_block.pling record @a[distance=..7.50] ^-1.0 ^ ^ 0.500 1.48110 0.000
+playsound block.note_block.bit record @a[distance=..8.76] ^1.0 ^ ^ 0.810 1.05946 0.000
+playsound block.note_block.bit record @a[distance=..8.81] ^1.0 ^ ^ 0.810 1.04729 0.000
+playsound block.note_block.bit record @a[distance=..7.85] ^-1.0 ^ ^ 1.000 1.33484 0.000
+playsound block.note_block.bit record @a[distance=..8.88] ^-1.0 ^ ^ 0.750 1.02930 0.000
+playsound block.note_block.bit record @a[distance=..8.93] ^-1.0 ^ ^ 0.750 1.01748 0.000
+playsound block.note_block.bit record @a[distance=..7.95] ^1.0 ^ ^ 1.000 1.29684 0.000
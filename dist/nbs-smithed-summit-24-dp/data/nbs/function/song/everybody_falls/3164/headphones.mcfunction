@@ -0,0 +1,9 @@
+playsound block.note_block.bell record @s[] ^-0.0 ^ ^ 0.600 1.00000 0.000
+playsound block.note_block.xylophone record @s[] ^-0.0 ^ ^ 0.900 1.00000 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.800 1.00000 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.500 1.00000 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.750 1.00000 0.000
+playsound block.note_block.pling record @s[] ^-0.5 ^ ^ 0.700 1.63392 0.000
+playsound block.note_block.pling record @s[] ^0.5 ^ ^ 0.500 1.61515 0.000
+playsound block.note_block.bit record @s[] ^0.5 ^ ^ 0.250 0.84090 0.000
+playsound block.note_block.bit record @s[] ^-0.5 ^ ^ 0.200 0.81696 0.000
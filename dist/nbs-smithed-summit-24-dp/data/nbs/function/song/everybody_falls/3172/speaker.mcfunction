@@ -0,0 +1,3 @@
+playsound block.note_block.flute record @a[distance=..6.75] ^0.0 ^ ^ 0.750 1.00000 0.000
+playsound block.note_block.pling record @a[distance=..6.75] ^1.0 ^ ^ 0.700 2.00000 0.000
+playsound block.note_block.pling record @a[distance=..6.77] ^-1.0 ^ ^ 0.500 1.97703 0.000
@@ -0,0 +1,8 @@
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.120 0.50000 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.180 0.62996 0.000
+playsound block.note_block.chime record @s[] ^-0.0 ^ ^ 0.079 2.00000 0.000
+playsound block.note_block.chime_1 record @s[] ^-0.0 ^ ^ 0.038 0.74915 0.000
+playsound block.note_block.chime record @s[] ^-0.0 ^ ^ 0.247 1.88775 0.000
+playsound block.note_block.chime record @s[] ^-0.0 ^ ^ 0.110 1.49831 0.000
+playsound block.note_block.chime record @s[] ^-0.0 ^ ^ 0.110 1.68179 0.000
+particle note ~ ~2.25 ~ 0 0 0 1 1
@@ -0,0 +1,9 @@
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.700 0.62996 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.700 0.50000 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.175 1.25992 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.175 1.00000 0.000
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 0.200 1.25992 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.5 ^ ^ 1.000 1.05946 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.5 ^ ^ 1.000 1.04729 0.000
+playsound block.note_block.bit_1 record @s[] ^0.5 ^ ^ 1.000 1.02930 0.000
+playsound block.note_block.bit_1 record @s[] ^0.5 ^ ^ 1.000 1.01748 0.000
@@ -0,0 +1,10 @@
+playsound block.note_block.pling record @a[distance=..10.71] ^0.0 ^ ^ 0.700 0.62996 0.000
+playsound block.note_block.pling record @a[distance=..11.25] ^0.0 ^ ^ 0.700 0.50000 0.000
+playsound block.note_block.pling record @a[distance=..8.06] ^0.0 ^ ^ 0.175 1.25992 0.000
+playsound block.note_block.pling record @a[distance=..9.00] ^0.0 ^ ^ 0.175 1.00000 0.000
+playsound dig_gravel1 record @a[distance=..6.23] ^0.0 ^ ^ 0.700 1.58740 0.000
+playsound block.note_block.snare record @a[distance=..6.42] ^0.0 ^ ^ 0.200 1.25992 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.12] ^1.0 ^ ^ 1.000 1.00000 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.12] ^1.0 ^ ^ 1.000 0.98851 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.13] ^-1.0 ^ ^ 1.000 0.97153 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.13] ^-1.0 ^ ^ 1.000 0.96037 0.000
@@ -0,0 +1,10 @@
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.700 0.62996 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.700 0.50000 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.175 1.25992 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.175 1.00000 0.000
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 0.200 1.25992 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.5 ^ ^ 1.000 0.94387 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.5 ^ ^ 1.000 0.93303 0.000
+particle note ~ ~2.25 ~ 0 0 0 1 1
+playsound block.note_block.bit_1 record @s[] ^0.5 ^ ^ 1.000 0.91700 0.000
+playsound block.note_block.bit_1 record @s[] ^0.5 ^ ^ 1.000 0.90647 0.000
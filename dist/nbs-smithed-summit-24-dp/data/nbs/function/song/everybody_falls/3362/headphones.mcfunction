@@ -0,0 +1,15 @@
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.700 0.62996 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.700 0.50000 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.175 1.25992 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.175 1.00000 0.000
+playsound block.note_block.basedrum record @s[] ^-0.0 ^ ^ 1.000 0.50000 0.000
+playsound block.note_block.basedrum record @s[] ^-0.0 ^ ^ 0.680 1.00000 0.000
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 0.800 0.50000 0.000
+playsound block.note_block.snare record @s[] ^-0.6 ^ ^ 0.800 1.00000 0.000
+playsound random_wood_click record @s[] ^0.6 ^ ^ 0.800 1.00000 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.5 ^ ^ 1.000 0.89090 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.5 ^ ^ 1.000 0.88067 0.000
+playsound block.note_block.bit_1 record @s[] ^0.5 ^ ^ 1.000 1.12246 0.000
+playsound block.note_block.bit_1 record @s[] ^0.5 ^ ^ 1.000 0.86554 0.000
+playsound block.note_block.bit_1 record @s[] ^0.5 ^ ^ 1.000 0.85560 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.5 ^ ^ 1.000 1.09051 0.000
@@ -0,0 +1,7 @@
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 0.200 1.25992 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.5 ^ ^ 1.000 0.84090 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.5 ^ ^ 1.000 0.83124 0.000
+playsound block.note_block.bit_1 record @s[] ^0.5 ^ ^ 1.000 1.05946 0.000
+playsound block.note_block.bit_1 record @s[] ^0.5 ^ ^ 1.000 0.81696 0.000
+playsound block.note_block.bit_1 record @s[] ^0.5 ^ ^ 1.000 0.80757 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.5 ^ ^ 1.000 1.02930 0.000
@@ -0,0 +1,12 @@
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.700 0.56123 0.000
+playsound block.note_block.pling_-1 record @s[] ^-0.0 ^ ^ 0.700 1.78180 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.175 1.12246 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.175 0.89090 0.000
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 0.200 1.25992 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.5 ^ ^ 1.000 0.59460 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.5 ^ ^ 1.000 0.58777 0.000
+playsound block.note_block.bit_1 record @s[] ^0.5 ^ ^ 1.000 0.74915 0.000
+particle note ~ ~2.25 ~ 0 0 0 1 1
+playsound block.note_block.bit_1 record @s[] ^0.5 ^ ^ 1.000 0.57768 0.000
+playsound block.note_block.bit_1 record @s[] ^0.5 ^ ^ 1.000 0.57104 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.5 ^ ^ 1.000 0.72783 0.000
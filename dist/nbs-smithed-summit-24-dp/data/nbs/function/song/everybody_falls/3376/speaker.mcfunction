@@ -0,0 +1,16 @@
+playsound block.note_block.pling record @a[distance=..11.01] ^0.0 ^ ^ 0.700 0.56123 0.000
+playsound block.note_block.pling_-1 record @a[distance=..11.44] ^0.0 ^ ^ 0.700 1.78180 0.000
+playsound block.note_block.pling record @a[distance=..8.52] ^0.0 ^ ^ 0.175 1.12246 0.000
+playsound block.note_block.pling record @a[distance=..9.48] ^0.0 ^ ^ 0.175 0.89090 0.000
+playsound block.note_block.snare record @a[distance=..6.42] ^0.0 ^ ^ 0.200 1.25992 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.48] ^1.0 ^ ^ 1.000 0.59460 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.50] ^1.0 ^ ^ 1.000 0.58777 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.26] ^-1.0 ^ ^ 1.000 0.74915 0.000
+execute store result score #random nbs run random value 1..4
+execute if score #random nbs matches 1 if entity @a[distance=0..12] run function animated_java:music_speaker/animations/animation_speaker_beat_1/play
+execute if score #random nbs matches 2 if entity @a[distance=0..12] run function animated_java:music_speaker/animations/animation_speaker_beat_2/play
+execute if score #random nbs matches 3 if entity @a[distance=0..12] run function animated_java:music_speaker/animations/animation_speaker_beat_3/play
+execute if score #random nbs matches 4 if entity @a[distance=0..12] run function animated_java:music_speaker/animations/animation_speaker_beat_4/play
+playsound block.note_block.bit_1 record @a[distance=..6.52] ^-1.0 ^ ^ 1.000 0.57768 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.54] ^-1.0 ^ ^ 1.000 0.57104 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.28] ^1.0 ^ ^ 1.000 0.72783 0.000
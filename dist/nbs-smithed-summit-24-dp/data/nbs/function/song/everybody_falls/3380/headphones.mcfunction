@@ -0,0 +1,11 @@
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.700 0.56123 0.000
+playsound block.note_block.pling_-1 record @s[] ^-0.0 ^ ^ 0.700 1.78180 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.175 1.12246 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.175 0.89090 0.000
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 0.200 1.25992 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.5 ^ ^ 1.000 0.52973 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.5 ^ ^ 1.000 0.52365 0.000
+playsound block.note_block.bit_1 record @s[] ^0.5 ^ ^ 1.000 0.66742 0.000
+playsound block.note_block.bit_1 record @s[] ^0.5 ^ ^ 1.000 0.51465 0.000
+playsound block.note_block.bit_1 record @s[] ^0.5 ^ ^ 1.000 0.50874 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.5 ^ ^ 1.000 0.64842 0.000
@@ -0,0 +1,11 @@
+playsound block.note_block.pling record @a[distance=..11.01] ^0.0 ^ ^ 0.700 0.56123 0.000
+playsound block.note_block.pling_-1 record @a[distance=..11.44] ^0.0 ^ ^ 0.700 1.78180 0.000
+playsound block.note_block.pling record @a[distance=..8.52] ^0.0 ^ ^ 0.175 1.12246 0.000
+playsound block.note_block.pling record @a[distance=..9.48] ^0.0 ^ ^ 0.175 0.89090 0.000
+playsound block.note_block.snare record @a[distance=..6.42] ^0.0 ^ ^ 0.200 1.25992 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.65] ^1.0 ^ ^ 1.000 0.52973 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.67] ^1.0 ^ ^ 1.000 0.52365 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.36] ^-1.0 ^ ^ 1.000 0.66742 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.70] ^-1.0 ^ ^ 1.000 0.51465 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.72] ^-1.0 ^ ^ 1.000 0.50874 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.39] ^1.0 ^ ^ 1.000 0.64842 0.000
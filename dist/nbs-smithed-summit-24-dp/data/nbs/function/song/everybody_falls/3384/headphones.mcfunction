@@ -0,0 +1,8 @@
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 0.200 1.25992 0.000
+playsound block.note_block.bit record @s[] ^-0.5 ^ ^ 1.000 1.88775 0.000
+playsound block.note_block.bit record @s[] ^-0.5 ^ ^ 1.000 1.86607 0.000
+playsound block.note_block.bit_1 record @s[] ^0.5 ^ ^ 1.000 0.59460 0.000
+particle note ~ ~2.25 ~ 0 0 0 1 1
+playsound block.note_block.bit record @s[] ^0.5 ^ ^ 1.000 1.83401 0.000
+playsound block.note_block.bit record @s[] ^0.5 ^ ^ 1.000 1.81294 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.5 ^ ^ 1.000 0.57768 0.000
@@ -0,0 +1,12 @@
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.700 0.50000 0.000
+playsound block.note_block.pling_-1 record @s[] ^-0.0 ^ ^ 0.700 1.58740 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.175 1.00000 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.175 0.79370 0.000
+playsound block.note_block.basedrum record @s[] ^-0.0 ^ ^ 1.000 0.50000 0.000
+playsound block.note_block.basedrum record @s[] ^-0.0 ^ ^ 0.680 1.00000 0.000
+playsound block.note_block.bit record @s[] ^-0.5 ^ ^ 1.000 1.78180 0.000
+playsound block.note_block.bit record @s[] ^-0.5 ^ ^ 1.000 1.76133 0.000
+playsound block.note_block.bit_1 record @s[] ^0.5 ^ ^ 1.000 0.56123 0.000
+playsound block.note_block.bit record @s[] ^0.5 ^ ^ 1.000 1.73107 0.000
+playsound block.note_block.bit record @s[] ^0.5 ^ ^ 1.000 1.71119 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.5 ^ ^ 1.000 0.54525 0.000
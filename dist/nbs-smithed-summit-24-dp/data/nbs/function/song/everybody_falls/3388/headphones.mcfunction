@@ -0,0 +1,11 @@
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.700 0.50000 0.000
+playsound block.note_block.pling_-1 record @s[] ^-0.0 ^ ^ 0.700 1.58740 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.175 1.00000 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.175 0.79370 0.000
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 0.200 1.25992 0.000
+playsound block.note_block.bit record @s[] ^-0.5 ^ ^ 1.000 1.68179 0.000
+playsound block.note_block.bit record @s[] ^-0.5 ^ ^ 1.000 1.66248 0.000
+playsound block.note_block.bit_1 record @s[] ^0.5 ^ ^ 1.000 0.52973 0.000
+playsound block.note_block.bit record @s[] ^0.5 ^ ^ 1.000 1.63392 0.000
+playsound block.note_block.bit record @s[] ^0.5 ^ ^ 1.000 1.61515 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.5 ^ ^ 1.000 0.51465 0.000
@@ -0,0 +1,11 @@
+playsound block.note_block.pling record @a[distance=..11.25] ^0.0 ^ ^ 0.700 0.50000 0.000
+playsound block.note_block.pling_-1 record @a[distance=..11.58] ^0.0 ^ ^ 0.700 1.58740 0.000
+playsound block.note_block.pling record @a[distance=..9.00] ^0.0 ^ ^ 0.175 1.00000 0.000
+playsound block.note_block.pling record @a[distance=..9.94] ^0.0 ^ ^ 0.175 0.79370 0.000
+playsound block.note_block.snare record @a[distance=..6.42] ^0.0 ^ ^ 0.200 1.25992 0.000
+playsound block.note_block.bit record @a[distance=..7.13] ^1.0 ^ ^ 1.000 1.68179 0.000
+playsound block.note_block.bit record @a[distance=..7.16] ^1.0 ^ ^ 1.000 1.66248 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.65] ^-1.0 ^ ^ 1.000 0.52973 0.000
+playsound block.note_block.bit record @a[distance=..7.21] ^-1.0 ^ ^ 1.000 1.63392 0.000
+playsound block.note_block.bit record @a[distance=..7.24] ^-1.0 ^ ^ 1.000 1.61515 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.70] ^1.0 ^ ^ 1.000 0.51465 0.000
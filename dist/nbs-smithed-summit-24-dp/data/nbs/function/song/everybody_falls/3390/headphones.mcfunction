@@ -0,0 +1,17 @@
+playsound block.note_block.guitar record @s[] ^-0.0 ^ ^ 0.750 0.50000 0.000
+playsound block.note_block.guitar record @s[] ^-0.0 ^ ^ 0.680 0.50000 0.000
+playsound block.note_block.didgeridoo record @s[] ^-0.0 ^ ^ 0.600 0.50000 0.000
+playsound block.note_block.bass record @s[] ^-0.0 ^ ^ 1.000 0.50000 0.000
+playsound block.note_block.bass record @s[] ^-0.0 ^ ^ 0.600 0.50000 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.700 0.50000 0.000
+playsound block.note_block.pling_-1 record @s[] ^-0.0 ^ ^ 0.700 1.58740 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.175 1.00000 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.175 0.79370 0.000
+playsound dig_gravel1 record @s[] ^-0.25 ^ ^ 0.700 1.58740 0.000
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 0.200 1.25992 0.000
+playsound block.note_block.bit record @s[] ^-0.5 ^ ^ 1.000 1.58740 0.000
+playsound block.note_block.bit record @s[] ^-0.5 ^ ^ 1.000 1.56917 0.000
+playsound block.note_block.bit record @s[] ^0.5 ^ ^ 1.000 2.00000 0.000
+playsound block.note_block.bit record @s[] ^0.5 ^ ^ 1.000 1.54221 0.000
+playsound block.note_block.bit record @s[] ^0.5 ^ ^ 1.000 1.52450 0.000
+playsound block.note_block.bit record @s[] ^-0.5 ^ ^ 1.000 1.94306 0.000
@@ -0,0 +1,12 @@
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.700 0.50000 0.000
+playsound block.note_block.pling_-1 record @s[] ^-0.0 ^ ^ 0.700 1.58740 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.175 1.00000 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.175 0.79370 0.000
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 0.200 1.25992 0.000
+playsound block.note_block.bit record @s[] ^-0.5 ^ ^ 1.000 1.49831 0.000
+playsound block.note_block.bit record @s[] ^-0.5 ^ ^ 1.000 1.48110 0.000
+playsound block.note_block.bit record @s[] ^0.5 ^ ^ 1.000 1.88775 0.000
+particle note ~ ~2.25 ~ 0 0 0 1 1
+playsound block.note_block.bit record @s[] ^0.5 ^ ^ 1.000 1.45565 0.000
+playsound block.note_block.bit record @s[] ^0.5 ^ ^ 1.000 1.43893 0.000
+playsound block.note_block.bit record @s[] ^-0.5 ^ ^ 1.000 1.83401 0.000
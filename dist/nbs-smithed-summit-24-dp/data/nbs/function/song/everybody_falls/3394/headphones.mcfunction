@@ -0,0 +1,15 @@
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.700 0.50000 0.000
+playsound block.note_block.pling_-1 record @s[] ^-0.0 ^ ^ 0.700 1.58740 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.175 1.00000 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.175 0.79370 0.000
+playsound block.note_block.basedrum record @s[] ^-0.0 ^ ^ 1.000 0.50000 0.000
+playsound block.note_block.basedrum record @s[] ^-0.0 ^ ^ 0.680 1.00000 0.000
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 0.800 0.50000 0.000
+playsound block.note_block.snare record @s[] ^-0.6 ^ ^ 0.800 1.00000 0.000
+playsound random_wood_click record @s[] ^0.6 ^ ^ 0.800 1.00000 0.000
+playsound block.note_block.bit record @s[] ^-0.5 ^ ^ 1.000 1.41421 0.000
+playsound block.note_block.bit record @s[] ^-0.5 ^ ^ 1.000 1.39797 0.000
+playsound block.note_block.bit record @s[] ^0.5 ^ ^ 1.000 1.78180 0.000
+playsound block.note_block.bit record @s[] ^0.5 ^ ^ 1.000 1.37395 0.000
+playsound block.note_block.bit record @s[] ^0.5 ^ ^ 1.000 1.35817 0.000
+playsound block.note_block.bit record @s[] ^-0.5 ^ ^ 1.000 1.73107 0.000
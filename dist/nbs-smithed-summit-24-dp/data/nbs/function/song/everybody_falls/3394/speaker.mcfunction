@@ -0,0 +1,15 @@
+playsound block.note_block.pling record @a[distance=..11.25] ^0.0 ^ ^ 0.700 0.50000 0.000
+playsound block.note_block.pling_-1 record @a[distance=..11.58] ^0.0 ^ ^ 0.700 1.58740 0.000
+playsound block.note_block.pling record @a[distance=..9.00] ^0.0 ^ ^ 0.175 1.00000 0.000
+playsound block.note_block.pling record @a[distance=..9.94] ^0.0 ^ ^ 0.175 0.79370 0.000
+playsound block.note_block.basedrum record @a[distance=..11.88] ^0.0 ^ ^ 1.000 0.50000 0.000
+playsound block.note_block.basedrum record @a[distance=..11.25] ^0.0 ^ ^ 0.680 1.00000 0.000
+playsound block.note_block.snare record @a[distance=..9.00] ^0.0 ^ ^ 0.800 0.50000 0.000
+playsound block.note_block.snare record @a[distance=..6.75] ^1.0 ^ ^ 0.800 1.00000 0.000
+playsound random_wood_click record @a[distance=..6.75] ^-2.0 ^ ^ 0.800 1.00000 0.000
+playsound block.note_block.bit record @a[distance=..7.65] ^1.0 ^ ^ 1.000 1.41421 0.000
+playsound block.note_block.bit record @a[distance=..7.68] ^1.0 ^ ^ 1.000 1.39797 0.000
+playsound block.note_block.bit record @a[distance=..6.99] ^-1.0 ^ ^ 1.000 1.78180 0.000
+playsound block.note_block.bit record @a[distance=..7.74] ^-1.0 ^ ^ 1.000 1.37395 0.000
+playsound block.note_block.bit record @a[distance=..7.78] ^-1.0 ^ ^ 1.000 1.35817 0.000
+playsound block.note_block.bit record @a[distance=..7.06] ^1.0 ^ ^ 1.000 1.73107 0.000
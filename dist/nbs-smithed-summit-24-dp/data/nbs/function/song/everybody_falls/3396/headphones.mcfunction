@@ -0,0 +1,7 @@
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 0.200 1.25992 0.000
+playsound block.note_block.bit record @s[] ^-0.5 ^ ^ 1.000 1.33484 0.000
+playsound block.note_block.bit record @s[] ^-0.5 ^ ^ 1.000 1.31951 0.000
+playsound block.note_block.bit record @s[] ^0.5 ^ ^ 1.000 1.68179 0.000
+playsound block.note_block.bit record @s[] ^0.5 ^ ^ 1.000 1.29684 0.000
+playsound block.note_block.bit record @s[] ^0.5 ^ ^ 1.000 1.28194 0.000
+playsound block.note_block.bit record @s[] ^-0.5 ^ ^ 1.000 1.63392 0.000
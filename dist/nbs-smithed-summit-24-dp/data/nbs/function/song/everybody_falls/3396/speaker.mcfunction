@@ -0,0 +1,7 @@
+playsound block.note_block.snare record @a[distance=..6.42] ^0.0 ^ ^ 0.200 1.25992 0.000
+playsound block.note_block.bit record @a[distance=..7.85] ^1.0 ^ ^ 1.000 1.33484 0.000
+playsound block.note_block.bit record @a[distance=..7.89] ^1.0 ^ ^ 1.000 1.31951 0.000
+playsound block.note_block.bit record @a[distance=..7.13] ^-1.0 ^ ^ 1.000 1.68179 0.000
+playsound block.note_block.bit record @a[distance=..7.95] ^-1.0 ^ ^ 1.000 1.29684 0.000
+playsound block.note_block.bit record @a[distance=..7.99] ^-1.0 ^ ^ 1.000 1.28194 0.000
+playsound block.note_block.bit record @a[distance=..7.21] ^1.0 ^ ^ 1.000 1.63392 0.000
@@ -0,0 +1,17 @@
+playsound block.note_block.guitar record @a[distance=..11.88] ^0.0 ^ ^ 0.750 0.50000 0.000
+playsound block.note_block.guitar record @a[distance=..11.88] ^0.0 ^ ^ 0.680 0.50000 0.000
+playsound block.note_block.didgeridoo record @a[distance=..11.98] ^0.0 ^ ^ 0.600 0.50000 0.000
+playsound block.note_block.bass record @a[distance=..11.98] ^0.0 ^ ^ 1.000 0.50000 0.000
+playsound block.note_block.bass record @a[distance=..11.98] ^0.0 ^ ^ 0.600 0.50000 0.000
+playsound block.note_block.pling record @a[distance=..11.25] ^0.0 ^ ^ 0.700 0.50000 0.000
+playsound block.note_block.pling_-1 record @a[distance=..11.58] ^0.0 ^ ^ 0.700 1.58740 0.000
+playsound block.note_block.pling record @a[distance=..9.00] ^0.0 ^ ^ 0.175 1.00000 0.000
+playsound block.note_block.pling record @a[distance=..9.94] ^0.0 ^ ^ 0.175 0.79370 0.000
+playsound dig_gravel1 record @a[distance=..6.23] ^0.0 ^ ^ 0.700 1.58740 0.000
+playsound block.note_block.snare record @a[distance=..6.42] ^0.0 ^ ^ 0.200 1.25992 0.000
+playsound block.note_block.bit record @a[distance=..8.06] ^1.0 ^ ^ 1.000 1.25992 0.000
+playsound block.note_block.bit record @a[distance=..8.10] ^1.0 ^ ^ 1.000 1.24545 0.000
+playsound block.note_block.bit record @a[distance=..7.29] ^-1.0 ^ ^ 1.000 1.58740 0.000
+playsound block.note_block.bit record @a[distance=..8.17] ^-1.0 ^ ^ 1.000 1.22405 0.000
+playsound block.note_block.bit record @a[distance=..8.22] ^-1.0 ^ ^ 1.000 1.20999 0.000
+playsound block.note_block.bit record @a[distance=..7.37] ^1.0 ^ ^ 1.000 1.54221 0.000
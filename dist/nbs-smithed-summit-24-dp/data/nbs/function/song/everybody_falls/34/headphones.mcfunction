@@ -0,0 +1,7 @@
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.120 0.50000 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.180 0.62996 0.000
+playsound block.note_block.chime record @s[] ^-0.0 ^ ^ 0.066 1.78180 0.000
+playsound block.note_block.chime record @s[] ^-0.0 ^ ^ 0.046 2.00000 0.000
+playsound block.note_block.chime_1 record @s[] ^-0.0 ^ ^ 0.046 0.56123 0.000
+playsound block.note_block.chime record @s[] ^-0.0 ^ ^ 0.203 1.68179 0.000
+playsound block.note_block.chime_1 record @s[] ^-0.0 ^ ^ 0.130 0.59460 0.000
@@ -0,0 +1,15 @@
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.700 0.50000 0.000
+playsound block.note_block.pling_-1 record @s[] ^-0.0 ^ ^ 0.700 1.58740 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.175 1.00000 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.175 0.79370 0.000
+playsound random_wood_click record @s[] ^-0.0 ^ ^ 0.680 0.62996 0.000
+playsound random_wood_click record @s[] ^-0.0 ^ ^ 0.680 0.79370 0.000
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 0.750 0.70711 0.000
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 0.200 1.25992 0.000
+playsound block.note_block.bit record @s[] ^-0.5 ^ ^ 1.000 1.18921 0.000
+playsound block.note_block.bit record @s[] ^-0.5 ^ ^ 1.000 1.17555 0.000
+playsound block.note_block.bit record @s[] ^0.5 ^ ^ 1.000 1.49831 0.000
+particle note ~ ~2.25 ~ 0 0 0 1 1
+playsound block.note_block.bit record @s[] ^0.5 ^ ^ 1.000 1.15535 0.000
+playsound block.note_block.bit record @s[] ^0.5 ^ ^ 1.000 1.14208 0.000
+playsound block.note_block.bit record @s[] ^-0.5 ^ ^ 1.000 1.45565 0.000
@@ -0,0 +1,19 @@
+playsound block.note_block.pling record @a[distance=..11.25] ^0.0 ^ ^ 0.700 0.50000 0.000
+playsound block.note_block.pling_-1 record @a[distance=..11.58] ^0.0 ^ ^ 0.700 1.58740 0.000
+playsound block.note_block.pling record @a[distance=..9.00] ^0.0 ^ ^ 0.175 1.00000 0.000
+playsound block.note_block.pling record @a[distance=..9.94] ^0.0 ^ ^ 0.175 0.79370 0.000
+playsound random_wood_click record @a[distance=..8.06] ^0.0 ^ ^ 0.680 0.62996 0.000
+playsound random_wood_click record @a[distance=..7.29] ^0.0 ^ ^ 0.680 0.79370 0.000
+playsound block.note_block.snare record @a[distance=..7.65] ^0.0 ^ ^ 0.750 0.70711 0.000
+playsound block.note_block.snare record @a[distance=..6.42] ^0.0 ^ ^ 0.200 1.25992 0.000
+playsound block.note_block.bit record @a[distance=..8.28] ^1.0 ^ ^ 1.000 1.18921 0.000
+playsound block.note_block.bit record @a[distance=..8.33] ^1.0 ^ ^ 1.000 1.17555 0.000
+playsound block.note_block.bit record @a[distance=..7.46] ^-1.0 ^ ^ 1.000 1.49831 0.000
+execute store result score #random nbs run random value 1..4
+execute if score #random nbs matches 1 if entity @a[distance=0..12] run function animated_java:music_speaker/animations/animation_speaker_beat_1/play
+execute if score #random nbs matches 2 if entity @a[distance=0..12] run function animated_java:music_speaker/animations/animation_speaker_beat_2/play
+execute if score #random nbs matches 3 if entity @a[distance=0..12] run function animated_java:music_speaker/animations/animation_speaker_beat_3/play
+execute if score #random nbs matches 4 if entity @a[distance=0..12] run function animated_java:music_speaker/animations/animation_speaker_beat_4/play
+playsound block.note_block.bit record @a[distance=..8.40] ^-1.0 ^ ^ 1.000 1.15535 0.000
+playsound block.note_block.bit record @a[distance=..8.45] ^-1.0 ^ ^ 1.000 1.14208 0.000
+playsound block.note_block.bit record @a[distance=..7.55] ^1.0 ^ ^ 1.000 1.45565 0.000
@@ -0,0 +1,17 @@
+playsound block.note_block.guitar record @a[distance=..11.25] ^0.0 ^ ^ 0.750 1.00000 0.000
+playsound block.note_block.guitar record @a[distance=..11.25] ^0.0 ^ ^ 0.680 1.00000 0.000
+playsound block.note_block.didgeridoo record @a[distance=..11.88] ^0.0 ^ ^ 0.600 1.00000 0.000
+playsound block.note_block.bass record @a[distance=..11.88] ^0.0 ^ ^ 1.000 1.00000 0.000
+playsound block.note_block.bass record @a[distance=..11.88] ^0.0 ^ ^ 0.600 1.00000 0.000
+playsound block.note_block.pling record @a[distance=..11.25] ^0.0 ^ ^ 0.700 0.50000 0.000
+playsound block.note_block.pling_-1 record @a[distance=..11.58] ^0.0 ^ ^ 0.700 1.58740 0.000
+playsound block.note_block.pling record @a[distance=..9.00] ^0.0 ^ ^ 0.175 1.00000 0.000
+playsound block.note_block.pling record @a[distance=..9.94] ^0.0 ^ ^ 0.175 0.79370 0.000
+playsound block.note_block.basedrum record @a[distance=..11.88] ^0.0 ^ ^ 1.000 0.50000 0.000
+playsound block.note_block.basedrum record @a[distance=..11.25] ^0.0 ^ ^ 0.680 1.00000 0.000
+playsound block.note_block.bit record @a[distance=..8.52] ^1.0 ^ ^ 0.930 1.12246 0.000
+playsound block.note_block.bit record @a[distance=..8.57] ^1.0 ^ ^ 0.930 1.10957 0.000
+playsound block.note_block.bit record @a[distance=..7.65] ^-1.0 ^ ^ 1.000 1.41421 0.000
+playsound block.note_block.bit record @a[distance=..8.64] ^-1.0 ^ ^ 0.870 1.09051 0.000
+playsound block.note_block.bit record @a[distance=..8.68] ^-1.0 ^ ^ 0.870 1.07798 0.000
+playsound block.note_block.bit record @a[distance=..7.74] ^1.0 ^ ^ 1.000 1.37395 0.000
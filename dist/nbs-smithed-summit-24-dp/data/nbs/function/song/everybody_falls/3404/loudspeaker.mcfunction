@@ -0,0 +1,7 @@
+playsound block.note_block.snare record @a[distance=..48.00] ^0.0 ^ ^ 0.457 1.25992 0.000
+playsound block.note_block.bit record @a[distance=..48.00] ^2.0 ^ ^ 2.014 1.05946 0.000
+playsound block.note_block.bit record @a[distance=..48.00] ^2.0 ^ ^ 2.016 1.04729 0.000
+playsound block.note_block.bit record @a[distance=..48.00] ^-2.0 ^ ^ 2.432 1.33484 0.000
+playsound block.note_block.bit record @a[distance=..48.00] ^-2.0 ^ ^ 1.870 1.02930 0.000
+playsound block.note_block.bit record @a[distance=..48.00] ^-2.0 ^ ^ 1.872 1.01748 0.000
+playsound block.note_block.bit record @a[distance=..48.00] ^2.0 ^ ^ 2.439 1.29684 0.000
@@ -0,0 +1,7 @@
+playsound block.note_block.snare record @a[distance=..6.42] ^0.0 ^ ^ 0.200 1.25992 0.000
+playsound block.note_block.bit record @a[distance=..8.76] ^1.0 ^ ^ 0.810 1.05946 0.000
+playsound block.note_block.bit record @a[distance=..8.81] ^1.0 ^ ^ 0.810 1.04729 0.000
+playsound block.note_block.bit record @a[distance=..7.85] ^-1.0 ^ ^ 1.000 1.33484 0.000
+playsound block.note_block.bit record @a[distance=..8.88] ^-1.0 ^ ^ 0.750 1.02930 0.000
+playsound block.note_block.bit record @a[distance=..8.93] ^-1.0 ^ ^ 0.750 1.01748 0.000
+playsound block.note_block.bit record @a[distance=..7.95] ^1.0 ^ ^ 1.000 1.29684 0.000
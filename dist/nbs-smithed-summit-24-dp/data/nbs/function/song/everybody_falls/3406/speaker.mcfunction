@@ -0,0 +1,17 @@
+playsound block.note_block.guitar record @a[distance=..11.64] ^0.0 ^ ^ 0.750 0.74915 0.000
+playsound block.note_block.guitar record @a[distance=..11.64] ^0.0 ^ ^ 0.680 0.74915 0.000
+playsound block.note_block.didgeridoo record @a[distance=..11.95] ^0.0 ^ ^ 0.600 0.74915 0.000
+playsound block.note_block.bass record @a[distance=..11.95] ^0.0 ^ ^ 1.000 0.74915 0.000
+playsound block.note_block.bass record @a[distance=..11.95] ^0.0 ^ ^ 0.600 0.74915 0.000
+playsound block.note_block.pling record @a[distance=..11.01] ^0.0 ^ ^ 0.700 0.56123 0.000
+playsound block.note_block.pling_-1 record @a[distance=..11.44] ^0.0 ^ ^ 0.700 1.78180 0.000
+playsound block.note_block.pling record @a[distance=..8.52] ^0.0 ^ ^ 0.175 1.12246 0.000
+playsound block.note_block.pling record @a[distance=..9.48] ^0.0 ^ ^ 0.175 0.89090 0.000
+playsound dig_gravel1 record @a[distance=..6.23] ^0.0 ^ ^ 0.700 1.58740 0.000
+playsound block.note_block.snare record @a[distance=..6.42] ^0.0 ^ ^ 0.200 1.25992 0.000
+playsound block.note_block.bit record @a[distance=..9.00] ^1.0 ^ ^ 0.680 1.00000 0.000
+playsound block.note_block.bit record @a[distance=..9.05] ^1.0 ^ ^ 0.680 0.98851 0.000
+playsound block.note_block.bit record @a[distance=..8.06] ^-1.0 ^ ^ 0.950 1.25992 0.000
+playsound block.note_block.bit record @a[distance=..9.12] ^-1.0 ^ ^ 0.620 0.97153 0.000
+playsound block.note_block.bit record @a[distance=..9.17] ^-1.0 ^ ^ 0.620 0.96037 0.000
+playsound block.note_block.bit record @a[distance=..8.17] ^1.0 ^ ^ 0.900 1.22405 0.000
@@ -0,0 +1,12 @@
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.700 0.56123 0.000
+playsound block.note_block.pling_-1 record @s[] ^-0.0 ^ ^ 0.700 1.78180 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.175 1.12246 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.175 0.89090 0.000
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 0.200 1.25992 0.000
+playsound block.note_block.bit record @s[] ^-0.5 ^ ^ 0.560 0.94387 0.000
+playsound block.note_block.bit record @s[] ^-0.5 ^ ^ 0.560 0.93303 0.000
+playsound block.note_block.bit record @s[] ^0.5 ^ ^ 0.850 1.18921 0.000
+particle note ~ ~2.25 ~ 0 0 0 1 1
+playsound block.note_block.bit record @s[] ^0.5 ^ ^ 0.500 0.91700 0.000
+playsound block.note_block.bit record @s[] ^0.5 ^ ^ 0.500 0.90647 0.000
+playsound block.note_block.bit record @s[] ^-0.5 ^ ^ 0.800 1.15535 0.000
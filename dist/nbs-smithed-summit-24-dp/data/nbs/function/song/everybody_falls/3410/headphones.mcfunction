@@ -0,0 +1,16 @@
+playsound block.note_block.guitar record @s[] ^-0.0 ^ ^ 0.750 0.59460 0.000
+playsound block.note_block.guitar record @s[] ^-0.0 ^ ^ 0.680 0.59460 0.000
+playsound block.note_block.didgeridoo record @s[] ^-0.0 ^ ^ 0.600 0.59460 0.000
+playsound block.note_block.bass record @s[] ^-0.0 ^ ^ 1.000 0.59460 0.000
+playsound block.note_block.bass record @s[] ^-0.0 ^ ^ 0.600 0.59460 0.000
+playsound block.note_block.basedrum record @s[] ^-0.0 ^ ^ 1.000 0.50000 0.000
+playsound block.note_block.basedrum record @s[] ^-0.0 ^ ^ 0.680 1.00000 0.000
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 0.800 0.50000 0.000
+playsound block.note_block.snare record @s[] ^-0.6 ^ ^ 0.800 1.00000 0.000
+playsound random_wood_click record @s[] ^0.6 ^ ^ 0.800 1.00000 0.000
+playsound block.note_block.bit record @s[] ^-0.5 ^ ^ 0.430 0.89090 0.000
+playsound block.note_block.bit record @s[] ^-0.5 ^ ^ 0.430 0.88067 0.000
+playsound block.note_block.bit record @s[] ^0.5 ^ ^ 0.750 1.12246 0.000
+playsound block.note_block.bit record @s[] ^0.5 ^ ^ 0.370 0.86554 0.000
+playsound block.note_block.bit record @s[] ^0.5 ^ ^ 0.370 0.85560 0.000
+playsound block.note_block.bit record @s[] ^-0.5 ^ ^ 0.700 1.09051 0.000
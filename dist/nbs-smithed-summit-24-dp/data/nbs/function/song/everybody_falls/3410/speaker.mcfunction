@@ -0,0 +1,16 @@
+playsound block.note_block.guitar record @a[distance=..11.81] ^0.0 ^ ^ 0.750 0.59460 0.000
+playsound block.note_block.guitar record @a[distance=..11.81] ^0.0 ^ ^ 0.680 0.59460 0.000
+playsound block.note_block.didgeridoo record @a[distance=..11.97] ^0.0 ^ ^ 0.600 0.59460 0.000
+playsound block.note_block.bass record @a[distance=..11.97] ^0.0 ^ ^ 1.000 0.59460 0.000
+playsound block.note_block.bass record @a[distance=..11.97] ^0.0 ^ ^ 0.600 0.59460 0.000
+playsound block.note_block.basedrum record @a[distance=..11.88] ^0.0 ^ ^ 1.000 0.50000 0.000
+playsound block.note_block.basedrum record @a[distance=..11.25] ^0.0 ^ ^ 0.680 1.00000 0.000
+playsound block.note_block.snare record @a[distance=..9.00] ^0.0 ^ ^ 0.800 0.50000 0.000
+playsound block.note_block.snare record @a[distance=..6.75] ^1.0 ^ ^ 0.800 1.00000 0.000
+playsound random_wood_click record @a[distance=..6.75] ^-2.0 ^ ^ 0.800 1.00000 0.000
+playsound block.note_block.bit record @a[distance=..9.48] ^1.0 ^ ^ 0.430 0.89090 0.000
+playsound block.note_block.bit record @a[distance=..9.53] ^1.0 ^ ^ 0.430 0.88067 0.000
+playsound block.note_block.bit record @a[distance=..8.52] ^-1.0 ^ ^ 0.750 1.12246 0.000
+playsound block.note_block.bit record @a[distance=..9.60] ^-1.0 ^ ^ 0.370 0.86554 0.000
+playsound block.note_block.bit record @a[distance=..9.65] ^-1.0 ^ ^ 0.370 0.85560 0.000
+playsound block.note_block.bit record @a[distance=..8.64] ^1.0 ^ ^ 0.700 1.09051 0.000
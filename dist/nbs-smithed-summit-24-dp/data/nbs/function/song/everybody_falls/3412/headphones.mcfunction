@@ -0,0 +1,11 @@
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.700 0.56123 0.000
+playsound block.note_block.pling_-1 record @s[] ^-0.0 ^ ^ 0.700 1.78180 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.175 1.12246 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.175 0.89090 0.000
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 0.200 1.25992 0.000
+playsound block.note_block.bit record @s[] ^-0.5 ^ ^ 0.310 0.84090 0.000
+playsound block.note_block.bit record @s[] ^-0.5 ^ ^ 0.310 0.83124 0.000
+playsound block.note_block.bit record @s[] ^0.5 ^ ^ 0.650 1.05946 0.000
+playsound block.note_block.bit record @s[] ^0.5 ^ ^ 0.250 0.81696 0.000
+playsound block.note_block.bit record @s[] ^0.5 ^ ^ 0.250 0.80757 0.000
+playsound block.note_block.bit record @s[] ^-0.5 ^ ^ 0.600 1.02930 0.000
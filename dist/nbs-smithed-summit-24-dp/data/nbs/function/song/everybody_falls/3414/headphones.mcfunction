@@ -0,0 +1,12 @@
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.700 0.56123 0.000
+playsound block.note_block.pling_-1 record @s[] ^-0.0 ^ ^ 0.700 1.78180 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.175 1.12246 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.175 0.89090 0.000
+playsound dig_gravel1 record @s[] ^-0.25 ^ ^ 0.700 1.58740 0.000
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 0.200 1.25992 0.000
+playsound block.note_block.bit record @s[] ^-0.5 ^ ^ 0.180 0.79370 0.000
+playsound block.note_block.bit record @s[] ^-0.5 ^ ^ 0.180 0.78458 0.000
+playsound block.note_block.bit record @s[] ^0.5 ^ ^ 0.550 1.00000 0.000
+playsound block.note_block.bit record @s[] ^0.5 ^ ^ 0.120 0.77111 0.000
+playsound block.note_block.bit record @s[] ^0.5 ^ ^ 0.120 0.76225 0.000
+playsound block.note_block.bit record @s[] ^-0.5 ^ ^ 0.500 0.97153 0.000
@@ -0,0 +1,8 @@
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 0.200 1.25992 0.000
+playsound block.note_block.bit record @s[] ^-0.5 ^ ^ 0.060 0.74915 0.000
+playsound block.note_block.bit record @s[] ^-0.5 ^ ^ 0.060 0.74055 0.000
+playsound block.note_block.bit record @s[] ^0.5 ^ ^ 0.450 0.94387 0.000
+particle note ~ ~2.25 ~ 0 0 0 1 1
+playsound block.note_block.bit record @s[] ^0.5 ^ ^ 0.000 0.72783 0.000
+playsound block.note_block.bit record @s[] ^0.5 ^ ^ 0.000 0.71947 0.000
+playsound block.note_block.bit record @s[] ^-0.5 ^ ^ 0.400 0.91700 0.000
@@ -0,0 +1,12 @@
+playsound block.note_block.snare record @a[distance=..6.42] ^0.0 ^ ^ 0.200 1.25992 0.000
+playsound block.note_block.bit record @a[distance=..10.15] ^1.0 ^ ^ 0.060 0.74915 0.000
+playsound block.note_block.bit record @a[distance=..10.19] ^1.0 ^ ^ 0.060 0.74055 0.000
+playsound block.note_block.bit record @a[distance=..9.24] ^-1.0 ^ ^ 0.450 0.94387 0.000
+execute store result score #random nbs run random value 1..4
+execute if score #random nbs matches 1 if entity @a[distance=0..12] run function animated_java:music_speaker/animations/animation_speaker_beat_1/play
+execute if score #random nbs matches 2 if entity @a[distance=0..12] run function animated_java:music_speaker/animations/animation_speaker_beat_2/play
+execute if score #random nbs matches 3 if entity @a[distance=0..12] run function animated_java:music_speaker/animations/animation_speaker_beat_3/play
+execute if score #random nbs matches 4 if entity @a[distance=0..12] run function animated_java:music_speaker/animations/animation_speaker_beat_4/play
+playsound block.note_block.bit record @a[distance=..10.26] ^-1.0 ^ ^ 0.000 0.72783 0.000
+playsound block.note_block.bit record @a[distance=..10.30] ^-1.0 ^ ^ 0.000 0.71947 0.000
+playsound block.note_block.bit record @a[distance=..9.36] ^1.0 ^ ^ 0.400 0.91700 0.000
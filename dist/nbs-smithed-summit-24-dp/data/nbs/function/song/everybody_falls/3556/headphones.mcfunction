@@ -0,0 +1,2 @@
+playsound ambient_cave_cave11 record @s[] ^-0.0 ^ ^ 0.500 1.58740 0.000
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 0.200 1.25992 0.000
@@ -0,0 +1,2 @@
+playsound ambient_cave_cave11 record @a[distance=..48.00] ^0.0 ^ ^ 1.115 1.58740 0.000
+playsound block.note_block.snare record @a[distance=..48.00] ^0.0 ^ ^ 0.457 1.25992 0.000
@@ -0,0 +1,7 @@
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.120 0.50000 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.180 0.62996 0.000
+playsound block.note_block.chime record @s[] ^-0.0 ^ ^ 0.053 1.58740 0.000
+playsound block.note_block.chime_1 record @s[] ^-0.0 ^ ^ 0.053 0.59460 0.000
+playsound block.note_block.chime record @s[] ^-0.0 ^ ^ 0.158 1.41421 0.000
+playsound block.note_block.chime record @s[] ^-0.0 ^ ^ 0.160 1.58740 0.000
+playsound block.note_block.chime_1 record @s[] ^-0.0 ^ ^ 0.160 0.56123 0.000
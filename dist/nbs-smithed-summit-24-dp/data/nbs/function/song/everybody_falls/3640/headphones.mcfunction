@@ -0,0 +1,7 @@
+playsound ambient_cave_cave11 record @s[] ^-0.0 ^ ^ 0.100 1.78180 0.000
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 0.200 1.25992 0.000
+playsound block.note_block.bit_1 record @s[] ^0.5 ^ ^ 0.574 0.62996 0.000
+playsound block.note_block.bit_1 record @s[] ^0.45 ^ ^ 0.320 0.73841 0.000
+playsound block.note_block.bit_1 record @s[] ^0.55 ^ ^ 0.415 0.74915 0.000
+playsound block.note_block.bit_1 record @s[] ^0.5 ^ ^ 0.328 0.62093 0.000
+particle note ~ ~2.25 ~ 0 0 0 1 1
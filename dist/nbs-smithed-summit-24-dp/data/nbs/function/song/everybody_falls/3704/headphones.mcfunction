@@ -0,0 +1,6 @@
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 0.200 1.25992 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.3 ^ ^ 0.357 1.49831 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.35 ^ ^ 0.212 1.25992 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.25 ^ ^ 0.250 2.00000 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.3 ^ ^ 0.204 1.49831 0.000
+particle note ~ ~2.25 ~ 0 0 0 1 1
@@ -0,0 +1,4 @@
+playsound block.note_block.chime record @a[distance=..48.00] ^0.0 ^ ^ 0.083 1.33484 0.000
+playsound block.note_block.chime record @a[distance=..48.00] ^0.0 ^ ^ 0.239 1.25992 0.000
+playsound block.note_block.chime record @a[distance=..48.00] ^0.0 ^ ^ 0.345 1.88775 0.000
+playsound block.note_block.chime record @a[distance=..48.00] ^0.0 ^ ^ 0.342 2.00000 0.000
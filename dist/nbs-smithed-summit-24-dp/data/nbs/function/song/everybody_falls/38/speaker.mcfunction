@@ -0,0 +1,4 @@
+playsound block.note_block.chime record @a[distance=..6.05] ^0.0 ^ ^ 0.040 1.33484 0.000
+playsound block.note_block.chime record @a[distance=..6.06] ^0.0 ^ ^ 0.112 1.25992 0.000
+playsound block.note_block.chime record @a[distance=..6.02] ^0.0 ^ ^ 0.170 1.88775 0.000
+playsound block.note_block.chime record @a[distance=..6.02] ^0.0 ^ ^ 0.170 2.00000 0.000
@@ -0,0 +1,2 @@
+playsound ambient_cave_cave11 record @a[distance=..6.12] ^0.0 ^ ^ 0.500 2.00000 0.000
+playsound block.note_block.snare record @a[distance=..6.42] ^0.0 ^ ^ 0.200 1.25992 0.000
@@ -0,0 +1,5 @@
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.644 0.59460 0.000
+playsound block.note_block.pling_-1 record @s[] ^-0.0 ^ ^ 0.644 1.78180 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.154 1.18921 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.154 0.89090 0.000
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 0.200 1.25992 0.000
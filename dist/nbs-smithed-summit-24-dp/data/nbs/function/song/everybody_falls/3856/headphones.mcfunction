@@ -0,0 +1,6 @@
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.245 0.56123 0.000
+playsound block.note_block.pling_-1 record @s[] ^-0.0 ^ ^ 0.245 1.78180 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.028 1.12246 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.028 0.89090 0.000
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 0.200 1.25992 0.000
+particle note ~ ~2.25 ~ 0 0 0 1 1
@@ -0,0 +1,5 @@
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.196 0.56123 0.000
+playsound block.note_block.pling_-1 record @s[] ^-0.0 ^ ^ 0.196 1.78180 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.014 1.12246 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.014 0.89090 0.000
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 0.200 1.25992 0.000
@@ -0,0 +1,6 @@
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.147 0.56123 0.000
+playsound block.note_block.pling_-1 record @s[] ^-0.0 ^ ^ 0.147 1.78180 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.000 1.12246 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.000 0.89090 0.000
+playsound dig_gravel1 record @s[] ^-0.25 ^ ^ 0.700 1.58740 0.000
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 0.200 1.25992 0.000
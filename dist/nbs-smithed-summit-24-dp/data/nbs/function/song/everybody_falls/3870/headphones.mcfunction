@@ -0,0 +1,4 @@
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.180 0.50000 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.160 0.62996 0.000
+playsound block.note_block.chime_1 record @s[] ^-0.0 ^ ^ 0.205 0.74915 0.000
+playsound block.note_block.chime record @s[] ^-0.0 ^ ^ 0.015 1.78180 0.000
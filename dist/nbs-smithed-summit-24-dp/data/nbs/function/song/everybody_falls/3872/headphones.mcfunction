@@ -0,0 +1,5 @@
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.180 0.50000 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.160 0.62996 0.000
+playsound block.note_block.chime_1 record @s[] ^-0.0 ^ ^ 0.182 0.66742 0.000
+playsound block.note_block.chime_1 record @s[] ^-0.0 ^ ^ 0.023 0.59460 0.000
+particle note ~ ~2.25 ~ 0 0 0 1 1
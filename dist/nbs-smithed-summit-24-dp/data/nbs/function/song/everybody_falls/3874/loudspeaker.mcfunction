@@ -0,0 +1,2 @@
+playsound block.note_block.chime_1 record @a[distance=..48.00] ^0.0 ^ ^ 0.315 0.59460 0.000
+playsound block.note_block.chime_1 record @a[distance=..48.00] ^0.0 ^ ^ 0.061 0.52973 0.000
@@ -0,0 +1,2 @@
+playsound block.note_block.chime_1 record @a[distance=..6.01] ^0.0 ^ ^ 0.160 0.59460 0.000
+playsound block.note_block.chime_1 record @a[distance=..6.01] ^0.0 ^ ^ 0.030 0.52973 0.000
@@ -0,0 +1,4 @@
+playsound block.note_block.pling record @a[distance=..11.25] ^0.0 ^ ^ 0.180 0.50000 0.000
+playsound block.note_block.pling record @a[distance=..10.71] ^0.0 ^ ^ 0.160 0.62996 0.000
+playsound block.note_block.chime record @a[distance=..6.02] ^0.0 ^ ^ 0.114 1.78180 0.000
+playsound block.note_block.chime record @a[distance=..6.02] ^0.0 ^ ^ 0.046 2.00000 0.000
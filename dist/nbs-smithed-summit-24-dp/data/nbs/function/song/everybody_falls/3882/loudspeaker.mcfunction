@@ -0,0 +1 @@
+playsound block.note_block.chime record @a[distance=..48.00] ^0.0 ^ ^ 0.144 1.33484 0.000
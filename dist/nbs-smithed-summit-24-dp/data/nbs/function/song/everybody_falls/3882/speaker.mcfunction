@@ -0,0 +1 @@
+playsound block.note_block.chime record @a[distance=..6.05] ^0.0 ^ ^ 0.068 1.33484 0.000
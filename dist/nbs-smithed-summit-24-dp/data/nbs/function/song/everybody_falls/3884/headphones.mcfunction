@@ -0,0 +1,4 @@
+playsound block.note_block.pling_-1 record @s[] ^-0.0 ^ ^ 0.180 1.78180 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.160 0.56123 0.000
+playsound block.note_block.chime record @s[] ^-0.0 ^ ^ 0.046 1.18921 0.000
+playsound block.note_block.chime_1 record @s[] ^-0.0 ^ ^ 0.068 0.62996 0.000
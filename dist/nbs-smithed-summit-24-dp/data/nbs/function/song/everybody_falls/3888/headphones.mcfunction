@@ -0,0 +1,7 @@
+playsound block.note_block.bit_1 record @s[] ^-0.1 ^ ^ 0.016 1.00000 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.05 ^ ^ 0.015 0.73841 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.15 ^ ^ 0.024 1.25992 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.1 ^ ^ 0.020 0.98566 0.000
+playsound block.note_block.chime record @s[] ^-0.0 ^ ^ 0.008 0.94387 0.000
+playsound block.note_block.chime record @s[] ^-0.0 ^ ^ 0.065 1.49831 0.000
+particle note ~ ~2.25 ~ 0 0 0 1 1
@@ -0,0 +1,7 @@
+playsound block.note_block.pling_-1 record @s[] ^-0.0 ^ ^ 0.198 1.78180 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.176 0.56123 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.2 ^ ^ 0.032 1.49831 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.15 ^ ^ 0.030 1.24186 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.25 ^ ^ 0.036 2.00000 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.2 ^ ^ 0.040 1.47683 0.000
+playsound block.note_block.chime_1 record @s[] ^-0.0 ^ ^ 0.061 0.74915 0.000
@@ -0,0 +1,7 @@
+playsound block.note_block.pling_-1 record @s[] ^-0.0 ^ ^ 0.225 1.78180 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.200 0.56123 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.3 ^ ^ 0.044 1.49831 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.25 ^ ^ 0.045 1.97133 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.35 ^ ^ 0.048 1.25992 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.3 ^ ^ 0.055 1.47683 0.000
+playsound block.note_block.chime record @s[] ^-0.0 ^ ^ 0.061 1.41421 0.000
@@ -0,0 +1,5 @@
+playsound block.note_block.bit_1 record @a[distance=..48.00] ^1.0 ^ ^ 0.122 1.00000 0.000
+playsound block.note_block.bit_1 record @a[distance=..48.00] ^1.0 ^ ^ 0.128 1.24186 0.000
+playsound block.note_block.bit_1 record @a[distance=..48.00] ^1.0 ^ ^ 0.144 0.74915 0.000
+playsound block.note_block.bit_1 record @a[distance=..48.00] ^1.0 ^ ^ 0.153 0.98566 0.000
+playsound block.note_block.chime record @a[distance=..48.00] ^0.0 ^ ^ 0.116 1.88775 0.000
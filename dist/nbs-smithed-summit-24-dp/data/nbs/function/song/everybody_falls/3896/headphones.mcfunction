@@ -0,0 +1,8 @@
+playsound block.note_block.pling_-1 record @s[] ^-0.0 ^ ^ 0.243 1.58740 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.216 0.50000 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.5 ^ ^ 0.068 0.62996 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.45 ^ ^ 0.080 0.73841 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.55 ^ ^ 0.076 0.74915 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.5 ^ ^ 0.085 0.62093 0.000
+playsound block.note_block.chime_1 record @s[] ^-0.0 ^ ^ 0.053 0.62996 0.000
+particle note ~ ~2.25 ~ 0 0 0 1 1
@@ -0,0 +1,7 @@
+playsound block.note_block.pling_-1 record @s[] ^-0.0 ^ ^ 0.261 1.58740 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.232 0.50000 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.6 ^ ^ 0.080 1.00000 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.55 ^ ^ 0.095 0.73841 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.65 ^ ^ 0.088 1.25992 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.6 ^ ^ 0.100 0.98566 0.000
+playsound block.note_block.chime_1 record @s[] ^-0.0 ^ ^ 0.053 0.56123 0.000
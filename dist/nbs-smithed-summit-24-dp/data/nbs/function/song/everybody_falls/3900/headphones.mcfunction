@@ -0,0 +1,7 @@
+playsound block.note_block.pling_-1 record @s[] ^-0.0 ^ ^ 0.279 1.58740 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.248 0.50000 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.7 ^ ^ 0.096 1.49831 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.65 ^ ^ 0.110 1.24186 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.75 ^ ^ 0.100 2.00000 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.7 ^ ^ 0.120 1.47683 0.000
+playsound block.note_block.chime_1 record @s[] ^-0.0 ^ ^ 0.049 0.70711 0.000
@@ -0,0 +1,6 @@
+playsound block.note_block.pling_-1 record @s[] ^-0.0 ^ ^ 0.297 1.58740 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.264 0.50000 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.8 ^ ^ 0.108 1.49831 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.75 ^ ^ 0.125 1.97133 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.85 ^ ^ 0.116 1.25992 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.8 ^ ^ 0.135 1.47683 0.000
@@ -0,0 +1,8 @@
+playsound block.note_block.pling_-1 record @s[] ^-0.0 ^ ^ 0.315 1.58740 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.280 0.50000 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.9 ^ ^ 0.120 1.00000 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.85 ^ ^ 0.145 1.24186 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.95 ^ ^ 0.128 0.74915 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.9 ^ ^ 0.150 0.98566 0.000
+playsound block.note_block.chime_1 record @s[] ^-0.0 ^ ^ 0.046 0.59460 0.000
+particle note ~ ~2.25 ~ 0 0 0 1 1
@@ -0,0 +1,5 @@
+playsound block.note_block.bit_1 record @s[] ^-1.0 ^ ^ 0.132 0.62996 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.95 ^ ^ 0.160 0.73841 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.95 ^ ^ 0.140 0.74915 0.000
+playsound block.note_block.bit_1 record @s[] ^-1.0 ^ ^ 0.165 0.62093 0.000
+playsound block.note_block.chime_1 record @s[] ^-0.0 ^ ^ 0.042 0.74915 0.000
@@ -0,0 +1,7 @@
+playsound block.note_block.pling_-1 record @s[] ^-0.0 ^ ^ 0.351 1.58740 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.312 0.50000 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.8 ^ ^ 0.160 1.49831 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.85 ^ ^ 0.190 1.24186 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.75 ^ ^ 0.164 2.00000 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.8 ^ ^ 0.200 1.47683 0.000
+playsound block.note_block.chime_1 record @s[] ^-0.0 ^ ^ 0.038 0.66742 0.000
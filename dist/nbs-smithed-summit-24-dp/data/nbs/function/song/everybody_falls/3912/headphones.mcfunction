@@ -0,0 +1,8 @@
+playsound block.note_block.pling_-1 record @s[] ^-0.0 ^ ^ 0.369 1.58740 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.328 0.50000 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.7 ^ ^ 0.172 1.49831 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.75 ^ ^ 0.205 1.97133 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.65 ^ ^ 0.180 1.25992 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.7 ^ ^ 0.215 1.47683 0.000
+playsound block.note_block.chime record @s[] ^-0.0 ^ ^ 0.034 1.49831 0.000
+particle note ~ ~2.25 ~ 0 0 0 1 1
@@ -0,0 +1,4 @@
+playsound block.note_block.bit_1 record @s[] ^-0.6 ^ ^ 0.184 1.00000 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.65 ^ ^ 0.225 1.24186 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.55 ^ ^ 0.192 0.74915 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.6 ^ ^ 0.230 0.98566 0.000
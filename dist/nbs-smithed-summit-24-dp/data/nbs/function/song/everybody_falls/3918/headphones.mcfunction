@@ -0,0 +1,7 @@
+playsound block.note_block.pling_-1 record @s[] ^-0.0 ^ ^ 0.405 1.78180 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.360 0.56123 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.4 ^ ^ 0.212 1.00000 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.45 ^ ^ 0.255 0.73841 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.35 ^ ^ 0.216 1.25992 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.4 ^ ^ 0.265 0.98566 0.000
+playsound block.note_block.chime record @s[] ^-0.0 ^ ^ 0.027 1.58740 0.000
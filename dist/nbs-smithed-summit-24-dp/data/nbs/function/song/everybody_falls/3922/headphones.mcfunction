@@ -0,0 +1,6 @@
+playsound block.note_block.pling_-1 record @s[] ^-0.0 ^ ^ 0.423 1.78180 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.376 0.56123 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.2 ^ ^ 0.236 1.49831 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.25 ^ ^ 0.290 1.97133 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.15 ^ ^ 0.244 1.25992 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.2 ^ ^ 0.295 1.47683 0.000
@@ -0,0 +1,6 @@
+playsound block.note_block.pling_-1 record @s[] ^-0.0 ^ ^ 0.450 1.78180 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.400 0.56123 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.1 ^ ^ 0.248 1.00000 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.15 ^ ^ 0.305 1.24186 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.05 ^ ^ 0.256 0.74915 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.1 ^ ^ 0.310 0.98566 0.000
@@ -0,0 +1,5 @@
+playsound block.note_block.bit_1 record @s[] ^-0.0 ^ ^ 0.264 0.62996 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.05 ^ ^ 0.320 0.73841 0.000
+playsound block.note_block.bit_1 record @s[] ^0.05 ^ ^ 0.268 0.74915 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.0 ^ ^ 0.330 0.62093 0.000
+playsound block.note_block.chime record @s[] ^-0.0 ^ ^ 0.019 1.78180 0.000
@@ -0,0 +1,5 @@
+playsound block.note_block.bit_1 record @a[distance=..48.00] ^0.0 ^ ^ 0.603 0.62996 0.000
+playsound block.note_block.bit_1 record @a[distance=..48.00] ^0.0 ^ ^ 0.719 0.73841 0.000
+playsound block.note_block.bit_1 record @a[distance=..48.00] ^-1.0 ^ ^ 0.601 0.74915 0.000
+playsound block.note_block.bit_1 record @a[distance=..48.00] ^0.0 ^ ^ 0.755 0.62093 0.000
+playsound block.note_block.chime record @a[distance=..48.00] ^0.0 ^ ^ 0.039 1.78180 0.000
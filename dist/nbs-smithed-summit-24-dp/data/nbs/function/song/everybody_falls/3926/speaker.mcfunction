@@ -0,0 +1,5 @@
+playsound block.note_block.bit_1 record @a[distance=..6.42] ^0.0 ^ ^ 0.264 0.62996 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.27] ^0.0 ^ ^ 0.320 0.73841 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.26] ^-1.0 ^ ^ 0.268 0.74915 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.43] ^0.0 ^ ^ 0.330 0.62093 0.000
+playsound block.note_block.chime record @a[distance=..6.02] ^0.0 ^ ^ 0.019 1.78180 0.000
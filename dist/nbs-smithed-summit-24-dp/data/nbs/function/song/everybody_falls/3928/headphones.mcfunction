@@ -0,0 +1,8 @@
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.468 0.50000 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.416 0.62996 0.000
+playsound block.note_block.bit_1 record @s[] ^0.1 ^ ^ 0.276 1.00000 0.000
+playsound block.note_block.bit_1 record @s[] ^0.05 ^ ^ 0.335 0.73841 0.000
+playsound block.note_block.bit_1 record @s[] ^0.15 ^ ^ 0.280 1.25992 0.000
+playsound block.note_block.bit_1 record @s[] ^0.1 ^ ^ 0.345 0.98566 0.000
+playsound block.note_block.chime record @s[] ^-0.0 ^ ^ 0.019 1.33484 0.000
+particle note ~ ~2.25 ~ 0 0 0 1 1
@@ -0,0 +1,7 @@
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.486 0.50000 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.432 0.62996 0.000
+playsound block.note_block.bit_1 record @s[] ^0.2 ^ ^ 0.288 1.49831 0.000
+playsound block.note_block.bit_1 record @s[] ^0.15 ^ ^ 0.350 1.24186 0.000
+playsound block.note_block.bit_1 record @s[] ^0.25 ^ ^ 0.296 2.00000 0.000
+playsound block.note_block.bit_1 record @s[] ^0.2 ^ ^ 0.360 1.47683 0.000
+playsound block.note_block.chime_1 record @s[] ^-0.0 ^ ^ 0.015 0.62996 0.000
@@ -0,0 +1,7 @@
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.504 0.50000 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.448 0.62996 0.000
+playsound block.note_block.bit_1 record @s[] ^0.3 ^ ^ 0.300 1.49831 0.000
+playsound block.note_block.bit_1 record @s[] ^0.25 ^ ^ 0.370 1.97133 0.000
+playsound block.note_block.bit_1 record @s[] ^0.35 ^ ^ 0.308 1.25992 0.000
+playsound block.note_block.bit_1 record @s[] ^0.3 ^ ^ 0.375 1.47683 0.000
+playsound block.note_block.chime_1 record @s[] ^-0.0 ^ ^ 0.011 0.56123 0.000
@@ -0,0 +1,7 @@
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.522 0.50000 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.464 0.62996 0.000
+playsound block.note_block.bit_1 record @s[] ^0.4 ^ ^ 0.316 1.00000 0.000
+playsound block.note_block.bit_1 record @s[] ^0.35 ^ ^ 0.385 1.24186 0.000
+playsound block.note_block.bit_1 record @s[] ^0.45 ^ ^ 0.320 0.74915 0.000
+playsound block.note_block.bit_1 record @s[] ^0.4 ^ ^ 0.395 0.98566 0.000
+playsound block.note_block.chime record @s[] ^-0.0 ^ ^ 0.008 1.33484 0.000
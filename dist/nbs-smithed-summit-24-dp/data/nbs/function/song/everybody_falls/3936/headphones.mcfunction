@@ -0,0 +1,8 @@
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.540 0.50000 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.480 0.62996 0.000
+playsound block.note_block.bit_1 record @s[] ^0.5 ^ ^ 0.328 0.62996 0.000
+playsound block.note_block.bit_1 record @s[] ^0.45 ^ ^ 0.400 0.73841 0.000
+playsound block.note_block.bit_1 record @s[] ^0.55 ^ ^ 0.332 0.74915 0.000
+playsound block.note_block.bit_1 record @s[] ^0.5 ^ ^ 0.410 0.62093 0.000
+playsound block.note_block.chime record @s[] ^-0.0 ^ ^ 0.008 2.00000 0.000
+particle note ~ ~2.25 ~ 0 0 0 1 1
@@ -0,0 +1,6 @@
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.558 0.50000 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.496 0.62996 0.000
+playsound block.note_block.bit_1 record @s[] ^0.7 ^ ^ 0.352 1.49831 0.000
+playsound block.note_block.bit_1 record @s[] ^0.65 ^ ^ 0.435 1.24186 0.000
+playsound block.note_block.bit_1 record @s[] ^0.75 ^ ^ 0.360 2.00000 0.000
+playsound block.note_block.bit_1 record @s[] ^0.7 ^ ^ 0.440 1.47683 0.000
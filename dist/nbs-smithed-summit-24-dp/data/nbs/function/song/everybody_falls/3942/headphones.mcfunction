@@ -0,0 +1,7 @@
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.576 0.50000 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.512 0.62996 0.000
+playsound block.note_block.bit_1 record @s[] ^0.8 ^ ^ 0.364 1.49831 0.000
+playsound block.note_block.bit_1 record @s[] ^0.75 ^ ^ 0.450 1.97133 0.000
+playsound block.note_block.bit_1 record @s[] ^0.85 ^ ^ 0.372 1.25992 0.000
+playsound block.note_block.bit_1 record @s[] ^0.8 ^ ^ 0.455 1.47683 0.000
+playsound block.note_block.chime record @s[] ^-0.0 ^ ^ 0.000 1.33484 0.000
@@ -0,0 +1,4 @@
+playsound block.note_block.bit_1 record @s[] ^1.0 ^ ^ 0.392 0.62996 0.000
+playsound block.note_block.bit_1 record @s[] ^0.95 ^ ^ 0.480 0.73841 0.000
+playsound block.note_block.bit_1 record @s[] ^0.95 ^ ^ 0.400 0.74915 0.000
+playsound block.note_block.bit_1 record @s[] ^1.0 ^ ^ 0.490 0.62093 0.000
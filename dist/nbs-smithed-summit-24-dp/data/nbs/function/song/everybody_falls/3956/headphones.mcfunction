@@ -0,0 +1,7 @@
+playsound block.note_block.pling_-1 record @s[] ^-0.0 ^ ^ 0.675 1.78180 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.600 0.56123 0.000
+playsound block.note_block.bit_1 record @s[] ^0.5 ^ ^ 0.400 0.62996 0.000
+playsound block.note_block.bit_1 record @s[] ^0.55 ^ ^ 0.500 0.73841 0.000
+playsound block.note_block.bit_1 record @s[] ^0.45 ^ ^ 0.400 0.74915 0.000
+playsound block.note_block.bit_1 record @s[] ^0.5 ^ ^ 0.500 0.62093 0.000
+playsound block.note_block.chime record @s[] ^-0.0 ^ ^ 0.004 1.78180 0.000
@@ -0,0 +1,6 @@
+playsound block.note_block.pling_-1 record @s[] ^-0.0 ^ ^ 0.729 1.58740 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.648 0.50000 0.000
+playsound block.note_block.bit_1 record @s[] ^0.1 ^ ^ 0.400 1.00000 0.000
+playsound block.note_block.bit_1 record @s[] ^0.15 ^ ^ 0.500 1.24186 0.000
+playsound block.note_block.bit_1 record @s[] ^0.05 ^ ^ 0.400 0.74915 0.000
+playsound block.note_block.bit_1 record @s[] ^0.1 ^ ^ 0.500 0.98566 0.000
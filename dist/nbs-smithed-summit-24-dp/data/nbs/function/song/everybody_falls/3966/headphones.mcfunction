@@ -0,0 +1,6 @@
+playsound block.note_block.pling_-1 record @s[] ^-0.0 ^ ^ 0.747 1.58740 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.664 0.50000 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.0 ^ ^ 0.400 0.62996 0.000
+playsound block.note_block.bit_1 record @s[] ^0.05 ^ ^ 0.500 0.73841 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.05 ^ ^ 0.400 0.74915 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.0 ^ ^ 0.500 0.62093 0.000
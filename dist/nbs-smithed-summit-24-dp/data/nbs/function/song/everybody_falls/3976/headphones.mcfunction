@@ -0,0 +1,7 @@
+playsound block.note_block.pling_-1 record @s[] ^-0.0 ^ ^ 0.819 1.58740 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.728 0.50000 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.5 ^ ^ 0.400 0.62996 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.45 ^ ^ 0.500 0.73841 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.55 ^ ^ 0.400 0.74915 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.5 ^ ^ 0.500 0.62093 0.000
+particle note ~ ~2.25 ~ 0 0 0 1 1
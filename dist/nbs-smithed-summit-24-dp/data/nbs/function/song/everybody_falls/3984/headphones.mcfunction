@@ -0,0 +1,5 @@
+playsound block.note_block.bit_1 record @s[] ^-0.9 ^ ^ 0.400 1.00000 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.85 ^ ^ 0.500 1.24186 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.95 ^ ^ 0.400 0.74915 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.9 ^ ^ 0.500 0.98566 0.000
+particle note ~ ~2.25 ~ 0 0 0 1 1
@@ -0,0 +1,6 @@
+playsound block.note_block.pling_-1 record @s[] ^-0.0 ^ ^ 0.873 1.78180 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.776 0.56123 0.000
+playsound block.note_block.bit_1 record @s[] ^-1.0 ^ ^ 0.400 0.62996 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.95 ^ ^ 0.500 0.73841 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.95 ^ ^ 0.400 0.74915 0.000
+playsound block.note_block.bit_1 record @s[] ^-1.0 ^ ^ 0.500 0.62093 0.000
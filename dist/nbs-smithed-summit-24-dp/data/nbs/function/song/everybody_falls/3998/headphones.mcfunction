@@ -0,0 +1,9 @@
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.900 0.50000 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.800 0.62996 0.000
+playsound block.note_block.pling_-1 record @s[] ^0.8 ^ ^ 0.110 1.98848 0.000
+playsound block.note_block.pling record @s[] ^0.8 ^ ^ 0.110 0.62633 0.000
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 0.300 0.59460 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.4 ^ ^ 0.400 1.00000 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.45 ^ ^ 0.500 0.73841 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.35 ^ ^ 0.400 1.25992 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.4 ^ ^ 0.500 0.98566 0.000
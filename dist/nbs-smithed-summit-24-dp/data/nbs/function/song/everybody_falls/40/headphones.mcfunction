@@ -0,0 +1,7 @@
+playsound block.note_block.pling_-1 record @s[] ^-0.0 ^ ^ 0.120 1.78180 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.180 0.56123 0.000
+playsound block.note_block.chime record @s[] ^-0.0 ^ ^ 0.026 1.18921 0.000
+playsound block.note_block.chime_1 record @s[] ^-0.0 ^ ^ 0.068 0.62996 0.000
+playsound block.note_block.chime record @s[] ^-0.0 ^ ^ 0.068 1.12246 0.000
+playsound block.note_block.chime_1 record @s[] ^-0.0 ^ ^ 0.170 0.56123 0.000
+particle note ~ ~2.25 ~ 0 0 0 1 1
@@ -0,0 +1,11 @@
+playsound random_wood_click record @s[] ^-0.0 ^ ^ 0.517 0.59460 0.000
+playsound random_wood_click record @s[] ^-0.0 ^ ^ 0.570 0.59460 0.000
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 0.800 0.59460 0.000
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 0.800 0.66742 0.000
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 0.750 0.74915 0.000
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 0.600 1.00000 0.000
+playsound block.note_block.bit_1 record @s[] ^0.5 ^ ^ 0.400 0.62996 0.000
+playsound block.note_block.bit_1 record @s[] ^0.45 ^ ^ 0.500 0.73841 0.000
+playsound block.note_block.bit_1 record @s[] ^0.55 ^ ^ 0.400 0.74915 0.000
+playsound block.note_block.bit_1 record @s[] ^0.5 ^ ^ 0.500 0.62093 0.000
+particle note ~ ~2.25 ~ 0 0 0 1 1
@@ -0,0 +1,11 @@
+playsound block.note_block.pling_-1 record @s[] ^-0.0 ^ ^ 0.900 1.78180 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.800 0.74915 0.000
+playsound block.note_block.pling_-1 record @s[] ^0.8 ^ ^ 0.330 1.77154 0.000
+playsound block.note_block.pling record @s[] ^0.8 ^ ^ 0.330 0.74484 0.000
+playsound block.note_block.basedrum record @s[] ^0.8 ^ ^ 0.150 1.00000 0.000
+playsound block.note_block.basedrum record @s[] ^0.8 ^ ^ 0.136 0.84090 0.000
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 0.450 1.12246 0.000
+playsound block.note_block.bit_1 record @s[] ^0.7 ^ ^ 0.400 1.49831 0.000
+playsound block.note_block.bit_1 record @s[] ^0.65 ^ ^ 0.500 1.24186 0.000
+playsound block.note_block.bit_1 record @s[] ^0.75 ^ ^ 0.400 2.00000 0.000
+playsound block.note_block.bit_1 record @s[] ^0.7 ^ ^ 0.500 1.47683 0.000
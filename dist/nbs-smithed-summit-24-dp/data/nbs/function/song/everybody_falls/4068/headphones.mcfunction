@@ -0,0 +1,9 @@
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.900 0.50000 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.800 0.62996 0.000
+playsound block.note_block.pling_-1 record @s[] ^0.8 ^ ^ 0.830 1.98848 0.000
+playsound block.note_block.pling record @s[] ^0.8 ^ ^ 0.830 0.62633 0.000
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 0.450 2.00000 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.9 ^ ^ 0.220 1.00000 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.95 ^ ^ 0.280 0.73841 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.85 ^ ^ 0.216 1.25992 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.9 ^ ^ 0.275 0.98566 0.000
@@ -0,0 +1,11 @@
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.900 0.50000 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.800 0.62996 0.000
+playsound block.note_block.pling_-1 record @s[] ^0.8 ^ ^ 0.880 1.98848 0.000
+playsound block.note_block.pling record @s[] ^0.8 ^ ^ 0.880 0.62633 0.000
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 0.600 2.00000 0.000
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 1.000 1.58740 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.7 ^ ^ 0.204 1.49831 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.75 ^ ^ 0.260 1.97133 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.65 ^ ^ 0.200 1.25992 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.7 ^ ^ 0.255 1.47683 0.000
+particle note ~ ~2.25 ~ 0 0 0 1 1
@@ -0,0 +1,5 @@
+playsound block.note_block.bit_1 record @s[] ^0.1 ^ ^ 0.144 1.00000 0.000
+playsound block.note_block.bit_1 record @s[] ^0.05 ^ ^ 0.185 0.73841 0.000
+playsound block.note_block.bit_1 record @s[] ^0.15 ^ ^ 0.140 1.25992 0.000
+playsound block.note_block.bit_1 record @s[] ^0.1 ^ ^ 0.180 0.98566 0.000
+particle note ~ ~2.25 ~ 0 0 0 1 1
@@ -0,0 +1,4 @@
+playsound block.note_block.bit_1 record @s[] ^0.3 ^ ^ 0.128 1.49831 0.000
+playsound block.note_block.bit_1 record @s[] ^0.25 ^ ^ 0.165 1.97133 0.000
+playsound block.note_block.bit_1 record @s[] ^0.35 ^ ^ 0.124 1.25992 0.000
+playsound block.note_block.bit_1 record @s[] ^0.3 ^ ^ 0.160 1.47683 0.000
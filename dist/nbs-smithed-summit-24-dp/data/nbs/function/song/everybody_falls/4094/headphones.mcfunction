@@ -0,0 +1,8 @@
+playsound fireworks_launch1 record @s[] ^-0.0 ^ ^ 0.750 1.00000 0.000
+playsound fireworks_launch1 record @s[] ^-0.6 ^ ^ 0.700 1.00000 0.000
+playsound fireworks_launch1 record @s[] ^-0.0 ^ ^ 1.000 0.79370 0.000
+playsound fireworks_launch1 record @s[] ^-0.0 ^ ^ 1.000 0.89090 0.000
+playsound block.note_block.bit_1 record @s[] ^0.4 ^ ^ 0.120 1.00000 0.000
+playsound block.note_block.bit_1 record @s[] ^0.35 ^ ^ 0.155 1.24186 0.000
+playsound block.note_block.bit_1 record @s[] ^0.45 ^ ^ 0.116 0.74915 0.000
+playsound block.note_block.bit_1 record @s[] ^0.4 ^ ^ 0.150 0.98566 0.000
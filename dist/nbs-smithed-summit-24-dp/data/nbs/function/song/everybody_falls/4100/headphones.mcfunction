@@ -0,0 +1,4 @@
+playsound block.note_block.bit_1 record @s[] ^0.7 ^ ^ 0.096 1.49831 0.000
+playsound block.note_block.bit_1 record @s[] ^0.65 ^ ^ 0.125 1.24186 0.000
+playsound block.note_block.bit_1 record @s[] ^0.75 ^ ^ 0.092 2.00000 0.000
+playsound block.note_block.bit_1 record @s[] ^0.7 ^ ^ 0.120 1.47683 0.000
@@ -0,0 +1,4 @@
+playsound block.note_block.bit_1 record @s[] ^0.8 ^ ^ 0.088 1.49831 0.000
+playsound block.note_block.bit_1 record @s[] ^0.75 ^ ^ 0.115 1.97133 0.000
+playsound block.note_block.bit_1 record @s[] ^0.85 ^ ^ 0.084 1.25992 0.000
+playsound block.note_block.bit_1 record @s[] ^0.8 ^ ^ 0.110 1.47683 0.000
@@ -0,0 +1,5 @@
+playsound block.note_block.bit_1 record @s[] ^0.9 ^ ^ 0.080 1.00000 0.000
+playsound block.note_block.bit_1 record @s[] ^0.85 ^ ^ 0.105 1.24186 0.000
+playsound block.note_block.bit_1 record @s[] ^0.95 ^ ^ 0.076 0.74915 0.000
+playsound block.note_block.bit_1 record @s[] ^0.9 ^ ^ 0.100 0.98566 0.000
+particle note ~ ~2.25 ~ 0 0 0 1 1
@@ -0,0 +1,4 @@
+playsound block.note_block.bit_1 record @s[] ^1.0 ^ ^ 0.072 0.62996 0.000
+playsound block.note_block.bit_1 record @s[] ^0.95 ^ ^ 0.095 0.73841 0.000
+playsound block.note_block.bit_1 record @s[] ^0.95 ^ ^ 0.068 0.74915 0.000
+playsound block.note_block.bit_1 record @s[] ^1.0 ^ ^ 0.090 0.62093 0.000
@@ -0,0 +1,4 @@
+playsound block.note_block.bit_1 record @s[] ^0.9 ^ ^ 0.064 1.00000 0.000
+playsound block.note_block.bit_1 record @s[] ^0.95 ^ ^ 0.085 0.73841 0.000
+playsound block.note_block.bit_1 record @s[] ^0.85 ^ ^ 0.060 1.25992 0.000
+playsound block.note_block.bit_1 record @s[] ^0.9 ^ ^ 0.080 0.98566 0.000
@@ -0,0 +1,4 @@
+playsound block.note_block.bit_1 record @s[] ^0.8 ^ ^ 0.056 1.49831 0.000
+playsound block.note_block.bit_1 record @s[] ^0.85 ^ ^ 0.075 1.24186 0.000
+playsound block.note_block.bit_1 record @s[] ^0.75 ^ ^ 0.052 2.00000 0.000
+playsound block.note_block.bit_1 record @s[] ^0.8 ^ ^ 0.070 1.47683 0.000
@@ -0,0 +1,4 @@
+playsound block.note_block.bit_1 record @s[] ^0.6 ^ ^ 0.040 1.00000 0.000
+playsound block.note_block.bit_1 record @s[] ^0.65 ^ ^ 0.055 1.24186 0.000
+playsound block.note_block.bit_1 record @s[] ^0.55 ^ ^ 0.036 0.74915 0.000
+playsound block.note_block.bit_1 record @s[] ^0.6 ^ ^ 0.050 0.98566 0.000
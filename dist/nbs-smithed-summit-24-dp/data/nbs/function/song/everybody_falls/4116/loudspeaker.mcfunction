@@ -0,0 +1,8 @@
+playsound fireworks_blast_far1 record @a[distance=..48.00] ^0.0 ^ ^ 2.378 0.84090 0.000
+playsound fireworks_blast_far1 record @a[distance=..48.00] ^0.0 ^ ^ 2.297 1.18921 0.000
+playsound fireworks_blast_far1 record @a[distance=..48.00] ^1.0 ^ ^ 1.646 0.94387 0.000
+playsound fireworks_blast_far1 record @a[distance=..48.00] ^0.0 ^ ^ 2.432 0.66742 0.000
+playsound block.note_block.bit_1 record @a[distance=..48.00] ^-2.0 ^ ^ 0.073 0.62996 0.000
+playsound block.note_block.bit_1 record @a[distance=..48.00] ^-3.0 ^ ^ 0.101 0.73841 0.000
+playsound block.note_block.bit_1 record @a[distance=..48.00] ^-2.0 ^ ^ 0.063 0.74915 0.000
+playsound block.note_block.bit_1 record @a[distance=..48.00] ^-2.0 ^ ^ 0.091 0.62093 0.000
@@ -0,0 +1,10 @@
+playsound block.note_block.bell record @a[distance=..6.06] ^0.0 ^ ^ 0.600 1.25992 0.000
+playsound block.note_block.xylophone record @a[distance=..6.06] ^0.0 ^ ^ 0.900 1.25992 0.000
+playsound block.note_block.pling record @a[distance=..8.06] ^0.0 ^ ^ 0.800 1.25992 0.000
+playsound block.note_block.flute record @a[distance=..6.42] ^0.0 ^ ^ 0.750 1.25992 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.56] ^-2.0 ^ ^ 0.562 0.56123 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.56] ^-2.0 ^ ^ 0.562 0.56123 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.58] ^-2.0 ^ ^ 0.525 0.55478 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.56] ^-2.0 ^ ^ 0.750 0.56123 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.56] ^-2.0 ^ ^ 0.750 0.56123 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.58] ^-2.0 ^ ^ 0.750 0.55478 0.000
@@ -0,0 +1,5 @@
+playsound block.note_block.bit_1 record @s[] ^0.3 ^ ^ 0.016 1.49831 0.000
+playsound block.note_block.bit_1 record @s[] ^0.35 ^ ^ 0.025 1.24186 0.000
+playsound block.note_block.bit_1 record @s[] ^0.25 ^ ^ 0.012 2.00000 0.000
+playsound block.note_block.bit_1 record @s[] ^0.3 ^ ^ 0.020 1.47683 0.000
+particle note ~ ~2.25 ~ 0 0 0 1 1
@@ -0,0 +1,4 @@
+playsound block.note_block.bit_1 record @s[] ^0.2 ^ ^ 0.008 1.49831 0.000
+playsound block.note_block.bit_1 record @s[] ^0.25 ^ ^ 0.015 1.97133 0.000
+playsound block.note_block.bit_1 record @s[] ^0.15 ^ ^ 0.004 1.25992 0.000
+playsound block.note_block.bit_1 record @s[] ^0.2 ^ ^ 0.010 1.47683 0.000
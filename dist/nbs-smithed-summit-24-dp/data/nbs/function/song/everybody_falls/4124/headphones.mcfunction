@@ -0,0 +1,4 @@
+playsound block.note_block.bit_1 record @s[] ^0.1 ^ ^ 0.000 1.00000 0.000
+playsound block.note_block.bit_1 record @s[] ^0.15 ^ ^ 0.005 1.24186 0.000
+playsound block.note_block.bit_1 record @s[] ^0.05 ^ ^ 0.000 0.74915 0.000
+playsound block.note_block.bit_1 record @s[] ^0.1 ^ ^ 0.000 0.98566 0.000
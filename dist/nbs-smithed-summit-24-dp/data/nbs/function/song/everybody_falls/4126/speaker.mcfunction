@@ -0,0 +1 @@
+playsound block.note_block.bit_1 record @a[distance=..6.27] ^-1.0 ^ ^ 0.000 0.73841 0.000
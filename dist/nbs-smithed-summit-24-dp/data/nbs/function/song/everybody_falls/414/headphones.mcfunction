@@ -0,0 +1,10 @@
+playsound block.note_block.bell record @s[] ^-0.0 ^ ^ 0.600 1.25992 0.000
+playsound block.note_block.xylophone record @s[] ^-0.0 ^ ^ 0.900 1.25992 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.800 1.25992 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.750 1.25992 0.000
+playsound block.note_block.bit record @s[] ^0.2 ^ ^ 0.375 1.68179 0.000
+playsound block.note_block.bit record @s[] ^0.2 ^ ^ 0.375 1.68179 0.000
+playsound block.note_block.bit record @s[] ^0.2 ^ ^ 0.350 1.66248 0.000
+playsound block.note_block.bit record @s[] ^0.2 ^ ^ 0.500 1.68179 0.000
+playsound block.note_block.bit record @s[] ^0.2 ^ ^ 0.500 1.68179 0.000
+playsound block.note_block.bit record @s[] ^0.2 ^ ^ 0.500 1.66248 0.000
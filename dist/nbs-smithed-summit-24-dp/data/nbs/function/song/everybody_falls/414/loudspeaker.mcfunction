@@ -0,0 +1,10 @@
+playsound block.note_block.bell record @a[distance=..48.00] ^0.0 ^ ^ 1.273 1.25992 0.000
+playsound block.note_block.xylophone record @a[distance=..48.00] ^0.0 ^ ^ 1.909 1.25992 0.000
+playsound block.note_block.pling record @a[distance=..48.00] ^0.0 ^ ^ 1.957 1.25992 0.000
+playsound block.note_block.flute record @a[distance=..48.00] ^0.0 ^ ^ 1.713 1.25992 0.000
+playsound block.note_block.bit record @a[distance=..48.00] ^-1.0 ^ ^ 0.892 1.68179 0.000
+playsound block.note_block.bit record @a[distance=..48.00] ^-1.0 ^ ^ 0.892 1.68179 0.000
+playsound block.note_block.bit record @a[distance=..48.00] ^-1.0 ^ ^ 0.833 1.66248 0.000
+playsound block.note_block.bit record @a[distance=..48.00] ^-1.0 ^ ^ 1.189 1.68179 0.000
+playsound block.note_block.bit record @a[distance=..48.00] ^-1.0 ^ ^ 1.189 1.68179 0.000
+playsound block.note_block.bit record @a[distance=..48.00] ^-1.0 ^ ^ 1.191 1.66248 0.000
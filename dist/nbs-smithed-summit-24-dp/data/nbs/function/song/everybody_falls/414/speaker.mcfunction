@@ -0,0 +1,10 @@
+playsound block.note_block.bell record @a[distance=..6.06] ^0.0 ^ ^ 0.600 1.25992 0.000
+playsound block.note_block.xylophone record @a[distance=..6.06] ^0.0 ^ ^ 0.900 1.25992 0.000
+playsound block.note_block.pling record @a[distance=..8.06] ^0.0 ^ ^ 0.800 1.25992 0.000
+playsound block.note_block.flute record @a[distance=..6.42] ^0.0 ^ ^ 0.750 1.25992 0.000
+playsound block.note_block.bit record @a[distance=..7.13] ^-1.0 ^ ^ 0.375 1.68179 0.000
+playsound block.note_block.bit record @a[distance=..7.13] ^-1.0 ^ ^ 0.375 1.68179 0.000
+playsound block.note_block.bit record @a[distance=..7.16] ^-1.0 ^ ^ 0.350 1.66248 0.000
+playsound block.note_block.bit record @a[distance=..7.13] ^-1.0 ^ ^ 0.500 1.68179 0.000
+playsound block.note_block.bit record @a[distance=..7.13] ^-1.0 ^ ^ 0.500 1.68179 0.000
+playsound block.note_block.bit record @a[distance=..7.16] ^-1.0 ^ ^ 0.500 1.66248 0.000
@@ -0,0 +1,11 @@
+playsound block.note_block.bell record @s[] ^-0.0 ^ ^ 0.600 1.25992 0.000
+playsound block.note_block.xylophone record @s[] ^-0.0 ^ ^ 0.900 1.25992 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.800 1.25992 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.750 1.25992 0.000
+playsound block.note_block.bit record @s[] ^-0.2 ^ ^ 0.188 1.33484 0.000
+playsound block.note_block.bit record @s[] ^-0.2 ^ ^ 0.188 1.33484 0.000
+playsound block.note_block.bit record @s[] ^-0.2 ^ ^ 0.175 1.31951 0.000
+playsound block.note_block.bit record @s[] ^-0.2 ^ ^ 0.250 1.33484 0.000
+playsound block.note_block.bit record @s[] ^-0.2 ^ ^ 0.250 1.33484 0.000
+playsound block.note_block.bit record @s[] ^-0.2 ^ ^ 0.250 1.31951 0.000
+particle note ~ ~2.25 ~ 0 0 0 1 1
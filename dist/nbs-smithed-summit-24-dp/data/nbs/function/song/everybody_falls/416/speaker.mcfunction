@@ -0,0 +1,15 @@
+playsound block.note_block.bell record @a[distance=..6.06] ^0.0 ^ ^ 0.600 1.25992 0.000
+playsound block.note_block.xylophone record @a[distance=..6.06] ^0.0 ^ ^ 0.900 1.25992 0.000
+playsound block.note_block.pling record @a[distance=..8.06] ^0.0 ^ ^ 0.800 1.25992 0.000
+playsound block.note_block.flute record @a[distance=..6.42] ^0.0 ^ ^ 0.750 1.25992 0.000
+playsound block.note_block.bit record @a[distance=..7.85] ^0.0 ^ ^ 0.188 1.33484 0.000
+playsound block.note_block.bit record @a[distance=..7.85] ^0.0 ^ ^ 0.188 1.33484 0.000
+playsound block.note_block.bit record @a[distance=..7.89] ^0.0 ^ ^ 0.175 1.31951 0.000
+playsound block.note_block.bit record @a[distance=..7.85] ^0.0 ^ ^ 0.250 1.33484 0.000
+playsound block.note_block.bit record @a[distance=..7.85] ^0.0 ^ ^ 0.250 1.33484 0.000
+playsound block.note_block.bit record @a[distance=..7.89] ^0.0 ^ ^ 0.250 1.31951 0.000
+execute store result score #random nbs run random value 1..4
+execute if score #random nbs matches 1 if entity @a[distance=0..12] run function animated_java:music_speaker/animations/animation_speaker_beat_1/play
+execute if score #random nbs matches 2 if entity @a[distance=0..12] run function animated_java:music_speaker/animations/animation_speaker_beat_2/play
+execute if score #random nbs matches 3 if entity @a[distance=0..12] run function animated_java:music_speaker/animations/animation_speaker_beat_3/play
+execute if score #random nbs matches 4 if entity @a[distance=0..12] run function animated_java:music_speaker/animations/animation_speaker_beat_4/play
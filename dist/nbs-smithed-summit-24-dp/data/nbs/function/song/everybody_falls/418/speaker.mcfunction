@@ -0,0 +1,11 @@
+playsound block.note_block.bell record @a[distance=..6.06] ^0.0 ^ ^ 0.600 1.25992 0.000
+playsound block.note_block.xylophone record @a[distance=..6.06] ^0.0 ^ ^ 0.900 1.25992 0.000
+playsound block.note_block.pling record @a[distance=..8.06] ^0.0 ^ ^ 0.800 1.25992 0.000
+playsound block.note_block.flute record @a[distance=..6.42] ^0.0 ^ ^ 0.750 1.25992 0.000
+playsound entity_witch_hurt1 record @a[distance=..6.12] ^0.0 ^ ^ 0.450 2.00000 0.000
+playsound block.note_block.bit record @a[distance=..8.28] ^1.0 ^ ^ 0.090 1.18921 0.000
+playsound block.note_block.bit record @a[distance=..8.28] ^1.0 ^ ^ 0.090 1.18921 0.000
+playsound block.note_block.bit record @a[distance=..8.33] ^1.0 ^ ^ 0.084 1.17555 0.000
+playsound block.note_block.bit record @a[distance=..8.28] ^1.0 ^ ^ 0.120 1.18921 0.000
+playsound block.note_block.bit record @a[distance=..8.28] ^1.0 ^ ^ 0.120 1.18921 0.000
+playsound block.note_block.bit record @a[distance=..8.33] ^1.0 ^ ^ 0.120 1.17555 0.000
@@ -0,0 +1,7 @@
+playsound block.note_block.pling_-1 record @s[] ^-0.0 ^ ^ 0.120 1.78180 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.180 0.56123 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.0 ^ ^ 0.007 0.62996 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.05 ^ ^ 0.015 0.74915 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.0 ^ ^ 0.004 0.62093 0.000
+playsound block.note_block.chime record @s[] ^-0.0 ^ ^ 0.013 1.05946 0.000
+playsound block.note_block.chime record @s[] ^-0.0 ^ ^ 0.022 1.00000 0.000
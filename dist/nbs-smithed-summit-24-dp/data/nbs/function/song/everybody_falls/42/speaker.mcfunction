@@ -0,0 +1,7 @@
+playsound block.note_block.pling_-1 record @a[distance=..11.44] ^0.0 ^ ^ 0.120 1.78180 0.000
+playsound block.note_block.pling record @a[distance=..11.01] ^0.0 ^ ^ 0.180 0.56123 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.42] ^0.0 ^ ^ 0.007 0.62996 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.26] ^0.0 ^ ^ 0.015 0.74915 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.43] ^0.0 ^ ^ 0.004 0.62093 0.000
+playsound block.note_block.chime record @a[distance=..6.10] ^0.0 ^ ^ 0.013 1.05946 0.000
+playsound block.note_block.chime record @a[distance=..6.12] ^0.0 ^ ^ 0.022 1.00000 0.000
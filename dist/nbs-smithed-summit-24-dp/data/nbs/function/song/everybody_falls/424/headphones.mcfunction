@@ -0,0 +1,11 @@
+playsound block.note_block.bell record @s[] ^-0.0 ^ ^ 0.600 1.25992 0.000
+playsound block.note_block.xylophone record @s[] ^-0.0 ^ ^ 0.900 1.25992 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.800 1.25992 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.750 1.25992 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.6 ^ ^ 0.562 0.56123 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.6 ^ ^ 0.562 0.56123 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.6 ^ ^ 0.525 0.55478 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.6 ^ ^ 0.750 0.56123 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.6 ^ ^ 0.750 0.56123 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.6 ^ ^ 0.750 0.55478 0.000
+particle note ~ ~2.25 ~ 0 0 0 1 1
@@ -0,0 +1,7 @@
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.750 1.25992 0.000
+playsound block.note_block.bit record @s[] ^0.2 ^ ^ 0.188 1.33484 0.000
+playsound block.note_block.bit record @s[] ^0.2 ^ ^ 0.188 1.33484 0.000
+playsound block.note_block.bit record @s[] ^0.2 ^ ^ 0.175 1.31951 0.000
+playsound block.note_block.bit record @s[] ^0.2 ^ ^ 0.250 1.33484 0.000
+playsound block.note_block.bit record @s[] ^0.2 ^ ^ 0.250 1.33484 0.000
+playsound block.note_block.bit record @s[] ^0.2 ^ ^ 0.250 1.31951 0.000
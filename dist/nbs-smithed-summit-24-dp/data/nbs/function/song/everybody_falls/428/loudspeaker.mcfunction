@@ -0,0 +1,7 @@
+playsound block.note_block.flute record @a[distance=..48.00] ^0.0 ^ ^ 1.713 1.25992 0.000
+playsound block.note_block.bit record @a[distance=..48.00] ^-1.0 ^ ^ 0.456 1.33484 0.000
+playsound block.note_block.bit record @a[distance=..48.00] ^-1.0 ^ ^ 0.456 1.33484 0.000
+playsound block.note_block.bit record @a[distance=..48.00] ^-1.0 ^ ^ 0.426 1.31951 0.000
+playsound block.note_block.bit record @a[distance=..48.00] ^-1.0 ^ ^ 0.608 1.33484 0.000
+playsound block.note_block.bit record @a[distance=..48.00] ^-1.0 ^ ^ 0.608 1.33484 0.000
+playsound block.note_block.bit record @a[distance=..48.00] ^-1.0 ^ ^ 0.609 1.31951 0.000
@@ -0,0 +1,7 @@
+playsound block.note_block.flute record @a[distance=..6.42] ^0.0 ^ ^ 0.750 1.25992 0.000
+playsound block.note_block.bit record @a[distance=..7.85] ^-1.0 ^ ^ 0.188 1.33484 0.000
+playsound block.note_block.bit record @a[distance=..7.85] ^-1.0 ^ ^ 0.188 1.33484 0.000
+playsound block.note_block.bit record @a[distance=..7.89] ^-1.0 ^ ^ 0.175 1.31951 0.000
+playsound block.note_block.bit record @a[distance=..7.85] ^-1.0 ^ ^ 0.250 1.33484 0.000
+playsound block.note_block.bit record @a[distance=..7.85] ^-1.0 ^ ^ 0.250 1.33484 0.000
+playsound block.note_block.bit record @a[distance=..7.89] ^-1.0 ^ ^ 0.250 1.31951 0.000
@@ -0,0 +1,10 @@
+playsound block.note_block.bell record @s[] ^-0.0 ^ ^ 0.600 1.12246 0.000
+playsound block.note_block.xylophone record @s[] ^-0.0 ^ ^ 0.900 1.12246 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.800 1.12246 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.750 1.12246 0.000
+playsound block.note_block.bit record @s[] ^0.6 ^ ^ 0.090 1.18921 0.000
+playsound block.note_block.bit record @s[] ^0.6 ^ ^ 0.090 1.18921 0.000
+playsound block.note_block.bit record @s[] ^0.6 ^ ^ 0.084 1.17555 0.000
+playsound block.note_block.bit record @s[] ^0.6 ^ ^ 0.120 1.18921 0.000
+playsound block.note_block.bit record @s[] ^0.6 ^ ^ 0.120 1.18921 0.000
+playsound block.note_block.bit record @s[] ^0.6 ^ ^ 0.120 1.17555 0.000
@@ -0,0 +1,10 @@
+playsound block.note_block.bell record @a[distance=..48.00] ^0.0 ^ ^ 1.289 1.12246 0.000
+playsound block.note_block.xylophone record @a[distance=..48.00] ^0.0 ^ ^ 1.934 1.12246 0.000
+playsound block.note_block.pling record @a[distance=..48.00] ^0.0 ^ ^ 1.978 1.12246 0.000
+playsound block.note_block.flute record @a[distance=..48.00] ^0.0 ^ ^ 1.733 1.12246 0.000
+playsound block.note_block.bit record @a[distance=..48.00] ^-3.0 ^ ^ 0.221 1.18921 0.000
+playsound block.note_block.bit record @a[distance=..48.00] ^-3.0 ^ ^ 0.221 1.18921 0.000
+playsound block.note_block.bit record @a[distance=..48.00] ^-3.0 ^ ^ 0.207 1.17555 0.000
+playsound block.note_block.bit record @a[distance=..48.00] ^-3.0 ^ ^ 0.295 1.18921 0.000
+playsound block.note_block.bit record @a[distance=..48.00] ^-3.0 ^ ^ 0.295 1.18921 0.000
+playsound block.note_block.bit record @a[distance=..48.00] ^-3.0 ^ ^ 0.295 1.17555 0.000
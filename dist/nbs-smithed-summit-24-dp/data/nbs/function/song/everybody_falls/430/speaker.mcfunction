@@ -0,0 +1,10 @@
+playsound block.note_block.bell record @a[distance=..6.09] ^0.0 ^ ^ 0.600 1.12246 0.000
+playsound block.note_block.xylophone record @a[distance=..6.09] ^0.0 ^ ^ 0.900 1.12246 0.000
+playsound block.note_block.pling record @a[distance=..8.52] ^0.0 ^ ^ 0.800 1.12246 0.000
+playsound block.note_block.flute record @a[distance=..6.56] ^0.0 ^ ^ 0.750 1.12246 0.000
+playsound block.note_block.bit record @a[distance=..8.28] ^-2.0 ^ ^ 0.090 1.18921 0.000
+playsound block.note_block.bit record @a[distance=..8.28] ^-2.0 ^ ^ 0.090 1.18921 0.000
+playsound block.note_block.bit record @a[distance=..8.33] ^-2.0 ^ ^ 0.084 1.17555 0.000
+playsound block.note_block.bit record @a[distance=..8.28] ^-2.0 ^ ^ 0.120 1.18921 0.000
+playsound block.note_block.bit record @a[distance=..8.28] ^-2.0 ^ ^ 0.120 1.18921 0.000
+playsound block.note_block.bit record @a[distance=..8.33] ^-2.0 ^ ^ 0.120 1.17555 0.000
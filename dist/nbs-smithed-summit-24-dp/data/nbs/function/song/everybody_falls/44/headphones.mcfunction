@@ -0,0 +1,7 @@
+playsound block.note_block.bit_1 record @s[] ^-0.1 ^ ^ 0.028 1.00000 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.05 ^ ^ 0.012 0.73841 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.15 ^ ^ 0.030 1.25992 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.1 ^ ^ 0.016 0.98566 0.000
+playsound block.note_block.chime record @s[] ^-0.0 ^ ^ 0.004 0.94387 0.000
+playsound block.note_block.chime record @s[] ^-0.0 ^ ^ 0.065 1.49831 0.000
+playsound block.note_block.chime record @s[] ^-0.0 ^ ^ 0.065 1.33484 0.000
@@ -0,0 +1,7 @@
+playsound block.note_block.bit_1 record @a[distance=..48.00] ^0.0 ^ ^ 0.061 1.00000 0.000
+playsound block.note_block.bit_1 record @a[distance=..48.00] ^0.0 ^ ^ 0.027 0.73841 0.000
+playsound block.note_block.bit_1 record @a[distance=..48.00] ^0.0 ^ ^ 0.064 1.25992 0.000
+playsound block.note_block.bit_1 record @a[distance=..48.00] ^0.0 ^ ^ 0.035 0.98566 0.000
+playsound block.note_block.chime record @a[distance=..48.00] ^0.0 ^ ^ 0.010 0.94387 0.000
+playsound block.note_block.chime record @a[distance=..48.00] ^0.0 ^ ^ 0.134 1.49831 0.000
+playsound block.note_block.chime record @a[distance=..48.00] ^0.0 ^ ^ 0.136 1.33484 0.000
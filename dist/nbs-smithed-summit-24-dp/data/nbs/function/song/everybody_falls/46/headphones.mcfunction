@@ -0,0 +1,11 @@
+playsound block.note_block.pling_-1 record @s[] ^-0.0 ^ ^ 0.132 1.78180 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.198 0.56123 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.2 ^ ^ 0.056 1.49831 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.15 ^ ^ 0.024 1.24186 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.25 ^ ^ 0.045 2.00000 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.2 ^ ^ 0.032 1.47683 0.000
+playsound block.note_block.chime_1 record @s[] ^-0.0 ^ ^ 0.061 0.74915 0.000
+playsound block.note_block.chime_1 record @s[] ^-0.0 ^ ^ 0.061 0.66742 0.000
+playsound block.note_block.chime record @s[] ^-0.0 ^ ^ 0.160 1.78180 0.000
+playsound block.note_block.chime record @s[] ^-0.0 ^ ^ 0.160 2.00000 0.000
+playsound block.note_block.chime_1 record @s[] ^-0.0 ^ ^ 0.160 0.59460 0.000
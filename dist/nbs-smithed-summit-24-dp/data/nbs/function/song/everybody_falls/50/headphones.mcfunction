@@ -0,0 +1,5 @@
+playsound block.note_block.bit_1 record @s[] ^-0.4 ^ ^ 0.098 1.00000 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.35 ^ ^ 0.048 1.24186 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.45 ^ ^ 0.080 0.74915 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.4 ^ ^ 0.056 0.98566 0.000
+playsound block.note_block.chime record @s[] ^-0.0 ^ ^ 0.057 1.88775 0.000
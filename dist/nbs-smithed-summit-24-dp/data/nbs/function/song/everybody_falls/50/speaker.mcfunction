@@ -0,0 +1,5 @@
+playsound block.note_block.bit_1 record @a[distance=..6.12] ^0.0 ^ ^ 0.098 1.00000 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.07] ^0.0 ^ ^ 0.048 1.24186 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.26] ^0.0 ^ ^ 0.080 0.74915 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.12] ^0.0 ^ ^ 0.056 0.98566 0.000
+playsound block.note_block.chime record @a[distance=..6.02] ^0.0 ^ ^ 0.057 1.88775 0.000
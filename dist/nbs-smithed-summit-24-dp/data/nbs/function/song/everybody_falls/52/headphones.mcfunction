@@ -0,0 +1,9 @@
+playsound block.note_block.pling_-1 record @s[] ^-0.0 ^ ^ 0.162 1.58740 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.243 0.50000 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.5 ^ ^ 0.119 0.62996 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.45 ^ ^ 0.064 0.73841 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.55 ^ ^ 0.095 0.74915 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.5 ^ ^ 0.068 0.62093 0.000
+playsound block.note_block.chime_1 record @s[] ^-0.0 ^ ^ 0.053 0.62996 0.000
+playsound block.note_block.chime_1 record @s[] ^-0.0 ^ ^ 0.140 0.66742 0.000
+playsound block.note_block.chime record @s[] ^-0.0 ^ ^ 0.140 2.00000 0.000
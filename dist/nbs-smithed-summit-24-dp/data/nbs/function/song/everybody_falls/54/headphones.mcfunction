@@ -0,0 +1,8 @@
+playsound block.note_block.pling_-1 record @s[] ^-0.0 ^ ^ 0.174 1.58740 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.261 0.50000 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.6 ^ ^ 0.140 1.00000 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.55 ^ ^ 0.076 0.73841 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.65 ^ ^ 0.110 1.25992 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.6 ^ ^ 0.080 0.98566 0.000
+playsound block.note_block.chime_1 record @s[] ^-0.0 ^ ^ 0.053 0.56123 0.000
+playsound block.note_block.chime record @s[] ^-0.0 ^ ^ 0.130 1.49831 0.000
@@ -0,0 +1,11 @@
+playsound block.note_block.pling_-1 record @s[] ^-0.0 ^ ^ 0.186 1.58740 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.279 0.50000 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.7 ^ ^ 0.168 1.49831 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.65 ^ ^ 0.088 1.24186 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.75 ^ ^ 0.125 2.00000 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.7 ^ ^ 0.096 1.47683 0.000
+playsound block.note_block.chime_1 record @s[] ^-0.0 ^ ^ 0.049 0.70711 0.000
+playsound block.note_block.chime_1 record @s[] ^-0.0 ^ ^ 0.049 0.74915 0.000
+playsound block.note_block.chime_1 record @s[] ^-0.0 ^ ^ 0.120 0.62996 0.000
+playsound block.note_block.chime_1 record @s[] ^-0.0 ^ ^ 0.120 0.56123 0.000
+particle note ~ ~2.25 ~ 0 0 0 1 1
@@ -0,0 +1,8 @@
+playsound block.note_block.pling_-1 record @s[] ^-0.0 ^ ^ 0.198 1.58740 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.297 0.50000 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.8 ^ ^ 0.189 1.49831 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.75 ^ ^ 0.100 1.97133 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.85 ^ ^ 0.145 1.25992 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.8 ^ ^ 0.108 1.47683 0.000
+playsound block.note_block.chime_1 record @s[] ^-0.0 ^ ^ 0.120 0.52973 0.000
+playsound block.note_block.chime record @s[] ^-0.0 ^ ^ 0.120 1.88775 0.000
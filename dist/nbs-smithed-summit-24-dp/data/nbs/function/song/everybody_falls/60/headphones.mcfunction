@@ -0,0 +1,10 @@
+playsound block.note_block.pling_-1 record @s[] ^-0.0 ^ ^ 0.210 1.58740 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.315 0.50000 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.9 ^ ^ 0.210 1.00000 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.85 ^ ^ 0.116 1.24186 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.95 ^ ^ 0.160 0.74915 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.9 ^ ^ 0.120 0.98566 0.000
+playsound block.note_block.chime_1 record @s[] ^-0.0 ^ ^ 0.046 0.59460 0.000
+playsound block.note_block.chime_1 record @s[] ^-0.0 ^ ^ 0.046 0.66742 0.000
+playsound block.note_block.chime record @s[] ^-0.0 ^ ^ 0.110 1.33484 0.000
+playsound block.note_block.chime record @s[] ^-0.0 ^ ^ 0.110 1.41421 0.000
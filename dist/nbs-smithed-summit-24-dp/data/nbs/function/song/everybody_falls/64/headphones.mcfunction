@@ -0,0 +1,8 @@
+playsound block.note_block.pling_-1 record @s[] ^-0.0 ^ ^ 0.222 1.58740 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.333 0.50000 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.9 ^ ^ 0.259 1.00000 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.95 ^ ^ 0.140 0.73841 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.85 ^ ^ 0.190 1.25992 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.9 ^ ^ 0.148 0.98566 0.000
+playsound block.note_block.chime_1 record @s[] ^-0.0 ^ ^ 0.038 0.59460 0.000
+particle note ~ ~2.25 ~ 0 0 0 1 1
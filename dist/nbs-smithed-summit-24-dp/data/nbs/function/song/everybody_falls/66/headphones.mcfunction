@@ -0,0 +1,9 @@
+playsound block.note_block.pling_-1 record @s[] ^-0.0 ^ ^ 0.234 1.58740 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.351 0.50000 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.8 ^ ^ 0.280 1.49831 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.85 ^ ^ 0.152 1.24186 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.75 ^ ^ 0.205 2.00000 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.8 ^ ^ 0.160 1.47683 0.000
+playsound block.note_block.chime_1 record @s[] ^-0.0 ^ ^ 0.038 0.66742 0.000
+playsound block.note_block.chime_1 record @s[] ^-0.0 ^ ^ 0.090 0.59460 0.000
+playsound block.note_block.chime record @s[] ^-0.0 ^ ^ 0.090 1.78180 0.000
@@ -0,0 +1,10 @@
+playsound block.note_block.pling_-1 record @s[] ^-0.0 ^ ^ 0.246 1.58740 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.369 0.50000 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.7 ^ ^ 0.301 1.49831 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.75 ^ ^ 0.164 1.97133 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.65 ^ ^ 0.225 1.25992 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.7 ^ ^ 0.172 1.47683 0.000
+playsound block.note_block.chime record @s[] ^-0.0 ^ ^ 0.034 1.49831 0.000
+playsound block.note_block.chime_1 record @s[] ^-0.0 ^ ^ 0.034 0.59460 0.000
+playsound block.note_block.chime record @s[] ^-0.0 ^ ^ 0.034 1.68179 0.000
+playsound block.note_block.chime record @s[] ^-0.0 ^ ^ 0.080 2.00000 0.000
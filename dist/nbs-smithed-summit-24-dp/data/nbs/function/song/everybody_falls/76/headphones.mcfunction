@@ -0,0 +1,6 @@
+playsound block.note_block.bit_1 record @s[] ^-0.3 ^ ^ 0.392 1.49831 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.35 ^ ^ 0.216 1.24186 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.25 ^ ^ 0.290 2.00000 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.3 ^ ^ 0.224 1.47683 0.000
+playsound block.note_block.chime_1 record @s[] ^-0.0 ^ ^ 0.060 0.59460 0.000
+playsound block.note_block.chime record @s[] ^-0.0 ^ ^ 0.060 2.00000 0.000
@@ -0,0 +1,7 @@
+playsound block.note_block.pling_-1 record @s[] ^-0.0 ^ ^ 0.282 1.78180 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.423 0.56123 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.2 ^ ^ 0.413 1.49831 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.25 ^ ^ 0.232 1.97133 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.15 ^ ^ 0.305 1.25992 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.2 ^ ^ 0.236 1.47683 0.000
+playsound block.note_block.chime_1 record @s[] ^-0.0 ^ ^ 0.060 0.74915 0.000
@@ -0,0 +1,4 @@
+playsound block.note_block.chime_1 record @a[distance=..6.01] ^0.0 ^ ^ 0.092 0.59460 0.000
+playsound block.note_block.chime_1 record @a[distance=..6.01] ^0.0 ^ ^ 0.030 0.52973 0.000
+playsound block.note_block.chime_1 record @a[distance=..6.01] ^0.0 ^ ^ 0.292 0.52973 0.000
+playsound block.note_block.chime_1 record @a[distance=..6.01] ^0.0 ^ ^ 0.090 0.56123 0.000
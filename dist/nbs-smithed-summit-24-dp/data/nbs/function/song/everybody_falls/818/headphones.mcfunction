@@ -0,0 +1,7 @@
+playsound entity_witch_hurt1 record @s[] ^-0.0 ^ ^ 0.450 2.00000 0.000
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 0.800 0.50000 0.000
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 0.800 1.00000 0.000
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 0.400 2.00000 0.000
+playsound block.note_block.chime record @s[] ^-0.0 ^ ^ 0.004 0.94387 0.000
+playsound block.note_block.chime record @s[] ^-0.0 ^ ^ 0.065 1.49831 0.000
+playsound block.note_block.chime record @s[] ^-0.0 ^ ^ 0.065 1.33484 0.000
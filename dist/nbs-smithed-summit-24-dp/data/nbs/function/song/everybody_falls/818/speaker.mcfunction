@@ -0,0 +1,7 @@
+playsound entity_witch_hurt1 record @a[distance=..6.12] ^0.0 ^ ^ 0.450 2.00000 0.000
+playsound block.note_block.snare record @a[distance=..9.00] ^0.0 ^ ^ 0.800 0.50000 0.000
+playsound block.note_block.snare record @a[distance=..6.75] ^0.0 ^ ^ 0.800 1.00000 0.000
+playsound block.note_block.snare record @a[distance=..6.12] ^0.0 ^ ^ 0.400 2.00000 0.000
+playsound block.note_block.chime record @a[distance=..6.14] ^0.0 ^ ^ 0.004 0.94387 0.000
+playsound block.note_block.chime record @a[distance=..6.04] ^0.0 ^ ^ 0.065 1.49831 0.000
+playsound block.note_block.chime record @a[distance=..6.05] ^0.0 ^ ^ 0.065 1.33484 0.000
@@ -0,0 +1,2 @@
+playsound block.note_block.chime record @s[] ^-0.0 ^ ^ 0.057 1.88775 0.000
+particle note ~ ~2.25 ~ 0 0 0 1 1
@@ -0,0 +1,7 @@
+playsound block.note_block.bit_1 record @s[] ^-0.5 ^ ^ 0.119 0.56123 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.45 ^ ^ 0.064 0.65785 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.55 ^ ^ 0.095 0.66742 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.5 ^ ^ 0.068 0.55318 0.000
+playsound block.note_block.chime_1 record @s[] ^-0.0 ^ ^ 0.042 0.74915 0.000
+playsound block.note_block.chime record @s[] ^-0.0 ^ ^ 0.100 1.78180 0.000
+playsound block.note_block.chime_1 record @s[] ^-0.0 ^ ^ 0.100 0.66742 0.000
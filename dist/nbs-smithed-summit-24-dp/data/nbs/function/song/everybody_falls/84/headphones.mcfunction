@@ -0,0 +1,9 @@
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.312 0.50000 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.468 0.62996 0.000
+playsound block.note_block.bit_1 record @s[] ^0.1 ^ ^ 0.483 1.00000 0.000
+playsound block.note_block.bit_1 record @s[] ^0.05 ^ ^ 0.268 0.73841 0.000
+playsound block.note_block.bit_1 record @s[] ^0.15 ^ ^ 0.350 1.25992 0.000
+playsound block.note_block.bit_1 record @s[] ^0.1 ^ ^ 0.276 0.98566 0.000
+playsound block.note_block.chime record @s[] ^-0.0 ^ ^ 0.019 1.33484 0.000
+playsound block.note_block.chime record @s[] ^-0.0 ^ ^ 0.019 1.18921 0.000
+playsound block.note_block.chime_1 record @s[] ^-0.0 ^ ^ 0.040 0.62996 0.000
@@ -0,0 +1,15 @@
+playsound block.note_block.pling_-1 record @a[distance=..11.44] ^0.0 ^ ^ 0.900 1.78180 0.000
+playsound block.note_block.pling_-1 record @a[distance=..11.69] ^0.0 ^ ^ 0.800 1.41421 0.000
+playsound block.note_block.pling record @a[distance=..9.48] ^0.0 ^ ^ 0.125 0.89090 0.000
+playsound block.note_block.pling record @a[distance=..10.35] ^0.0 ^ ^ 0.125 0.70711 0.000
+playsound random_click_stereo record @a[distance=..6.16] ^0.0 ^ ^ 0.520 1.78180 0.000
+playsound block.note_block.snare record @a[distance=..6.19] ^0.0 ^ ^ 0.750 1.68179 0.000
+playsound block.note_block.snare record @a[distance=..6.12] ^0.0 ^ ^ 0.400 2.00000 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.05] ^1.0 ^ ^ 0.189 1.33484 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.03] ^1.0 ^ ^ 0.100 1.75625 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.09] ^1.0 ^ ^ 0.145 1.12246 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.06] ^1.0 ^ ^ 0.108 1.31570 0.000
+playsound block.note_block.chime record @a[distance=..6.04] ^0.0 ^ ^ 0.034 1.49831 0.000
+playsound block.note_block.chime_1 record @a[distance=..6.01] ^0.0 ^ ^ 0.034 0.59460 0.000
+playsound block.note_block.chime record @a[distance=..6.03] ^0.0 ^ ^ 0.034 1.68179 0.000
+playsound block.note_block.chime record @a[distance=..6.02] ^0.0 ^ ^ 0.080 2.00000 0.000
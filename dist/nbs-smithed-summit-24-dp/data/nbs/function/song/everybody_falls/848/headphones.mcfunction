@@ -0,0 +1,13 @@
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.900 0.50000 0.000
+playsound block.note_block.pling_-1 record @s[] ^-0.0 ^ ^ 0.800 1.58740 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.125 1.00000 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.125 0.79370 0.000
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 0.400 1.18921 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.9 ^ ^ 0.259 0.89090 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.95 ^ ^ 0.140 0.65785 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.85 ^ ^ 0.190 1.12246 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.9 ^ ^ 0.148 0.87813 0.000
+playsound block.note_block.chime record @s[] ^-0.0 ^ ^ 0.027 1.58740 0.000
+playsound block.note_block.chime record @s[] ^-0.0 ^ ^ 0.027 1.41421 0.000
+playsound block.note_block.chime_1 record @s[] ^-0.0 ^ ^ 0.070 0.62996 0.000
+particle note ~ ~2.25 ~ 0 0 0 1 1
@@ -0,0 +1,6 @@
+playsound block.note_block.bit_1 record @s[] ^-0.5 ^ ^ 0.350 0.56123 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.55 ^ ^ 0.192 0.65785 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.45 ^ ^ 0.255 0.66742 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.5 ^ ^ 0.200 0.55318 0.000
+playsound block.note_block.chime record @s[] ^-0.0 ^ ^ 0.019 1.78180 0.000
+particle note ~ ~2.25 ~ 0 0 0 1 1
@@ -0,0 +1,8 @@
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.324 0.50000 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.486 0.62996 0.000
+playsound block.note_block.bit_1 record @s[] ^0.2 ^ ^ 0.504 1.49831 0.000
+playsound block.note_block.bit_1 record @s[] ^0.15 ^ ^ 0.280 1.24186 0.000
+playsound block.note_block.bit_1 record @s[] ^0.25 ^ ^ 0.370 2.00000 0.000
+playsound block.note_block.bit_1 record @s[] ^0.2 ^ ^ 0.288 1.47683 0.000
+playsound block.note_block.chime_1 record @s[] ^-0.0 ^ ^ 0.015 0.62996 0.000
+playsound block.note_block.chime record @s[] ^-0.0 ^ ^ 0.040 1.88775 0.000
@@ -0,0 +1,13 @@
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.900 0.56123 0.000
+playsound block.note_block.pling_-1 record @s[] ^-0.0 ^ ^ 0.800 1.78180 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.125 1.12246 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.125 0.89090 0.000
+playsound block.note_block.basedrum record @s[] ^0.8 ^ ^ 0.150 1.41421 0.000
+playsound block.note_block.basedrum record @s[] ^0.8 ^ ^ 0.150 1.18921 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.1 ^ ^ 0.434 0.89090 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.15 ^ ^ 0.244 1.10637 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.05 ^ ^ 0.320 0.66742 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.1 ^ ^ 0.248 0.87813 0.000
+playsound block.note_block.chime record @s[] ^-0.0 ^ ^ 0.008 1.33484 0.000
+playsound block.note_block.chime record @s[] ^-0.0 ^ ^ 0.020 1.49831 0.000
+particle note ~ ~2.25 ~ 0 0 0 1 1
@@ -0,0 +1,7 @@
+playsound block.note_block.bit_1 record @s[] ^0.1 ^ ^ 0.483 0.89090 0.000
+playsound block.note_block.bit_1 record @s[] ^0.05 ^ ^ 0.268 0.65785 0.000
+playsound block.note_block.bit_1 record @s[] ^0.15 ^ ^ 0.350 1.12246 0.000
+playsound block.note_block.bit_1 record @s[] ^0.1 ^ ^ 0.276 0.87813 0.000
+playsound block.note_block.chime_1 record @s[] ^-0.0 ^ ^ 0.004 0.56123 0.000
+playsound block.note_block.chime record @s[] ^-0.0 ^ ^ 0.010 1.78180 0.000
+playsound block.note_block.chime record @s[] ^-0.0 ^ ^ 0.010 1.33484 0.000
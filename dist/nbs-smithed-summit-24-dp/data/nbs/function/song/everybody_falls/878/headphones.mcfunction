@@ -0,0 +1,15 @@
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.900 0.66742 0.000
+playsound block.note_block.pling_-1 record @s[] ^-0.0 ^ ^ 0.800 1.58740 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.125 1.33484 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.125 0.79370 0.000
+playsound block.note_block.basedrum record @s[] ^-0.0 ^ ^ 1.000 0.50000 0.000
+playsound block.note_block.basedrum record @s[] ^-0.0 ^ ^ 0.680 1.00000 0.000
+playsound dig_gravel1 record @s[] ^-0.25 ^ ^ 0.700 1.58740 0.000
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 0.400 1.41421 0.000
+playsound block.note_block.bit_1 record @s[] ^0.6 ^ ^ 0.595 0.89090 0.000
+playsound block.note_block.bit_1 record @s[] ^0.55 ^ ^ 0.332 0.65785 0.000
+playsound block.note_block.bit_1 record @s[] ^0.65 ^ ^ 0.435 1.12246 0.000
+playsound block.note_block.bit_1 record @s[] ^0.6 ^ ^ 0.340 0.87813 0.000
+playsound block.note_block.chime record @s[] ^-0.0 ^ ^ 0.004 1.58740 0.000
+playsound block.note_block.chime record @s[] ^-0.0 ^ ^ 0.004 1.41421 0.000
+playsound block.note_block.chime_1 record @s[] ^-0.0 ^ ^ 0.010 0.62996 0.000
@@ -0,0 +1,9 @@
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.336 0.50000 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.504 0.62996 0.000
+playsound block.note_block.bit_1 record @s[] ^0.3 ^ ^ 0.525 1.49831 0.000
+playsound block.note_block.bit_1 record @s[] ^0.25 ^ ^ 0.296 1.97133 0.000
+playsound block.note_block.bit_1 record @s[] ^0.35 ^ ^ 0.385 1.25992 0.000
+playsound block.note_block.bit_1 record @s[] ^0.3 ^ ^ 0.300 1.47683 0.000
+playsound block.note_block.chime_1 record @s[] ^-0.0 ^ ^ 0.011 0.56123 0.000
+playsound block.note_block.chime_1 record @s[] ^-0.0 ^ ^ 0.030 0.66742 0.000
+particle note ~ ~2.25 ~ 0 0 0 1 1
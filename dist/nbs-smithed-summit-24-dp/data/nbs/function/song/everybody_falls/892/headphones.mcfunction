@@ -0,0 +1,8 @@
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.900 0.52973 0.000
+playsound block.note_block.pling_-1 record @s[] ^-0.0 ^ ^ 0.800 1.41421 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.125 1.05946 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.125 0.70711 0.000
+playsound block.note_block.bit_1 record @s[] ^0.7 ^ ^ 0.700 1.33484 0.000
+playsound block.note_block.bit_1 record @s[] ^0.75 ^ ^ 0.400 1.75625 0.000
+playsound block.note_block.bit_1 record @s[] ^0.65 ^ ^ 0.500 1.12246 0.000
+playsound block.note_block.bit_1 record @s[] ^0.7 ^ ^ 0.400 1.31570 0.000
@@ -0,0 +1,8 @@
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.348 0.50000 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.522 0.62996 0.000
+playsound block.note_block.bit_1 record @s[] ^0.4 ^ ^ 0.553 1.00000 0.000
+playsound block.note_block.bit_1 record @s[] ^0.35 ^ ^ 0.308 1.24186 0.000
+playsound block.note_block.bit_1 record @s[] ^0.45 ^ ^ 0.400 0.74915 0.000
+playsound block.note_block.bit_1 record @s[] ^0.4 ^ ^ 0.316 0.98566 0.000
+playsound block.note_block.chime record @s[] ^-0.0 ^ ^ 0.008 1.33484 0.000
+playsound block.note_block.chime record @s[] ^-0.0 ^ ^ 0.020 1.49831 0.000
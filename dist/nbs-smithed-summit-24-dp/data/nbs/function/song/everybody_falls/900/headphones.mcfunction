@@ -0,0 +1,6 @@
+playsound block.note_block.basedrum record @s[] ^-0.0 ^ ^ 0.750 1.41421 0.000
+playsound block.note_block.basedrum record @s[] ^-0.0 ^ ^ 0.750 1.18921 0.000
+playsound block.note_block.bit_1 record @s[] ^0.3 ^ ^ 0.700 1.33484 0.000
+playsound block.note_block.bit_1 record @s[] ^0.35 ^ ^ 0.400 1.10637 0.000
+playsound block.note_block.bit_1 record @s[] ^0.25 ^ ^ 0.500 1.78180 0.000
+playsound block.note_block.bit_1 record @s[] ^0.3 ^ ^ 0.400 1.31570 0.000
@@ -0,0 +1,7 @@
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.360 0.50000 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.540 0.62996 0.000
+playsound block.note_block.bit_1 record @s[] ^0.5 ^ ^ 0.574 0.62996 0.000
+playsound block.note_block.bit_1 record @s[] ^0.45 ^ ^ 0.320 0.73841 0.000
+playsound block.note_block.bit_1 record @s[] ^0.55 ^ ^ 0.415 0.74915 0.000
+playsound block.note_block.bit_1 record @s[] ^0.5 ^ ^ 0.328 0.62093 0.000
+playsound block.note_block.chime record @s[] ^-0.0 ^ ^ 0.008 2.00000 0.000
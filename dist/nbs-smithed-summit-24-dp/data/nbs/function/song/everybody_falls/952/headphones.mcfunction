@@ -0,0 +1,5 @@
+playsound block.note_block.bit_1 record @s[] ^0.3 ^ ^ 0.700 1.33484 0.000
+playsound block.note_block.bit_1 record @s[] ^0.25 ^ ^ 0.400 1.75625 0.000
+playsound block.note_block.bit_1 record @s[] ^0.35 ^ ^ 0.500 1.12246 0.000
+playsound block.note_block.bit_1 record @s[] ^0.3 ^ ^ 0.400 1.31570 0.000
+particle note ~ ~2.25 ~ 0 0 0 1 1
@@ -0,0 +1,6 @@
+playsound block.note_block.basedrum record @s[] ^-0.0 ^ ^ 0.750 1.41421 0.000
+playsound block.note_block.basedrum record @s[] ^-0.0 ^ ^ 0.750 1.18921 0.000
+playsound block.note_block.bit_1 record @s[] ^0.9 ^ ^ 0.693 0.89090 0.000
+playsound block.note_block.bit_1 record @s[] ^0.85 ^ ^ 0.400 1.10637 0.000
+playsound block.note_block.bit_1 record @s[] ^0.95 ^ ^ 0.490 0.66742 0.000
+playsound block.note_block.bit_1 record @s[] ^0.9 ^ ^ 0.396 0.87813 0.000
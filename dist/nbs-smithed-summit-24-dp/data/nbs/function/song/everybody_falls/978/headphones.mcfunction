@@ -0,0 +1,9 @@
+playsound entity_witch_hurt1 record @s[] ^-0.0 ^ ^ 0.450 1.12246 0.000
+playsound entity_witch_hurt1 record @s[] ^-0.0 ^ ^ 0.450 1.12246 0.000
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 0.800 0.50000 0.000
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 0.800 1.00000 0.000
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 0.400 2.00000 0.000
+playsound block.note_block.bit_1 record @s[] ^0.4 ^ ^ 0.595 0.89090 0.000
+playsound block.note_block.bit_1 record @s[] ^0.45 ^ ^ 0.344 0.65785 0.000
+playsound block.note_block.bit_1 record @s[] ^0.35 ^ ^ 0.420 1.12246 0.000
+playsound block.note_block.bit_1 record @s[] ^0.4 ^ ^ 0.340 0.87813 0.000
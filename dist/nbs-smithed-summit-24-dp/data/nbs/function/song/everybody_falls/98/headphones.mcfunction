@@ -0,0 +1,10 @@
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.384 0.50000 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.576 0.62996 0.000
+playsound block.note_block.bit_1 record @s[] ^0.8 ^ ^ 0.637 1.49831 0.000
+playsound block.note_block.bit_1 record @s[] ^0.75 ^ ^ 0.360 1.97133 0.000
+playsound block.note_block.bit_1 record @s[] ^0.85 ^ ^ 0.465 1.25992 0.000
+playsound block.note_block.bit_1 record @s[] ^0.8 ^ ^ 0.364 1.47683 0.000
+playsound block.note_block.chime record @s[] ^-0.0 ^ ^ 0.000 1.33484 0.000
+playsound block.note_block.chime_1 record @s[] ^-0.0 ^ ^ 0.000 0.84090 0.000
+playsound block.note_block.chime_1 record @s[] ^-0.0 ^ ^ 0.000 0.74915 0.000
+playsound block.note_block.chime record @s[] ^-0.0 ^ ^ 0.010 2.00000 0.000
@@ -0,0 +1,5 @@
+playsound block.note_block.bit_1 record @s[] ^0.1 ^ ^ 0.553 0.89090 0.000
+playsound block.note_block.bit_1 record @s[] ^0.15 ^ ^ 0.320 1.10637 0.000
+playsound block.note_block.bit_1 record @s[] ^0.05 ^ ^ 0.390 0.66742 0.000
+playsound block.note_block.bit_1 record @s[] ^0.1 ^ ^ 0.316 0.87813 0.000
+particle note ~ ~2.25 ~ 0 0 0 1 1
@@ -0,0 +1,8 @@
+playsound block.note_block.pling_-1 record @s[] ^-0.0 ^ ^ 0.900 1.78180 0.000
+playsound block.note_block.pling_-1 record @s[] ^-0.0 ^ ^ 0.800 1.41421 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.125 0.89090 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.125 0.70711 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.1 ^ ^ 0.525 0.89090 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.05 ^ ^ 0.304 0.65785 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.15 ^ ^ 0.370 1.12246 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.1 ^ ^ 0.300 0.87813 0.000
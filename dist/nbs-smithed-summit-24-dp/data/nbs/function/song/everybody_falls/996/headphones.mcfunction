@@ -0,0 +1,4 @@
+playsound block.note_block.bit_1 record @s[] ^-0.5 ^ ^ 0.469 0.56123 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.45 ^ ^ 0.272 0.65785 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.55 ^ ^ 0.330 0.66742 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.5 ^ ^ 0.268 0.55318 0.000
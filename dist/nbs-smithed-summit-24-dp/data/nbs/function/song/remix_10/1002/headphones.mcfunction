@@ -0,0 +1,3 @@
+playsound block.note_block.didgeridoo record @s[] ^-0.0 ^ ^ 0.500 2.00000 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 1.000 1.00000 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 1.000 0.74915 0.000
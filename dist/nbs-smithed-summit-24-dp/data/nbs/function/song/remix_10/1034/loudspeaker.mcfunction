@@ -0,0 +1,3 @@
+playsound block.note_block.didgeridoo record @a[distance=..48.00] ^0.0 ^ ^ 1.399 1.12246 0.000
+playsound block.note_block.flute record @a[distance=..48.00] ^0.0 ^ ^ 2.473 0.56123 0.000
+playsound block.note_block.flute_-1 record @a[distance=..48.00] ^0.0 ^ ^ 2.541 1.68179 0.000
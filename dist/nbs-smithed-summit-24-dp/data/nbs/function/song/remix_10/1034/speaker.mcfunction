@@ -0,0 +1,3 @@
+playsound block.note_block.didgeridoo record @a[distance=..11.84] ^0.0 ^ ^ 0.500 1.12246 0.000
+playsound block.note_block.flute record @a[distance=..8.52] ^0.0 ^ ^ 1.000 0.56123 0.000
+playsound block.note_block.flute_-1 record @a[distance=..9.72] ^0.0 ^ ^ 1.000 1.68179 0.000
@@ -0,0 +1,10 @@
+playsound dig_gravel2 record @s[] ^-0.0 ^ ^ 0.500 1.00000 0.000
+playsound mob_silverfish_hit2 record @s[] ^-0.0 ^ ^ 0.100 1.00000 0.000
+playsound block.note_block.hat record @s[] ^-0.0 ^ ^ 1.000 0.70711 0.000
+playsound block.note_block.hat record @s[] ^-0.0 ^ ^ 1.000 0.59460 0.000
+playsound block.note_block.didgeridoo record @s[] ^-0.0 ^ ^ 1.000 1.12246 0.000
+playsound block.note_block.bass record @s[] ^-0.0 ^ ^ 1.000 0.56123 0.000
+playsound block.note_block.bass record @s[] ^-0.0 ^ ^ 1.000 1.10000 0.000
+playsound block.note_block.didgeridoo_1 record @s[] ^-0.0 ^ ^ 0.500 0.52973 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 1.000 1.05946 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 1.000 0.79370 0.000
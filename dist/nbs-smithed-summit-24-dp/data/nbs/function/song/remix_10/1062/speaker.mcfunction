@@ -0,0 +1,5 @@
+playsound block.note_block.basedrum record @a[distance=..11.69] ^0.0 ^ ^ 1.000 0.70711 0.000
+playsound block.note_block.basedrum record @a[distance=..11.81] ^0.0 ^ ^ 1.000 0.59460 0.000
+playsound block.note_block.didgeridoo_1 record @a[distance=..11.14] ^0.0 ^ ^ 0.500 0.52973 0.000
+playsound block.note_block.flute record @a[distance=..6.65] ^0.0 ^ ^ 1.000 1.05946 0.000
+playsound block.note_block.flute record @a[distance=..7.29] ^0.0 ^ ^ 1.000 0.79370 0.000
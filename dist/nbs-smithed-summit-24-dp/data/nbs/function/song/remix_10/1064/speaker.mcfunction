@@ -0,0 +1,24 @@
+playsound block.note_block.basedrum record @a[distance=..11.69] ^0.0 ^ ^ 1.000 0.70711 0.000
+playsound block.note_block.basedrum record @a[distance=..11.81] ^0.0 ^ ^ 1.000 0.59460 0.000
+playsound block.note_block.snare_-1 record @a[distance=..9.94] ^0.0 ^ ^ 1.000 1.58740 0.000
+playsound fireworks_blast_far1 record @a[distance=..6.48] ^0.0 ^ ^ 1.000 1.18921 0.000
+playsound fireworks_blast_far1 record @a[distance=..6.31] ^0.0 ^ ^ 1.000 1.41421 0.000
+playsound block.note_block.didgeridoo record @a[distance=..11.86] ^0.0 ^ ^ 1.000 1.05946 0.000
+playsound block.note_block.bass record @a[distance=..11.98] ^0.0 ^ ^ 1.000 0.52973 0.000
+playsound block.note_block.bass record @a[distance=..11.87] ^0.0 ^ ^ 1.000 1.03826 0.000
+playsound block.note_block.didgeridoo record @a[distance=..11.25] ^0.0 ^ ^ 0.500 2.00000 0.000
+playsound block.note_block.flute record @a[distance=..6.75] ^0.0 ^ ^ 1.000 1.00000 0.000
+playsound block.note_block.banjo record @a[distance=..6.75] ^0.0 ^ ^ 1.000 2.00000 0.000
+playsound block.note_block.banjo record @a[distance=..9.00] ^0.0 ^ ^ 0.700 1.00000 0.000
+playsound block.note_block.guitar record @a[distance=..9.00] ^0.0 ^ ^ 0.200 2.00000 0.000
+playsound block.note_block.guitar record @a[distance=..11.25] ^0.0 ^ ^ 0.200 1.00000 0.000
+playsound block.note_block.banjo record @a[distance=..7.46] ^0.0 ^ ^ 0.300 1.49831 0.000
+playsound block.note_block.banjo record @a[distance=..10.15] ^0.0 ^ ^ 0.800 0.74915 0.000
+playsound block.note_block.guitar record @a[distance=..11.64] ^0.0 ^ ^ 0.700 0.74915 0.000
+playsound block.note_block.guitar record @a[distance=..10.15] ^0.0 ^ ^ 0.600 1.49831 0.000
+playsound block.note_block.flute record @a[distance=..7.46] ^0.0 ^ ^ 1.000 0.74915 0.000
+execute store result score #random nbs run random value 1..4
+execute if score #random nbs matches 1 if entity @a[distance=0..12] run function animated_java:music_speaker/animations/animation_speaker_beat_1/play
+execute if score #random nbs matches 2 if entity @a[distance=0..12] run function animated_java:music_speaker/animations/animation_speaker_beat_2/play
+execute if score #random nbs matches 3 if entity @a[distance=0..12] run function animated_java:music_speaker/animations/animation_speaker_beat_3/play
+execute if score #random nbs matches 4 if entity @a[distance=0..12] run function animated_java:music_speaker/animations/animation_speaker_beat_4/play
@@ -0,0 +1,10 @@
+playsound dig_gravel2 record @a[distance=..6.75] ^0.0 ^ ^ 0.500 1.00000 0.000
+playsound mob_silverfish_hit2 record @a[distance=..6.75] ^0.0 ^ ^ 0.100 1.00000 0.000
+playsound block.note_block.hat record @a[distance=..10.35] ^0.0 ^ ^ 1.000 0.70711 0.000
+playsound block.note_block.hat record @a[distance=..10.87] ^0.0 ^ ^ 1.000 0.59460 0.000
+playsound block.note_block.didgeridoo record @a[distance=..11.84] ^0.0 ^ ^ 1.000 1.12246 0.000
+playsound block.note_block.bass record @a[distance=..11.98] ^0.0 ^ ^ 1.000 0.56123 0.000
+playsound block.note_block.bass record @a[distance=..11.84] ^0.0 ^ ^ 1.000 1.10000 0.000
+playsound block.note_block.didgeridoo record @a[distance=..11.58] ^0.0 ^ ^ 0.500 1.58740 0.000
+playsound block.note_block.flute record @a[distance=..7.29] ^0.0 ^ ^ 1.000 0.79370 0.000
+playsound block.note_block.flute record @a[distance=..8.28] ^0.0 ^ ^ 1.000 0.59460 0.000
@@ -0,0 +1,18 @@
+playsound dig_gravel2 record @s[] ^-0.0 ^ ^ 0.500 1.00000 0.000
+playsound mob_silverfish_hit2 record @s[] ^-0.0 ^ ^ 0.100 1.00000 0.000
+playsound block.note_block.hat record @s[] ^-0.0 ^ ^ 1.000 0.70711 0.000
+playsound block.note_block.hat record @s[] ^-0.0 ^ ^ 1.000 0.59460 0.000
+playsound block.note_block.didgeridoo record @s[] ^-0.0 ^ ^ 1.000 1.12246 0.000
+playsound block.note_block.bass record @s[] ^-0.0 ^ ^ 1.000 0.56123 0.000
+playsound block.note_block.bass record @s[] ^-0.0 ^ ^ 1.000 1.10000 0.000
+playsound block.note_block.didgeridoo record @s[] ^-0.0 ^ ^ 0.500 1.05946 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 1.000 0.52973 0.000
+playsound block.note_block.banjo record @s[] ^-0.0 ^ ^ 1.000 1.05946 0.000
+playsound block.note_block.banjo record @s[] ^-0.0 ^ ^ 0.700 0.52973 0.000
+playsound block.note_block.guitar record @s[] ^-0.0 ^ ^ 0.200 1.05946 0.000
+playsound block.note_block.guitar record @s[] ^-0.0 ^ ^ 0.200 0.52973 0.000
+playsound block.note_block.banjo record @s[] ^-0.0 ^ ^ 0.300 0.79370 0.000
+playsound block.note_block.banjo_-1 record @s[] ^-0.0 ^ ^ 0.800 1.58740 0.000
+playsound block.note_block.guitar_-1 record @s[] ^-0.0 ^ ^ 0.700 1.58740 0.000
+playsound block.note_block.guitar record @s[] ^-0.0 ^ ^ 0.600 0.79370 0.000
+playsound block.note_block.flute_-1 record @s[] ^-0.0 ^ ^ 1.000 1.58740 0.000
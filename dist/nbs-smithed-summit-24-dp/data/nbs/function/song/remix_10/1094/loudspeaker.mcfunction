@@ -0,0 +1,13 @@
+playsound block.note_block.basedrum record @a[distance=..48.00] ^0.0 ^ ^ 2.743 0.70711 0.000
+playsound block.note_block.basedrum record @a[distance=..48.00] ^0.0 ^ ^ 2.784 0.59460 0.000
+playsound block.note_block.didgeridoo record @a[distance=..48.00] ^0.0 ^ ^ 1.385 1.25992 0.000
+playsound block.note_block.flute record @a[distance=..48.00] ^0.0 ^ ^ 2.446 0.62996 0.000
+playsound block.note_block.banjo record @a[distance=..48.00] ^0.0 ^ ^ 2.446 1.25992 0.000
+playsound block.note_block.banjo record @a[distance=..48.00] ^0.0 ^ ^ 1.826 0.62996 0.000
+playsound block.note_block.guitar record @a[distance=..48.00] ^0.0 ^ ^ 0.522 1.25992 0.000
+playsound block.note_block.guitar record @a[distance=..48.00] ^0.0 ^ ^ 0.554 0.62996 0.000
+playsound block.note_block.banjo record @a[distance=..48.00] ^0.0 ^ ^ 0.754 0.94387 0.000
+playsound block.note_block.banjo_-1 record @a[distance=..48.00] ^0.0 ^ ^ 2.141 1.88775 0.000
+playsound block.note_block.guitar_-1 record @a[distance=..48.00] ^0.0 ^ ^ 1.986 1.88775 0.000
+playsound block.note_block.guitar record @a[distance=..48.00] ^0.0 ^ ^ 1.605 0.94387 0.000
+playsound block.note_block.flute_-1 record @a[distance=..48.00] ^0.0 ^ ^ 2.514 1.88775 0.000
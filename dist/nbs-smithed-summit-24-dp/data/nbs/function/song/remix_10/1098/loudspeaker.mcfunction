@@ -0,0 +1,3 @@
+playsound block.note_block.didgeridoo record @a[distance=..48.00] ^0.0 ^ ^ 1.372 1.41421 0.000
+playsound block.note_block.flute record @a[distance=..48.00] ^0.0 ^ ^ 2.419 0.70711 0.000
+playsound block.note_block.flute record @a[distance=..48.00] ^0.0 ^ ^ 2.486 0.52973 0.000
@@ -0,0 +1,3 @@
+playsound block.note_block.didgeridoo record @a[distance=..11.69] ^0.0 ^ ^ 0.500 1.41421 0.000
+playsound block.note_block.flute record @a[distance=..7.65] ^0.0 ^ ^ 1.000 0.70711 0.000
+playsound block.note_block.flute record @a[distance=..8.76] ^0.0 ^ ^ 1.000 0.52973 0.000
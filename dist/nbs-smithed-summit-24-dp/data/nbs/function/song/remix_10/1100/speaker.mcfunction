@@ -0,0 +1,18 @@
+playsound dig_gravel2 record @a[distance=..6.75] ^0.0 ^ ^ 0.500 1.00000 0.000
+playsound mob_silverfish_hit2 record @a[distance=..6.75] ^0.0 ^ ^ 0.100 1.00000 0.000
+playsound block.note_block.hat record @a[distance=..10.35] ^0.0 ^ ^ 1.000 0.70711 0.000
+playsound block.note_block.hat record @a[distance=..10.87] ^0.0 ^ ^ 1.000 0.59460 0.000
+playsound block.note_block.didgeridoo record @a[distance=..11.84] ^0.0 ^ ^ 1.000 1.12246 0.000
+playsound block.note_block.bass record @a[distance=..11.98] ^0.0 ^ ^ 1.000 0.56123 0.000
+playsound block.note_block.bass record @a[distance=..11.84] ^0.0 ^ ^ 1.000 1.10000 0.000
+playsound block.note_block.didgeridoo record @a[distance=..11.77] ^0.0 ^ ^ 0.500 1.25992 0.000
+playsound block.note_block.flute record @a[distance=..8.06] ^0.0 ^ ^ 1.000 0.62996 0.000
+playsound block.note_block.banjo record @a[distance=..8.06] ^0.0 ^ ^ 1.000 1.25992 0.000
+playsound block.note_block.banjo record @a[distance=..10.71] ^0.0 ^ ^ 0.700 0.62996 0.000
+playsound block.note_block.guitar record @a[distance=..10.71] ^0.0 ^ ^ 0.200 1.25992 0.000
+playsound block.note_block.guitar record @a[distance=..11.77] ^0.0 ^ ^ 0.200 0.62996 0.000
+playsound block.note_block.banjo record @a[distance=..9.24] ^0.0 ^ ^ 0.300 0.94387 0.000
+playsound block.note_block.banjo_-1 record @a[distance=..11.35] ^0.0 ^ ^ 0.800 1.88775 0.000
+playsound block.note_block.guitar_-1 record @a[distance=..11.90] ^0.0 ^ ^ 0.700 1.88775 0.000
+playsound block.note_block.guitar record @a[distance=..11.35] ^0.0 ^ ^ 0.600 0.94387 0.000
+playsound block.note_block.flute_-1 record @a[distance=..9.24] ^0.0 ^ ^ 1.000 1.88775 0.000
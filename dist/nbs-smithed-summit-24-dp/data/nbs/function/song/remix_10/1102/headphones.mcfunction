@@ -0,0 +1,13 @@
+playsound block.note_block.basedrum record @s[] ^-0.0 ^ ^ 1.000 0.70711 0.000
+playsound block.note_block.basedrum record @s[] ^-0.0 ^ ^ 1.000 0.59460 0.000
+playsound block.note_block.didgeridoo record @s[] ^-0.0 ^ ^ 0.500 1.12246 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 1.000 0.56123 0.000
+playsound block.note_block.banjo record @s[] ^-0.0 ^ ^ 1.000 1.12246 0.000
+playsound block.note_block.banjo record @s[] ^-0.0 ^ ^ 0.700 0.56123 0.000
+playsound block.note_block.guitar record @s[] ^-0.0 ^ ^ 0.200 1.12246 0.000
+playsound block.note_block.guitar record @s[] ^-0.0 ^ ^ 0.200 0.56123 0.000
+playsound block.note_block.banjo record @s[] ^-0.0 ^ ^ 0.300 0.84090 0.000
+playsound block.note_block.banjo_-1 record @s[] ^-0.0 ^ ^ 0.800 1.68179 0.000
+playsound block.note_block.guitar_-1 record @s[] ^-0.0 ^ ^ 0.700 1.68179 0.000
+playsound block.note_block.guitar record @s[] ^-0.0 ^ ^ 0.600 0.84090 0.000
+playsound block.note_block.flute_-1 record @s[] ^-0.0 ^ ^ 1.000 1.68179 0.000
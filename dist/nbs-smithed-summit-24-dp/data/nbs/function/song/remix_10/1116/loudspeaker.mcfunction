@@ -0,0 +1,10 @@
+playsound dig_gravel2 record @a[distance=..48.00] ^0.0 ^ ^ 1.169 1.00000 0.000
+playsound mob_silverfish_hit2 record @a[distance=..48.00] ^0.0 ^ ^ 0.234 1.00000 0.000
+playsound block.note_block.hat record @a[distance=..48.00] ^0.0 ^ ^ 2.581 0.70711 0.000
+playsound block.note_block.hat record @a[distance=..48.00] ^0.0 ^ ^ 2.622 0.59460 0.000
+playsound block.note_block.didgeridoo record @a[distance=..48.00] ^0.0 ^ ^ 2.838 0.94387 0.000
+playsound block.note_block.bass_-1 record @a[distance=..48.00] ^0.0 ^ ^ 3.000 1.88775 0.000
+playsound block.note_block.bass record @a[distance=..48.00] ^0.0 ^ ^ 2.843 0.92498 0.000
+playsound block.note_block.didgeridoo record @a[distance=..48.00] ^0.0 ^ ^ 1.405 1.05946 0.000
+playsound block.note_block.flute record @a[distance=..48.00] ^0.0 ^ ^ 2.486 0.52973 0.000
+playsound block.note_block.flute_-1 record @a[distance=..48.00] ^0.0 ^ ^ 2.554 1.58740 0.000
@@ -0,0 +1,10 @@
+playsound block.note_block.basedrum record @s[] ^-0.0 ^ ^ 1.000 0.70711 0.000
+playsound block.note_block.basedrum record @s[] ^-0.0 ^ ^ 1.000 0.59460 0.000
+playsound block.note_block.bass record @s[] ^-0.0 ^ ^ 1.000 0.66742 0.000
+playsound block.note_block.bass record @s[] ^-0.0 ^ ^ 1.000 0.65406 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 1.000 1.05946 0.000
+playsound block.note_block.pling_1 record @s[] ^-0.0 ^ ^ 1.000 0.52973 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.0 ^ ^ 1.000 0.52973 0.000
+playsound block.note_block.xylophone record @s[] ^-0.0 ^ ^ 0.135 0.79370 0.000
+playsound block.note_block.guitar record @s[] ^-0.0 ^ ^ 0.100 0.79370 0.000
+particle note ~ ~2.25 ~ 0 0 0 1 1
@@ -0,0 +1,11 @@
+playsound block.note_block.basedrum record @s[] ^-0.0 ^ ^ 1.000 0.70711 0.000
+playsound block.note_block.basedrum record @s[] ^-0.0 ^ ^ 1.000 0.59460 0.000
+playsound block.note_block.didgeridoo record @s[] ^-0.0 ^ ^ 1.000 1.05946 0.000
+playsound block.note_block.bass record @s[] ^-0.0 ^ ^ 1.000 0.52973 0.000
+playsound block.note_block.bass record @s[] ^-0.0 ^ ^ 1.000 1.03826 0.000
+playsound block.note_block.didgeridoo record @s[] ^-0.0 ^ ^ 0.480 1.05946 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.960 0.52973 0.000
+playsound block.note_block.flute_-1 record @s[] ^-0.0 ^ ^ 0.930 1.58740 0.000
+playsound mob_silverfish_hit2 record @s[] ^-0.0 ^ ^ 0.100 1.49831 0.000
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 1.000 1.05946 0.000
+particle note ~ ~2.25 ~ 0 0 0 1 1
@@ -0,0 +1,5 @@
+playsound block.note_block.didgeridoo record @a[distance=..48.00] ^0.0 ^ ^ 1.293 1.05946 0.000
+playsound block.note_block.flute record @a[distance=..48.00] ^0.0 ^ ^ 2.312 0.52973 0.000
+playsound block.note_block.flute_-1 record @a[distance=..48.00] ^0.0 ^ ^ 2.299 1.58740 0.000
+playsound mob_silverfish_hit2 record @a[distance=..48.00] ^0.0 ^ ^ 0.226 1.41421 0.000
+playsound block.note_block.snare record @a[distance=..48.00] ^0.0 ^ ^ 2.324 1.05946 0.000
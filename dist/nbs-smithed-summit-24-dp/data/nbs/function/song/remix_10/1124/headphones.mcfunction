@@ -0,0 +1,12 @@
+playsound dig_gravel2 record @s[] ^-0.0 ^ ^ 0.500 1.00000 0.000
+playsound mob_silverfish_hit2 record @s[] ^-0.0 ^ ^ 0.100 1.00000 0.000
+playsound block.note_block.hat record @s[] ^-0.0 ^ ^ 1.000 0.70711 0.000
+playsound block.note_block.hat record @s[] ^-0.0 ^ ^ 1.000 0.59460 0.000
+playsound block.note_block.didgeridoo_1 record @s[] ^-0.0 ^ ^ 1.000 0.52973 0.000
+playsound block.note_block.bass record @s[] ^-0.0 ^ ^ 1.000 1.05946 0.000
+playsound block.note_block.bass_1 record @s[] ^-0.0 ^ ^ 1.000 0.51913 0.000
+playsound block.note_block.didgeridoo record @s[] ^-0.0 ^ ^ 0.450 1.05946 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.900 0.52973 0.000
+playsound block.note_block.flute_-1 record @s[] ^-0.0 ^ ^ 0.870 1.58740 0.000
+playsound mob_silverfish_hit2 record @s[] ^-0.0 ^ ^ 0.100 1.33484 0.000
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 1.000 1.05946 0.000
@@ -0,0 +1,7 @@
+playsound block.note_block.basedrum record @a[distance=..11.69] ^0.0 ^ ^ 1.000 0.70711 0.000
+playsound block.note_block.basedrum record @a[distance=..11.81] ^0.0 ^ ^ 1.000 0.59460 0.000
+playsound block.note_block.didgeridoo record @a[distance=..11.86] ^0.0 ^ ^ 0.430 1.05946 0.000
+playsound block.note_block.flute record @a[distance=..8.76] ^0.0 ^ ^ 0.870 0.52973 0.000
+playsound block.note_block.flute_-1 record @a[distance=..9.94] ^0.0 ^ ^ 0.830 1.58740 0.000
+playsound mob_silverfish_hit2 record @a[distance=..6.42] ^0.0 ^ ^ 0.100 1.25992 0.000
+playsound block.note_block.snare record @a[distance=..6.65] ^0.0 ^ ^ 1.000 1.05946 0.000
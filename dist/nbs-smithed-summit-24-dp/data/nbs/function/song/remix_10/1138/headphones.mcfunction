@@ -0,0 +1,5 @@
+playsound block.note_block.didgeridoo record @s[] ^-0.0 ^ ^ 0.330 1.05946 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.670 0.52973 0.000
+playsound block.note_block.flute_-1 record @s[] ^-0.0 ^ ^ 0.640 1.58740 0.000
+playsound mob_silverfish_hit2 record @s[] ^-0.0 ^ ^ 0.100 0.94387 0.000
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 1.000 0.89090 0.000
@@ -0,0 +1,13 @@
+playsound block.note_block.snare record @a[distance=..48.00] ^0.0 ^ ^ 2.419 0.70711 0.000
+playsound block.note_block.flute record @a[distance=..48.00] ^0.0 ^ ^ 1.162 1.05946 0.000
+playsound block.note_block.pling_1 record @a[distance=..48.00] ^0.0 ^ ^ 1.162 0.52973 0.000
+playsound block.note_block.bit_1 record @a[distance=..48.00] ^0.0 ^ ^ 1.162 0.52973 0.000
+playsound block.note_block.guitar_1 record @a[distance=..48.00] ^0.0 ^ ^ 0.590 0.59460 0.000
+playsound block.note_block.guitar_1 record @a[distance=..48.00] ^0.0 ^ ^ 0.511 0.66742 0.000
+playsound block.note_block.guitar_1 record @a[distance=..48.00] ^0.0 ^ ^ 0.431 0.79370 0.000
+playsound block.note_block.harp record @a[distance=..48.00] ^0.0 ^ ^ 0.738 1.18921 0.000
+playsound block.note_block.harp record @a[distance=..48.00] ^0.0 ^ ^ 0.730 1.33484 0.000
+playsound block.note_block.harp record @a[distance=..48.00] ^0.0 ^ ^ 0.718 1.58740 0.000
+playsound block.note_block.pling record @a[distance=..48.00] ^0.0 ^ ^ 0.295 1.18921 0.000
+playsound block.note_block.pling record @a[distance=..48.00] ^0.0 ^ ^ 0.292 1.33484 0.000
+playsound block.note_block.pling record @a[distance=..48.00] ^0.0 ^ ^ 0.359 1.58740 0.000
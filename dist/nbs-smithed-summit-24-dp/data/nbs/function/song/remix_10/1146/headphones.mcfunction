@@ -0,0 +1,5 @@
+playsound block.note_block.didgeridoo record @s[] ^-0.0 ^ ^ 0.270 1.05946 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.540 0.52973 0.000
+playsound block.note_block.flute_-1 record @s[] ^-0.0 ^ ^ 0.510 1.58740 0.000
+playsound mob_silverfish_hit2 record @s[] ^-0.0 ^ ^ 0.100 0.74915 0.000
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 1.000 0.59460 0.000
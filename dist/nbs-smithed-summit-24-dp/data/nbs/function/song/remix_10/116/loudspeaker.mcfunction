@@ -0,0 +1,21 @@
+playsound dig_gravel2 record @a[distance=..48.00] ^0.0 ^ ^ 1.169 1.00000 0.000
+playsound mob_silverfish_hit2 record @a[distance=..48.00] ^0.0 ^ ^ 0.234 1.00000 0.000
+playsound block.note_block.hat record @a[distance=..48.00] ^0.0 ^ ^ 2.581 0.70711 0.000
+playsound block.note_block.hat record @a[distance=..48.00] ^0.0 ^ ^ 2.622 0.59460 0.000
+playsound block.note_block.snare record @a[distance=..48.00] ^0.0 ^ ^ 2.365 0.89090 0.000
+playsound block.note_block.bass record @a[distance=..48.00] ^0.0 ^ ^ 2.757 1.33484 0.000
+playsound block.note_block.bass record @a[distance=..48.00] ^0.0 ^ ^ 2.761 1.30812 0.000
+playsound block.note_block.flute record @a[distance=..48.00] ^0.0 ^ ^ 2.351 0.94387 0.000
+playsound block.note_block.pling record @a[distance=..48.00] ^0.0 ^ ^ 2.351 1.88775 0.000
+playsound block.note_block.bit record @a[distance=..48.00] ^0.0 ^ ^ 2.351 1.88775 0.000
+playsound block.note_block.xylophone record @a[distance=..48.00] ^0.0 ^ ^ 0.669 0.79370 0.000
+playsound block.note_block.guitar_1 record @a[distance=..48.00] ^0.0 ^ ^ 1.968 0.59460 0.000
+playsound block.note_block.guitar_1 record @a[distance=..48.00] ^0.0 ^ ^ 1.703 0.66742 0.000
+playsound block.note_block.guitar_1 record @a[distance=..48.00] ^0.0 ^ ^ 1.435 0.79370 0.000
+playsound block.note_block.harp record @a[distance=..48.00] ^0.0 ^ ^ 2.459 1.18921 0.000
+playsound block.note_block.harp record @a[distance=..48.00] ^0.0 ^ ^ 2.432 1.33484 0.000
+playsound block.note_block.harp record @a[distance=..48.00] ^0.0 ^ ^ 2.392 1.58740 0.000
+playsound block.note_block.pling record @a[distance=..48.00] ^0.0 ^ ^ 0.984 1.18921 0.000
+playsound block.note_block.pling record @a[distance=..48.00] ^0.0 ^ ^ 0.973 1.33484 0.000
+playsound block.note_block.pling record @a[distance=..48.00] ^0.0 ^ ^ 1.196 1.58740 0.000
+playsound block.note_block.guitar record @a[distance=..48.00] ^0.0 ^ ^ 0.272 0.79370 0.000
@@ -0,0 +1,10 @@
+playsound block.note_block.bass record @a[distance=..11.58] ^0.0 ^ ^ 1.000 1.58740 0.000
+playsound block.note_block.bass record @a[distance=..11.44] ^0.0 ^ ^ 1.000 1.78180 0.000
+playsound block.note_block.bass record @a[distance=..11.35] ^0.0 ^ ^ 1.000 1.88775 0.000
+playsound block.note_block.bass record @a[distance=..11.35] ^0.0 ^ ^ 1.000 1.88775 0.000
+playsound block.note_block.didgeridoo record @a[distance=..11.86] ^0.0 ^ ^ 0.080 1.05946 0.000
+playsound block.note_block.flute record @a[distance=..8.76] ^0.0 ^ ^ 0.160 0.52973 0.000
+playsound block.note_block.flute_-1 record @a[distance=..9.94] ^0.0 ^ ^ 0.120 1.58740 0.000
+playsound mob_silverfish_hit2 record @a[distance=..9.00] ^0.0 ^ ^ 0.033 0.50000 0.000
+playsound block.note_block.snare_-1 record @a[distance=..11.58] ^0.0 ^ ^ 0.330 0.79370 0.000
+playsound block.note_block.basedrum record @a[distance=..11.58] ^0.0 ^ ^ 1.000 0.79370 0.000
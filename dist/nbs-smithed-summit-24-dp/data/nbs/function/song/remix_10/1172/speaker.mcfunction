@@ -0,0 +1,14 @@
+playsound dig_gravel2 record @a[distance=..6.75] ^0.0 ^ ^ 0.500 1.00000 0.000
+playsound mob_silverfish_hit2 record @a[distance=..6.75] ^0.0 ^ ^ 0.100 1.00000 0.000
+playsound block.note_block.hat record @a[distance=..10.35] ^0.0 ^ ^ 1.000 0.70711 0.000
+playsound block.note_block.hat record @a[distance=..10.87] ^0.0 ^ ^ 1.000 0.59460 0.000
+playsound block.note_block.bass record @a[distance=..11.35] ^0.0 ^ ^ 1.000 1.88775 0.000
+playsound block.note_block.bass record @a[distance=..11.35] ^0.0 ^ ^ 1.000 1.88775 0.000
+playsound block.note_block.bass record @a[distance=..11.35] ^0.0 ^ ^ 1.000 1.88775 0.000
+playsound block.note_block.bass record @a[distance=..11.35] ^0.0 ^ ^ 1.000 1.88775 0.000
+playsound block.note_block.didgeridoo record @a[distance=..11.86] ^0.0 ^ ^ 0.060 1.05946 0.000
+playsound block.note_block.flute record @a[distance=..8.76] ^0.0 ^ ^ 0.120 0.52973 0.000
+playsound block.note_block.flute_-1 record @a[distance=..9.94] ^0.0 ^ ^ 0.090 1.58740 0.000
+playsound mob_silverfish_hit2 record @a[distance=..9.00] ^0.0 ^ ^ 0.022 0.50000 0.000
+playsound block.note_block.snare_-1 record @a[distance=..11.58] ^0.0 ^ ^ 0.220 0.79370 0.000
+playsound block.note_block.basedrum record @a[distance=..11.58] ^0.0 ^ ^ 1.000 0.79370 0.000
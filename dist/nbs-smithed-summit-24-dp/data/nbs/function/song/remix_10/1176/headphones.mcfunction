@@ -0,0 +1,16 @@
+playsound block.note_block.basedrum record @s[] ^-0.0 ^ ^ 1.000 0.70711 0.000
+playsound block.note_block.basedrum record @s[] ^-0.0 ^ ^ 1.000 0.59460 0.000
+playsound block.note_block.snare_-1 record @s[] ^-0.0 ^ ^ 1.000 1.58740 0.000
+playsound fireworks_blast_far1 record @s[] ^-0.0 ^ ^ 1.000 1.18921 0.000
+playsound fireworks_blast_far1 record @s[] ^-0.0 ^ ^ 1.000 1.41421 0.000
+playsound block.note_block.bass record @s[] ^-0.0 ^ ^ 1.000 1.18921 0.000
+playsound block.note_block.bass record @s[] ^-0.0 ^ ^ 1.000 1.05946 0.000
+playsound block.note_block.bass record @s[] ^-0.0 ^ ^ 1.000 0.94387 0.000
+playsound block.note_block.bass record @s[] ^-0.0 ^ ^ 1.000 0.89090 0.000
+playsound block.note_block.didgeridoo record @s[] ^-0.0 ^ ^ 0.030 1.05946 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.060 0.52973 0.000
+playsound block.note_block.flute_-1 record @s[] ^-0.0 ^ ^ 0.030 1.58740 0.000
+playsound mob_silverfish_hit2 record @s[] ^-0.0 ^ ^ 0.006 0.50000 0.000
+playsound block.note_block.snare_-1 record @s[] ^-0.0 ^ ^ 0.060 0.79370 0.000
+playsound block.note_block.basedrum record @s[] ^-0.0 ^ ^ 1.000 0.79370 0.000
+particle note ~ ~2.25 ~ 0 0 0 1 1
@@ -0,0 +1,4 @@
+playsound block.note_block.flute record @a[distance=..48.00] ^0.0 ^ ^ 2.351 0.94387 0.000
+playsound block.note_block.bell_-1 record @a[distance=..48.00] ^0.0 ^ ^ 2.351 1.88775 0.000
+playsound block.note_block.iron_xylophone record @a[distance=..48.00] ^0.0 ^ ^ 2.351 1.88775 0.000
+playsound block.note_block.cow_bell record @a[distance=..48.00] ^0.0 ^ ^ 1.759 0.94387 0.000
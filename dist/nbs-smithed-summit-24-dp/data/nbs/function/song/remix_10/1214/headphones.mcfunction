@@ -0,0 +1,4 @@
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 1.000 0.79370 0.000
+playsound block.note_block.bell_-1 record @s[] ^-0.0 ^ ^ 1.000 1.58740 0.000
+playsound block.note_block.iron_xylophone record @s[] ^-0.0 ^ ^ 1.000 1.58740 0.000
+playsound block.note_block.cow_bell record @s[] ^-0.0 ^ ^ 0.700 0.79370 0.000
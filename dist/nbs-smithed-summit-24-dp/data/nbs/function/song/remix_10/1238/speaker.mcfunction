@@ -0,0 +1,4 @@
+playsound block.note_block.flute record @a[distance=..6.65] ^0.0 ^ ^ 1.000 1.05946 0.000
+playsound block.note_block.bell record @a[distance=..6.65] ^0.0 ^ ^ 1.000 0.52973 0.000
+playsound block.note_block.iron_xylophone_1 record @a[distance=..6.65] ^0.0 ^ ^ 1.000 0.52973 0.000
+playsound block.note_block.cow_bell record @a[distance=..8.76] ^0.0 ^ ^ 0.700 1.05946 0.000
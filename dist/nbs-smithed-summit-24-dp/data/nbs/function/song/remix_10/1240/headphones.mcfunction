@@ -0,0 +1,11 @@
+playsound block.note_block.basedrum record @s[] ^-0.0 ^ ^ 1.000 0.70711 0.000
+playsound block.note_block.basedrum record @s[] ^-0.0 ^ ^ 1.000 0.59460 0.000
+playsound block.note_block.snare_-1 record @s[] ^-0.0 ^ ^ 1.000 1.58740 0.000
+playsound fireworks_blast_far1 record @s[] ^-0.0 ^ ^ 1.000 1.18921 0.000
+playsound fireworks_blast_far1 record @s[] ^-0.0 ^ ^ 1.000 1.41421 0.000
+playsound block.note_block.bass_-1 record @s[] ^-0.0 ^ ^ 1.000 1.88775 0.000
+playsound block.note_block.bass_-1 record @s[] ^-0.0 ^ ^ 1.000 1.84997 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 1.000 1.05946 0.000
+playsound block.note_block.bell record @s[] ^-0.0 ^ ^ 1.000 0.52973 0.000
+playsound block.note_block.iron_xylophone_1 record @s[] ^-0.0 ^ ^ 1.000 0.52973 0.000
+particle note ~ ~2.25 ~ 0 0 0 1 1
@@ -0,0 +1,3 @@
+playsound block.note_block.flute record @a[distance=..48.00] ^0.0 ^ ^ 1.162 1.05946 0.000
+playsound block.note_block.bell record @a[distance=..48.00] ^0.0 ^ ^ 1.162 0.52973 0.000
+playsound block.note_block.iron_xylophone_1 record @a[distance=..48.00] ^0.0 ^ ^ 1.162 0.52973 0.000
@@ -0,0 +1,4 @@
+playsound block.note_block.flute record @a[distance=..48.00] ^0.0 ^ ^ 2.419 0.70711 0.000
+playsound block.note_block.bell_-1 record @a[distance=..48.00] ^0.0 ^ ^ 2.419 1.41421 0.000
+playsound block.note_block.iron_xylophone record @a[distance=..48.00] ^0.0 ^ ^ 2.419 1.41421 0.000
+playsound block.note_block.cow_bell record @a[distance=..48.00] ^0.0 ^ ^ 1.807 0.70711 0.000
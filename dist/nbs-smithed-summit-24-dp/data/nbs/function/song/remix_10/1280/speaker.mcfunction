@@ -0,0 +1,13 @@
+playsound block.note_block.basedrum record @a[distance=..11.69] ^0.0 ^ ^ 1.000 0.70711 0.000
+playsound block.note_block.basedrum record @a[distance=..11.81] ^0.0 ^ ^ 1.000 0.59460 0.000
+playsound block.note_block.bass_-1 record @a[distance=..11.99] ^0.0 ^ ^ 1.000 1.88775 0.000
+playsound block.note_block.bass_-1 record @a[distance=..11.99] ^0.0 ^ ^ 1.000 1.84997 0.000
+playsound block.note_block.flute record @a[distance=..7.65] ^0.0 ^ ^ 1.000 0.70711 0.000
+playsound block.note_block.bell_-1 record @a[distance=..7.65] ^0.0 ^ ^ 1.000 1.41421 0.000
+playsound block.note_block.iron_xylophone record @a[distance=..7.65] ^0.0 ^ ^ 1.000 1.41421 0.000
+playsound block.note_block.cow_bell record @a[distance=..10.35] ^0.0 ^ ^ 0.700 0.70711 0.000
+execute store result score #random nbs run random value 1..4
+execute if score #random nbs matches 1 if entity @a[distance=0..12] run function animated_java:music_speaker/animations/animation_speaker_beat_1/play
+execute if score #random nbs matches 2 if entity @a[distance=0..12] run function animated_java:music_speaker/animations/animation_speaker_beat_2/play
+execute if score #random nbs matches 3 if entity @a[distance=0..12] run function animated_java:music_speaker/animations/animation_speaker_beat_3/play
+execute if score #random nbs matches 4 if entity @a[distance=0..12] run function animated_java:music_speaker/animations/animation_speaker_beat_4/play
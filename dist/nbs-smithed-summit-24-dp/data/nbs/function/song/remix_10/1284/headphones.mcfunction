@@ -0,0 +1,10 @@
+playsound dig_gravel2 record @s[] ^-0.0 ^ ^ 0.500 1.00000 0.000
+playsound mob_silverfish_hit2 record @s[] ^-0.0 ^ ^ 0.100 1.00000 0.000
+playsound block.note_block.hat record @s[] ^-0.0 ^ ^ 1.000 0.70711 0.000
+playsound block.note_block.hat record @s[] ^-0.0 ^ ^ 1.000 0.59460 0.000
+playsound block.note_block.bass record @s[] ^-0.0 ^ ^ 1.000 0.94387 0.000
+playsound block.note_block.bass record @s[] ^-0.0 ^ ^ 1.000 0.92498 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 1.000 0.94387 0.000
+playsound block.note_block.bell_-1 record @s[] ^-0.0 ^ ^ 1.000 1.88775 0.000
+playsound block.note_block.iron_xylophone record @s[] ^-0.0 ^ ^ 1.000 1.88775 0.000
+playsound block.note_block.cow_bell record @s[] ^-0.0 ^ ^ 0.700 0.94387 0.000
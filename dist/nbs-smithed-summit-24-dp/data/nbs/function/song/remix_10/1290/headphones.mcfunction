@@ -0,0 +1,4 @@
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 1.000 1.18921 0.000
+playsound block.note_block.bell record @s[] ^-0.0 ^ ^ 1.000 0.59460 0.000
+playsound block.note_block.iron_xylophone_1 record @s[] ^-0.0 ^ ^ 1.000 0.59460 0.000
+playsound block.note_block.cow_bell record @s[] ^-0.0 ^ ^ 0.700 1.18921 0.000
@@ -0,0 +1,4 @@
+playsound block.note_block.flute record @a[distance=..48.00] ^0.0 ^ ^ 2.297 1.18921 0.000
+playsound block.note_block.bell record @a[distance=..48.00] ^0.0 ^ ^ 2.297 0.59460 0.000
+playsound block.note_block.iron_xylophone_1 record @a[distance=..48.00] ^0.0 ^ ^ 2.297 0.59460 0.000
+playsound block.note_block.cow_bell record @a[distance=..48.00] ^0.0 ^ ^ 1.722 1.18921 0.000
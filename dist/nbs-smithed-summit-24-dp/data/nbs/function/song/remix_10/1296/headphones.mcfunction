@@ -0,0 +1,8 @@
+playsound block.note_block.basedrum record @s[] ^-0.0 ^ ^ 1.000 0.70711 0.000
+playsound block.note_block.basedrum record @s[] ^-0.0 ^ ^ 1.000 0.59460 0.000
+playsound block.note_block.bass_-1 record @s[] ^-0.0 ^ ^ 1.000 1.88775 0.000
+playsound block.note_block.bass_-1 record @s[] ^-0.0 ^ ^ 1.000 1.84997 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 1.000 0.94387 0.000
+playsound block.note_block.bell_-1 record @s[] ^-0.0 ^ ^ 1.000 1.88775 0.000
+playsound block.note_block.iron_xylophone record @s[] ^-0.0 ^ ^ 1.000 1.88775 0.000
+particle note ~ ~2.25 ~ 0 0 0 1 1
@@ -0,0 +1,11 @@
+playsound block.note_block.basedrum record @s[] ^-0.0 ^ ^ 1.000 0.70711 0.000
+playsound block.note_block.basedrum record @s[] ^-0.0 ^ ^ 1.000 0.59460 0.000
+playsound block.note_block.bass record @s[] ^-0.0 ^ ^ 1.000 0.59460 0.000
+playsound block.note_block.bass record @s[] ^-0.0 ^ ^ 1.000 0.58270 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 1.000 0.70711 0.000
+playsound block.note_block.bell_-1 record @s[] ^-0.0 ^ ^ 1.000 1.41421 0.000
+playsound block.note_block.iron_xylophone record @s[] ^-0.0 ^ ^ 1.000 1.41421 0.000
+playsound block.note_block.cow_bell record @s[] ^-0.0 ^ ^ 0.700 0.70711 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.800 0.52973 0.000
+playsound block.note_block.iron_xylophone record @s[] ^-0.0 ^ ^ 0.700 1.05946 0.000
+particle note ~ ~2.25 ~ 0 0 0 1 1
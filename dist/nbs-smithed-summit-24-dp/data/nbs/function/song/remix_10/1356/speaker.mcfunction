@@ -0,0 +1,12 @@
+playsound dig_gravel2 record @a[distance=..6.75] ^0.0 ^ ^ 0.500 1.00000 0.000
+playsound mob_silverfish_hit2 record @a[distance=..6.75] ^0.0 ^ ^ 0.100 1.00000 0.000
+playsound block.note_block.hat record @a[distance=..10.35] ^0.0 ^ ^ 1.000 0.70711 0.000
+playsound block.note_block.hat record @a[distance=..10.87] ^0.0 ^ ^ 1.000 0.59460 0.000
+playsound block.note_block.bass record @a[distance=..11.84] ^0.0 ^ ^ 1.000 1.12246 0.000
+playsound block.note_block.bass record @a[distance=..11.84] ^0.0 ^ ^ 1.000 1.10000 0.000
+playsound block.note_block.flute record @a[distance=..6.31] ^0.0 ^ ^ 1.000 1.41421 0.000
+playsound block.note_block.bell record @a[distance=..6.31] ^0.0 ^ ^ 1.000 0.70711 0.000
+playsound block.note_block.iron_xylophone_1 record @a[distance=..6.31] ^0.0 ^ ^ 1.000 0.70711 0.000
+playsound block.note_block.cow_bell record @a[distance=..7.65] ^0.0 ^ ^ 0.700 1.41421 0.000
+playsound block.note_block.flute record @a[distance=..6.65] ^0.0 ^ ^ 0.800 1.05946 0.000
+playsound block.note_block.iron_xylophone_1 record @a[distance=..6.65] ^0.0 ^ ^ 0.700 0.52973 0.000
@@ -0,0 +1,11 @@
+playsound block.note_block.basedrum record @s[] ^-0.0 ^ ^ 1.000 0.70711 0.000
+playsound block.note_block.basedrum record @s[] ^-0.0 ^ ^ 1.000 0.59460 0.000
+playsound block.note_block.bass_-1 record @s[] ^-0.0 ^ ^ 1.000 1.33484 0.000
+playsound block.note_block.bass_-1 record @s[] ^-0.0 ^ ^ 1.000 1.30812 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 1.000 1.18921 0.000
+playsound block.note_block.bell record @s[] ^-0.0 ^ ^ 1.000 0.59460 0.000
+playsound block.note_block.iron_xylophone_1 record @s[] ^-0.0 ^ ^ 1.000 0.59460 0.000
+playsound block.note_block.cow_bell record @s[] ^-0.0 ^ ^ 0.700 1.18921 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.800 0.89090 0.000
+playsound block.note_block.iron_xylophone record @s[] ^-0.0 ^ ^ 0.700 1.78180 0.000
+particle note ~ ~2.25 ~ 0 0 0 1 1
@@ -0,0 +1 @@
+playsound block.note_block.xylophone record @s[] ^-0.0 ^ ^ 0.135 0.89090 0.000
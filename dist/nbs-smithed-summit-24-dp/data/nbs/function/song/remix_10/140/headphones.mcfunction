@@ -0,0 +1,17 @@
+playsound dig_gravel2 record @s[] ^-0.0 ^ ^ 0.500 1.00000 0.000
+playsound mob_silverfish_hit2 record @s[] ^-0.0 ^ ^ 0.100 1.00000 0.000
+playsound block.note_block.hat record @s[] ^-0.0 ^ ^ 1.000 0.70711 0.000
+playsound block.note_block.hat record @s[] ^-0.0 ^ ^ 1.000 0.59460 0.000
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 1.000 1.05946 0.000
+playsound block.note_block.bass record @s[] ^-0.0 ^ ^ 1.000 1.33484 0.000
+playsound block.note_block.bass record @s[] ^-0.0 ^ ^ 1.000 1.30812 0.000
+playsound block.note_block.guitar_1 record @s[] ^-0.0 ^ ^ 0.800 0.66742 0.000
+playsound block.note_block.guitar_1 record @s[] ^-0.0 ^ ^ 0.700 0.89090 0.000
+playsound block.note_block.guitar_1 record @s[] ^-0.0 ^ ^ 0.600 1.00000 0.000
+playsound block.note_block.harp record @s[] ^-0.0 ^ ^ 1.000 1.33484 0.000
+playsound block.note_block.harp record @s[] ^-0.0 ^ ^ 1.000 1.78180 0.000
+playsound block.note_block.harp record @s[] ^-0.0 ^ ^ 1.000 2.00000 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.400 1.33484 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.400 1.78180 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.500 2.00000 0.000
+playsound block.note_block.guitar record @s[] ^-0.0 ^ ^ 0.100 0.79370 0.000
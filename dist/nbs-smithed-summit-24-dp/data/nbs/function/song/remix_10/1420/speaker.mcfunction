@@ -0,0 +1,12 @@
+playsound dig_gravel2 record @a[distance=..6.75] ^0.0 ^ ^ 0.500 1.00000 0.000
+playsound mob_silverfish_hit2 record @a[distance=..6.75] ^0.0 ^ ^ 0.100 1.00000 0.000
+playsound block.note_block.hat record @a[distance=..10.35] ^0.0 ^ ^ 1.000 0.70711 0.000
+playsound block.note_block.hat record @a[distance=..10.87] ^0.0 ^ ^ 1.000 0.59460 0.000
+playsound block.note_block.bass record @a[distance=..11.91] ^0.0 ^ ^ 1.000 0.89090 0.000
+playsound block.note_block.bass record @a[distance=..11.92] ^0.0 ^ ^ 1.000 0.87307 0.000
+playsound block.note_block.flute record @a[distance=..6.65] ^0.0 ^ ^ 1.000 1.05946 0.000
+playsound block.note_block.bell record @a[distance=..6.65] ^0.0 ^ ^ 1.000 0.52973 0.000
+playsound block.note_block.iron_xylophone_1 record @a[distance=..6.65] ^0.0 ^ ^ 1.000 0.52973 0.000
+playsound block.note_block.cow_bell record @a[distance=..8.76] ^0.0 ^ ^ 0.700 1.05946 0.000
+playsound block.note_block.flute record @a[distance=..7.29] ^0.0 ^ ^ 0.800 0.79370 0.000
+playsound block.note_block.iron_xylophone record @a[distance=..7.29] ^0.0 ^ ^ 0.700 1.58740 0.000
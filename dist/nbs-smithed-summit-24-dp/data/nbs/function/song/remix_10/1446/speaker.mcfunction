@@ -0,0 +1,2 @@
+playsound block.note_block.flute record @a[distance=..6.56] ^0.0 ^ ^ 0.430 1.12246 0.000
+playsound block.note_block.flute record @a[distance=..6.58] ^0.0 ^ ^ 0.301 1.10637 0.000
@@ -0,0 +1,5 @@
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.180 1.12246 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.126 1.10637 0.000
+playsound block.note_block.flute_-1 record @s[] ^-0.0 ^ ^ 0.150 1.41421 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.400 1.05946 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.350 1.12246 0.000
@@ -0,0 +1,11 @@
+playsound dig_gravel2 record @a[distance=..48.00] ^0.0 ^ ^ 1.169 1.00000 0.000
+playsound mob_silverfish_hit2 record @a[distance=..48.00] ^0.0 ^ ^ 0.234 1.00000 0.000
+playsound block.note_block.hat record @a[distance=..48.00] ^0.0 ^ ^ 2.581 0.70711 0.000
+playsound block.note_block.hat record @a[distance=..48.00] ^0.0 ^ ^ 2.622 0.59460 0.000
+playsound block.note_block.bass record @a[distance=..48.00] ^0.0 ^ ^ 2.838 0.94387 0.000
+playsound block.note_block.bass record @a[distance=..48.00] ^0.0 ^ ^ 2.843 0.92498 0.000
+playsound block.note_block.flute record @a[distance=..48.00] ^0.0 ^ ^ 0.000 1.12246 0.000
+playsound block.note_block.flute record @a[distance=..48.00] ^0.0 ^ ^ 0.000 1.10637 0.000
+playsound block.note_block.flute record @a[distance=..48.00] ^0.0 ^ ^ 0.809 1.12246 0.000
+playsound block.note_block.guitar record @a[distance=..48.00] ^0.0 ^ ^ 2.635 1.12246 0.000
+playsound block.note_block.guitar record @a[distance=..48.00] ^0.0 ^ ^ 2.635 1.12246 0.000
@@ -0,0 +1 @@
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.350 1.09682 0.000
@@ -0,0 +1 @@
+playsound block.note_block.flute record @a[distance=..48.00] ^0.0 ^ ^ 0.811 1.09682 0.000
@@ -0,0 +1,18 @@
+playsound dig_gravel2 record @a[distance=..6.75] ^0.0 ^ ^ 0.500 1.00000 0.000
+playsound mob_silverfish_hit2 record @a[distance=..6.75] ^0.0 ^ ^ 0.100 1.00000 0.000
+playsound block.note_block.hat record @a[distance=..10.35] ^0.0 ^ ^ 1.000 0.70711 0.000
+playsound block.note_block.hat record @a[distance=..10.87] ^0.0 ^ ^ 1.000 0.59460 0.000
+playsound block.note_block.snare record @a[distance=..6.99] ^0.0 ^ ^ 1.000 0.89090 0.000
+playsound block.note_block.bass record @a[distance=..11.74] ^0.0 ^ ^ 1.000 1.33484 0.000
+playsound block.note_block.bass record @a[distance=..11.75] ^0.0 ^ ^ 1.000 1.30812 0.000
+playsound block.note_block.xylophone record @a[distance=..6.16] ^0.0 ^ ^ 0.300 0.89090 0.000
+playsound block.note_block.guitar_1 record @a[distance=..7.85] ^0.0 ^ ^ 0.800 0.66742 0.000
+playsound block.note_block.guitar_1 record @a[distance=..6.99] ^0.0 ^ ^ 0.700 0.89090 0.000
+playsound block.note_block.guitar_1 record @a[distance=..6.75] ^0.0 ^ ^ 0.600 1.00000 0.000
+playsound block.note_block.harp record @a[distance=..7.85] ^0.0 ^ ^ 1.000 1.33484 0.000
+playsound block.note_block.harp record @a[distance=..6.99] ^0.0 ^ ^ 1.000 1.78180 0.000
+playsound block.note_block.harp record @a[distance=..6.75] ^0.0 ^ ^ 1.000 2.00000 0.000
+playsound block.note_block.pling record @a[distance=..7.85] ^0.0 ^ ^ 0.400 1.33484 0.000
+playsound block.note_block.pling record @a[distance=..6.99] ^0.0 ^ ^ 0.400 1.78180 0.000
+playsound block.note_block.pling record @a[distance=..6.75] ^0.0 ^ ^ 0.500 2.00000 0.000
+playsound block.note_block.guitar record @a[distance=..11.58] ^0.0 ^ ^ 0.100 0.79370 0.000
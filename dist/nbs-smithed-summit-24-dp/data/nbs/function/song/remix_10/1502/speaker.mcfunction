@@ -0,0 +1 @@
+playsound block.note_block.flute record @a[distance=..6.53] ^0.0 ^ ^ 0.217 1.14870 0.000
@@ -0,0 +1,6 @@
+playsound block.note_block.harp record @a[distance=..48.00] ^0.0 ^ ^ 2.635 0.56123 0.000
+playsound block.note_block.guitar record @a[distance=..48.00] ^0.0 ^ ^ 2.635 1.12246 0.000
+playsound block.note_block.harp record @a[distance=..48.00] ^0.0 ^ ^ 2.473 1.12246 0.000
+playsound block.note_block.guitar_1 record @a[distance=..48.00] ^0.0 ^ ^ 2.473 0.56123 0.000
+playsound block.note_block.harp record @a[distance=..48.00] ^0.0 ^ ^ 2.541 0.84090 0.000
+playsound block.note_block.guitar record @a[distance=..48.00] ^0.0 ^ ^ 2.541 1.68179 0.000
@@ -0,0 +1,9 @@
+playsound block.note_block.pling_1 record @a[distance=..48.00] ^-2.0 ^ ^ 2.297 0.59460 0.000
+playsound block.note_block.bit_1 record @a[distance=..48.00] ^-2.0 ^ ^ 2.297 0.59460 0.000
+playsound block.note_block.flute record @a[distance=..48.00] ^2.0 ^ ^ 1.608 1.18921 0.000
+playsound block.note_block.harp record @a[distance=..48.00] ^0.0 ^ ^ 2.649 0.52973 0.000
+playsound block.note_block.guitar record @a[distance=..48.00] ^0.0 ^ ^ 2.649 1.05946 0.000
+playsound block.note_block.harp record @a[distance=..48.00] ^0.0 ^ ^ 2.486 1.05946 0.000
+playsound block.note_block.guitar_1 record @a[distance=..48.00] ^0.0 ^ ^ 2.486 0.52973 0.000
+playsound block.note_block.harp record @a[distance=..48.00] ^0.0 ^ ^ 2.554 0.79370 0.000
+playsound block.note_block.guitar record @a[distance=..48.00] ^0.0 ^ ^ 2.554 1.58740 0.000
@@ -0,0 +1,3 @@
+playsound block.note_block.pling_1 record @s[] ^0.5 ^ ^ 1.000 0.59460 0.000
+playsound block.note_block.bit_1 record @s[] ^0.5 ^ ^ 1.000 0.59460 0.000
+playsound block.note_block.flute record @s[] ^-0.5 ^ ^ 0.700 1.18921 0.000
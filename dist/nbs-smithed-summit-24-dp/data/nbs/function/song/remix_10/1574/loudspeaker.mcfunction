@@ -0,0 +1,3 @@
+playsound block.note_block.pling_1 record @a[distance=..48.00] ^-2.0 ^ ^ 2.297 0.59460 0.000
+playsound block.note_block.bit_1 record @a[distance=..48.00] ^-2.0 ^ ^ 2.297 0.59460 0.000
+playsound block.note_block.flute record @a[distance=..48.00] ^2.0 ^ ^ 1.608 1.18921 0.000
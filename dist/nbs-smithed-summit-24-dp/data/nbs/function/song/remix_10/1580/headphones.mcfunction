@@ -0,0 +1,22 @@
+playsound dig_gravel2 record @s[] ^-0.0 ^ ^ 0.500 1.00000 0.000
+playsound mob_silverfish_hit2 record @s[] ^-0.0 ^ ^ 0.100 1.00000 0.000
+playsound block.note_block.hat record @s[] ^-0.0 ^ ^ 1.000 0.70711 0.000
+playsound block.note_block.hat record @s[] ^-0.0 ^ ^ 1.000 0.59460 0.000
+playsound block.note_block.bass record @s[] ^-0.0 ^ ^ 1.000 0.94387 0.000
+playsound block.note_block.bass record @s[] ^-0.0 ^ ^ 1.000 0.92498 0.000
+playsound block.note_block.pling_1 record @s[] ^-0.5 ^ ^ 1.000 0.59460 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.5 ^ ^ 1.000 0.59460 0.000
+playsound block.note_block.flute record @s[] ^0.5 ^ ^ 0.700 1.16205 0.000
+playsound block.note_block.flute record @s[] ^0.5 ^ ^ 0.800 1.18921 0.000
+playsound block.note_block.guitar record @s[] ^-0.0 ^ ^ 1.000 0.70711 0.000
+playsound block.note_block.guitar record @s[] ^-0.0 ^ ^ 1.000 0.70711 0.000
+playsound block.note_block.harp record @s[] ^-0.0 ^ ^ 1.000 0.56123 0.000
+playsound block.note_block.guitar record @s[] ^-0.0 ^ ^ 1.000 1.12246 0.000
+playsound block.note_block.harp record @s[] ^-0.0 ^ ^ 1.000 1.12246 0.000
+playsound block.note_block.guitar_1 record @s[] ^-0.0 ^ ^ 1.000 0.56123 0.000
+playsound block.note_block.harp record @s[] ^-0.0 ^ ^ 1.000 0.84090 0.000
+playsound block.note_block.guitar record @s[] ^-0.0 ^ ^ 1.000 1.68179 0.000
+playsound block.note_block.xylophone record @s[] ^-0.0 ^ ^ 1.000 0.56123 0.000
+playsound block.note_block.xylophone record @s[] ^-0.0 ^ ^ 1.000 0.56123 0.000
+playsound block.note_block.xylophone_-1 record @s[] ^-0.0 ^ ^ 1.000 1.68179 0.000
+playsound block.note_block.xylophone_-1 record @s[] ^-0.0 ^ ^ 0.100 1.68179 0.000
@@ -0,0 +1,22 @@
+playsound dig_gravel2 record @a[distance=..6.75] ^0.0 ^ ^ 0.500 1.00000 0.000
+playsound mob_silverfish_hit2 record @a[distance=..6.75] ^0.0 ^ ^ 0.100 1.00000 0.000
+playsound block.note_block.hat record @a[distance=..10.35] ^0.0 ^ ^ 1.000 0.70711 0.000
+playsound block.note_block.hat record @a[distance=..10.87] ^0.0 ^ ^ 1.000 0.59460 0.000
+playsound block.note_block.bass record @a[distance=..11.90] ^0.0 ^ ^ 1.000 0.94387 0.000
+playsound block.note_block.bass record @a[distance=..11.90] ^0.0 ^ ^ 1.000 0.92498 0.000
+playsound block.note_block.pling_1 record @a[distance=..6.48] ^1.0 ^ ^ 1.000 0.59460 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.48] ^1.0 ^ ^ 1.000 0.59460 0.000
+playsound block.note_block.flute record @a[distance=..6.51] ^-1.0 ^ ^ 0.700 1.16205 0.000
+playsound block.note_block.flute record @a[distance=..6.48] ^-1.0 ^ ^ 0.800 1.18921 0.000
+playsound block.note_block.guitar record @a[distance=..11.69] ^0.0 ^ ^ 1.000 0.70711 0.000
+playsound block.note_block.guitar record @a[distance=..11.69] ^0.0 ^ ^ 1.000 0.70711 0.000
+playsound block.note_block.harp record @a[distance=..11.01] ^0.0 ^ ^ 1.000 0.56123 0.000
+playsound block.note_block.guitar record @a[distance=..11.01] ^0.0 ^ ^ 1.000 1.12246 0.000
+playsound block.note_block.harp record @a[distance=..8.52] ^0.0 ^ ^ 1.000 1.12246 0.000
+playsound block.note_block.guitar_1 record @a[distance=..8.52] ^0.0 ^ ^ 1.000 0.56123 0.000
+playsound block.note_block.harp record @a[distance=..9.72] ^0.0 ^ ^ 1.000 0.84090 0.000
+playsound block.note_block.guitar record @a[distance=..9.72] ^0.0 ^ ^ 1.000 1.68179 0.000
+playsound block.note_block.xylophone record @a[distance=..6.56] ^0.0 ^ ^ 1.000 0.56123 0.000
+playsound block.note_block.xylophone record @a[distance=..6.56] ^0.0 ^ ^ 1.000 0.56123 0.000
+playsound block.note_block.xylophone_-1 record @a[distance=..7.13] ^0.0 ^ ^ 1.000 1.68179 0.000
+playsound block.note_block.xylophone_-1 record @a[distance=..7.13] ^0.0 ^ ^ 0.100 1.68179 0.000
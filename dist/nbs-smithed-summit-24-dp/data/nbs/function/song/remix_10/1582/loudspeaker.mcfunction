@@ -0,0 +1,10 @@
+playsound block.note_block.pling_1 record @a[distance=..48.00] ^-2.0 ^ ^ 2.297 0.59460 0.000
+playsound block.note_block.bit_1 record @a[distance=..48.00] ^-2.0 ^ ^ 2.297 0.59460 0.000
+playsound block.note_block.flute record @a[distance=..48.00] ^2.0 ^ ^ 1.608 1.18921 0.000
+playsound block.note_block.flute record @a[distance=..48.00] ^-2.0 ^ ^ 1.838 1.18921 0.000
+playsound block.note_block.harp record @a[distance=..48.00] ^0.0 ^ ^ 2.635 0.56123 0.000
+playsound block.note_block.guitar record @a[distance=..48.00] ^0.0 ^ ^ 2.635 1.12246 0.000
+playsound block.note_block.harp record @a[distance=..48.00] ^0.0 ^ ^ 2.473 1.12246 0.000
+playsound block.note_block.guitar_1 record @a[distance=..48.00] ^0.0 ^ ^ 2.473 0.56123 0.000
+playsound block.note_block.harp record @a[distance=..48.00] ^0.0 ^ ^ 2.541 0.84090 0.000
+playsound block.note_block.guitar record @a[distance=..48.00] ^0.0 ^ ^ 2.541 1.68179 0.000
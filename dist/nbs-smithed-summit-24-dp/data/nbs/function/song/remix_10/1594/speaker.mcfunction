@@ -0,0 +1,10 @@
+playsound block.note_block.pling_1 record @a[distance=..6.48] ^-1.0 ^ ^ 1.000 0.59460 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.48] ^-1.0 ^ ^ 1.000 0.59460 0.000
+playsound block.note_block.flute record @a[distance=..6.48] ^1.0 ^ ^ 0.700 1.18921 0.000
+playsound block.note_block.flute record @a[distance=..6.48] ^-1.0 ^ ^ 0.800 1.18921 0.000
+playsound block.note_block.harp record @a[distance=..10.87] ^0.0 ^ ^ 1.000 0.59460 0.000
+playsound block.note_block.guitar record @a[distance=..10.87] ^0.0 ^ ^ 1.000 1.18921 0.000
+playsound block.note_block.harp record @a[distance=..8.28] ^0.0 ^ ^ 1.000 1.18921 0.000
+playsound block.note_block.guitar_1 record @a[distance=..8.28] ^0.0 ^ ^ 1.000 0.59460 0.000
+playsound block.note_block.harp record @a[distance=..9.48] ^0.0 ^ ^ 1.000 0.89090 0.000
+playsound block.note_block.guitar record @a[distance=..9.48] ^0.0 ^ ^ 1.000 1.78180 0.000
@@ -0,0 +1,7 @@
+playsound block_bubble_column_whirlpool_ambient4 record @s[] ^-0.0 ^ ^ 1.000 2.00000 0.000
+playsound block_bubble_column_whirlpool_ambient4 record @s[] ^-0.0 ^ ^ 1.000 2.00000 0.000
+playsound block_bubble_column_whirlpool_ambient4 record @s[] ^-0.0 ^ ^ 1.000 2.00000 0.000
+playsound block_bubble_column_whirlpool_ambient4 record @s[] ^-0.0 ^ ^ 1.000 1.58740 0.000
+playsound block_bubble_column_whirlpool_ambient4 record @s[] ^-0.0 ^ ^ 1.000 2.00000 0.000
+playsound block_bubble_column_whirlpool_ambient4 record @s[] ^-0.0 ^ ^ 0.300 2.00000 0.000
+particle note ~ ~2.25 ~ 0 0 0 1 1
@@ -0,0 +1,11 @@
+playsound block_bubble_column_whirlpool_ambient4 record @a[distance=..6.12] ^0.0 ^ ^ 1.000 2.00000 0.000
+playsound block_bubble_column_whirlpool_ambient4 record @a[distance=..6.12] ^0.0 ^ ^ 1.000 2.00000 0.000
+playsound block_bubble_column_whirlpool_ambient4 record @a[distance=..6.12] ^0.0 ^ ^ 1.000 2.00000 0.000
+playsound block_bubble_column_whirlpool_ambient4 record @a[distance=..6.23] ^0.0 ^ ^ 1.000 1.58740 0.000
+playsound block_bubble_column_whirlpool_ambient4 record @a[distance=..6.12] ^0.0 ^ ^ 1.000 2.00000 0.000
+playsound block_bubble_column_whirlpool_ambient4 record @a[distance=..6.12] ^0.0 ^ ^ 0.300 2.00000 0.000
+execute store result score #random nbs run random value 1..4
+execute if score #random nbs matches 1 if entity @a[distance=0..12] run function animated_java:music_speaker/animations/animation_speaker_beat_1/play
+execute if score #random nbs matches 2 if entity @a[distance=0..12] run function animated_java:music_speaker/animations/animation_speaker_beat_2/play
+execute if score #random nbs matches 3 if entity @a[distance=0..12] run function animated_java:music_speaker/animations/animation_speaker_beat_3/play
+execute if score #random nbs matches 4 if entity @a[distance=0..12] run function animated_java:music_speaker/animations/animation_speaker_beat_4/play
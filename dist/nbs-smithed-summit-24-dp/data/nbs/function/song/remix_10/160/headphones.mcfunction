@@ -0,0 +1,17 @@
+playsound block.note_block.basedrum record @s[] ^-0.0 ^ ^ 1.000 0.70711 0.000
+playsound block.note_block.basedrum record @s[] ^-0.0 ^ ^ 1.000 0.59460 0.000
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 1.000 1.05946 0.000
+playsound block.note_block.bass record @s[] ^-0.0 ^ ^ 1.000 0.79370 0.000
+playsound block.note_block.bass record @s[] ^-0.0 ^ ^ 1.000 0.77782 0.000
+playsound block.note_block.xylophone record @s[] ^-0.0 ^ ^ 0.135 0.89090 0.000
+playsound block.note_block.guitar_1 record @s[] ^-0.0 ^ ^ 0.800 0.59460 0.000
+playsound block.note_block.guitar_1 record @s[] ^-0.0 ^ ^ 0.700 0.66742 0.000
+playsound block.note_block.guitar_1 record @s[] ^-0.0 ^ ^ 0.600 0.79370 0.000
+playsound block.note_block.harp record @s[] ^-0.0 ^ ^ 1.000 1.18921 0.000
+playsound block.note_block.harp record @s[] ^-0.0 ^ ^ 1.000 1.33484 0.000
+playsound block.note_block.harp record @s[] ^-0.0 ^ ^ 1.000 1.58740 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.400 1.18921 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.400 1.33484 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.500 1.58740 0.000
+playsound block.note_block.guitar record @s[] ^-0.0 ^ ^ 0.100 0.79370 0.000
+particle note ~ ~2.25 ~ 0 0 0 1 1
@@ -0,0 +1,15 @@
+playsound block.note_block.basedrum record @s[] ^-0.0 ^ ^ 1.000 0.70711 0.000
+playsound block.note_block.basedrum record @s[] ^-0.0 ^ ^ 1.000 0.59460 0.000
+playsound block.note_block.bass_-1 record @s[] ^-0.0 ^ ^ 1.000 1.88775 0.000
+playsound block.note_block.bass_-1 record @s[] ^-0.0 ^ ^ 1.000 1.84997 0.000
+playsound block.note_block.pling record @s[] ^-0.5 ^ ^ 1.000 2.00000 0.000
+playsound block.note_block.bit record @s[] ^-0.5 ^ ^ 1.000 2.00000 0.000
+playsound block.note_block.flute record @s[] ^0.5 ^ ^ 0.700 1.02337 0.000
+playsound block.note_block.flute record @s[] ^0.5 ^ ^ 0.800 1.18921 0.000
+playsound block.note_block.harp record @s[] ^-0.0 ^ ^ 1.000 0.56123 0.000
+playsound block.note_block.guitar record @s[] ^-0.0 ^ ^ 1.000 1.12246 0.000
+playsound block.note_block.harp record @s[] ^-0.0 ^ ^ 1.000 1.12246 0.000
+playsound block.note_block.guitar_1 record @s[] ^-0.0 ^ ^ 1.000 0.56123 0.000
+playsound block.note_block.harp record @s[] ^-0.0 ^ ^ 1.000 0.84090 0.000
+playsound block.note_block.guitar record @s[] ^-0.0 ^ ^ 1.000 1.68179 0.000
+particle note ~ ~2.25 ~ 0 0 0 1 1
@@ -0,0 +1,4 @@
+playsound block.note_block.pling record @a[distance=..48.00] ^-2.0 ^ ^ 2.351 1.88775 0.000
+playsound block.note_block.bit record @a[distance=..48.00] ^-2.0 ^ ^ 2.351 1.88775 0.000
+playsound block.note_block.flute record @a[distance=..48.00] ^2.0 ^ ^ 1.646 0.94387 0.000
+playsound block.note_block.flute record @a[distance=..48.00] ^-2.0 ^ ^ 1.838 1.18921 0.000
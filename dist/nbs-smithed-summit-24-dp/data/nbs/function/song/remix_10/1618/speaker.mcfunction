@@ -0,0 +1,4 @@
+playsound block.note_block.pling record @a[distance=..6.86] ^-1.0 ^ ^ 1.000 1.88775 0.000
+playsound block.note_block.bit record @a[distance=..6.86] ^-1.0 ^ ^ 1.000 1.88775 0.000
+playsound block.note_block.flute record @a[distance=..6.86] ^1.0 ^ ^ 0.700 0.94387 0.000
+playsound block.note_block.flute record @a[distance=..6.48] ^-1.0 ^ ^ 0.800 1.18921 0.000
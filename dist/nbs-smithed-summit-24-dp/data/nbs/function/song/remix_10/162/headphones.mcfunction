@@ -0,0 +1 @@
+playsound block.note_block.xylophone record @s[] ^-0.0 ^ ^ 0.300 0.79370 0.000
@@ -0,0 +1,22 @@
+playsound dig_gravel2 record @s[] ^-0.0 ^ ^ 0.500 1.00000 0.000
+playsound mob_silverfish_hit2 record @s[] ^-0.0 ^ ^ 0.100 1.00000 0.000
+playsound block.note_block.hat record @s[] ^-0.0 ^ ^ 1.000 0.70711 0.000
+playsound block.note_block.hat record @s[] ^-0.0 ^ ^ 1.000 0.59460 0.000
+playsound block.note_block.bass record @s[] ^-0.0 ^ ^ 1.000 0.94387 0.000
+playsound block.note_block.bass record @s[] ^-0.0 ^ ^ 1.000 0.92498 0.000
+playsound block.note_block.pling record @s[] ^-0.5 ^ ^ 1.000 1.78180 0.000
+playsound block.note_block.bit record @s[] ^-0.5 ^ ^ 1.000 1.78180 0.000
+playsound block.note_block.flute record @s[] ^0.5 ^ ^ 0.700 0.87055 0.000
+playsound block.note_block.flute record @s[] ^0.5 ^ ^ 0.800 1.12246 0.000
+playsound block.note_block.guitar record @s[] ^-0.0 ^ ^ 1.000 1.12246 0.000
+playsound block.note_block.guitar record @s[] ^-0.0 ^ ^ 1.000 1.12246 0.000
+playsound block.note_block.harp record @s[] ^-0.0 ^ ^ 1.000 0.52973 0.000
+playsound block.note_block.guitar record @s[] ^-0.0 ^ ^ 1.000 1.05946 0.000
+playsound block.note_block.harp record @s[] ^-0.0 ^ ^ 1.000 1.05946 0.000
+playsound block.note_block.guitar_1 record @s[] ^-0.0 ^ ^ 1.000 0.52973 0.000
+playsound block.note_block.harp record @s[] ^-0.0 ^ ^ 1.000 0.79370 0.000
+playsound block.note_block.guitar record @s[] ^-0.0 ^ ^ 1.000 1.58740 0.000
+playsound block.note_block.xylophone record @s[] ^-0.0 ^ ^ 1.000 0.52973 0.000
+playsound block.note_block.xylophone record @s[] ^-0.0 ^ ^ 1.000 0.52973 0.000
+playsound block.note_block.xylophone_-1 record @s[] ^-0.0 ^ ^ 1.000 1.58740 0.000
+playsound block.note_block.xylophone_-1 record @s[] ^-0.0 ^ ^ 0.100 1.58740 0.000
@@ -0,0 +1,22 @@
+playsound dig_gravel2 record @a[distance=..6.75] ^0.0 ^ ^ 0.500 1.00000 0.000
+playsound mob_silverfish_hit2 record @a[distance=..6.75] ^0.0 ^ ^ 0.100 1.00000 0.000
+playsound block.note_block.hat record @a[distance=..10.35] ^0.0 ^ ^ 1.000 0.70711 0.000
+playsound block.note_block.hat record @a[distance=..10.87] ^0.0 ^ ^ 1.000 0.59460 0.000
+playsound block.note_block.bass record @a[distance=..11.90] ^0.0 ^ ^ 1.000 0.94387 0.000
+playsound block.note_block.bass record @a[distance=..11.90] ^0.0 ^ ^ 1.000 0.92498 0.000
+playsound block.note_block.pling record @a[distance=..6.99] ^1.0 ^ ^ 1.000 1.78180 0.000
+playsound block.note_block.bit record @a[distance=..6.99] ^1.0 ^ ^ 1.000 1.78180 0.000
+playsound block.note_block.flute record @a[distance=..7.04] ^-1.0 ^ ^ 0.700 0.87055 0.000
+playsound block.note_block.flute record @a[distance=..6.56] ^-1.0 ^ ^ 0.800 1.12246 0.000
+playsound block.note_block.guitar record @a[distance=..11.01] ^0.0 ^ ^ 1.000 1.12246 0.000
+playsound block.note_block.guitar record @a[distance=..11.01] ^0.0 ^ ^ 1.000 1.12246 0.000
+playsound block.note_block.harp record @a[distance=..11.14] ^0.0 ^ ^ 1.000 0.52973 0.000
+playsound block.note_block.guitar record @a[distance=..11.14] ^0.0 ^ ^ 1.000 1.05946 0.000
+playsound block.note_block.harp record @a[distance=..8.76] ^0.0 ^ ^ 1.000 1.05946 0.000
+playsound block.note_block.guitar_1 record @a[distance=..8.76] ^0.0 ^ ^ 1.000 0.52973 0.000
+playsound block.note_block.harp record @a[distance=..9.94] ^0.0 ^ ^ 1.000 0.79370 0.000
+playsound block.note_block.guitar record @a[distance=..9.94] ^0.0 ^ ^ 1.000 1.58740 0.000
+playsound block.note_block.xylophone record @a[distance=..6.65] ^0.0 ^ ^ 1.000 0.52973 0.000
+playsound block.note_block.xylophone record @a[distance=..6.65] ^0.0 ^ ^ 1.000 0.52973 0.000
+playsound block.note_block.xylophone_-1 record @a[distance=..7.29] ^0.0 ^ ^ 1.000 1.58740 0.000
+playsound block.note_block.xylophone_-1 record @a[distance=..7.29] ^0.0 ^ ^ 0.100 1.58740 0.000
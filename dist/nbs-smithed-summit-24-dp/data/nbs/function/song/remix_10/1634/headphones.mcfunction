@@ -0,0 +1,10 @@
+playsound block.note_block.pling record @s[] ^0.5 ^ ^ 1.000 1.18921 0.000
+playsound block.note_block.bit record @s[] ^0.5 ^ ^ 1.000 1.18921 0.000
+playsound block.note_block.flute record @s[] ^-0.5 ^ ^ 0.700 0.59460 0.000
+playsound block.note_block.flute record @s[] ^0.5 ^ ^ 0.800 0.74915 0.000
+playsound block.note_block.harp record @s[] ^-0.0 ^ ^ 1.000 0.52973 0.000
+playsound block.note_block.guitar record @s[] ^-0.0 ^ ^ 1.000 1.05946 0.000
+playsound block.note_block.harp record @s[] ^-0.0 ^ ^ 1.000 1.05946 0.000
+playsound block.note_block.guitar_1 record @s[] ^-0.0 ^ ^ 1.000 0.52973 0.000
+playsound block.note_block.harp record @s[] ^-0.0 ^ ^ 1.000 0.79370 0.000
+playsound block.note_block.guitar record @s[] ^-0.0 ^ ^ 1.000 1.58740 0.000
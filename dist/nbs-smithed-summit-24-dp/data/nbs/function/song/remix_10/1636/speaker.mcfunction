@@ -0,0 +1,12 @@
+playsound dig_gravel2 record @a[distance=..6.75] ^0.0 ^ ^ 0.500 1.00000 0.000
+playsound mob_silverfish_hit2 record @a[distance=..6.75] ^0.0 ^ ^ 0.100 1.00000 0.000
+playsound block.note_block.basedrum record @a[distance=..11.69] ^0.0 ^ ^ 1.000 0.70711 0.000
+playsound block.note_block.basedrum record @a[distance=..11.81] ^0.0 ^ ^ 1.000 0.59460 0.000
+playsound block.note_block.bass record @a[distance=..11.90] ^0.0 ^ ^ 1.000 0.94387 0.000
+playsound block.note_block.bass record @a[distance=..11.90] ^0.0 ^ ^ 1.000 0.92498 0.000
+playsound block.note_block.pling record @a[distance=..8.28] ^1.0 ^ ^ 1.000 1.18921 0.000
+playsound block.note_block.bit record @a[distance=..8.28] ^1.0 ^ ^ 1.000 1.18921 0.000
+playsound block.note_block.flute record @a[distance=..8.38] ^-1.0 ^ ^ 0.700 0.58102 0.000
+playsound block.note_block.flute record @a[distance=..7.65] ^-1.0 ^ ^ 0.800 0.70711 0.000
+playsound block.note_block.guitar record @a[distance=..11.69] ^0.0 ^ ^ 1.000 0.70711 0.000
+playsound block.note_block.guitar record @a[distance=..11.69] ^0.0 ^ ^ 1.000 0.70711 0.000
@@ -0,0 +1,17 @@
+playsound dig_gravel2 record @s[] ^-0.0 ^ ^ 0.500 1.00000 0.000
+playsound mob_silverfish_hit2 record @s[] ^-0.0 ^ ^ 0.100 1.00000 0.000
+playsound block.note_block.basedrum record @s[] ^-0.0 ^ ^ 1.000 0.70711 0.000
+playsound block.note_block.basedrum record @s[] ^-0.0 ^ ^ 1.000 0.59460 0.000
+playsound block.note_block.bass record @s[] ^-0.0 ^ ^ 1.000 0.94387 0.000
+playsound block.note_block.bass record @s[] ^-0.0 ^ ^ 1.000 0.92498 0.000
+playsound block.note_block.pling record @s[] ^-0.5 ^ ^ 0.200 1.18921 0.000
+playsound block.note_block.bit record @s[] ^-0.5 ^ ^ 0.200 1.18921 0.000
+playsound block.note_block.flute record @s[] ^0.5 ^ ^ 0.140 0.58102 0.000
+playsound block.note_block.flute record @s[] ^0.5 ^ ^ 0.800 0.59460 0.000
+playsound block.note_block.guitar record @s[] ^-0.0 ^ ^ 1.000 0.70711 0.000
+playsound block.note_block.guitar record @s[] ^-0.0 ^ ^ 1.000 0.70711 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 1.000 1.41421 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 1.000 1.38992 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 1.000 0.70711 0.000
+playsound block.note_block.chime record @s[] ^-0.0 ^ ^ 0.750 1.41421 0.000
+playsound block.note_block.pling_1 record @s[] ^-0.0 ^ ^ 1.000 0.69496 0.000
@@ -0,0 +1,9 @@
+playsound block.note_block.pling record @s[] ^0.5 ^ ^ 0.000 1.18921 0.000
+playsound block.note_block.bit record @s[] ^0.5 ^ ^ 0.000 1.18921 0.000
+playsound block.note_block.flute record @s[] ^-0.5 ^ ^ 0.000 0.59460 0.000
+playsound block.note_block.flute record @s[] ^0.5 ^ ^ 0.640 0.59460 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 1.000 1.41421 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 1.000 1.38992 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 1.000 0.70711 0.000
+playsound block.note_block.chime record @s[] ^-0.0 ^ ^ 0.750 1.41421 0.000
+playsound block.note_block.pling_1 record @s[] ^-0.0 ^ ^ 1.000 0.70711 0.000
@@ -0,0 +1,9 @@
+playsound block.note_block.pling record @a[distance=..48.00] ^-2.0 ^ ^ 0.000 1.18921 0.000
+playsound block.note_block.bit record @a[distance=..48.00] ^-2.0 ^ ^ 0.000 1.18921 0.000
+playsound block.note_block.flute record @a[distance=..48.00] ^2.0 ^ ^ 0.000 0.59460 0.000
+playsound block.note_block.flute record @a[distance=..48.00] ^-2.0 ^ ^ 1.574 0.59460 0.000
+playsound block.note_block.flute record @a[distance=..48.00] ^0.0 ^ ^ 2.257 1.41421 0.000
+playsound block.note_block.flute record @a[distance=..48.00] ^0.0 ^ ^ 2.261 1.38992 0.000
+playsound block.note_block.flute record @a[distance=..48.00] ^0.0 ^ ^ 2.419 0.70711 0.000
+playsound block.note_block.chime record @a[distance=..48.00] ^0.0 ^ ^ 1.571 1.41421 0.000
+playsound block.note_block.pling_1 record @a[distance=..48.00] ^0.0 ^ ^ 2.257 0.70711 0.000
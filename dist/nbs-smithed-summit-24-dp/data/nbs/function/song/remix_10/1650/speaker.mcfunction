@@ -0,0 +1,6 @@
+playsound block.note_block.flute record @a[distance=..8.28] ^-1.0 ^ ^ 0.320 0.59460 0.000
+playsound block.note_block.flute record @a[distance=..6.31] ^0.0 ^ ^ 1.000 1.41421 0.000
+playsound block.note_block.flute record @a[distance=..6.32] ^0.0 ^ ^ 1.000 1.38992 0.000
+playsound block.note_block.flute record @a[distance=..7.65] ^0.0 ^ ^ 1.000 0.70711 0.000
+playsound block.note_block.chime record @a[distance=..6.05] ^0.0 ^ ^ 0.750 1.41421 0.000
+playsound block.note_block.pling_1 record @a[distance=..6.31] ^0.0 ^ ^ 1.000 0.70711 0.000
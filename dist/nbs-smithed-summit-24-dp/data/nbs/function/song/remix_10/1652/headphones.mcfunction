@@ -0,0 +1,15 @@
+playsound dig_gravel2 record @s[] ^-0.0 ^ ^ 0.500 1.00000 0.000
+playsound mob_silverfish_hit2 record @s[] ^-0.0 ^ ^ 0.100 1.00000 0.000
+playsound block.note_block.basedrum record @s[] ^-0.0 ^ ^ 1.000 0.70711 0.000
+playsound block.note_block.basedrum record @s[] ^-0.0 ^ ^ 1.000 0.59460 0.000
+playsound block.note_block.bass record @s[] ^-0.0 ^ ^ 1.000 0.94387 0.000
+playsound block.note_block.bass record @s[] ^-0.0 ^ ^ 1.000 0.92498 0.000
+playsound block.note_block.flute record @s[] ^0.5 ^ ^ 0.160 0.59460 0.000
+playsound block.note_block.guitar record @s[] ^-0.0 ^ ^ 1.000 1.12246 0.000
+playsound block.note_block.guitar record @s[] ^-0.0 ^ ^ 1.000 1.12246 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 1.000 1.41421 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 1.000 1.25992 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.600 1.23828 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 1.000 0.62996 0.000
+playsound block.note_block.chime record @s[] ^-0.0 ^ ^ 0.750 1.25992 0.000
+playsound block.note_block.pling_1 record @s[] ^-0.0 ^ ^ 1.000 0.61914 0.000
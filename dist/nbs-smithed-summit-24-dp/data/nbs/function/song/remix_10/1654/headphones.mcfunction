@@ -0,0 +1,7 @@
+playsound block.note_block.flute record @s[] ^0.5 ^ ^ 0.000 0.59460 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 1.000 1.41421 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 1.000 1.25992 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.600 1.23828 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 1.000 0.62996 0.000
+playsound block.note_block.chime record @s[] ^-0.0 ^ ^ 0.750 1.25992 0.000
+playsound block.note_block.pling_1 record @s[] ^-0.0 ^ ^ 1.000 0.62996 0.000
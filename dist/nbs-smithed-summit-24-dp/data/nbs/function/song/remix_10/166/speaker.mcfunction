@@ -0,0 +1,11 @@
+playsound block.note_block.snare record @a[distance=..7.65] ^0.0 ^ ^ 1.000 0.70711 0.000
+playsound block.note_block.guitar_1 record @a[distance=..8.28] ^0.0 ^ ^ 0.800 0.59460 0.000
+playsound block.note_block.guitar_1 record @a[distance=..7.85] ^0.0 ^ ^ 0.700 0.66742 0.000
+playsound block.note_block.guitar_1 record @a[distance=..7.29] ^0.0 ^ ^ 0.600 0.79370 0.000
+playsound block.note_block.harp record @a[distance=..8.28] ^0.0 ^ ^ 1.000 1.18921 0.000
+playsound block.note_block.harp record @a[distance=..7.85] ^0.0 ^ ^ 1.000 1.33484 0.000
+playsound block.note_block.harp record @a[distance=..7.29] ^0.0 ^ ^ 1.000 1.58740 0.000
+playsound block.note_block.pling record @a[distance=..8.28] ^0.0 ^ ^ 0.400 1.18921 0.000
+playsound block.note_block.pling record @a[distance=..7.85] ^0.0 ^ ^ 0.400 1.33484 0.000
+playsound block.note_block.pling record @a[distance=..7.29] ^0.0 ^ ^ 0.500 1.58740 0.000
+playsound block.note_block.guitar record @a[distance=..11.58] ^0.0 ^ ^ 0.100 0.79370 0.000
@@ -0,0 +1,6 @@
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 1.000 0.94387 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 1.000 1.25992 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 1.000 0.92766 0.000
+playsound block.note_block.flute_-1 record @s[] ^-0.0 ^ ^ 1.000 1.88775 0.000
+playsound block.note_block.chime record @s[] ^-0.0 ^ ^ 0.750 0.94387 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 1.000 1.88775 0.000
@@ -0,0 +1,5 @@
+playsound block.note_block.flute record @a[distance=..6.86] ^0.0 ^ ^ 1.000 0.94387 0.000
+playsound block.note_block.flute record @a[distance=..6.90] ^0.0 ^ ^ 1.000 0.92766 0.000
+playsound block.note_block.flute_-1 record @a[distance=..9.24] ^0.0 ^ ^ 1.000 1.88775 0.000
+playsound block.note_block.chime record @a[distance=..6.14] ^0.0 ^ ^ 0.750 0.94387 0.000
+playsound block.note_block.pling record @a[distance=..6.86] ^0.0 ^ ^ 1.000 1.88775 0.000
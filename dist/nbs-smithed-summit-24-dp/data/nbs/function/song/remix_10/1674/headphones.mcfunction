@@ -0,0 +1,6 @@
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 1.000 0.94387 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 1.000 1.12246 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.600 1.10318 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 1.000 0.56123 0.000
+playsound block.note_block.chime record @s[] ^-0.0 ^ ^ 0.750 1.12246 0.000
+playsound block.note_block.pling_1 record @s[] ^-0.0 ^ ^ 1.000 0.56123 0.000
@@ -0,0 +1,5 @@
+playsound block.note_block.flute record @a[distance=..6.56] ^0.0 ^ ^ 1.000 1.12246 0.000
+playsound block.note_block.flute record @a[distance=..6.59] ^0.0 ^ ^ 0.600 1.10318 0.000
+playsound block.note_block.flute record @a[distance=..8.52] ^0.0 ^ ^ 1.000 0.56123 0.000
+playsound block.note_block.chime record @a[distance=..6.09] ^0.0 ^ ^ 0.750 1.12246 0.000
+playsound block.note_block.pling_1 record @a[distance=..6.56] ^0.0 ^ ^ 1.000 0.56123 0.000
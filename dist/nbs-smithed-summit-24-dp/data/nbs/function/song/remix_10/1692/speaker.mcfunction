@@ -0,0 +1,14 @@
+playsound dig_gravel2 record @a[distance=..6.75] ^0.0 ^ ^ 0.500 1.00000 0.000
+playsound mob_silverfish_hit2 record @a[distance=..6.75] ^0.0 ^ ^ 0.100 1.00000 0.000
+playsound block.note_block.basedrum record @a[distance=..11.69] ^0.0 ^ ^ 1.000 0.70711 0.000
+playsound block.note_block.basedrum record @a[distance=..11.81] ^0.0 ^ ^ 1.000 0.59460 0.000
+playsound block.note_block.bass record @a[distance=..11.90] ^0.0 ^ ^ 1.000 0.94387 0.000
+playsound block.note_block.bass record @a[distance=..11.90] ^0.0 ^ ^ 1.000 0.92498 0.000
+playsound block.note_block.guitar record @a[distance=..11.69] ^0.0 ^ ^ 1.000 0.70711 0.000
+playsound block.note_block.guitar record @a[distance=..11.69] ^0.0 ^ ^ 1.000 0.70711 0.000
+playsound block.note_block.flute record @a[distance=..6.42] ^0.0 ^ ^ 1.000 1.25992 0.000
+playsound block.note_block.flute record @a[distance=..7.13] ^0.0 ^ ^ 1.000 0.84090 0.000
+playsound block.note_block.flute record @a[distance=..7.18] ^0.0 ^ ^ 0.600 0.82645 0.000
+playsound block.note_block.flute_-1 record @a[distance=..9.72] ^0.0 ^ ^ 1.000 1.68179 0.000
+playsound block.note_block.chime record @a[distance=..6.19] ^0.0 ^ ^ 0.750 0.84090 0.000
+playsound block.note_block.pling record @a[distance=..7.18] ^0.0 ^ ^ 1.000 1.65290 0.000
@@ -0,0 +1,5 @@
+playsound block.note_block.flute record @a[distance=..7.65] ^0.0 ^ ^ 1.000 0.70711 0.000
+playsound block.note_block.flute record @a[distance=..7.70] ^0.0 ^ ^ 0.600 0.69496 0.000
+playsound block.note_block.flute_-1 record @a[distance=..10.35] ^0.0 ^ ^ 1.000 1.41421 0.000
+playsound block.note_block.chime record @a[distance=..6.31] ^0.0 ^ ^ 0.750 0.70711 0.000
+playsound block.note_block.pling record @a[distance=..7.65] ^0.0 ^ ^ 1.000 1.41421 0.000
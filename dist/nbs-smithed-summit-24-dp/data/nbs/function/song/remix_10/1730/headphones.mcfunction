@@ -0,0 +1,6 @@
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 1.000 0.79370 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 1.000 0.84090 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.600 0.82645 0.000
+playsound block.note_block.flute_-1 record @s[] ^-0.0 ^ ^ 1.000 1.68179 0.000
+playsound block.note_block.chime record @s[] ^-0.0 ^ ^ 0.750 0.84090 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 1.000 1.68179 0.000
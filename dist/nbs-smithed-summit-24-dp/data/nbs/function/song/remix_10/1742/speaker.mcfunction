@@ -0,0 +1,5 @@
+playsound block.note_block.flute record @a[distance=..7.13] ^0.0 ^ ^ 1.000 0.84090 0.000
+playsound block.note_block.flute record @a[distance=..7.18] ^0.0 ^ ^ 0.600 0.82645 0.000
+playsound block.note_block.flute_-1 record @a[distance=..9.72] ^0.0 ^ ^ 1.000 1.68179 0.000
+playsound block.note_block.chime record @a[distance=..6.19] ^0.0 ^ ^ 0.750 0.84090 0.000
+playsound block.note_block.pling record @a[distance=..7.13] ^0.0 ^ ^ 1.000 1.68179 0.000
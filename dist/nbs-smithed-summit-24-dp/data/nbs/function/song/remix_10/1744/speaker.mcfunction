@@ -0,0 +1,14 @@
+playsound block.note_block.hat record @a[distance=..10.35] ^0.0 ^ ^ 1.000 0.70711 0.000
+playsound block.note_block.hat record @a[distance=..10.87] ^0.0 ^ ^ 1.000 0.59460 0.000
+playsound block.note_block.bass_-1 record @a[distance=..11.99] ^0.0 ^ ^ 1.000 1.88775 0.000
+playsound block.note_block.bass_-1 record @a[distance=..11.99] ^0.0 ^ ^ 1.000 1.84997 0.000
+playsound block.note_block.flute record @a[distance=..7.15] ^0.0 ^ ^ 0.930 0.83605 0.000
+playsound block.note_block.flute record @a[distance=..7.19] ^0.0 ^ ^ 0.558 0.82169 0.000
+playsound block.note_block.flute_-1 record @a[distance=..9.74] ^0.0 ^ ^ 0.930 1.67211 0.000
+playsound block.note_block.chime record @a[distance=..6.20] ^0.0 ^ ^ 0.690 0.83605 0.000
+playsound block.note_block.pling record @a[distance=..7.12] ^0.0 ^ ^ 0.930 1.69154 0.000
+execute store result score #random nbs run random value 1..4
+execute if score #random nbs matches 1 if entity @a[distance=0..12] run function animated_java:music_speaker/animations/animation_speaker_beat_1/play
+execute if score #random nbs matches 2 if entity @a[distance=0..12] run function animated_java:music_speaker/animations/animation_speaker_beat_2/play
+execute if score #random nbs matches 3 if entity @a[distance=0..12] run function animated_java:music_speaker/animations/animation_speaker_beat_3/play
+execute if score #random nbs matches 4 if entity @a[distance=0..12] run function animated_java:music_speaker/animations/animation_speaker_beat_4/play
@@ -0,0 +1,5 @@
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.870 0.83124 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.522 0.81696 0.000
+playsound block.note_block.flute_-1 record @s[] ^-0.0 ^ ^ 0.870 1.66248 0.000
+playsound block.note_block.chime record @s[] ^-0.0 ^ ^ 0.650 0.83124 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.870 1.66248 0.000
@@ -0,0 +1,5 @@
+playsound block.note_block.flute record @a[distance=..48.00] ^0.0 ^ ^ 2.072 0.83124 0.000
+playsound block.note_block.flute record @a[distance=..48.00] ^0.0 ^ ^ 1.245 0.81696 0.000
+playsound block.note_block.flute_-1 record @a[distance=..48.00] ^0.0 ^ ^ 2.213 1.66248 0.000
+playsound block.note_block.chime record @a[distance=..48.00] ^0.0 ^ ^ 1.442 0.83124 0.000
+playsound block.note_block.pling record @a[distance=..48.00] ^0.0 ^ ^ 2.072 1.66248 0.000
@@ -0,0 +1,13 @@
+playsound dig_gravel2 record @s[] ^-0.0 ^ ^ 0.500 1.00000 0.000
+playsound mob_silverfish_hit2 record @s[] ^-0.0 ^ ^ 0.100 1.00000 0.000
+playsound block.note_block.basedrum record @s[] ^-0.0 ^ ^ 1.000 0.70711 0.000
+playsound block.note_block.basedrum record @s[] ^-0.0 ^ ^ 1.000 0.59460 0.000
+playsound block.note_block.bass record @s[] ^-0.0 ^ ^ 1.000 0.94387 0.000
+playsound block.note_block.bass record @s[] ^-0.0 ^ ^ 1.000 0.92498 0.000
+playsound block.note_block.guitar record @s[] ^-0.0 ^ ^ 1.000 1.12246 0.000
+playsound block.note_block.guitar record @s[] ^-0.0 ^ ^ 1.000 1.12246 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.810 0.82645 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.486 0.81225 0.000
+playsound block.note_block.flute_-1 record @s[] ^-0.0 ^ ^ 0.810 1.65290 0.000
+playsound block.note_block.chime record @s[] ^-0.0 ^ ^ 0.600 0.82645 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.810 1.65290 0.000
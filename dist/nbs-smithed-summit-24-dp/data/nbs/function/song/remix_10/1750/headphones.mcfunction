@@ -0,0 +1,5 @@
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.750 0.82169 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.450 0.80757 0.000
+playsound block.note_block.flute_-1 record @s[] ^-0.0 ^ ^ 0.750 1.64338 0.000
+playsound block.note_block.chime record @s[] ^-0.0 ^ ^ 0.560 0.82169 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.750 1.64338 0.000
@@ -0,0 +1,5 @@
+playsound block.note_block.flute record @a[distance=..48.00] ^0.0 ^ ^ 1.788 0.82169 0.000
+playsound block.note_block.flute record @a[distance=..48.00] ^0.0 ^ ^ 1.075 0.80757 0.000
+playsound block.note_block.flute_-1 record @a[distance=..48.00] ^0.0 ^ ^ 1.909 1.64338 0.000
+playsound block.note_block.chime record @a[distance=..48.00] ^0.0 ^ ^ 1.244 0.82169 0.000
+playsound block.note_block.pling record @a[distance=..48.00] ^0.0 ^ ^ 1.788 1.64338 0.000
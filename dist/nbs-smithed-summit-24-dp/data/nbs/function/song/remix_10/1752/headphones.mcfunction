@@ -0,0 +1,16 @@
+playsound block.note_block.hat record @s[] ^-0.0 ^ ^ 1.000 0.70711 0.000
+playsound block.note_block.hat record @s[] ^-0.0 ^ ^ 1.000 0.59460 0.000
+playsound block.note_block.snare_-1 record @s[] ^-0.0 ^ ^ 1.000 1.58740 0.000
+playsound fireworks_blast_far1 record @s[] ^-0.0 ^ ^ 1.000 1.18921 0.000
+playsound fireworks_blast_far1 record @s[] ^-0.0 ^ ^ 1.000 1.41421 0.000
+playsound block.note_block.snare_-1 record @s[] ^-0.0 ^ ^ 1.000 1.58740 0.000
+playsound block.note_block.bass_-1 record @s[] ^-0.0 ^ ^ 1.000 1.88775 0.000
+playsound block.note_block.bass_-1 record @s[] ^-0.0 ^ ^ 1.000 1.84997 0.000
+playsound block.note_block.guitar record @s[] ^-0.0 ^ ^ 1.000 0.94387 0.000
+playsound block.note_block.guitar record @s[] ^-0.0 ^ ^ 1.000 0.94387 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.680 0.81696 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.408 0.80292 0.000
+playsound block.note_block.flute_-1 record @s[] ^-0.0 ^ ^ 0.680 1.63392 0.000
+playsound block.note_block.chime record @s[] ^-0.0 ^ ^ 0.510 0.81696 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.680 1.63392 0.000
+particle note ~ ~2.25 ~ 0 0 0 1 1
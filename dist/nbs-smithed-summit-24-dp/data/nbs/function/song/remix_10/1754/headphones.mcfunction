@@ -0,0 +1,5 @@
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.620 0.81225 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.372 0.79830 0.000
+playsound block.note_block.flute_-1 record @s[] ^-0.0 ^ ^ 0.620 1.62450 0.000
+playsound block.note_block.chime record @s[] ^-0.0 ^ ^ 0.460 0.81225 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.620 1.62450 0.000
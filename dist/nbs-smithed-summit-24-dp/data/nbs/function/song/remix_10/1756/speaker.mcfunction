@@ -0,0 +1,13 @@
+playsound dig_gravel2 record @a[distance=..6.75] ^0.0 ^ ^ 0.500 1.00000 0.000
+playsound mob_silverfish_hit2 record @a[distance=..6.75] ^0.0 ^ ^ 0.100 1.00000 0.000
+playsound block.note_block.basedrum record @a[distance=..11.69] ^0.0 ^ ^ 1.000 0.70711 0.000
+playsound block.note_block.basedrum record @a[distance=..11.81] ^0.0 ^ ^ 1.000 0.59460 0.000
+playsound block.note_block.bass record @a[distance=..11.90] ^0.0 ^ ^ 1.000 0.94387 0.000
+playsound block.note_block.bass record @a[distance=..11.90] ^0.0 ^ ^ 1.000 0.92498 0.000
+playsound block.note_block.guitar record @a[distance=..11.69] ^0.0 ^ ^ 1.000 0.70711 0.000
+playsound block.note_block.guitar record @a[distance=..11.69] ^0.0 ^ ^ 1.000 0.70711 0.000
+playsound block.note_block.flute record @a[distance=..7.24] ^0.0 ^ ^ 0.560 0.80757 0.000
+playsound block.note_block.flute record @a[distance=..7.29] ^0.0 ^ ^ 0.336 0.79370 0.000
+playsound block.note_block.flute_-1 record @a[distance=..9.87] ^0.0 ^ ^ 0.560 1.61515 0.000
+playsound block.note_block.chime record @a[distance=..6.22] ^0.0 ^ ^ 0.420 0.80757 0.000
+playsound block.note_block.pling record @a[distance=..7.24] ^0.0 ^ ^ 0.560 1.61515 0.000
@@ -0,0 +1,5 @@
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.500 0.80292 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.300 0.78913 0.000
+playsound block.note_block.flute_-1 record @s[] ^-0.0 ^ ^ 0.500 1.60585 0.000
+playsound block.note_block.chime record @s[] ^-0.0 ^ ^ 0.370 0.80292 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.500 1.60585 0.000
@@ -0,0 +1,5 @@
+playsound block.note_block.flute record @a[distance=..48.00] ^0.0 ^ ^ 1.195 0.80292 0.000
+playsound block.note_block.flute record @a[distance=..48.00] ^0.0 ^ ^ 0.718 0.78913 0.000
+playsound block.note_block.flute_-1 record @a[distance=..48.00] ^0.0 ^ ^ 1.276 1.60585 0.000
+playsound block.note_block.chime record @a[distance=..48.00] ^0.0 ^ ^ 0.824 0.80292 0.000
+playsound block.note_block.pling record @a[distance=..48.00] ^0.0 ^ ^ 1.195 1.60585 0.000
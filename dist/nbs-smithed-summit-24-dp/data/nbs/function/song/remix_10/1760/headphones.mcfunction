@@ -0,0 +1,12 @@
+playsound block.note_block.hat record @s[] ^-0.0 ^ ^ 1.000 0.70711 0.000
+playsound block.note_block.hat record @s[] ^-0.0 ^ ^ 1.000 0.59460 0.000
+playsound block.note_block.bass_-1 record @s[] ^-0.0 ^ ^ 1.000 1.88775 0.000
+playsound block.note_block.bass_-1 record @s[] ^-0.0 ^ ^ 1.000 1.84997 0.000
+playsound block.note_block.guitar_-1 record @s[] ^-0.0 ^ ^ 1.000 1.88775 0.000
+playsound block.note_block.guitar_-1 record @s[] ^-0.0 ^ ^ 1.000 1.88775 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.430 0.79830 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.258 0.78458 0.000
+playsound block.note_block.flute_-1 record @s[] ^-0.0 ^ ^ 0.430 1.59660 0.000
+playsound block.note_block.chime record @s[] ^-0.0 ^ ^ 0.320 0.79830 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.430 1.59660 0.000
+particle note ~ ~2.25 ~ 0 0 0 1 1
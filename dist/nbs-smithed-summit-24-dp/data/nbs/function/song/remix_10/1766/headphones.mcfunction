@@ -0,0 +1,5 @@
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.250 0.78458 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.150 0.77111 0.000
+playsound block.note_block.flute_-1 record @s[] ^-0.0 ^ ^ 0.250 1.56917 0.000
+playsound block.note_block.chime record @s[] ^-0.0 ^ ^ 0.180 0.78458 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.250 1.56917 0.000
@@ -0,0 +1,5 @@
+playsound block.note_block.flute record @a[distance=..7.32] ^0.0 ^ ^ 0.250 0.78458 0.000
+playsound block.note_block.flute record @a[distance=..7.37] ^0.0 ^ ^ 0.150 0.77111 0.000
+playsound block.note_block.flute_-1 record @a[distance=..9.98] ^0.0 ^ ^ 0.250 1.56917 0.000
+playsound block.note_block.chime record @a[distance=..6.23] ^0.0 ^ ^ 0.180 0.78458 0.000
+playsound block.note_block.pling record @a[distance=..7.32] ^0.0 ^ ^ 0.250 1.56917 0.000
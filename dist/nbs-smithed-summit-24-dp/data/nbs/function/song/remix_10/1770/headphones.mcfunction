@@ -0,0 +1,5 @@
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.120 0.77557 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.072 0.76225 0.000
+playsound block.note_block.flute_-1 record @s[] ^-0.0 ^ ^ 0.120 1.55114 0.000
+playsound block.note_block.chime record @s[] ^-0.0 ^ ^ 0.090 0.77557 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.120 1.55114 0.000
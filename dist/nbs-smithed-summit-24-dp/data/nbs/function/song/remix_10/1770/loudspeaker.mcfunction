@@ -0,0 +1,5 @@
+playsound block.note_block.flute record @a[distance=..48.00] ^0.0 ^ ^ 0.288 0.77557 0.000
+playsound block.note_block.flute record @a[distance=..48.00] ^0.0 ^ ^ 0.173 0.76225 0.000
+playsound block.note_block.flute_-1 record @a[distance=..48.00] ^0.0 ^ ^ 0.307 1.55114 0.000
+playsound block.note_block.chime record @a[distance=..48.00] ^0.0 ^ ^ 0.201 0.77557 0.000
+playsound block.note_block.pling record @a[distance=..48.00] ^0.0 ^ ^ 0.288 1.55114 0.000
@@ -0,0 +1,5 @@
+playsound block.note_block.flute record @a[distance=..7.35] ^0.0 ^ ^ 0.120 0.77557 0.000
+playsound block.note_block.flute record @a[distance=..7.41] ^0.0 ^ ^ 0.072 0.76225 0.000
+playsound block.note_block.flute_-1 record @a[distance=..10.03] ^0.0 ^ ^ 0.120 1.55114 0.000
+playsound block.note_block.chime record @a[distance=..6.24] ^0.0 ^ ^ 0.090 0.77557 0.000
+playsound block.note_block.pling record @a[distance=..7.35] ^0.0 ^ ^ 0.120 1.55114 0.000
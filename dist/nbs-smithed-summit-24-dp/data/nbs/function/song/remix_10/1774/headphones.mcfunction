@@ -0,0 +1,11 @@
+playsound block.note_block.harp record @s[] ^-0.0 ^ ^ 1.000 0.56123 0.000
+playsound block.note_block.guitar record @s[] ^-0.0 ^ ^ 1.000 1.12246 0.000
+playsound block.note_block.harp record @s[] ^-0.0 ^ ^ 1.000 1.12246 0.000
+playsound block.note_block.guitar_1 record @s[] ^-0.0 ^ ^ 1.000 0.56123 0.000
+playsound block.note_block.harp record @s[] ^-0.0 ^ ^ 1.000 0.84090 0.000
+playsound block.note_block.guitar record @s[] ^-0.0 ^ ^ 1.000 1.68179 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.000 0.76666 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.000 0.75349 0.000
+playsound block.note_block.flute_-1 record @s[] ^-0.0 ^ ^ 0.000 1.53333 0.000
+playsound block.note_block.chime record @s[] ^-0.0 ^ ^ 0.000 0.76666 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.000 1.53333 0.000
@@ -0,0 +1,11 @@
+playsound block.note_block.harp record @a[distance=..48.00] ^0.0 ^ ^ 2.635 0.56123 0.000
+playsound block.note_block.guitar record @a[distance=..48.00] ^0.0 ^ ^ 2.635 1.12246 0.000
+playsound block.note_block.harp record @a[distance=..48.00] ^0.0 ^ ^ 2.473 1.12246 0.000
+playsound block.note_block.guitar_1 record @a[distance=..48.00] ^0.0 ^ ^ 2.473 0.56123 0.000
+playsound block.note_block.harp record @a[distance=..48.00] ^0.0 ^ ^ 2.541 0.84090 0.000
+playsound block.note_block.guitar record @a[distance=..48.00] ^0.0 ^ ^ 2.541 1.68179 0.000
+playsound block.note_block.flute record @a[distance=..48.00] ^0.0 ^ ^ 0.000 0.76666 0.000
+playsound block.note_block.flute record @a[distance=..48.00] ^0.0 ^ ^ 0.000 0.75349 0.000
+playsound block.note_block.flute_-1 record @a[distance=..48.00] ^0.0 ^ ^ 0.000 1.53333 0.000
+playsound block.note_block.chime record @a[distance=..48.00] ^0.0 ^ ^ 0.000 0.76666 0.000
+playsound block.note_block.pling record @a[distance=..48.00] ^0.0 ^ ^ 0.000 1.53333 0.000
@@ -0,0 +1,11 @@
+playsound block.note_block.harp record @a[distance=..11.01] ^0.0 ^ ^ 1.000 0.56123 0.000
+playsound block.note_block.guitar record @a[distance=..11.01] ^0.0 ^ ^ 1.000 1.12246 0.000
+playsound block.note_block.harp record @a[distance=..8.52] ^0.0 ^ ^ 1.000 1.12246 0.000
+playsound block.note_block.guitar_1 record @a[distance=..8.52] ^0.0 ^ ^ 1.000 0.56123 0.000
+playsound block.note_block.harp record @a[distance=..9.72] ^0.0 ^ ^ 1.000 0.84090 0.000
+playsound block.note_block.guitar record @a[distance=..9.72] ^0.0 ^ ^ 1.000 1.68179 0.000
+playsound block.note_block.flute record @a[distance=..7.39] ^0.0 ^ ^ 0.000 0.76666 0.000
+playsound block.note_block.flute record @a[distance=..7.44] ^0.0 ^ ^ 0.000 0.75349 0.000
+playsound block.note_block.flute_-1 record @a[distance=..10.07] ^0.0 ^ ^ 0.000 1.53333 0.000
+playsound block.note_block.chime record @a[distance=..6.25] ^0.0 ^ ^ 0.000 0.76666 0.000
+playsound block.note_block.pling record @a[distance=..7.39] ^0.0 ^ ^ 0.000 1.53333 0.000
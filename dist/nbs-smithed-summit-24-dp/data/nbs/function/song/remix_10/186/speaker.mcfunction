@@ -0,0 +1,2 @@
+playsound block.note_block.snare record @a[distance=..7.65] ^0.0 ^ ^ 1.000 0.70711 0.000
+playsound block.note_block.xylophone record @a[distance=..6.23] ^0.0 ^ ^ 0.300 0.79370 0.000
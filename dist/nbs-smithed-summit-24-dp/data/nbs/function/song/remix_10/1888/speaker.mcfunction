@@ -0,0 +1,40 @@
+playsound block.note_block.hat record @a[distance=..10.35] ^0.0 ^ ^ 1.000 0.70711 0.000
+playsound block.note_block.hat record @a[distance=..10.87] ^0.0 ^ ^ 1.000 0.59460 0.000
+playsound block.note_block.snare record @a[distance=..6.65] ^0.0 ^ ^ 1.000 1.05946 0.000
+playsound block.note_block.bass record @a[distance=..11.95] ^0.0 ^ ^ 1.000 0.70711 0.000
+playsound block.note_block.bass record @a[distance=..11.96] ^0.0 ^ ^ 1.000 0.69295 0.000
+playsound block.note_block.harp record @a[distance=..7.65] ^0.0 ^ ^ 1.000 1.41421 0.000
+playsound block.note_block.harp record @a[distance=..6.99] ^0.0 ^ ^ 1.000 1.78180 0.000
+playsound block.note_block.harp_1 record @a[distance=..6.65] ^0.0 ^ ^ 1.000 0.52973 0.000
+playsound block.note_block.guitar_1 record @a[distance=..7.65] ^0.0 ^ ^ 0.700 0.70711 0.000
+playsound block.note_block.guitar_1 record @a[distance=..6.99] ^0.0 ^ ^ 0.200 0.89090 0.000
+playsound block.note_block.guitar_1 record @a[distance=..6.65] ^0.0 ^ ^ 0.200 1.05946 0.000
+playsound block.note_block.pling record @a[distance=..7.65] ^0.0 ^ ^ 0.200 1.41421 0.000
+playsound block.note_block.pling record @a[distance=..6.99] ^0.0 ^ ^ 0.175 1.78180 0.000
+playsound block.note_block.pling_1 record @a[distance=..6.65] ^0.0 ^ ^ 0.150 0.52973 0.000
+playsound block.note_block.pling record @a[distance=..8.76] ^0.0 ^ ^ 1.000 1.05946 0.000
+playsound block.note_block.pling_1 record @a[distance=..6.65] ^0.0 ^ ^ 1.000 0.52973 0.000
+playsound block.note_block.pling_1 record @a[distance=..6.10] ^0.0 ^ ^ 1.000 1.05946 0.000
+playsound block.note_block.bell record @a[distance=..6.10] ^0.0 ^ ^ 1.000 1.05946 0.000
+playsound block.note_block.bell_1 record @a[distance=..6.01] ^0.0 ^ ^ 1.000 0.52973 0.000
+playsound block.note_block.guitar_1 record @a[distance=..8.76] ^0.0 ^ ^ 1.000 0.52973 0.000
+playsound block.note_block.guitar_1 record @a[distance=..6.65] ^0.0 ^ ^ 1.000 1.05946 0.000
+playsound block.note_block.flute record @a[distance=..6.65] ^0.0 ^ ^ 1.000 1.05946 0.000
+playsound block.note_block.flute_1 record @a[distance=..6.10] ^0.0 ^ ^ 1.000 0.52973 0.000
+playsound block.note_block.bell record @a[distance=..6.16] ^0.0 ^ ^ 0.100 0.89090 0.000
+playsound block.note_block.bell record @a[distance=..6.02] ^0.0 ^ ^ 1.000 1.78180 0.000
+playsound block.note_block.pling record @a[distance=..9.48] ^0.0 ^ ^ 1.000 0.89090 0.000
+playsound block.note_block.pling record @a[distance=..6.99] ^0.0 ^ ^ 1.000 1.78180 0.000
+playsound block.note_block.pling_1 record @a[distance=..6.16] ^0.0 ^ ^ 0.600 0.89090 0.000
+playsound block.note_block.guitar record @a[distance=..9.48] ^0.0 ^ ^ 1.000 1.78180 0.000
+playsound block.note_block.guitar_1 record @a[distance=..6.99] ^0.0 ^ ^ 1.000 0.89090 0.000
+playsound block.note_block.flute record @a[distance=..6.99] ^0.0 ^ ^ 1.000 0.89090 0.000
+playsound block.note_block.flute record @a[distance=..6.16] ^0.0 ^ ^ 1.000 1.78180 0.000
+playsound random_fizz record @a[distance=..6.42] ^0.0 ^ ^ 1.000 1.25992 0.000
+playsound random_fizz record @a[distance=..6.75] ^0.0 ^ ^ 1.000 1.00000 0.000
+playsound random_fizz record @a[distance=..7.13] ^0.0 ^ ^ 1.000 0.84090 0.000
+execute store result score #random nbs run random value 1..4
+execute if score #random nbs matches 1 if entity @a[distance=0..12] run function animated_java:music_speaker/animations/animation_speaker_beat_1/play
+execute if score #random nbs matches 2 if entity @a[distance=0..12] run function animated_java:music_speaker/animations/animation_speaker_beat_2/play
+execute if score #random nbs matches 3 if entity @a[distance=0..12] run function animated_java:music_speaker/animations/animation_speaker_beat_3/play
+execute if score #random nbs matches 4 if entity @a[distance=0..12] run function animated_java:music_speaker/animations/animation_speaker_beat_4/play
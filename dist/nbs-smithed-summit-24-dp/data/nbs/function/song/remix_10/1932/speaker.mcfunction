@@ -0,0 +1,34 @@
+playsound dig_gravel2 record @a[distance=..6.75] ^0.0 ^ ^ 0.500 1.00000 0.000
+playsound mob_silverfish_hit2 record @a[distance=..6.75] ^0.0 ^ ^ 0.100 1.00000 0.000
+playsound block.note_block.basedrum record @a[distance=..11.69] ^0.0 ^ ^ 1.000 0.70711 0.000
+playsound block.note_block.basedrum record @a[distance=..11.81] ^0.0 ^ ^ 1.000 0.59460 0.000
+playsound block.note_block.snare record @a[distance=..6.65] ^0.0 ^ ^ 1.000 1.05946 0.000
+playsound block.note_block.bass record @a[distance=..11.86] ^0.0 ^ ^ 1.000 1.05946 0.000
+playsound block.note_block.bass record @a[distance=..11.87] ^0.0 ^ ^ 1.000 1.03826 0.000
+playsound block.note_block.harp record @a[distance=..7.29] ^0.0 ^ ^ 1.000 1.58740 0.000
+playsound block.note_block.harp record @a[distance=..6.86] ^0.0 ^ ^ 1.000 1.88775 0.000
+playsound block.note_block.harp record @a[distance=..8.76] ^0.0 ^ ^ 1.000 1.05946 0.000
+playsound block.note_block.guitar_1 record @a[distance=..7.29] ^0.0 ^ ^ 0.700 0.79370 0.000
+playsound block.note_block.guitar_1 record @a[distance=..6.86] ^0.0 ^ ^ 0.200 0.94387 0.000
+playsound block.note_block.guitar_1 record @a[distance=..8.76] ^0.0 ^ ^ 0.200 0.52973 0.000
+playsound block.note_block.pling record @a[distance=..7.29] ^0.0 ^ ^ 0.200 1.58740 0.000
+playsound block.note_block.pling record @a[distance=..6.86] ^0.0 ^ ^ 0.175 1.88775 0.000
+playsound block.note_block.pling record @a[distance=..8.76] ^0.0 ^ ^ 0.150 1.05946 0.000
+playsound block.note_block.pling record @a[distance=..9.24] ^0.0 ^ ^ 1.000 0.94387 0.000
+playsound block.note_block.pling record @a[distance=..6.86] ^0.0 ^ ^ 1.000 1.88775 0.000
+playsound block.note_block.pling_1 record @a[distance=..6.14] ^0.0 ^ ^ 1.000 0.94387 0.000
+playsound block.note_block.bell record @a[distance=..6.14] ^0.0 ^ ^ 1.000 0.94387 0.000
+playsound block.note_block.bell record @a[distance=..6.02] ^0.0 ^ ^ 1.000 1.88775 0.000
+playsound block.note_block.guitar record @a[distance=..9.24] ^0.0 ^ ^ 1.000 1.88775 0.000
+playsound block.note_block.guitar_1 record @a[distance=..6.86] ^0.0 ^ ^ 1.000 0.94387 0.000
+playsound block.note_block.flute record @a[distance=..6.86] ^0.0 ^ ^ 1.000 0.94387 0.000
+playsound block.note_block.flute record @a[distance=..6.14] ^0.0 ^ ^ 1.000 1.88775 0.000
+playsound block.note_block.bell record @a[distance=..6.23] ^0.0 ^ ^ 0.100 0.79370 0.000
+playsound block.note_block.bell record @a[distance=..6.03] ^0.0 ^ ^ 1.000 1.58740 0.000
+playsound block.note_block.pling record @a[distance=..9.94] ^0.0 ^ ^ 1.000 0.79370 0.000
+playsound block.note_block.pling record @a[distance=..7.29] ^0.0 ^ ^ 1.000 1.58740 0.000
+playsound block.note_block.pling_1 record @a[distance=..6.23] ^0.0 ^ ^ 0.600 0.79370 0.000
+playsound block.note_block.guitar record @a[distance=..9.94] ^0.0 ^ ^ 1.000 1.58740 0.000
+playsound block.note_block.guitar_1 record @a[distance=..7.29] ^0.0 ^ ^ 1.000 0.79370 0.000
+playsound block.note_block.flute record @a[distance=..7.29] ^0.0 ^ ^ 1.000 0.79370 0.000
+playsound block.note_block.flute record @a[distance=..6.23] ^0.0 ^ ^ 1.000 1.58740 0.000
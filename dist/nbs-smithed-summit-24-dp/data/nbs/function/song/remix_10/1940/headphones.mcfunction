@@ -0,0 +1,16 @@
+playsound dig_gravel2 record @s[] ^-0.0 ^ ^ 0.500 1.00000 0.000
+playsound mob_silverfish_hit2 record @s[] ^-0.0 ^ ^ 0.100 1.00000 0.000
+playsound block.note_block.basedrum record @s[] ^-0.0 ^ ^ 1.000 0.70711 0.000
+playsound block.note_block.basedrum record @s[] ^-0.0 ^ ^ 1.000 0.59460 0.000
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 1.000 0.89090 0.000
+playsound block.note_block.bass record @s[] ^-0.0 ^ ^ 1.000 1.05946 0.000
+playsound block.note_block.bass record @s[] ^-0.0 ^ ^ 1.000 1.03826 0.000
+playsound block.note_block.harp record @s[] ^-0.0 ^ ^ 1.000 1.58740 0.000
+playsound block.note_block.harp record @s[] ^-0.0 ^ ^ 1.000 1.88775 0.000
+playsound block.note_block.harp record @s[] ^-0.0 ^ ^ 1.000 1.05946 0.000
+playsound block.note_block.guitar_1 record @s[] ^-0.0 ^ ^ 0.700 0.79370 0.000
+playsound block.note_block.guitar_1 record @s[] ^-0.0 ^ ^ 0.200 0.94387 0.000
+playsound block.note_block.guitar_1 record @s[] ^-0.0 ^ ^ 0.200 0.52973 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.200 1.58740 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.175 1.88775 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.150 1.05946 0.000
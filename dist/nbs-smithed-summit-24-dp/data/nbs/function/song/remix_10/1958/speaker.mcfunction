@@ -0,0 +1,10 @@
+playsound block.note_block.snare record @a[distance=..7.65] ^0.0 ^ ^ 1.000 0.70711 0.000
+playsound block.note_block.harp record @a[distance=..7.29] ^0.0 ^ ^ 1.000 1.58740 0.000
+playsound block.note_block.harp record @a[distance=..6.86] ^0.0 ^ ^ 1.000 1.88775 0.000
+playsound block.note_block.harp record @a[distance=..8.76] ^0.0 ^ ^ 1.000 1.05946 0.000
+playsound block.note_block.guitar_1 record @a[distance=..7.29] ^0.0 ^ ^ 0.700 0.79370 0.000
+playsound block.note_block.guitar_1 record @a[distance=..6.86] ^0.0 ^ ^ 0.200 0.94387 0.000
+playsound block.note_block.guitar_1 record @a[distance=..8.76] ^0.0 ^ ^ 0.200 0.52973 0.000
+playsound block.note_block.pling record @a[distance=..7.29] ^0.0 ^ ^ 0.200 1.58740 0.000
+playsound block.note_block.pling record @a[distance=..6.86] ^0.0 ^ ^ 0.175 1.88775 0.000
+playsound block.note_block.pling record @a[distance=..8.76] ^0.0 ^ ^ 0.150 1.05946 0.000
@@ -0,0 +1,10 @@
+playsound block.note_block.snare record @a[distance=..48.00] ^0.0 ^ ^ 2.203 1.78180 0.000
+playsound block.note_block.snare_1 record @a[distance=..48.00] ^0.0 ^ ^ 2.162 0.52973 0.000
+playsound block.note_block.snare record @a[distance=..48.00] ^0.0 ^ ^ 2.351 0.94387 0.000
+playsound block.note_block.snare_1 record @a[distance=..48.00] ^0.0 ^ ^ 1.973 1.18921 0.000
+playsound block.note_block.snare record @a[distance=..48.00] ^0.0 ^ ^ 2.297 1.18921 0.000
+playsound block.note_block.didgeridoo record @a[distance=..48.00] ^0.0 ^ ^ 2.730 1.49831 0.000
+playsound block.note_block.didgeridoo record @a[distance=..48.00] ^0.0 ^ ^ 2.662 2.00000 0.000
+playsound mob_zombie_unfect record @a[distance=..48.00] ^0.0 ^ ^ 1.338 1.58740 0.000
+playsound mob_silverfish_say2 record @a[distance=..48.00] ^0.0 ^ ^ 2.230 1.58740 0.000
+playsound mob_bat_idle2 record @a[distance=..48.00] ^0.0 ^ ^ 0.195 0.66742 0.000
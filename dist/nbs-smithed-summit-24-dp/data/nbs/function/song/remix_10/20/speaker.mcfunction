@@ -0,0 +1,10 @@
+playsound block.note_block.snare record @a[distance=..6.16] ^0.0 ^ ^ 1.000 1.78180 0.000
+playsound block.note_block.snare_1 record @a[distance=..6.10] ^0.0 ^ ^ 1.000 0.52973 0.000
+playsound block.note_block.snare record @a[distance=..6.86] ^0.0 ^ ^ 1.000 0.94387 0.000
+playsound block.note_block.snare_1 record @a[distance=..6.01] ^0.0 ^ ^ 1.000 1.18921 0.000
+playsound block.note_block.snare record @a[distance=..6.48] ^0.0 ^ ^ 1.000 1.18921 0.000
+playsound block.note_block.didgeridoo record @a[distance=..11.64] ^0.0 ^ ^ 1.000 1.49831 0.000
+playsound block.note_block.didgeridoo record @a[distance=..11.25] ^0.0 ^ ^ 1.000 2.00000 0.000
+playsound mob_zombie_unfect record @a[distance=..6.23] ^0.0 ^ ^ 0.600 1.58740 0.000
+playsound mob_silverfish_say2 record @a[distance=..6.23] ^0.0 ^ ^ 1.000 1.58740 0.000
+playsound mob_bat_idle2 record @a[distance=..7.85] ^0.0 ^ ^ 0.080 0.66742 0.000
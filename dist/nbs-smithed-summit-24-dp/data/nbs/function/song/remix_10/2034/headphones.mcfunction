@@ -0,0 +1,10 @@
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 1.000 0.70711 0.000
+playsound block.note_block.harp record @s[] ^-0.0 ^ ^ 0.500 1.41421 0.000
+playsound block.note_block.harp record @s[] ^-0.0 ^ ^ 0.500 1.78180 0.000
+playsound block.note_block.harp record @s[] ^-0.0 ^ ^ 0.500 1.05946 0.000
+playsound block.note_block.guitar_1 record @s[] ^-0.0 ^ ^ 0.350 0.70711 0.000
+playsound block.note_block.guitar_1 record @s[] ^-0.0 ^ ^ 0.100 0.89090 0.000
+playsound block.note_block.guitar_1 record @s[] ^-0.0 ^ ^ 0.100 0.52973 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.096 1.41421 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.084 1.78180 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.072 1.05946 0.000
@@ -0,0 +1,5 @@
+playsound block.note_block.flute record @a[distance=..7.85] ^0.0 ^ ^ 0.500 0.66742 0.000
+playsound block.note_block.pling record @a[distance=..7.85] ^0.0 ^ ^ 0.500 1.33484 0.000
+playsound block.note_block.bit record @a[distance=..7.85] ^0.0 ^ ^ 0.500 1.33484 0.000
+playsound block.note_block.xylophone record @a[distance=..6.16] ^0.0 ^ ^ 0.135 0.89090 0.000
+playsound block.note_block.guitar record @a[distance=..11.58] ^0.0 ^ ^ 0.100 0.79370 0.000
@@ -0,0 +1,10 @@
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 1.000 0.70711 0.000
+playsound block.note_block.harp record @s[] ^-0.0 ^ ^ 0.500 1.41421 0.000
+playsound block.note_block.harp record @s[] ^-0.0 ^ ^ 0.500 1.88775 0.000
+playsound block.note_block.harp record @s[] ^-0.0 ^ ^ 0.500 1.18921 0.000
+playsound block.note_block.guitar_1 record @s[] ^-0.0 ^ ^ 0.350 0.70711 0.000
+playsound block.note_block.guitar_1 record @s[] ^-0.0 ^ ^ 0.100 0.94387 0.000
+playsound block.note_block.guitar_1 record @s[] ^-0.0 ^ ^ 0.100 0.59460 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.096 1.41421 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.084 1.88775 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.072 1.18921 0.000
@@ -0,0 +1,13 @@
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 1.000 0.70711 0.000
+playsound block.note_block.harp record @s[] ^-0.0 ^ ^ 0.500 1.41421 0.000
+playsound block.note_block.harp record @s[] ^-0.0 ^ ^ 0.500 1.88775 0.000
+playsound block.note_block.harp_1 record @s[] ^-0.0 ^ ^ 0.500 0.52973 0.000
+playsound block.note_block.harp_1 record @s[] ^-0.0 ^ ^ 0.500 0.70711 0.000
+playsound block.note_block.guitar_1 record @s[] ^-0.0 ^ ^ 0.350 0.70711 0.000
+playsound block.note_block.guitar_1 record @s[] ^-0.0 ^ ^ 0.100 0.94387 0.000
+playsound block.note_block.guitar_1 record @s[] ^-0.0 ^ ^ 0.100 1.05946 0.000
+playsound block.note_block.guitar_1 record @s[] ^-0.0 ^ ^ 0.150 0.70711 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.096 1.41421 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.084 1.88775 0.000
+playsound block.note_block.pling_1 record @s[] ^-0.0 ^ ^ 0.072 0.52973 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.120 1.41421 0.000
@@ -0,0 +1 @@
+playsound mob_silverfish_say2 record @s[] ^-0.0 ^ ^ 1.000 1.33484 0.000
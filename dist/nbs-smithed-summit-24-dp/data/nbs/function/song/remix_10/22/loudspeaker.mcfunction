@@ -0,0 +1 @@
+playsound mob_silverfish_say2 record @a[distance=..48.00] ^0.0 ^ ^ 2.270 1.33484 0.000
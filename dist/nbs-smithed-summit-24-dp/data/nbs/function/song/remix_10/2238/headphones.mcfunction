@@ -0,0 +1 @@
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 1.000 0.94387 0.000
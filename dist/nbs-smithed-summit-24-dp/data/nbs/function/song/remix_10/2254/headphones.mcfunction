@@ -0,0 +1,4 @@
+playsound block.note_block.basedrum record @s[] ^-0.0 ^ ^ 1.000 0.89090 0.000
+playsound block.note_block.basedrum record @s[] ^-0.0 ^ ^ 1.000 0.62996 0.000
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 1.000 0.62996 0.000
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 1.000 0.79370 0.000
@@ -0,0 +1,4 @@
+playsound block.note_block.basedrum record @s[] ^-0.0 ^ ^ 1.000 1.88775 0.000
+playsound block.note_block.basedrum record @s[] ^-0.0 ^ ^ 1.000 1.33484 0.000
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 1.000 1.33484 0.000
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 1.000 1.68179 0.000
@@ -0,0 +1,5 @@
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.500 1.12246 0.000
+playsound block.note_block.pling_1 record @s[] ^-0.0 ^ ^ 0.500 0.56123 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.0 ^ ^ 0.500 0.56123 0.000
+playsound block.note_block.xylophone record @s[] ^-0.0 ^ ^ 0.300 0.79370 0.000
+playsound block.note_block.guitar record @s[] ^-0.0 ^ ^ 0.100 0.79370 0.000
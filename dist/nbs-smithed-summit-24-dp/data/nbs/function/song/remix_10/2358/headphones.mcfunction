@@ -0,0 +1,5 @@
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.500 0.94387 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.500 1.88775 0.000
+playsound block.note_block.bit record @s[] ^-0.0 ^ ^ 0.500 1.88775 0.000
+playsound block.note_block.xylophone record @s[] ^-0.0 ^ ^ 0.135 0.79370 0.000
+playsound block.note_block.guitar record @s[] ^-0.0 ^ ^ 0.100 0.79370 0.000
@@ -0,0 +1,3 @@
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 1.000 0.94387 0.000
+playsound block.note_block.xylophone record @s[] ^-0.0 ^ ^ 0.300 0.89090 0.000
+playsound block.note_block.guitar record @s[] ^-0.0 ^ ^ 0.100 0.79370 0.000
@@ -0,0 +1,10 @@
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 1.000 1.41421 0.000
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 1.000 0.70711 0.000
+playsound block.note_block.snare_1 record @s[] ^-0.0 ^ ^ 1.000 1.58740 0.000
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 1.000 1.58740 0.000
+playsound block.note_block.didgeridoo record @s[] ^-0.0 ^ ^ 1.000 1.33484 0.000
+playsound block.note_block.didgeridoo record @s[] ^-0.0 ^ ^ 1.000 1.78180 0.000
+playsound mob_zombie_unfect record @s[] ^-0.0 ^ ^ 0.600 2.00000 0.000
+playsound mob_silverfish_say2 record @s[] ^-0.0 ^ ^ 1.000 1.18921 0.000
+playsound mob_bat_idle2 record @s[] ^-0.0 ^ ^ 0.080 0.62996 0.000
+particle note ~ ~2.25 ~ 0 0 0 1 1
@@ -0,0 +1,14 @@
+playsound block.note_block.snare record @a[distance=..6.31] ^0.0 ^ ^ 1.000 1.41421 0.000
+playsound block.note_block.snare record @a[distance=..7.65] ^0.0 ^ ^ 1.000 0.70711 0.000
+playsound block.note_block.snare_1 record @a[distance=..6.00] ^0.0 ^ ^ 1.000 1.58740 0.000
+playsound block.note_block.snare record @a[distance=..6.23] ^0.0 ^ ^ 1.000 1.58740 0.000
+playsound block.note_block.didgeridoo record @a[distance=..11.74] ^0.0 ^ ^ 1.000 1.33484 0.000
+playsound block.note_block.didgeridoo record @a[distance=..11.44] ^0.0 ^ ^ 1.000 1.78180 0.000
+playsound mob_zombie_unfect record @a[distance=..6.12] ^0.0 ^ ^ 0.600 2.00000 0.000
+playsound mob_silverfish_say2 record @a[distance=..6.48] ^0.0 ^ ^ 1.000 1.18921 0.000
+playsound mob_bat_idle2 record @a[distance=..8.06] ^0.0 ^ ^ 0.080 0.62996 0.000
+execute store result score #random nbs run random value 1..4
+execute if score #random nbs matches 1 if entity @a[distance=0..12] run function animated_java:music_speaker/animations/animation_speaker_beat_1/play
+execute if score #random nbs matches 2 if entity @a[distance=0..12] run function animated_java:music_speaker/animations/animation_speaker_beat_2/play
+execute if score #random nbs matches 3 if entity @a[distance=0..12] run function animated_java:music_speaker/animations/animation_speaker_beat_3/play
+execute if score #random nbs matches 4 if entity @a[distance=0..12] run function animated_java:music_speaker/animations/animation_speaker_beat_4/play
@@ -0,0 +1,2 @@
+playsound block.note_block.pling record @a[distance=..48.00] ^0.0 ^ ^ 2.435 1.31951 0.000
+playsound block.note_block.flute record @a[distance=..48.00] ^0.0 ^ ^ 2.273 1.31951 0.000
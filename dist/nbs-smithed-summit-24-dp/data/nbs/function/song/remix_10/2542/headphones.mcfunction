@@ -0,0 +1,3 @@
+playsound block.note_block.xylophone_-1 record @s[] ^-0.0 ^ ^ 0.300 1.58740 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 1.000 1.33484 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 1.000 1.33484 0.000
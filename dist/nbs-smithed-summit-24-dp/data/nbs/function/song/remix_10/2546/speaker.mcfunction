@@ -0,0 +1,3 @@
+playsound block.note_block.snare record @a[distance=..7.65] ^0.0 ^ ^ 1.000 0.70711 0.000
+playsound block.note_block.pling record @a[distance=..7.85] ^0.0 ^ ^ 1.000 1.33484 0.000
+playsound block.note_block.flute record @a[distance=..6.36] ^0.0 ^ ^ 1.000 1.33484 0.000
@@ -0,0 +1,2 @@
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 1.000 1.52450 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 1.000 1.52450 0.000
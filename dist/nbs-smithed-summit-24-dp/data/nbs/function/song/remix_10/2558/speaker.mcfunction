@@ -0,0 +1,3 @@
+playsound block.note_block.snare record @a[distance=..6.86] ^0.0 ^ ^ 1.000 0.94387 0.000
+playsound block.note_block.pling record @a[distance=..7.29] ^0.0 ^ ^ 1.000 1.58740 0.000
+playsound block.note_block.flute record @a[distance=..6.23] ^0.0 ^ ^ 1.000 1.58740 0.000
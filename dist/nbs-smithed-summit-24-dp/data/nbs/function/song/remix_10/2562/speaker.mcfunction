@@ -0,0 +1,2 @@
+playsound block.note_block.pling record @a[distance=..6.75] ^0.0 ^ ^ 1.000 2.00000 0.000
+playsound block.note_block.flute record @a[distance=..6.12] ^0.0 ^ ^ 1.000 2.00000 0.000
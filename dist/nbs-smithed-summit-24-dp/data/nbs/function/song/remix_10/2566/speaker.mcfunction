@@ -0,0 +1,4 @@
+playsound block.note_block.snare record @a[distance=..7.65] ^0.0 ^ ^ 1.000 0.70711 0.000
+playsound block.note_block.xylophone record @a[distance=..6.36] ^0.0 ^ ^ 0.300 0.66742 0.000
+playsound block.note_block.pling record @a[distance=..6.75] ^0.0 ^ ^ 1.000 2.00000 0.000
+playsound block.note_block.flute record @a[distance=..6.12] ^0.0 ^ ^ 1.000 2.00000 0.000
@@ -0,0 +1,3 @@
+playsound block.note_block.xylophone record @s[] ^-0.0 ^ ^ 0.300 0.59460 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 1.000 1.58740 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 1.000 1.58740 0.000
@@ -0,0 +1,3 @@
+playsound block.note_block.xylophone record @a[distance=..48.00] ^0.0 ^ ^ 0.689 0.59460 0.000
+playsound block.note_block.pling record @a[distance=..48.00] ^0.0 ^ ^ 2.392 1.58740 0.000
+playsound block.note_block.flute record @a[distance=..48.00] ^0.0 ^ ^ 2.230 1.58740 0.000
@@ -0,0 +1,6 @@
+playsound block.note_block.snare record @a[distance=..6.48] ^0.0 ^ ^ 1.000 1.18921 0.000
+playsound block.note_block.snare record @a[distance=..8.28] ^0.0 ^ ^ 1.000 0.59460 0.000
+playsound block.note_block.snare_1 record @a[distance=..6.10] ^0.0 ^ ^ 1.000 0.52973 0.000
+playsound block.note_block.didgeridoo record @a[distance=..11.88] ^0.0 ^ ^ 1.000 1.00000 0.000
+playsound block.note_block.didgeridoo record @a[distance=..11.74] ^0.0 ^ ^ 1.000 1.33484 0.000
+playsound mob_bat_idle2 record @a[distance=..8.52] ^0.0 ^ ^ 0.080 0.56123 0.000
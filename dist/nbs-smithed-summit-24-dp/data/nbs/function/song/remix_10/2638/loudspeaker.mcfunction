@@ -0,0 +1 @@
+playsound block.note_block.xylophone record @a[distance=..48.00] ^0.0 ^ ^ 0.673 0.74915 0.000
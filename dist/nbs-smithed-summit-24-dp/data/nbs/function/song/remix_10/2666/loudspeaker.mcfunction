@@ -0,0 +1,3 @@
+playsound block.note_block.snare record @a[distance=..48.00] ^0.0 ^ ^ 2.270 1.33484 0.000
+playsound block.note_block.snare record @a[distance=..48.00] ^0.0 ^ ^ 2.270 1.33484 0.000
+playsound block.note_block.snare record @a[distance=..48.00] ^0.0 ^ ^ 0.227 1.33484 0.000
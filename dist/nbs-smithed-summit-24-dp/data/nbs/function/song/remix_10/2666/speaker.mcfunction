@@ -0,0 +1,3 @@
+playsound block.note_block.snare record @a[distance=..6.36] ^0.0 ^ ^ 1.000 1.33484 0.000
+playsound block.note_block.snare record @a[distance=..6.36] ^0.0 ^ ^ 1.000 1.33484 0.000
+playsound block.note_block.snare record @a[distance=..6.36] ^0.0 ^ ^ 0.100 1.33484 0.000
@@ -0,0 +1,14 @@
+playsound block.note_block.basedrum record @a[distance=..11.69] ^0.0 ^ ^ 1.000 0.70711 0.000
+playsound block.note_block.basedrum record @a[distance=..11.81] ^0.0 ^ ^ 1.000 0.59460 0.000
+playsound block.note_block.bass record @a[distance=..11.98] ^0.0 ^ ^ 1.000 0.52973 0.000
+playsound block.note_block.bass record @a[distance=..11.98] ^0.0 ^ ^ 1.000 0.51913 0.000
+playsound block.note_block.xylophone_-1 record @a[distance=..7.29] ^0.0 ^ ^ 0.135 1.58740 0.000
+playsound block.note_block.snare record @a[distance=..6.36] ^0.0 ^ ^ 0.250 1.33484 0.000
+playsound block.note_block.snare record @a[distance=..6.36] ^0.0 ^ ^ 0.250 1.33484 0.000
+playsound block.note_block.snare record @a[distance=..6.36] ^0.0 ^ ^ 0.025 1.33484 0.000
+playsound random_fizz record @a[distance=..6.86] ^1.0 ^ ^ 0.500 0.94387 0.000
+execute store result score #random nbs run random value 1..4
+execute if score #random nbs matches 1 if entity @a[distance=0..12] run function animated_java:music_speaker/animations/animation_speaker_beat_1/play
+execute if score #random nbs matches 2 if entity @a[distance=0..12] run function animated_java:music_speaker/animations/animation_speaker_beat_2/play
+execute if score #random nbs matches 3 if entity @a[distance=0..12] run function animated_java:music_speaker/animations/animation_speaker_beat_3/play
+execute if score #random nbs matches 4 if entity @a[distance=0..12] run function animated_java:music_speaker/animations/animation_speaker_beat_4/play
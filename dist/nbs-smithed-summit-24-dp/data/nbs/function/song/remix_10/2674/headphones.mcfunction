@@ -0,0 +1,4 @@
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 1.000 0.70711 0.000
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 0.000 1.33484 0.000
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 0.000 1.33484 0.000
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 0.000 1.33484 0.000
@@ -0,0 +1 @@
+playsound block.note_block.xylophone record @s[] ^-0.0 ^ ^ 0.300 0.70711 0.000
@@ -0,0 +1 @@
+playsound block.note_block.xylophone record @a[distance=..48.00] ^0.0 ^ ^ 0.689 0.59460 0.000
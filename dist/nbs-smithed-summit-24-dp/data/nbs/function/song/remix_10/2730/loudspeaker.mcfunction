@@ -0,0 +1 @@
+playsound block.note_block.xylophone record @a[distance=..48.00] ^0.0 ^ ^ 0.294 1.00000 0.000
@@ -0,0 +1,3 @@
+playsound block.note_block.xylophone record @a[distance=..6.07] ^0.0 ^ ^ 0.300 1.18921 0.000
+playsound block.note_block.pling record @a[distance=..6.99] ^0.0 ^ ^ 1.000 1.78180 0.000
+playsound block.note_block.flute record @a[distance=..6.16] ^0.0 ^ ^ 1.000 1.78180 0.000
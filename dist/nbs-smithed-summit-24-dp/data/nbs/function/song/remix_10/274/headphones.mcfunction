@@ -0,0 +1,13 @@
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 1.000 0.70711 0.000
+playsound block.note_block.bass_-1 record @s[] ^-0.0 ^ ^ 1.000 1.78180 0.000
+playsound block.note_block.bass_-1 record @s[] ^-0.0 ^ ^ 1.000 1.88775 0.000
+playsound block.note_block.bass record @s[] ^-0.0 ^ ^ 1.000 0.52973 0.000
+playsound block.note_block.guitar_1 record @s[] ^-0.0 ^ ^ 0.240 0.66742 0.000
+playsound block.note_block.guitar_1 record @s[] ^-0.0 ^ ^ 0.210 0.89090 0.000
+playsound block.note_block.guitar_1 record @s[] ^-0.0 ^ ^ 0.180 1.00000 0.000
+playsound block.note_block.harp record @s[] ^-0.0 ^ ^ 0.300 1.33484 0.000
+playsound block.note_block.harp record @s[] ^-0.0 ^ ^ 0.300 1.78180 0.000
+playsound block.note_block.harp record @s[] ^-0.0 ^ ^ 0.300 2.00000 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.120 1.33484 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.120 1.78180 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.150 2.00000 0.000
@@ -0,0 +1,6 @@
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 1.000 1.18921 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 1.000 1.18921 0.000
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 0.060 1.41421 0.000
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 0.060 1.00000 0.000
+playsound block.note_block.basedrum record @s[] ^-0.0 ^ ^ 0.060 0.70711 0.000
+playsound mob_silverfish_hit2 record @s[] ^-0.0 ^ ^ 0.018 1.88775 0.000
@@ -0,0 +1,7 @@
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 1.000 0.94387 0.000
+playsound block.note_block.snare_-1 record @s[] ^-0.0 ^ ^ 1.000 1.88775 0.000
+playsound block.note_block.snare_1 record @s[] ^-0.0 ^ ^ 1.000 0.66742 0.000
+playsound block.note_block.didgeridoo record @s[] ^-0.0 ^ ^ 1.000 1.00000 0.000
+playsound block.note_block.didgeridoo record @s[] ^-0.0 ^ ^ 1.000 1.05946 0.000
+playsound mob_silverfish_say2 record @s[] ^-0.0 ^ ^ 1.000 0.94387 0.000
+playsound mob_bat_idle2 record @s[] ^-0.0 ^ ^ 0.080 0.50000 0.000
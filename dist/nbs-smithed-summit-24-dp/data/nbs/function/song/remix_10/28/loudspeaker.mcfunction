@@ -0,0 +1,7 @@
+playsound block.note_block.snare record @a[distance=..48.00] ^0.0 ^ ^ 2.351 0.94387 0.000
+playsound block.note_block.snare_-1 record @a[distance=..48.00] ^0.0 ^ ^ 2.514 1.88775 0.000
+playsound block.note_block.snare_1 record @a[distance=..48.00] ^0.0 ^ ^ 2.108 0.66742 0.000
+playsound block.note_block.didgeridoo record @a[distance=..48.00] ^0.0 ^ ^ 2.824 1.00000 0.000
+playsound block.note_block.didgeridoo record @a[distance=..48.00] ^0.0 ^ ^ 2.811 1.05946 0.000
+playsound mob_silverfish_say2 record @a[distance=..48.00] ^0.0 ^ ^ 2.351 0.94387 0.000
+playsound mob_bat_idle2 record @a[distance=..48.00] ^0.0 ^ ^ 0.200 0.50000 0.000
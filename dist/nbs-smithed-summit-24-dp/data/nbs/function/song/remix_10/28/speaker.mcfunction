@@ -0,0 +1,7 @@
+playsound block.note_block.snare record @a[distance=..6.86] ^0.0 ^ ^ 1.000 0.94387 0.000
+playsound block.note_block.snare_-1 record @a[distance=..9.24] ^0.0 ^ ^ 1.000 1.88775 0.000
+playsound block.note_block.snare_1 record @a[distance=..6.05] ^0.0 ^ ^ 1.000 0.66742 0.000
+playsound block.note_block.didgeridoo record @a[distance=..11.88] ^0.0 ^ ^ 1.000 1.00000 0.000
+playsound block.note_block.didgeridoo record @a[distance=..11.86] ^0.0 ^ ^ 1.000 1.05946 0.000
+playsound mob_silverfish_say2 record @a[distance=..6.86] ^0.0 ^ ^ 1.000 0.94387 0.000
+playsound mob_bat_idle2 record @a[distance=..9.00] ^0.0 ^ ^ 0.080 0.50000 0.000
@@ -0,0 +1,11 @@
+playsound block.note_block.basedrum record @s[] ^-0.0 ^ ^ 1.000 0.70711 0.000
+playsound block.note_block.basedrum record @s[] ^-0.0 ^ ^ 1.000 0.59460 0.000
+playsound block.note_block.bass record @s[] ^-0.0 ^ ^ 1.000 0.59460 0.000
+playsound block.note_block.bass record @s[] ^-0.0 ^ ^ 1.000 0.58270 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 1.000 1.33484 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 1.000 1.33484 0.000
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 0.280 1.41421 0.000
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 0.280 1.00000 0.000
+playsound block.note_block.basedrum record @s[] ^-0.0 ^ ^ 0.280 0.70711 0.000
+playsound mob_silverfish_hit2 record @s[] ^-0.0 ^ ^ 0.084 1.88775 0.000
+particle note ~ ~2.25 ~ 0 0 0 1 1
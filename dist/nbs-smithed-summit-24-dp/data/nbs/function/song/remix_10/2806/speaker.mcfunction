@@ -0,0 +1,6 @@
+playsound block.note_block.pling record @a[distance=..7.85] ^0.0 ^ ^ 1.000 1.33484 0.000
+playsound block.note_block.flute record @a[distance=..6.36] ^0.0 ^ ^ 1.000 1.33484 0.000
+playsound block.note_block.snare record @a[distance=..6.31] ^0.0 ^ ^ 0.370 1.41421 0.000
+playsound block.note_block.snare record @a[distance=..6.75] ^0.0 ^ ^ 0.370 1.00000 0.000
+playsound block.note_block.basedrum record @a[distance=..11.69] ^0.0 ^ ^ 0.370 0.70711 0.000
+playsound mob_silverfish_hit2 record @a[distance=..6.14] ^0.0 ^ ^ 0.111 1.88775 0.000
@@ -0,0 +1,9 @@
+playsound block.note_block.basedrum record @s[] ^-0.0 ^ ^ 1.000 0.70711 0.000
+playsound block.note_block.basedrum record @s[] ^-0.0 ^ ^ 1.000 0.59460 0.000
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 1.000 1.05946 0.000
+playsound block.note_block.bass record @s[] ^-0.0 ^ ^ 1.000 0.79370 0.000
+playsound block.note_block.bass record @s[] ^-0.0 ^ ^ 1.000 0.77782 0.000
+playsound random_fizz record @s[] ^-0.0 ^ ^ 1.000 1.25992 0.000
+playsound random_fizz record @s[] ^-0.0 ^ ^ 0.600 1.00000 0.000
+playsound random_fizz record @s[] ^-0.0 ^ ^ 1.000 0.84090 0.000
+particle note ~ ~2.25 ~ 0 0 0 1 1
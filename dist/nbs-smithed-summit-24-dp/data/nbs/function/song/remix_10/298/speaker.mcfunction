@@ -0,0 +1,2 @@
+playsound block.note_block.pling record @a[distance=..7.89] ^0.0 ^ ^ 1.000 1.31951 0.000
+playsound block.note_block.flute record @a[distance=..6.37] ^0.0 ^ ^ 1.000 1.31951 0.000
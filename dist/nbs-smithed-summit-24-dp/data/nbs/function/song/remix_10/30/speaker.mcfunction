@@ -0,0 +1,6 @@
+playsound block.note_block.snare record @a[distance=..7.65] ^0.0 ^ ^ 1.000 0.70711 0.000
+playsound block.note_block.snare_-1 record @a[distance=..9.94] ^0.0 ^ ^ 1.000 1.58740 0.000
+playsound block.note_block.snare_1 record @a[distance=..6.00] ^0.0 ^ ^ 1.000 1.88775 0.000
+playsound block.note_block.snare_1 record @a[distance=..6.02] ^0.0 ^ ^ 1.000 0.94387 0.000
+playsound block.note_block.didgeridoo record @a[distance=..11.96] ^0.0 ^ ^ 1.000 0.66742 0.000
+playsound block.note_block.didgeridoo record @a[distance=..11.88] ^0.0 ^ ^ 1.000 1.00000 0.000
@@ -0,0 +1,3 @@
+playsound block.note_block.flute record @a[distance=..6.14] ^0.0 ^ ^ 0.200 1.88775 0.000
+playsound block.note_block.pling record @a[distance=..6.86] ^0.0 ^ ^ 0.200 1.88775 0.000
+playsound block.note_block.bit record @a[distance=..6.86] ^0.0 ^ ^ 0.300 1.88775 0.000
@@ -0,0 +1,12 @@
+playsound block.note_block.basedrum record @s[] ^-0.0 ^ ^ 1.000 0.70711 0.000
+playsound block.note_block.basedrum record @s[] ^-0.0 ^ ^ 1.000 0.59460 0.000
+playsound block.note_block.bass record @s[] ^-0.0 ^ ^ 1.000 1.18921 0.000
+playsound block.note_block.bass record @s[] ^-0.0 ^ ^ 1.000 1.16541 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 1.000 2.00000 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 1.000 2.00000 0.000
+playsound block.note_block.bit record @s[] ^-0.0 ^ ^ 1.000 2.00000 0.000
+playsound block.note_block.bit record @s[] ^-0.0 ^ ^ 0.700 2.00000 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.090 1.88775 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.090 1.88775 0.000
+playsound block.note_block.bit record @s[] ^-0.0 ^ ^ 0.135 1.88775 0.000
+particle note ~ ~2.25 ~ 0 0 0 1 1
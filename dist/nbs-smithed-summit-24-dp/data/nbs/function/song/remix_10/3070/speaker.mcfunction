@@ -0,0 +1,3 @@
+playsound block.note_block.flute record @a[distance=..6.36] ^0.0 ^ ^ 0.090 1.33484 0.000
+playsound block.note_block.pling record @a[distance=..7.85] ^0.0 ^ ^ 0.090 1.33484 0.000
+playsound block.note_block.bit record @a[distance=..7.85] ^0.0 ^ ^ 0.135 1.33484 0.000
@@ -0,0 +1,2 @@
+playsound block.note_block.pling record @a[distance=..7.41] ^0.0 ^ ^ 1.000 1.52450 0.000
+playsound block.note_block.flute record @a[distance=..6.25] ^0.0 ^ ^ 1.000 1.52450 0.000
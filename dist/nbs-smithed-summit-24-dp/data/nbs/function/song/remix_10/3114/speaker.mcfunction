@@ -0,0 +1,2 @@
+playsound block.note_block.didgeridoo record @a[distance=..11.25] ^0.0 ^ ^ 0.500 2.00000 0.000
+playsound block.note_block.flute record @a[distance=..6.75] ^0.0 ^ ^ 1.000 1.00000 0.000
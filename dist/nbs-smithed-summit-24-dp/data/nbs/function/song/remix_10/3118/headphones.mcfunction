@@ -0,0 +1,8 @@
+playsound block.note_block.basedrum record @s[] ^-0.0 ^ ^ 1.000 0.70711 0.000
+playsound block.note_block.basedrum record @s[] ^-0.0 ^ ^ 1.000 0.59460 0.000
+playsound block.note_block.didgeridoo record @s[] ^-0.0 ^ ^ 0.500 2.00000 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 1.000 1.00000 0.000
+playsound block.note_block.banjo record @s[] ^-0.0 ^ ^ 1.000 2.00000 0.000
+playsound block.note_block.banjo record @s[] ^-0.0 ^ ^ 0.700 1.00000 0.000
+playsound block.note_block.guitar record @s[] ^-0.0 ^ ^ 0.200 2.00000 0.000
+playsound block.note_block.guitar record @s[] ^-0.0 ^ ^ 0.200 1.00000 0.000
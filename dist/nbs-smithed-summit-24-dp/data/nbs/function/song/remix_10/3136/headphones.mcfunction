@@ -0,0 +1,12 @@
+playsound block.note_block.basedrum record @s[] ^-0.0 ^ ^ 1.000 0.70711 0.000
+playsound block.note_block.basedrum record @s[] ^-0.0 ^ ^ 1.000 0.59460 0.000
+playsound block.note_block.didgeridoo record @s[] ^-0.0 ^ ^ 1.000 1.05946 0.000
+playsound block.note_block.bass record @s[] ^-0.0 ^ ^ 1.000 0.52973 0.000
+playsound block.note_block.bass record @s[] ^-0.0 ^ ^ 1.000 1.03826 0.000
+playsound block.note_block.didgeridoo record @s[] ^-0.0 ^ ^ 0.500 1.10957 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 1.000 0.55478 0.000
+playsound block.note_block.banjo record @s[] ^-0.0 ^ ^ 1.000 1.12246 0.000
+playsound block.note_block.banjo record @s[] ^-0.0 ^ ^ 0.700 0.56123 0.000
+playsound block.note_block.guitar record @s[] ^-0.0 ^ ^ 0.200 1.12246 0.000
+playsound block.note_block.guitar record @s[] ^-0.0 ^ ^ 0.200 0.56123 0.000
+particle note ~ ~2.25 ~ 0 0 0 1 1
@@ -0,0 +1,8 @@
+playsound block.note_block.basedrum record @a[distance=..11.69] ^0.0 ^ ^ 1.000 0.70711 0.000
+playsound block.note_block.basedrum record @a[distance=..11.81] ^0.0 ^ ^ 1.000 0.59460 0.000
+playsound block.note_block.didgeridoo record @a[distance=..11.77] ^0.0 ^ ^ 0.500 1.25992 0.000
+playsound block.note_block.flute record @a[distance=..8.06] ^0.0 ^ ^ 1.000 0.62996 0.000
+playsound block.note_block.banjo record @a[distance=..8.06] ^0.0 ^ ^ 1.000 1.25992 0.000
+playsound block.note_block.banjo record @a[distance=..10.71] ^0.0 ^ ^ 0.700 0.62996 0.000
+playsound block.note_block.guitar record @a[distance=..10.71] ^0.0 ^ ^ 0.200 1.25992 0.000
+playsound block.note_block.guitar record @a[distance=..11.77] ^0.0 ^ ^ 0.200 0.62996 0.000
@@ -0,0 +1,2 @@
+playsound block.note_block.didgeridoo record @s[] ^-0.0 ^ ^ 0.500 1.41421 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 1.000 0.70711 0.000
@@ -0,0 +1,17 @@
+playsound block.note_block.basedrum record @s[] ^-0.0 ^ ^ 1.000 0.70711 0.000
+playsound block.note_block.basedrum record @s[] ^-0.0 ^ ^ 1.000 0.59460 0.000
+playsound block.note_block.didgeridoo record @s[] ^-0.0 ^ ^ 1.000 1.05946 0.000
+playsound block.note_block.bass record @s[] ^-0.0 ^ ^ 1.000 0.52973 0.000
+playsound block.note_block.bass record @s[] ^-0.0 ^ ^ 1.000 1.03826 0.000
+playsound block.note_block.didgeridoo_1 record @s[] ^-0.0 ^ ^ 0.500 0.51465 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 1.000 1.02930 0.000
+playsound block.note_block.banjo_1 record @s[] ^-0.0 ^ ^ 1.000 0.52973 0.000
+playsound block.note_block.banjo record @s[] ^-0.0 ^ ^ 0.700 1.05946 0.000
+playsound block.note_block.guitar_1 record @s[] ^-0.0 ^ ^ 0.200 0.52973 0.000
+playsound block.note_block.guitar record @s[] ^-0.0 ^ ^ 0.200 1.05946 0.000
+playsound block.note_block.banjo record @s[] ^-0.0 ^ ^ 0.300 1.58740 0.000
+playsound block.note_block.banjo record @s[] ^-0.0 ^ ^ 0.800 0.79370 0.000
+playsound block.note_block.guitar record @s[] ^-0.0 ^ ^ 0.700 0.79370 0.000
+playsound block.note_block.guitar record @s[] ^-0.0 ^ ^ 0.600 1.58740 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 1.000 0.77111 0.000
+particle note ~ ~2.25 ~ 0 0 0 1 1
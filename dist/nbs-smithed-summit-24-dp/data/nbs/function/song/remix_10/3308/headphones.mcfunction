@@ -0,0 +1,18 @@
+playsound dig_gravel2 record @s[] ^-0.0 ^ ^ 0.500 1.00000 0.000
+playsound mob_silverfish_hit2 record @s[] ^-0.0 ^ ^ 0.100 1.00000 0.000
+playsound block.note_block.hat record @s[] ^-0.0 ^ ^ 1.000 0.70711 0.000
+playsound block.note_block.hat record @s[] ^-0.0 ^ ^ 1.000 0.59460 0.000
+playsound block.note_block.didgeridoo record @s[] ^-0.0 ^ ^ 1.000 1.12246 0.000
+playsound block.note_block.bass record @s[] ^-0.0 ^ ^ 1.000 0.56123 0.000
+playsound block.note_block.bass record @s[] ^-0.0 ^ ^ 1.000 1.10000 0.000
+playsound block.note_block.didgeridoo record @s[] ^-0.0 ^ ^ 0.500 1.68179 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 1.000 0.84090 0.000
+playsound block.note_block.banjo record @s[] ^-0.0 ^ ^ 1.000 1.68179 0.000
+playsound block.note_block.banjo record @s[] ^-0.0 ^ ^ 0.700 0.84090 0.000
+playsound block.note_block.guitar record @s[] ^-0.0 ^ ^ 0.200 1.68179 0.000
+playsound block.note_block.guitar record @s[] ^-0.0 ^ ^ 0.200 0.84090 0.000
+playsound block.note_block.banjo record @s[] ^-0.0 ^ ^ 0.300 1.25992 0.000
+playsound block.note_block.banjo record @s[] ^-0.0 ^ ^ 0.800 0.62996 0.000
+playsound block.note_block.guitar record @s[] ^-0.0 ^ ^ 0.700 0.62996 0.000
+playsound block.note_block.guitar record @s[] ^-0.0 ^ ^ 0.600 1.25992 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 1.000 0.62996 0.000
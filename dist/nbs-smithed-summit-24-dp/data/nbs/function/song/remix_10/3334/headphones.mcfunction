@@ -0,0 +1,13 @@
+playsound block.note_block.basedrum record @s[] ^-0.0 ^ ^ 1.000 0.70711 0.000
+playsound block.note_block.basedrum record @s[] ^-0.0 ^ ^ 1.000 0.59460 0.000
+playsound block.note_block.didgeridoo record @s[] ^-0.0 ^ ^ 0.500 1.25992 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 1.000 0.62996 0.000
+playsound block.note_block.banjo record @s[] ^-0.0 ^ ^ 1.000 1.25992 0.000
+playsound block.note_block.banjo record @s[] ^-0.0 ^ ^ 0.700 0.62996 0.000
+playsound block.note_block.guitar record @s[] ^-0.0 ^ ^ 0.200 1.25992 0.000
+playsound block.note_block.guitar record @s[] ^-0.0 ^ ^ 0.200 0.62996 0.000
+playsound block.note_block.banjo record @s[] ^-0.0 ^ ^ 0.300 0.94387 0.000
+playsound block.note_block.banjo_-1 record @s[] ^-0.0 ^ ^ 0.800 1.88775 0.000
+playsound block.note_block.guitar_-1 record @s[] ^-0.0 ^ ^ 0.700 1.88775 0.000
+playsound block.note_block.guitar record @s[] ^-0.0 ^ ^ 0.600 0.94387 0.000
+playsound block.note_block.flute_-1 record @s[] ^-0.0 ^ ^ 1.000 1.88775 0.000
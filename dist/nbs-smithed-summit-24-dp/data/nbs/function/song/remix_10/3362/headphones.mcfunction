@@ -0,0 +1,5 @@
+playsound block.note_block.didgeridoo record @s[] ^-0.0 ^ ^ 0.460 1.05946 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.930 0.52973 0.000
+playsound block.note_block.flute_-1 record @s[] ^-0.0 ^ ^ 0.900 1.58740 0.000
+playsound mob_silverfish_hit2 record @s[] ^-0.0 ^ ^ 0.100 1.41421 0.000
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 1.000 1.05946 0.000
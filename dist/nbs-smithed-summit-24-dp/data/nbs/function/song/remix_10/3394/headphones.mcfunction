@@ -0,0 +1,6 @@
+playsound block.note_block.didgeridoo record @s[] ^-0.0 ^ ^ 0.200 1.05946 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.410 0.52973 0.000
+playsound block.note_block.flute_-1 record @s[] ^-0.0 ^ ^ 0.380 1.58740 0.000
+playsound mob_silverfish_hit2 record @s[] ^-0.0 ^ ^ 0.100 0.59460 0.000
+playsound block.note_block.snare_-1 record @s[] ^-0.0 ^ ^ 1.000 1.58740 0.000
+playsound block.note_block.basedrum record @s[] ^-0.0 ^ ^ 1.000 0.79370 0.000
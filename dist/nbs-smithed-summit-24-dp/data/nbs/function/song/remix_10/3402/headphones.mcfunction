@@ -0,0 +1,6 @@
+playsound block.note_block.didgeridoo record @s[] ^-0.0 ^ ^ 0.140 1.05946 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.290 0.52973 0.000
+playsound block.note_block.flute_-1 record @s[] ^-0.0 ^ ^ 0.250 1.58740 0.000
+playsound mob_silverfish_hit2 record @s[] ^-0.0 ^ ^ 0.077 0.50000 0.000
+playsound block.note_block.snare_-1 record @s[] ^-0.0 ^ ^ 0.770 1.05946 0.000
+playsound block.note_block.basedrum record @s[] ^-0.0 ^ ^ 1.000 0.79370 0.000
@@ -0,0 +1,2 @@
+playsound block.note_block.flute record @a[distance=..48.00] ^0.0 ^ ^ 0.994 1.12246 0.000
+playsound block.note_block.flute record @a[distance=..48.00] ^0.0 ^ ^ 0.697 1.10637 0.000
@@ -0,0 +1,3 @@
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.310 1.12246 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.217 1.10637 0.000
+playsound block.note_block.flute_-1 record @s[] ^-0.0 ^ ^ 0.150 1.41421 0.000
@@ -0,0 +1,13 @@
+playsound dig_gravel2 record @s[] ^-0.0 ^ ^ 0.500 1.00000 0.000
+playsound mob_silverfish_hit2 record @s[] ^-0.0 ^ ^ 0.100 1.00000 0.000
+playsound block.note_block.hat record @s[] ^-0.0 ^ ^ 1.000 0.70711 0.000
+playsound block.note_block.hat record @s[] ^-0.0 ^ ^ 1.000 0.59460 0.000
+playsound block.note_block.bass record @s[] ^-0.0 ^ ^ 1.000 0.94387 0.000
+playsound block.note_block.bass record @s[] ^-0.0 ^ ^ 1.000 0.92498 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.250 1.12246 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.175 1.10637 0.000
+playsound block.note_block.flute_-1 record @s[] ^-0.0 ^ ^ 0.150 1.41421 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.400 0.79370 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.350 0.89090 0.000
+playsound block.note_block.guitar record @s[] ^-0.0 ^ ^ 1.000 0.70711 0.000
+playsound block.note_block.guitar record @s[] ^-0.0 ^ ^ 1.000 0.70711 0.000
@@ -0,0 +1,5 @@
+playsound block.note_block.flute record @a[distance=..6.56] ^0.0 ^ ^ 0.180 1.12246 0.000
+playsound block.note_block.flute record @a[distance=..6.58] ^0.0 ^ ^ 0.126 1.10637 0.000
+playsound block.note_block.flute_-1 record @a[distance=..10.35] ^0.0 ^ ^ 0.150 1.41421 0.000
+playsound block.note_block.flute record @a[distance=..6.65] ^0.0 ^ ^ 0.400 1.05946 0.000
+playsound block.note_block.flute record @a[distance=..6.56] ^0.0 ^ ^ 0.350 1.12246 0.000
@@ -0,0 +1,3 @@
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.060 1.12246 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.042 1.10637 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.350 1.14870 0.000
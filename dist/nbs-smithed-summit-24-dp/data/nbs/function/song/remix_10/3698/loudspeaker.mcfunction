@@ -0,0 +1,3 @@
+playsound block.note_block.flute record @a[distance=..48.00] ^0.0 ^ ^ 0.139 1.12246 0.000
+playsound block.note_block.flute record @a[distance=..48.00] ^0.0 ^ ^ 0.097 1.10637 0.000
+playsound block.note_block.flute record @a[distance=..48.00] ^0.0 ^ ^ 0.807 1.14870 0.000
@@ -0,0 +1,3 @@
+playsound block.note_block.flute record @a[distance=..6.56] ^0.0 ^ ^ 0.060 1.12246 0.000
+playsound block.note_block.flute record @a[distance=..6.58] ^0.0 ^ ^ 0.042 1.10637 0.000
+playsound block.note_block.flute record @a[distance=..6.53] ^0.0 ^ ^ 0.350 1.14870 0.000
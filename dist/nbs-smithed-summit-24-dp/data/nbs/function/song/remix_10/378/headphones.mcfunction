@@ -0,0 +1,2 @@
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 1.000 0.70711 0.000
+playsound block.note_block.xylophone_-1 record @s[] ^-0.0 ^ ^ 0.300 1.18921 0.000
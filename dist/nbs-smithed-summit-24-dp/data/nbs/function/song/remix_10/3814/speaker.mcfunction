@@ -0,0 +1,3 @@
+playsound block.note_block.pling_1 record @a[distance=..6.48] ^-1.0 ^ ^ 1.000 0.59460 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.48] ^-1.0 ^ ^ 1.000 0.59460 0.000
+playsound block.note_block.flute record @a[distance=..6.48] ^1.0 ^ ^ 0.700 1.18921 0.000
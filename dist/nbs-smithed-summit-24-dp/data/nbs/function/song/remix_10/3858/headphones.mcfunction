@@ -0,0 +1,4 @@
+playsound block.note_block.pling record @s[] ^0.5 ^ ^ 1.000 1.88775 0.000
+playsound block.note_block.bit record @s[] ^0.5 ^ ^ 1.000 1.88775 0.000
+playsound block.note_block.flute record @s[] ^-0.5 ^ ^ 0.700 0.94387 0.000
+playsound block.note_block.flute record @s[] ^0.5 ^ ^ 0.800 1.18921 0.000
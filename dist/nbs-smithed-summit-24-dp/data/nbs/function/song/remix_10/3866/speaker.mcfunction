@@ -0,0 +1,10 @@
+playsound block.note_block.pling record @a[distance=..7.46] ^-1.0 ^ ^ 1.000 1.49831 0.000
+playsound block.note_block.bit record @a[distance=..7.46] ^-1.0 ^ ^ 1.000 1.49831 0.000
+playsound block.note_block.flute record @a[distance=..7.46] ^1.0 ^ ^ 0.700 0.74915 0.000
+playsound block.note_block.flute record @a[distance=..6.86] ^-1.0 ^ ^ 0.800 0.94387 0.000
+playsound block.note_block.harp record @a[distance=..11.14] ^0.0 ^ ^ 1.000 0.52973 0.000
+playsound block.note_block.guitar record @a[distance=..11.14] ^0.0 ^ ^ 1.000 1.05946 0.000
+playsound block.note_block.harp record @a[distance=..8.76] ^0.0 ^ ^ 1.000 1.05946 0.000
+playsound block.note_block.guitar_1 record @a[distance=..8.76] ^0.0 ^ ^ 1.000 0.52973 0.000
+playsound block.note_block.harp record @a[distance=..9.94] ^0.0 ^ ^ 1.000 0.79370 0.000
+playsound block.note_block.guitar record @a[distance=..9.94] ^0.0 ^ ^ 1.000 1.58740 0.000
@@ -0,0 +1,4 @@
+playsound block.note_block.pling record @a[distance=..48.00] ^-2.0 ^ ^ 1.968 1.18921 0.000
+playsound block.note_block.bit record @a[distance=..48.00] ^-2.0 ^ ^ 1.968 1.18921 0.000
+playsound block.note_block.flute record @a[distance=..48.00] ^2.0 ^ ^ 1.377 0.59460 0.000
+playsound block.note_block.flute record @a[distance=..48.00] ^-2.0 ^ ^ 1.946 0.66742 0.000
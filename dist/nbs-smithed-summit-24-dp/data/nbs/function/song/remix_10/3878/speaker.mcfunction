@@ -0,0 +1,4 @@
+playsound block.note_block.pling record @a[distance=..8.28] ^-1.0 ^ ^ 0.800 1.18921 0.000
+playsound block.note_block.bit record @a[distance=..8.28] ^-1.0 ^ ^ 0.800 1.18921 0.000
+playsound block.note_block.flute record @a[distance=..8.28] ^1.0 ^ ^ 0.560 0.59460 0.000
+playsound block.note_block.flute record @a[distance=..7.85] ^-1.0 ^ ^ 0.800 0.66742 0.000
@@ -0,0 +1 @@
+playsound block.note_block.xylophone record @a[distance=..6.26] ^0.0 ^ ^ 0.300 0.74915 0.000
@@ -0,0 +1,10 @@
+playsound block.note_block.hat record @s[] ^-0.0 ^ ^ 1.000 0.70711 0.000
+playsound block.note_block.hat record @s[] ^-0.0 ^ ^ 1.000 0.59460 0.000
+playsound block.note_block.bass_-1 record @s[] ^-0.0 ^ ^ 1.000 1.88775 0.000
+playsound block.note_block.bass_-1 record @s[] ^-0.0 ^ ^ 1.000 1.84997 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.930 0.83605 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.558 0.82169 0.000
+playsound block.note_block.flute_-1 record @s[] ^-0.0 ^ ^ 0.930 1.67211 0.000
+playsound block.note_block.chime record @s[] ^-0.0 ^ ^ 0.690 0.83605 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.930 1.69154 0.000
+particle note ~ ~2.25 ~ 0 0 0 1 1
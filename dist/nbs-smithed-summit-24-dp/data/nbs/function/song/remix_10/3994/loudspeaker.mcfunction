@@ -0,0 +1,5 @@
+playsound block.note_block.flute record @a[distance=..48.00] ^0.0 ^ ^ 1.480 0.81225 0.000
+playsound block.note_block.flute record @a[distance=..48.00] ^0.0 ^ ^ 0.889 0.79830 0.000
+playsound block.note_block.flute_-1 record @a[distance=..48.00] ^0.0 ^ ^ 1.580 1.62450 0.000
+playsound block.note_block.chime record @a[distance=..48.00] ^0.0 ^ ^ 1.023 0.81225 0.000
+playsound block.note_block.pling record @a[distance=..48.00] ^0.0 ^ ^ 1.480 1.62450 0.000
@@ -0,0 +1,5 @@
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.370 0.79370 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.222 0.78007 0.000
+playsound block.note_block.flute_-1 record @s[] ^-0.0 ^ ^ 0.370 1.58740 0.000
+playsound block.note_block.chime record @s[] ^-0.0 ^ ^ 0.270 0.79370 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.370 1.58740 0.000
@@ -0,0 +1,5 @@
+playsound block.note_block.flute record @a[distance=..7.29] ^0.0 ^ ^ 0.370 0.79370 0.000
+playsound block.note_block.flute record @a[distance=..7.34] ^0.0 ^ ^ 0.222 0.78007 0.000
+playsound block.note_block.flute_-1 record @a[distance=..9.94] ^0.0 ^ ^ 0.370 1.58740 0.000
+playsound block.note_block.chime record @a[distance=..6.23] ^0.0 ^ ^ 0.270 0.79370 0.000
+playsound block.note_block.pling record @a[distance=..7.29] ^0.0 ^ ^ 0.370 1.58740 0.000
@@ -0,0 +1,5 @@
+playsound block.note_block.flute record @a[distance=..48.00] ^0.0 ^ ^ 0.599 0.78458 0.000
+playsound block.note_block.flute record @a[distance=..48.00] ^0.0 ^ ^ 0.360 0.77111 0.000
+playsound block.note_block.flute_-1 record @a[distance=..48.00] ^0.0 ^ ^ 0.639 1.56917 0.000
+playsound block.note_block.chime record @a[distance=..48.00] ^0.0 ^ ^ 0.402 0.78458 0.000
+playsound block.note_block.pling record @a[distance=..48.00] ^0.0 ^ ^ 0.599 1.56917 0.000
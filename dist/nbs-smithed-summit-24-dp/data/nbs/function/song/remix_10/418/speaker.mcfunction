@@ -0,0 +1 @@
+playsound block.note_block.xylophone record @a[distance=..6.48] ^0.0 ^ ^ 0.300 0.59460 0.000
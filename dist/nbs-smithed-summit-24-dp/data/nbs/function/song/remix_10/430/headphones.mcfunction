@@ -0,0 +1,4 @@
+playsound block.note_block.xylophone_-1 record @s[] ^-0.0 ^ ^ 0.300 1.58740 0.000
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 0.500 1.33484 0.000
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 0.500 1.33484 0.000
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 0.050 1.33484 0.000
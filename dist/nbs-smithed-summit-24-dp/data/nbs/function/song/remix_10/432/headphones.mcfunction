@@ -0,0 +1,10 @@
+playsound block.note_block.basedrum record @s[] ^-0.0 ^ ^ 1.000 0.70711 0.000
+playsound block.note_block.basedrum record @s[] ^-0.0 ^ ^ 1.000 0.59460 0.000
+playsound block.note_block.bass record @s[] ^-0.0 ^ ^ 1.000 0.52973 0.000
+playsound block.note_block.bass record @s[] ^-0.0 ^ ^ 1.000 0.51913 0.000
+playsound block.note_block.xylophone_-1 record @s[] ^-0.0 ^ ^ 0.135 1.58740 0.000
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 0.250 1.33484 0.000
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 0.250 1.33484 0.000
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 0.025 1.33484 0.000
+playsound random_fizz record @s[] ^-0.5 ^ ^ 0.500 0.94387 0.000
+particle note ~ ~2.25 ~ 0 0 0 1 1
@@ -0,0 +1,4 @@
+playsound block.note_block.basedrum record @a[distance=..11.44] ^0.0 ^ ^ 1.000 0.89090 0.000
+playsound block.note_block.basedrum record @a[distance=..11.77] ^0.0 ^ ^ 1.000 0.62996 0.000
+playsound block.note_block.snare record @a[distance=..8.06] ^0.0 ^ ^ 1.000 0.62996 0.000
+playsound block.note_block.snare record @a[distance=..7.29] ^0.0 ^ ^ 1.000 0.79370 0.000
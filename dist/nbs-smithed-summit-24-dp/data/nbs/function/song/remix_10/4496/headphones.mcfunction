@@ -0,0 +1,7 @@
+playsound block.note_block.bass record @s[] ^-0.0 ^ ^ 1.000 0.70711 0.000
+playsound block.note_block.bass record @s[] ^-0.0 ^ ^ 1.000 0.69295 0.000
+playsound block.note_block.basedrum record @s[] ^-0.0 ^ ^ 1.000 1.05946 0.000
+playsound block.note_block.basedrum record @s[] ^-0.0 ^ ^ 1.000 0.74915 0.000
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 1.000 0.74915 0.000
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 1.000 0.94387 0.000
+particle note ~ ~2.25 ~ 0 0 0 1 1
@@ -0,0 +1,4 @@
+playsound block.note_block.basedrum record @a[distance=..9.24] ^0.0 ^ ^ 1.000 1.88775 0.000
+playsound block.note_block.basedrum record @a[distance=..10.54] ^0.0 ^ ^ 1.000 1.33484 0.000
+playsound block.note_block.snare record @a[distance=..6.36] ^0.0 ^ ^ 1.000 1.33484 0.000
+playsound block.note_block.snare record @a[distance=..6.19] ^0.0 ^ ^ 1.000 1.68179 0.000
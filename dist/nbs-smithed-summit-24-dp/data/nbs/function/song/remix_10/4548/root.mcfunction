@@ -0,0 +1 @@
+function nbs:global/advance
@@ -0,0 +1 @@
+playsound block.note_block.xylophone record @a[distance=..6.12] ^0.0 ^ ^ 0.135 1.00000 0.000
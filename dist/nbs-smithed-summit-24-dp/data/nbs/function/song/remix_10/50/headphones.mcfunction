@@ -0,0 +1,13 @@
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 1.000 0.70711 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.500 1.05946 0.000
+playsound block.note_block.pling_1 record @s[] ^-0.0 ^ ^ 0.500 0.52973 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.0 ^ ^ 0.500 0.52973 0.000
+playsound block.note_block.guitar_1 record @s[] ^-0.0 ^ ^ 0.240 0.59460 0.000
+playsound block.note_block.guitar_1 record @s[] ^-0.0 ^ ^ 0.210 0.66742 0.000
+playsound block.note_block.guitar_1 record @s[] ^-0.0 ^ ^ 0.180 0.79370 0.000
+playsound block.note_block.harp record @s[] ^-0.0 ^ ^ 0.300 1.18921 0.000
+playsound block.note_block.harp record @s[] ^-0.0 ^ ^ 0.300 1.33484 0.000
+playsound block.note_block.harp record @s[] ^-0.0 ^ ^ 0.300 1.58740 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.120 1.18921 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.120 1.33484 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.150 1.58740 0.000
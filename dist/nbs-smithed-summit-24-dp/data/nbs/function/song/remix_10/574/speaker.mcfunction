@@ -0,0 +1,9 @@
+playsound block.note_block.snare record @a[distance=..6.86] ^0.0 ^ ^ 1.000 0.94387 0.000
+playsound block.note_block.pling record @a[distance=..7.37] ^0.0 ^ ^ 1.000 1.54221 0.000
+playsound block.note_block.pling record @a[distance=..7.46] ^0.0 ^ ^ 1.000 1.49831 0.000
+playsound block.note_block.flute record @a[distance=..6.24] ^0.0 ^ ^ 1.000 1.54221 0.000
+playsound block.note_block.flute record @a[distance=..6.26] ^0.0 ^ ^ 1.000 1.49831 0.000
+playsound block.note_block.snare record @a[distance=..6.31] ^0.0 ^ ^ 0.500 1.41421 0.000
+playsound block.note_block.snare record @a[distance=..6.75] ^0.0 ^ ^ 0.500 1.00000 0.000
+playsound block.note_block.basedrum record @a[distance=..11.69] ^0.0 ^ ^ 0.500 0.70711 0.000
+playsound mob_silverfish_hit2 record @a[distance=..6.14] ^0.0 ^ ^ 0.150 1.88775 0.000
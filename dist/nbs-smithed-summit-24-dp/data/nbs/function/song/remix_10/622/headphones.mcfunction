@@ -0,0 +1,3 @@
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.200 1.88775 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.200 1.88775 0.000
+playsound block.note_block.bit record @s[] ^-0.0 ^ ^ 0.300 1.88775 0.000
@@ -0,0 +1,7 @@
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 1.000 2.00000 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 1.000 2.00000 0.000
+playsound block.note_block.bit record @s[] ^-0.0 ^ ^ 1.000 2.00000 0.000
+playsound block.note_block.bit record @s[] ^-0.0 ^ ^ 0.700 2.00000 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.200 1.88775 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.200 1.88775 0.000
+playsound block.note_block.bit record @s[] ^-0.0 ^ ^ 0.300 1.88775 0.000
@@ -0,0 +1,3 @@
+playsound block.note_block.flute record @a[distance=..6.48] ^0.0 ^ ^ 0.200 1.18921 0.000
+playsound block.note_block.pling record @a[distance=..8.28] ^0.0 ^ ^ 0.200 1.18921 0.000
+playsound block.note_block.bit record @a[distance=..8.28] ^0.0 ^ ^ 0.300 1.18921 0.000
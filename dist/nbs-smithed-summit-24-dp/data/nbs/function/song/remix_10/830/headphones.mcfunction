@@ -0,0 +1,3 @@
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.090 1.33484 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.090 1.33484 0.000
+playsound block.note_block.bit record @s[] ^-0.0 ^ ^ 0.135 1.33484 0.000
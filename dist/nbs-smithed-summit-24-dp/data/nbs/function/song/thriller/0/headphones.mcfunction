@@ -0,0 +1,9 @@
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 1.000 0.50000 0.000
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 1.000 0.70711 0.000
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 1.000 1.00000 0.000
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 0.495 0.50000 0.000
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 0.495 0.70711 0.000
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 0.495 1.00000 0.000
+playsound block.note_block.flute_-1 record @s[] ^-0.0 ^ ^ 0.500 0.74915 0.000
+playsound item_elytra_elytra_loop record @s[] ^-0.0 ^ ^ 0.400 1.33484 0.000
+particle note ~ ~2.25 ~ 0 0 0 1 1
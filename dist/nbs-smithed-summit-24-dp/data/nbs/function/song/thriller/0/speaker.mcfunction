@@ -0,0 +1,13 @@
+playsound block.note_block.snare record @a[distance=..9.00] ^0.0 ^ ^ 1.000 0.50000 0.000
+playsound block.note_block.snare record @a[distance=..7.65] ^0.0 ^ ^ 1.000 0.70711 0.000
+playsound block.note_block.snare record @a[distance=..6.75] ^0.0 ^ ^ 1.000 1.00000 0.000
+playsound block.note_block.snare record @a[distance=..9.00] ^0.0 ^ ^ 0.495 0.50000 0.000
+playsound block.note_block.snare record @a[distance=..7.65] ^0.0 ^ ^ 0.495 0.70711 0.000
+playsound block.note_block.snare record @a[distance=..6.75] ^0.0 ^ ^ 0.495 1.00000 0.000
+playsound block.note_block.flute_-1 record @a[distance=..11.64] ^0.0 ^ ^ 0.500 0.74915 0.000
+playsound item_elytra_elytra_loop record @a[distance=..6.36] ^0.0 ^ ^ 0.400 1.33484 0.000
+execute store result score #random nbs run random value 1..4
+execute if score #random nbs matches 1 if entity @a[distance=0..12] run function animated_java:music_speaker/animations/animation_speaker_beat_1/play
+execute if score #random nbs matches 2 if entity @a[distance=0..12] run function animated_java:music_speaker/animations/animation_speaker_beat_2/play
+execute if score #random nbs matches 3 if entity @a[distance=0..12] run function animated_java:music_speaker/animations/animation_speaker_beat_3/play
+execute if score #random nbs matches 4 if entity @a[distance=0..12] run function animated_java:music_speaker/animations/animation_speaker_beat_4/play
@@ -0,0 +1,2 @@
+playsound block.note_block.flute_-1 record @s[] ^-0.0 ^ ^ 0.500 0.74915 0.000
+particle note ~ ~2.25 ~ 0 0 0 1 1
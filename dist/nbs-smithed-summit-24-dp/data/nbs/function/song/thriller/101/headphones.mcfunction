@@ -0,0 +1,7 @@
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 0.300 1.41421 0.000
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 0.700 0.62996 0.000
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 0.700 0.50000 0.000
+playsound block.note_block.bit record @s[] ^-0.65 ^ ^ 0.119 0.79370 0.000
+playsound block.note_block.bit record @s[] ^0.5 ^ ^ 0.140 0.77111 0.000
+playsound block.note_block.flute_-1 record @s[] ^0.5 ^ ^ 0.600 1.68179 0.000
+playsound block.note_block.flute_-1 record @s[] ^-0.5 ^ ^ 0.800 1.66248 0.000
@@ -0,0 +1,7 @@
+playsound block.note_block.snare record @a[distance=..48.00] ^0.0 ^ ^ 0.677 1.41421 0.000
+playsound block.note_block.snare record @a[distance=..48.00] ^0.0 ^ ^ 1.712 0.62996 0.000
+playsound block.note_block.snare record @a[distance=..48.00] ^0.0 ^ ^ 1.750 0.50000 0.000
+playsound block.note_block.bit record @a[distance=..48.00] ^2.0 ^ ^ 0.304 0.79370 0.000
+playsound block.note_block.bit record @a[distance=..48.00] ^-2.0 ^ ^ 0.359 0.77111 0.000
+playsound block.note_block.flute_-1 record @a[distance=..48.00] ^-2.0 ^ ^ 1.524 1.68179 0.000
+playsound block.note_block.flute_-1 record @a[distance=..48.00] ^2.0 ^ ^ 2.035 1.66248 0.000
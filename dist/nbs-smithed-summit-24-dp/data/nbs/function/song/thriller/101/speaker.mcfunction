@@ -0,0 +1,7 @@
+playsound block.note_block.snare record @a[distance=..6.31] ^0.0 ^ ^ 0.300 1.41421 0.000
+playsound block.note_block.snare record @a[distance=..8.06] ^0.0 ^ ^ 0.700 0.62996 0.000
+playsound block.note_block.snare record @a[distance=..9.00] ^0.0 ^ ^ 0.700 0.50000 0.000
+playsound block.note_block.bit record @a[distance=..9.94] ^1.0 ^ ^ 0.119 0.79370 0.000
+playsound block.note_block.bit record @a[distance=..10.05] ^-1.0 ^ ^ 0.140 0.77111 0.000
+playsound block.note_block.flute_-1 record @a[distance=..9.72] ^-1.0 ^ ^ 0.600 1.68179 0.000
+playsound block.note_block.flute_-1 record @a[distance=..9.76] ^1.0 ^ ^ 0.800 1.66248 0.000
@@ -0,0 +1,9 @@
+playsound block.note_block.didgeridoo_-1 record @s[] ^-0.0 ^ ^ 1.000 1.49831 0.000
+playsound block.note_block.bass_-1 record @s[] ^-0.0 ^ ^ 0.800 1.48538 0.000
+playsound block.note_block.bass_-1 record @s[] ^-0.0 ^ ^ 1.000 1.49831 0.000
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 0.500 1.58740 0.000
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 0.700 1.00000 0.000
+playsound random_wood_click record @s[] ^-0.0 ^ ^ 0.300 0.62996 0.000
+playsound block.note_block.pling record @s[] ^0.25 ^ ^ 0.700 0.56123 0.000
+playsound block.note_block.flute_-1 record @s[] ^-0.0 ^ ^ 0.500 1.25992 0.000
+playsound block.note_block.flute_-1 record @s[] ^-0.0 ^ ^ 0.500 1.49831 0.000
@@ -0,0 +1,16 @@
+playsound block.note_block.basedrum record @s[] ^-0.0 ^ ^ 1.000 0.50000 0.000
+playsound block.note_block.basedrum record @s[] ^-0.0 ^ ^ 1.000 0.62996 0.000
+playsound block.note_block.basedrum record @s[] ^-0.0 ^ ^ 1.000 0.79370 0.000
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 0.500 1.58740 0.000
+playsound fireworks_blast_far1 record @s[] ^-0.0 ^ ^ 0.900 1.00000 0.000
+playsound fireworks_blast_far1 record @s[] ^-0.0 ^ ^ 0.900 1.25992 0.000
+playsound random_wood_click record @s[] ^-0.0 ^ ^ 0.300 1.25992 0.000
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 1.000 0.50000 0.000
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 1.000 0.70711 0.000
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 1.000 1.00000 0.000
+playsound block.note_block.pling record @s[] ^-0.15 ^ ^ 1.000 0.74915 0.000
+playsound block.note_block.pling record @s[] ^0.15 ^ ^ 0.900 0.74269 0.000
+playsound block.note_block.flute_-1 record @s[] ^-0.0 ^ ^ 0.500 1.00000 0.000
+playsound block.note_block.flute_-1 record @s[] ^-0.0 ^ ^ 0.500 1.25992 0.000
+playsound block.note_block.flute_-1 record @s[] ^-0.0 ^ ^ 0.500 1.49831 0.000
+particle note ~ ~2.25 ~ 0 0 0 1 1
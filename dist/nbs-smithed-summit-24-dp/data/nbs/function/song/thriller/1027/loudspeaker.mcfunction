@@ -0,0 +1,8 @@
+playsound block.note_block.snare record @a[distance=..48.00] ^0.0 ^ ^ 1.115 1.58740 0.000
+playsound random_wood_click record @a[distance=..48.00] ^0.0 ^ ^ 0.705 0.94387 0.000
+playsound block.note_block.pling record @a[distance=..48.00] ^0.0 ^ ^ 2.541 0.84090 0.000
+playsound block.note_block.pling record @a[distance=..48.00] ^-1.0 ^ ^ 2.288 0.83364 0.000
+playsound block.note_block.pling record @a[distance=..48.00] ^-1.0 ^ ^ 1.778 0.84090 0.000
+playsound block.note_block.flute_-1 record @a[distance=..48.00] ^0.0 ^ ^ 1.331 1.00000 0.000
+playsound block.note_block.flute_-1 record @a[distance=..48.00] ^0.0 ^ ^ 1.304 1.25992 0.000
+playsound block.note_block.flute_-1 record @a[distance=..48.00] ^0.0 ^ ^ 1.284 1.49831 0.000
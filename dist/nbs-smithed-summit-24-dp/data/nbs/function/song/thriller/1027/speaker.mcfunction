@@ -0,0 +1,8 @@
+playsound block.note_block.snare record @a[distance=..6.23] ^0.0 ^ ^ 0.500 1.58740 0.000
+playsound random_wood_click record @a[distance=..6.86] ^0.0 ^ ^ 0.300 0.94387 0.000
+playsound block.note_block.pling record @a[distance=..9.72] ^0.0 ^ ^ 1.000 0.84090 0.000
+playsound block.note_block.pling record @a[distance=..9.75] ^-1.0 ^ ^ 0.900 0.83364 0.000
+playsound block.note_block.pling record @a[distance=..9.72] ^-1.0 ^ ^ 0.700 0.84090 0.000
+playsound block.note_block.flute_-1 record @a[distance=..11.25] ^0.0 ^ ^ 0.500 1.00000 0.000
+playsound block.note_block.flute_-1 record @a[distance=..10.71] ^0.0 ^ ^ 0.500 1.25992 0.000
+playsound block.note_block.flute_-1 record @a[distance=..10.15] ^0.0 ^ ^ 0.500 1.49831 0.000
@@ -0,0 +1,19 @@
+playsound block.note_block.basedrum record @a[distance=..11.44] ^0.0 ^ ^ 1.000 0.89090 0.000
+playsound block.note_block.basedrum record @a[distance=..11.01] ^0.0 ^ ^ 1.000 1.12246 0.000
+playsound block.note_block.snare record @a[distance=..6.12] ^0.0 ^ ^ 0.500 2.00000 0.000
+playsound block.note_block.hat record @a[distance=..10.35] ^0.0 ^ ^ 0.500 0.70711 0.000
+playsound block.note_block.snare record @a[distance=..6.16] ^0.0 ^ ^ 0.400 1.78180 0.000
+playsound block.note_block.bit record @a[distance=..10.15] ^1.0 ^ ^ 0.070 0.74915 0.000
+playsound block.note_block.bit record @a[distance=..10.26] ^-1.0 ^ ^ 0.070 0.72783 0.000
+playsound block.note_block.guitar record @a[distance=..9.72] ^-1.0 ^ ^ 0.800 1.68179 0.000
+playsound block.note_block.guitar record @a[distance=..11.01] ^-1.0 ^ ^ 0.400 1.12246 0.000
+playsound block.note_block.flute_-1 record @a[distance=..11.64] ^0.0 ^ ^ 0.500 0.74915 0.000
+playsound block.note_block.flute_-1 record @a[distance=..11.44] ^0.0 ^ ^ 0.500 0.89090 0.000
+playsound block.note_block.flute_-1 record @a[distance=..11.01] ^0.0 ^ ^ 0.500 1.12246 0.000
+playsound block.note_block.flute_-1 record @a[distance=..9.72] ^1.0 ^ ^ 0.600 1.68179 0.000
+playsound block.note_block.flute_-1 record @a[distance=..9.76] ^-1.0 ^ ^ 0.800 1.66248 0.000
+execute store result score #random nbs run random value 1..4
+execute if score #random nbs matches 1 if entity @a[distance=0..12] run function animated_java:music_speaker/animations/animation_speaker_beat_1/play
+execute if score #random nbs matches 2 if entity @a[distance=0..12] run function animated_java:music_speaker/animations/animation_speaker_beat_2/play
+execute if score #random nbs matches 3 if entity @a[distance=0..12] run function animated_java:music_speaker/animations/animation_speaker_beat_3/play
+execute if score #random nbs matches 4 if entity @a[distance=0..12] run function animated_java:music_speaker/animations/animation_speaker_beat_4/play
@@ -0,0 +1,10 @@
+playsound block.note_block.didgeridoo record @s[] ^-0.0 ^ ^ 1.000 0.74915 0.000
+playsound block.note_block.bass record @s[] ^-0.0 ^ ^ 0.800 0.74269 0.000
+playsound block.note_block.bass record @s[] ^-0.0 ^ ^ 1.000 0.74915 0.000
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 0.500 1.58740 0.000
+playsound block.note_block.pling record @s[] ^-0.15 ^ ^ 1.000 0.84090 0.000
+playsound block.note_block.pling record @s[] ^0.15 ^ ^ 0.900 0.83364 0.000
+playsound block.note_block.pling record @s[] ^0.25 ^ ^ 0.700 0.89090 0.000
+playsound block.note_block.pling record @s[] ^0.25 ^ ^ 0.300 0.88321 0.000
+playsound block.note_block.flute_-1 record @s[] ^-0.0 ^ ^ 0.500 1.25992 0.000
+playsound block.note_block.flute_-1 record @s[] ^-0.0 ^ ^ 0.500 1.49831 0.000
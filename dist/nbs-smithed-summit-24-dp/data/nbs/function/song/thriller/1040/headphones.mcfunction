@@ -0,0 +1,6 @@
+playsound block.note_block.didgeridoo record @s[] ^-0.0 ^ ^ 0.500 0.74915 0.000
+playsound block.note_block.bass record @s[] ^-0.0 ^ ^ 0.500 0.74915 0.000
+playsound random_wood_click record @s[] ^-0.0 ^ ^ 0.300 0.62996 0.000
+playsound block.note_block.pling record @s[] ^-0.25 ^ ^ 0.600 0.89090 0.000
+playsound block.note_block.flute_-1 record @s[] ^-0.0 ^ ^ 0.500 1.25992 0.000
+playsound block.note_block.flute_-1 record @s[] ^-0.0 ^ ^ 0.500 1.49831 0.000
@@ -0,0 +1,7 @@
+playsound block.note_block.didgeridoo record @a[distance=..11.91] ^0.0 ^ ^ 0.500 0.89090 0.000
+playsound block.note_block.bass record @a[distance=..11.91] ^0.0 ^ ^ 0.500 0.89090 0.000
+playsound block.note_block.cow_bell record @a[distance=..9.48] ^0.0 ^ ^ 0.300 0.89090 0.000
+playsound random_wood_click record @a[distance=..6.42] ^0.0 ^ ^ 0.300 1.25992 0.000
+playsound block.note_block.pling record @a[distance=..9.48] ^0.0 ^ ^ 0.600 0.89090 0.000
+playsound block.note_block.flute_-1 record @a[distance=..10.71] ^0.0 ^ ^ 0.500 1.25992 0.000
+playsound block.note_block.flute_-1 record @a[distance=..10.15] ^0.0 ^ ^ 0.500 1.49831 0.000
@@ -0,0 +1,7 @@
+playsound block.note_block.didgeridoo record @s[] ^-0.0 ^ ^ 0.500 0.74915 0.000
+playsound block.note_block.bass record @s[] ^-0.0 ^ ^ 0.500 0.74915 0.000
+playsound random_wood_click record @s[] ^-0.0 ^ ^ 0.300 0.94387 0.000
+playsound block.note_block.pling record @s[] ^-0.15 ^ ^ 1.000 0.56123 0.000
+playsound block.note_block.pling record @s[] ^0.15 ^ ^ 0.900 0.55639 0.000
+playsound block.note_block.flute_-1 record @s[] ^-0.0 ^ ^ 0.500 1.25992 0.000
+playsound block.note_block.flute_-1 record @s[] ^-0.0 ^ ^ 0.500 1.49831 0.000
@@ -0,0 +1,4 @@
+playsound block.note_block.bit record @a[distance=..48.00] ^2.0 ^ ^ 0.054 0.70711 0.000
+playsound block.note_block.bit record @a[distance=..48.00] ^-2.0 ^ ^ 0.000 0.68698 0.000
+playsound block.note_block.flute_-1 record @a[distance=..48.00] ^-2.0 ^ ^ 1.524 1.68179 0.000
+playsound block.note_block.flute_-1 record @a[distance=..48.00] ^2.0 ^ ^ 2.035 1.66248 0.000
@@ -0,0 +1,4 @@
+playsound block.note_block.bit record @a[distance=..10.35] ^1.0 ^ ^ 0.021 0.70711 0.000
+playsound block.note_block.bit record @a[distance=..10.45] ^-1.0 ^ ^ 0.000 0.68698 0.000
+playsound block.note_block.flute_-1 record @a[distance=..9.72] ^-1.0 ^ ^ 0.600 1.68179 0.000
+playsound block.note_block.flute_-1 record @a[distance=..9.76] ^1.0 ^ ^ 0.800 1.66248 0.000
@@ -0,0 +1,3 @@
+playsound block.note_block.pling record @a[distance=..48.00] ^1.0 ^ ^ 1.581 0.56123 0.000
+playsound block.note_block.flute_-1 record @a[distance=..48.00] ^0.0 ^ ^ 1.304 1.25992 0.000
+playsound block.note_block.flute_-1 record @a[distance=..48.00] ^0.0 ^ ^ 1.284 1.49831 0.000
@@ -0,0 +1,11 @@
+playsound block.note_block.didgeridoo record @a[distance=..11.95] ^0.0 ^ ^ 1.000 0.74915 0.000
+playsound block.note_block.bass record @a[distance=..11.95] ^0.0 ^ ^ 0.800 0.74269 0.000
+playsound block.note_block.bass record @a[distance=..11.95] ^0.0 ^ ^ 1.000 0.74915 0.000
+playsound block.note_block.snare record @a[distance=..6.23] ^0.0 ^ ^ 0.500 1.58740 0.000
+playsound block.note_block.cow_bell record @a[distance=..9.48] ^0.0 ^ ^ 0.300 0.89090 0.000
+playsound random_wood_click record @a[distance=..6.42] ^0.0 ^ ^ 0.300 1.25992 0.000
+playsound block.note_block.pling record @a[distance=..10.15] ^0.0 ^ ^ 1.000 0.74915 0.000
+playsound block.note_block.pling record @a[distance=..10.18] ^-1.0 ^ ^ 0.900 0.74269 0.000
+playsound block.note_block.flute_-1 record @a[distance=..11.01] ^0.0 ^ ^ 0.500 1.12246 0.000
+playsound block.note_block.flute_-1 record @a[distance=..10.54] ^0.0 ^ ^ 0.500 1.33484 0.000
+playsound block.note_block.flute_-1 record @a[distance=..9.48] ^0.0 ^ ^ 0.500 1.78180 0.000
@@ -0,0 +1,6 @@
+playsound block.note_block.didgeridoo record @a[distance=..11.95] ^0.0 ^ ^ 0.500 0.74915 0.000
+playsound block.note_block.bass record @a[distance=..11.95] ^0.0 ^ ^ 0.500 0.74915 0.000
+playsound random_wood_click record @a[distance=..8.06] ^0.0 ^ ^ 0.300 0.62996 0.000
+playsound block.note_block.pling record @a[distance=..10.15] ^-1.0 ^ ^ 0.700 0.74915 0.000
+playsound block.note_block.flute_-1 record @a[distance=..10.54] ^0.0 ^ ^ 0.500 1.33484 0.000
+playsound block.note_block.flute_-1 record @a[distance=..9.48] ^0.0 ^ ^ 0.500 1.78180 0.000
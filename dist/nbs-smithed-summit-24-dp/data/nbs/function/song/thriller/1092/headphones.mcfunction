@@ -0,0 +1,8 @@
+playsound block.note_block.didgeridoo record @s[] ^-0.0 ^ ^ 0.500 1.00000 0.000
+playsound block.note_block.bass record @s[] ^-0.0 ^ ^ 0.500 1.00000 0.000
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 0.500 1.58740 0.000
+playsound random_wood_click record @s[] ^-0.0 ^ ^ 0.300 0.94387 0.000
+playsound block.note_block.pling record @s[] ^-0.15 ^ ^ 1.000 0.66742 0.000
+playsound block.note_block.pling record @s[] ^0.15 ^ ^ 0.900 0.66166 0.000
+playsound block.note_block.flute_-1 record @s[] ^-0.0 ^ ^ 0.500 1.33484 0.000
+playsound block.note_block.flute_-1 record @s[] ^-0.0 ^ ^ 0.500 1.78180 0.000
@@ -0,0 +1,6 @@
+playsound block.note_block.snare record @a[distance=..6.23] ^0.0 ^ ^ 0.500 1.58740 0.000
+playsound block.note_block.pling record @a[distance=..10.54] ^0.0 ^ ^ 1.000 0.66742 0.000
+playsound block.note_block.pling record @a[distance=..10.57] ^-1.0 ^ ^ 0.900 0.66166 0.000
+playsound block.note_block.flute_-1 record @a[distance=..11.01] ^0.0 ^ ^ 0.500 1.12246 0.000
+playsound block.note_block.flute_-1 record @a[distance=..10.54] ^0.0 ^ ^ 0.500 1.33484 0.000
+playsound block.note_block.flute_-1 record @a[distance=..9.48] ^0.0 ^ ^ 0.500 1.78180 0.000
@@ -0,0 +1,3 @@
+playsound block.note_block.pling record @s[] ^0.25 ^ ^ 0.700 0.74915 0.000
+playsound block.note_block.flute_-1 record @s[] ^-0.0 ^ ^ 0.500 1.33484 0.000
+playsound block.note_block.flute_-1 record @s[] ^-0.0 ^ ^ 0.500 1.78180 0.000
@@ -0,0 +1,3 @@
+playsound block.note_block.pling record @a[distance=..48.00] ^-1.0 ^ ^ 1.797 0.74915 0.000
+playsound block.note_block.flute_-1 record @a[distance=..48.00] ^0.0 ^ ^ 1.297 1.33484 0.000
+playsound block.note_block.flute_-1 record @a[distance=..48.00] ^0.0 ^ ^ 1.264 1.78180 0.000
@@ -0,0 +1,3 @@
+playsound block.note_block.pling record @a[distance=..10.15] ^-1.0 ^ ^ 0.700 0.74915 0.000
+playsound block.note_block.flute_-1 record @a[distance=..10.54] ^0.0 ^ ^ 0.500 1.33484 0.000
+playsound block.note_block.flute_-1 record @a[distance=..9.48] ^0.0 ^ ^ 0.500 1.78180 0.000
@@ -0,0 +1,6 @@
+playsound block.note_block.didgeridoo record @s[] ^-0.0 ^ ^ 0.500 0.74915 0.000
+playsound block.note_block.bass record @s[] ^-0.0 ^ ^ 0.500 0.74915 0.000
+playsound random_wood_click record @s[] ^-0.0 ^ ^ 0.300 0.62996 0.000
+playsound block.note_block.pling record @s[] ^0.25 ^ ^ 0.700 0.56123 0.000
+playsound block.note_block.flute_-1 record @s[] ^-0.0 ^ ^ 0.500 1.33484 0.000
+playsound block.note_block.flute_-1 record @s[] ^-0.0 ^ ^ 0.500 1.78180 0.000
@@ -0,0 +1,5 @@
+playsound block.note_block.pling record @s[] ^0.25 ^ ^ 0.700 0.89090 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.320 0.56123 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.320 0.66742 0.000
+playsound block.note_block.flute_-1 record @s[] ^-0.0 ^ ^ 0.500 1.33484 0.000
+playsound block.note_block.flute_-1 record @s[] ^-0.0 ^ ^ 0.500 1.78180 0.000
@@ -0,0 +1,5 @@
+playsound block.note_block.pling record @a[distance=..9.48] ^-1.0 ^ ^ 0.700 0.89090 0.000
+playsound block.note_block.pling record @a[distance=..11.01] ^0.0 ^ ^ 0.320 0.56123 0.000
+playsound block.note_block.pling record @a[distance=..10.54] ^0.0 ^ ^ 0.320 0.66742 0.000
+playsound block.note_block.flute_-1 record @a[distance=..10.54] ^0.0 ^ ^ 0.500 1.33484 0.000
+playsound block.note_block.flute_-1 record @a[distance=..9.48] ^0.0 ^ ^ 0.500 1.78180 0.000
@@ -0,0 +1,13 @@
+playsound block.note_block.didgeridoo record @s[] ^-0.0 ^ ^ 1.000 0.74915 0.000
+playsound block.note_block.bass record @s[] ^-0.0 ^ ^ 0.800 0.74269 0.000
+playsound block.note_block.bass record @s[] ^-0.0 ^ ^ 1.000 0.74915 0.000
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 0.500 1.58740 0.000
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 0.700 1.00000 0.000
+playsound block.note_block.pling record @s[] ^-0.15 ^ ^ 1.000 0.92766 0.000
+playsound block.note_block.pling record @s[] ^0.15 ^ ^ 0.900 0.91966 0.000
+playsound block.note_block.pling record @s[] ^0.25 ^ ^ 0.700 1.12246 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.320 0.56123 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.320 0.89090 0.000
+playsound block.note_block.flute_-1 record @s[] ^-0.0 ^ ^ 0.500 1.25992 0.000
+playsound block.note_block.flute_-1 record @s[] ^-0.0 ^ ^ 0.500 1.49831 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.600 0.50000 0.000
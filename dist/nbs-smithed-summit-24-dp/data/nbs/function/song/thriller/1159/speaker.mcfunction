@@ -0,0 +1,10 @@
+playsound block.note_block.didgeridoo record @a[distance=..11.96] ^0.0 ^ ^ 0.500 0.66742 0.000
+playsound block.note_block.bass record @a[distance=..11.96] ^0.0 ^ ^ 0.500 0.66742 0.000
+playsound block.note_block.pling record @a[distance=..9.48] ^0.0 ^ ^ 1.000 0.89090 0.000
+playsound block.note_block.pling record @a[distance=..9.52] ^-1.0 ^ ^ 0.900 0.88321 0.000
+playsound block.note_block.pling record @a[distance=..9.48] ^-1.0 ^ ^ 0.700 0.89090 0.000
+playsound block.note_block.pling record @a[distance=..10.15] ^1.0 ^ ^ 0.320 0.74915 0.000
+playsound block.note_block.pling record @a[distance=..10.71] ^1.0 ^ ^ 0.320 0.62996 0.000
+playsound block.note_block.flute_-1 record @a[distance=..10.71] ^0.0 ^ ^ 0.500 1.25992 0.000
+playsound block.note_block.flute_-1 record @a[distance=..10.15] ^0.0 ^ ^ 0.500 1.49831 0.000
+playsound block.note_block.flute record @a[distance=..9.00] ^0.0 ^ ^ 0.600 0.50000 0.000
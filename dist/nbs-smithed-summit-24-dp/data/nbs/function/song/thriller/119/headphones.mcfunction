@@ -0,0 +1,7 @@
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 0.300 1.41421 0.000
+playsound block.note_block.guitar record @s[] ^0.3 ^ ^ 0.800 1.33484 0.000
+playsound block.note_block.guitar record @s[] ^0.3 ^ ^ 0.400 0.89090 0.000
+playsound block.note_block.flute_-1 record @s[] ^-0.0 ^ ^ 0.500 0.89090 0.000
+playsound block.note_block.flute_-1 record @s[] ^-0.0 ^ ^ 0.500 1.12246 0.000
+playsound block.note_block.flute_-1 record @s[] ^-0.5 ^ ^ 0.600 1.68179 0.000
+playsound block.note_block.flute_-1 record @s[] ^0.5 ^ ^ 0.800 1.66248 0.000
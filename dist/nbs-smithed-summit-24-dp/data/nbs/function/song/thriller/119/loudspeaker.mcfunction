@@ -0,0 +1,7 @@
+playsound block.note_block.snare record @a[distance=..48.00] ^0.0 ^ ^ 0.677 1.41421 0.000
+playsound block.note_block.guitar record @a[distance=..48.00] ^-2.0 ^ ^ 2.076 1.33484 0.000
+playsound block.note_block.guitar record @a[distance=..48.00] ^-2.0 ^ ^ 1.076 0.89090 0.000
+playsound block.note_block.flute_-1 record @a[distance=..48.00] ^0.0 ^ ^ 1.345 0.89090 0.000
+playsound block.note_block.flute_-1 record @a[distance=..48.00] ^0.0 ^ ^ 1.318 1.12246 0.000
+playsound block.note_block.flute_-1 record @a[distance=..48.00] ^2.0 ^ ^ 1.524 1.68179 0.000
+playsound block.note_block.flute_-1 record @a[distance=..48.00] ^-2.0 ^ ^ 2.035 1.66248 0.000
@@ -0,0 +1,7 @@
+playsound block.note_block.pling record @s[] ^-0.15 ^ ^ 1.000 0.90647 0.000
+playsound block.note_block.pling record @s[] ^0.15 ^ ^ 0.900 0.89865 0.000
+playsound block.note_block.pling record @s[] ^0.25 ^ ^ 0.700 1.00000 0.000
+playsound block.note_block.pling record @s[] ^0.25 ^ ^ 0.300 0.99137 0.000
+playsound block.note_block.flute_-1 record @s[] ^-0.0 ^ ^ 0.500 1.25992 0.000
+playsound block.note_block.flute_-1 record @s[] ^-0.0 ^ ^ 0.500 1.49831 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.600 0.50000 0.000
@@ -0,0 +1,7 @@
+playsound block.note_block.pling record @a[distance=..9.41] ^0.0 ^ ^ 1.000 0.90647 0.000
+playsound block.note_block.pling record @a[distance=..9.45] ^-1.0 ^ ^ 0.900 0.89865 0.000
+playsound block.note_block.pling record @a[distance=..9.00] ^-1.0 ^ ^ 0.700 1.00000 0.000
+playsound block.note_block.pling record @a[distance=..9.04] ^-1.0 ^ ^ 0.300 0.99137 0.000
+playsound block.note_block.flute_-1 record @a[distance=..10.71] ^0.0 ^ ^ 0.500 1.25992 0.000
+playsound block.note_block.flute_-1 record @a[distance=..10.15] ^0.0 ^ ^ 0.500 1.49831 0.000
+playsound block.note_block.flute record @a[distance=..9.00] ^0.0 ^ ^ 0.600 0.50000 0.000
@@ -0,0 +1,2 @@
+playsound block.note_block.flute_-1 record @a[distance=..48.00] ^-2.0 ^ ^ 1.524 1.68179 0.000
+playsound block.note_block.flute_-1 record @a[distance=..48.00] ^2.0 ^ ^ 2.035 1.66248 0.000
@@ -0,0 +1,2 @@
+playsound block.note_block.flute_-1 record @a[distance=..9.72] ^-1.0 ^ ^ 0.600 1.68179 0.000
+playsound block.note_block.flute_-1 record @a[distance=..9.76] ^1.0 ^ ^ 0.800 1.66248 0.000
@@ -0,0 +1,2 @@
+playsound block.note_block.bit_1 record @s[] ^-0.65 ^ ^ 0.700 1.33484 0.000
+playsound block.note_block.bit_1 record @s[] ^0.5 ^ ^ 1.000 1.29684 0.000
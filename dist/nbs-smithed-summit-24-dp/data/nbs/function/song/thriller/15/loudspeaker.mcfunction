@@ -0,0 +1,2 @@
+playsound block.note_block.bit_1 record @a[distance=..48.00] ^2.0 ^ ^ 1.476 1.33484 0.000
+playsound block.note_block.bit_1 record @a[distance=..48.00] ^-2.0 ^ ^ 2.115 1.29684 0.000
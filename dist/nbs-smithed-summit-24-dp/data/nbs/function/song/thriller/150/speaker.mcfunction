@@ -0,0 +1,7 @@
+playsound block.note_block.snare record @a[distance=..6.31] ^0.0 ^ ^ 0.300 1.41421 0.000
+playsound block.note_block.guitar record @a[distance=..10.54] ^-1.0 ^ ^ 0.800 1.33484 0.000
+playsound block.note_block.guitar record @a[distance=..11.44] ^-1.0 ^ ^ 0.400 0.89090 0.000
+playsound block.note_block.flute_-1 record @a[distance=..11.44] ^0.0 ^ ^ 0.500 0.89090 0.000
+playsound block.note_block.flute_-1 record @a[distance=..11.01] ^0.0 ^ ^ 0.500 1.12246 0.000
+playsound block.note_block.flute_-1 record @a[distance=..9.72] ^1.0 ^ ^ 0.600 1.68179 0.000
+playsound block.note_block.flute_-1 record @a[distance=..9.76] ^-1.0 ^ ^ 0.800 1.66248 0.000
@@ -0,0 +1,4 @@
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 0.300 1.41421 0.000
+playsound block.note_block.flute_-1 record @s[] ^0.5 ^ ^ 0.600 1.68179 0.000
+playsound block.note_block.flute_-1 record @s[] ^-0.5 ^ ^ 0.800 1.66248 0.000
+playsound item_elytra_elytra_loop record @s[] ^-0.0 ^ ^ 0.400 1.68179 0.000
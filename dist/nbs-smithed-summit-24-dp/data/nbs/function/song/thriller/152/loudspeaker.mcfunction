@@ -0,0 +1,4 @@
+playsound block.note_block.snare record @a[distance=..48.00] ^0.0 ^ ^ 0.677 1.41421 0.000
+playsound block.note_block.flute_-1 record @a[distance=..48.00] ^-2.0 ^ ^ 1.524 1.68179 0.000
+playsound block.note_block.flute_-1 record @a[distance=..48.00] ^2.0 ^ ^ 2.035 1.66248 0.000
+playsound item_elytra_elytra_loop record @a[distance=..48.00] ^0.0 ^ ^ 0.886 1.68179 0.000
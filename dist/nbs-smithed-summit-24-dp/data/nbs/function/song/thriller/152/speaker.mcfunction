@@ -0,0 +1,4 @@
+playsound block.note_block.snare record @a[distance=..6.31] ^0.0 ^ ^ 0.300 1.41421 0.000
+playsound block.note_block.flute_-1 record @a[distance=..9.72] ^-1.0 ^ ^ 0.600 1.68179 0.000
+playsound block.note_block.flute_-1 record @a[distance=..9.76] ^1.0 ^ ^ 0.800 1.66248 0.000
+playsound item_elytra_elytra_loop record @a[distance=..6.19] ^0.0 ^ ^ 0.400 1.68179 0.000
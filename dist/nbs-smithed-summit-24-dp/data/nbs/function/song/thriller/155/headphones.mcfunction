@@ -0,0 +1,12 @@
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 0.500 2.00000 0.000
+playsound block.note_block.hat record @s[] ^-0.0 ^ ^ 0.500 0.70711 0.000
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 0.400 1.78180 0.000
+playsound block.note_block.cow_bell record @s[] ^-0.35 ^ ^ 0.300 0.89090 0.000
+playsound block.note_block.guitar record @s[] ^0.3 ^ ^ 0.800 1.68179 0.000
+playsound block.note_block.guitar record @s[] ^0.3 ^ ^ 0.400 1.12246 0.000
+playsound block.note_block.flute_-1 record @s[] ^-0.0 ^ ^ 0.500 0.74915 0.000
+playsound block.note_block.flute_-1 record @s[] ^-0.0 ^ ^ 0.500 0.89090 0.000
+playsound block.note_block.flute_-1 record @s[] ^-0.0 ^ ^ 0.500 1.12246 0.000
+playsound block.note_block.flute_-1 record @s[] ^-0.5 ^ ^ 0.600 1.68179 0.000
+playsound block.note_block.flute_-1 record @s[] ^0.5 ^ ^ 0.800 1.66248 0.000
+particle note ~ ~2.25 ~ 0 0 0 1 1
@@ -0,0 +1,12 @@
+playsound block.note_block.didgeridoo record @s[] ^-0.0 ^ ^ 0.500 0.74915 0.000
+playsound block.note_block.bass record @s[] ^-0.0 ^ ^ 0.500 0.74915 0.000
+playsound random_wood_click record @s[] ^-0.0 ^ ^ 0.300 0.94387 0.000
+playsound block.note_block.pling record @s[] ^0.25 ^ ^ 0.700 1.12246 0.000
+playsound block.note_block.pling record @s[] ^-0.6 ^ ^ 0.400 0.66742 0.000
+playsound block.note_block.pling record @s[] ^-0.6 ^ ^ 0.400 0.89090 0.000
+playsound block.note_block.pling record @s[] ^-0.6 ^ ^ 0.400 1.12246 0.000
+playsound block.note_block.flute_-1 record @s[] ^-0.0 ^ ^ 0.500 1.33484 0.000
+playsound block.note_block.flute_-1 record @s[] ^-0.0 ^ ^ 0.500 1.78180 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.500 0.56123 0.000
+playsound block.note_block.flute_-1 record @s[] ^-0.0 ^ ^ 0.600 1.68179 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.400 0.66742 0.000
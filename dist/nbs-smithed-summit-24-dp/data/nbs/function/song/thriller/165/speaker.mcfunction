@@ -0,0 +1,18 @@
+playsound block.note_block.basedrum record @a[distance=..11.44] ^0.0 ^ ^ 1.000 0.89090 0.000
+playsound block.note_block.basedrum record @a[distance=..11.01] ^0.0 ^ ^ 1.000 1.12246 0.000
+playsound block.note_block.snare record @a[distance=..6.12] ^0.0 ^ ^ 0.500 2.00000 0.000
+playsound block.note_block.hat record @a[distance=..10.35] ^0.0 ^ ^ 0.500 0.70711 0.000
+playsound block.note_block.snare record @a[distance=..6.16] ^0.0 ^ ^ 0.400 1.78180 0.000
+playsound block.note_block.guitar record @a[distance=..9.48] ^-1.0 ^ ^ 0.800 1.78180 0.000
+playsound block.note_block.guitar record @a[distance=..10.87] ^-1.0 ^ ^ 0.400 1.18921 0.000
+playsound block.note_block.flute_-1 record @a[distance=..11.64] ^0.0 ^ ^ 0.500 0.74915 0.000
+playsound block.note_block.flute_-1 record @a[distance=..11.25] ^0.0 ^ ^ 0.500 1.00000 0.000
+playsound block.note_block.flute_-1 record @a[distance=..10.87] ^0.0 ^ ^ 0.500 1.18921 0.000
+playsound block.note_block.flute_-1 record @a[distance=..9.48] ^1.0 ^ ^ 0.600 1.78180 0.000
+playsound block.note_block.flute_-1 record @a[distance=..9.53] ^-1.0 ^ ^ 0.800 1.76133 0.000
+playsound mob_wolf_howl2 record @a[distance=..6.75] ^1.0 ^ ^ 0.200 1.00000 0.000
+execute store result score #random nbs run random value 1..4
+execute if score #random nbs matches 1 if entity @a[distance=0..12] run function animated_java:music_speaker/animations/animation_speaker_beat_1/play
+execute if score #random nbs matches 2 if entity @a[distance=0..12] run function animated_java:music_speaker/animations/animation_speaker_beat_2/play
+execute if score #random nbs matches 3 if entity @a[distance=0..12] run function animated_java:music_speaker/animations/animation_speaker_beat_3/play
+execute if score #random nbs matches 4 if entity @a[distance=0..12] run function animated_java:music_speaker/animations/animation_speaker_beat_4/play
@@ -0,0 +1,9 @@
+playsound block.note_block.didgeridoo record @s[] ^-0.0 ^ ^ 0.500 1.00000 0.000
+playsound block.note_block.bass record @s[] ^-0.0 ^ ^ 0.500 1.00000 0.000
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 0.500 1.58740 0.000
+playsound random_wood_click record @s[] ^-0.0 ^ ^ 0.300 0.94387 0.000
+playsound block.note_block.pling record @s[] ^-0.15 ^ ^ 1.000 1.03526 0.000
+playsound block.note_block.pling record @s[] ^0.15 ^ ^ 0.900 1.02633 0.000
+playsound block.note_block.pling record @s[] ^-0.25 ^ ^ 0.600 1.12246 0.000
+playsound block.note_block.pling record @s[] ^-0.6 ^ ^ 0.400 0.74915 0.000
+playsound block.note_block.pling record @s[] ^-0.6 ^ ^ 0.400 1.00000 0.000
@@ -0,0 +1,2 @@
+playsound random_wood_click record @a[distance=..6.86] ^0.0 ^ ^ 0.300 0.94387 0.000
+playsound block.note_block.pling record @a[distance=..8.76] ^-1.0 ^ ^ 0.700 1.05946 0.000
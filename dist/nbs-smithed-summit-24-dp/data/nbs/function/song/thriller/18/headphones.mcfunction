@@ -0,0 +1,2 @@
+playsound block.note_block.bit_1 record @s[] ^-0.65 ^ ^ 0.700 1.25992 0.000
+playsound block.note_block.bit_1 record @s[] ^0.5 ^ ^ 1.000 1.22405 0.000
@@ -0,0 +1,2 @@
+playsound block.note_block.bit_1 record @a[distance=..6.06] ^1.0 ^ ^ 0.700 1.25992 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.07] ^-1.0 ^ ^ 1.000 1.22405 0.000
@@ -0,0 +1,4 @@
+playsound block.note_block.didgeridoo record @s[] ^-0.0 ^ ^ 0.500 0.66742 0.000
+playsound block.note_block.bass record @s[] ^-0.0 ^ ^ 0.500 0.66742 0.000
+playsound block.note_block.pling record @s[] ^0.25 ^ ^ 0.700 1.49831 0.000
+playsound block.note_block.pling record @s[] ^-0.25 ^ ^ 0.600 1.49831 0.000
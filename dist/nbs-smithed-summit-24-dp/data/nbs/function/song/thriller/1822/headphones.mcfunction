@@ -0,0 +1,10 @@
+playsound block.note_block.didgeridoo record @s[] ^-0.0 ^ ^ 1.000 0.74915 0.000
+playsound block.note_block.bass record @s[] ^-0.0 ^ ^ 0.800 0.74269 0.000
+playsound block.note_block.bass record @s[] ^-0.0 ^ ^ 1.000 0.74915 0.000
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 0.500 1.58740 0.000
+playsound block.note_block.cow_bell record @s[] ^-0.35 ^ ^ 0.300 0.89090 0.000
+playsound random_wood_click record @s[] ^-0.0 ^ ^ 0.300 1.25992 0.000
+playsound block.note_block.guitar record @s[] ^0.3 ^ ^ 0.800 1.12246 0.000
+playsound block.note_block.guitar record @s[] ^0.3 ^ ^ 0.400 1.11600 0.000
+playsound block.note_block.pling record @s[] ^0.25 ^ ^ 0.700 1.49831 0.000
+playsound block.note_block.pling record @s[] ^-0.25 ^ ^ 0.600 1.49831 0.000
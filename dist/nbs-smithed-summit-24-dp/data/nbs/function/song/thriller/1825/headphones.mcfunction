@@ -0,0 +1,7 @@
+playsound block.note_block.didgeridoo record @s[] ^-0.0 ^ ^ 0.500 0.74915 0.000
+playsound block.note_block.bass record @s[] ^-0.0 ^ ^ 0.500 0.74915 0.000
+playsound random_wood_click record @s[] ^-0.0 ^ ^ 0.300 0.62996 0.000
+playsound block.note_block.guitar record @s[] ^0.3 ^ ^ 0.800 1.00000 0.000
+playsound block.note_block.guitar record @s[] ^0.3 ^ ^ 0.400 0.99424 0.000
+playsound block.note_block.pling record @s[] ^0.25 ^ ^ 0.700 1.49831 0.000
+playsound block.note_block.pling record @s[] ^-0.25 ^ ^ 0.600 1.49831 0.000
@@ -0,0 +1,7 @@
+playsound block.note_block.didgeridoo record @a[distance=..11.95] ^0.0 ^ ^ 0.500 0.74915 0.000
+playsound block.note_block.bass record @a[distance=..11.95] ^0.0 ^ ^ 0.500 0.74915 0.000
+playsound random_wood_click record @a[distance=..8.06] ^0.0 ^ ^ 0.300 0.62996 0.000
+playsound block.note_block.guitar record @a[distance=..11.25] ^-1.0 ^ ^ 0.800 1.00000 0.000
+playsound block.note_block.guitar record @a[distance=..11.26] ^-1.0 ^ ^ 0.400 0.99424 0.000
+playsound block.note_block.pling record @a[distance=..7.46] ^-1.0 ^ ^ 0.700 1.49831 0.000
+playsound block.note_block.pling record @a[distance=..7.46] ^0.0 ^ ^ 0.600 1.49831 0.000
@@ -0,0 +1,4 @@
+playsound block.note_block.guitar record @a[distance=..48.00] ^-2.0 ^ ^ 2.076 1.33484 0.000
+playsound block.note_block.guitar record @a[distance=..48.00] ^-2.0 ^ ^ 1.038 1.32715 0.000
+playsound block.note_block.pling record @a[distance=..48.00] ^-1.0 ^ ^ 1.769 0.89090 0.000
+playsound block.note_block.pling record @a[distance=..48.00] ^1.0 ^ ^ 1.516 0.89090 0.000
@@ -0,0 +1,4 @@
+playsound block.note_block.guitar record @a[distance=..10.54] ^-1.0 ^ ^ 0.800 1.33484 0.000
+playsound block.note_block.guitar record @a[distance=..10.56] ^-1.0 ^ ^ 0.400 1.32715 0.000
+playsound block.note_block.pling record @a[distance=..9.48] ^-1.0 ^ ^ 0.700 0.89090 0.000
+playsound block.note_block.pling record @a[distance=..9.48] ^0.0 ^ ^ 0.600 0.89090 0.000
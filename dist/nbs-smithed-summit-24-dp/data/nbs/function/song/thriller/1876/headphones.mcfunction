@@ -0,0 +1,8 @@
+playsound block.note_block.didgeridoo record @s[] ^-0.0 ^ ^ 0.500 1.00000 0.000
+playsound block.note_block.bass record @s[] ^-0.0 ^ ^ 0.500 1.00000 0.000
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 0.500 1.58740 0.000
+playsound random_wood_click record @s[] ^-0.0 ^ ^ 0.300 0.94387 0.000
+playsound block.note_block.guitar record @s[] ^0.3 ^ ^ 0.800 1.00000 0.000
+playsound block.note_block.guitar record @s[] ^0.3 ^ ^ 0.400 0.99424 0.000
+playsound block.note_block.pling record @s[] ^0.25 ^ ^ 0.700 0.74484 0.000
+playsound block.note_block.pling record @s[] ^-0.25 ^ ^ 0.600 0.74055 0.000
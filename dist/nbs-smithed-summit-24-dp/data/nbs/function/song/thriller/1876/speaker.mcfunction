@@ -0,0 +1,8 @@
+playsound block.note_block.didgeridoo record @a[distance=..11.88] ^0.0 ^ ^ 0.500 1.00000 0.000
+playsound block.note_block.bass record @a[distance=..11.88] ^0.0 ^ ^ 0.500 1.00000 0.000
+playsound block.note_block.snare record @a[distance=..6.23] ^0.0 ^ ^ 0.500 1.58740 0.000
+playsound random_wood_click record @a[distance=..6.86] ^0.0 ^ ^ 0.300 0.94387 0.000
+playsound block.note_block.guitar record @a[distance=..11.25] ^-1.0 ^ ^ 0.800 1.00000 0.000
+playsound block.note_block.guitar record @a[distance=..11.26] ^-1.0 ^ ^ 0.400 0.99424 0.000
+playsound block.note_block.pling record @a[distance=..10.17] ^-1.0 ^ ^ 0.700 0.74484 0.000
+playsound block.note_block.pling record @a[distance=..10.19] ^0.0 ^ ^ 0.600 0.74055 0.000
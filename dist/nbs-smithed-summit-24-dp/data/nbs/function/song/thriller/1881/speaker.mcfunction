@@ -0,0 +1,5 @@
+playsound block.note_block.didgeridoo record @a[distance=..11.95] ^0.0 ^ ^ 0.500 0.74915 0.000
+playsound block.note_block.bass record @a[distance=..11.95] ^0.0 ^ ^ 0.500 0.74915 0.000
+playsound random_wood_click record @a[distance=..6.86] ^0.0 ^ ^ 0.300 0.94387 0.000
+playsound block.note_block.pling record @a[distance=..10.13] ^-1.0 ^ ^ 0.700 0.75349 0.000
+playsound block.note_block.pling record @a[distance=..10.11] ^0.0 ^ ^ 0.600 0.75786 0.000
@@ -0,0 +1,3 @@
+playsound block.note_block.guitar record @s[] ^0.3 ^ ^ 0.800 1.33484 0.000
+playsound block.note_block.guitar record @s[] ^0.3 ^ ^ 0.400 1.32715 0.000
+playsound block.note_block.pling record @s[] ^-0.25 ^ ^ 0.600 0.75349 0.000
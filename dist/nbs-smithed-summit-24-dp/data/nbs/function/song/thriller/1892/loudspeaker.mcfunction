@@ -0,0 +1,3 @@
+playsound block.note_block.guitar record @a[distance=..48.00] ^-2.0 ^ ^ 2.076 1.33484 0.000
+playsound block.note_block.guitar record @a[distance=..48.00] ^-2.0 ^ ^ 1.038 1.32715 0.000
+playsound block.note_block.pling record @a[distance=..48.00] ^1.0 ^ ^ 1.540 0.75349 0.000
@@ -0,0 +1,11 @@
+playsound block.note_block.didgeridoo record @s[] ^-0.0 ^ ^ 1.000 0.66742 0.000
+playsound block.note_block.bass record @s[] ^-0.0 ^ ^ 0.800 0.66166 0.000
+playsound block.note_block.bass record @s[] ^-0.0 ^ ^ 1.000 0.66742 0.000
+playsound block.note_block.basedrum record @s[] ^-0.0 ^ ^ 1.000 0.50000 0.000
+playsound block.note_block.basedrum record @s[] ^-0.0 ^ ^ 1.000 0.62996 0.000
+playsound block.note_block.basedrum record @s[] ^-0.0 ^ ^ 1.000 0.79370 0.000
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 0.500 1.58740 0.000
+playsound block.note_block.chime record @s[] ^-0.0 ^ ^ 0.900 0.74915 0.000
+playsound block.note_block.chime record @s[] ^-0.0 ^ ^ 0.900 0.50000 0.000
+playsound block.note_block.chime record @s[] ^-0.0 ^ ^ 0.900 1.00000 0.000
+particle note ~ ~2.25 ~ 0 0 0 1 1
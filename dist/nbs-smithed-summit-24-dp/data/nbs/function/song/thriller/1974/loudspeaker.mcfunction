@@ -0,0 +1,5 @@
+playsound block.note_block.guitar record @a[distance=..48.00] ^-2.0 ^ ^ 2.076 1.33484 0.000
+playsound block.note_block.guitar record @a[distance=..48.00] ^-2.0 ^ ^ 1.038 1.32715 0.000
+playsound block.note_block.pling record @a[distance=..48.00] ^0.0 ^ ^ 0.989 1.12246 0.000
+playsound block.note_block.pling record @a[distance=..48.00] ^0.0 ^ ^ 2.076 0.66742 0.000
+playsound block.note_block.pling record @a[distance=..48.00] ^0.0 ^ ^ 1.946 1.33484 0.000
@@ -0,0 +1,5 @@
+playsound block.note_block.guitar record @a[distance=..10.54] ^-1.0 ^ ^ 0.800 1.33484 0.000
+playsound block.note_block.guitar record @a[distance=..10.56] ^-1.0 ^ ^ 0.400 1.32715 0.000
+playsound block.note_block.pling record @a[distance=..8.52] ^0.0 ^ ^ 0.400 1.12246 0.000
+playsound block.note_block.pling record @a[distance=..10.54] ^0.0 ^ ^ 0.800 0.66742 0.000
+playsound block.note_block.pling record @a[distance=..7.85] ^0.0 ^ ^ 0.800 1.33484 0.000
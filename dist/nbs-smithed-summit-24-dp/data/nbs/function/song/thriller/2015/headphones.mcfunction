@@ -0,0 +1,2 @@
+playsound block.note_block.guitar record @s[] ^0.3 ^ ^ 0.800 1.33484 0.000
+playsound block.note_block.guitar record @s[] ^0.3 ^ ^ 0.400 1.32715 0.000
@@ -0,0 +1,5 @@
+playsound block.note_block.guitar record @a[distance=..10.54] ^-1.0 ^ ^ 0.800 1.33484 0.000
+playsound block.note_block.guitar record @a[distance=..10.56] ^-1.0 ^ ^ 0.400 1.32715 0.000
+playsound block.note_block.pling record @a[distance=..10.15] ^-1.0 ^ ^ 0.700 0.74915 0.000
+playsound block.note_block.flute_-1 record @a[distance=..10.71] ^0.0 ^ ^ 0.500 1.25992 0.000
+playsound block.note_block.flute_-1 record @a[distance=..10.15] ^0.0 ^ ^ 0.500 1.49831 0.000
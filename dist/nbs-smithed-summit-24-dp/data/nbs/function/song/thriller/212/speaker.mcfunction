@@ -0,0 +1,7 @@
+playsound block.note_block.snare record @a[distance=..6.31] ^0.0 ^ ^ 0.300 1.41421 0.000
+playsound block.note_block.guitar record @a[distance=..10.15] ^-1.0 ^ ^ 0.800 1.49831 0.000
+playsound block.note_block.guitar record @a[distance=..11.25] ^-1.0 ^ ^ 0.400 1.00000 0.000
+playsound block.note_block.flute_-1 record @a[distance=..11.25] ^0.0 ^ ^ 0.500 1.00000 0.000
+playsound block.note_block.flute_-1 record @a[distance=..10.87] ^0.0 ^ ^ 0.500 1.18921 0.000
+playsound block.note_block.flute_-1 record @a[distance=..9.48] ^1.0 ^ ^ 0.600 1.78180 0.000
+playsound block.note_block.flute_-1 record @a[distance=..9.53] ^-1.0 ^ ^ 0.800 1.76133 0.000
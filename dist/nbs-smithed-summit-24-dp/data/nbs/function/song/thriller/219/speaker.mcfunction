@@ -0,0 +1,2 @@
+playsound block.note_block.flute_-1 record @a[distance=..9.48] ^-1.0 ^ ^ 0.600 1.78180 0.000
+playsound block.note_block.flute_-1 record @a[distance=..9.53] ^1.0 ^ ^ 0.800 1.76133 0.000
@@ -0,0 +1,2 @@
+playsound block.note_block.bit_1 record @s[] ^-0.65 ^ ^ 0.700 1.12246 0.000
+playsound block.note_block.bit_1 record @s[] ^0.5 ^ ^ 1.000 1.09051 0.000
@@ -0,0 +1,2 @@
+playsound block.note_block.bit_1 record @a[distance=..6.09] ^1.0 ^ ^ 0.700 1.12246 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.09] ^-1.0 ^ ^ 1.000 1.09051 0.000
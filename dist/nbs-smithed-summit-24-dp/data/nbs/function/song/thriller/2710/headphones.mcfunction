@@ -0,0 +1,12 @@
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 0.500 1.58740 0.000
+playsound block.note_block.guitar record @s[] ^-0.35 ^ ^ 0.500 1.78180 0.000
+playsound block.note_block.pling record @s[] ^-0.35 ^ ^ 0.200 0.89090 0.000
+playsound block.note_block.pling record @s[] ^0.25 ^ ^ 0.300 1.33484 0.000
+playsound block.note_block.pling record @s[] ^-0.6 ^ ^ 0.480 1.12246 0.000
+playsound block.note_block.pling record @s[] ^-0.6 ^ ^ 0.480 0.89090 0.000
+playsound block.note_block.pling record @s[] ^-0.6 ^ ^ 0.480 1.33484 0.000
+playsound block.note_block.flute_-1 record @s[] ^-0.0 ^ ^ 0.500 1.49831 0.000
+playsound block.note_block.flute_-1 record @s[] ^-0.0 ^ ^ 0.500 1.78180 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.500 0.56123 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.600 0.66742 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.400 0.89090 0.000
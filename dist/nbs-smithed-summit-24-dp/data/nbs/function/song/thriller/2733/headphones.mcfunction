@@ -0,0 +1,12 @@
+playsound block.note_block.didgeridoo record @s[] ^-0.0 ^ ^ 0.500 0.74915 0.000
+playsound block.note_block.bass record @s[] ^-0.0 ^ ^ 0.500 0.74915 0.000
+playsound random_wood_click record @s[] ^-0.0 ^ ^ 0.300 0.62996 0.000
+playsound block.note_block.guitar record @s[] ^-0.35 ^ ^ 0.500 1.33484 0.000
+playsound block.note_block.pling record @s[] ^-0.35 ^ ^ 0.200 0.66742 0.000
+playsound block.note_block.pling record @s[] ^-0.15 ^ ^ 1.000 1.16878 0.000
+playsound block.note_block.pling record @s[] ^0.15 ^ ^ 0.900 1.15869 0.000
+playsound block.note_block.pling record @s[] ^0.25 ^ ^ 0.300 1.33484 0.000
+playsound block.note_block.pling record @s[] ^-0.6 ^ ^ 0.400 0.89090 0.000
+playsound block.note_block.pling record @s[] ^-0.6 ^ ^ 0.400 1.12246 0.000
+playsound block.note_block.pling record @s[] ^0.6 ^ ^ 0.400 0.74915 0.000
+playsound block.note_block.pling record @s[] ^0.6 ^ ^ 0.400 1.33484 0.000
@@ -0,0 +1,12 @@
+playsound block.note_block.didgeridoo record @a[distance=..11.88] ^0.0 ^ ^ 0.500 1.00000 0.000
+playsound block.note_block.bass record @a[distance=..11.88] ^0.0 ^ ^ 0.500 1.00000 0.000
+playsound block.note_block.snare record @a[distance=..6.23] ^0.0 ^ ^ 0.500 1.58740 0.000
+playsound random_wood_click record @a[distance=..6.86] ^0.0 ^ ^ 0.300 0.94387 0.000
+playsound block.note_block.guitar record @a[distance=..10.54] ^0.0 ^ ^ 0.500 1.33484 0.000
+playsound block.note_block.pling record @a[distance=..10.54] ^0.0 ^ ^ 0.200 0.66742 0.000
+playsound block.note_block.pling record @a[distance=..8.85] ^0.0 ^ ^ 1.000 1.03526 0.000
+playsound block.note_block.pling record @a[distance=..8.89] ^-1.0 ^ ^ 0.900 1.02633 0.000
+playsound block.note_block.pling record @a[distance=..8.52] ^0.0 ^ ^ 0.600 1.12246 0.000
+playsound block.note_block.pling record @a[distance=..10.15] ^1.0 ^ ^ 0.400 0.74915 0.000
+playsound block.note_block.pling record @a[distance=..9.00] ^1.0 ^ ^ 0.400 1.00000 0.000
+playsound block.note_block.pling record @a[distance=..8.06] ^-2.0 ^ ^ 0.400 1.25992 0.000
@@ -0,0 +1,2 @@
+playsound block.note_block.bit_1 record @s[] ^-0.65 ^ ^ 0.700 1.00000 0.000
+playsound block.note_block.bit_1 record @s[] ^0.5 ^ ^ 1.000 0.97153 0.000
@@ -0,0 +1,2 @@
+playsound block.note_block.bit_1 record @a[distance=..6.12] ^1.0 ^ ^ 0.700 1.00000 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.13] ^-1.0 ^ ^ 1.000 0.97153 0.000
@@ -0,0 +1,10 @@
+playsound block.note_block.guitar_1 record @a[distance=..8.52] ^0.0 ^ ^ 0.500 0.56123 0.000
+playsound block.note_block.pling record @a[distance=..8.52] ^0.0 ^ ^ 0.200 1.12246 0.000
+playsound block.note_block.guitar_1 record @a[distance=..8.66] ^0.0 ^ ^ 0.800 0.54211 0.000
+playsound block.note_block.pling record @a[distance=..8.66] ^0.0 ^ ^ 0.700 1.08423 0.000
+playsound block.note_block.pling record @a[distance=..9.48] ^-1.0 ^ ^ 0.700 0.89090 0.000
+playsound block.note_block.flute_-1 record @a[distance=..10.71] ^0.0 ^ ^ 0.500 1.25992 0.000
+playsound block.note_block.flute_-1 record @a[distance=..10.15] ^0.0 ^ ^ 0.500 1.49831 0.000
+playsound block.note_block.flute_-1 record @a[distance=..9.48] ^0.0 ^ ^ 0.500 1.78180 0.000
+playsound block.note_block.flute record @a[distance=..9.00] ^0.0 ^ ^ 0.600 0.50000 0.000
+playsound block.note_block.flute record @a[distance=..8.06] ^0.0 ^ ^ 0.400 0.62996 0.000
@@ -0,0 +1,11 @@
+playsound block.note_block.guitar_1 record @s[] ^-0.35 ^ ^ 0.500 0.56123 0.000
+playsound block.note_block.pling record @s[] ^-0.35 ^ ^ 0.200 1.12246 0.000
+playsound block.note_block.guitar_1 record @s[] ^-0.0 ^ ^ 0.800 0.54211 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.700 1.08423 0.000
+playsound block.note_block.pling record @s[] ^-0.15 ^ ^ 1.000 1.78180 0.000
+playsound block.note_block.pling record @s[] ^0.15 ^ ^ 0.900 1.76643 0.000
+playsound block.note_block.flute_-1 record @s[] ^-0.0 ^ ^ 0.500 1.49831 0.000
+playsound block.note_block.flute_-1 record @s[] ^-0.0 ^ ^ 0.500 1.78180 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.500 0.56123 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.600 0.66742 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.400 0.89090 0.000
@@ -0,0 +1,6 @@
+playsound random_wood_click record @s[] ^-0.0 ^ ^ 0.300 0.62996 0.000
+playsound block.note_block.pling record @s[] ^0.25 ^ ^ 0.700 0.89090 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.200 0.66742 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.200 1.18921 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.200 0.89090 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.200 1.33484 0.000
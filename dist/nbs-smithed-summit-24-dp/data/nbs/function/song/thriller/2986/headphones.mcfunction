@@ -0,0 +1,8 @@
+playsound block.note_block.cow_bell record @s[] ^-0.35 ^ ^ 0.300 0.89090 0.000
+playsound random_wood_click record @s[] ^-0.0 ^ ^ 0.300 1.25992 0.000
+playsound block.note_block.pling record @s[] ^0.25 ^ ^ 0.700 0.74915 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.025 0.52973 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.200 0.89090 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.200 0.50000 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.200 0.74915 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.200 1.05946 0.000
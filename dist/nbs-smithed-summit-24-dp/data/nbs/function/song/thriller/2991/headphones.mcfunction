@@ -0,0 +1,11 @@
+playsound block.note_block.didgeridoo record @s[] ^-0.0 ^ ^ 0.500 0.50000 0.000
+playsound block.note_block.bass record @s[] ^-0.0 ^ ^ 0.500 0.50000 0.000
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 0.500 1.58740 0.000
+playsound random_wood_click record @s[] ^-0.0 ^ ^ 0.300 0.94387 0.000
+playsound block.note_block.pling record @s[] ^-0.15 ^ ^ 1.000 1.00000 0.000
+playsound block.note_block.pling record @s[] ^0.15 ^ ^ 0.900 0.99137 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.025 0.52973 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.200 0.89090 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.200 0.50000 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.200 0.74915 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.200 1.05946 0.000
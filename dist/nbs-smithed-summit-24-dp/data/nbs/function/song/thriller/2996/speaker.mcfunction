@@ -0,0 +1,6 @@
+playsound random_wood_click record @a[distance=..6.86] ^0.0 ^ ^ 0.300 0.94387 0.000
+playsound block.note_block.pling record @a[distance=..8.76] ^-1.0 ^ ^ 0.700 1.05946 0.000
+playsound block.note_block.pling record @a[distance=..11.14] ^0.0 ^ ^ 0.025 0.52973 0.000
+playsound block.note_block.pling record @a[distance=..10.15] ^0.0 ^ ^ 0.200 0.74915 0.000
+playsound block.note_block.pling record @a[distance=..9.48] ^0.0 ^ ^ 0.200 0.89090 0.000
+playsound block.note_block.pling record @a[distance=..8.76] ^0.0 ^ ^ 0.200 1.05946 0.000
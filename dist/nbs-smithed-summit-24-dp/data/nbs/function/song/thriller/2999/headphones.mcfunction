@@ -0,0 +1,7 @@
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 0.500 1.58740 0.000
+playsound block.note_block.pling record @s[] ^-0.15 ^ ^ 1.000 0.89090 0.000
+playsound block.note_block.pling record @s[] ^0.15 ^ ^ 0.900 0.88321 0.000
+playsound block.note_block.pling_-1 record @s[] ^-0.0 ^ ^ 0.080 1.78180 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.640 0.62996 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.640 0.74915 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.640 0.89090 0.000
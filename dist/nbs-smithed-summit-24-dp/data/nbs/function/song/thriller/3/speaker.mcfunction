@@ -0,0 +1,3 @@
+playsound block.note_block.snare record @a[distance=..9.00] ^0.0 ^ ^ 0.290 0.50000 0.000
+playsound block.note_block.snare record @a[distance=..7.65] ^0.0 ^ ^ 0.290 0.70711 0.000
+playsound block.note_block.snare record @a[distance=..6.75] ^0.0 ^ ^ 0.290 1.00000 0.000
@@ -0,0 +1,2 @@
+playsound block.note_block.flute record @a[distance=..48.00] ^-2.0 ^ ^ 1.500 0.50000 0.000
+playsound block.note_block.flute_-1 record @a[distance=..48.00] ^2.0 ^ ^ 2.002 1.97703 0.000
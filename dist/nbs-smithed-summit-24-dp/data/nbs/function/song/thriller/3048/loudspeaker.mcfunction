@@ -0,0 +1,9 @@
+playsound block.note_block.guitar_1 record @a[distance=..48.00] ^1.0 ^ ^ 1.236 0.56123 0.000
+playsound block.note_block.pling record @a[distance=..48.00] ^1.0 ^ ^ 0.495 1.12246 0.000
+playsound block.note_block.guitar_1 record @a[distance=..48.00] ^0.0 ^ ^ 1.985 0.54211 0.000
+playsound block.note_block.pling record @a[distance=..48.00] ^0.0 ^ ^ 1.737 1.08423 0.000
+playsound block.note_block.flute_-1 record @a[distance=..48.00] ^0.0 ^ ^ 1.284 1.49831 0.000
+playsound block.note_block.flute_-1 record @a[distance=..48.00] ^0.0 ^ ^ 1.264 1.78180 0.000
+playsound block.note_block.flute record @a[distance=..48.00] ^0.0 ^ ^ 1.236 0.56123 0.000
+playsound block.note_block.flute record @a[distance=..48.00] ^0.0 ^ ^ 1.459 0.66742 0.000
+playsound block.note_block.flute record @a[distance=..48.00] ^0.0 ^ ^ 0.946 0.89090 0.000
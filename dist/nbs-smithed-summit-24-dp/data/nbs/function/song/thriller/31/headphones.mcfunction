@@ -0,0 +1,7 @@
+playsound block.note_block.hat record @s[] ^-0.0 ^ ^ 0.500 0.70711 0.000
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 0.400 1.78180 0.000
+playsound block.note_block.cow_bell record @s[] ^-0.35 ^ ^ 0.300 0.89090 0.000
+playsound block.note_block.bit_1 record @s[] ^-0.65 ^ ^ 0.700 0.94387 0.000
+playsound block.note_block.bit_1 record @s[] ^0.5 ^ ^ 1.000 0.91700 0.000
+playsound block.note_block.flute_-1 record @s[] ^-0.0 ^ ^ 0.500 0.74915 0.000
+particle note ~ ~2.25 ~ 0 0 0 1 1
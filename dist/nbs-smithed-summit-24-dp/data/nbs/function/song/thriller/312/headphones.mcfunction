@@ -0,0 +1,2 @@
+playsound block.note_block.flute record @s[] ^0.5 ^ ^ 0.600 0.50000 0.000
+playsound block.note_block.flute_-1 record @s[] ^-0.5 ^ ^ 0.800 1.97703 0.000
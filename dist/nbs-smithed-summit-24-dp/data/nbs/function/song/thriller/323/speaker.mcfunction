@@ -0,0 +1,2 @@
+playsound block.note_block.flute record @a[distance=..9.00] ^-1.0 ^ ^ 0.600 0.50000 0.000
+playsound block.note_block.flute_-1 record @a[distance=..9.05] ^1.0 ^ ^ 0.800 1.97703 0.000
@@ -0,0 +1,2 @@
+playsound block.note_block.didgeridoo record @a[distance=..11.97] ^0.0 ^ ^ 0.500 0.59460 0.000
+playsound block.note_block.bass record @a[distance=..11.97] ^0.0 ^ ^ 0.500 0.59460 0.000
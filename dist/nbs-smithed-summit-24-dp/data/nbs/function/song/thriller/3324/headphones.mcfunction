@@ -0,0 +1,12 @@
+playsound block.note_block.basedrum record @s[] ^-0.0 ^ ^ 1.000 0.50000 0.000
+playsound block.note_block.basedrum record @s[] ^-0.0 ^ ^ 1.000 0.62996 0.000
+playsound block.note_block.basedrum record @s[] ^-0.0 ^ ^ 1.000 0.79370 0.000
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 0.500 1.58740 0.000
+playsound block.note_block.pling record @s[] ^-0.15 ^ ^ 1.000 1.05946 0.000
+playsound block.note_block.pling record @s[] ^0.15 ^ ^ 0.900 1.05032 0.000
+playsound block.note_block.pling record @s[] ^0.25 ^ ^ 0.700 1.00000 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.080 0.52973 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.640 0.74915 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.640 0.89090 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.640 1.05946 0.000
+particle note ~ ~2.25 ~ 0 0 0 1 1
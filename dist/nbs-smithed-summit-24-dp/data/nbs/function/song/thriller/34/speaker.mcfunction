@@ -0,0 +1,2 @@
+playsound block.note_block.bit_1 record @a[distance=..6.16] ^1.0 ^ ^ 0.700 0.89090 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.18] ^-1.0 ^ ^ 1.000 0.86554 0.000
@@ -0,0 +1,2 @@
+playsound block.note_block.bit_1 record @a[distance=..6.19] ^1.0 ^ ^ 0.700 0.84090 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.21] ^-1.0 ^ ^ 1.000 0.81696 0.000
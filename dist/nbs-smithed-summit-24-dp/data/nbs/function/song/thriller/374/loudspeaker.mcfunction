@@ -0,0 +1,4 @@
+playsound block.note_block.flute_-1 record @a[distance=..48.00] ^-2.0 ^ ^ 1.516 1.78180 0.000
+playsound block.note_block.flute record @a[distance=..48.00] ^-2.0 ^ ^ 0.995 0.52973 0.000
+playsound block.note_block.flute_-1 record @a[distance=..48.00] ^2.0 ^ ^ 2.024 1.76133 0.000
+playsound block.note_block.flute record @a[distance=..48.00] ^2.0 ^ ^ 2.489 0.52365 0.000
@@ -0,0 +1,2 @@
+playsound block.note_block.bit_1 record @a[distance=..6.23] ^1.0 ^ ^ 0.700 0.79370 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.24] ^-1.0 ^ ^ 1.000 0.77111 0.000
@@ -0,0 +1,7 @@
+playsound block.note_block.snare record @a[distance=..6.31] ^0.0 ^ ^ 0.300 1.41421 0.000
+playsound block.note_block.snare record @a[distance=..8.06] ^0.0 ^ ^ 0.700 0.62996 0.000
+playsound block.note_block.snare record @a[distance=..9.00] ^0.0 ^ ^ 0.700 0.50000 0.000
+playsound block.note_block.flute_-1 record @a[distance=..9.48] ^-1.0 ^ ^ 0.600 1.78180 0.000
+playsound block.note_block.flute record @a[distance=..8.76] ^-1.0 ^ ^ 0.400 0.52973 0.000
+playsound block.note_block.flute_-1 record @a[distance=..9.53] ^1.0 ^ ^ 0.800 1.76133 0.000
+playsound block.note_block.flute record @a[distance=..8.81] ^1.0 ^ ^ 1.000 0.52365 0.000
@@ -0,0 +1,18 @@
+playsound block.note_block.didgeridoo record @s[] ^-0.0 ^ ^ 1.000 0.89090 0.000
+playsound block.note_block.bass record @s[] ^-0.0 ^ ^ 0.800 0.88321 0.000
+playsound block.note_block.bass record @s[] ^-0.0 ^ ^ 1.000 0.89090 0.000
+playsound block.note_block.basedrum record @s[] ^-0.0 ^ ^ 1.000 0.50000 0.000
+playsound block.note_block.basedrum record @s[] ^-0.0 ^ ^ 1.000 0.62996 0.000
+playsound block.note_block.basedrum record @s[] ^-0.0 ^ ^ 1.000 0.79370 0.000
+playsound block.note_block.pling record @s[] ^-0.15 ^ ^ 1.000 1.33484 0.000
+playsound block.note_block.pling record @s[] ^0.15 ^ ^ 0.900 1.32332 0.000
+playsound block.note_block.pling_1 record @s[] ^-0.5 ^ ^ 0.800 0.66742 0.000
+playsound block.note_block.pling record @s[] ^-0.5 ^ ^ 0.800 0.89090 0.000
+playsound block.note_block.pling record @s[] ^-0.5 ^ ^ 0.800 1.12246 0.000
+playsound block.note_block.pling_1 record @s[] ^0.5 ^ ^ 0.304 0.66742 0.000
+playsound block.note_block.pling record @s[] ^0.5 ^ ^ 0.190 0.89090 0.000
+playsound block.note_block.pling record @s[] ^0.5 ^ ^ 0.380 1.12246 0.000
+playsound block.note_block.flute_-1 record @s[] ^-0.0 ^ ^ 0.500 0.89090 0.000
+playsound block.note_block.flute_-1 record @s[] ^-0.0 ^ ^ 0.500 1.12246 0.000
+playsound block.note_block.flute_-1 record @s[] ^-0.0 ^ ^ 0.600 1.78180 0.000
+playsound block.note_block.flute_-1 record @s[] ^-0.0 ^ ^ 0.400 1.33484 0.000
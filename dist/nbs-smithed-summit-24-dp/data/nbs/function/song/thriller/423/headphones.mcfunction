@@ -0,0 +1,13 @@
+playsound block.note_block.didgeridoo record @s[] ^-0.0 ^ ^ 0.500 0.89090 0.000
+playsound block.note_block.bass record @s[] ^-0.0 ^ ^ 0.500 0.89090 0.000
+playsound block.note_block.pling record @s[] ^0.25 ^ ^ 0.700 1.33484 0.000
+playsound block.note_block.pling record @s[] ^0.25 ^ ^ 0.300 1.32332 0.000
+playsound block.note_block.pling_1 record @s[] ^-0.5 ^ ^ 0.288 0.66742 0.000
+playsound block.note_block.pling record @s[] ^-0.5 ^ ^ 0.288 0.89090 0.000
+playsound block.note_block.pling record @s[] ^-0.5 ^ ^ 0.288 1.12246 0.000
+playsound block.note_block.pling_1 record @s[] ^0.5 ^ ^ 0.280 0.66742 0.000
+playsound block.note_block.pling record @s[] ^0.5 ^ ^ 0.175 0.89090 0.000
+playsound block.note_block.pling record @s[] ^0.5 ^ ^ 0.350 1.12246 0.000
+playsound block.note_block.flute_-1 record @s[] ^-0.0 ^ ^ 0.600 1.78180 0.000
+playsound block.note_block.flute_-1 record @s[] ^-0.0 ^ ^ 0.400 1.33484 0.000
+particle note ~ ~2.25 ~ 0 0 0 1 1
@@ -0,0 +1,12 @@
+playsound block.note_block.didgeridoo record @s[] ^-0.0 ^ ^ 0.500 0.89090 0.000
+playsound block.note_block.bass record @s[] ^-0.0 ^ ^ 0.500 0.89090 0.000
+playsound block.note_block.pling record @s[] ^0.25 ^ ^ 0.700 1.33484 0.000
+playsound block.note_block.pling record @s[] ^0.25 ^ ^ 0.300 1.32332 0.000
+playsound block.note_block.pling_1 record @s[] ^-0.5 ^ ^ 0.240 0.66742 0.000
+playsound block.note_block.pling record @s[] ^-0.5 ^ ^ 0.240 0.89090 0.000
+playsound block.note_block.pling record @s[] ^-0.5 ^ ^ 0.240 1.12246 0.000
+playsound block.note_block.pling_1 record @s[] ^0.5 ^ ^ 0.224 0.66742 0.000
+playsound block.note_block.pling record @s[] ^0.5 ^ ^ 0.140 0.89090 0.000
+playsound block.note_block.pling record @s[] ^0.5 ^ ^ 0.280 1.12246 0.000
+playsound block.note_block.flute_-1 record @s[] ^-0.0 ^ ^ 0.600 1.78180 0.000
+playsound block.note_block.flute_-1 record @s[] ^-0.0 ^ ^ 0.400 1.33484 0.000
@@ -0,0 +1,2 @@
+playsound block.note_block.bit_1 record @a[distance=..6.31] ^1.0 ^ ^ 0.700 0.70711 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.33] ^-1.0 ^ ^ 1.000 0.68698 0.000
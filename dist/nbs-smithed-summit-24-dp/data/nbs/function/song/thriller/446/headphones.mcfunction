@@ -0,0 +1,8 @@
+playsound block.note_block.pling record @s[] ^-0.25 ^ ^ 0.600 1.33484 0.000
+playsound block.note_block.pling record @s[] ^-0.25 ^ ^ 0.300 1.32332 0.000
+playsound block.note_block.pling_1 record @s[] ^-0.5 ^ ^ 0.048 0.66742 0.000
+playsound block.note_block.pling record @s[] ^-0.5 ^ ^ 0.048 0.89090 0.000
+playsound block.note_block.pling record @s[] ^-0.5 ^ ^ 0.048 1.12246 0.000
+playsound block.note_block.pling_1 record @s[] ^0.5 ^ ^ 0.040 0.66742 0.000
+playsound block.note_block.pling record @s[] ^0.5 ^ ^ 0.025 0.89090 0.000
+playsound block.note_block.pling record @s[] ^0.5 ^ ^ 0.050 1.12246 0.000
@@ -0,0 +1,8 @@
+playsound block.note_block.pling record @s[] ^0.25 ^ ^ 0.300 1.33484 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.100 1.32332 0.000
+playsound block.note_block.pling_1 record @s[] ^-0.5 ^ ^ 0.024 0.66742 0.000
+playsound block.note_block.pling record @s[] ^-0.5 ^ ^ 0.024 0.89090 0.000
+playsound block.note_block.pling record @s[] ^-0.5 ^ ^ 0.024 1.12246 0.000
+playsound block.note_block.pling_1 record @s[] ^0.5 ^ ^ 0.008 0.66742 0.000
+playsound block.note_block.pling record @s[] ^0.5 ^ ^ 0.005 0.89090 0.000
+playsound block.note_block.pling record @s[] ^0.5 ^ ^ 0.010 1.12246 0.000
@@ -0,0 +1,2 @@
+playsound block.note_block.bit_1 record @a[distance=..6.36] ^1.0 ^ ^ 0.700 0.66742 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.39] ^-1.0 ^ ^ 1.000 0.64842 0.000
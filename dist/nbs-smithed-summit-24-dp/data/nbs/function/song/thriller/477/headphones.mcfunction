@@ -0,0 +1,13 @@
+playsound block.note_block.didgeridoo record @s[] ^-0.0 ^ ^ 0.500 0.74915 0.000
+playsound block.note_block.bass record @s[] ^-0.0 ^ ^ 0.500 0.74915 0.000
+playsound block.note_block.pling record @s[] ^0.25 ^ ^ 0.700 1.12246 0.000
+playsound block.note_block.pling record @s[] ^0.25 ^ ^ 0.300 1.11278 0.000
+playsound block.note_block.pling_1 record @s[] ^0.5 ^ ^ 0.280 0.56123 0.000
+playsound block.note_block.pling record @s[] ^0.5 ^ ^ 0.280 0.74915 0.000
+playsound block.note_block.pling record @s[] ^0.5 ^ ^ 0.280 0.89090 0.000
+playsound block.note_block.pling_1 record @s[] ^-0.5 ^ ^ 0.248 0.56123 0.000
+playsound block.note_block.pling record @s[] ^-0.5 ^ ^ 0.155 0.74915 0.000
+playsound block.note_block.pling record @s[] ^-0.5 ^ ^ 0.310 0.89090 0.000
+playsound block.note_block.flute_-1 record @s[] ^-0.0 ^ ^ 0.500 1.49831 0.000
+playsound block.note_block.flute_-1 record @s[] ^-0.0 ^ ^ 0.500 1.78180 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.600 0.56123 0.000
@@ -0,0 +1,16 @@
+playsound block.note_block.didgeridoo record @s[] ^-0.0 ^ ^ 0.500 0.74915 0.000
+playsound block.note_block.bass record @s[] ^-0.0 ^ ^ 0.500 0.74915 0.000
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 1.000 0.50000 0.000
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 1.000 0.70711 0.000
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 1.000 1.00000 0.000
+playsound block.note_block.pling record @s[] ^0.25 ^ ^ 0.300 1.12246 0.000
+playsound block.note_block.pling record @s[] ^-0.0 ^ ^ 0.100 1.11278 0.000
+playsound block.note_block.pling_1 record @s[] ^0.5 ^ ^ 0.136 0.56123 0.000
+playsound block.note_block.pling record @s[] ^0.5 ^ ^ 0.136 0.74915 0.000
+playsound block.note_block.pling record @s[] ^0.5 ^ ^ 0.136 0.89090 0.000
+playsound block.note_block.pling_1 record @s[] ^-0.5 ^ ^ 0.104 0.56123 0.000
+playsound block.note_block.pling record @s[] ^-0.5 ^ ^ 0.065 0.74915 0.000
+playsound block.note_block.pling record @s[] ^-0.5 ^ ^ 0.130 0.89090 0.000
+playsound block.note_block.flute_-1 record @s[] ^-0.0 ^ ^ 0.500 1.49831 0.000
+playsound block.note_block.flute_-1 record @s[] ^-0.0 ^ ^ 0.500 1.78180 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.600 0.56123 0.000
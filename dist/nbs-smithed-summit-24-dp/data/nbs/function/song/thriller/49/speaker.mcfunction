@@ -0,0 +1,2 @@
+playsound block.note_block.bit_1 record @a[distance=..6.42] ^1.0 ^ ^ 0.700 0.62996 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.45] ^-1.0 ^ ^ 1.000 0.61203 0.000
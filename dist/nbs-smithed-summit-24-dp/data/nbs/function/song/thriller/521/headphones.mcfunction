@@ -0,0 +1,6 @@
+playsound block.note_block.snare record @s[] ^-0.0 ^ ^ 0.500 1.58740 0.000
+playsound block.note_block.flute_-1 record @s[] ^-0.0 ^ ^ 0.390 1.12246 0.000
+playsound block.note_block.flute_-1 record @s[] ^-0.0 ^ ^ 0.390 1.49831 0.000
+playsound block.note_block.flute_-1 record @s[] ^-0.0 ^ ^ 0.390 1.78180 0.000
+playsound block.note_block.flute record @s[] ^-0.0 ^ ^ 0.468 0.56123 0.000
+playsound mob_wolf_bark2 record @s[] ^0.5 ^ ^ 0.300 0.66742 0.000
@@ -0,0 +1,3 @@
+playsound block.note_block.flute_-1 record @a[distance=..10.15] ^0.0 ^ ^ 0.365 1.49831 0.000
+playsound block.note_block.flute_-1 record @a[distance=..9.48] ^0.0 ^ ^ 0.365 1.78180 0.000
+playsound block.note_block.flute record @a[distance=..8.52] ^0.0 ^ ^ 0.438 0.56123 0.000
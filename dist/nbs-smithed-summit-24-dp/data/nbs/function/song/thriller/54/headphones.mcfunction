@@ -0,0 +1,2 @@
+playsound block.note_block.bit_1 record @s[] ^-0.65 ^ ^ 0.700 0.56123 0.000
+playsound block.note_block.bit_1 record @s[] ^0.5 ^ ^ 1.000 0.54525 0.000
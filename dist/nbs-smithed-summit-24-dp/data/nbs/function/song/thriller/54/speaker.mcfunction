@@ -0,0 +1,2 @@
+playsound block.note_block.bit_1 record @a[distance=..6.56] ^1.0 ^ ^ 0.700 0.56123 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.60] ^-1.0 ^ ^ 1.000 0.54525 0.000
@@ -0,0 +1,2 @@
+playsound block.note_block.bit_1 record @a[distance=..6.65] ^1.0 ^ ^ 0.700 0.52973 0.000
+playsound block.note_block.bit_1 record @a[distance=..6.70] ^-1.0 ^ ^ 1.000 0.51465 0.000
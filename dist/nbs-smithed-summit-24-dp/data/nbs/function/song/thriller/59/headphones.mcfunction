@@ -0,0 +1,2 @@
+playsound block.note_block.bit record @s[] ^-0.65 ^ ^ 0.700 2.00000 0.000
+playsound block.note_block.bit record @s[] ^0.5 ^ ^ 1.000 1.94306 0.000
@@ -0,0 +1,2 @@
+playsound block.note_block.bit record @a[distance=..48.00] ^2.0 ^ ^ 1.636 2.00000 0.000
+playsound block.note_block.bit record @a[distance=..48.00] ^-2.0 ^ ^ 2.345 1.94306 0.000
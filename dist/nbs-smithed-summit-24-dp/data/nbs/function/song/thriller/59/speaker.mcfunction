@@ -0,0 +1,2 @@
+playsound block.note_block.bit record @a[distance=..6.75] ^1.0 ^ ^ 0.700 2.00000 0.000
+playsound block.note_block.bit record @a[distance=..6.80] ^-1.0 ^ ^ 1.000 1.94306 0.000
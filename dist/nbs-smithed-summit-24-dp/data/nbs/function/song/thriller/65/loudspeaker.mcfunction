@@ -0,0 +1,2 @@
+playsound block.note_block.bit record @a[distance=..48.00] ^2.0 ^ ^ 1.655 1.78180 0.000
+playsound block.note_block.bit record @a[distance=..48.00] ^-2.0 ^ ^ 2.372 1.73107 0.000
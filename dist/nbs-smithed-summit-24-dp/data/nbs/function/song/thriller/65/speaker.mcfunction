@@ -0,0 +1,2 @@
+playsound block.note_block.bit record @a[distance=..6.99] ^1.0 ^ ^ 0.700 1.78180 0.000
+playsound block.note_block.bit record @a[distance=..7.06] ^-1.0 ^ ^ 1.000 1.73107 0.000
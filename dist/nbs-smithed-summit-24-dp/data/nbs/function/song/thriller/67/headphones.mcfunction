@@ -0,0 +1,2 @@
+playsound block.note_block.bit record @s[] ^-0.65 ^ ^ 0.700 1.68179 0.000
+playsound block.note_block.bit record @s[] ^0.5 ^ ^ 1.000 1.63392 0.000
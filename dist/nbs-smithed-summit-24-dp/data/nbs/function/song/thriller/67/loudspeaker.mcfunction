@@ -0,0 +1,2 @@
+playsound block.note_block.bit record @a[distance=..48.00] ^2.0 ^ ^ 1.665 1.68179 0.000
+playsound block.note_block.bit record @a[distance=..48.00] ^-2.0 ^ ^ 2.385 1.63392 0.000
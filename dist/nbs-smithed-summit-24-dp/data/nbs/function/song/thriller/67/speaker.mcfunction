@@ -0,0 +1,2 @@
+playsound block.note_block.bit record @a[distance=..7.13] ^1.0 ^ ^ 0.700 1.68179 0.000
+playsound block.note_block.bit record @a[distance=..7.21] ^-1.0 ^ ^ 1.000 1.63392 0.000
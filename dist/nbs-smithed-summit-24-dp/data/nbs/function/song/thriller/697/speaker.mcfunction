@@ -0,0 +1,3 @@
+playsound block.note_block.snare record @a[distance=..6.23] ^0.0 ^ ^ 0.500 1.58740 0.000
+playsound random_wood_click record @a[distance=..6.86] ^0.0 ^ ^ 0.300 0.94387 0.000
+playsound mob_wolf_howl2 record @a[distance=..6.42] ^1.0 ^ ^ 0.200 1.25992 0.000
@@ -0,0 +1,2 @@
+playsound block.note_block.bit record @s[] ^-0.65 ^ ^ 0.700 1.58740 0.000
+playsound block.note_block.bit record @s[] ^0.5 ^ ^ 1.000 1.54221 0.000
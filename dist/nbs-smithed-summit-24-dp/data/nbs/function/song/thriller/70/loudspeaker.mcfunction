@@ -0,0 +1,2 @@
+playsound block.note_block.bit record @a[distance=..48.00] ^2.0 ^ ^ 1.674 1.58740 0.000
+playsound block.note_block.bit record @a[distance=..48.00] ^-2.0 ^ ^ 2.399 1.54221 0.000
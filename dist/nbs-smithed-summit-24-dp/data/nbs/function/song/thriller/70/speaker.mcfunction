@@ -0,0 +1,2 @@
+playsound block.note_block.bit record @a[distance=..7.29] ^1.0 ^ ^ 0.700 1.58740 0.000
+playsound block.note_block.bit record @a[distance=..7.37] ^-1.0 ^ ^ 1.000 1.54221 0.000
@@ -0,0 +1,2 @@
+playsound block.note_block.bit record @s[] ^-0.65 ^ ^ 0.623 1.41421 0.000
+playsound block.note_block.bit record @s[] ^0.5 ^ ^ 0.850 1.37395 0.000
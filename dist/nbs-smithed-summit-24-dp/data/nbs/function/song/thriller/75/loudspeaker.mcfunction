@@ -0,0 +1,2 @@
+playsound block.note_block.bit record @a[distance=..48.00] ^2.0 ^ ^ 1.507 1.41421 0.000
+playsound block.note_block.bit record @a[distance=..48.00] ^-2.0 ^ ^ 2.062 1.37395 0.000
@@ -0,0 +1,2 @@
+playsound block.note_block.bit record @a[distance=..7.65] ^1.0 ^ ^ 0.623 1.41421 0.000
+playsound block.note_block.bit record @a[distance=..7.74] ^-1.0 ^ ^ 0.850 1.37395 0.000
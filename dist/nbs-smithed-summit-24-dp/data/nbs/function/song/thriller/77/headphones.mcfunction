@@ -0,0 +1,2 @@
+playsound block.note_block.bit record @s[] ^-0.65 ^ ^ 0.574 1.33484 0.000
+playsound block.note_block.bit record @s[] ^0.5 ^ ^ 0.780 1.29684 0.000
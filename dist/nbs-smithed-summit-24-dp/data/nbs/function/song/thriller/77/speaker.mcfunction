@@ -0,0 +1,2 @@
+playsound block.note_block.bit record @a[distance=..7.85] ^1.0 ^ ^ 0.574 1.33484 0.000
+playsound block.note_block.bit record @a[distance=..7.95] ^-1.0 ^ ^ 0.780 1.29684 0.000
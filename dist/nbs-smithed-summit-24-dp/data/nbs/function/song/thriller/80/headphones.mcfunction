@@ -0,0 +1,2 @@
+playsound block.note_block.bit record @s[] ^-0.65 ^ ^ 0.525 1.25992 0.000
+playsound block.note_block.bit record @s[] ^0.5 ^ ^ 0.710 1.22405 0.000
@@ -0,0 +1,2 @@
+playsound block.note_block.bit record @a[distance=..8.06] ^1.0 ^ ^ 0.525 1.25992 0.000
+playsound block.note_block.bit record @a[distance=..8.17] ^-1.0 ^ ^ 0.710 1.22405 0.000
@@ -0,0 +1,4 @@
+playsound block.note_block.bit record @a[distance=..8.52] ^1.0 ^ ^ 0.420 1.12246 0.000
+playsound block.note_block.bit record @a[distance=..8.64] ^-1.0 ^ ^ 0.570 1.09051 0.000
+playsound block.note_block.flute_-1 record @a[distance=..9.72] ^-1.0 ^ ^ 0.600 1.68179 0.000
+playsound block.note_block.flute_-1 record @a[distance=..9.76] ^1.0 ^ ^ 0.800 1.66248 0.000
@@ -0,0 +1,4 @@
+playsound block.note_block.bit record @s[] ^-0.65 ^ ^ 0.224 0.89090 0.000
+playsound block.note_block.bit record @s[] ^0.5 ^ ^ 0.280 0.86554 0.000
+playsound block.note_block.flute_-1 record @s[] ^0.5 ^ ^ 0.600 1.68179 0.000
+playsound block.note_block.flute_-1 record @s[] ^-0.5 ^ ^ 0.800 1.66248 0.000
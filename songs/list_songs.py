@@ -1,64 +1,167 @@
+"""
+Catalog the songs of this directory in songs.csv.
+
+Only the header of each .nbs file is decoded: note records are skipped over to count
+them, without building any objects. Files are scanned in parallel, and the entries of
+files whose modification time, size or content hash didn't change are reused from the
+previous run, so songs.csv is only rewritten when the catalog actually changes.
+
+Usage (from the songs directory):
+
+    python list_songs.py [--workers 0] [--no-cache]
+"""
+
+import argparse
 import csv
+import hashlib
+import io
+import json
+import mmap
 import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+# Bump this whenever the layout of the cached entries changes
+CACHE_VERSION = 1
+PROJECT = Path(__file__).resolve().parent.parent
+CACHE_PATH = PROJECT / ".beet_cache" / "song_catalog.json"
+
+# The script runs from the songs directory, and shares the .nbs parser of the build
+sys.path.insert(0, str(PROJECT))
+from src.nbs_reader import NbsReader  # noqa: E402
+
+FIELDNAMES = ["name", "length", "notes", "title", "author", "original_author"]
+
+
+def read_song(path: str) -> dict:
+    """Return the catalog entry of an .nbs file, along with its custom instruments."""
+
+    with NbsReader(path) as reader:
+        header = reader.header
+        instruments = [instrument.file for instrument in reader.instruments]
+        digest = hashlib.sha256(reader.map).hexdigest()
 
-import pynbs
-
-data = []
-
-total_length = 0
-total_notes = 0
-
-for file in os.listdir("."):
-    if file.endswith(".nbs"):
-
-        print(f"Processing {file}...")
-
-        # Load the NBS file
-        song = pynbs.read(file)
-
-        note_count = len(song.notes)
-
-        length_total = song.header.song_length / song.header.tempo
-        length_minutes = int(length_total // 60)
-        length_seconds = int(length_total % 60)
-        length = f"{length_minutes}:{length_seconds:02}"
-
-        total_length += length_total
-        total_notes += note_count
-
-        # Add the data to the list
-        data.append(
-            {
-                "name": file,
-                "length": length,
-                "notes": note_count,
-                "title": song.header.song_name,
-                "author": song.header.song_author,
-                "original_author": song.header.original_author,
-            }
-        )
-
-        for instrument in song.instruments:
-            if not instrument.file.startswith("minecraft/"):
-                print(f"Warning: {instrument.file} is not a Minecraft sound file")
-
-# Calculate totals
-print(total_length)
-data.append(
-    {
-        "name": "[TOTAL]",
-        "length": f"{int(total_length // 60)}:{int(total_length % 60)}",
-        "notes": total_notes,
-        "title": "",
-        "author": "",
-        "original_author": "",
+    length_total = header.song_length / header.tempo
+    length_minutes = int(length_total // 60)
+    length_seconds = int(length_total % 60)
+
+    return {
+        "hash": digest,
+        "length_total": length_total,
+        "instruments": instruments,
+        "row": {
+            "name": os.path.basename(path),
+            "length": f"{length_minutes}:{length_seconds:02}",
+            "notes": reader.note_count,
+            "title": header.song_name,
+            "author": header.song_author,
+            "original_author": header.original_author,
+        },
     }
-)
 
-# Write the data to a CSV file
-with open("songs.csv", "w", newline="") as f:
-    writer = csv.DictWriter(
-        f, fieldnames=["name", "length", "notes", "title", "author", "original_author"]
+
+def get_file_hash(path: str) -> str:
+    with open(path, "rb") as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buf:
+            return hashlib.sha256(buf).hexdigest()
+
+
+def read_songs(pending: list, workers: int) -> list[dict]:
+    """Read the given files, in parallel when there's more than one worker."""
+
+    paths = [file for file, _ in pending]
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or len(paths) <= 1:
+        return list(map(read_song, paths))
+
+    with ProcessPoolExecutor(min(workers, len(paths))) as executor:
+        return list(executor.map(read_song, paths, chunksize=8))
+
+
+def load_cache(enabled: bool) -> dict:
+    if not enabled or not CACHE_PATH.is_file():
+        return {}
+    cache = json.loads(CACHE_PATH.read_text("utf-8"))
+    return cache["entries"] if cache.get("version") == CACHE_VERSION else {}
+
+
+def save_cache(entries: dict):
+    CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+    CACHE_PATH.write_text(
+        json.dumps({"version": CACHE_VERSION, "entries": entries}), "utf-8"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Catalog the songs of this directory in songs.csv."
+    )
+    parser.add_argument("--workers", type=int, default=0)
+    parser.add_argument("--no-cache", dest="cache", action="store_false")
+    args = parser.parse_args()
+
+    cache = load_cache(args.cache)
+    entries = {}
+    pending = []
+
+    for file in sorted(os.listdir(".")):
+        if not file.endswith(".nbs"):
+            continue
+
+        stat = os.stat(file)
+        entry = cache.get(os.path.abspath(file))
+
+        # A touched file whose content didn't change only costs a hash
+        if entry is not None and (
+            (entry["mtime"], entry["size"]) == (stat.st_mtime_ns, stat.st_size)
+            or entry["hash"] == get_file_hash(file)
+        ):
+            entries[file] = {**entry, "mtime": stat.st_mtime_ns, "size": stat.st_size}
+        else:
+            print(f"Processing {file}...")
+            pending.append((file, stat))
+
+    for (file, stat), entry in zip(pending, read_songs(pending, args.workers)):
+        entries[file] = {**entry, "mtime": stat.st_mtime_ns, "size": stat.st_size}
+
+        for instrument in entry["instruments"]:
+            if not instrument.startswith("minecraft/"):
+                print(f"Warning: {instrument} is not a Minecraft sound file")
+
+    if args.cache:
+        save_cache({os.path.abspath(file): entry for file, entry in entries.items()})
+
+    data = [entry["row"] for entry in entries.values()]
+    total_length = sum(entry["length_total"] for entry in entries.values())
+    total_notes = sum(row["notes"] for row in data)
+
+    # Calculate totals
+    print(total_length)
+    data.append(
+        {
+            "name": "[TOTAL]",
+            "length": f"{int(total_length // 60)}:{int(total_length % 60)}",
+            "notes": total_notes,
+            "title": "",
+            "author": "",
+            "original_author": "",
+        }
     )
+
+    output = io.StringIO(newline="")
+    writer = csv.DictWriter(output, fieldnames=FIELDNAMES)
     writer.writeheader()
     writer.writerows(data)
+
+    # Only write the CSV file when the catalog changed
+    csv_path = Path("songs.csv")
+    if csv_path.is_file() and csv_path.read_bytes() == output.getvalue().encode():
+        print(f"songs.csv is up to date ({len(pending)} song(s) scanned)")
+    else:
+        csv_path.write_bytes(output.getvalue().encode())
+        print(f"songs.csv updated ({len(pending)} song(s) scanned)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,154 @@
+__all__ = [
+    "AtlasBox",
+    "get_atlas_boxes",
+    "get_atlas_layout",
+    "get_atlas_texture",
+    "get_scrolling_atlas_texture",
+    "get_texture_size",
+    "remap_model",
+]
+
+
+import math
+from copy import deepcopy
+from io import BytesIO
+from typing import Any, Dict, List, Optional, Tuple
+
+from beet import Texture
+from PIL import Image
+
+# Area of a texture inside its sheet, as fractions of the sheet: (x0, y0, x1, y1)
+AtlasBox = Tuple[float, float, float, float]
+
+
+def get_texture_size(texture: Texture) -> Tuple[int, int]:
+    """Return the size of a texture, only reading the header of the png."""
+    with Image.open(BytesIO(texture.blob)) as img:
+        return img.size
+
+
+def get_atlas_layout(
+    sizes: List[Tuple[int, int]],
+) -> Tuple[Tuple[int, int], List[Tuple[int, int]]]:
+    """
+    Lay out textures on a grid of cells as big as the largest one, as close to a square
+    as possible. Return the size of the sheet and the position of each texture.
+    """
+
+    cell_width = max(width for width, _ in sizes)
+    cell_height = max(height for _, height in sizes)
+    columns = math.ceil(math.sqrt(len(sizes)))
+    rows = math.ceil(len(sizes) / columns)
+
+    positions = [
+        ((i % columns) * cell_width, (i // columns) * cell_height)
+        for i in range(len(sizes))
+    ]
+
+    return (columns * cell_width, rows * cell_height), positions
+
+
+def get_atlas_boxes(sizes: List[Tuple[int, int]]) -> List[AtlasBox]:
+    """Return the area of each texture in the sheet laid out by `get_atlas_layout`."""
+    (sheet_width, sheet_height), positions = get_atlas_layout(sizes)
+    return [
+        (
+            x / sheet_width,
+            y / sheet_height,
+            (x + width) / sheet_width,
+            (y + height) / sheet_height,
+        )
+        for (x, y), (width, height) in zip(positions, sizes)
+    ]
+
+
+def get_atlas_texture(*textures: Texture) -> Texture:
+    """Pack the textures in a single sheet, laid out by `get_atlas_layout`."""
+
+    images = [texture.image.convert("RGBA") for texture in textures]
+    sheet_size, positions = get_atlas_layout([img.size for img in images])
+
+    sheet = Image.new("RGBA", sheet_size, (0, 0, 0, 0))
+    for img, position in zip(images, positions):
+        sheet.paste(img, position)
+
+    return Texture(sheet)
+
+
+def get_scrolling_atlas_texture(
+    texture: Texture, scroll_factor: int, panel_count: int
+) -> Texture:
+    """
+    Turn a scrolling strip (see `generate_scrolling_texture`) into a single animation
+    that shows every panel side by side. Each frame holds the frame that each panel
+    would show at that time with the mcmetas from `generate_scrolling_mcmetas`.
+    """
+
+    strip = texture.image
+    tile_size = strip.width
+    frames = strip.height // tile_size
+    frames_per_slice = tile_size // scroll_factor
+
+    output = Image.new("RGBA", (tile_size * panel_count, strip.height), (0, 0, 0, 0))
+
+    for i in range(frames):
+        for panel in range(panel_count):
+            frame = (i + panel * frames_per_slice) % frames
+            box = (0, frame * tile_size, tile_size, (frame + 1) * tile_size)
+            output.paste(strip.crop(box), (panel * tile_size, i * tile_size))
+
+    return Texture(output)
+
+
+def remap_uv(uv: List[float], box: AtlasBox) -> List[float]:
+    x0, y0, x1, y1 = box
+    u0, v0, u1, v1 = uv
+    # A pixel of a 1024x1024 sheet is 1/64 of a uv unit, so 4 decimals are plenty
+    return [
+        round(16 * x0 + u0 * (x1 - x0), 4),
+        round(16 * y0 + v0 * (y1 - y0), 4),
+        round(16 * x0 + u1 * (x1 - x0), 4),
+        round(16 * y0 + v1 * (y1 - y0), 4),
+    ]
+
+
+def remap_model(
+    model: Dict[str, Any],
+    parent: Optional[Dict[str, Any]],
+    boxes: Dict[str, Tuple[str, AtlasBox]],
+) -> bool:
+    """
+    Point the texture variables of a model that use packed textures to their sheet,
+    and move the uvs of the faces that use them to the texture's area in the sheet.
+    Models that inherit their elements get a copy of the parent's. Return whether the
+    model was changed.
+    """
+
+    textures = model.get("textures", {})
+    packed = {
+        variable: boxes[path] for variable, path in textures.items() if path in boxes
+    }
+    if not packed:
+        return False
+
+    if "elements" in model:
+        elements = model["elements"]
+    elif parent is not None and "elements" in parent:
+        elements = deepcopy(parent["elements"])
+    else:
+        raise ValueError(f"Can't find the elements of {model} to remap its uvs.")
+
+    for element in elements:
+        for face in element["faces"].values():
+            variable = face["texture"].lstrip("#")
+            if variable not in packed:
+                continue
+            if "uv" not in face:
+                raise ValueError(f"Faces need explicit uvs to use an atlas: {face}")
+            face["uv"] = remap_uv(face["uv"], packed[variable][1])
+
+    for variable, (sheet, _) in packed.items():
+        textures[variable] = sheet
+
+    model["elements"] = elements
+    return True
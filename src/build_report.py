@@ -0,0 +1,283 @@
+__all__ = [
+    "BuildReport",
+    "Measurement",
+]
+
+
+import cProfile
+import json
+import time
+import tracemalloc
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from functools import wraps
+from typing import Any, Dict, Generator, Iterable, Iterator, List, Optional
+
+from beet import Context, Pipeline, Plugin
+from beet.contrib.autosave import Autosave
+
+
+@dataclass
+class Measurement:
+    """Resources used by a stage of the pipeline or a song, over all of its runs."""
+
+    name: str
+    parent: Optional[str] = None
+    runs: int = 0
+    wall_time: float = 0.0
+    cpu_time: float = 0.0
+    memory_peak: int = 0
+    functions: Optional[int] = None
+    commands: Optional[int] = None
+
+    def add_counts(self, functions: int, commands: int):
+        self.functions = (self.functions or 0) + functions
+        self.commands = (self.commands or 0) + commands
+
+    def add_functions(self, functions: Dict[str, str]):
+        """Count the given functions, keyed by resource location, and their commands."""
+        self.add_counts(len(functions), sum(map(count_commands, functions.values())))
+
+
+class BuildReport:
+    """
+    Records the wall time, CPU time and tracemalloc peak of each plugin of the pipeline,
+    and of each song, when `report` is enabled in `meta.nbs`.
+
+    Plugins are measured by wrapping every plugin the pipeline resolves once the report
+    is installed, so nested plugins (like the ones mecha requires) get their own entry,
+    and their time is also included in their parent's. Generator plugins are measured
+    over all of their steps. Top-level stages also record how many functions and
+    commands they added to the data pack. The CPU time only covers the build process,
+    not the song workers or the texture threads it waits on.
+
+    The report is written as json next to the output directory once the packs are
+    saved. With `profile` set to the name of a stage, that stage also runs under
+    cProfile, and its stats are dumped to `<stage>.prof` next to the report.
+    """
+
+    def __init__(self, ctx: Context):
+        self.ctx = ctx
+        opts = ctx.meta.get("nbs", {})
+        self.enabled = opts.get("report", False)
+        self.profile_stage: Optional[str] = opts.get("profile") or None
+        self.profiler = cProfile.Profile()
+        self.profiled = False
+
+        self.stages: Dict[str, Measurement] = {}
+        self.songs: Dict[str, Measurement] = {}
+        self.stack: List[Measurement] = []
+        self.wrapped: Dict[Plugin, Plugin] = {}
+        self.line_counts: Dict[int, tuple[str, int]] = {}
+        self.start = time.perf_counter()
+        self.start_cpu = time.process_time()
+
+        output = ctx.output_directory
+        directory = output.parent if output else ctx.directory
+        self.path = directory / "build_report.json"
+
+    def install(self):
+        """Measure every plugin resolved by the pipeline from now on."""
+
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+
+        pipeline = self.ctx.inject(Pipeline)
+        resolve = pipeline.resolve
+        pipeline.resolve = lambda spec: self.wrap(get_stage_name(spec), resolve(spec))
+
+    def uninstall(self):
+        pipeline = self.ctx.inject(Pipeline)
+        pipeline.__dict__.pop("resolve", None)
+
+    def wrap(self, name: str, plugin: Plugin) -> Plugin:
+        """Return a plugin that runs the given one under a measurement."""
+
+        # The pipeline only runs a plugin once, so the same one must always come back
+        if plugin in self.wrapped:
+            return self.wrapped[plugin]
+
+        @wraps(plugin)
+        def measured(ctx: Context):
+            with self.measure(name):
+                result = plugin(ctx)
+                if not isinstance(result, Iterable):
+                    return None
+                iterator = iter(result)
+            return self.resume(name, iterator)
+
+        self.wrapped[plugin] = measured
+        return measured
+
+    def resume(self, name: str, iterator: Iterator[Any]) -> Generator[None, None, None]:
+        """Run the steps of a generator plugin, measuring each of them."""
+
+        exception: Optional[Exception] = None
+        while True:
+            with self.measure(name):
+                try:
+                    if exception is None:
+                        next(iterator)
+                    elif isinstance(iterator, Generator):
+                        iterator.throw(exception)
+                    else:
+                        raise exception
+                except StopIteration:
+                    return
+            exception = None
+            try:
+                yield
+            except Exception as exc:
+                exception = exc
+
+    @contextmanager
+    def measure(self, name: str):
+        """Measure a stage of the pipeline, under the one currently running."""
+
+        if name not in self.stages:
+            parent = self.stack[-1].name if self.stack else None
+            self.stages[name] = Measurement(name, parent)
+        measurement = self.stages[name]
+
+        counts = self.count() if not self.stack else None
+        profiled = name == self.profile_stage
+        if profiled:
+            self.profiler.enable()
+            self.profiled = True
+
+        try:
+            with self.track(measurement):
+                yield measurement
+        finally:
+            if profiled:
+                self.profiler.disable()
+            if counts is not None:
+                functions, commands = self.count()
+                measurement.add_counts(functions - counts[0], commands - counts[1])
+
+    @contextmanager
+    def song(self, name: str):
+        """Measure the compilation (or the cache load) of a song."""
+
+        if not self.enabled:
+            yield Measurement(name)
+            return
+
+        measurement = self.songs.setdefault(name, Measurement(name))
+        if self.stack:
+            measurement.parent = self.stack[-1].name
+        with self.track(measurement):
+            yield measurement
+
+    @contextmanager
+    def track(self, measurement: Measurement):
+        # The peak of the running measurement is saved before being reset for this one
+        if self.stack:
+            parent = self.stack[-1]
+            peak = tracemalloc.get_traced_memory()[1]
+            parent.memory_peak = max(parent.memory_peak, peak)
+        tracemalloc.reset_peak()
+        self.stack.append(measurement)
+
+        start = time.perf_counter()
+        start_cpu = time.process_time()
+        try:
+            yield
+        finally:
+            measurement.runs += 1
+            measurement.wall_time += time.perf_counter() - start
+            measurement.cpu_time += time.process_time() - start_cpu
+
+            self.stack.pop()
+            peak = tracemalloc.get_traced_memory()[1]
+            measurement.memory_peak = max(measurement.memory_peak, peak)
+            if self.stack:
+                parent = self.stack[-1]
+                parent.memory_peak = max(parent.memory_peak, peak)
+
+    def count(self) -> tuple[int, int]:
+        """Return the number of functions and commands in the data pack."""
+
+        functions = self.ctx.data.functions
+        commands = 0
+        line_counts = {}
+
+        for function in functions.values():
+            text = function.text
+            cached = self.line_counts.get(id(function))
+            if cached is None or cached[0] is not text:
+                cached = (text, count_commands(text))
+            line_counts[id(function)] = cached
+            commands += cached[1]
+
+        self.line_counts = line_counts
+        return len(functions), commands
+
+    def finish(self):
+        """Measure the output handlers, and write the report once they're done."""
+
+        self.uninstall()
+        autosave = self.ctx.inject(Autosave)
+        pipeline = self.ctx.inject(Pipeline)
+        autosave.output_handlers = [
+            self.wrap(get_stage_name(spec), pipeline.resolve(spec))
+            for spec in autosave.output_handlers
+        ]
+        autosave.add_output(self.write)
+
+    def write(self, ctx: Context):
+        profile = None
+        if self.profiled:
+            profile = self.path.with_name(f"{self.profile_stage}.prof")
+            self.profiler.dump_stats(profile)
+
+        report = {
+            "wall_time": time.perf_counter() - self.start,
+            "cpu_time": time.process_time() - self.start_cpu,
+            "memory_peak": max(m.memory_peak for m in self.stages.values()),
+            "profile": str(profile) if profile else None,
+            "stages": [asdict(m) for m in self.stages.values()],
+            "songs": [asdict(m) for m in self.songs.values()],
+        }
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.path.write_text(json.dumps(report, indent=2), "utf-8")
+
+        slowest = sorted(self.stages.values(), key=lambda m: -m.wall_time)[:5]
+        for measurement in slowest:
+            print(
+                f"{measurement.name:<40} {measurement.wall_time:>8.2f} s "
+                f"{measurement.cpu_time:>8.2f} s cpu "
+                f"{measurement.memory_peak / 2**20:>8.1f} MiB"
+            )
+        print(f"build report: {len(self.stages)} stages, {len(self.songs)} songs")
+
+        if self.profile_stage and not self.profiled:
+            print(f"Warning: no stage named {self.profile_stage} to profile")
+
+
+def get_stage_name(spec: Any) -> str:
+    """Return the dotted path of a plugin, the way it would be written in beet.yml."""
+
+    if isinstance(spec, str):
+        return spec
+
+    module = getattr(spec, "__module__", None) or type(spec).__module__
+    name = getattr(spec, "__qualname__", None) or type(spec).__qualname__
+    if name == "beet_default":
+        return module
+    return f"{module}.{name}"
+
+
+def count_commands(text: str) -> int:
+    return sum(1 for line in text.splitlines() if line and not line.startswith("#"))
+
+
+def beet_default(ctx: Context):
+    report = ctx.inject(BuildReport)
+    if not report.enabled:
+        return
+
+    report.install()
+    yield
+    report.finish()
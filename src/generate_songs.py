@@ -0,0 +1,113 @@
+__all__ = [
+    "get_song_entry",
+]
+
+
+from typing import Dict
+
+from beet import Context
+from nbtlib import Compound, Int, String, serialize_tag
+
+from src.build_report import BuildReport
+from src.runtime_cost import RuntimeCost
+from src.song import SongOptions, compile_songs, get_song_name
+from src.song_cache import SongCache
+from src.song_writer import SongWriter
+from src.sound_index import SoundIndex
+
+
+def get_song_entry(name: str, index: int, stem: str, header: Dict[str, str]) -> str:
+    """Return the command that adds a song to the list the playback picks songs from."""
+
+    entry = Compound(
+        {
+            "name": String(name),
+            "index": Int(index),
+            "formatted_string": String(stem),
+            "title": String(header["title"]),
+            "author": String(header["author"]),
+            "original_author": String(header["original_author"]),
+        }
+    )
+
+    return f"data modify storage nbs:main songs append value {serialize_tag(entry)}"
+
+
+def beet_default(ctx: Context):
+    """
+    Add the functions of every song to the data pack.
+
+    Songs are rendered to plain commands by `src.song`, so there's nothing left for
+    bolt or mecha to do with them. This plugin runs after mecha in the pipeline, and
+    adds them as `Function` objects that skip the parsing and serialization mecha
+    applies to the hand-written `global.bolt` and `interaction.bolt`.
+    """
+
+    opts = ctx.meta.get("nbs", {})
+    songs = ctx.directory / opts.get("songs", "songs")
+
+    build_report = ctx.inject(BuildReport)
+    runtime_cost = ctx.inject(RuntimeCost)
+    song_cache = ctx.inject(SongCache)
+    song_writer = ctx.inject(SongWriter)
+    sound_index = ctx.inject(SoundIndex)
+    song_workers = opts.get("workers", 1)
+    song_options = SongOptions.from_meta(opts)
+
+    load = ["data modify storage nbs:main songs set value []"]
+
+    song_paths = list(songs.glob("*.nbs"))
+    cache_keys = {}
+    cache_hits = set()
+    pending_paths = []
+
+    for path in song_paths:
+        song_name = get_song_name(path)
+        cache_keys[path] = song_cache.get_key(path)
+
+        if song_cache.check(song_name, cache_keys[path]):
+            print("cached", song_name)
+            cache_hits.add(path)
+        else:
+            print("processing", song_name)
+            pending_paths.append(path)
+
+    # Songs are rendered to plain commands, on a process pool when `workers` allows it,
+    # and come back in a fixed order so the output doesn't depend on the worker count.
+    # Each song is handed to the writer right away, so they don't pile up in memory.
+    compiled_songs = compile_songs(pending_paths, song_workers, song_options)
+
+    for song_index, path in enumerate(song_paths):
+        song_name = get_song_name(path)
+
+        with build_report.song(song_name) as song_measurement:
+            if path in cache_hits:
+                cache_entry = song_cache.load(song_name)
+                header = cache_entry.header
+                instruments = cache_entry.instruments
+                song_functions = cache_entry.functions
+            else:
+                compiled = next(compiled_songs)
+                print(compiled.report())
+                header = compiled.header
+                instruments = compiled.instruments
+                song_functions = compiled.texts
+                song_cache.record(
+                    song_name,
+                    cache_keys[path],
+                    header,
+                    instruments,
+                    song_functions,
+                )
+
+            load.append(get_song_entry(song_name, song_index, path.stem, header))
+
+            song_writer.write(song_functions)
+            sound_index.add(song_name, instruments)
+            runtime_cost.add(song_name, song_functions)
+            song_measurement.add_functions(song_functions)
+
+    # The song list is set up before anything else `nbs:global/load` does
+    ctx.data.functions["nbs:global/load"].prepend(load)
+
+    print("🎉 LGTM")
@@ -0,0 +1,221 @@
+__all__ = [
+    "IncrementalOutput",
+    "OutputSummary",
+]
+
+
+import hashlib
+import json
+import os
+from dataclasses import dataclass
+from functools import partial
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
+
+from beet import Context, DataPack, Pack
+from beet.contrib.autosave import Autosave
+from beet.contrib.output import output
+from beet.core.file import File, TextFileBase
+
+from src.song_writer import SongWriter
+
+# Bump this whenever the layout of the manifest changes
+MANIFEST_VERSION = 1
+
+
+@dataclass
+class OutputSummary:
+    """Files of a pack that were written, removed or left untouched in the output."""
+
+    name: str
+    written: int = 0
+    removed: int = 0
+    unchanged: int = 0
+
+    def __str__(self) -> str:
+        return (
+            f"{self.name}: {self.written} written, {self.removed} removed, "
+            f"{self.unchanged} unchanged"
+        )
+
+
+class IncrementalOutput:
+    """
+    Saves the packs to the output directory by only touching the files that changed.
+
+    beet deletes each pack from the output directory and writes it again in full on
+    every build, so every file gets a new mtime. With `incremental` enabled in
+    `meta.nbs`, that output step is replaced: each file of the pack is serialized in
+    memory and hashed, and only written when its hash differs from the one recorded in
+    the manifest of the previous build. Files left in the output directory of a pack
+    that aren't part of it anymore are deleted, so the output ends up the same as with
+    a full save, and tools like rsync only pick up what actually changed.
+
+    The manifest is kept in beet's cache, with the size and mtime of each file as it
+    was written. Files that were modified in the output directory since, or that
+    predate the manifest, are hashed again rather than trusted. Zipped packs are a
+    single file, and are still saved in full, with the streamed song functions
+    appended to the archive as in a regular build.
+    """
+
+    def __init__(self, ctx: Context):
+        self.ctx = ctx
+        self.enabled = ctx.meta.get("nbs", {}).get("incremental", False)
+        self.directory = ctx.cache["nbs_output"].directory
+
+    def install(self):
+        """Replace the output step of beet with the incremental one."""
+
+        autosave = self.ctx.inject(Autosave)
+        song_writer = self.ctx.inject(SongWriter)
+        handlers = []
+
+        for spec in autosave.output_handlers:
+            if isinstance(spec, partial) and spec.func is output:
+                handlers.append(self.output)
+            # Spooled song functions are saved along with the rest of the data pack,
+            # unless it's zipped and they still have to be added to the archive
+            elif spec != song_writer.output or self.ctx.data.zipped:
+                handlers.append(spec)
+
+        autosave.output_handlers = handlers
+
+    def output(self, ctx: Context):
+        directory = ctx.output_directory
+        if directory is None:
+            return
+
+        for pack in filter(None, ctx.packs):
+            if pack.zipped:
+                pack.save(directory, overwrite=True)
+                continue
+
+            print(self.save(pack, directory))
+
+    def save(self, pack: Pack[Any], directory: Path) -> OutputSummary:
+        """Bring the directory of a pack in the output up to date with its content."""
+
+        pack.path = directory.resolve()
+        if not pack.name:
+            pack.name = pack.default_name
+
+        root = pack.path / pack.name
+        manifest_path = self.directory / f"{pack.name}.json"
+        previous = self.load_manifest(manifest_path, root)
+        manifest: Dict[str, List[Any]] = {}
+        summary = OutputSummary(pack.name)
+        parents = set()
+
+        for path, content in self.list_files(pack):
+            data = content.read_bytes() if isinstance(content, Path) else content
+            digest = hashlib.sha256(data).hexdigest()
+            target = root / path
+
+            stat = get_unchanged_stat(target, data, digest, previous.get(path))
+            if stat is None:
+                if target.parent not in parents:
+                    target.parent.mkdir(parents=True, exist_ok=True)
+                    parents.add(target.parent)
+                target.write_bytes(data)
+                stat = target.stat()
+                summary.written += 1
+            else:
+                summary.unchanged += 1
+
+            manifest[path] = [digest, stat.st_size, stat.st_mtime_ns]
+
+        summary.removed = remove_stale_files(root, manifest)
+
+        manifest_path.parent.mkdir(parents=True, exist_ok=True)
+        manifest_path.write_text(
+            json.dumps(
+                {"version": MANIFEST_VERSION, "output": str(root), "files": manifest}
+            ),
+            "utf-8",
+        )
+
+        return summary
+
+    def load_manifest(self, path: Path, root: Path) -> Dict[str, List[Any]]:
+        """Return the files recorded by the previous build for the given output."""
+
+        if not path.is_file():
+            return {}
+
+        manifest = json.loads(path.read_text("utf-8"))
+        if manifest["version"] != MANIFEST_VERSION or manifest["output"] != str(root):
+            return {}
+        return manifest["files"]
+
+    def list_files(self, pack: Pack[Any]) -> Iterator[Tuple[str, Union[bytes, Path]]]:
+        """Yield the path of each file in the pack, with its bytes or its source."""
+
+        for path, file in pack.list_files():
+            yield path, get_file_content(file)
+
+        song_writer = self.ctx.inject(SongWriter)
+        if song_writer.stream and isinstance(pack, DataPack):
+            yield from song_writer.list_spooled(pack)
+
+
+def get_file_content(file: File[Any, Any]) -> Union[bytes, Path]:
+    """Return the bytes a file is written with, or its source if it's not loaded."""
+
+    if file.source_path:
+        return Path(file.source_path)
+
+    raw = file.ensure_serialized()
+    if not isinstance(file, TextFileBase):
+        return raw
+
+    # Same translation as the text mode `open` used by `TextFileBase.dump_path`
+    newline = os.linesep if file.newline is None else file.newline
+    if newline not in ("", "\n"):
+        raw = raw.replace("\n", newline)
+    return raw.encode(file.encoding or "utf-8", file.errors or "strict")
+
+
+def get_unchanged_stat(
+    target: Path, data: bytes, digest: str, entry: Optional[List[Any]]
+) -> Optional[os.stat_result]:
+    """Return the stat of the file in the output if it already holds the given bytes."""
+
+    try:
+        stat = target.stat()
+    except FileNotFoundError:
+        return None
+
+    if entry and entry[1:] == [stat.st_size, stat.st_mtime_ns]:
+        return stat if entry[0] == digest else None
+
+    # The file was modified since it was written, or wasn't written by a manifest
+    if stat.st_size != len(data) or target.read_bytes() != data:
+        return None
+    return stat
+
+
+def remove_stale_files(root: Path, manifest: Dict[str, List[Any]]) -> int:
+    """Delete the files of the output that aren't in the pack, and empty directories."""
+
+    removed = 0
+
+    for directory, _, filenames in os.walk(root, topdown=False):
+        relative = Path(directory).relative_to(root)
+        for filename in filenames:
+            if (relative / filename).as_posix() not in manifest:
+                os.remove(os.path.join(directory, filename))
+                removed += 1
+
+        if directory != str(root) and not os.listdir(directory):
+            os.rmdir(directory)
+
+    return removed
+
+
+def beet_default(ctx: Context):
+    incremental_output = ctx.inject(IncrementalOutput)
+    if not incremental_output.enabled:
+        return
+
+    yield
+    incremental_output.install()
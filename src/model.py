@@ -1,8 +1,20 @@
+import json
 from fnmatch import fnmatch
+from pathlib import Path
+from typing import Any
 
 from beet import Context, Model, Texture, TextureMcmeta
 from PIL import Image, ImageChops
 
+from src.atlas import (
+    get_atlas_boxes,
+    get_atlas_texture,
+    get_scrolling_atlas_texture,
+    get_texture_size,
+    remap_model,
+)
+from src.texture_cache import TextureCache
+
 models = [
     "nbw_block",
     "nbw_text",
@@ -35,6 +47,20 @@ CMD_OFFSET = 48184
 
 MONITOR_TEXTURE_SIZE = 512
 
+SCROLL_FACTOR = 4
+SCROLL_PANEL_COUNT = 5
+
+# Sheets of the atlas mode, and the textures packed in each of them. The names of the
+# sheets still match the emissive patterns of the textures they hold. The monitors are
+# left out: they're 512x512 screenshots, which compress worse in a shared sheet than
+# on their own, so packing them only makes the pack bigger.
+atlases = {
+    "nbs:block/note_sign_atlas": "nbs:block/note_sign_*",
+    "nbs:item/balloons/balloon_note_atlas": "nbs:item/balloons/balloon_note[0-9]*",
+}
+
+SCROLL_PANEL_ATLAS = "nbs:block/scroll_panel_atlas"
+
 
 def generate_model_predicates(parent: str, models: list[str] | dict[str, int]) -> Model:
     if isinstance(models, list):
@@ -106,12 +132,28 @@ def generate_scrolling_mcmetas(
 
 
 def generate_scrolling_animation(ctx: Context) -> None:
+    texture_cache = ctx.inject(TextureCache)
+
     panel_texture = ctx.assets.textures["nbs:block/nbw_32x"]
-    texture = generate_scrolling_texture(panel_texture.image)
-    mcmetas = generate_scrolling_mcmetas(texture)
+    key = texture_cache.get_key(
+        "scroll", (SCROLL_FACTOR, SCROLL_PANEL_COUNT), panel_texture
+    )
+
+    def get_texture() -> Texture:
+        return generate_scrolling_texture(panel_texture.image, SCROLL_FACTOR)
+
+    texture = texture_cache.derive(key, get_texture)
+
+    def get_mcmetas() -> list:
+        mcmetas = generate_scrolling_mcmetas(texture, SCROLL_FACTOR, SCROLL_PANEL_COUNT)
+        return [mcmeta.data for mcmeta in mcmetas]
+
+    mcmetas = texture_cache.derive_json(key, get_mcmetas)
     for i, mcmeta in enumerate(mcmetas, start=1):
         ctx.assets.textures[f"nbs:block/scroll_panel_{i}"] = texture
-        ctx.assets.textures_mcmeta[f"nbs:block/scroll_panel_{i}"] = mcmeta
+        ctx.assets.textures_mcmeta[f"nbs:block/scroll_panel_{i}"] = TextureMcmeta(
+            mcmeta
+        )
     del ctx.assets.textures["nbs:block/nbw_32x"]
 
 
@@ -120,16 +162,34 @@ def apply_emissive_textures(ctx: Context) -> None:
         if img.mode != "RGBA":
             img = img.convert("RGBA")
         # set the alpha value to the desired value where it is not 0
-        mask = Image.eval(img.split()[3], lambda a: 0 if a == 0 else alpha)
+        mask = img.getchannel("A").point([0] + [alpha] * 255)
         img.putalpha(mask)
         return img
 
-    for name, texture in ctx.assets.textures.items():
-        name = name.split("/")[-1]
-        if any(fnmatch(name, pattern) for pattern in emissive_textures):
-            texture.image = multiply_alpha(texture.image, EMISSIVE_ALPHA)
+    def get_alpha_texture(texture: Texture, alpha: int) -> Texture:
+        return Texture(multiply_alpha(texture.image, alpha))
+
+    texture_cache = ctx.inject(TextureCache)
+
+    paths = []
+    jobs = []
+
+    for path, texture in ctx.assets.textures.items():
+        name = path.split("/")[-1]
+        # The no-shade alpha wins for textures that match both
         if any(fnmatch(name, pattern) for pattern in no_shade_textures):
-            texture.image = multiply_alpha(texture.image, NO_SHADE_ALPHA)
+            alpha = NO_SHADE_ALPHA
+        elif any(fnmatch(name, pattern) for pattern in emissive_textures):
+            alpha = EMISSIVE_ALPHA
+        else:
+            continue
+
+        key = texture_cache.get_key("alpha", alpha, texture)
+        paths.append(path)
+        jobs.append((key, get_alpha_texture, (texture, alpha)))
+
+    for path, texture in zip(paths, texture_cache.derive_all(jobs)):
+        ctx.assets.textures[path] = texture
 
 
 def create_note_models(ctx: Context) -> None:
@@ -150,18 +210,30 @@ def create_note_models(ctx: Context) -> None:
         models_cmd[filename] = i + 100
 
 
+def resize_monitor_texture(texture: Texture) -> Texture:
+    size = MONITOR_TEXTURE_SIZE
+    # The monitor is 12x10 pixels. We stretch the image to a 512x512 texture
+    src_img: Image.Image = texture.image
+    resized_img = src_img.resize((size, size), Image.Resampling.LANCZOS)
+    return Texture(resized_img)
+
+
 def create_monitor_models(ctx: Context) -> None:
-    monitor_variants = filter(
-        lambda name: name.startswith("nbs:block/monitor_"), ctx.assets.textures
-    )
+    texture_cache = ctx.inject(TextureCache)
 
-    global models
+    monitor_variants = [
+        name for name in ctx.assets.textures if name.startswith("nbs:block/monitor_")
+    ]
+
+    jobs = []
     for texture in monitor_variants:
-        size = MONITOR_TEXTURE_SIZE
-        # The monitor is 12x10 pixels. We stretch the image to a 512x512 texture
-        src_img: Image.Image = ctx.assets.textures[texture].image
-        resized_img = src_img.resize((size, size), Image.Resampling.LANCZOS)
-        ctx.assets.textures[texture] = Texture(resized_img)
+        src_texture = ctx.assets.textures[texture]
+        key = texture_cache.get_key("monitor", MONITOR_TEXTURE_SIZE, src_texture)
+        jobs.append((key, resize_monitor_texture, (src_texture,)))
+
+    global models
+    for texture, resized in zip(monitor_variants, texture_cache.derive_all(jobs)):
+        ctx.assets.textures[texture] = resized
 
     for i in range(6):
         texture = f"nbs:block/monitor_{i}"
@@ -179,43 +251,47 @@ def create_monitor_models(ctx: Context) -> None:
         models_cmd[f"monitor_{i}"] = i + 200
 
 
-def apply_alpha(img: Image.Image, alpha_texture: Image.Image) -> Image.Image:
-    def get_alpha_from_level(level: int) -> int:
-        if level < 64:
-            return 8
-        elif level < 128:
-            return 7
-        elif level < 192:
-            return 6
-        else:
-            return 5
+# Alpha of the balloon pixels for each level of the alpha mask (0-255)
+ALPHA_LEVELS = [8] * 64 + [7] * 64 + [6] * 64 + [5] * 64
 
+
+def apply_alpha(img: Image.Image, alpha_texture: Image.Image) -> Image.Image:
     img = img.convert("RGBA")
     alpha_texture = alpha_texture.convert("L")
-    for x in range(img.width):
-        for y in range(img.height):
-            pixel = img.getpixel((x, y))
-            if not isinstance(pixel, tuple):
-                raise ValueError(f"Expected RGBA pixel, got {pixel}")
-            r, g, b, a = pixel
-            if a == 0:
-                continue
-            level = alpha_texture.getpixel((x, y))
-            if not isinstance(level, int):
-                raise ValueError(f"Alpha mask image must be in grayscale (L) mode")
-            alpha = get_alpha_from_level(level)
-            img.putpixel((x, y), (r, g, b, alpha))
+    if alpha_texture.size != img.size:
+        alpha_texture = alpha_texture.crop((0, 0, img.width, img.height))
+
+    # Map the mask to alpha levels, and keep fully transparent pixels transparent
+    alpha = img.getchannel("A")
+    visible = alpha.point([0] + [255] * 255)
+    img.putalpha(ImageChops.darker(alpha_texture.point(ALPHA_LEVELS), visible))
     return img
 
 
+def get_balloon_texture(texture: Texture, alpha_texture: Texture) -> Texture:
+    return Texture(apply_alpha(texture.image, alpha_texture.image))
+
+
 def create_balloon_models(ctx: Context) -> None:
+    texture_cache = ctx.inject(TextureCache)
+
+    paths = []
+    jobs = []
+
+    def add_balloon_texture(texture: str, alpha_texture: Texture) -> None:
+        # Jobs run in parallel, so each of them gets its own copy of the alpha mask
+        balloon_texture = ctx.assets.textures[texture]
+        key = texture_cache.get_key(
+            "balloon", ALPHA_LEVELS, balloon_texture, alpha_texture
+        )
+        paths.append(texture)
+        jobs.append((key, get_balloon_texture, (balloon_texture, alpha_texture.copy())))
 
     # Apply alpha to the note block balloon texture
-    balloon_texture = ctx.assets.textures["nbs:item/balloons/balloon_nbs"].image
-    alpha_texture = ctx.assets.textures["nbs:item/balloons/balloon_nbs_alpha"].image
-    balloon_texture = apply_alpha(balloon_texture, alpha_texture)
-    ctx.assets.textures["nbs:item/balloons/balloon_nbs"] = Texture(balloon_texture)
-    del ctx.assets.textures["nbs:item/balloons/balloon_nbs_alpha"]
+    add_balloon_texture(
+        "nbs:item/balloons/balloon_nbs",
+        ctx.assets.textures["nbs:item/balloons/balloon_nbs_alpha"],
+    )
 
     balloon_variants = filter(
         lambda name: name.startswith("nbs:item/balloons/balloon_note"),
@@ -238,15 +314,115 @@ def create_balloon_models(ctx: Context) -> None:
         models_cmd[filename] = i + 300
 
         # Apply alpha to the balloon texture
-        balloon_texture = ctx.assets.textures[texture].image
-        alpha_texture = ctx.assets.textures[
-            "nbs:item/balloons/balloon_note_alpha"
-        ].image
-        balloon_texture = apply_alpha(balloon_texture, alpha_texture)
-        ctx.assets.textures[texture] = Texture(balloon_texture)
+        add_balloon_texture(
+            texture, ctx.assets.textures["nbs:item/balloons/balloon_note_alpha"]
+        )
+
+    for path, texture in zip(paths, texture_cache.derive_all(jobs)):
+        ctx.assets.textures[path] = texture
+
+    del ctx.assets.textures["nbs:item/balloons/balloon_nbs_alpha"]
     del ctx.assets.textures["nbs:item/balloons/balloon_note_alpha"]
 
 
+def get_pack_size(ctx: Context) -> tuple[int, int]:
+    """Return the number of files in the resource pack, and their size in bytes."""
+    files = [file for _, file in ctx.assets.list_files()]
+    return len(files), sum(len(get_file_bytes(file)) for file in files)
+
+
+def get_file_bytes(file: Any) -> bytes:
+    if file.source_path:
+        return Path(file.source_path).read_bytes()
+    raw = file.ensure_serialized()
+    return raw.encode() if isinstance(raw, str) else raw
+
+
+def create_atlases(ctx: Context) -> None:
+    """
+    Pack the note sign and balloon variants in shared sheets, and merge the scroll
+    panels into a single animation. The models that use them point to the sheets
+    instead, with their uvs moved to the area of each texture.
+    """
+
+    texture_cache = ctx.inject(TextureCache)
+    files_before, size_before = get_pack_size(ctx)
+
+    # Texture path -> (sheet, area of the texture in the sheet)
+    boxes = {}
+    sheets = [SCROLL_PANEL_ATLAS]
+
+    for sheet, pattern in atlases.items():
+        paths = sorted(path for path in ctx.assets.textures if fnmatch(path, pattern))
+        if not paths:
+            continue
+
+        textures = [ctx.assets.textures[path] for path in paths]
+        sizes = [get_texture_size(texture) for texture in textures]
+
+        key = texture_cache.get_key("atlas", sizes, *textures)
+        ctx.assets.textures[sheet] = texture_cache.derive(
+            key, get_atlas_texture, *textures
+        )
+        sheets.append(sheet)
+
+        for path, box in zip(paths, get_atlas_boxes(sizes)):
+            boxes[path] = (sheet, box)
+
+    # The scroll panels share a texture, and only differ by the frames of their mcmeta
+    panels = [f"nbs:block/scroll_panel_{i}" for i in range(1, SCROLL_PANEL_COUNT + 1)]
+    strip = ctx.assets.textures[panels[0]]
+    tile_size, _ = get_texture_size(strip)
+
+    params = (SCROLL_FACTOR, SCROLL_PANEL_COUNT)
+    key = texture_cache.get_key("scroll_atlas", params, strip)
+    ctx.assets.textures[SCROLL_PANEL_ATLAS] = texture_cache.derive(
+        key, get_scrolling_atlas_texture, strip, SCROLL_FACTOR, SCROLL_PANEL_COUNT
+    )
+    ctx.assets.textures_mcmeta[SCROLL_PANEL_ATLAS] = TextureMcmeta(
+        {
+            "animation": {
+                "interpolate": False,
+                "frametime": 1,
+                "width": tile_size * SCROLL_PANEL_COUNT,
+                "height": tile_size,
+            }
+        }
+    )
+
+    for i, path in enumerate(panels):
+        box = (i / SCROLL_PANEL_COUNT, 0, (i + 1) / SCROLL_PANEL_COUNT, 1)
+        boxes[path] = (SCROLL_PANEL_ATLAS, box)
+        del ctx.assets.textures_mcmeta[path]
+
+    # Only the models that use packed textures are parsed, so that the others keep
+    # their original formatting. The rewritten ones are minified, as they get a copy
+    # of the elements of their parent.
+    for path, model in list(ctx.assets.models.items()):
+        if not any(texture in model.text for texture in boxes):
+            continue
+
+        data = json.loads(model.text)
+        parent = data.get("parent", "")
+        if parent in ctx.assets.models:
+            parent = json.loads(ctx.assets.models[parent].text)
+        else:
+            parent = None
+
+        if remap_model(data, parent, boxes):
+            ctx.assets.models[path] = Model(json.dumps(data, separators=(",", ":")))
+
+    for path in boxes:
+        del ctx.assets.textures[path]
+
+    files_after, size_after = get_pack_size(ctx)
+    print(
+        f"atlas: packed {len(boxes)} textures in {len(sheets)} sheets, "
+        f"the resource pack went from {files_before} files ({size_before} bytes) "
+        f"to {files_after} files ({size_after} bytes)"
+    )
+
+
 def beet_default(ctx: Context):
     create_note_models(ctx)
     create_monitor_models(ctx)
@@ -261,3 +437,10 @@ def beet_default(ctx: Context):
 
     generate_scrolling_animation(ctx)
     apply_emissive_textures(ctx)
+
+    if ctx.meta.get("nbs", {}).get("atlas", False):
+        create_atlases(ctx)
+
+    texture_cache = ctx.inject(TextureCache)
+    texture_cache.prune()
+    print(texture_cache.report())
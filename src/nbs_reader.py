@@ -0,0 +1,166 @@
+__all__ = [
+    "NbsReader",
+]
+
+
+import mmap
+from pathlib import Path
+from struct import Struct
+from typing import Iterator, List
+
+import pynbs
+
+BYTE = Struct("<B")
+SHORT = Struct("<H")
+INT = Struct("<I")
+
+# Instrument and key, then velocity, panning and pitch since version 4
+NOTE_V0 = Struct("<BB")
+NOTE_V4 = Struct("<BBBBh")
+
+
+class NbsReader:
+    """
+    Reads an .nbs file in place, through a read-only memory map.
+
+    The header, layers and custom instruments are decoded when the file is opened, like
+    `pynbs.read` does, but note records are only decoded by `iter_notes`, one at a time,
+    so the notes of the song never need to be held in memory all at once. Can be passed
+    to `get_notes` in place of a `pynbs.File`. This is the only .nbs parser of the
+    project, and is also used by `songs/list_songs.py` to catalog songs.
+    """
+
+    def __init__(self, path: Path | str):
+        with open(path, "rb") as f:
+            self.map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self.view = memoryview(self.map)
+        self.offset = 0
+
+        self.header = self.read_header()
+        self.notes_offset = self.offset
+        self.note_count = self.skip_notes()
+        self.layers = self.read_layers()
+        self.instruments = self.read_instruments()
+
+    def __enter__(self) -> "NbsReader":
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def close(self):
+        # The view has to be released before the map can be closed
+        self.view.release()
+        self.map.close()
+
+    def read_numeric(self, fmt: Struct) -> int:
+        value = fmt.unpack_from(self.view, self.offset)[0]
+        self.offset += fmt.size
+        return value
+
+    def read_string(self) -> str:
+        length = self.read_numeric(INT)
+        value = self.view[self.offset : self.offset + length].tobytes()
+        self.offset += length
+        return value.decode(encoding="cp1252")
+
+    def read_header(self) -> pynbs.Header:
+        song_length = self.read_numeric(SHORT)
+        version = self.read_numeric(BYTE) if song_length == 0 else 0
+
+        return pynbs.Header(
+            version=version,
+            default_instruments=self.read_numeric(BYTE) if version > 0 else 10,
+            song_length=self.read_numeric(SHORT) if version >= 3 else song_length,
+            song_layers=self.read_numeric(SHORT),
+            song_name=self.read_string(),
+            song_author=self.read_string(),
+            original_author=self.read_string(),
+            description=self.read_string(),
+            tempo=self.read_numeric(SHORT) / 100.0,
+            auto_save=self.read_numeric(BYTE) == 1,
+            auto_save_duration=self.read_numeric(BYTE),
+            time_signature=self.read_numeric(BYTE),
+            minutes_spent=self.read_numeric(INT),
+            left_clicks=self.read_numeric(INT),
+            right_clicks=self.read_numeric(INT),
+            blocks_added=self.read_numeric(INT),
+            blocks_removed=self.read_numeric(INT),
+            song_origin=self.read_string(),
+            loop=self.read_numeric(BYTE) == 1 if version >= 4 else False,
+            max_loop_count=self.read_numeric(BYTE) if version >= 4 else 0,
+            loop_start=self.read_numeric(SHORT) if version >= 4 else 0,
+        )
+
+    def skip_notes(self) -> int:
+        """Move past the note records, to the layers that follow them, counting them."""
+        note_size = (NOTE_V4 if self.header.version >= 4 else NOTE_V0).size
+        count = 0
+        while self.read_numeric(SHORT):
+            while self.read_numeric(SHORT):
+                self.offset += note_size
+                count += 1
+        return count
+
+    def read_layers(self) -> List[pynbs.Layer]:
+        version = self.header.version
+        return [
+            pynbs.Layer(
+                id=i,
+                name=self.read_string(),
+                lock=self.read_numeric(BYTE) == 1 if version >= 4 else False,
+                volume=self.read_numeric(BYTE),
+                panning=self.read_numeric(BYTE) - 100 if version >= 2 else 0,
+            )
+            for i in range(self.header.song_layers)
+        ]
+
+    def read_instruments(self) -> List[pynbs.Instrument]:
+        return [
+            pynbs.Instrument(
+                id=i,
+                name=self.read_string(),
+                file=self.read_string(),
+                pitch=self.read_numeric(BYTE),
+                press_key=self.read_numeric(BYTE) == 1,
+            )
+            for i in range(self.read_numeric(BYTE))
+        ]
+
+    def iter_notes(self) -> Iterator[pynbs.Note]:
+        """Decode the note records, in the order of the file (by tick, then layer)."""
+
+        view = self.view
+        offset = self.notes_offset
+        unpack_short = SHORT.unpack_from
+        v4 = self.header.version >= 4
+        unpack_note = (NOTE_V4 if v4 else NOTE_V0).unpack_from
+        note_size = (NOTE_V4 if v4 else NOTE_V0).size
+
+        tick = -1
+        while True:
+            (jump,) = unpack_short(view, offset)
+            offset += SHORT.size
+            if not jump:
+                return
+            tick += jump
+
+            layer = -1
+            while True:
+                (jump,) = unpack_short(view, offset)
+                offset += SHORT.size
+                if not jump:
+                    break
+                layer += jump
+
+                if v4:
+                    instrument, key, velocity, pan, pitch = unpack_note(view, offset)
+                    note = pynbs.Note(
+                        tick, layer, instrument, key, velocity, pan - 100, pitch
+                    )
+                else:
+                    instrument, key = unpack_note(view, offset)
+                    note = pynbs.Note(tick, layer, instrument, key)
+                offset += note_size
+
+                yield note
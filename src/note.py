@@ -1,13 +1,24 @@
 __all__ = [
     "Note",
+    "NoteRow",
+    "NoteTable",
+    "get_bucket_radius",
     "get_notes",
     "get_pitch",
+    "get_rolloff_bucket",
+    "get_rolloff_tag",
+    "limit_polyphony",
+    "merge_notes",
+    "render_note",
 ]
 
 
+import heapq
 import math
+from array import array
 from dataclasses import dataclass
-from typing import Any, Iterator, List, Tuple
+from functools import lru_cache
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Tuple
 
 import pynbs
 
@@ -30,6 +41,13 @@ NBS_DEFAULT_INSTRUMENTS = [
     "block.note_block.pling",
 ]
 
+# Layer of the special notes that mark the beats
+BEAT_LAYER = 150
+
+# Range of the `distance` radius of `Note.play_speakers`, for the highest to the
+# lowest notes, split into evenly spaced buckets by `get_rolloff_bucket`
+SPEAKER_RADII = (6, 12)
+
 octaves = {
     "harp": 0,
     "bass": -2,
@@ -60,9 +78,13 @@ class Note:
     pitch: float = 1
     panning: float = 0
 
-    def play_speakers(self, stereo_separation: float = 4) -> str:
+    def play_speakers(
+        self, stereo_separation: float = 4, rolloff_buckets: int = 0
+    ) -> str:
         """
-        Play a sound that can be heard in a small radius by all players in range.
+        Play a sound that can be heard in a small radius by all players in range. With
+        `rolloff_buckets`, the players in range are the ones tagged for the bucket of
+        the radius (see `get_rolloff_tag`), instead of a `distance` check.
         """
 
         # This is achieved by bypassing the `volume` argument completely and instead using the
@@ -86,6 +108,20 @@ class Note:
         # decay/rolloff than using volume, but is necessary to achieve rolloff with a ranger smaller
         # than 16 blocks.
 
+        radius = self.get_speaker_radius()
+
+        stereo_offset = self.panning * stereo_separation // 2
+        position = f"^{stereo_offset} ^ ^"
+
+        if rolloff_buckets:
+            tag = get_rolloff_tag(get_rolloff_bucket(radius, rolloff_buckets))
+            return self.play(tag=tag, position=position, volume=self.volume)
+
+        return self.play(radius=radius, position=position, volume=self.volume)
+
+    def get_speaker_radius(self) -> float:
+        """Return the range of the note when played by a speaker."""
+
         def rolloff_curve(x: float) -> float:
             # slope  = -6   -> make curve steeper towards the center and mirror it in the x axis
             # offset = -0.5 -> move the curve down so its center is at y=0
@@ -95,12 +131,7 @@ class Note:
 
             return sigmoid(x, -6, -0.5, 6)
 
-        radius = 9 + rolloff_curve(self.radius)
-
-        stereo_offset = self.panning * stereo_separation // 2
-        position = f"^{stereo_offset} ^ ^"
-
-        return self.play(radius=radius, position=position, volume=self.volume)
+        return 9 + rolloff_curve(self.radius)
 
     def play_loudspeakers(self, stereo_separation: float = 8) -> str:
         """
@@ -190,71 +221,255 @@ class Note:
         return args
 
 
-def get_notes(song: pynbs.File) -> Iterator[Tuple[int, List["Note"]]]:
-    """Yield all the notes from the given nbs file."""
+# Maximum number of rendered /playsound commands kept in memory
+RENDER_CACHE_SIZE = 8192
+
+
+@lru_cache(maxsize=RENDER_CACHE_SIZE)
+def render_cached(
+    mode: str,
+    instrument: str,
+    volume: float,
+    radius: float,
+    pitch: float,
+    panning: float,
+    rolloff_buckets: int = 0,
+) -> str:
+    """Memoized version of `Note.play_<mode>`, keyed on the note's rounded values."""
+    note = Note(instrument, volume, radius, pitch, panning)
+    if rolloff_buckets:
+        return note.play_speakers(rolloff_buckets=rolloff_buckets)
+    return getattr(note, f"play_{mode}")()
+
+
+def render_note(note: Any, mode: str, rolloff_buckets: int = 0) -> str:
+    """
+    Return the /playsound arguments of a note for the given listener mode
+    (`speakers`, `loudspeakers` or `headphones`), going through the render cache.
+    `rolloff_buckets` only applies to speakers.
+    """
+
+    # Values that are only formatted are rounded to the precision they're printed
+    # with, so they can share a cache entry without changing the output. The others
+    # go through further arithmetic, so they're kept as-is. The radius doesn't
+    # affect headphones at all.
+    pitch = round(note.pitch, 5)
+
+    if mode == "speakers":
+        key = (round(note.volume, 3), note.radius, pitch)
+    elif mode == "loudspeakers":
+        key = (note.volume, note.radius, pitch)
+    else:
+        key = (round(note.volume, 3), 0, pitch)
+
+    if mode != "speakers":
+        rolloff_buckets = 0
+
+    return render_cached(mode, note.instrument, *key, note.panning, rolloff_buckets)
+
+
+def get_rolloff_bucket(radius: float, buckets: int) -> int:
+    """Return the index of the bucket whose radius is the closest to the given one."""
+
+    if buckets <= 1:
+        return 0
+
+    low, high = SPEAKER_RADII
+    bucket = round((radius - low) / (high - low) * (buckets - 1))
+    return min(max(bucket, 0), buckets - 1)
+
+
+def get_bucket_radius(bucket: int, buckets: int) -> float:
+    """Return the radius shared by the notes of a bucket."""
+
+    low, high = SPEAKER_RADII
+    if buckets <= 1:
+        return (low + high) / 2
+    return low + (high - low) * bucket / (buckets - 1)
+
+
+def get_rolloff_tag(bucket: int) -> str:
+    """Return the tag of the players in range of the notes of a bucket."""
+    return f"nbs_rolloff_{bucket}"
+
+
+class NoteRow:
+    """Lightweight view of a row of a `NoteTable`, with the same interface as `Note`."""
+
+    __slots__ = ("table", "index")
+
+    def __init__(self, table: "NoteTable", index: int):
+        self.table = table
+        self.index = index
+
+    @property
+    def instrument(self) -> str:
+        return self.table.sources[self.table.instrument[self.index]]
+
+    @property
+    def volume(self) -> float:
+        return self.table.volume[self.index]
+
+    @property
+    def radius(self) -> float:
+        return self.table.radius[self.index]
+
+    @property
+    def pitch(self) -> float:
+        return self.table.pitch[self.index]
+
+    @property
+    def panning(self) -> float:
+        return self.table.panning[self.index]
+
+    play_speakers = Note.play_speakers
+    get_speaker_radius = Note.get_speaker_radius
+    play_loudspeakers = Note.play_loudspeakers
+    play_headphones = Note.play_headphones
+    play = Note.play
+
+    def to_note(self) -> Note:
+        """Return a standalone copy of the note."""
+        return Note(
+            instrument=self.instrument,
+            volume=self.volume,
+            radius=self.radius,
+            pitch=self.pitch,
+            panning=self.panning,
+        )
+
+
+class NoteTable:
+    """
+    Columnar storage of the notes of a song, grouped in chords.
+
+    Each note is a row spread across typed arrays, and instruments are stored as
+    indices into `sources`. Chords are described by the `ticks`, `starts` and `ends`
+    arrays, in the order they should be played, so notes only become objects (as
+    `NoteRow` views) while a chord is being iterated.
+    """
+
+    __slots__ = (
+        "sources",
+        "source_index",
+        "instrument",
+        "volume",
+        "radius",
+        "pitch",
+        "panning",
+        "ticks",
+        "starts",
+        "ends",
+    )
+
+    def __init__(self, sources: Iterable[str] = ()):
+        self.sources: List[str] = list(sources)
+        self.source_index = {source: i for i, source in enumerate(self.sources)}
+        self.instrument = array("I")
+        self.volume = array("d")
+        self.radius = array("d")
+        self.pitch = array("d")
+        self.panning = array("d")
+        self.ticks = array("q")
+        self.starts = array("Q")
+        self.ends = array("Q")
+
+    def __len__(self) -> int:
+        return len(self.volume)
+
+    def __getitem__(self, index: int) -> NoteRow:
+        return NoteRow(self, index)
+
+    def get_source(self, source: str) -> int:
+        """Return the index of the given sound source, registering it if needed."""
+        if (index := self.source_index.get(source)) is None:
+            index = self.source_index[source] = len(self.sources)
+            self.sources.append(source)
+        return index
+
+    def add_chord(self, tick: int, notes: Iterable[Any]) -> None:
+        """Append a chord made of `Note`-like objects."""
+        start = len(self)
+        for note in notes:
+            self.instrument.append(self.get_source(note.instrument))
+            self.volume.append(note.volume)
+            self.radius.append(note.radius)
+            self.pitch.append(note.pitch)
+            self.panning.append(note.panning)
+        self.ticks.append(tick)
+        self.starts.append(start)
+        self.ends.append(len(self))
+
+    @classmethod
+    def from_chords(cls, chords: Iterable[Tuple[int, Iterable[Any]]]) -> "NoteTable":
+        """Build a table from the output of `get_notes`."""
+        table = cls()
+        for tick, notes in chords:
+            table.add_chord(tick, notes)
+        return table
+
+    def chords(self) -> Iterator[Tuple[int, List[NoteRow]]]:
+        """Yield each tick along with views of the notes in its chord."""
+        for tick, start, end in zip(self.ticks, self.starts, self.ends):
+            yield tick, [NoteRow(self, index) for index in range(start, end)]
+
+
+def get_notes(song: Any) -> Iterator[Tuple[int, List["Note"]]]:
+    """
+    Yield all the notes from the given nbs file, either a `pynbs.File` or an
+    `NbsReader`. Notes are quantized and filtered as they're read, and chords are built
+    one at a time, so the song is left untouched and an `NbsReader` never has more
+    than a chord of notes in memory.
+    """
 
     # Quantize notes to nearest tick (pigstep always exports at 20 t/s)
     # Remove vanilla instrument notes outside the 6-octave range
     # Remove custom instrument notes outside the 2-octave range
 
-    new_notes = []
+    header = song.header
 
-    # Add special notes to mark the beats
-    # (we'll quantize the song afterwards so doing it later on would be out of sync)
-    for tick in range(0, song.header.song_length, 4):
-        song.notes.append(
-            pynbs.Note(
-                tick=tick,
-                layer=150,
-                key=45,
-                instrument=-1,
-            )
-        )
+    def quantize(tick: int) -> int:
+        return round(tick * 20 / header.tempo)
 
-    for note in song.notes:
-        new_tick = round(note.tick * 20 / song.header.tempo)
-        note.tick = new_tick
+    def is_playable(note: pynbs.Note) -> bool:
         note_pitch = note.key + note.pitch / 100
-        is_custom_instrument = note.instrument >= song.header.default_instruments
-        is_2_octave = 33 <= note_pitch <= 57
-        is_6_octave = 9 <= note_pitch <= 81
-
-        if is_custom_instrument and not is_2_octave:
-            # print(
-            #    f"Warning: Custom instrument out of 2-octave range at {note.tick},{note.layer}: {note_pitch}"
-            # )
-            continue
+        if note.instrument >= header.default_instruments:
+            return 33 <= note_pitch <= 57
+        return 9 <= note_pitch <= 81
 
-        if not is_custom_instrument and not is_6_octave:
-            # print(
-            #    f"Warning: Vanilla instrument out of 6-octave range at {note.tick},{note.layer}: {note_pitch}"
-            # )
-            continue
+    def iter_notes() -> Iterator[pynbs.Note]:
+        if hasattr(song, "iter_notes"):
+            return song.iter_notes()
+        return iter(sorted(song.notes, key=lambda note: note.tick))
 
-        new_notes.append(note)
-
-    song.notes = new_notes
+    # Add special notes to mark the beats
+    # (they're quantized along with the song so they stay in sync)
+    def iter_beats() -> Iterator[pynbs.Note]:
+        for tick in range(0, header.song_length, 4):
+            yield pynbs.Note(tick=tick, layer=BEAT_LAYER, key=45, instrument=-1)
 
-    # Ensure that there are as many layers as the last layer with a note
-    max_layer = max(note.layer for note in song.notes)
-    while len(song.layers) <= max_layer:
-        song.layers.append(pynbs.Layer(id=len(song.layers)))
+    # Layers past the last one in the song have the default volume and panning
+    default_layer = pynbs.Layer(id=len(song.layers))
 
     # Make sure instrument paths are valid
+    instrument_files = []
     for instrument in song.instruments:
-        instrument.file = instrument.file.lower().replace(" ", "_")
-        if not instrument.file.startswith("minecraft/"):
-            print(f"Warning: Invalid instrument path: {instrument.file}")
+        file = instrument.file.lower().replace(" ", "_")
+        if not file.startswith("minecraft/"):
+            print(f"Warning: Invalid instrument path: {file}")
+        instrument_files.append(file)
 
     sounds = NBS_DEFAULT_INSTRUMENTS + [
-        instrument.file.replace("minecraft/", "").replace(".ogg", "")
-        for instrument in song.instruments
+        file.replace("minecraft/", "").replace(".ogg", "") for file in instrument_files
     ]
 
     def get_note(note: pynbs.Note) -> Note:
         """Get an intermediary note for /playsound based on a pynbs note."""
 
-        layer = song.layers[note.layer]
+        if note.layer < len(song.layers):
+            layer = song.layers[note.layer]
+        else:
+            layer = default_layer
 
         sound = sounds[note.instrument] if note.instrument >= 0 else "BEAT"
         pitch = note.key + (note.pitch / 100)
@@ -278,18 +493,124 @@ def get_notes(song: pynbs.File) -> Iterator[Tuple[int, List["Note"]]]:
             pitch=pitch,
         )
 
-    output = {}
+    def iter_chords(
+        include: Callable[[int], bool],
+    ) -> Iterator[Tuple[int, List[Note]]]:
+        """Yield the chords whose tick is included, in tick order."""
+
+        # Beats come after the notes of the song at the same tick, and chords are
+        # sorted by layer (this is the order pynbs iterates the notes in)
+        merged = heapq.merge(iter_notes(), iter_beats(), key=lambda note: note.tick)
+        chord: List[Tuple[int, bool, pynbs.Note]] = []
+        # Quantized ticks are never negative, so the first note always starts a chord
+        current_tick = -1
+
+        for note in merged:
+            tick = quantize(note.tick)
+            if tick != current_tick:
+                if chord:
+                    chord.sort(key=lambda entry: entry[:2])
+                    yield current_tick, [get_note(note) for _, _, note in chord]
+                chord = []
+                current_tick = tick
+            if include(tick) and is_playable(note):
+                chord.append((note.layer, note.instrument == -1, note))
+
+        if chord:
+            # pynbs doesn't sort the last chord of the song by layer
+            chord.sort(key=lambda entry: entry[1])
+            yield current_tick, [get_note(note) for _, _, note in chord]
+
+    # Every 8th tick is emitted first, even when it's empty. The tick of the first
+    # note of the song follows (pynbs registers it before the others), then the
+    # remaining ticks in order. Each group is read from the song separately, so that
+    # the chords don't have to be held until they're due.
+    empty_ticks = range(0, header.song_length, 8)
+
+    first_tick = next(
+        (quantize(note.tick) for note in iter_notes() if is_playable(note)), None
+    )
+    if first_tick is None:
+        first_tick = next(
+            (quantize(note.tick) for note in iter_beats() if is_playable(note)), None
+        )
+
+    chords = iter_chords(lambda tick: tick in empty_ticks)
+    chord = next(chords, None)
+    for tick in empty_ticks:
+        if chord is not None and chord[0] == tick:
+            yield chord
+            chord = next(chords, None)
+        else:
+            yield tick, []
+
+    if first_tick is not None and first_tick not in empty_ticks:
+        yield from iter_chords(lambda tick: tick == first_tick)
+
+    yield from iter_chords(lambda tick: tick not in empty_ticks and tick != first_tick)
+
+
+def merge_notes(notes: List[Any], panning_step: float = 0.25) -> List[Any]:
+    """
+    Merge the notes of a chord that play the same sound at the same pitch, with their
+    panning in the same bucket of `panning_step` width.
+    """
+
+    # Playing the same sound several times on the same tick only makes it louder, so a
+    # single note with the combined volume sounds the same. Volume is capped at 1, the
+    # same way `Note.play` caps `min_volume`, as higher values would extend the range of
+    # the sound rather than make it louder. The merged note keeps the panning of its
+    # loudest note. Notes that aren't merged are returned untouched.
+
+    groups: Dict[Tuple[Any, ...], List[Any]] = {}
+
+    for i, note in enumerate(notes):
+        if note.instrument == "BEAT":
+            # Beat markers are never merged
+            key: Tuple[Any, ...] = ("BEAT", i)
+        else:
+            key = (note.instrument, note.pitch, math.floor(note.panning / panning_step))
+        groups.setdefault(key, []).append(note)
+
+    merged = []
+
+    for group in groups.values():
+        if len(group) == 1:
+            merged.append(group[0])
+            continue
+
+        loudest = max(group, key=lambda note: note.volume)
+        merged.append(
+            Note(
+                instrument=loudest.instrument,
+                volume=min(sum(note.volume for note in group), 1),
+                radius=loudest.radius,
+                pitch=loudest.pitch,
+                panning=loudest.panning,
+            )
+        )
+
+    return merged
+
+
+def limit_polyphony(notes: List[Any], limit: int) -> List[Any]:
+    """
+    Keep at most `limit` notes in a chord, dropping the least audible ones: the quietest
+    first, then the ones heard from the shortest distance (the highest ones, see
+    `Note.get_speaker_radius`). Beat markers don't count towards the limit, and the
+    kept notes stay in their original order.
+    """
 
-    for tick in range(0, song.header.song_length, 8):
-        output[tick] = []
+    playable = [i for i, note in enumerate(notes) if note.instrument != "BEAT"]
+    if len(playable) <= limit:
+        return notes
 
-    for tick, chord in song:
-        if tick not in output:
-            output[tick] = []
-        output[tick].extend(get_note(note) for note in chord)
+    ranked = sorted(
+        playable, key=lambda i: (-notes[i].volume, -notes[i].get_speaker_radius())
+    )
+    dropped = set(ranked[limit:])
 
-    for tick, notes in output.items():
-        yield tick, notes
+    return [note for i, note in enumerate(notes) if i not in dropped]
 
 
 def get_panning(note: Any, layer: Any) -> float:
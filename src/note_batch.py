@@ -0,0 +1,171 @@
+__all__ = [
+    "get_note_table",
+    "get_notes_batch",
+    "load_note_arrays",
+]
+
+
+from array import array
+from typing import Dict, Iterator, List, Tuple
+
+import numpy as np
+import pynbs
+
+from src.note import BEAT_LAYER, NBS_DEFAULT_INSTRUMENTS, Note, NoteTable, octaves
+
+
+def load_note_arrays(song: pynbs.File) -> Dict[str, np.ndarray]:
+    """Load the notes of a song into arrays, including the notes that mark the beats."""
+
+    beat_ticks = np.arange(0, song.header.song_length, 4, dtype=np.int64)
+
+    def column(attribute: str, beat_values: int | np.ndarray) -> np.ndarray:
+        values = np.fromiter(
+            (getattr(note, attribute) for note in song.notes),
+            dtype=np.int64,
+            count=len(song.notes),
+        )
+        beats = np.broadcast_to(np.asarray(beat_values, np.int64), beat_ticks.shape)
+        return np.concatenate([values, beats])
+
+    return {
+        "tick": column("tick", beat_ticks),
+        "layer": column("layer", BEAT_LAYER),
+        "key": column("key", 45),
+        "pitch": column("pitch", 0),
+        "velocity": column("velocity", 100),
+        "panning": column("panning", 0),
+        "instrument": column("instrument", -1),
+    }
+
+
+def get_note_table(song: pynbs.File) -> NoteTable:
+    """
+    Return all the notes from the given nbs file as a `NoteTable`, computing every
+    transform on whole arrays at once. The chords are identical to the ones yielded by
+    `get_notes`, which remains the scalar reference implementation. Unlike
+    `get_notes`, the song is left untouched.
+    """
+
+    arrays = load_note_arrays(song)
+
+    # Quantize notes to nearest tick (pigstep always exports at 20 t/s)
+    ticks = np.round(arrays["tick"] * 20 / song.header.tempo).astype(np.int64)
+    last_tick = ticks.max(initial=0)
+
+    # Remove vanilla instrument notes outside the 6-octave range
+    # Remove custom instrument notes outside the 2-octave range
+    note_pitch = arrays["key"] + arrays["pitch"] / 100
+    is_custom_instrument = arrays["instrument"] >= song.header.default_instruments
+    is_2_octave = (33 <= note_pitch) & (note_pitch <= 57)
+    is_6_octave = (9 <= note_pitch) & (note_pitch <= 81)
+    keep = np.where(is_custom_instrument, is_2_octave, is_6_octave)
+
+    ticks = ticks[keep]
+    note_pitch = note_pitch[keep]
+    layers = arrays["layer"][keep]
+    velocities = arrays["velocity"][keep]
+    note_panning = arrays["panning"][keep]
+    instruments = arrays["instrument"][keep]
+
+    # Layers past the last one in the song have the default volume and panning
+    layer_count = max(len(song.layers), int(layers.max()) + 1)
+    layer_volume = np.full(layer_count, 100, np.int64)
+    layer_panning = np.zeros(layer_count, np.int64)
+    for i, layer in enumerate(song.layers):
+        layer_volume[i] = layer.volume
+        layer_panning[i] = layer.panning
+
+    # Make sure instrument paths are valid
+    instrument_files = []
+    for instrument in song.instruments:
+        file = instrument.file.lower().replace(" ", "_")
+        if not file.startswith("minecraft/"):
+            print(f"Warning: Invalid instrument path: {file}")
+        instrument_files.append(file)
+
+    # The last sound is used by the beat notes (instrument -1)
+    sounds = (
+        NBS_DEFAULT_INSTRUMENTS
+        + [
+            file.replace("minecraft/", "").replace(".ogg", "")
+            for file in instrument_files
+        ]
+        + ["BEAT"]
+    )
+    sound_index = np.where(instruments >= 0, instruments, len(sounds) - 1)
+
+    # Octave suffix: 0 = "", 1 = "_-1", 2 = "_1"
+    suffixes = ["", "_-1", "_1"]
+    suffix_index = np.select([note_pitch < 33, note_pitch > 57], [1, 2], 0)
+    source_table = [f"{sound}{suffix}" for sound in sounds for suffix in suffixes]
+    source_index = sound_index * len(suffixes) + suffix_index
+
+    volume = (layer_volume[layers] / 100) * (velocities / 100)
+
+    # Rolloff factor (see `get_rolloff_factor`)
+    sound_octaves = np.array(
+        [octaves.get(sound.split(".")[-1], 1) for sound in sounds], np.int64
+    )
+    real_pitch = note_pitch + 12 * sound_octaves[sound_index]
+    radius = (real_pitch - 45) / (45 - 8)
+
+    # Panning (see `get_panning`)
+    pan_layer = layer_panning[layers]
+    panning = (
+        np.where(pan_layer == 0, note_panning, (pan_layer + note_panning) / 2) / 100
+    )
+
+    # Pitch (see `get_pitch`). The power is evaluated once per distinct key with
+    # Python's own float arithmetic, so results match the scalar path bit for bit.
+    key = note_pitch - np.select([note_pitch < 33, note_pitch > 57], [9, 57], 33)
+    unique_keys, key_index = np.unique(key, return_inverse=True)
+    pitch_table = np.array([2 ** (k / 12) / 2 for k in unique_keys.tolist()])
+    pitch = pitch_table[key_index.reshape(-1)]
+
+    # Group notes in chords, by tick and then by layer (same order as pynbs). pynbs
+    # doesn't sort the last chord of the song by layer: its notes stay in file order,
+    # followed by the beats, which is the order they're loaded in.
+    order = np.lexsort((np.where(ticks == last_tick, 0, layers), ticks))
+    sorted_ticks = ticks[order]
+
+    def to_array(values: np.ndarray, typecode: str) -> array:
+        return array(typecode, values[order].astype(typecode).tobytes())
+
+    table = NoteTable(source_table)
+    table.instrument = to_array(source_index, "I")
+    table.volume = to_array(volume, "d")
+    table.radius = to_array(radius, "d")
+    table.pitch = to_array(pitch, "d")
+    table.panning = to_array(panning, "d")
+
+    chord_ticks, chord_starts = np.unique(sorted_ticks, return_index=True)
+    chord_ends = np.append(chord_starts[1:], len(sorted_ticks))
+    chord_spans = dict(
+        zip(chord_ticks.tolist(), zip(chord_starts.tolist(), chord_ends.tolist()))
+    )
+
+    output: Dict[int, Tuple[int, int]] = {}
+
+    for tick in range(0, song.header.song_length, 8):
+        output[tick] = (0, 0)
+
+    if len(ticks):
+        # pynbs starts chords at the tick of the first note in the list rather than
+        # the earliest one, which registers that tick before the others
+        output.setdefault(int(ticks[0]), (0, 0))
+
+    for tick, span in chord_spans.items():
+        output[tick] = span
+
+    table.ticks = array("q", output.keys())
+    table.starts = array("Q", (start for start, _ in output.values()))
+    table.ends = array("Q", (end for _, end in output.values()))
+
+    return table
+
+
+def get_notes_batch(song: pynbs.File) -> Iterator[Tuple[int, List[Note]]]:
+    """Yield all the notes from the given nbs file, like `get_notes` does."""
+    for tick, chord in get_note_table(song).chords():
+        yield tick, [row.to_note() for row in chord]
@@ -0,0 +1,246 @@
+__all__ = [
+    "ITER_COMMANDS",
+    "ITER_MACROS",
+    "Listeners",
+    "RuntimeCost",
+    "SongCost",
+    "TickCost",
+    "get_song_costs",
+    "get_tick_cost",
+]
+
+
+import math
+import re
+from dataclasses import dataclass, field
+from typing import Any, Dict, List
+
+from beet import Context, ErrorMessage
+
+# Commands run by a single `speaker_iter` (or `chord_iter`) iteration: the uuid lookup,
+# the call to the `uuid` helper, the counter increment and the recursion check. The
+# `uuid` helper runs one more command, and both functions are macros.
+ITER_COMMANDS = 4 + 1
+ITER_MACROS = 2
+
+# Iteration helpers of `src/global.bolt`, with the functions each one calls per speaker
+ITER_FUNCTIONS = {
+    "nbs:global/speaker_iter": "nbs:song/{song}/{tick}/{speaker_type}",
+    "nbs:global/chord_iter": "nbs:chord/{chord}/{speaker_type}",
+}
+
+# Tags selected by the tag dispatch, and by the headphones command of every dispatch
+LISTENER_TAGS = {
+    "nbs_speaker": "speaker",
+    "nbs_loudspeaker": "loudspeaker",
+    "nbs_headphones": "headphones",
+}
+
+# Options of `meta.nbs` with the number of listeners of each mode
+LISTENER_OPTIONS = {
+    "speaker": "speakers",
+    "loudspeaker": "loudspeakers",
+    "headphones": "headphones",
+}
+
+TICK_FUNCTION = re.compile(r"nbs:song/(?P<song>.+)/(?P<tick>\d+)/root")
+STORAGE_VALUE = re.compile(
+    r'data modify storage nbs:temp input\.(\w+) set value "?([^"]*)"?'
+)
+RUN_FUNCTION = re.compile(
+    r"execute (?:if score #channel nbs matches \d+ )?as @\w\[[^\]]*tag=(\w+)[^\]]*\] "
+    r".*run function (\S+)"
+)
+ITER_FUNCTION = re.compile(r"function (\S+) with storage nbs:temp input")
+NOTES_PLAYED = re.compile(r"scoreboard players add notes_played nbs_stats (\d+)$")
+
+
+@dataclass(frozen=True)
+class Listeners:
+    """Number of speakers of each kind and of headphone users to work out costs for."""
+
+    speaker: int = 2
+    loudspeaker: int = 1
+    headphones: int = 8
+
+    @classmethod
+    def from_meta(cls, meta: Dict[str, Any]) -> "Listeners":
+        return cls(
+            **{mode: meta[key] for mode, key in LISTENER_OPTIONS.items() if key in meta}
+        )
+
+
+@dataclass
+class TickCost:
+    """Commands run by the server to play one tick of a song."""
+
+    tick: int
+    notes: int = 0
+    commands: int = 0
+    macros: int = 0
+
+
+@dataclass
+class SongCost:
+    """Cost of every tick of a song, in the order they're played."""
+
+    name: str
+    ticks: List[TickCost] = field(default_factory=list)
+
+    @property
+    def worst(self) -> TickCost:
+        return max(self.ticks, key=lambda tick: tick.commands)
+
+    def percentile(self, percent: float) -> int:
+        """Return the commands of the tick at the given percentile (nearest rank)."""
+        commands = sorted(tick.commands for tick in self.ticks)
+        return commands[max(math.ceil(percent / 100 * len(commands)) - 1, 0)]
+
+    @property
+    def mean(self) -> float:
+        return sum(tick.commands for tick in self.ticks) / len(self.ticks)
+
+
+class RuntimeCost:
+    """
+    Static estimate of the commands the server runs to play each tick of every song.
+
+    The tick functions of each song are walked as they're added to the data pack, from
+    `nbs:song/<name>/<tick>/root` down to the functions of each listener mode, whether
+    they're called through `speaker_iter`, `chord_iter` or a tagged selector. Each call
+    is multiplied by the number of listeners assumed by `speakers`, `loudspeakers` and
+    `headphones` in `meta.nbs`, with the overhead of the macro iteration included. The
+    notes of each tick are read from the `notes_played` statistic of its root function.
+
+    Songs whose worst tick goes over `tick_budget` commands are reported, and fail the
+    build when `over_budget` is set to "fail". The functions of the global tick loop
+    run on every tick regardless of the song, and aren't counted.
+    """
+
+    def __init__(self, ctx: Context):
+        self.ctx = ctx
+        opts = ctx.meta.get("nbs", {})
+        self.listeners = Listeners.from_meta(opts)
+        self.budget = opts.get("tick_budget", 0)
+        self.over_budget = opts.get("over_budget", "warn")
+        self.songs: Dict[str, SongCost] = {}
+
+    def add(self, song_name: str, functions: Dict[str, str]) -> SongCost:
+        """Work out the cost of each tick from the text of the functions of a song."""
+
+        songs = get_song_costs(song_name, functions, self.listeners)
+        self.songs.update(songs)
+        return songs[song_name]
+
+    def report(self) -> List[str]:
+        """Return a line per song with its notes and commands per tick."""
+
+        listeners = self.listeners
+        lines = [
+            f"runtime cost for {listeners.speaker} speaker(s), "
+            f"{listeners.loudspeaker} loudspeaker(s) and "
+            f"{listeners.headphones} headphone user(s), in commands per tick:",
+            f"{'song':<24} {'ticks':>6} {'notes':>7} {'mean':>8} {'p99':>8} "
+            f"{'worst':>8} {'at tick':>8} {'macros':>7}",
+        ]
+
+        for song in self.songs.values():
+            if not song.ticks:
+                continue
+            worst = song.worst
+            lines.append(
+                f"{song.name:<24} {len(song.ticks):>6} "
+                f"{sum(tick.notes for tick in song.ticks):>7} {song.mean:>8.1f} "
+                f"{song.percentile(99):>8} {worst.commands:>8} {worst.tick:>8} "
+                f"{worst.macros:>7}"
+            )
+
+        return lines
+
+    def check_budget(self):
+        """Warn about, or fail on, the songs whose worst tick is over the budget."""
+
+        if not self.budget:
+            return
+
+        over = [
+            f"{song.name} runs {song.worst.commands} commands at tick "
+            f"{song.worst.tick} ({song.worst.notes} notes)"
+            for song in self.songs.values()
+            if song.ticks and song.worst.commands > self.budget
+        ]
+        if not over:
+            return
+
+        message = f"{len(over)} song(s) over {self.budget} commands per tick"
+        if self.over_budget == "fail":
+            raise ErrorMessage(f"{message}:\n" + "\n".join(over))
+
+        print(f"Warning: {message}")
+        for line in over:
+            print(f"  {line}")
+
+
+def get_song_costs(
+    song_name: str, functions: Dict[str, str], listeners: Listeners
+) -> Dict[str, SongCost]:
+    """Return the cost of each tick of a song, and of its reduced variants."""
+
+    lengths = {
+        path: sum(1 for line in text.splitlines() if line and line[0] != "#")
+        for path, text in functions.items()
+    }
+
+    # Reduced variants of the song are reported as songs of their own
+    songs = {song_name: SongCost(song_name)}
+    for path, text in functions.items():
+        if match := TICK_FUNCTION.fullmatch(path):
+            song = songs.setdefault(match["song"], SongCost(match["song"]))
+            song.ticks.append(
+                get_tick_cost(int(match["tick"]), text, lengths, listeners)
+            )
+
+    for song in songs.values():
+        song.ticks.sort(key=lambda tick: tick.tick)
+    return songs
+
+
+def get_tick_cost(
+    tick: int, root: str, lengths: Dict[str, int], listeners: Listeners
+) -> TickCost:
+    """Return the commands run to play a tick, from the text of its root function."""
+
+    cost = TickCost(tick)
+    storage: Dict[str, str] = {}
+
+    for command in root.splitlines():
+        if not command or command[0] == "#":
+            continue
+        cost.commands += 1
+
+        if match := STORAGE_VALUE.match(command):
+            storage[match[1]] = match[2]
+        elif match := NOTES_PLAYED.match(command):
+            cost.notes += int(match[1])
+        elif match := RUN_FUNCTION.match(command):
+            count = getattr(listeners, LISTENER_TAGS.get(match[1], ""), 0)
+            cost.commands += count * lengths.get(match[2], 0)
+        elif (match := ITER_FUNCTION.match(command)) and match[1] in ITER_FUNCTIONS:
+            target = ITER_FUNCTIONS[match[1]].format(**storage)
+            count = getattr(listeners, storage["speaker_type"])
+
+            # The iteration runs at least once, even if there are no speakers
+            iterations = max(count, 1)
+            cost.commands += iterations * ITER_COMMANDS + count * lengths.get(target, 0)
+            cost.macros += iterations * ITER_MACROS
+
+    return cost
+
+
+def beet_default(ctx: Context):
+    runtime_cost = ctx.inject(RuntimeCost)
+
+    for line in runtime_cost.report():
+        print(line)
+
+    runtime_cost.check_budget()
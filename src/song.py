@@ -0,0 +1,562 @@
+__all__ = [
+    "CompiledSong",
+    "SongOptions",
+    "compile_song",
+    "compile_songs",
+    "get_song_name",
+]
+
+
+import hashlib
+import json
+import os
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass, field, fields, replace
+from functools import partial
+from itertools import islice
+from pathlib import Path
+from typing import Any, Deque, Dict, Iterable, Iterator, List, Tuple
+
+import pynbs
+from beet.core.utils import normalize_string
+
+from src.nbs_reader import NbsReader
+from src.note import (
+    Note,
+    NoteRow,
+    get_bucket_radius,
+    get_notes,
+    get_rolloff_bucket,
+    get_rolloff_tag,
+    limit_polyphony,
+    merge_notes,
+    render_cached,
+    render_note,
+)
+
+try:
+    from src.note_batch import get_note_table
+except ImportError:  # numpy only comes in through beet, fall back to the scalar path
+    get_note_table = None
+
+# Listener modes, in the order their functions are emitted for each tick
+MODES = ["speaker", "loudspeaker", "headphones"]
+
+# Name of the `Note.play_<mode>` method used by each listener mode
+PLAY_MODES = {
+    "speaker": "speakers",
+    "loudspeaker": "loudspeakers",
+    "headphones": "headphones",
+}
+
+# Name of the reduced variant of each song played under load, see `lod_polyphony`
+LOD_VARIANT = "lod"
+
+BEAT_RANGES = [("speaker", 12), ("loudspeaker", 48)]
+
+
+@dataclass(frozen=True)
+class SongOptions:
+    """Options that change how songs are compiled, read from `meta.nbs` in beet.yml."""
+
+    vectorize: bool = True
+    render_cache: bool = True
+    playback: str = "macro"
+    dispatch: str = "macro"
+    merge_notes: bool = False
+    merge_panning_step: float = 0.25
+    polyphony: int = 0
+    dedupe_chords: bool = False
+    lod_polyphony: int = 0
+    rolloff_buckets: int = 0
+    channels: int = 1
+
+    @classmethod
+    def from_meta(cls, meta: Dict[str, Any]) -> "SongOptions":
+        return cls(**{f.name: meta[f.name] for f in fields(cls) if f.name in meta})
+
+
+@dataclass
+class CompiledSong:
+    """The commands of every function generated for a song, as plain strings."""
+
+    name: str
+    header: Dict[str, str]
+    # Number of notes played with each sound, as used by the sound index
+    instruments: Dict[str, int] = field(default_factory=dict)
+    ticks: List[Tuple[int, Dict[str, List[str]]]] = field(default_factory=list)
+    # Ticks of the reduced variants of the song, under `nbs:song/<name>/<variant>`
+    variants: Dict[str, List[Tuple[int, Dict[str, List[str]]]]] = field(
+        default_factory=dict
+    )
+    chords: Dict[str, Dict[str, List[str]]] = field(default_factory=dict)
+    stats: Dict[str, int] = field(default_factory=dict)
+
+    @property
+    def functions(self) -> Dict[str, List[str]]:
+        """Return the commands of each function, keyed by resource location."""
+        functions = {
+            f"nbs:song/{self.name}/{tick}/{kind}": commands
+            for tick, functions in self.ticks
+            for kind, commands in functions.items()
+        }
+        functions.update(
+            (f"nbs:song/{self.name}/{variant}/{tick}/{kind}", commands)
+            for variant, ticks in self.variants.items()
+            for tick, functions in ticks
+            for kind, commands in functions.items()
+        )
+        functions.update(
+            (f"nbs:chord/{chord_hash}/{mode}", commands)
+            for chord_hash, chord in self.chords.items()
+            for mode, commands in chord.items()
+        )
+        return functions
+
+    @property
+    def texts(self) -> Dict[str, str]:
+        """Return the text of each function, as it's written to the data pack."""
+        return {
+            path: "".join(f"{command}\n" for command in commands)
+            for path, commands in self.functions.items()
+        }
+
+    def report(self) -> str:
+        """Return a one-line summary of the build statistics of the song."""
+        parts = []
+
+        hits = self.stats.get("render_hits", 0)
+        if lookups := hits + self.stats.get("render_misses", 0):
+            hit_rate = hits / lookups
+            parts.append(f"render cache hit rate {hit_rate:.1%} ({hits}/{lookups})")
+
+        merged = self.stats.get("notes_merged", 0)
+        dropped = self.stats.get("notes_dropped", 0)
+        if merged or dropped:
+            # Every note is played by one /playsound command per listener mode
+            saved = (merged + dropped) * len(MODES)
+            parts.append(
+                f"saved {saved} commands ({merged} notes merged, "
+                f"{dropped} over polyphony)"
+            )
+
+        if self.chords:
+            chord_ticks = self.stats.get("chord_ticks", 0)
+            parts.append(f"{len(self.chords)} distinct chords over {chord_ticks} ticks")
+
+        return f"{self.name}: {', '.join(parts) or 'no stats'}"
+
+
+def get_song_name(path: Path) -> str:
+    """Return the name used in the resource locations of the given song."""
+    return normalize_string(path.stem.split(" - ")[0].split("(")[0])
+
+
+def get_chord_hash(chord: Dict[str, List[str]]) -> str:
+    """Return the content hash that names the shared functions of a chord."""
+    return hashlib.sha256(json.dumps(chord).encode()).hexdigest()[:16]
+
+
+def render_root(
+    song_name: str,
+    tick: int,
+    note_count: int,
+    options: SongOptions = SongOptions(),
+    modes: Iterable[str] = MODES,
+    chord_hash: str | None = None,
+) -> List[str]:
+    """
+    Return the commands that dispatch a tick to every speaker and headphone user. With
+    a `chord_hash`, the tick plays the shared `nbs:chord/<hash>/<mode>` functions
+    instead of its own.
+    """
+
+    if chord_hash is not None:
+        target = f"nbs:chord/{chord_hash}"
+    else:
+        target = f"nbs:song/{song_name}/{tick}"
+
+    if options.dispatch == "tag":
+        return render_tag_dispatch(target, modes) + render_stats(note_count)
+
+    if chord_hash is not None:
+        return (
+            render_channel_locations(options)
+            + render_chord_dispatch(chord_hash, options)
+            + render_stats(note_count)
+        )
+
+    commands = render_channel_locations(options) if note_count else []
+    commands += [
+        "data modify storage nbs:temp input set value {}",
+        f'data modify storage nbs:temp input.song set value "{song_name}"',
+        f"data modify storage nbs:temp input.tick set value {tick}",
+    ]
+
+    # iterate through speaker UUIDs
+    for entity in ["speaker", "loudspeaker"]:
+        commands += [
+            f"execute store result score #len nbs if data storage nbs:main locations.{entity}[]",
+            "execute store result storage nbs:temp input.i int 1 run scoreboard players set #iter nbs 0",
+            f'data modify storage nbs:temp input.speaker_type set value "{entity}"',
+            "function nbs:global/speaker_iter with storage nbs:temp input",
+        ]
+
+    commands.append(
+        f"execute {get_headphones_condition(options)}as @a[tag=nbs_headphones] at @s run function nbs:song/{song_name}/{tick}/headphones"
+    )
+
+    return commands + render_stats(note_count)
+
+
+def get_headphones_condition(options: SongOptions) -> str:
+    """
+    Return the condition that keeps headphone users on the first playback channel, when
+    speakers are split between several of them (see `channels`).
+    """
+
+    if options.channels > 1 and options.playback == "macro":
+        return "if score #channel nbs matches 0 "
+    return ""
+
+
+def render_channel_locations(options: SongOptions) -> List[str]:
+    """
+    Return the commands that load the speakers of the channel playing the tick into
+    `locations`, when speakers are split between several channels (see `channels`).
+    Only ticks with notes load them, so silent ticks don't copy any storage.
+    """
+
+    if options.channels > 1 and options.playback == "macro":
+        return ["function nbs:global/channel/locations"]
+    return []
+
+
+def render_chord_dispatch(
+    chord_hash: str, options: SongOptions = SongOptions()
+) -> List[str]:
+    """
+    Return the commands that play a shared chord at every speaker through the saved
+    UUIDs, like the macro dispatch does for the tick's own functions.
+    """
+
+    commands = [
+        "data modify storage nbs:temp input set value {}",
+        f'data modify storage nbs:temp input.chord set value "{chord_hash}"',
+    ]
+
+    for entity in ["speaker", "loudspeaker"]:
+        commands += [
+            f"execute store result score #len nbs if data storage nbs:main locations.{entity}[]",
+            "execute store result storage nbs:temp input.i int 1 run scoreboard players set #iter nbs 0",
+            f'data modify storage nbs:temp input.speaker_type set value "{entity}"',
+            "function nbs:global/chord_iter with storage nbs:temp input",
+        ]
+
+    commands.append(
+        f"execute {get_headphones_condition(options)}as @a[tag=nbs_headphones] at @s run function nbs:chord/{chord_hash}/headphones"
+    )
+
+    return commands
+
+
+def render_tag_dispatch(target: str, modes: Iterable[str]) -> List[str]:
+    """
+    Return the commands that run the tick's functions at every speaker by selecting the
+    tagged speaker entities directly, instead of going through `speaker_iter`. Unlike
+    the macro dispatch, there's no storage copy nor macro expansion per speaker, and
+    listener modes without any notes on this tick are skipped altogether. `target` is
+    the resource location the functions of each mode are found under.
+    """
+
+    selectors = {
+        "speaker": "@e[type=item_display,tag=nbs_speaker]",
+        "loudspeaker": "@e[type=item_display,tag=nbs_loudspeaker]",
+        "headphones": "@a[tag=nbs_headphones]",
+    }
+
+    return [
+        f"execute as {selectors[mode]} at @s run function {target}/{mode}"
+        for mode in MODES
+        if mode in modes
+    ]
+
+
+def render_stats(note_count: int) -> List[str]:
+    """Return the commands that keep track of the playback statistics."""
+    return [
+        f"scoreboard players add notes_played nbs_stats {note_count}",
+        "scoreboard players add ticks_played nbs_stats 1",
+    ]
+
+
+def render_chain(song_name: str, tick: int, next_tick: int) -> List[str]:
+    """Return the commands that schedule the next tick of a song (sparse playback)."""
+
+    delay = next_tick - tick
+
+    # `#due` keeps the game time the next tick is due at, so pausing can work out how
+    # much of the delay was left (see `nbs:global/sparse/suspend`)
+    return [
+        f"scoreboard players set songtime nbs {tick}",
+        f"data modify storage nbs:main playing.next set value {next_tick}",
+        "execute store result score #due nbs run time query gametime",
+        f"scoreboard players add #due nbs {delay}",
+        f"schedule function nbs:song/{song_name}/{next_tick}/root {delay}t replace",
+    ]
+
+
+def render_beat(mode: str) -> List[str]:
+    """Return the commands that mark a beat for the given listener mode."""
+
+    if mode == "headphones":
+        return ["particle note ~ ~2.25 ~ 0 0 0 1 1"]
+
+    dist = dict(BEAT_RANGES)[mode]
+
+    return ["execute store result score #random nbs run random value 1..4"] + [
+        f"execute if score #random nbs matches {i + 1} if entity @a[distance=0..{dist}] "
+        f"run function animated_java:music_speaker/animations/animation_speaker_beat_{i + 1}/play"
+        for i in range(4)
+    ]
+
+
+def render_chord(
+    notes: List[Note | NoteRow],
+    instruments: Dict[str, int],
+    options: SongOptions = SongOptions(),
+) -> Dict[str, List[str]]:
+    """
+    Return the commands that play a chord for each listener mode, and count the notes
+    of each sound in `instruments`.
+    """
+
+    functions: Dict[str, List[str]] = {}
+
+    def play(note: Note | NoteRow, mode: str) -> str:
+        if options.render_cache:
+            return render_note(note, mode, options.rolloff_buckets)
+        if mode == "speakers" and options.rolloff_buckets:
+            return note.play_speakers(rolloff_buckets=options.rolloff_buckets)
+        return getattr(note, f"play_{mode}")()
+
+    buckets: Dict[int, int] = {}
+
+    for note in notes:
+        if note.instrument == "BEAT":
+            for mode in MODES:
+                functions.setdefault(mode, []).extend(render_beat(mode))
+            continue
+
+        instruments[note.instrument] = instruments.get(note.instrument, 0) + 1
+
+        for mode in MODES:
+            command = f"playsound {play(note, PLAY_MODES[mode])}"
+            functions.setdefault(mode, []).append(command)
+
+        if options.rolloff_buckets:
+            radius = note.get_speaker_radius()
+            bucket = get_rolloff_bucket(radius, options.rolloff_buckets)
+            buckets[bucket] = buckets.get(bucket, 0) + 1
+
+    if buckets:
+        functions["speaker"] = render_rolloff_tags(
+            functions["speaker"], buckets, options.rolloff_buckets
+        )
+
+    return {mode: functions[mode] for mode in MODES if mode in functions}
+
+
+def render_rolloff_tags(
+    commands: List[str], buckets: Dict[int, int], bucket_count: int
+) -> List[str]:
+    """
+    Wrap the commands of a speaker with the ones that tag the players in range of each
+    bucket, given with its number of notes, so the notes only select players by tag.
+    The tags are removed afterwards, as the next speaker has players at other
+    distances. A bucket with a single note keeps a `distance` check instead, as
+    tagging would cost more than it saves.
+    """
+
+    tagged = []
+    for bucket, notes in sorted(buckets.items()):
+        tag = get_rolloff_tag(bucket)
+        radius = get_bucket_radius(bucket, bucket_count)
+        if notes > 1:
+            tagged.append((tag, radius))
+            continue
+        selector = f"@a[tag={tag}]"
+        commands = [
+            command.replace(selector, f"@a[distance=..{radius:.2f}]")
+            for command in commands
+        ]
+
+    return (
+        [f"tag @a[distance=..{radius:.2f}] add {tag}" for tag, radius in tagged]
+        + commands
+        + [f"tag @a[tag={tag}] remove {tag}" for tag, _ in tagged]
+    )
+
+
+def reduce_chord(
+    notes: List[Any], options: SongOptions, stats: Dict[str, int]
+) -> List[Any]:
+    """Merge duplicate notes and apply the polyphony cap, as configured."""
+
+    if options.merge_notes:
+        merged = merge_notes(notes, options.merge_panning_step)
+        stats["notes_merged"] = stats.get("notes_merged", 0) + len(notes) - len(merged)
+        notes = merged
+
+    if options.polyphony > 0:
+        kept = limit_polyphony(notes, options.polyphony)
+        stats["notes_dropped"] = stats.get("notes_dropped", 0) + len(notes) - len(kept)
+        notes = kept
+
+    return notes
+
+
+def render_ticks(
+    song_name: str,
+    chords: Iterable[Tuple[int, List[Any]]],
+    options: SongOptions,
+    instruments: Dict[str, int],
+    compiled: CompiledSong,
+    stats: Dict[str, int] | None = None,
+) -> List[Tuple[int, Dict[str, List[str]]]]:
+    """
+    Return the functions of every tick of a song, and add the chords they share to
+    `compiled`. `song_name` is the path of the tick functions under `nbs:song`.
+    Statistics go to `stats`, or to the ones of `compiled` by default.
+    """
+
+    stats = compiled.stats if stats is None else stats
+    ticks = []
+
+    sparse = options.playback == "sparse"
+    next_ticks: List[int] = []
+
+    if sparse:
+        # Silent ticks aren't emitted at all, each tick schedules the next one instead
+        chords = sorted((chord for chord in chords if chord[1]), key=lambda c: c[0])
+        next_ticks = [tick for tick, _ in chords[1:]]
+        next_ticks.append(chords[-1][0] + 40 if chords else 40)
+
+    tick = 0
+    for i, (tick, notes) in enumerate(chords):
+        notes = reduce_chord(notes, options, stats)
+        chord = render_chord(notes, instruments, options)
+
+        chord_hash = None
+        if options.dedupe_chords and chord:
+            # Identical chords share their functions, within the song and across songs
+            chord_hash = get_chord_hash(chord)
+            compiled.chords[chord_hash] = chord
+            stats["chord_ticks"] = stats.get("chord_ticks", 0) + 1
+
+        root = render_root(
+            song_name, tick, len(notes), options, chord.keys(), chord_hash
+        )
+        if sparse:
+            root = render_chain(song_name, tick, next_ticks[i]) + root
+
+        if chord_hash is None:
+            ticks.append((tick, {"root": root, **chord}))
+        else:
+            ticks.append((tick, {"root": root}))
+
+    ticks.append((tick + 40, {"root": ["function nbs:global/advance"]}))
+
+    return ticks
+
+
+def read_file_chords(path: Path) -> Iterator[Tuple[int, List[Note]]]:
+    """Yield the chords of a song as they're read from its file."""
+    with NbsReader(path) as song:
+        yield from get_notes(song)
+
+
+def compile_song(path: Path, options: SongOptions = SongOptions()) -> CompiledSong:
+    """Read a song and render the commands of all of its functions."""
+
+    song_name = get_song_name(path)
+
+    if options.vectorize and get_note_table is not None:
+        song = pynbs.read(path)
+        header = song.header
+        read_chords = get_note_table(song).chords
+    else:
+        # The notes are streamed from the file, chord by chord, straight into rendering,
+        # and the file is read again for each pass over the song
+        with NbsReader(path) as reader:
+            header = reader.header
+        read_chords = partial(read_file_chords, path)
+
+    compiled = CompiledSong(
+        name=song_name,
+        header={
+            "title": header.song_name,
+            "author": header.song_author,
+            "original_author": header.original_author,
+        },
+    )
+
+    before = render_cached.cache_info()
+
+    compiled.ticks = render_ticks(
+        song_name, read_chords(), options, compiled.instruments, compiled
+    )
+
+    if options.lod_polyphony > 0 and options.playback == "macro":
+        # The reduced variant is played in place of the song under load (see
+        # `nbs:global/playback_lod`), so it's rendered from the same notes
+        lod_options = replace(
+            options, merge_notes=True, polyphony=options.lod_polyphony
+        )
+        compiled.variants[LOD_VARIANT] = render_ticks(
+            f"{song_name}/{LOD_VARIANT}", read_chords(), lod_options, {}, compiled, {}
+        )
+
+    if options.render_cache:
+        after = render_cached.cache_info()
+        compiled.stats["render_hits"] = after.hits - before.hits
+        compiled.stats["render_misses"] = after.misses - before.misses
+
+    return compiled
+
+
+def compile_songs(
+    paths: List[Path],
+    workers: int = 1,
+    options: SongOptions = SongOptions(),
+) -> Iterator[CompiledSong]:
+    """
+    Compile the given songs, yielding them in order. With more than one worker, songs
+    are compiled in parallel on a process pool. A worker count of 0 uses every core.
+    """
+
+    if workers == 0:
+        workers = os.cpu_count() or 1
+
+    if workers == 1 or len(paths) <= 1:
+        for path in paths:
+            yield compile_song(path, options)
+        return
+
+    workers = min(workers, len(paths))
+    remaining = iter(paths)
+    pending: Deque[Future[CompiledSong]] = deque()
+
+    # Only `workers` songs are in flight at once, so songs that finish ahead of their
+    # turn don't pile up in memory. The next one is submitted before yielding, to keep
+    # every worker busy while the song is handed over.
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for path in islice(remaining, workers):
+            pending.append(executor.submit(compile_song, path, options))
+
+        while pending:
+            compiled = pending.popleft().result()
+            for path in islice(remaining, 1):
+                pending.append(executor.submit(compile_song, path, options))
+            yield compiled
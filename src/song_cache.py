@@ -0,0 +1,126 @@
+__all__ = [
+    "SongCache",
+    "SongCacheEntry",
+]
+
+
+import hashlib
+import json
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+
+from beet import Context
+
+from src.song import SongOptions
+
+# Bump this whenever the layout of the cached entries changes
+CACHE_VERSION = 2
+
+# Sources that determine how a song is compiled, relative to the project directory
+COMPILER_SOURCES = [
+    "src/nbs_reader.py",
+    "src/note.py",
+    "src/note_batch.py",
+    "src/song.py",
+    "src/generate_songs.py",
+]
+
+
+@dataclass
+class SongCacheEntry:
+    """Everything a song contributes to the build, as produced by its last compilation."""
+
+    key: str
+    header: dict[str, str]
+    instruments: dict[str, int] = field(default_factory=dict)
+    functions: dict[str, str] = field(default_factory=dict)
+
+
+class SongCache:
+    """
+    On-disk cache of the functions generated for each song.
+
+    Entries are keyed by the content hash of the song's .nbs file, combined with a
+    fingerprint of the code that turns it into functions (`COMPILER_SOURCES`) and of
+    the song options. On a hit, the serialized functions are put back into the data
+    pack as-is (see `SongWriter`), so the song doesn't need to be parsed nor compiled
+    again.
+    """
+
+    def __init__(self, ctx: Context):
+        self.ctx = ctx
+        self.cache = ctx.cache["nbs_songs"]
+        self.enabled = ctx.meta.get("nbs", {}).get("song_cache", True)
+        self.options = SongOptions.from_meta(ctx.meta.get("nbs", {}))
+        self.fingerprint = self.get_fingerprint()
+        self.hits = 0
+        self.misses = 0
+
+    def get_fingerprint(self) -> str:
+        """Hash the sources that determine how a song is compiled."""
+        digest = hashlib.sha256(f"{CACHE_VERSION} {self.options}".encode())
+        for source in COMPILER_SOURCES:
+            digest.update((self.ctx.directory / source).read_bytes())
+        return digest.hexdigest()
+
+    def get_key(self, path: Path) -> str:
+        """Return the cache key for the given .nbs file."""
+        digest = hashlib.sha256(self.fingerprint.encode())
+        digest.update(path.read_bytes())
+        return digest.hexdigest()
+
+    def get_entry_path(self, song_name: str) -> Path:
+        return self.cache.directory / f"{song_name}.json"
+
+    def check(self, song_name: str, key: str) -> bool:
+        """Return whether the song has an up-to-date entry in the cache."""
+
+        # Songs aren't counted as misses when the cache is disabled
+        if not self.enabled:
+            return False
+
+        if (
+            self.cache.json.get(song_name) == key
+            and self.get_entry_path(song_name).is_file()
+        ):
+            self.hits += 1
+            return True
+
+        self.misses += 1
+        return False
+
+    def load(self, song_name: str) -> SongCacheEntry:
+        """Read the cached entry of a song, once `check` found it up to date."""
+        entry_path = self.get_entry_path(song_name)
+        return SongCacheEntry(**json.loads(entry_path.read_text("utf-8")))
+
+    def record(
+        self,
+        song_name: str,
+        key: str,
+        header: dict[str, str],
+        instruments: dict[str, int],
+        functions: dict[str, str],
+    ) -> None:
+        """Save a freshly compiled song, with the text of all of its functions."""
+        if not self.enabled:
+            return
+
+        entry = SongCacheEntry(
+            key=key,
+            header=header,
+            instruments=instruments,
+            functions=functions,
+        )
+
+        self.get_entry_path(song_name).write_text(json.dumps(asdict(entry)), "utf-8")
+        self.cache.json[song_name] = key
+
+
+def beet_default(ctx: Context):
+    cache = ctx.inject(SongCache)
+
+    yield
+
+    if cache.hits or cache.misses:
+        print(f"song cache: {cache.hits} hit(s), {cache.misses} miss(es)")
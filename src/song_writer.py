@@ -0,0 +1,104 @@
+__all__ = [
+    "SongWriter",
+]
+
+
+import os
+import shutil
+from pathlib import Path
+from typing import Dict, Iterator, Tuple
+from zipfile import ZipFile
+
+from beet import Context, DataPack, Function
+from beet.contrib.autosave import Autosave
+from beet.library.base import PACK_COMPRESSION, get_output_scope
+
+
+class SongWriter:
+    """
+    Adds the functions of each song to the data pack.
+
+    By default, they're added to `ctx.data` like any other function. With `stream`
+    enabled in `meta.nbs`, each song is written to a spool directory as soon as it's
+    compiled instead, so the build only ever holds the functions of one song in memory.
+    The spooled files are moved into the data pack once beet has saved it to the output
+    directory, or added to its zip when the pack is zipped.
+    """
+
+    def __init__(self, ctx: Context):
+        self.ctx = ctx
+        self.stream = ctx.meta.get("nbs", {}).get("stream", False)
+        self.directory = ctx.cache["nbs_stream"].directory / "functions"
+        self.count = 0
+
+        if self.stream:
+            # Leftovers from a build that failed before the output step
+            shutil.rmtree(self.directory, ignore_errors=True)
+            self.directory.mkdir(parents=True)
+            ctx.inject(Autosave).add_output(self.output)
+
+    def write(self, functions: Dict[str, str]) -> None:
+        """Add the given functions, keyed by resource location, to the data pack."""
+
+        for path, text in functions.items():
+            if not self.stream:
+                self.ctx.data.functions[path] = Function(text)
+                continue
+
+            namespace, name = path.split(":")
+            file_path = self.directory / namespace / f"{name}{Function.extension}"
+            file_path.parent.mkdir(parents=True, exist_ok=True)
+            file_path.write_text(text, "utf-8")
+
+        self.count += len(functions)
+
+    def output(self, ctx: Context):
+        """Move the spooled functions into the data pack that was just saved."""
+
+        pack = ctx.data
+        if pack.path is None or not pack.name:
+            return
+
+        # The directory of functions inside a namespace depends on the pack format
+        scope = "/".join(get_output_scope(Function.scope, pack.pack_format))
+
+        if pack.zipped:
+            self.output_zip(pack, pack.path)
+        else:
+            for namespace in self.directory.iterdir():
+                destination = pack.path / pack.name / "data" / namespace.name / scope
+                merge_directory(namespace, destination)
+
+        print(f"streamed {self.count} song functions to {pack.name}")
+
+    def output_zip(self, pack: DataPack, directory: Path):
+        with ZipFile(
+            directory / f"{pack.name}.zip",
+            "a",
+            compression=PACK_COMPRESSION[pack.compression or "deflate"],
+            compresslevel=pack.compression_level,
+        ) as zip_file:
+            for path, file_path in self.list_spooled(pack):
+                zip_file.write(file_path, path)
+                file_path.unlink()
+
+    def list_spooled(self, pack: DataPack) -> Iterator[Tuple[str, Path]]:
+        """Yield the path in the data pack of each spooled function, with its file."""
+
+        scope = "/".join(get_output_scope(Function.scope, pack.pack_format))
+        for file_path in sorted(self.directory.rglob(f"*{Function.extension}")):
+            namespace, *name = file_path.relative_to(self.directory).parts
+            yield "/".join(["data", namespace, scope, *name]), file_path
+
+
+def merge_directory(source: Path, destination: Path):
+    """Move the content of a directory into another one, merging subdirectories."""
+
+    for entry in source.iterdir():
+        target = destination / entry.name
+
+        if entry.is_dir() and target.is_dir():
+            merge_directory(entry, target)
+        else:
+            target.parent.mkdir(parents=True, exist_ok=True)
+            os.replace(entry, target)
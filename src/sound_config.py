@@ -1,7 +1,12 @@
+import hashlib
 from pathlib import Path
 
 from beet import Context, Sound, SoundConfig
 
+from src.sound_index import SoundIndex
+
+SOUNDS = Path("sounds")
+
 EXTRA_NOTES = {
     "block.note_block.banjo_-1": "banjo_-1.ogg",
     "block.note_block.banjo_1": "banjo_1.ogg",
@@ -38,18 +43,39 @@ EXTRA_NOTES = {
 }
 
 
+def get_file_size(file) -> int:
+    """Return the size of a file of the pack, without loading it when it's on disk."""
+    if file.source_path is not None and file.source_stop is None:
+        return Path(file.source_path).stat().st_size
+    return len(file.ensure_serialized())
+
+
 def beet_default(ctx: Context):
+    sound_index = ctx.inject(SoundIndex)
     sound_config = {}
 
-    for instrument in ctx.meta["instruments"]:
+    # Sound path of each sample, by content hash, so identical samples ship only once
+    samples = {}
+    sizes = {}
+
+    for instrument in sound_index.sounds:
         sound_path = EXTRA_NOTES.get(instrument)
         if sound_path is not None:
+            source_path = ctx.directory / SOUNDS / sound_path
+            digest = hashlib.sha256(source_path.read_bytes()).hexdigest()
             instrument_path = instrument.replace(".", "/")
-            ctx.assets["minecraft"].sounds[instrument_path] = Sound(
-                (Path("sounds") / sound_path).read_bytes(),
-                event=instrument,
-                subtitle="subtitles.block.note_block.note",
-            )
+
+            if digest in samples:
+                instrument_path = samples[digest]
+            else:
+                samples[digest] = instrument_path
+                sizes[instrument] = source_path.stat().st_size
+                # The sample is copied to the output as-is, it's never loaded in memory
+                ctx.assets["minecraft"].sounds[instrument_path] = Sound(
+                    source_path=source_path,
+                    event=instrument,
+                    subtitle="subtitles.block.note_block.note",
+                )
 
             sound_config[instrument] = {
                 "sounds": [instrument_path],
@@ -65,3 +91,15 @@ def beet_default(ctx: Context):
             }
 
     ctx.assets["minecraft"].sound_config = SoundConfig(sound_config)
+
+    excluded = len(set(EXTRA_NOTES) - set(sound_index.usage))
+    print(
+        f"sounds: {len(sound_index.usage)} used, {len(samples)} samples shipped, "
+        f"{excluded} unused samples excluded"
+    )
+
+    # The breakdown of each sound comes with the rest of the build report
+    if ctx.meta.get("nbs", {}).get("report", False):
+        pack_size = sum(get_file_size(file) for _, file in ctx.assets.all())
+        for line in sound_index.report(sizes, pack_size):
+            print(line)
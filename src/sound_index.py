@@ -0,0 +1,56 @@
+__all__ = [
+    "SoundIndex",
+]
+
+
+from typing import Dict, List
+
+from beet import Context
+
+
+class SoundIndex:
+    """
+    Index of the sounds played by the songs, built as they're compiled (or loaded from
+    the song cache). Each sound event is mapped to the songs that use it, with the
+    number of notes each of them plays, so that the resource pack only ships the
+    samples that are actually played.
+    """
+
+    def __init__(self, ctx: Context):
+        self.ctx = ctx
+        self.usage: Dict[str, Dict[str, int]] = {}
+
+    def add(self, song_name: str, instruments: Dict[str, int]) -> None:
+        """Record the number of notes the song plays with each sound."""
+        for sound, notes in instruments.items():
+            self.usage.setdefault(sound, {})[song_name] = notes
+
+    @property
+    def sounds(self) -> List[str]:
+        """Return the sound events used by at least one song."""
+        return sorted(self.usage)
+
+    def get_notes(self, sound: str) -> int:
+        return sum(self.usage.get(sound, {}).values())
+
+    def report(self, sizes: Dict[str, int], pack_size: int) -> List[str]:
+        """
+        Return a line per sound with the songs and notes that use it, its share of the
+        notes played, and the share of the resource pack taken by its sample. Sounds
+        without a size in `sizes` come with the game.
+        """
+
+        total_notes = sum(self.get_notes(sound) for sound in self.usage) or 1
+        pack_size = pack_size or 1
+
+        lines = ["sound usage, by share of the notes played and of the pack size:"]
+        for sound in sorted(self.usage, key=lambda s: (-sizes.get(s, 0), s)):
+            notes = self.get_notes(sound)
+            size = sizes.get(sound, 0)
+            lines.append(
+                f"{sound:<40} {len(self.usage[sound]):>3} song(s) "
+                f"{notes:>7} notes ({notes / total_notes:>6.1%}) "
+                f"{size:>7} bytes ({size / pack_size:>6.1%})"
+            )
+
+        return lines
@@ -0,0 +1,155 @@
+__all__ = [
+    "TextureCache",
+]
+
+
+import hashlib
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+from threading import Lock
+from typing import Any, Callable, List, Tuple
+
+from beet import Context, Texture
+
+# Bump this whenever the layout of the cached files changes
+CACHE_VERSION = 1
+
+# Sources that determine how textures are derived, relative to the project directory
+TEXTURE_SOURCES = [
+    "src/atlas.py",
+    "src/model.py",
+]
+
+
+class TextureCache:
+    """
+    On-disk cache of the textures and mcmetas derived by the model stage.
+
+    Entries are keyed by the bytes of the source textures, combined with the parameters
+    of the operation and a fingerprint of the code that applies it (`TEXTURE_SOURCES`).
+    On a hit, the cached png is added to the resource pack as a file, so it's never
+    decoded, processed nor encoded again.
+
+    Misses can be derived on a thread pool (see `derive_all`), as PIL releases the GIL
+    while it decodes, resizes and encodes images.
+    """
+
+    def __init__(self, ctx: Context):
+        self.ctx = ctx
+        self.directory = ctx.cache["nbs_textures"].directory / "derived"
+        self.enabled = ctx.meta.get("nbs", {}).get("texture_cache", True)
+        self.workers = (
+            ctx.meta.get("nbs", {}).get("texture_workers", 0) or os.cpu_count() or 1
+        )
+        self.lock = Lock()
+        self.fingerprint = self.get_fingerprint()
+        self.used: set[str] = set()
+        self.digests: dict[int, tuple[Texture, bytes]] = {}
+        self.hits = 0
+        self.misses = 0
+
+        if self.enabled:
+            self.directory.mkdir(parents=True, exist_ok=True)
+
+    def get_fingerprint(self) -> str:
+        """Hash the sources that determine how textures are derived."""
+        digest = hashlib.sha256(str(CACHE_VERSION).encode())
+        for source in TEXTURE_SOURCES:
+            digest.update((self.ctx.directory / source).read_bytes())
+        return digest.hexdigest()
+
+    def get_digest(self, texture: Texture) -> bytes:
+        """Hash the bytes of a texture, the first time it's seen."""
+
+        # Once a texture is decoded, its bytes come from encoding the image again, which
+        # doesn't give back the original file. Textures are held onto with their digest,
+        # so the ids stay unique for the whole build.
+        if entry := self.digests.get(id(texture)):
+            return entry[1]
+
+        digest = hashlib.sha256(texture.blob).digest()
+        self.digests[id(texture)] = (texture, digest)
+        return digest
+
+    def get_key(self, operation: str, params: Any, *sources: Texture) -> str:
+        """Return the cache key for applying an operation to the given textures."""
+        digest = hashlib.sha256(f"{self.fingerprint} {operation} {params}".encode())
+        for source in sources:
+            digest.update(self.get_digest(source))
+        return digest.hexdigest()
+
+    def derive(self, key: str, function: Callable[..., Texture], *args: Any) -> Texture:
+        """Return the cached texture for the key, or create it with the function."""
+        if not self.enabled:
+            return function(*args)
+
+        path = self.directory / f"{key}.png"
+
+        if path.is_file():
+            hit = True
+        else:
+            hit = False
+            path.write_bytes(function(*args).blob)
+
+        with self.lock:
+            self.used.add(path.name)
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+        return Texture(source_path=path)
+
+    def derive_all(
+        self, jobs: List[Tuple[str, Callable[..., Texture], Tuple[Any, ...]]]
+    ) -> List[Texture]:
+        """
+        Run `derive` for each `(key, function, args)` job on the thread pool, and return
+        the textures in the order of the jobs. Jobs with the same key are only run once.
+        """
+
+        unique_jobs = {}
+        for key, function, args in jobs:
+            unique_jobs.setdefault(key, (function, args))
+
+        def run(key: str) -> Texture:
+            function, args = unique_jobs[key]
+            return self.derive(key, function, *args)
+
+        if self.workers == 1 or len(unique_jobs) <= 1:
+            textures = dict(zip(unique_jobs, map(run, unique_jobs)))
+        else:
+            with ThreadPoolExecutor(min(self.workers, len(unique_jobs))) as executor:
+                textures = dict(zip(unique_jobs, executor.map(run, unique_jobs)))
+
+        return [textures[key] for key, _, _ in jobs]
+
+    def derive_json(self, key: str, function: Callable[[], Any]) -> Any:
+        """Return the cached json value for the key, or create it with the function."""
+        if not self.enabled:
+            return function()
+
+        path = self.directory / f"{key}.json"
+        self.used.add(path.name)
+
+        if path.is_file():
+            self.hits += 1
+            return json.loads(path.read_text("utf-8"))
+
+        self.misses += 1
+        value = function()
+        path.write_text(json.dumps(value), "utf-8")
+        return value
+
+    def prune(self) -> None:
+        """Delete the cached files that weren't used in this build."""
+        if not self.enabled:
+            return
+
+        for path in self.directory.iterdir():
+            if path.name not in self.used:
+                path.unlink()
+
+    def report(self) -> str:
+        return f"texture cache: {self.hits} hit(s), {self.misses} miss(es)"
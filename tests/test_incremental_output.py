@@ -0,0 +1,37 @@
+from pathlib import Path
+from zipfile import ZipFile
+
+from beet import run_beet
+from beet.toolchain.config import load_config
+
+from src.song import get_song_name
+
+PROJECT = Path(__file__).resolve().parent.parent
+
+
+def test_zipped_stream_keeps_song_functions(tmp_path: Path):
+    config = load_config(
+        PROJECT / "beet.yml",
+        overrides=[
+            f"output={tmp_path.as_posix()}",
+            "data_pack.zipped=true",
+            "meta.nbs.stream=true",
+            "meta.nbs.incremental=true",
+            "meta.nbs.song_cache=false",
+        ],
+    )
+
+    with run_beet(config, directory=PROJECT) as ctx:
+        pack_name = ctx.data.name
+        songs = ctx.directory / ctx.meta["nbs"]["songs"]
+
+    with ZipFile(tmp_path / f"{pack_name}.zip") as zip_file:
+        song_functions = [
+            name
+            for name in zip_file.namelist()
+            if name.startswith("data/nbs/function/song/")
+        ]
+
+    expected = {get_song_name(path) for path in songs.glob("*.nbs")}
+    assert expected
+    assert {name.split("/")[4] for name in song_functions} == expected
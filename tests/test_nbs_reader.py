@@ -0,0 +1,55 @@
+from pathlib import Path
+
+import pynbs
+import pytest
+
+from src.nbs_reader import NbsReader
+
+SONGS = Path(__file__).resolve().parent.parent / "songs"
+
+
+def assert_same_song(path: Path):
+    song = pynbs.read(path)
+
+    with NbsReader(path) as reader:
+        assert reader.header == song.header
+        assert reader.layers == song.layers
+        assert reader.instruments == song.instruments
+        assert list(reader.iter_notes()) == song.notes
+        assert reader.note_count == len(song.notes)
+
+
+@pytest.mark.parametrize(
+    "path", sorted(SONGS.glob("*.nbs")), ids=lambda path: path.stem
+)
+def test_reader_matches_pynbs_on_songs(path: Path):
+    assert_same_song(path)
+
+
+@pytest.mark.parametrize("version", range(6))
+def test_reader_matches_pynbs_on_versions(tmp_path: Path, version: int):
+    song = pynbs.new_file(
+        song_name="Song",
+        song_author="Author",
+        original_author="Composer",
+        description="Accents: é",
+        tempo=6.75,
+    )
+    song.layers = [
+        pynbs.Layer(id=i, name=f"Layer {i}", volume=50 + i, panning=-i)
+        for i in range(3)
+    ]
+    song.instruments = [
+        pynbs.Instrument(id=16, name="Bell", file="minecraft/block/bell.ogg")
+    ]
+    song.notes = [
+        pynbs.Note(tick=0, layer=0, instrument=0, key=45),
+        pynbs.Note(tick=0, layer=2, instrument=16, key=33, velocity=40, panning=-20),
+        pynbs.Note(tick=7, layer=1, instrument=3, key=80, pitch=-50),
+        pynbs.Note(tick=300, layer=4, instrument=5, key=9, velocity=0, panning=100),
+    ]
+
+    path = tmp_path / "song.nbs"
+    song.save(path, version=version)
+
+    assert_same_song(path)
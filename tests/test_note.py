@@ -0,0 +1,25 @@
+from src.note import Note, limit_polyphony
+
+
+def test_limit_polyphony_keeps_loudest():
+    quiet = Note("block.note_block.harp", volume=0.5, radius=0)
+    loud = Note("block.note_block.harp", volume=1, radius=0)
+
+    assert limit_polyphony([quiet, loud], 1) == [loud]
+
+
+def test_limit_polyphony_keeps_longest_range_on_ties():
+    # Low notes have a negative `radius`, and are heard from further away
+    bass = Note("block.note_block.bass", volume=1, radius=-0.8)
+    bell = Note("block.note_block.bell", volume=1, radius=0.9)
+    assert bass.get_speaker_radius() > bell.get_speaker_radius()
+
+    assert limit_polyphony([bell, bass], 1) == [bass]
+    assert limit_polyphony([bass, bell], 1) == [bass]
+
+
+def test_limit_polyphony_ignores_beats():
+    beat = Note("BEAT")
+    notes = [beat, Note(volume=1), Note(volume=0.2)]
+
+    assert limit_polyphony(notes, 1) == notes[:2]
@@ -0,0 +1,77 @@
+import random
+from pathlib import Path
+
+import pynbs
+import pytest
+
+from src.note import get_notes
+
+pytest.importorskip("numpy")
+
+from src.note_batch import get_note_table  # noqa: E402
+
+SONGS = Path(__file__).resolve().parent.parent / "songs"
+
+
+def get_table_chords(song: pynbs.File) -> list:
+    return [
+        (tick, [row.to_note() for row in chord])
+        for tick, chord in get_note_table(song).chords()
+    ]
+
+
+def make_song(tempo: float, seed: int) -> pynbs.File:
+    """Return a song with notes on every layer, some out of range or on missing layers."""
+
+    rng = random.Random(seed)
+    song = pynbs.new_file(tempo=tempo, song_length=301, default_instruments=16)
+    song.layers = [
+        pynbs.Layer(id=i, volume=rng.randint(0, 100), panning=rng.randint(-100, 100))
+        for i in range(6)
+    ]
+    song.instruments = [
+        pynbs.Instrument(id=16, name="custom", file="minecraft/block/bell.ogg")
+    ]
+
+    for tick in range(0, 301, 3):
+        for layer in sorted(rng.sample(range(8), rng.randint(0, 4))):
+            song.notes.append(
+                pynbs.Note(
+                    tick=tick,
+                    layer=layer,
+                    instrument=rng.randint(0, 16),
+                    key=rng.randint(0, 87),
+                    velocity=rng.randint(0, 100),
+                    panning=rng.randint(-100, 100),
+                    pitch=rng.randint(-100, 100),
+                )
+            )
+
+    return song
+
+
+@pytest.mark.parametrize("tempo", [5, 6.75, 10, 20, 33.3, 40])
+def test_note_table_matches_get_notes(tempo: float):
+    song = make_song(tempo, seed=int(tempo * 100))
+
+    assert get_table_chords(song) == list(get_notes(song))
+
+
+@pytest.mark.parametrize("tempo", [10, 20, 40])
+def test_note_table_keeps_last_chord_in_file_order(tempo: float):
+    # At tempo 40, both notes are quantized to the last tick of the song
+    song = pynbs.new_file(tempo=tempo, song_length=301)
+    song.layers = [pynbs.Layer(id=i) for i in range(6)]
+    song.notes = [
+        pynbs.Note(tick=299, layer=5, instrument=1, key=45),
+        pynbs.Note(tick=300, layer=2, instrument=2, key=45),
+    ]
+
+    assert get_table_chords(song) == list(get_notes(song))
+
+
+@pytest.mark.parametrize(
+    "path", sorted(SONGS.glob("*.nbs")), ids=lambda path: path.stem
+)
+def test_note_table_matches_get_notes_on_songs(path: Path):
+    assert get_table_chords(pynbs.read(path)) == list(get_notes(pynbs.read(path)))
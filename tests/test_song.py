@@ -0,0 +1,40 @@
+import re
+from pathlib import Path
+
+import pytest
+
+from src.song import SongOptions, compile_song
+
+SONGS = Path(__file__).resolve().parent.parent / "songs"
+
+CHORD_DATA = re.compile(r'data modify storage nbs:temp input\.chord set value "(\w+)"')
+CHORD_TAG = re.compile(r"run function nbs:chord/(\w+)/")
+
+
+def get_chord_hash(root: list) -> str | None:
+    for command in root:
+        if match := CHORD_DATA.search(command) or CHORD_TAG.search(command):
+            return match[1]
+    return None
+
+
+@pytest.mark.parametrize("dispatch", ["macro", "tag"])
+@pytest.mark.parametrize(
+    "path", sorted(SONGS.glob("*.nbs"))[:2], ids=lambda path: path.stem
+)
+def test_dedupe_chords_plays_the_same_notes(path: Path, dispatch: str):
+    song = compile_song(path, SongOptions(dispatch=dispatch))
+    deduped = compile_song(path, SongOptions(dispatch=dispatch, dedupe_chords=True))
+
+    assert [tick for tick, _ in deduped.ticks] == [tick for tick, _ in song.ticks]
+    assert 0 < len(deduped.chords) < len(song.ticks)
+
+    for (tick, functions), (_, deduped_functions) in zip(song.ticks, deduped.ticks):
+        chord = {mode: cmds for mode, cmds in functions.items() if mode != "root"}
+        chord_hash = get_chord_hash(deduped_functions["root"])
+
+        if chord_hash is None:
+            assert deduped_functions == functions, tick
+        else:
+            assert deduped.chords[chord_hash] == chord, tick
+            assert list(deduped_functions) == ["root"]
@@ -0,0 +1,54 @@
+import shutil
+from pathlib import Path
+
+from beet import run_beet
+
+from src.song_cache import SongCache
+
+PROJECT = Path(__file__).resolve().parent.parent
+SONG = sorted((PROJECT / "songs").glob("*.nbs"))[0]
+
+
+def get_key(path: Path, **options) -> str:
+    with run_beet({"meta": {"nbs": options}}, directory=PROJECT) as ctx:
+        return ctx.inject(SongCache).get_key(path)
+
+
+def test_key_depends_on_song_and_options(tmp_path: Path):
+    copy = tmp_path / SONG.name
+    shutil.copyfile(SONG, copy)
+
+    assert get_key(SONG) == get_key(copy)
+    assert get_key(SONG) == get_key(SONG, song_cache=False)
+    assert get_key(SONG) != get_key(SONG, polyphony=4)
+    assert get_key(SONG) != get_key(SONG, dispatch="tag")
+
+    with copy.open("ab") as f:
+        f.write(b"\0")
+    assert get_key(SONG) != get_key(copy)
+
+
+def test_check_hits_recorded_songs():
+    with run_beet({"meta": {"nbs": {}}}, directory=PROJECT) as ctx:
+        cache = ctx.inject(SongCache)
+        key = cache.get_key(SONG)
+
+        assert not cache.check("song", key)
+        cache.record("song", key, {"title": "Song"}, {"harp": 1}, {"a:b": "say hi"})
+        assert cache.check("song", key)
+        assert not cache.check("song", "other")
+        assert (cache.hits, cache.misses) == (1, 2)
+
+        entry = cache.load("song")
+        assert entry.functions == {"a:b": "say hi"}
+        assert entry.instruments == {"harp": 1}
+
+
+def test_disabled_cache_counts_nothing():
+    with run_beet({"meta": {"nbs": {"song_cache": False}}}, directory=PROJECT) as ctx:
+        cache = ctx.inject(SongCache)
+        key = cache.get_key(SONG)
+
+        cache.record("song", key, {}, {}, {})
+        assert not cache.check("song", key)
+        assert (cache.hits, cache.misses) == (0, 0)